@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+'''Split a generated <name>_parser.json into a slim lookup index and the
+   parser documentation.
+
+   <name>_parser_index.json only keeps what get_parser needs to find a parser
+   class (module_name, package, class) and is what genie.libs.parser loads
+   at import time. <name>_parser_doc.json keeps the same structure with the
+   doc, schema, uid and url of each parser and is only read on demand.
+
+   usage: python split_parser_json.py outputs/github_parser.json
+'''
+
+import json
+import pathlib
+import argparse
+
+# Keys needed to import the parser class
+INDEX_KEYS = ('module_name', 'package', 'class')
+
+
+def split_entry(entry):
+    '''Split one command entry (os/token levels down to the parser
+       information) into its index and doc parts'''
+    index = {}
+    doc = {}
+    for key, value in entry.items():
+        if isinstance(value, dict):
+            # os or token level
+            index[key], doc[key] = split_entry(value)
+        elif key in INDEX_KEYS:
+            index[key] = value
+        else:
+            doc[key] = value
+    return index, doc
+
+
+def split_parser_json(path):
+    '''Write the index and doc files next to the given parser json file'''
+    path = pathlib.Path(path)
+    with open(path) as f:
+        parser_data = json.load(f)
+
+    index = {}
+    doc = {}
+    for command, entry in parser_data.items():
+        if command == 'tokens':
+            index[command] = doc[command] = entry
+            continue
+        index[command], doc[command] = split_entry(entry)
+
+    index_path = path.with_name(path.stem + '_index.json')
+    doc_path = path.with_name(path.stem + '_doc.json')
+
+    # Compact separators, the index is loaded in every process
+    with open(index_path, 'w') as f:
+        json.dump(index, f, separators=(',', ':'))
+    with open(doc_path, 'w') as f:
+        json.dump(doc, f)
+
+    return index_path, doc_path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('path',
+                        help='parser json generated by the sdk generator',
+                        type=pathlib.Path,
+                        nargs='+')
+    args = parser.parse_args()
+
+    for path in args.path:
+        for output in split_parser_json(path):
+            print('Created {}'.format(output))
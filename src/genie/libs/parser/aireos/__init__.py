@@ -0,0 +1,3 @@
+# Enable abstraction using this directory name as the abstraction token
+from genie import abstract
+abstract.declare_token(__name__)
@@ -28,6 +28,7 @@ class ShowFirmwareUpgradeStatusSchema(MetaParser):
         }
     }
 
+
 class ShowFirmwareUpgradeStatus(ShowFirmwareUpgradeStatusSchema):
     """ Parser class for:
         * 'show firmware upgrade status'
@@ -48,19 +49,30 @@ class ShowFirmwareUpgradeStatus(ShowFirmwareUpgradeStatusSchema):
 
             output = self.device.execute(cmd)
 
-        # 1           1           apic-4.2(4o)                                success                    100                downloaded       100
-        # 1           101         unknown               unknown               node unreachable           -                  downloaded     100
+        # Pod         Node        Current-Firmware      Target-Firmware       Status                     Upgrade-Progress(%)
+        # ----------  ----------  --------------------  --------------------  -------------------------  --------------------
+
+        # 1           1           apic-4.2(4o)                                success                    100
         # 1           101         unknown               unknown               node unreachable           -
-        p1 = re.compile(r"^(?P<pod>\d+)  +(?P<node>\d+)  +(?P<current_firmware>\S+)  +(?:(?P<target_firmware>\S+)  +)?(?P<status>\w+(?: \w+)*\w)  +(?P<upgrade_progress_percentage>\d+|-)(?:  +(?:(?P<download_status>\S+)  +(?P<download_progress_percentage>\d+)|(?P<last_firmware_install_date>\S+)))?")
+        # 1           102         n9000-14.2(4q)                              not scheduled              0
+        # 1           201         unknown               unknown               node unreachable           -
+
+        #  Pod         Node        Current-Firmware      Target-Firmware       Status                     Upgrade-Progress(%)   Download-Status            Download-Progress(%)
+        #  ----------  ----------  --------------------  --------------------  -------------------------  --------------------  -------------------------  --------------------
+
+        #  1           101         n9000-15.0(0.138)     n9000-15.0(0.144)     upgrade in progress        45                    downloaded                 100                 
+        #  1           107         n9000-15.0(0.138)     n9000-15.0(0.144)     waiting in queue           0                     downloaded                 100                 
+        #  1           108         n9000-15.0(0.138)     n9000-15.0(0.144)     upgrade in progress        45                    downloaded                 100                 
+        #  1           112         n9000-15.0(0.138)     n9000-15.0(0.144)     upgrade in progress        45                    downloaded                 100                 
+        #  1           113         n9000-15.0(0.138)     n9000-15.0(0.144)     upgrade in progress        45                    downloaded       
+
+        p1 = re.compile(r"^\s*(?P<pod>\d+)  +(?P<node>\d+)  +(?P<current_firmware>\S+)  +(?:(?P<target_firmware>\S+)?  +)?(?P<status>\w+(?: \w+)*\w)  +(?P<upgrade_progress_percentage>\d+|-)(?: *(?:(?P<download_status>\S+) *(?P<download_progress_percentage>\d+)?)?)")
 
         ret_dict = {}
 
         for line in output.splitlines():
             line = line.strip()
 
-            # 1           1           apic-4.2(4o)                                success                    100                downloaded       100
-            # 1           101         unknown               unknown               node unreachable           -                  downloaded     100
-            # 1           101         unknown               unknown               node unreachable           -
             m = p1.match(line)
             if m:
                 groups = m.groupdict()
@@ -88,7 +100,7 @@ class ShowFirmwareUpgradeStatus(ShowFirmwareUpgradeStatusSchema):
         return ret_dict
 
 
-class ShowFirmwareUpgradeStatusControllerGroup(ShowFirmwareUpgradeStatus):
+class ShowFirmwareUpgradeStatusControllerGroup(ShowFirmwareUpgradeStatusSchema):
     """ Parser class for
         * 'show firmware upgrade status controller-group'
     """
@@ -100,7 +112,40 @@ class ShowFirmwareUpgradeStatusControllerGroup(ShowFirmwareUpgradeStatus):
         if output is None:
             output = self.device.execute(self.cli_command[0])
 
-        return super().cli(output=output)
+        # Pod         Node        Current-Firmware      Target-Firmware       Status                     Upgrade-Progress(%)     Last-Firmware-Install-Date
+        # ----------  ----------  --------------------  --------------------  -------------------------  --------------------  ------------------------------
+
+        # 1           1           apic-5.0(1k)          apic-5.0(1k)          success                    100                   2020-11-17T18:43:57.000+00:00
+        p1 = re.compile(r"^(?P<pod>\d+)  +(?P<node>\d+)  +(?P<current_firmware>\S+)  +(?:(?P<target_firmware>\S+)  +)?(?P<status>\w+(?: \w+)*\w)  +(?P<upgrade_progress_percentage>\d+|-)  +(?P<last_firmware_install_date>\S+)")
+
+        ret_dict = {}
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            # Pod         Node        Current-Firmware      Target-Firmware       Status                     Upgrade-Progress(%)     Last-Firmware-Install-Date
+            # ----------  ----------  --------------------  --------------------  -------------------------  --------------------  ------------------------------
+
+            # 1           1           apic-5.0(1k)          apic-5.0(1k)          success                    100                   2020-11-17T18:43:57.000+00:00
+            m = p1.match(line)
+            if m:
+                groups = m.groupdict()
+
+                node_dict = ret_dict.setdefault('node', {}).setdefault(int(groups['node']), {})
+                node_dict.update({'pod': int(groups['pod'])})
+                node_dict.update({'current_firmware': groups['current_firmware']})
+                node_dict.update({'status': groups['status']})
+
+                if 'target_firmware' in groups and groups['target_firmware']:
+                    node_dict.update({'target_firmware': groups['target_firmware']})
+
+                if groups['upgrade_progress_percentage'] != '-':
+                    node_dict.update({'upgrade_progress_percentage': int(groups['upgrade_progress_percentage'])})
+
+                if 'last_firmware_install_date' in groups and groups['last_firmware_install_date']:
+                    node_dict.update({'last_firmware_install_date': groups['last_firmware_install_date']})
+
+        return ret_dict
 
 
 class ShowFirmwareRepositorySchema(MetaParser):
@@ -1,4 +1,4 @@
 from genie.base import *
 from genie import abstract
 
-abstract.declare_token(__name__)
\ No newline at end of file
+abstract.declare_token(__name__)
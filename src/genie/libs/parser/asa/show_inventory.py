@@ -49,14 +49,13 @@ class ShowInventory(ShowInventorySchema):
 
         # Name: "Chassis", DESCR: "ASA 5555-X with SW, 8 GE Data, 1 GE Mgmt"
         # Name: "power supply 1", DESCR: "ASA 5545-X/5555-X AC Power Supply"
-        p1 = re.compile(
-            r'^Name: +"+(?P<name>.+)"+,* +DESCR:+ "+(?P<description>.+)+"$')
+        p1 = re.compile(r'^Name:\s+"(?P<name>.+)",\s+DESCR:\s+"(?P<description>.+)"$')
 
         # PID: ASA5555, VID: V01, SN: AAAAA11111
         # PID: AAA-AAA-AAA, VID: N/A, SN: AAA111
         # PID: N/A, VID: N/A, SN: AAAAA11111
-        p2 = re.compile(r'^PID: +(?P<pid>.+)( )?,+ VID: (?P<vid>.+)( )?, '
-            '+SN: (?P<sn>.+)$')
+        # PID: N/A, VID: , SN: AAAAA11111
+        p2 = re.compile(r'^PID:\s+(?P<pid>.+),\s+VID:\s?(?P<vid>.+),\s+SN:\s+(?P<sn>.+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -80,9 +79,11 @@ class ShowInventory(ShowInventorySchema):
                 pid = pid.replace(' ','')
                 vid = groups['vid']
                 vid = vid.replace(' ','')
+                sn = groups['sn']
+                sn = sn.replace(' ','')
                 dict_name.update({'pid': pid})
                 dict_name.update({'vid': vid})
-                dict_name.update({'sn': groups['sn']})
+                dict_name.update({'sn': sn})
                 continue
 
-        return ret_dict
\ No newline at end of file
+        return ret_dict
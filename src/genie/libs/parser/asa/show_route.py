@@ -7,7 +7,7 @@ Parser for the following show commands:
 import re
 
 from genie.metaparser import MetaParser
-from genie.metaparser.util.schemaengine import Any, Optional
+from genie.metaparser.util.schemaengine import Any, Optional, Or
 from netaddr import IPAddress
 
 
@@ -24,7 +24,7 @@ class ShowRouteSchema(MetaParser):
             'default': {
                 'address_family': {
                     'ipv4': {
-                        Optional('routes'): {
+                        Optional(Or('routes', 'tunneled_routes')): {
                             Any(): {
                                 'candidate_default': bool,
                                 Optional('subnet'): str,
@@ -65,6 +65,7 @@ class ShowRouteSchema(MetaParser):
            i - IS-IS, su - IS-IS summary, L1 - IS-IS level-1, L2 - IS-IS level-2
            ia - IS-IS, * - candidate default, U - per-user static route
            o - ODR, P - periodic downloaded static route, + - replicated route
+           SI - Static InterVRF
     """
     source_protocol_dict = {
         'O': 'ospf',
@@ -93,6 +94,7 @@ class ShowRouteSchema(MetaParser):
         '+': 'replicated route',
         'V': 'VPN',
         'P': 'periodic downloaded static route',
+        'SI': 'Static InterVRF',
     }
 
 
@@ -121,14 +123,15 @@ class ShowRoute(ShowRouteSchema):
         # i - IS-IS, L1 - IS-IS level-1, L2 - IS-IS level-2, ia - IS-IS inter area
         # * - candidate default, su - IS-IS summary, U - per-user static route, o - ODR
         # P - periodic downloaded static route, + - replicated route
-        p1 = re.sub(r'(?ms)(Codes:.+?)replicated\sroute', '', out, re.MULTILINE)
+        # SI - Static InterVRF
+        p1 = re.sub(r'(?ms)(Codes:.+?)replicated\sroute(\s*SI\s-\sStatic\sInterVRF)?', '', out)
 
-        res = "\n".join([x.lstrip() for x in p1.splitlines()])
+        lines = [x.strip() for x in p1.splitlines()]
         entries = dict()
         last_entry = str()
         clean_lines = list()
 
-        for i, line in enumerate(res.splitlines()):
+        for line in lines:
             if re.match(r'(^[A-Z]{1,2})', line):
                 entries[line] = list()
                 last_entry = line
@@ -171,6 +174,10 @@ class ShowRoute(ShowRouteSchema):
         # L 10.10.1.5 255.255.255.255 is directly connected, pod2500
         p5 = re.compile(r'^(?P<code>\S+)\s(?P<network>\S+)\s(?P<subnet>\S+)\s(?:.*),\s(?P<context_name>\S+)')
 
+        # SI 10.121.0.0 255.0.0.0 [1/0] is directly connected, gig3
+        p5_1 = re.compile(
+            r'^(?P<code>\S+)\s(?P<network>\S+)\s(?P<subnet>\S+)\s(\[(?P<route_preference>[\d\/]+)\])?\s(?:.*),\s(?P<context_name>\S+)')
+
         # S 0.0.0.1 0.0.0.0 [10/5]
         p6 = re.compile(r'^(?P<code>\S+)\s(?P<network>\S+)\s(?P<subnet>\S+)\s\[(?P<route_preference>[\d\/]+)\]')
 
@@ -197,14 +204,18 @@ class ShowRoute(ShowRouteSchema):
             return
 
         dict_ipv4 = ret_dict.setdefault('vrf', {}).setdefault('default', {}). \
-            setdefault('address_family', {}).setdefault('ipv4', {}). \
-            setdefault('routes', {})
+            setdefault('address_family', {}).setdefault('ipv4', {})
+        dict_routes = dict_ipv4.setdefault('routes', {})
 
         for line in clean_lines:
             index = 1
             groups = dict()
             next_hops = list()
 
+            target_dict = dict_routes
+            if line.strip().endswith("tunneled"):
+                target_dict = dict_ipv4.setdefault('tunneled_routes', {})
+
             if line.startswith('O'):
                 """ OSPF """
                 next_hops = [m.groupdict() for m in p2.finditer(line)]
@@ -237,6 +248,12 @@ class ShowRoute(ShowRouteSchema):
                 if m:
                     groups = m.groupdict()
 
+            elif line.startswith('SI'):
+                """ Static InterVRF """
+                m = p5_1.match(line)
+                if m:
+                    groups = m.groupdict()
+
             elif line.startswith('S'):
                 m = p6.match(line)
                 groups = m.groupdict()
@@ -257,27 +274,27 @@ class ShowRoute(ShowRouteSchema):
 
             prefix_length = str(IPAddress(groups['subnet']).netmask_bits())
             combined_ip = groups['network'] + '/' + prefix_length
-            dict_routes = dict_ipv4.setdefault(combined_ip, {})
+            dict_route = target_dict.setdefault(combined_ip, {})
 
             if '*' in groups['code']:
-                dict_routes.update({'candidate_default': True})
+                dict_route.update({'candidate_default': True})
                 groups['code'] = groups['code'].strip('*')
             else:
-                dict_routes.update({'candidate_default': False})
+                dict_route.update({'candidate_default': False})
 
-            dict_routes.update({'active': True})
+            dict_route.update({'active': True})
 
             if 'date' not in groups.keys() and next_hops:
                 date = next_hops[0].get('date')
             else:
                 date = groups.get('date')
             if date:
-                dict_routes.update({'date': date})
+                dict_route.update({'date': date})
 
-            dict_routes.update({'route': combined_ip})
+            dict_route.update({'route': combined_ip})
 
-            dict_routes.update({'source_protocol_codes': groups['code']})
-            dict_routes.update({'source_protocol': self.source_protocol_dict[groups['code']].lower()})
+            dict_route.update({'source_protocol_codes': groups['code']})
+            dict_route.update({'source_protocol': self.source_protocol_dict[groups['code']].lower()})
 
             if 'route_preference' not in groups.keys() and next_hops:
                 route_preference = next_hops[0]['route_preference']
@@ -288,19 +305,19 @@ class ShowRoute(ShowRouteSchema):
             if route_preference:
                 if '/' in route_preference:
                     route_preference, metric = map(int, route_preference.split('/'))
-                    dict_routes.update({'metric': metric})
+                    dict_route.update({'metric': metric})
                 else:
                     route_preference = int(route_preference)
-                dict_routes.update({'route_preference': route_preference})
+                dict_route.update({'route_preference': route_preference})
 
             if not next_hops and groups.get('context_name'):
-                dict_next_hop = dict_routes.setdefault('next_hop', {})
+                dict_next_hop = dict_route.setdefault('next_hop', {})
                 dict_next_hop.update({'outgoing_interface_name': {
                     groups['context_name']: {'outgoing_interface_name': groups['context_name']}
                 }})
 
             for nh in next_hops:
-                dict_next_hop = dict_routes.setdefault('next_hop', {}).setdefault('next_hop_list', {}).setdefault(index,
+                dict_next_hop = dict_route.setdefault('next_hop', {}).setdefault('next_hop_list', {}).setdefault(index,
                                                                                                                   {})
                 dict_next_hop.update({'index': index})
                 dict_next_hop.update({'next_hop': nh.get('next_hop')})
@@ -0,0 +1,195 @@
+'''Parsers of the F5 BIG-IP REST API endpoints, created from the table of
+endpoints.py. Each parser returns the JSON of its endpoint as is:
+
+    >>> from genie.libs.parser.bigip.get_sys_version import SysVersion
+    >>> SysVersion(device=device, context='rest').parse()
+
+The modules of the parsers are not files of the package: they are created on
+their first import, so that neither importing the package nor walking it, as
+the genie.abstract lookups do, imports the parsers of all the endpoints.
+
+Several endpoints can be fetched at once, over the connections of a pool:
+
+    >>> with RestSession('https://10.1.1.1', auth=('admin', 'admin')) as dev:
+    ...     version, interfaces = parse_endpoints(
+    ...         dev, ['/mgmt/tm/sys/version', '/mgmt/tm/net/interface'])
+'''
+
+import sys
+import functools
+import importlib
+import importlib.abc
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+
+from genie.metaparser import MetaParser
+
+from .endpoints import ENDPOINTS
+
+PACKAGE = __name__.rpartition('.')[0]
+
+
+@functools.lru_cache(maxsize=None)
+def endpoints():
+    '''the (class name, endpoint) of the parser of each module of the table,
+       by module name'''
+    table = {}
+    for line in ENDPOINTS.splitlines():
+        if line:
+            module, name, command = line.split()
+            table[module] = (name, command)
+    return table
+
+
+@functools.lru_cache(maxsize=None)
+def _endpoint_modules():
+    return {command: module
+            for module, (name, command) in endpoints().items()}
+
+
+def rest(self):
+    '''rest() of the parsers, the JSON of their endpoint'''
+    response = self.device.get(self.cli_command)
+
+    response_json = response.json()
+
+    if not response_json:
+        return {}
+
+    return response_json
+
+
+class EndpointFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    '''Finder and loader of the modules of the parsers of the table, such as
+       genie.libs.parser.bigip.get_sys_version, each with the schema and the
+       parser classes of its endpoint'''
+
+    def find_spec(self, fullname, path=None, target=None):
+        package, _, module = fullname.rpartition('.')
+        if package != PACKAGE or module not in endpoints():
+            return None
+        return importlib.util.spec_from_loader(fullname, self)
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        name, command = endpoints()[module.__name__.rpartition('.')[2]]
+        schema = type(name + 'Schema', (MetaParser,), {
+            '__module__': module.__name__,
+            'schema': {},
+        })
+        parser = type(name, (schema,), {
+            '__module__': module.__name__,
+            '__doc__': ' To F5 resource for {}\n    '.format(command),
+            'cli_command': command,
+            'rest': rest,
+        })
+        module.__dict__.update({schema.__name__: schema, name: parser})
+
+
+def install_finder():
+    '''add the EndpointFinder to the finders of the import system, once'''
+    if not any(isinstance(finder, EndpointFinder)
+               for finder in sys.meta_path):
+        sys.meta_path.append(EndpointFinder())
+
+
+def endpoint_parser(command):
+    '''the parser class of an endpoint of the table
+
+        Args:
+            command (`str`): endpoint, such as '/mgmt/tm/sys/version'
+
+        Returns:
+            parser class
+
+        Raises:
+            Exception: no parser for the endpoint
+    '''
+    try:
+        module = _endpoint_modules()[command]
+    except KeyError:
+        raise Exception("Could not find parser for '{}'".format(command)) \
+            from None
+    name = endpoints()[module][0]
+    return getattr(importlib.import_module('{}.{}'.format(PACKAGE, module)),
+                   name)
+
+
+class RestSession(object):
+    '''Device of the parsers getting the endpoints of a BIG-IP over HTTP,
+       with a requests session whose pool of connections is shared by the
+       concurrent requests of parse_endpoints()
+
+        Args:
+            base_url (`str`): scheme and address of the BIG-IP, such as
+                              'https://10.1.1.1'
+            auth (`tuple`): user and password
+            verify (`bool`): whether the certificate of the BIG-IP is
+                             verified
+            pool_size (`int`): number of connections kept open, and of
+                               endpoints fetched at a time
+            timeout (`float`): timeout of each request in seconds
+    '''
+
+    def __init__(self, base_url, auth=None, verify=True, pool_size=10,
+                 timeout=None):
+        # only needed to fetch the endpoints without a pyATS device
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.base_url = base_url.rstrip('/')
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.auth = auth
+        self.session.verify = verify
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get(self, api_url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        response = self.session.get(self.base_url + api_url, **kwargs)
+        response.raise_for_status()
+        return response
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def parse_endpoints(device, commands, max_workers=None):
+    '''Parse several endpoints with their parser, concurrently
+
+        Args:
+            device (`Device`): device with a get() of the endpoints, such as a
+                               pyATS device connected over REST or a
+                               RestSession
+            commands (`list`): endpoints, such as '/mgmt/tm/sys/version'
+            max_workers (`int`): number of endpoints fetched at a time, the
+                                 pool size of a RestSession by default, one
+                                 otherwise
+
+        Returns:
+            `list` of the parsed output of each endpoint, in order
+    '''
+    parsers = [endpoint_parser(command) for command in commands]
+
+    def parse(parser):
+        return parser(device=device, context='rest').parse()
+
+    if max_workers is None:
+        max_workers = device.pool_size if isinstance(device, RestSession) \
+            else 1
+    workers = min(len(parsers), max_workers)
+    if workers <= 1:
+        return [parse(parser) for parser in parsers]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse, parsers))
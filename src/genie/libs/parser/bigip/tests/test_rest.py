@@ -0,0 +1,118 @@
+# Python
+import json
+import pickle
+import threading
+import unittest
+from unittest.mock import Mock
+from socketserver import ThreadingMixIn
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+try:
+    import requests
+except ImportError:
+    # only needed by the RestSession
+    requests = None
+
+# Genie
+from genie.abstract import Lookup
+
+# Parser
+import genie.libs.parser
+from genie.libs.parser.bigip.get_sys_version import SysVersion
+from genie.libs.parser.bigip.rest import (
+    RestSession, endpoint_parser, endpoints, parse_endpoints)
+
+
+class MockBigip(BaseHTTPRequestHandler):
+    '''REST API of a BIG-IP returning the endpoint in its JSON'''
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.clients.add(self.client_address)
+        if self.path.startswith('/mgmt/tm/'):
+            body = json.dumps({'kind': 'tm', 'selfLink': self.path}).encode()
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    # http.server.ThreadingHTTPServer of python 3.7
+    daemon_threads = True
+
+
+class TestRest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), MockBigip)
+        cls.server.clients = set()
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = 'http://127.0.0.1:{}'.format(cls.server.server_port)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_parser(self):
+        self.assertEqual(SysVersion.cli_command, '/mgmt/tm/sys/version')
+        self.assertEqual(SysVersion.__module__,
+                         'genie.libs.parser.bigip.get_sys_version')
+        self.assertEqual(SysVersion.__mro__[1].__name__, 'SysVersionSchema')
+        self.assertIs(pickle.loads(pickle.dumps(SysVersion)), SysVersion)
+        self.assertIs(endpoint_parser('/mgmt/tm/sys/version'), SysVersion)
+
+        lookup = Lookup('bigip', packages={'parser': genie.libs.parser})
+        self.assertIs(lookup.parser.get_sys_version.SysVersion, SysVersion)
+
+        device = Mock()
+        device.get.return_value.json.return_value = {'kind': 'tm'}
+        self.assertEqual(SysVersion(device=device, context='rest').parse(),
+                         {'kind': 'tm'})
+        device.get.assert_called_with('/mgmt/tm/sys/version')
+
+    def test_endpoints(self):
+        self.assertEqual(len(endpoints()), 739)
+        self.assertEqual(endpoints()['get_access_profile_rewritestats'],
+                         ('AccessProfilerewriteStats',
+                          '/mgmt/tm/access/profile-rewrite/stats'))
+        with self.assertRaises(Exception):
+            endpoint_parser('/mgmt/tm/sys/unknown')
+        with self.assertRaises(ImportError):
+            from genie.libs.parser.bigip import get_sys_unknown
+
+    @unittest.skipUnless(requests, 'requests is not installed')
+    def test_parse_endpoints(self):
+        commands = [command for name, command in endpoints().values()][:40]
+        self.server.clients.clear()
+        with RestSession(self.base_url, pool_size=4) as device:
+            parsed = parse_endpoints(device, commands)
+            self.assertEqual(parsed, [{'kind': 'tm', 'selfLink': command}
+                                      for command in commands])
+            # the connections of the pool are reused
+            self.assertLessEqual(len(self.server.clients), 4)
+
+            self.assertEqual(
+                parse_endpoints(device, ['/mgmt/tm/sys/version'],
+                                max_workers=1),
+                [{'kind': 'tm', 'selfLink': '/mgmt/tm/sys/version'}])
+
+    @unittest.skipUnless(requests, 'requests is not installed')
+    def test_errors(self):
+        with RestSession(self.base_url) as device:
+            with self.assertRaises(Exception):
+                device.get('/unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
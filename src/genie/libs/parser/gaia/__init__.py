@@ -0,0 +1,2 @@
+from genie import abstract
+abstract.declare_token(__name__)
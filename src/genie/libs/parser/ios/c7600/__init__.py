@@ -1,3 +1,3 @@
 from genie import abstract
 
-abstract.declare_token(__name__)
\ No newline at end of file
+abstract.declare_token(__name__)
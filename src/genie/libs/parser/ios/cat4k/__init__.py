@@ -1,3 +1,3 @@
 # Enable abstraction using this directory name as the abstraction token
 from genie import abstract
-abstract.declare_token(__name__)
\ No newline at end of file
+abstract.declare_token(__name__)
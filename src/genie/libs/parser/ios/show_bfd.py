@@ -2,12 +2,16 @@
 IOS parser for the following show command
 	* show bfd neighbors details
 	* show bfd neighbors client <client> details
+	* show bfd internal
 '''
 
 # import iosxe parser
 from genie.libs.parser.iosxe.show_bfd import ShowBfdNeighborsDetails as \
 											 ShowBfdNeighborsDetails_iosxe
 
+from genie.libs.parser.iosxe.show_bfd import ShowBfdInternal as \
+											 ShowBfdInternal_iosxe
+
 
 class ShowBfdNeighborsDetails(ShowBfdNeighborsDetails_iosxe):
     """
@@ -16,3 +20,11 @@ class ShowBfdNeighborsDetails(ShowBfdNeighborsDetails_iosxe):
 	  'show bfd neighbors client <client> details'
 	"""
     pass
+
+
+class ShowBfdInternal(ShowBfdInternal_iosxe):
+    """
+    IOS parser for the following show command
+	  'show bfd internal'
+	"""
+    pass
\ No newline at end of file
@@ -10,6 +10,10 @@
     * show ipv6 interface
     * show interfaces accounting
     * show interfaces status
+    * show interfaces transciever
+    * show interfaces {interface} transceiver
+    * show interfaces transceiver detail
+    * show interfaces {interface} transceiver detail
 
     # TODO: Need find replacement command for IOSXE 'show interface <intf> counters'
 """
@@ -20,7 +24,7 @@ import re
 # genie
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
-                                         Any, Optional
+    Any, Optional
 
 # import iosxe parser
 from genie.libs.parser.iosxe.show_interface import \
@@ -34,9 +38,11 @@ from genie.libs.parser.iosxe.show_interface import \
     ShowInterfacesCounters as ShowInterfacesCounters_iosxe, \
     ShowInterfacesSwitchport as ShowInterfacesSwitchport_iosxe, \
     ShowInterfacesTrunk as ShowInterfacesTrunk_iosxe, \
-    ShowInterfacesStats as ShowInterfacesStats_iosxe,\
+    ShowInterfacesStats as ShowInterfacesStats_iosxe, \
     ShowInterfacesDescription as ShowInterfacesDescription_iosxe, \
-    ShowInterfacesStatus as ShowInterfacesStatus_iosxe
+    ShowInterfacesStatus as ShowInterfacesStatus_iosxe, \
+    ShowInterfacesTransceiver as ShowInterfacesTransceiver_iosxe, \
+    ShowInterfacesTransceiverDetail as ShowInterfacesTransceiverDetail_iosxe
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
@@ -45,14 +51,14 @@ from genie.libs.parser.utils.common import Common
 class ShowInterfaces(ShowInterfaces_iosxe):
     """parser for show interfaces"""
     exclude = ['in_octets', 'in_pkts', 'out_octets', 'out_pkts',
-        'in_rate', 'in_rate_pkts', 'out_rate', 'out_rate_pkts',
-        'input_queue_size', 'in_broadcast_pkts', 'in_multicast_pkts'
-        'last_output', 'out_unknown_protocl_drops', 'last_input',
-        'input_queue_drops', 'out_interface_resets', 
-        'rxload', 'txload', 'last_clear', 'in_crc_errors',
-        'in_errors', 'in_giants', 'unnumbered', 'mac_address', 
-        'phys_address', 'out_lost_carrier', '(Tunnel.*)',
-        'input_queue_flushes', 'reliability', 'in_runts']
+               'in_rate', 'in_rate_pkts', 'out_rate', 'out_rate_pkts',
+               'input_queue_size', 'in_broadcast_pkts', 'in_multicast_pkts',
+               'last_output', 'out_unknown_protocl_drops', 'last_input',
+               'input_queue_drops', 'out_interface_resets',
+               'rxload', 'txload', 'last_clear', 'in_crc_errors',
+               'in_errors', 'in_giants', 'unnumbered', 'mac_address',
+               'phys_address', 'out_lost_carrier', '(Tunnel.*)',
+               'input_queue_flushes', 'reliability', 'in_runts']
 
     pass
 
@@ -110,7 +116,7 @@ class ShowInterfacesTrunk(ShowInterfacesTrunk_iosxe):
     """Parser for show interfaces trunk"""
     pass
 
-    
+
 class ShowInterfacesStats(ShowInterfacesStats_iosxe):
     """Parser for:
         show interfaces <interface> stats
@@ -129,3 +135,21 @@ class ShowInterfacesStatus(ShowInterfacesStatus_iosxe):
     """Parser for:
         show interfaces status"""
     pass
+
+
+class ShowInterfacesTransceiverDetail(ShowInterfacesTransceiverDetail_iosxe):
+    """
+    Parser for:
+        * show interfaces transceiver detail
+        * show interfaces <interface> transceiver detail
+    """
+    pass
+
+
+class ShowInterfacesTransceiver(ShowInterfacesTransceiver_iosxe):
+    """
+    Parser for:
+        * show interfaces transciever
+        * show interfaces <interface> transceiver
+    """
+    pass
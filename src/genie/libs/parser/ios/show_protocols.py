@@ -9,13 +9,16 @@ from genie.libs.parser.iosxe.show_protocols import ShowIpProtocols as \
 												   ShowIpProtocolsSectionRip as \
 												   ShowIpProtocolsSectionRip_iosxe, \
 												   ShowIpv6ProtocolsSectionRip as \
-												   ShowIpv6ProtocolsSectionRip_iosxe
+												   ShowIpv6ProtocolsSectionRip_iosxe, \
+                                                   ShowIpv6Protocols as \
+                                                   ShowIpv6Protocols_iosxe
 
 
 class ShowIpProtocols(ShowIpProtocols_iosxe):
 	''' Parser for "show ip protocols" '''
 	pass
 
+
 class ShowIpProtocolsSectionRip(ShowIpProtocolsSectionRip_iosxe):
 	"""
 	Parser for :
@@ -24,9 +27,15 @@ class ShowIpProtocolsSectionRip(ShowIpProtocolsSectionRip_iosxe):
 	"""
 	pass
 
+
 class ShowIpv6ProtocolsSectionRip(ShowIpv6ProtocolsSectionRip_iosxe):
 	"""Parser for :
 		show ipv6 protocols | sec rip
 		show ipv6 protocols vrf {vrf} | sec rip
 	"""
-	pass
\ No newline at end of file
+	pass
+
+
+class ShowIpv6Protocols(ShowIpv6Protocols_iosxe):
+	''' Parser for "show ipv6 protocols" '''
+	pass
@@ -25,15 +25,17 @@ class ShowArchiveSchema(MetaParser):
     Schema for show archive
     """
 
-    schema = {'archive': {
-                'total': int,
-                Optional('max_archive_configurations'): int,
-                'most_recent_file': str,
-                Any(): {
-                    'file': str,
-                },
-            }
+    schema = {
+        'archive': {
+            Optional('total'): int,
+            Optional('max_archive_configurations'): int,
+            Optional('most_recent_file'): str,
+            Optional('error'): str,
+            Any(): {
+                'file': str,
+            },
         }
+    }
 
 class ShowArchive(ShowArchiveSchema):
     """ Parser for show archive """
@@ -44,55 +46,55 @@ class ShowArchive(ShowArchiveSchema):
     def cli(self,output=None):
         if output is None:
             # excute command to get output
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
+            output = self.device.execute(self.cli_command)
 
+        # The maximum archive configurations allowed is 10.
+        p1 = re.compile(r'^The +maximum +archive +configurations +allowed +is +(?P<max>\d+)\.$')
+
+        # There are currently 1 archive configurations saved.
+        p2 = re.compile(r'^There +are +currently +(?P<total>\d+) +archive +configurations +saved\.$')
+
+        # 1        bootflash:uncfgIntfgigabitethernet0_0_0-Sep-27-15-04-18.414-PDT-0 <- Most Recent
+        p3 = re.compile(r'^(?P<num>[0-9]+) +(?P<file>\S+)(?P<recent> +\<\- +Most +Recent)?$')
+
+        # Archive feature not enabled
+        p4 = re.compile(r'^(?P<error>Archive feature not enabled)$')
+        
         # initial variables
         ret_dict = {}
 
-        for line in out.splitlines():
+        for line in output.splitlines():
             line = line.strip()
 
             # The maximum archive configurations allowed is 10.
-            p1 = re.compile(r'^The +maximum +archive +configurations +allowed +is +(?P<max>\d+)\.$')
             m = p1.match(line)
             if m:
-                if 'archive' not in ret_dict:
-                    ret_dict['archive'] = {}
-                ret_dict['archive']['max_archive_configurations'] = int(m.groupdict()['max'])
+                ret_dict.setdefault('archive', {}).setdefault('max_archive_configurations', int(m.groupdict()['max']))
                 continue
-
+            
             # There are currently 1 archive configurations saved.
-            p2 = re.compile(r'^There +are +currently +(?P<total>\d+) +archive +configurations +saved\.$')
             m = p2.match(line)
             if m:
-                if 'archive' not in ret_dict:
-                    ret_dict['archive'] = {}
-                    
-                ret_dict['archive']['total'] = int(m.groupdict()['total'])
+                ret_dict.setdefault('archive', {}).setdefault('total', int(m.groupdict()['total']))
                 continue
-
+            
             # 1        bootflash:uncfgIntfgigabitethernet0_0_0-Sep-27-15-04-18.414-PDT-0 <- Most Recent
-            p3 = re.compile(r'^(?P<num>[0-9]+) +'
-                             '(?P<file>[\w\:\-\.]+)(?P<recent> +\<\- +Most +Recent)?$')
             m = p3.match(line)
             if m:
-                num = m.groupdict()['num']
                 file = m.groupdict()['file']
-                recent = m.groupdict()['recent']
-
-                if 'archive' not in ret_dict:
-                    ret_dict['archive'] = {}
 
-                if num not in ret_dict['archive']:
-                    ret_dict['archive'][num] = {}
+                num_dict = ret_dict.setdefault('archive', {}).setdefault(m.groupdict()['num'], {})
 
-                ret_dict['archive'][num]['file'] = file
-                if recent:
+                num_dict['file'] = file
+                if m.groupdict()['recent']:
                     ret_dict['archive']['most_recent_file'] = file                
                 continue
-
+            
+            # Archive feature not enabled
+            m = p4.match(line)
+            if m:
+                ret_dict.setdefault('archive', {}).setdefault('error', m.groupdict()['error'])
+        
         return ret_dict
 
 # ====================================================
@@ -108,8 +110,8 @@ class ShowArchiveConfigDifferencesSchema(MetaParser):
     """
     
     schema = {
-            Optional('diff'): list,
-            Optional('list_of_commands'): list
+        Optional('diff'): list,
+        Optional('list_of_commands'): list
     }
 
 class ShowArchiveConfigDifferences(ShowArchiveConfigDifferencesSchema):
@@ -119,10 +121,11 @@ class ShowArchiveConfigDifferences(ShowArchiveConfigDifferencesSchema):
         * show archive config differences {fileA}
     """
 
-    cli_command = ['show archive config differences', 
-                'show archive config differences {fileA} {fileB}',
-                'show archive config differences {fileA}'
-            ]
+    cli_command = [
+        'show archive config differences', 
+        'show archive config differences {fileA} {fileB}',
+        'show archive config differences {fileA}'
+    ]
 
     def cli(self, fileA='', fileB='', cmd='', output=None):
         if output is None:
@@ -148,20 +151,26 @@ class ShowArchiveConfigDifferences(ShowArchiveConfigDifferencesSchema):
         
         # !Contextual Config Diffs:
         p1 = re.compile(r'^\s*!Contextual +Config +Diffs:$')
+        
         # +hostname Router
         # -hostname Test4
         p2 = re.compile(r'^\s*(?P<line_info>(\+|\-)[\w\W]+)$')
+        
         # !List of commands:
         p3 = re.compile(r'^\s*!List +of +(C|c)ommands:$')
+        
         # Load for five secs: 16%/0%; one minute: 30%; five minutes: 23%
         p4 = re.compile(r'^Load +for +five +secs: +\d+%\/\d+%; +one +minute:' \
             ' +\d+%; +five +minutes: +\d+%$')
+        
         # Time source is NTP, 19:16:19.992 EST Thu Sep 15 2016
         # Time source is NTP, *02:20:46.845 EST Thu May 16 2019
         p5 = re.compile(r'^Time +source +is +\w+, +\*?\d+:\d+:\d+\.\d+ +\w+ +' \
             '\w+ +\w+ +\d+ +\d+$')
+        
         # test#show archive config incremental-diffs bootflash:A.cfg
         p6 = re.compile(r'^(test#|Device#|Router#)')
+        
         # hostname Router3
         p7 = re.compile(r'^\s*(?P<line_info>([\w\W]+))$')
 
@@ -190,19 +199,23 @@ class ShowArchiveConfigDifferences(ShowArchiveConfigDifferencesSchema):
                 if m:
                     incremental_diff = ret_dict.setdefault('list_of_commands',[])
                     continue
+                
                 # Load for five secs: 16%/0%; one minute: 30%; five minutes: 23%
                 m = p4.match(line)
                 if m:
                     continue
+                
                 # Time source is NTP, 19:16:19.992 EST Thu Sep 15 2016
                 # Time source is NTP, *02:20:46.845 EST Thu May 16 2019
                 m = p5.match(line)
                 if m:
                     continue
-                #test#show archive config incremental-diffs bootflash:A.cfg
+                
+                # test#show archive config incremental-diffs bootflash:A.cfg
                 m = p6.match(line)
                 if m:
                     continue
+                
                 # hostname router 192.168.5.2/22
                 # end
                 m = p7.match(line)
@@ -221,3 +234,162 @@ class ShowArchiveConfigIncrementalDiffs(ShowArchiveConfigDifferences):
     def cli(self, fileA, output=None):
         return super().cli(fileA=fileA, cmd=self.cli_command, output=output)
 
+class ShowArchiveLogConfigSchema(MetaParser):
+
+    '''Schema for:
+        * show archive log config all
+        * schema for show archive log config {include}
+    '''
+    
+    schema = {   
+        'idx':{
+            int: { 
+                'sess' : int,
+                'userline' : str,
+                'logged_command' : str, 
+            }
+        }
+    } 
+     
+class ShowArchiveLogConfig(ShowArchiveLogConfigSchema):
+
+    ''' Parser for:
+        * show archive log config all
+        * show archive log config {include}
+    '''
+
+    cli_command = [
+        'show archive log config {include}',
+        'show archive log config all' 
+    ]
+        
+    def cli(self, include='', output=None):
+    
+        if output is None:          
+            if include:            
+                output = self.device.execute(self.cli_command[0].format(include=include))
+            else:
+                output = self.device.execute(self.cli_command[1])
+              
+        ret_dict = {}
+        
+        #idx   sess           user@line      Logged command 
+        #610     1        console@console  |  logging enable 
+        p1 = re.compile(r'^(?P<idx>\d+)\s+(?P<sess>\d+)\s+(?P<userline>[\w\@]+)\s+\|(\s+)?(?P<logged_command>[\w(\-)?\s]+)$')
+        
+        for line in output.splitlines():     
+            line = line.strip()
+            
+            #idx   sess           user@line      Logged command 
+            #609     1        console@console  | log config            
+            m = p1.match(line)                      
+            if m: 
+                group = m.groupdict()  
+                idx = int(group['idx'])              
+                idx_dict = ret_dict.setdefault('idx', {}).setdefault(idx, {})
+                idx_dict['sess'] = int(group['sess'])                    
+                idx_dict['userline'] = group['userline']  
+                idx_dict['logged_command'] = group['logged_command']
+                continue
+                
+        return ret_dict
+        
+        
+class ShowArchiveLogStatisticsSchema(MetaParser): 
+
+    '''schema for:
+       * show archive log config statistics
+    '''
+    
+    schema = {
+        'log':{
+            Any():{           
+                'num_entries_in_log': int,
+                'memory_held_bytes': int, 
+                'memory_allocated_bytes': int, 
+                'memory_free_bytes': int
+            }
+        }
+    }
+            
+                        
+class ShowArchiveLogStatistics(ShowArchiveLogStatisticsSchema):
+
+    ''' Parser for: 
+        * show archive log config statistics'''
+
+    cli_command = 'show archive log config statistics'
+    
+    def cli(self,output=None):
+    
+        if output is None:
+            output = self.device.execute(self.cli_command)
+ 
+        ret_dict = {}  
+         
+        #Config Log Session Info:
+        #Config Log log-queue Info:
+        p1  =  re.compile(r'^Config Log (?P<log>[\s\w(\-)?]+\:)$')
+
+        #Number of sessions being tracked: 1
+        #Number of entries in the log-queue: 472
+        p2 = re.compile(r'^Number of [\w\s(\-)?]+: +(?P<num_entries_in_log>[\d]+)$')
+
+        #Memory being held: 3934 bytes
+        #Memory being held by the log-queue: 186617 bytes
+        p3 = re.compile(r'^Memory being [\w\s(\-)?]+\: (?P<memory_held_bytes>[\d]+)[\w\s]+$')
+
+        #Total memory allocated for session tracking: 11793 bytes
+        #Total memory allocated for log entries: 186617 bytes
+        p4 = re.compile(r'^Total memory allocated for [\w\s]+: +(?P<memory_allocated_bytes>[\d]+)[\w\s]+$')
+        
+        #Total memory freed from session tracking: 7859 bytes
+        #Total memory freed from log entries: 0 bytes
+        p5 = re.compile(r'^Total memory freed from [\w\s]+: +(?P<memory_free_bytes>[\d]+)[\w\s]+$')
+        
+        for line in output.splitlines():
+            line=line.strip()
+            
+            #Config Log Session Info:
+            #Config Log log-queue Info:
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                log=group['log']
+                root_dict = ret_dict.setdefault('log', {}).setdefault(log, {})
+                continue
+            
+            #Number of sessions being tracked: 1
+            #Number of entries in the log-queue: 472
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                root_dict.setdefault('num_entries_in_log', int(group['num_entries_in_log']))
+                continue
+                
+            #Memory being held: 3934 bytes
+            #Memory being held by the log-queue: 186617 bytes           
+            m = p3.match(line)                                                                                                                                               
+            if m:
+                group = m.groupdict() 
+                root_dict.setdefault('memory_held_bytes', int(group['memory_held_bytes']))
+                continue
+            
+            #Total memory allocated for session tracking: 11793 bytes
+            #Total memory allocated for log entries: 186617 bytes
+            m = p4.match(line)
+            if m:
+                group = m.groupdict() 
+                root_dict.setdefault('memory_allocated_bytes', int(group['memory_allocated_bytes']))
+                continue
+            
+            #Total memory freed from session tracking: 7859 bytes
+            #Total memory freed from log entries: 0 bytes
+            m = p5.match(line)
+            if m:
+                group = m.groupdict() 
+                root_dict.setdefault('memory_free_bytes', int(group['memory_free_bytes']))
+                continue
+        
+        return ret_dict
+
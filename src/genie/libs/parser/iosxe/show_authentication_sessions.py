@@ -148,11 +148,22 @@ class ShowAuthenticationSessions(ShowAuthenticationSessionsSchema):
         return ret_dict
 
 
+
 # ==================================================================================
-# Parser for 'show authentication sessions interface {interface} details'
+# Schema for:
+#                * 'show authentication sessions interface {interface} details'
+#                * 'show authentication sessions interface {interface} details switch {switch} r0'
+#                * 'show authentication sessions mac {mac_address} details'
+#                * 'show authentication sessions mac {mac_address} details switch {switch} r0'
 # ==================================================================================
-class ShowAuthenticationSessionsInterfaceDetailsSchema(MetaParser):
-    """Schema for 'show authentication sessions interface {interface} details'
+
+class ShowAuthenticationSessionsDetailsSuperSchema(MetaParser):
+    """
+    Schema for:
+                * 'show authentication sessions interface {interface} details'
+                * 'show authentication sessions interface {interface} details switch {switch} r0'
+                * 'show authentication sessions mac {mac_address} details'
+                * 'show authentication sessions mac {mac_address} details switch {switch} r0'
     """
     schema = {
         'interfaces': {
@@ -161,11 +172,23 @@ class ShowAuthenticationSessionsInterfaceDetailsSchema(MetaParser):
                     Any(): {
                         Optional('iif_id'): str,
                         Optional('ipv6_address'): str,
+                         Optional('ipv6'): {
+                            'ipv6_address': Or(str, list)
+                        },
                         'ipv4_address': str,
                         Optional('user_name'): str,
+                        Optional('device_type'): str,
+                        Optional('device_name'): str,
                         Optional('periodic_acct_timeout'): str,
                         Optional('timeout_action'): str,
-                        Optional('restart_timeout'): str,
+                        Optional('restart_timeout'): {
+                            Optional('timeout'): int,
+                            Optional('remaining'): int,
+                        },
+                        Optional('unauth_timeout'): {
+                            Optional('timeout'): int,
+                            Optional('remaining'): int,
+                        },
                         Optional('session_uptime'): str,
                         'status': str,
                         'domain': str,
@@ -202,6 +225,7 @@ class ShowAuthenticationSessionsInterfaceDetailsSchema(MetaParser):
                             },
                             Optional('security_policy'): str,
                             Optional('security_status'): str,
+                            Optional('interface_template'): str
                         },
                         Optional('method_status'): {
                             Any(): {
@@ -215,19 +239,25 @@ class ShowAuthenticationSessionsInterfaceDetailsSchema(MetaParser):
         }
     }
 
+# ==================================================================================
+# Parser for:
+#           * 'show authentication sessions interface {interface} details'
+#           * 'show authentication sessions interface {interface} details switch {switch} r0'
+#           * 'show authentication sessions mac {mac_address} details'
+#           * 'show authentication sessions mac {mac_address} details switch {switch} r0'
+# ==================================================================================
 
-class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsInterfaceDetailsSchema):
-    """Parser for 'show authentication sessions interface {interface} details'
+class ShowAuthenticationSessionsDetailsSuperParser(ShowAuthenticationSessionsDetailsSuperSchema):
+    """
+    SuperParser for:
+                * 'show authentication sessions interface {interface} details'
+                * 'show authentication sessions interface {interface} details switch {switch} r0'
+                * 'show authentication sessions mac {mac_address} details'
+                * 'show authentication sessions mac {mac_address} details switch {switch} r0'
     """
-    cli_command = 'show authentication sessions interface {interface} details'
 
-    def cli(self, interface, output=None):
+    def cli(self, interface='', mac_address='', switch='', output=None):
 
-        if not output:
-            # get output from device
-            out = self.device.execute(self.cli_command.format(interface=interface))
-        else:
-            out = output
 
         # Interface:  GigabitEthernet3/0/2
         # IIF-ID:  0x1055240000001F6 
@@ -255,7 +285,7 @@ class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsInter
 
         # Template: CRITICAL_VLAN (priority 150)
         # Service Template: DEFAULT_LINKSEC_POLICY_SHOULD_SECURE (priority 150)
-        p3 = re.compile(r'^(?:Service +)?Template: +(?P<template>\w+) +\(priority +(?P<priority>[0-9]+)\)$')
+        p3 = re.compile(r'^(?P<template_type>Service|Interface)?\s*Template: +(?P<template>\w+)\s*(\(priority +(?P<priority>[0-9]+)\))?$')
 
         # Vlan Group:  Vlan: 130
         p4 = re.compile(r'^Vlan +Group: +(?P<vlan_name>\w+): +(?P<vlan_value>[0-9]+)$')
@@ -264,7 +294,7 @@ class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsInter
         p5 = re.compile(r'^Method +status +list:')
 
         # dot1x            Authc Failed
-        p6 = re.compile(r'^(?P<method>[dot1x|mab]\w+) +(?P<state>(\w+\s\w+)|(\w+))$')
+        p6 = re.compile(r'^(?P<method>[dot1x|mab|webauth]\w+) +(?P<state>(\w+\s\w+)|(\w+))$')
 
         # Runnable methods list:
         p7 = re.compile(r'^Runnable +methods +list:')
@@ -294,9 +324,19 @@ class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsInter
         # IPv6 Address: fe9d:f156::1
         p11 = re.compile(r'^IPv6 +Address\: +(?P<ipv6>\S+?)$')
 
+        # 1555:10::5ced:6cc3:825b:39da
+        # 1555:10::225:1ff:fe00:5
+        p11_1 = re.compile(r'^(?P<address>[\w\:]+)$')
+
         # Server Policies:
         p12 = re.compile(r'^Server +Policies\:$')
 
+        # Restart timeout:  60s, Remaining: 44s
+        p13 = re.compile(r'(Restart\s*timeout)\s*:\s*(?P<timeout>\w+)s(\s*,\s*Remaining\s*:\s*(?P<remaining>\w+)s)?')
+
+        # Unauth timeout:  10s, Remaining: 5s
+        p14 = re.compile(r'(Unauth\s*timeout)\s*:\s*(?P<timeout>\w+)s(\s*,\s*Remaining\s*:\s*(?P<remaining>\w+)s)?')
+
         # initial return dictionary
         ret_dict = {}
         hold_dict = {}
@@ -305,6 +345,7 @@ class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsInter
         policies_flag = False
         index = 1
 
+        out = output
         for line in out.splitlines():
             line = line.strip()
 
@@ -316,7 +357,7 @@ class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsInter
             #   Security Status:  Link Unsecure
             m = p10.match(line)
             if m:
-                group = m.groupdict()            
+                group = m.groupdict()
                 if policies_flag:
                     if index != 1:
                         index += 1
@@ -337,7 +378,7 @@ class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsInter
                             {'security_status': group['policy_status']})
 
                 continue
-                
+
             # *      Security Policy:  None      Security Status:  Link Unsecured*
             m = p10_1.match(line)
             if m:
@@ -353,7 +394,6 @@ class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsInter
                     security_dict.update({'security_policy': group['policy_status']})
                     security_dict.update({'security_status': group['policy_status2']})
                 continue
-                        
 
             # Session timeout:  43200s(local), Remaining: 31799s
             # Session timeout:  N/A
@@ -369,10 +409,26 @@ class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsInter
                     session_dict.update({'remaining': group['remaining']})
 
                 continue
+            
+            # Restart timeout:  10s, Remaining: 5s
+            m13 = p13.match(line)
+            if m13:
+                restart_dict = mac_dict.setdefault('restart_timeout', {})
+                restart_dict.update({'timeout': int(m13.group('timeout'))})
+                restart_dict.update({'remaining': int(m13.group('remaining'))})
+                continue
+
+            # Unauth timeout:  60s, Remaining: 44s
+            m14 = p14.match(line)
+            if m14:
+                unauth_dict = mac_dict.setdefault('unauth_timeout', {})
+                unauth_dict.update({'timeout': int(m14.group('timeout'))})
+                unauth_dict.update({'remaining': int(m14.group('remaining'))})
+                continue
 
             # match these lines:
             #             Interface:  GigabitEthernet3/0/2
-            #                IIF-ID:  0x1055240000001F6 
+            #                IIF-ID:  0x1055240000001F6
             #           MAC Address:  0010.00ff.1011
             #          IPv6 Address:  Unknown
             #          IPv4 Address:  192.0.2.1
@@ -381,7 +437,6 @@ class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsInter
             #                Domain:  DATA
             #        Oper host mode:  single-host
             #      Oper control dir:  both
-            #       Session timeout:  N/A
             #     Common Session ID:  AC14FC0A0000101200E28D62
             #       Acct Session ID:  Unknown
             #                Handle:  0xDB003227
@@ -397,12 +452,12 @@ class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsInter
                 known_list = ['interface', 'iif_id', 'mac_address', 
                               'ipv6_address', 'ipv4_address', 'user_name', 
                               'status', 'domain', 'oper_host_mode', 
-                              'oper_control_dir', 'session_timeout', 
+                              'oper_control_dir',
                               'common_session_id', 'acct_session_id', 
                               'handle', 'current_policy', 'authorized_by',
-                              'periodic_acct_timeout', 'restart_timeout',
+                              'periodic_acct_timeout',
                               'session_uptime', 'timeout_action', 'ip_address',
-                              'idle_timeout', 'vlan_policy']
+                              'idle_timeout', 'vlan_policy', 'device_type', 'device_name']
 
                 group = m.groupdict()
                 key = re.sub(r'( |-)', '_', group['argument'].lower())
@@ -414,6 +469,7 @@ class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsInter
 
                     if 'interfaces' in ret_dict.keys():
                         if key == 'mac_address':
+                            index = 1
                             mac_dict = intf_dict.setdefault(group['value'], {})
                         elif key == 'iif_id':
                             hold_dict.update({'argument': key, 'value': group['value']})
@@ -429,7 +485,8 @@ class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsInter
                         mac_dict = ret_dict.setdefault('interfaces', {})
                         value_dict = mac_dict.setdefault(group['value'], {})
                         intf_dict = value_dict.setdefault('mac_address', {})
-                        
+                    continue
+
                 elif (key not in known_list) and policies_flag:
                     policies_dict = mac_dict.setdefault('server_policies', {})
                     index_dict = policies_dict.setdefault(index, {})
@@ -437,13 +494,18 @@ class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsInter
                     index_dict.update({'policies': group['value']})
                     index += 1
                     
-                continue
+                    continue
  
             # Template: CRITICAL_VLAN (priority 150)
+            # Interface Template: IP_PHONE_INTERFACE_TEMPLATE
             m = p3.match(line)
             if m:
                 group = m.groupdict()
-                template_dict = mac_dict.setdefault('local_policies', {}).setdefault('template', {})
+                local_policies_dict = mac_dict.setdefault('local_policies', {})
+                if group['template_type'] == 'Interface':
+                    local_policies_dict.setdefault('interface_template', group['template'])
+                    continue
+                template_dict = local_policies_dict.setdefault('template', {})
                 priority_dict = template_dict.setdefault(group['template'], {})
                 priority_dict.update({'priority': int(group['priority'])})
                 continue
@@ -479,6 +541,15 @@ class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsInter
                 mac_dict.update({'ipv6_address': m11.groupdict()['ipv6']})
 
                 continue
+            
+            # 1555:10::5ced:6cc3:825b:39da
+            # 1555:10::225:1ff:fe00:5            
+            m = p11_1.match(line)                            
+            if m:                         
+                group = m.groupdict()
+                com_dict = mac_dict.setdefault('ipv6', {}).setdefault('ipv6_address', [])      
+                com_dict.append(group['address'])         
+                continue
 
             # Server Policies:
             m12 = p12.match(line)
@@ -487,4 +558,235 @@ class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsInter
 
                 continue
 
-        return ret_dict
\ No newline at end of file
+        return ret_dict
+
+# ==================================================================================
+# Parser for:
+#           * 'show authentication sessions interface {interface} details'
+#           * 'show authentication sessions interface {interface} details switch {switch} r0'
+# ==================================================================================
+
+class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsDetailsSuperParser):
+    """
+    Parser for:
+                * 'show authentication sessions interface {interface} details'
+                * 'show authentication sessions interface {interface} details switch {switch} r0'
+    """
+
+    cli_command = ['show authentication sessions interface {interface} details',\
+                   'show authentication sessions interface {interface} details switch {switch} r0']
+                   
+    def cli(self, interface='', switch='', output=None):
+
+        if output is None:
+            # Build command
+            if switch:
+                cmd = self.cli_command[1].format(interface=interface,switch=switch)
+            else: 
+                cmd = self.cli_command[0].format(interface=interface)
+            # Execute command
+            show_output = self.device.execute(cmd)
+        else:
+            show_output = output
+
+        # Call super
+        return super().cli(output=show_output, interface=interface, switch=switch)
+
+# ==================================================================================
+# Parser for:
+#           * 'show authentication sessions mac {mac_address} details'
+#           * 'show authentication sessions mac {mac_address} details switch {switch} r0'
+# ==================================================================================
+
+class ShowAuthenticationSessionsMACDetails(ShowAuthenticationSessionsDetailsSuperParser):
+    """
+       Parser for:
+                * 'show authentication sessions mac {mac_address} details'
+                * 'show authentication sessions mac {mac_address} details switch {switch} r0'
+    """
+    cli_command = ['show authentication sessions mac {mac_address} details',\
+                   'show authentication sessions mac {mac_address} details switch {switch} r0'] 
+                    
+
+    def cli(self, mac_address='', switch='', output=None):
+
+        if output is None:
+            # Build command
+            if switch:
+                cmd = self.cli_command[1].format(mac_address=mac_address,switch=switch)
+            else: 
+                cmd = self.cli_command[0].format(mac_address=mac_address)
+            # Execute command
+            show_output = self.device.execute(cmd)
+        else:
+            show_output = output
+
+        # Call super
+        return super().cli(output=show_output, mac_address=mac_address, switch=switch)
+
+#========================================================================================
+# Parser for:
+#           * 'authentication display config-mode'
+#========================================================================================
+
+class AuthenticationDisplayConfigModeSchema(MetaParser):
+    schema = {
+        'current_config_mode': str,
+    }
+
+
+class AuthenticationDisplayConfigMode(AuthenticationDisplayConfigModeSchema):
+
+    cli_command = 'authentication display config-mode'
+
+    def cli(self,output=None):
+
+        if not output:
+            output = self.device.execute(self.cli_command)
+
+        p1 = re.compile(r'^Current\sconfiguration\smode\sis\s(?P<current_config_mode>\S+)$')
+
+        ret_dict = {}
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                ret_dict.setdefault('current_config_mode', group['current_config_mode'])
+                continue
+        
+        return ret_dict
+
+'''
+Device#show access-session info
+Interface    MAC Address    M:D:S    Vlan     IPv4        Policy               User-Role
+-----------------------------------------------------------------------------------------
+Gi3/0/11     0015.0100.0001 D1x:D:AZ  UA        200.1.0.1 Dot1x                UA        
+Gi3/0/11     0015.0100.0002 D1x:D:AZ  UA        200.1.0.2 Dot1x                UA        
+Gi3/0/3      2894.0feb.9280 D1x:U:UZ  UA       UA         Dot1x                UA        
+Gi3/0/3      34db.fde5.34ab D1x:V:UZ  UA       UA         Dot1x                UA
+'''
+
+# ==================================================================================
+# Schema for:
+#                * 'show access-session info'
+#                * 'show access-session info switch {switch} r0'
+# ==================================================================================
+
+# ==============================================
+# Parser for 'show access-session info'
+# ==============================================
+class ShowAccessSessionsInfoSchema(MetaParser):
+    """Schema for show access-session info
+            show access-session info switch {switch} r0
+    """
+
+    schema = {
+        'interfaces': {
+            Any(): {
+                'interface': str,
+                'client': {
+                    Any(): {
+                        'client': str,
+                        'method': str,
+                        'domain': str,
+                        'status': str,
+                        'vlan': str,
+                        'ipv4': str,
+                        'policy': str,
+                        'role': str,
+                    }
+                }
+            }
+        },
+        Optional('session_count'): int,
+    }
+
+class ShowAccessSessionsInfo(ShowAccessSessionsInfoSchema):
+    """Parser for 'show access-session info'
+                    'show access-session info switch {switch} r0'
+    """
+
+    cli_command = ['show access-session info', 'show access-session info switch {sw} r0']
+
+    def cli(self, sw='', output=None):
+
+        if output is None:
+            # Build command
+            if sw:
+                cmd = self.cli_command[1].format(sw=sw)
+            else:
+                cmd = self.cli_command[0]
+            # Execute command
+            show_output = self.device.execute(cmd)
+        else:
+            show_output = output
+
+        # initial return dictionary
+
+        ret_dict = {}
+
+        # initial regexp pattern
+
+        #Interface    MAC Address    M:D:S    Vlan     IPv4        Policy               User-Role
+        p1 = re.compile(r'^Interface +MAC +Address +M:D:S +Vlan +IPv4 +Policy +User-Role')
+
+        # Matching patterns
+        #Gi3/0/11     0015.0100.0001 D1x:D:AZ  UA        200.1.0.1 Dot1x                UA
+        #Gi3/0/11     0015.0100.0006 D1x:D:AZ  UA      200.1.0.190 Dot1x                ABCDEFGH..
+        #Gi2/0/7      0010.9400.0003 D1x:D:AZ 1001 101.100.100.201 WA_Dot1xMabWa_conc.. USERABCD
+        #Gi3/0/3      2894.0feb.9280 D1x:D:AZ 1001  101.100.100.98 Dot1x                USERABCD
+        #Gi3/0/3      34db.fde5.34ab D1x:V:AZ  UA       UA         Dot1x                CP-6941-..
+
+        p2 = re.compile(r'^(?P<interface>\S+) +'
+                            '(?P<client>\w+\.\w+\.\w+) +'
+                            '(?P<mds>[\w/]+\:\w+\:\w+) +'
+                            '(?P<vlan>\w+) +'
+                            '(?P<ipv4>[\w\.]+) +'
+                            '(?P<policy>\S+) +'
+                            '(?P<role>.*)$')
+
+        # *Session count = 2* 
+
+        p3 = re.compile(r'(?:\*)?Session +[Cc]ount +\= '
+                        r'+(?P<session_count>\d+)(?:\*)?$')
+
+        for line in show_output.splitlines():
+            line = line.strip()
+
+            if p1.match(line):
+                continue
+
+            m = p2.match(line)
+
+            if m:
+                group = m.groupdict()
+                interface = Common.convert_intf_name(group['interface'])
+                intf_dict = ret_dict.setdefault('interfaces', {}).setdefault(interface, {})
+                intf_dict['interface'] = interface
+                client = group['client']
+                client_dict = intf_dict.setdefault('client', {}).setdefault(client, {})
+                client_dict.update({'client': client})
+
+                x = group['mds'].split(':')
+                client_dict['method'] = x[0]
+                client_dict['domain'] = x[1]
+                client_dict['status'] = x[2]
+                client_dict['vlan'] = group['vlan']
+                client_dict['ipv4'] = group['ipv4']
+                client_dict['policy'] = group['policy']
+                client_dict['role'] = group['role']
+
+                continue
+
+            # *Session count = 2*
+
+            m3 = p3.match(line)
+            if m3:
+                count = int(m3.groupdict()['session_count'])
+                ret_dict.update({'session_count': count})
+                continue
+
+        return ret_dict
@@ -37,6 +37,8 @@ class ShowBfdNeighborsDetailsSchema(MetaParser):
 				'neighbor_address': {
 					Any(): {
 						Optional('ld_rd'): str,
+						Optional('ld'): int,
+						Optional('rd'): int,
 						Optional('rh_rs'): str,
 						Optional('holdown_timer'): int,
 						Optional('holdown_timer_multiplier'): int,
@@ -75,6 +77,20 @@ class ShowBfdNeighborsDetailsSchema(MetaParser):
 							Optional('avg_int_ms'): int,
 							Optional('last_ms_ago'): int
 						},
+						Optional('echo_tx'): {
+							Optional('count'): int,
+							Optional('min_int_ms'): int,
+							Optional('max_int_ms'): int,
+							Optional('avg_int_ms'): int,
+							Optional('last_ms_ago'): int
+						},
+						Optional('echo_rx'): {
+							Optional('count'): int,
+							Optional('min_int_ms'): int,
+							Optional('max_int_ms'): int,
+							Optional('avg_int_ms'): int,
+							Optional('last_ms_ago'): int
+						},
 						Optional('elapsed_time_watermarks'): str,
 						Optional('elapsed_time_watermarks_last'): int,
 						Optional('registered_protocols'): list,
@@ -122,20 +138,20 @@ class ShowBfdNeighborsDetails(ShowBfdNeighborsDetailsSchema):
 	""" Parser for the following commands:
 			* 'show bfd neighbors details'
 			* 'show bfd neighbors client {client} details'
-            * 'show bfd neighbors interface {interface} details'
+			* 'show bfd neighbors interface {interface} details'
 			* 'show bfd neighbors ipv4 {ipv4_address} details',
 			* 'show bfd neighbors ipv6 {ipv6_address} details'
 	"""
-	
+
 	cli_command = ['show bfd neighbors details',
-		'show bfd neighbors client {client} details',
-        'show bfd neighbors interface {interface} details',
-		'show bfd neighbors ipv4 {ipv4_address} details',
-		'show bfd neighbors ipv6 {ipv6_address} details']
+				   'show bfd neighbors client {client} details',
+				   'show bfd neighbors interface {interface} details',
+				   'show bfd neighbors ipv4 {ipv4_address} details',
+				   'show bfd neighbors ipv6 {ipv6_address} details']
 
 	def cli(self, client='', interface=None, ipv4_address=None, ipv6_address=None, output= None):
 		if output is None:
-			#execute command to get output
+			# execute command to get output
 			if client:
 				out = self.device.execute(self.cli_command[1].format(client=client))
 			elif interface:
@@ -178,6 +194,9 @@ class ShowBfdNeighborsDetails(ShowBfdNeighborsDetailsSchema):
 			'\/\d+)\s+(?P<rh_rs>\S+)\s+(?P<state>\w+)\s+(?P<interface>'\
 			'[\w\W]+)$')
 
+		# 5/2
+		p4_1 = re.compile(r'^(?P<ld>\d+)\/(?P<rd>\d+)$')
+
 		# OurAddr: 10.186.213.12
 		p5 = re.compile(r'^OurAddr:\s+(?P<our_address>[\w\.\:]+)$')
 
@@ -241,6 +260,12 @@ class ShowBfdNeighborsDetails(ShowBfdNeighborsDetailsSchema):
 			r'\/(?P<max_int_ms>\d+)\/(?P<avg_int_ms>\d+) +' \
 			r'last: +(?P<last_ms_ago>\d+) +ms +ago$')
 
+		# Echo Rx Count: 20777, Echo Rx Interval (ms) min/max/avg: 1505/2003/1751 last: 721 ms ago
+		p16_1 = re.compile(r'^Echo Rx Count: +(?P<count>\d+), '
+						   r'+Echo Rx Interval \(ms\) min\/max\/avg: '
+						   r'+(?P<min_int_ms>\d+)\/(?P<max_int_ms>\d+)\/(?P<avg_int_ms>\d+)'
+						   r' +last: +(?P<last_ms_ago>\d+) ms ago$')
+
 		# Rx Count: 5052
 		p17 = re.compile(r'^\s*Rx +Count: +(?P<count>\d+)$')
 
@@ -248,7 +273,13 @@ class ShowBfdNeighborsDetails(ShowBfdNeighborsDetailsSchema):
 		p18 = re.compile(r'^\s*Tx +Count: +(?P<count>\d+), +Tx +Interval +' \
 			'\(ms\) +min\/max\/avg: +(?P<min_int_ms>\d+)\/(?P<max_int_ms>\d+)'\
 			'\/(?P<avg_int_ms>\d+) +last: +(?P<last_ms_ago>\d+) +ms +ago$')
-		
+
+		# Echo Tx Count: 20777, Echo Tx Interval (ms) min/max/avg: 1506/2003/1751 last: 722 ms ago
+		p18_1 = re.compile(r'^Echo Tx Count: +(?P<count>\d+), '
+						   r'+Echo Tx Interval \(ms\) min\/max\/avg: '
+						   r'+(?P<min_int_ms>\d+)\/(?P<max_int_ms>\d+)\/(?P<avg_int_ms>\d+) '
+						   r'+last: +(?P<last_ms_ago>\d+) ms ago$')
+
 		# Tx Count: 7490
 		p19 = re.compile(r'^\s*Tx +Count: +(?P<count>\d+)$')
 		
@@ -382,6 +413,11 @@ class ShowBfdNeighborsDetails(ShowBfdNeighborsDetailsSchema):
 				our_neighbor.update({'state' : group['state']})
 				our_neighbor.update({'interface' : \
 					Common.convert_intf_name(group['interface'])})
+
+				# gets separated ld and rd values
+				s = p4_1.match(group['ld_rd'])
+				our_neighbor.update({'ld': int(s.groupdict()['ld'])})
+				our_neighbor.update({'rd': int(s.groupdict()['rd'])})
 				continue
 
 			# 10.169.197.93 					4097/4097		Up 		Up 	Gi0/0/0
@@ -390,11 +426,15 @@ class ShowBfdNeighborsDetails(ShowBfdNeighborsDetailsSchema):
 				group = m.groupdict()
 				neighbor = {}
 				our_neighbor = neighbor.setdefault(group['our_neighbor'], {})
-				our_neighbor.update({'ld_rd' : group['ld_rd']})
-				our_neighbor.update({'rh_rs' : group['rh_rs']})
-				our_neighbor.update({'state' : group['state']})
-				our_neighbor.update({'interface' : \
-					Common.convert_intf_name(group['interface'])})
+				our_neighbor.update({'ld_rd': group['ld_rd']})
+				our_neighbor.update({'rh_rs': group['rh_rs']})
+				our_neighbor.update({'state': group['state']})
+				our_neighbor.update({'interface': Common.convert_intf_name(group['interface'])})
+
+				# gets separated ld and rd values
+				s = p4_1.match(group['ld_rd'])
+				our_neighbor.update({'ld': int(s.groupdict()['ld'])})
+				our_neighbor.update({'rd': int(s.groupdict()['rd'])})
 				continue
 
 			# OurAddr: 10.186.213.12
@@ -526,6 +566,14 @@ class ShowBfdNeighborsDetails(ShowBfdNeighborsDetailsSchema):
 				rx.update({k: int(v) for k, v in group.items()})
 				continue
 
+			# Echo Rx Count: 20777, Echo Rx Interval (ms) min/max/avg: 1505/2003/1751 last: 721 ms ago
+			m = p16_1.match(line)
+			if m:
+				group = m.groupdict()
+				echo_rx = our_neighbor.setdefault('echo_rx', {})
+				echo_rx.update({k: int(v) for k, v in group.items()})
+				continue
+
 			# Rx Count: 5052
 			m = p17.match(line)
 			if m:
@@ -542,6 +590,14 @@ class ShowBfdNeighborsDetails(ShowBfdNeighborsDetailsSchema):
 				tx.update({k: int(v) for k, v in group.items()})
 				continue
 
+			# Echo Tx Count: 20777, Echo Tx Interval (ms) min/max/avg: 1506/2003/1751 last: 722 ms ago
+			m = p18_1.match(line)
+			if m:
+				group = m.groupdict()
+				echo_tx = our_neighbor.setdefault('echo_tx', {})
+				echo_tx.update({k: int(v) for k, v in group.items()})
+				continue
+
 			# Tx Count: 7490
 			m = p19.match(line)
 			if m:
@@ -742,4 +798,220 @@ class ShowBfdNeighborsDetails(ShowBfdNeighborsDetailsSchema):
 					{}).setdefault(group['our_neighbor'], {})
 				continue
 
-		return ret_dict
\ No newline at end of file
+		return ret_dict
+
+# =================================================
+#  Schema for 'show bfd summary host'
+# =================================================
+class ShowBfdSummaryHostSchema(MetaParser):
+	"""schema for show bfd summary host"""
+	schema = {		
+		'software_session': {
+			'sw_session_configured': int,
+			'sw_session_up': int,
+			'sw_session_down': int
+		},
+		'hardware_session': {
+   			'hw_session_configured': int,
+			'hw_session_up': int,
+			'hw_session_down': int
+		},
+		'total_session': {
+   			'total_session_configured': int,
+			'total_session_up': int,
+   			'total_session_down': int
+		}
+    }
+
+# ===================================================
+#  Parser for 'show bfd summary host'
+# ===================================================
+class ShowBfdSummaryHost(ShowBfdSummaryHostSchema):
+	"""Parser for show bfd summary host"""
+	cli_command = 'show bfd summary host'
+	def cli(self, output=None):
+		if output is None:
+			out = self.device.execute(self.cli_command)
+		else:
+			out = output
+		
+		#sw 3 3 0
+		p1 = re.compile(r'Software +(?P<sw_session_configured>[\d]+) +(?P<sw_session_up>[\d]+) +(?P<sw_session_down>[\d]+)')
+		#hw 0 0 0
+		p2 = re.compile(r'Hardware +(?P<hw_session_configured>[\d]+) +(?P<hw_session_up>[\d]+) +(?P<hw_session_down>[\d]+)')
+		#Total 3 3 0
+		p3 = re.compile(r'Total +(?P<total_session_configured>[\d]+) +(?P<total_session_up>[\d]+) +(?P<total_session_down>[\d]+)')
+		#initial return dictionary
+		ret_dict = {}
+		for line in out.splitlines():
+			line=line.strip()			
+			
+			#sw 3 3 0
+			m = p1.match(line)
+			if m:
+				group = m.groupdict()
+				software_session = ret_dict.setdefault('software_session', {})
+				software_session.update({'sw_session_configured': int(group['sw_session_configured'])})
+				software_session.update({'sw_session_up': int(group['sw_session_up'])})
+				software_session.update({'sw_session_down': int(group['sw_session_down'])})
+				continue
+
+			# hw 0 0 0
+			m = p2.match(line)
+			if m:
+				group = m.groupdict()
+				hardware_session = ret_dict.setdefault('hardware_session', {})
+				hardware_session.update({'hw_session_configured': int(group['hw_session_configured'])})
+				hardware_session.update({'hw_session_up': int(group['hw_session_up'])})
+				hardware_session.update({'hw_session_down': int(group['hw_session_down'])})
+				continue
+			# Total 3 3 0
+			m = p3.match(line)
+			if m:
+				group = m.groupdict()
+				total_session = ret_dict.setdefault('total_session', {})
+				total_session.update({'total_session_configured': int(group['total_session_configured'])})
+				total_session.update({'total_session_up': int(group['total_session_up'])})
+				total_session.update({'total_session_down': int(group['total_session_down'])})
+				continue
+		return(ret_dict)
+
+
+
+#---------------------------------
+# Schema for 'show bfd internal'
+#---------------------------------
+class ShowBfdInternalSchema(MetaParser):
+	'''Schema for show bfd internal'''
+	schema = {
+		'cleanup_timer_hits': int,
+		'pseudo_preemptive':{
+				'pseudo_count': int,
+				'min': int,
+				'max': int,
+				'avg': int,
+				'last': int
+		},
+		'interrupt_send_count':{
+			'interrupt_count': int,
+			'min': int,
+			'max': int,
+			'avg': int,
+			'last': int
+		},
+		'workload_credits':{
+			'credits': int,
+			'max': int
+		},
+		'ipv4_sessions':{
+			'interface':{
+				Any():{
+					'neigh_addr':{
+						Any():{
+							'ld_rd': str,
+							'rh_rs': str,
+							'state': str
+						}
+					}
+				}
+			}
+		}
+	}
+
+#---------------------------------
+# Parser for 'show bfd internal'
+#---------------------------------
+class ShowBfdInternal(ShowBfdInternalSchema):
+	'''Parser for show bfd internal'''
+	cli_command = 'show bfd internal'
+
+	def cli(self, output=None):
+		if output is None:
+			out = self.device.execute(self.cli_command)
+		else:
+			out = output
+
+
+		# Cleanup timer hits: 0
+		p01 = re.compile(r'^Cleanup +timer +hits: +(?P<cleanup_timer_hits>\d+)$')
+
+		# Pseudo pre-emptive process count: 16552 min/max/avg: 5/17/6 last: 5ms ago
+		p02 = re.compile(r'^Pseudo pre-emptive process count:\s+(?P<pseudo_count>\d+)\s+min/max/avg:\s+(?P<min>\d+)/(?P<max>\d+)/(?P<avg>\d+)\s+last:\s+(?P<last>\d+)+\s+ms ago$')
+
+		# Interrupt send count: 994 min/max/avg: 1/892/106 last: 256 ms ago
+		p03 = re.compile(r'^Interrupt +send +count: +(?P<interrupt_count>\d+)\s+min/max/avg:\s+(?P<min>\d+)/(?P<max>\d+)/(?P<avg>\d+)\s+last:\s+(?P<last>\d+)+\s+ms ago$')
+
+		# Workload credits: 12 allocated, 7500 max
+		p04 = re.compile(r'^Workload +credits:\s+(?P<credits>\d+)\s+allocated,+\s+(?P<max>\d+)\s+max$')
+
+		# IPv4 sessions
+		p05 = re.compile(r'^IPv4 +[Ss]essions$')
+
+		# 12.0.0.20                               1/1        Up             Up       Gi1/0/21
+		p06 = re.compile(r'^(?P<neigh_addr>[\w\.]+)\s+(?P<ld_rd>\d+\/\d+)\s+(?P<rh_rs>\w+)\s+(?P<state>\w+)\s+(?P<interface>[\w\W]+)$')
+
+
+		ret_dict = {}
+
+		for line in out.splitlines():
+			line = line.strip()
+
+			# Cleanup timer hits: 0
+			m = p01.match(line)
+			if m:
+				group = m.groupdict()
+				ret_dict['cleanup_timer_hits']=int(group['cleanup_timer_hits'])
+				continue
+
+			# Pseudo pre-emptive process count: 16552 min/max/avg: 5/17/6 last: 5ms ago
+			m = p02.match(line)
+			if m:
+				group = m.groupdict()
+				pseudo_dict = ret_dict.setdefault('pseudo_preemptive',{})
+				pseudo_dict['pseudo_count'] = int(group['pseudo_count'])
+				pseudo_dict['max'] = int(group['max'])
+				pseudo_dict['min'] = int(group['min'])
+				pseudo_dict['avg'] = int(group['avg'])
+				pseudo_dict['last'] = int(group['last'])
+				continue
+
+			# Interrupt send count: 994 min/max/avg: 1/892/106 last: 256 ms ago
+			m = p03.match(line)
+			if m:
+				group = m.groupdict()
+				interrupt_dict = ret_dict.setdefault('interrupt_send_count', {})
+				interrupt_dict['interrupt_count'] = int(group['interrupt_count'])
+				interrupt_dict['max'] = int(group['max'])
+				interrupt_dict['min'] = int(group['min'])
+				interrupt_dict['avg'] = int(group['avg'])
+				interrupt_dict['last'] = int(group['last'])
+				continue
+
+			# Workload credits: 12 allocated, 7500 max
+			m = p04.match(line)
+			if m:
+				group = m.groupdict()
+				workload_dict = ret_dict.setdefault('workload_credits', {})
+				workload_dict['credits'] = int(group['credits'])
+				workload_dict['max'] = int(group['max'])
+				continue
+
+			# IPv4 sessions
+			m = p05.match(line)
+			if m:
+				intf_dict = ret_dict.setdefault('ipv4_sessions', {})
+				continue
+
+
+			# 12.0.0.20                               1/1        Up             Up       Gi1/0/21
+			m = p06.match(line)
+			if m:
+				group = m.groupdict()
+				ipv4_dict = intf_dict.setdefault('interface', {}).setdefault(group['interface'],{})
+				neigh_dict = ipv4_dict.setdefault('neigh_addr', {}).setdefault(group['neigh_addr'],{})
+				neigh_dict['ld_rd'] = group['ld_rd']
+				neigh_dict['rh_rs'] = group['rh_rs']
+				neigh_dict['state'] = group['state']
+				continue
+
+		return ret_dict
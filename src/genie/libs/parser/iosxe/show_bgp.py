@@ -102,8 +102,10 @@ IOSXE parsers for the following show commands:
     * show bgp vrf {vrf} all summary
     * show bgp vrf {vrf} {route}
     * show bgp {address_family} vrf {vrf} {route}
+    * show bgp {address_family} {route}
     * show ip bgp {address_family} rd {rd} {route}
     * show ip bgp {address_family} vrf {vrf} neighbors {neighbor} advertised-routes
+    * show bgp l2vpn evpn evi {evi_id} route-type {route_type}
 '''
 
 # Python
@@ -236,9 +238,11 @@ class ShowBgpSuperParser(ShowBgpSchema):
         #     Network          Next Hop            Metric LocPrf Weight Path
         # *>   [5][65535:1][0][24][10.1.1.0]/17
         # *>  100:2051:VEID-2:Blk-1/136
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+        #  *>   [3][3001:1][*][*][1.1.1.1]/14
+        # *m   [2][2.2.2.2:1][0][48][000C293B2157][0][*]/20
+        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|\s)+)?'
                           r'(?P<path_type>(i|e|c|l|a|r|I))?\s*'
-                          r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,\-]+)'
+                          r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,\-\*]+)'
                           r'(?: *(?P<param>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
 
         #     Network          Next Hop            Metric LocPrf Weight Path
@@ -580,9 +584,9 @@ class ShowBgpAll(ShowBgpSuperParser, ShowBgpSchema):
         * 'show bgp {address_family} all'
     '''
 
-    cli_command = ['show bgp {address_family} all',
-                   'show bgp all',
-                   ]
+    cli_command = ['show bgp {address_family} all', 
+                    'show bgp all',
+                    ]
     exclude = ['bgp_table_version']
 
     def cli(self, address_family='', output=None):
@@ -644,20 +648,23 @@ class ShowIpBgpAll(ShowBgpSuperParser, ShowBgpSchema):
 # Parser for:
 #   * 'show bgp {address_family} rd {rd}'
 #   * 'show bgp {address_family} vrf {vrf}'
+#   * 'show bgp {address_family} unicast'
 # =============================================
 class ShowBgp(ShowBgpSuperParser, ShowBgpSchema):
 
     ''' Parser for:
         * 'show bgp {address_family} rd {rd}'
         * 'show bgp {address_family} vrf {vrf}'
+        * 'show bgp {address_family} unicast'
     '''
 
     cli_command = ['show bgp {address_family} vrf {vrf}',
                    'show bgp {address_family} rd {rd}',
-                   ]
-
-    def cli(self, address_family='', rd='', vrf='', output=None):
+                   'show bgp {address_family}',
+                   'show bgp {address_family} evi {evi}']
 
+    def cli(self, address_family='', rd='', vrf='', evi='', output=None):
+        cmd = None
         if output is None:
             # Build command
             if address_family and vrf:
@@ -666,6 +673,12 @@ class ShowBgp(ShowBgpSuperParser, ShowBgpSchema):
             elif address_family and rd:
                 cmd = self.cli_command[1].format(address_family=address_family,
                                                  rd=rd)
+            elif address_family and evi:
+                cmd = self.cli_command[3].format(address_family=address_family,
+                                                 evi=evi)
+            elif address_family and not vrf and not rd:
+                cmd = self.cli_command[2].format(address_family=address_family)
+                                                                                                  
             # Execute command
             show_output = self.device.execute(cmd)
         else:
@@ -814,6 +827,24 @@ class ShowBgpAllDetailSchema(MetaParser):
                                         Optional('available_path'): str,
                                         Optional('best_path'): str,
                                         Optional('table_version'): str,
+                                        Optional('nlri_data'):
+                                            {Optional('route-type'): str,
+                                             Optional('rd'): str,
+                                             Optional('esi'): str,
+                                             Optional('eti'): str,
+                                             Optional('mac_len'): str,
+                                             Optional('mac'): str,
+                                             Optional('ip_len'): str,
+                                             Optional('ip_prefix'): str,
+                                             Optional('orig_rtr_len'): str,
+                                             Optional('orig_rtr_id'): str,
+                                             Optional('mcast_src_len'): str,
+                                             Optional('mcast_src'): str,
+                                             Optional('mcast_group_len'): str,
+                                             Optional('mcast_group_addr'): str,
+                                             Optional('max_resp_time'): str,
+                                             Optional('subnet'): str
+                                            },
                                         Optional('index'):
                                             {Any():
                                                 {
@@ -844,12 +875,24 @@ class ShowBgpAllDetailSchema(MetaParser):
                                                 Optional('aggregated_by_as'): str,
                                                 Optional('aggregated_by_address'): str,
                                                 Optional('community'): str,
+                                                Optional('igmpmld'):
+                                                    {Optional('version'): str,
+                                                    Optional('filter_mode'): str
+                                                    },
                                                 Optional('ext_community'): str,
                                                 Optional('recursive_via_connected'): bool,
                                                 Optional('agi_version'): int,
                                                 Optional('ve_block_size'): int,
                                                 Optional('label_base'): int,
                                                 Optional('cluster_list'): str,
+                                                Optional('pmsi'):
+                                                    {Optional('tun_type'): str,
+                                                     Optional('vni'): str,
+                                                     Optional('tun_id'):
+                                                         {Optional('tun_endpoint'): str,
+                                                          Optional('local'): bool,
+                                                         }
+                                                    },
                                                 Optional('evpn'):
                                                     {Optional('ext_community'): str,
                                                     Optional('encap'): str,
@@ -860,6 +903,11 @@ class ShowBgpAllDetailSchema(MetaParser):
                                                     Optional('router_mac'): str,
                                                     Optional('recursive_via_connected'): bool,
                                                     },
+                                                 Optional('binding_sid'): {
+                                                    Optional('sid'): str,
+                                                    Optional('color'): str,
+                                                    Optional('state'): str,
+                                                    },
                                                  Optional('local_vxlan_vtep'):
                                                     {Optional('encap'): str,
                                                     Optional('local_router_mac'): str,
@@ -901,7 +949,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         * 'show ip bgp {address_family} rd {rd} detail'
     '''
 
-    def cli(self, address_family='', vrf='', rd='', output=None):
+    def cli(self, address_family='', vrf='', rd='', evi='', rt='', output=None):
         # Init dictionary
         ret_dict = {}
         subdict = ''
@@ -919,7 +967,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         refresh_epoch = None
         cmd_vrf = vrf if vrf else None
         default_vrf = None
-
+        nlri_data = {}
         # For address family: IPv4 Unicast
         # For address family: L2VPN E-VPN
         p1 = re.compile(r'^For +address +family:'
@@ -966,6 +1014,11 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                           r' +(?:(?P<rd>([0-9\:\[\]]+)))?:(?P<router_id>(\S+)),?'
                           r' +version +(?P<version>(\d+))$')
 
+        # BGP routing table entry for [route_type][rd][...][...][...], version 48
+        p3_3 = re.compile(r'^BGP +routing +table +entry +for'
+                          r' +(?P<router_id>(\[[0-9]\]\[[0-9\.]+[\:][0-9]+\](\[.+\])+[\/][0-9]+))\, +version '
+                          r'+(?P<prefix_table_version>[0-9]+)$')
+
         # 10.1.1.2 from 10.1.1.2 (10.1.1.2)
         # 10.16.2.2 (metric 11) (via default) from 10.16.2.2 (10.16.2.2)
         # :: (via vrf VRF1) from 0.0.0.0 (10.1.1.1)
@@ -1000,8 +1053,8 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
 
         # 3
         # 38         44         45
-        p6_3 = re.compile(r'^(?P<group1>(\d+))'
-                          r'(?: +(?P<group2>(\d+)) +(?P<group3>(\d+)))?$')
+        p6_3 = re.compile(r'(?P<group1>(\d+))'
+                          r'(?: +(?P<group2>(\d+)))?(?: +(?P<group3>(\d+)))?')
 
         # Refresh Epoch 1
         p7 = re.compile(r'^Refresh +Epoch +(?P<refresh_epoch>[0-9]+)$')
@@ -1014,10 +1067,13 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         # Extended Community: SoO:65109:999 RT:65109:50
         # Extended Community: RT:0:3051 RT:65109:3051 L2VPN L2:0x0:MTU-1500
         # Extended Community: RT:65109:50 RT:65109:51 , recursive-via-connected
+        # Extended Community: RT:1:1 RT:100:101 MVPN AS:100:0.0.0.0
         p8_2 = re.compile(r'^Extended +Community *:'
-                          r' +(?P<ext_community>([a-zA-Z0-9\-\:\s]+))'
+                          r' +(?P<ext_community>([a-zA-Z0-9\-\:\s\.]+))'
                           r'(?: *, +(?P<recursive>(recursive-via-connected)))?$')
 
+        p8_21 = re.compile(r'^(RT|Color|0x88|So0|Cost:pre-bestpath).*$')
+
         # Community: 62000:1
         # Community: 1:1 65100:101 65100:175 65100:500 65100:601 65151:65000 65351:1
         p8_3 = re.compile(r'^Community: +(?P<community>[\S+\s]+)$')
@@ -1030,6 +1086,11 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         # Originator: 192.168.165.220, Cluster list: 0.0.0.61
         p8_5 = re.compile(r'^\s*Originator: +(?P<originator>(\S+)),'
                           r' +Cluster +list: +(?P<cluster_list>(\S+))$')
+        
+        p8_6 = re.compile(r'^\s*PMSI Attribute: Flags.*'
+                          r'Tunnel type:(?P<tun_type>.+),'
+                          r' length.+vni:(?P<vni>.+)'
+                          r' tunnel identifier: ((< Tunnel Endpoint: (?P<tun_endpoint>.+) >)|(?P<local>0000 0000))$')
 
         # rx pathid: 0, tx pathid: 0
         p9 = re.compile(r'^rx +pathid\: +(?P<recipient_pathid>[0-9x]+)\,'
@@ -1037,21 +1098,24 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                         r' +(?P<transfer_pathid>[0-9x]+)$')
 
         # EVPN ESI: 00000000000000000000, Gateway Address: 0.0.0.0, local vtep: 10.21.33.33, Label 30000
-        p10 = re.compile(r'^EVPN +ESI\: +(?P<evpn_esi>[0-9]+)\,'
-                         r' +Gateway +Address\: +'
-                         r'(?P<gateway_address>[a-zA-Z0-9\.\:]+)\,'
-                         r' +local vtep\: +(?P<local_vtep>[a-zA-Z0-9\.\:]+)'
-                         r'\, +[L|l]abel +(?P<label>[0-9]+)$')
+        # EVPN ESI: 00000000000000000000, Label1 2000101
+        p10 = re.compile(r'^EVPN +ESI\: +(?P<evpn_esi>[0-9]+)\,\s+'
+                         r'(Gateway +Address\:\s+(?P<gateway_address>[a-zA-Z0-9\.\:]+)\,\s+)?'
+                         r'(local vtep\: +(?P<local_vtep>[a-zA-Z0-9\.\:]+)\,\s+)?'
+                         r'[L|l]abel\d* +(?P<label>[0-9]+)$')
 
         # Local vxlan vtep:
-        p11 = re.compile(r'^Local +vxlan +vtep\:$')
+        # Local irb vxlan vtep
+        p11 = re.compile(r'^Local\s+(irb\s+)?vxlan\s+vtep\:$')
 
         # bdi:BDI200
-        p12 = re.compile(r'^bdi\:(?P<bdi>[A-Z0-9]+)$')
+        # core-bdi:BDI200
+        p12 = re.compile(r'^(core-)?bdi\:(?P<bdi>[A-Z0-9]+)$')
 
         # vrf:evpn1, vni:30000
+        # vrf:evpn1, l3-vni:30000
         p13 = re.compile(r'^vrf\:(?P<vrf>[a-zA-Z0-9]+)\,'
-                         r' +vni\:(?P<vni>[0-9]+)$')
+                         r'\s+(.+-)?vni\:(?P<vni>[0-9]+)$')
 
         # local router mac:001E.7AFF.FCD2
         p14 = re.compile(r'^local +router +mac\:'
@@ -1061,7 +1125,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         p15 = re.compile(r'^encap\:(?P<encap>[0-9]+)$')
 
         # vtep-ip:10.21.33.33
-        p16 = re.compile(r'^vtep-ip\:(?P<vtep_ip>[0-9\.]+)$')
+        p16 = re.compile(r'^vtep-ip\:(?P<vtep_ip>[a-zA-Z0-9\.\:]+)$')
 
         # Local
         # 65530
@@ -1082,9 +1146,16 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         # mpls labels in/out nolabel/64402
         p18 = re.compile(r'^mpls +labels +in\/out +(?P<in>\w+)\/(?P<out>\w+)$')
 
+        # IGMP/MLD v1/v2/v3, exclude, max response time:
+        p19 = re.compile(r'^IGMP/MLD\s+(?P<version>v\d|v\d,\s*v\d)(,\s+(?P<filter_mode>\w+))?$')
+
+        # binding SID: 28 (color - 7) (state - UP)
+        p20 = re.compile(r'^binding +SID\:' r' +(?P<sid>([a-zA-Z0-9]+))'
+                 r'( +\(color[ ]{0,1}[-][ ]{0,1}(?P<color>[0-9]+)\))'
+                 r'(( +\(state +\- +(?P<state>[A-Za-z]+)\)))?$')
+
         for line in output.splitlines():
             line = line.strip()
-
             # For address family: IPv4 Unicast
             # For address family: L2VPN E-VPN
             m = p1.match(line)
@@ -1133,12 +1204,10 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 else:
                     vrf = 'default'
 
-                if vrf not in ret_dict['instance']['default']['vrf']:
-                    vrf_dict = ret_dict.setdefault('instance', {}).setdefault('default', {}).\
+                vrf_dict = ret_dict.setdefault('instance', {}).setdefault('default', {}).\
                                         setdefault('vrf', {}).setdefault(vrf, {})
 
-                if 'address_family' not in vrf_dict:
-                    address_family_dict = vrf_dict.setdefault('address_family', {})
+                address_family_dict = vrf_dict.setdefault('address_family', {})
 
                 # Adding the new_address_family that contains the RD info
                 if new_address_family:
@@ -1151,6 +1220,8 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
 
                     # Adding the keys we got from 'BGP routing table' line
                     new_addr_family_dict['prefixes'][prefixes]['table_version'] = prefix_table_version
+                    if nlri_data:
+                        new_addr_family_dict['prefixes'][prefixes]['nlri_data'] = nlri_data
 
                     # Adding the keys we got from 'Route Distinguisher' line
                     if route_distinguisher:
@@ -1173,6 +1244,9 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                     address_family_dict[address_family]['prefixes']\
                         [prefixes]['table_version'] = prefix_table_version
 
+                    if nlri_data:
+                        address_family_dict[address_family]['prefixes']\
+                            [prefixes]['nlri_data'] = nlri_data
                     # Adding the keys we got from 'Route Distinguisher' line
                     if route_distinguisher:
                         address_family_dict[address_family]['route_distinguisher'] = route_distinguisher
@@ -1231,6 +1305,224 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 prefixes = prefixes.replace(']', '')
                 prefix_table_version = m.groupdict()['version']
                 continue
+            
+            # For all EVPN route-types 1-8
+            # BGP routing table entry for [1][2.2.2.2:1000][AAAABBBBCCCCDDDDEEEE][10000]/23, version 26
+            # BGP routing table entry for [2][120:120][0][40][AABBCCDDEF00][0][*]/20, version 35
+            # BGP routing table entry for [2][2.2.2.2:1000][10000][48][022651BDC81C][32][0.0.0.0]/24, version 28
+            # BGP routing table entry for [2][22.2.2.2:1000][10000][48][022651BDC81C][128][1000::1]/36, version 36
+            # BGP routing table entry for [3][40.0.0.3:164][0][32][40.0.0.3]/17, version 30
+            # BGP routing table entry for [4][2.2.2.2:1000][AAAABBBBCCCCDDDDEEEE][32]/23, version 32
+            # BGP routing table entry for [5][100:100][4231][32][1.1.1.1]/17, version 37
+            # BGP routing table entry for [5][20.0.0.1:31000][0][32][250.250.250.22]/17, version 34
+            # BGP routing table entry for [6][7.7.7.7:11][0][32][10.10.10.10][32][19.0.101.1][32][224.0.0.1]/27, version 27
+            # BGP routing table entry for [6][117901063:11][0][128][A0A:A0A:A0A:A0A:A0A:A0A:A0A:A0A][128][1300:6501:1300:6501:1300:6501:1300:6501][128][E000:1:E000:1:E000:1:E000:1]/63, version 33
+            # BGP routing table entry for [7][7.7.7.7:11][0000000000AABBCCDDEE][0][32][10.10.10.10][32][19.0.101.1][32][224.0.0.1]/37, version 29
+            # BGP routing table entry for [8][7.7.7.7:11][0000000000AABBCCDDEE][0][32][10.10.10.10][32][19.0.101.1][32][224.0.0.1][4112]/41, version 31
+            m = p3_3.match(line)
+            if m:
+                nlri_data = {}
+                update_group = 0
+                index = 0
+                prefixes = m.groupdict()['router_id']
+                if prefixes.startswith('[6]'):
+                    # BGP routing table entry for [6][7.7.7.7:11][0][32][10.10.10.10][32][19.0.101.1][32][224.0.0.1]/27, version 27
+                    # BGP routing table entry for [6][117901063:11][0][128][A0A:A0A:A0A:A0A:A0A:A0A:A0A:A0A][128][1300:6501:1300:6501:1300:6501:1300:6501][128][E000:1:E000:1:E000:1:E000:1]/63, version 33
+                    rt6_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
+                                                '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                                                '\[(?P<eti>[0-9]+)\]'
+                                                '\[(?P<mcast_src_len>[0-9]+)\]'
+                                                '(\[(?P<mcast_src>.+)\])?'
+                                                '\[(?P<mcast_group_len>[0-9]+)\]'
+                                                '\[(?P<mcast_group_addr>.+)\]'
+                                                '\[(?P<orig_rtr_len>[0-9]+)\]'
+                                                '\[(?P<orig_rtr_id>.+)\]'
+                                                '\/(?P<subnet>[0-9]+)')
+                    rt6_mo = rt6_prefix_re.match(prefixes)
+                    if rt6_mo:
+                        rt6_dict = rt6_mo.groupdict()
+                        nlri_data['route-type'] = '6'
+                        nlri_data['rd'] = rt6_dict['rd']
+                        nlri_data['eti'] = rt6_dict['eti']
+                        nlri_data['mcast_src_len'] = rt6_dict['mcast_src_len']
+                        nlri_data['mcast_src'] = rt6_dict['mcast_src']
+                        nlri_data['mcast_group_len'] = rt6_dict['mcast_group_len']
+                        nlri_data['mcast_group_addr'] = rt6_dict['mcast_group_addr']
+                        nlri_data['orig_rtr_len'] = rt6_dict['orig_rtr_len']
+                        nlri_data['orig_rtr_id'] = rt6_dict['orig_rtr_id']
+                        nlri_data['subnet'] = rt6_dict['subnet']
+
+                elif prefixes.startswith('[3]'):
+                    # BGP routing table entry for [3][40.0.0.3:164][0][32][40.0.0.3]/17, version 30
+                    rt3_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
+                                                '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                                                '\[(?P<eti>[0-9]+)\]'
+                                                '\[(?P<ip_len>[0-9]+)\]'
+                                                '(\[(?P<orig_rtr_id>.+)\])?'
+                                                '\/(?P<subnet>[0-9]+)')
+                    rt3_mo = rt3_prefix_re.match(prefixes)
+                    if rt3_mo:
+                        rt3_dict = rt3_mo.groupdict()
+                        nlri_data['route-type'] = '3'
+                        nlri_data['rd'] = rt3_dict['rd']
+                        nlri_data['eti'] = rt3_dict['eti']
+                        nlri_data['ip_len'] = rt3_dict['ip_len']
+                        if rt3_dict['orig_rtr_id']:
+                            nlri_data['orig_rtr_id'] = rt3_dict['orig_rtr_id']
+                        nlri_data['subnet'] = rt3_dict['subnet']
+                        
+                elif prefixes.startswith('[1]'):
+                    # BGP routing table entry for [1][2.2.2.2:1000][AAAABBBBCCCCDDDDEEEE][10000]/23, version 26
+                    rt1_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
+                                                '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                                                '\[(?P<esi>.+)\]'
+                                                '\[(?P<eti>[0-9]+)\]'
+                                                '\/(?P<subnet>[0-9]+)')
+                    rt1_mo = rt1_prefix_re.match(prefixes)
+                    if rt1_mo:
+                        rt1_dict = rt1_mo.groupdict()
+                        nlri_data['route-type'] = '1'
+                        nlri_data['rd'] = rt1_dict['rd']
+                        nlri_data['esi'] = rt1_dict['esi']
+                        nlri_data['eti'] = rt1_dict['eti']
+                        nlri_data['subnet'] = rt1_dict['subnet']
+
+                elif prefixes.startswith('[2]'):
+                    # BGP routing table entry for [2][2.2.2.2:1000][10000][48][022651BDC81C][32][0.0.0.0]/24, version 28
+                    # BGP routing table entry for [2][22.2.2.2:1000][10000][48][022651BDC81C][128][1000::1]/36, version 36
+                    rt2_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
+                                                '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                                                '\[(?P<eti>[0-9]+)\]'
+                                                '\[(?P<mac_len>[0-9]+)\]'
+                                                '\[(?P<mac>.+)\]'
+                                                '\[(?P<ip_len>[0-9]+)\]'
+                                                '(\[(?P<ip_prefix>.+)\])?'
+                                                '\/(?P<subnet>[0-9]+)')
+                    
+                    rt2_mo = rt2_prefix_re.match(prefixes)
+                    if rt2_mo:
+                        rt2_dict = rt2_mo.groupdict()
+                        nlri_data['route-type'] = '2'
+                        nlri_data['rd'] = rt2_dict['rd']
+                        nlri_data['eti'] = rt2_dict['eti']
+                        nlri_data['mac_len'] = rt2_dict['mac_len']
+                        nlri_data['mac'] = rt2_dict['mac']
+                        nlri_data['ip_len'] = rt2_dict['ip_len']
+                        if int(rt2_dict['ip_len']) > 0:
+                            if rt2_dict['ip_prefix']:
+                                nlri_data['ip_prefix'] = rt2_dict['ip_prefix']
+                        nlri_data['subnet'] = rt2_dict['subnet']
+
+                elif prefixes.startswith('[4]'):
+                    # BGP routing table entry for [4][2.2.2.2:1000][AAAABBBBCCCCDDDDEEEE][32]/23, version 32
+                    rt4_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
+                                                '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                                                '\[(?P<esi>.+)\]'
+                                                '\[(?P<ip_len>[0-9]+)\]'
+                                                '(\[(?P<orig_rtr_id>.+)\])?'
+                                                '\/(?P<subnet>[0-9]+)')
+                    
+                    rt4_mo = rt4_prefix_re.match(prefixes)
+                    if rt4_mo:
+                        rt4_dict = rt4_mo.groupdict()
+                        nlri_data['route-type'] = '4'
+                        nlri_data['rd'] = rt4_dict['rd']
+                        nlri_data['esi'] = rt4_dict['esi']
+                        nlri_data['ip_len'] = rt4_dict['ip_len']
+                        if rt4_dict['orig_rtr_id']:
+                            nlri_data['orig_rtr_id'] = rt4_dict['orig_rtr_id']
+                        nlri_data['subnet'] = rt4_dict['subnet']
+
+                elif prefixes.startswith('[5]'):
+                    # BGP routing table entry for [5][100:100][4231][32][1.1.1.1]/17, version 37
+                    # BGP routing table entry for [5][20.0.0.1:31000][0][32][250.250.250.22]/17, version 34
+                    rt5_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
+                                                '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                                                '\[(?P<eti>[0-9]+)\]'
+                                                '\[(?P<ip_len>[0-9]+)\]'
+                                                '(\[(?P<ip_prefix>.+)\])?'
+                                                '\/(?P<subnet>[0-9]+)')
+                    
+                    rt5_mo = rt5_prefix_re.match(prefixes)
+                    if rt5_mo:
+                        rt5_dict = rt5_mo.groupdict()
+                        nlri_data['route-type'] = '5'
+                        nlri_data['rd'] = rt5_dict['rd']
+                        nlri_data['eti'] = rt5_dict['eti']
+                        nlri_data['ip_len'] = rt5_dict['ip_len']
+                        if int(rt5_dict['ip_len']) > 0:
+                            if rt5_dict['ip_prefix']:
+                                nlri_data['ip_prefix'] = rt5_dict['ip_prefix']
+                        nlri_data['subnet'] = rt5_dict['subnet']
+
+                elif prefixes.startswith('[7]'):
+                    # BGP routing table entry for [7][7.7.7.7:11][0000000000AABBCCDDEE][0][32][10.10.10.10][32][19.0.101.1][32][224.0.0.1]/37, version 29
+                    rt7_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
+                                                '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                                                '\[(?P<esi>.+)\]'
+                                                '\[(?P<eti>[0-9]+)\]'
+                                                '\[(?P<mcast_src_len>[0-9]+)\]'
+                                                '(\[(?P<mcast_src>.+)\])?'
+                                                '\[(?P<mcast_group_len>[0-9]+)\]'
+                                                '\[(?P<mcast_group_addr>.+)\]'
+                                                '\[(?P<orig_rtr_len>[0-9]+)\]'
+                                                '\[(?P<orig_rtr_id>.+)\]'
+                                                '\/(?P<subnet>[0-9]+)')
+
+                    rt7_mo = rt7_prefix_re.match(prefixes)
+                    if rt7_mo:
+                        rt7_dict = rt7_mo.groupdict()
+                        nlri_data['route-type'] = '7'
+                        nlri_data['rd'] = rt7_dict['rd']
+                        nlri_data['esi'] = rt7_dict['esi']
+                        nlri_data['eti'] = rt7_dict['eti']
+                        nlri_data['mcast_src_len'] = rt7_dict['mcast_src_len']
+                        if int(rt7_dict['mcast_src_len']) > 0:
+                            if rt7_dict['mcast_src']:
+                                nlri_data['mcast_src'] = rt7_dict['mcast_src']
+                        nlri_data['mcast_group_len'] = rt7_dict['mcast_group_len']
+                        nlri_data['mcast_group_addr'] = rt7_dict['mcast_group_addr']
+                        nlri_data['orig_rtr_len'] = rt7_dict['orig_rtr_len']
+                        nlri_data['orig_rtr_id'] = rt7_dict['orig_rtr_id']
+                        nlri_data['subnet'] = rt7_dict['subnet']
+
+                elif prefixes.startswith('[8]'):
+                    # BGP routing table entry for [8][7.7.7.7:11][0000000000AABBCCDDEE][0][32][10.10.10.10][32][19.0.101.1][32][224.0.0.1][4112]/41, version 31
+                    rt8_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
+                                                '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                                                '\[(?P<esi>.+)\]'
+                                                '\[(?P<eti>[0-9]+)\]'
+                                                '\[(?P<mcast_src_len>[0-9]+)\]'
+                                                '(\[(?P<mcast_src>.+)\])?'
+                                                '\[(?P<mcast_group_len>[0-9]+)\]'
+                                                '\[(?P<mcast_group_addr>.+)\]'
+                                                '\[(?P<orig_rtr_len>[0-9]+)\]'
+                                                '\[(?P<orig_rtr_id>.+)\]'
+                                                '\[(?P<max_resp_time>[0-9]+)\]'
+                                                '\/(?P<subnet>[0-9]+)')
+
+                    rt8_mo = rt8_prefix_re.match(prefixes)
+                    if rt8_mo:
+                        rt8_dict = rt8_mo.groupdict()
+                        nlri_data['route-type'] = '8'
+                        nlri_data['rd'] = rt8_dict['rd']
+                        nlri_data['esi'] = rt8_dict['esi']
+                        nlri_data['eti'] = rt8_dict['eti']
+                        nlri_data['mcast_src_len'] = rt8_dict['mcast_src_len']
+                        if int(rt8_dict['mcast_src_len']) > 0:
+                            if rt8_dict['mcast_src']:
+                                nlri_data['mcast_src'] = rt8_dict['mcast_src']
+                        nlri_data['mcast_group_len'] = rt8_dict['mcast_group_len']
+                        nlri_data['mcast_group_addr'] = rt8_dict['mcast_group_addr']
+                        nlri_data['orig_rtr_len'] = rt8_dict['orig_rtr_len']
+                        nlri_data['orig_rtr_id'] = rt8_dict['orig_rtr_id']
+                        nlri_data['max_resp_time'] = rt8_dict['max_resp_time']
+                        nlri_data['subnet'] = rt8_dict['subnet']
+
+
+                prefix_table_version = m.groupdict()['prefix_table_version']
+                continue
+            
             # 10.1.1.2 from 10.1.1.2 (10.1.1.2)
             # 10.16.2.2 (metric 11) (via default) from 10.16.2.2 (10.16.2.2)
             # :: (via vrf VRF1) from 0.0.0.0 (10.1.1.1)
@@ -1372,12 +1664,13 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             m = p6_3.match(line)
             if m and next_line_update_group:
                 group = m.groupdict()
-                if group['group2'] and group['group3']:
+                if group['group2'] or group['group3']:
                     update_group = []
                     for item in group:
-                        update_group.append(int(group[item]))
-                        # in-place sort is more efficient
-                        update_group.sort()
+                        if group[item]:
+                            update_group.append(int(group[item]))
+                            # in-place sort is more efficient
+                            update_group.sort()
                 else:
                     update_group = int(group['group1'])
                 next_line_update_group = False
@@ -1425,6 +1718,15 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                         subdict['recursive_via_connected'] = True
                 continue
 
+            m = p8_21.match(line)
+            if m:
+                group = m.group()
+                if 'evpn' in subdict:
+                    subdict['evpn']['ext_community'] = f"{subdict['evpn']['ext_community']} {group}"
+                else:
+                    subdict['ext_community'] = f"{subdict['ext_community']} {group}"
+                continue
+
             # Community: 62000:1
             # Community: 1:1 65100:101 65100:175 65100:500 65100:601 65151:65000 65351:1
             m = p8_3.match(line)
@@ -1448,6 +1750,17 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 subdict['cluster_list'] = m.groupdict()['cluster_list']
                 continue
 
+            m = p8_6.match(line)
+            if m:
+                subdict['pmsi'] = {}
+                subdict['pmsi']['tun_type'] = m.groupdict()['tun_type']
+                subdict['pmsi']['vni'] = m.groupdict()['vni']
+                subdict['pmsi']['tun_id'] = {}
+                if m.groupdict()['tun_endpoint'] is not None:
+                    subdict['pmsi']['tun_id']['tun_endpoint'] = m.groupdict()['tun_endpoint']
+                if m.groupdict()['local'] is not None:
+                    subdict['pmsi']['tun_id']['local'] = True
+
             # rx pathid: 0, tx pathid: 0
             m = p9.match(line)
             if m:
@@ -1465,7 +1778,34 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 mpls_labels_dict.update({'out': group['out']})
                 continue
 
+            # IGMP/MLD v3, exclude
+            # IGMP/MLD v3, include
+            # IGMP/MLD v2
+            # IGMP/MLD v1
+            # IGMP/MLD v2, v3, exclude
+            m = p19.match(line)
+            if m:
+                subdict['igmpmld'] = {}
+                group = m.groupdict()
+                subdict['igmpmld']['version'] = group['version']
+                if group['filter_mode']:
+                    subdict['igmpmld']['filter_mode'] = group['filter_mode']
+                continue
+
+            # binding SID: 28 (color - 7) (state - UP)
+            m = p20.match(line)
+            if m:
+                group = m.groupdict()
+                if 'binding_sid' not in subdict:
+                    subdict['binding_sid'] = {}
+                for i in ['sid', 'color']:
+                    subdict['binding_sid'][i] = group[i]
+                if group['state']:
+                    subdict['binding_sid']['state'] = str(group['state'])
+                continue
+
             # EVPN ESI: 00000000000000000000, Gateway Address: 0.0.0.0, local vtep: 10.21.33.33, Label 30000
+            # EVPN ESI: 00000000000000000000, Label1 2000101
             m = p10.match(line)
             if m:
                 group = m.groupdict()
@@ -1473,7 +1813,8 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                     subdict['evpn'] = {}
 
                 for i in ['evpn_esi', 'local_vtep', 'gateway_address']:
-                    subdict['evpn'][i] = group[i]
+                    if group[i]:
+                        subdict['evpn'][i] = group[i]
 
                 subdict['evpn']['label'] = int(group['label'])
                 continue
@@ -1557,11 +1898,13 @@ class ShowBgpAllDetail(ShowBgpDetailSuperParser, ShowBgpAllDetailSchema):
         * 'show bgp all detail'
         * 'show bgp vrf {vrf} {route}'
         * 'show bgp {address_family} vrf {vrf} {route}'
+        * 'show bgp {address_family} {route}'
     '''
 
     cli_command = ['show bgp all detail',
                     'show bgp vrf {vrf} {route}',
-                    'show bgp {address_family} vrf {vrf} {route}'
+                    'show bgp {address_family} vrf {vrf} {route}',
+                    'show bgp {address_family} {route}'
                    ]
     exclude = ['table_version', 'refresh_epoch', 'best_path', 'status_codes', 'transfer_pathid', 'paths']
 
@@ -1577,6 +1920,8 @@ class ShowBgpAllDetail(ShowBgpDetailSuperParser, ShowBgpAllDetailSchema):
                     address_family = 'vpnv4 unicast'
                     cmd = self.cli_command[1].format(vrf=vrf,
                         route=route)
+            # elif address_family and route:
+            #     cmd = self.cli_command[3].format(address_family=address_family, route=route) 
             else:
                 cmd = self.cli_command[0]
             # Execute command
@@ -1717,6 +2062,94 @@ class ShowIpBgpDetail(ShowBgpDetailSuperParser, ShowBgpAllDetailSchema):
                            address_family=address_family)
 
 
+# ====================================================
+# Parser for:
+#   * 'show ip bgp {address_family} detail'
+#   * 'show ip bgp {address_family} evi {evi}'
+#   * 'show ip bgp {address_family} route-type {rt}'
+#   * 'show ip bgp {address_family} evi {evi} route-type {rt}'
+# ====================================================
+class ShowIpBgpL2VPNEVPN(ShowBgpDetailSuperParser, ShowBgpAllDetailSchema):
+    ''' Parser for:
+          * 'show ip bgp {address_family} detail'
+          * 'show ip bgp {address_family} {evi} detail'
+          * 'show ip bgp {address_family} route-type {rt}'
+          * 'show ip bgp {address_family} evi {evi} route-type {rt}'
+          * 'show ip bgp {address_family} route-type {rt} {esi} {eti} {mpls_label}'
+          * 'show ip bgp {address_family} route-type {rt} {esi} {eti}'
+          * 'show ip bgp {address_family} route-type {rt} {esi}'
+          * 'show ip bgp {address_family} route-type {rt} {eti} {mac} {ip}'
+          * 'show ip bgp {address_family} route-type {rt} {eti} {ip}'
+          * 'show ip bgp {address_family} route-type {rt} {esi} {ip}'
+          * 'show ip bgp {address_family} route-type {rt} {eti} {ip} {ip_len}'
+          * 'show ip bgp {address_family} route-type {rt} {eti} {src_ip} {group_ip} {orig_ip}'
+          * 'show ip bgp {address_family} route-type {rt} {esi} {eti} {src_ip} {group_ip} {orig_ip}'
+          * 'show ip bgp {address_family} route-type {rt} {esi} {eti} {src_ip} {group_ip} {orig_ip} {lg_sync}'
+          * 'show ip bgp {address_family} evi {evi} route-type {rt} {esi} {eti} {mpls_label}', # RT1
+          * 'show ip bgp {address_family} evi {evi} route-type {rt} {esi} {eti}', # RT1
+          * 'show ip bgp {address_family} evi {evi} route-type {rt} {esi}', # RT1
+          * 'show ip bgp {address_family} evi {evi} route-type {rt} {eti} {mac} {ip}', # RT2
+          * 'show ip bgp {address_family} evi {evi} route-type {rt} {eti} {ip}', # RT3
+          * 'show ip bgp {address_family} evi {evi} route-type {rt} {esi} {ip}', # RT4 
+          * 'show ip bgp {address_family} evi {evi} route-type {rt} {eti} {ip} {ip_len}', # RT5 
+          * 'show ip bgp {address_family} evi {evi} route-type {rt} {eti} {src_ip} {group_ip} {orig_ip}', # RT6
+          * 'show ip bgp {address_family} evi {evi} route-type {rt} {esi} {eti} {src_ip} {group_ip} {orig_ip}', # RT7
+          * 'show ip bgp {address_family} evi {evi} route-type {rt} {esi} {eti} {src_ip} {group_ip} {orig_ip} {lg_sync}', # RT8
+          * 'show ip bgp {address_family} evi {evi} route-type {rt} {esi} {eti} {mac} {ip}'
+    '''
+    cli_command = ['show ip bgp {address_family} detail',
+                    'show ip bgp {address_family} evi {evi} detail',
+                    'show ip bgp {address_family} route-type {rt}',
+                    'show ip bgp {address_family} evi {evi} route-type {rt}',
+                    'show ip bgp {address_family} route-type {rt} {esi} {eti} {mpls_label}', # RT1
+                    'show ip bgp {address_family} route-type {rt} {esi} {eti}', # RT1
+                    'show ip bgp {address_family} route-type {rt} {esi}', # RT1
+                    'show ip bgp {address_family} route-type {rt} {eti} {mac} {ip}', # RT2
+                    'show ip bgp {address_family} route-type {rt} {eti} {ip}', # RT3
+                    'show ip bgp {address_family} route-type {rt} {esi} {ip}', # RT4 
+                    'show ip bgp {address_family} route-type {rt} {eti} {ip} {ip_len}', # RT5 
+                    'show ip bgp {address_family} route-type {rt} {eti} {src_ip} {group_ip} {orig_ip}', # RT6
+                    'show ip bgp {address_family} route-type {rt} {esi} {eti} {src_ip} {group_ip} {orig_ip}', # RT7
+                    'show ip bgp {address_family} route-type {rt} {esi} {eti} {src_ip} {group_ip} {orig_ip} {lg_sync}', # RT8
+                    'show ip bgp {address_family} evi {evi} route-type {rt} {esi} {eti} {mpls_label}', # RT1
+                    'show ip bgp {address_family} evi {evi} route-type {rt} {esi} {eti}', # RT1
+                    'show ip bgp {address_family} evi {evi} route-type {rt} {esi}', # RT1
+                    'show ip bgp {address_family} evi {evi} route-type {rt} {eti} {mac} {ip}', # RT2
+                    'show ip bgp {address_family} evi {evi} route-type {rt} {eti} {ip}', # RT3
+                    'show ip bgp {address_family} evi {evi} route-type {rt} {esi} {ip}', # RT4 
+                    'show ip bgp {address_family} evi {evi} route-type {rt} {eti} {ip} {ip_len}', # RT5 
+                    'show ip bgp {address_family} evi {evi} route-type {rt} {eti} {src_ip} {group_ip} {orig_ip}', # RT6
+                    'show ip bgp {address_family} evi {evi} route-type {rt} {esi} {eti} {src_ip} {group_ip} {orig_ip}', # RT7
+                    'show ip bgp {address_family} evi {evi} route-type {rt} {esi} {eti} {src_ip} {group_ip} {orig_ip} {lg_sync}', # RT8
+                    'show ip bgp {address_family} evi {evi} route-type {rt} {esi} {eti} {mac} {ip}']
+
+    def cli(self, address_family='', evi='', rt='', output=None, **kwargs):
+        if output is None:
+            if evi and rt:
+                cmd = self.cli_command[3].format(address_family='l2vpn evpn', evi=evi, rt=rt)
+            elif rt and not evi:
+                cmd = self.cli_command[2].format(address_family='l2vpn evpn', rt=rt)
+            elif not rt and evi:
+                cmd = self.cli_command[1].format(address_family='l2vpn evpn', evi=evi)
+            else:
+                cmd = self.cli_command[0].format(address_family='l2vpn evpn')
+
+            for arg in ['esi', 'eti', 'mac', 'mpls_label', 'ip', 'ip_len', 'src_ip', 'group_ip', 'orig_ip', 'lg_sync']:
+                    if arg in kwargs and kwargs[arg]:
+                        cmd += ' {}'.format(kwargs[arg])
+
+            output = self.device.execute(cmd)
+
+        show_output = output
+        if evi and rt:
+            return super().cli(address_family='l2vpn evpn', evi=evi, rt=rt, output=show_output)
+        elif rt and not evi:
+            return super().cli(address_family='l2vpn evpn', rt=rt, output=show_output)
+        elif not rt and evi:
+            return super().cli(address_family='l2vpn evpn', evi=evi, output=show_output)
+        else:
+            return super().cli(address_family='l2vpn evpn', output=show_output)
+
 #-------------------------------------------------------------------------------
 
 
@@ -1753,7 +2186,7 @@ class ShowBgpSummarySchema(MetaParser):
     '''
 
     schema = {
-        'bgp_id': int,
+        'bgp_id': Or(int,str),
         'vrf':
             {Any():
                 {Optional('neighbor'):
@@ -1761,7 +2194,7 @@ class ShowBgpSummarySchema(MetaParser):
                         {'address_family':
                             {Any():
                                 {'version': int,
-                                'as': int,
+                                'as': Or(int, str),
                                 'msg_rcvd': int,
                                 'msg_sent': int,
                                 'tbl_ver': int,
@@ -1770,7 +2203,7 @@ class ShowBgpSummarySchema(MetaParser):
                                 'up_down': str,
                                 'state_pfxrcd': str,
                                 Optional('route_identifier'): str,
-                                Optional('local_as'): int,
+                                Optional('local_as'): Or(int, str),
                                 Optional('bgp_table_version'): int,
                                 Optional('routing_table_version'): int,
                                 Optional('prefixes'):
@@ -1913,9 +2346,10 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
         p1 = re.compile(r'^For address family: +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
 
         # BGP router identifier 192.168.111.1, local AS number 100
+        # BGP router identifier 30.1.107.78, local AS number 304.304
         p2 = re.compile(r'^BGP +router +identifier'
                          ' +(?P<route_identifier>[0-9\.\:]+), +local +AS'
-                         ' +number +(?P<local_as>[0-9]+)$')
+                         ' +number +(?P<local_as>[0-9\.]+)$')
 
         # BGP table version is 28, main routing table version 28
         p3 = re.compile(r'^BGP +table +version +is'
@@ -1967,7 +2401,7 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
         # 192.168.4.1       4          100       0       0        1    0    0 never    Idle
         # 192.168.51.1       4          100       0       0        1    0    0 01:07:38 Idle
         p9 = re.compile(r'^ *(?P<our_entry>\*)?(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<version>[0-9]+)'
-                         ' +(?P<as>[0-9]+) +(?P<msg_rcvd>[0-9]+)'
+                         ' +(?P<as>[0-9]+(\.\d+)?) +(?P<msg_rcvd>[0-9]+)'
                          ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
                          ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
                          ' +(?P<up_down>[a-zA-Z0-9\:]+)'
@@ -1976,10 +2410,12 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
         #  Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
         #  2001:DB8:20:4:6::6
         #           4          400      67      73       66    0    0 01:03:11        5
-        p10 = re.compile(r'^(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
+        #  *2001::100:1:2:1
+        #                  4        65001       7       7      198    0    0 00:00:02        1
+        p10 = re.compile(r'^(?P<our_entry>\*)?(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
 
         p11 = re.compile(r'^(?P<version>[0-9]+)'
-                          ' +(?P<as>[0-9]+) +(?P<msg_rcvd>[0-9]+)'
+                          ' +(?P<as>[0-9]+(\.\d+)?) +(?P<msg_rcvd>[0-9]+)'
                           ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
                           ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
                           ' +(?P<up_down>[a-zA-Z0-9\:]+)'
@@ -2009,19 +2445,16 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                 continue
 
             # BGP router identifier 192.168.111.1, local AS number 100
+            # BGP router identifier 30.1.107.78, local AS number 304.304
             m = p2.match(line)
             if m:
                 route_identifier = m.groupdict()['route_identifier']
+                try:
+                    local_as = int(m.groupdict()['local_as'])
+                except:
+                    local_as = m.groupdict()['local_as']
 
-                local_as = str(m.groupdict()['local_as'])
-                # Coversion to BGP ASN 4260036636(AS-PLAIN) from 65003.28(AS-COLON)
-                if '.' in local_as:
-                    val = local_as.split('.')
-                    local_as = 65536*int(val[0])+int(val[1])
-                else:
-                    local_as = int(local_as)
                 sum_dict['bgp_id'] = local_as
-                
                 continue
 
             # BGP table version is 28, main routing table version 28
@@ -2101,12 +2534,17 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
             # 192.168.111.1       4          100       0       0        1    0    0 01:07:38 Idle
             # 192.168.4.1       4          100       0       0        1    0    0 never    Idle
             # 192.168.51.1       4          100       0       0        1    0    0 01:07:38 Idle
+            # 30.1.10.1       4      304.304    6953   38119   136088    0    0 00:50:14     2540
+            # 30.2.10.1       4      304.304    6347   38120   136088    0    0 00:50:13     2580
+            # 30.3.10.1       4      301.301    7722   38113   136088    0    0 00:50:14     4439
             m = p9.match(line)
             if m:
                 # Add neighbor to dictionary
                 neighbor = str(m.groupdict()['neighbor'])
-                neighbor_as = int(m.groupdict()['as'])
-
+                try:
+                    neighbor_as = int(m.groupdict()['as'])
+                except:
+                    neighbor_as = m.groupdict()['as']
                 if not passed_vrf:
                     if address_family not in ['ipv4 unicast', 'ipv6 unicast']:
                         if 'all summary' in cmd:
@@ -2206,11 +2644,12 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                 if m :
                     # Add neighbor to dictionary
                     neighbor = str(m.groupdict()['neighbor'])
-                    if 'neighbor' not in sum_dict['vrf'][vrf]:
-                        sum_dict['vrf'][vrf]['neighbor'] = {}
-                    if neighbor not in sum_dict['vrf'][vrf]['neighbor']:
-                        sum_dict['vrf'][vrf]['neighbor'][neighbor] = {}
-                    nbr_dict = sum_dict['vrf'][vrf]['neighbor'][neighbor]
+                    if sum_dict.get('vrf'):
+                        if 'neighbor' not in sum_dict['vrf'][vrf]:
+                            sum_dict['vrf'][vrf]['neighbor'] = {}
+                        if neighbor not in sum_dict['vrf'][vrf]['neighbor']:
+                            sum_dict['vrf'][vrf]['neighbor'][neighbor] = {}
+                        nbr_dict = sum_dict['vrf'][vrf]['neighbor'][neighbor]
 
                     # Add address family to this neighbor
                     if 'address_family' not in nbr_dict:
@@ -2223,7 +2662,10 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                 if m:
                     # Add keys for this address_family
                     nbr_af_dict['version'] = int(m.groupdict()['version'])
-                    nbr_af_dict['as'] = int(m.groupdict()['as'])
+                    try:
+                        nbr_af_dict['as'] = int(m.groupdict()['as'])
+                    except:
+                        nbr_af_dict['as'] = m.groupdict()['as']
                     nbr_af_dict['msg_rcvd'] = int(m.groupdict()['msg_rcvd'])
                     nbr_af_dict['msg_sent'] = int(m.groupdict()['msg_sent'])
                     nbr_af_dict['tbl_ver'] = int(m.groupdict()['tbl_ver'])
@@ -2330,6 +2772,23 @@ class ShowBgpSummary(ShowBgpSummarySuperParser, ShowBgpSummarySchema):
                            address_family=address_family, cmd=cmd)
 
 
+class ShowBgpL2vpnEvpnSummary(ShowBgpSummarySuperParser):
+
+    ''' Parser for:
+        * 'show bgp l2vpn evpn summary'
+    '''
+
+    cli_command = 'show bgp l2vpn evpn summary'
+
+    def cli(self, output=None):
+
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        # Call super
+        return super().cli(output=output)
+
+
 # ============================================
 # Parser for:
 #   * 'show bgp all summary'
@@ -2350,7 +2809,8 @@ class ShowBgpAllSummary(ShowBgpSummarySuperParser, ShowBgpSummarySchema):
                    ]
     exclude = ['msg_sent', 'msg_rcvd', 'activity_paths', 'activity_prefixes',
         'bgp_table_version', 'routing_table_version', 'tbl_ver', 'up_down',
-        'attribute_entries', 'dropped', 'established']
+        'attribute_entries', 'dropped', 'established', 'input_queue',
+        'output_queue']
 
 
     def cli(self, address_family='', vrf='',output=None):
@@ -2514,9 +2974,9 @@ class ShowBgpAllNeighborsSchema(MetaParser):
             {Any():
                  {'neighbor':
                     {Any():
-                        {'remote_as': int,
+                        {'remote_as': Or(int, str),
                         'link': str,
-                        Optional('local_as'): int,
+                        Optional('local_as'): Or(int, str),
                         Optional('description'): str,
                         'shutdown': bool,
                         Optional('bgp_version'): int,
@@ -2809,22 +3269,24 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
         # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
         p2_1 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +remote +AS'
-                         ' +(?P<remote_as>(\d+)), +(?P<link>[a-zA-Z]+) +link$')
+                         ' +(?P<remote_as>([\d\.]+)), +(?P<link>[a-zA-Z]+) +link$')
 
         # BGP neighbor is 10.66.6.6,  vrf VRF2,  remote AS 400, external link
         # BGP neighbor is 172.17.111.1,  vrf SH_BGP_VRF100,  remote AS 65000, external link
         p2_2 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +vrf'
-                           ' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>(\d+)),'
+                           ' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>([\d\.]+)),'
                            ' +(?P<link>[a-zA-Z]+) +link$')
 
         # IOS output
         # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101, external link
         # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101 no-prepend replace-as, external link
+        # BGP neighbor is 10.4.11.2, remote AS 101.101, external link
+        # BGP neighbor is 10.10.11.1, vrf CustA-VPN1, remote AS 4200000001, local AS 4200000101 no-prepend replace-as, external link
         p2_3 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)),'
                            '(?: +vrf +(?P<vrf>(\S+)),)?'
-                           ' +remote +AS +(?P<remote_as>(\d+)),'
-                           ' +local +AS +(?P<local_as>\d+)(?P<no_prepend> no-prepend)?'
-                           '(?P<replace_as> replace-as)?, +(?P<link>(\S+)) +link$')
+                           ' +remote +AS +(?P<remote_as>([\d\.]+)),'
+                           '( +local +AS +(?P<local_as>[\d\.]+))?(?P<no_prepend> no-prepend)?'
+                           '(?P<replace_as> replace-as)?,? +(?P<link>(\S+)) +link$')
 
         # Description: router22222222
         p3 = re.compile(r'^Description: +(?P<description>(\S+))$')
@@ -2937,7 +3399,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
         #  Used as bestpath:     n/a          0
         #  Used as multipath:    n/a          0
         p22 = re.compile('^(?P<item>([a-zA-Z\s\-]+)):? +(?P<sent>(n/a|\d+))'
-                         ' +(?P<recv>(n/a|\d+))(?:\(Consumes +(?P<bytes>(\d+))'
+                         ' +(?P<recv>(n/a|\d+))(?:\s+\(Consumes +(?P<bytes>(\d+))'
                          ' +bytes\))?$')
 
         # Do log neighbor state changes (via global configuration)
@@ -3195,7 +3657,10 @@ class ShowBgpNeighborSuperParser(MetaParser):
                            setdefault('neighbor', {}).setdefault(neighbor, {})
 
                 # Set keys
-                nbr_dict['remote_as'] = int(group['remote_as'])
+                try:
+                    nbr_dict['remote_as'] = int(group['remote_as'])
+                except:
+                    nbr_dict['remote_as'] = group['remote_as']
                 nbr_dict['link'] = group['link']
                 nbr_dict['shutdown'] = False
 
@@ -3222,7 +3687,10 @@ class ShowBgpNeighborSuperParser(MetaParser):
                            setdefault('neighbor', {}).setdefault(neighbor, {})
 
                 # Set keys
-                nbr_dict['remote_as'] = int(group['remote_as'])
+                try:
+                    nbr_dict['remote_as'] = int(group['remote_as'])
+                except:
+                    nbr_dict['remote_as'] = group['remote_as']
                 nbr_dict['link'] = group['link']
                 nbr_dict['shutdown'] = False
 
@@ -3234,11 +3702,16 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101, external link
             # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101 no-prepend replace-as, external link
+            # BGP neighbor is 10.4.11.2, remote AS 101.101, external link
+            # BGP neighbor is 10.10.11.1, vrf CustA-VPN1, remote AS 4200000001, local AS 4200000101 no-prepend replace-as, external link
             m = p2_3.match(line)
             if m:
                 group = m.groupdict()
                 neighbor = group['neighbor']
-                vrf = 'default'
+                vrf = group['vrf']
+                # if no vrf is configured - set vrf to 'default'
+                if not vrf:
+                    vrf = 'default'
 
                 # Add to neighbors list
                 list_of_neighbors.append(neighbor)
@@ -3249,11 +3722,17 @@ class ShowBgpNeighborSuperParser(MetaParser):
                            setdefault('neighbor', {}).setdefault(neighbor, {})
 
                 # Set keys
-                nbr_dict['remote_as'] = int(group['remote_as'])
+                try:
+                    nbr_dict['remote_as'] = int(group['remote_as'])
+                except:
+                    nbr_dict['remote_as'] = group['remote_as']
                 nbr_dict['link'] = group['link']
                 nbr_dict['shutdown'] = False
                 if group['local_as']:
-                    nbr_dict['local_as'] = int(group['local_as'])
+                    try:
+                        nbr_dict['local_as'] = int(group['local_as'])
+                    except:
+                        nbr_dict['local_as'] = group['local_as']
                 if group['replace_as']:
                     nbr_dict['replace_as'] = True
                 else:
@@ -3507,6 +3986,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             #  Keepalives:            75         74
             #  Route Refresh:          0          0
             #  Total:                 87         81
+            #  Prefixes Current:     403        201 (Consumes 27336 bytes)
             m = p22.match(line)
             if m:
                 group = m.groupdict()
@@ -4010,13 +4490,13 @@ class ShowBgpAllNeighbors(ShowBgpNeighborSuperParser, ShowBgpAllNeighborsSchema)
         'opens', 'route_refresh', 'total', 'updates', 'up_time', 'rtto', 'rtv', 'srtt',
         'pmtuager', 'min_rtt', 'irs', 'iss', 'tcp_semaphore', 'foreign_port', 'local_port',
         'reset_reason', 'status_flags', 'dropped', 'established', 'out_of_order',
-        'keepalive', 'retransmit_packet', 'max_rtt', 'mss', 'rcv_scale']
+        'keepalive', 'retransmit_packet', 'max_rtt', 'mss', 'rcv_scale', 'ack_hold', 'fastretransmit']
 
 
     def cli(self, neighbor='', address_family='', output=None):
 
         # Restricted address families
-        restricted_list = ['ipv4 unicast', 'ipv6 unicast']
+        restricted_list = ['ipv4 unicast', 'ipv6 unicast','l2vpn evpn']
 
         # Init vars
         ret_dict = {}
@@ -4221,7 +4701,7 @@ class ShowIpBgpNeighbors(ShowBgpNeighborSuperParser, ShowBgpAllNeighborsSchema):
     def cli(self, neighbor='', address_family='', vrf='', output=None):
 
         # Restricted address families
-        restricted_list = ['ipv4 unicast', 'ipv6 unicast', 'link-state link-state']
+        restricted_list = ['ipv4 unicast', 'ipv6 unicast', 'link-state link-state','l2vpn evpn']
 
         # Init vars
         ret_dict = {}
@@ -4360,22 +4840,15 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
 
     def cli(self, neighbor, address_family='', output=None):
 
-        # BGP neighbor is 10.225.10.253,  vrf CE1test,  remote AS 60000, external link
-        # BGP neighbor is 192.168.0.254,  vrf L3VPN_1001,  remote AS 60001, external link
-        p = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
-                        '(, +vrf +(?P<vrf>\S+))?, +remote AS '
-                        '+(?P<remote_as_id>[0-9]+), '
-                        '+(?P<internal_external_link>[a-z\s]+)$')
-
         p1 = re.compile(r'^\s*For +address +family:'
                             ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
 
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
+        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|d|h|\*|\>|i|r|S|m|b|f|x|a|c|t|L|\s)+)?(?=[\d|\[])'
+                            '(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
                             '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
                             '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
 
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|b|h|\*|\>|\s)+)'
+        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|d|h|\*|\>|i|r|S|m|b|f|x|a|c|t|L|\s)+)'
                             '(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
                             '(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
                             '[\.][0-9]+[\/]?[0-9]*)|([a-zA-Z0-9]+[\:]'
@@ -4387,7 +4860,7 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
                             ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
                             ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
 
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|d|h|\*|\>|i|r|S|m|b|f|x|a|c|t|L|\s)+)?'
                             '(?P<path_type>(i|e|c|l|a|r|I))?'
                             ' +(?P<next_hop>(([0-9]+[\.][0-9]+[\.][0-9]'
                             '+[\.][0-9]+)|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
@@ -4395,7 +4868,7 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
                             '[a-zA-Z0-9]+[\:][\:][a-zA-Z0-9])|'
                             '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
                             '[\:][a-zA-Z0-9]+[\:][\:][a-zA-Z0-9])))?'
-                            '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+                            '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\.]+))?'
                             ' +(?P<origin_codes>(i|e|\?|\|))$')
 
         p4 = re.compile(r'^\s*Route +Distinguisher *: '
@@ -4403,17 +4876,23 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
                             '( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
                             '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
+        vrf = 'default'
         # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
         out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
-        vrf = 'default'
+        bgp_neighbor_re = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
+                            '(, +vrf +(?P<vrf>\S+))?, +remote AS '
+                            '+(?P<remote_as_id>[0-9]+), '
+                            '+(?P<internal_external_link>[a-z\s]+)$')
         for line in out_vrf.splitlines():
             line = line.strip()
             # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
-            m = p.match(line)
+            # BGP neighbor is 10.225.10.253,  vrf CE1test,  remote AS 60000, external link
+            # BGP neighbor is 192.168.0.254,  vrf L3VPN_1001,  remote AS 60001, external link
+            m = bgp_neighbor_re.match(line)
             if m:
                 if m.groupdict()['bgp_neighbor'] == neighbor:
                     if m.groupdict()['vrf']:
-                        vrf = str(m.groupdict()['vrf'])
+                        vrf = m.groupdict()['vrf']
                         break
                 else:
                     continue
@@ -4452,9 +4931,12 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
         # *>i10.49.0.0/16         10.106.101.1                        100          0 10 20 30 40 50 60 70 80 90 i
         # *>i10.4.2.0/24         10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
         # *>i  172.16.51.0/24    192.168.36.220          0    100      0 ?
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|b|h|\*|\>|\s)+)'
+        # r>i 0.0.0.0          10.250.6.1               0    300      0 65000 i
+        # r>i 0.0.0.0          10.250.6.1               0    300      0 65000.1 i
+        # r>i 0.0.0.0          10.250.6.1               0    300      0 65000.1 65000.1 i
+        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|d|h|\*|\>|i|r|S|m|b|f|x|a|c|t|L|\s)+)'
             '(?P<path_type>(i|e|c|l|a|r|I))?(\s+)?(?P<prefix>\S+) +(?P<next_hop>'
-            '[a-zA-Z0-9\.\:]+) +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+) +'
+            '[a-zA-Z0-9\.\:]+) +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\.]+) +'
             '(?P<origin_codes>(i|e|\?|\&|\|))$')
 
         #                     0.0.0.0               100      32768 i
@@ -4523,6 +5005,7 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
             # *>i[2]:[77][7,0][10.69.9.9,1,151587081][10.135.1.1,22][10.106.101.1,10.76.1.30]/616
             # *>i2001:db8:aaaa:1::/113       ::ffff:10.106.101.1
             # *>  2001:db8:a69:484::/64   2001:DB8:20:4:6::6
+            # *>i 10.100.248.128/26
             m = p3_1.match(line)
             if m:
                 # New prefix, reset index count
@@ -4564,6 +5047,9 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
             # *>r10.16.2.0         0.0.0.0               4444        100      32768 ?
             # *>i10.49.0.0/16         10.106.101.1                        100          0 10 20 30 40 50 60 70 80 90 i
             # *>i10.4.2.0/24         10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
+            # r>i 0.0.0.0          10.250.6.1               0    300      0 65000 i
+            # r>i 0.0.0.0          10.250.6.1               0    300      0 65000.1 i
+            # r>i 0.0.0.0          10.250.6.1               0    300      0 65000.1 65000.1 i
             # Condition placed to handle the situation of a long line that is
             # divided nto two lines while actually it is not another index.
             if not data_on_nextline:
@@ -4620,7 +5106,7 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
                                      '(?P<localprf>[0-9]+)'
                                      '(?P<space2>\s{5,10})'
                                      '(?P<weight>[0-9]+)'
-                                     '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                                     '(?: *(?P<path>[0-9\{\}\s\.]+))?$').match(numbers)
 
                     #    100        ---          0 10 20 30 40 50 60 70 80 90
                     #    ---        100          0 10 20 30 40 50 60 70 80 90
@@ -4629,11 +5115,11 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
                     m2 = re.compile(r'^(?P<value>[0-9]+)'
                                      '(?P<space>\s{2,21})'
                                      '(?P<weight>[0-9]+)'
-                                     '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                                     '(?: *(?P<path>[0-9\{\}\s\.]+))?$').match(numbers)
 
                     #    ---        ---      32788 200 33299 51178 47751 {27016}
                     m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                     ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                                     ' +(?P<path>[0-9\{\}\s\.]+)$').match(numbers)
 
                     if m1:
                         af_dict['advertised'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -4653,7 +5139,7 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
                         # Set path
                         if m2.groupdict()['path']:
                             af_dict['advertised'][prefix]['index'][index]['path'] = m2.groupdict()['path'].strip()
-                            continue
+                        continue
                     elif m3:
                         af_dict['advertised'][prefix]['index'][index]['weight'] = int(m3.groupdict()['weight'])
                         af_dict['advertised'][prefix]['index'][index]['path'] = m3.groupdict()['path'].strip()
@@ -4663,6 +5149,7 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
             #                     10.106.101.1            4444       100 0 3 10 20 30 40 50 60 70 80 90 i
             #*>i                  10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
             #                                           2219             0 400 33299 51178 47751 {27016} e
+            #                                           2219             0 400 33299 51178 47751 27016.1 e
             m = p3_3.match(line)
             if m:
                 # Get keys
@@ -4708,7 +5195,7 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
                                  '(?P<localprf>[0-9]+)'
                                  '(?P<space2>\s{5,10})'
                                  '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                                 '(?: *(?P<path>[0-9\{\}\s\.]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
@@ -4717,11 +5204,11 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
                 m2 = re.compile(r'^(?P<value>[0-9]+)'
                                  '(?P<space>\s{2,21})'
                                  '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                                 '(?: *(?P<path>[0-9\{\}\s\.]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
                 m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                                 ' +(?P<path>[0-9\{\}\s\.]+)$').match(numbers)
 
                 if m1:
                     af_dict['advertised'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -4887,11 +5374,22 @@ class ShowIpBgpAllNeighborsAdvertisedRoutes(ShowBgpNeighborsAdvertisedRoutesSupe
             # Execute command
             show_output = self.device.execute(cmd)
         else:
+            if self.check_number_of_prefixes(output) == 0:
+                return {}
             show_output = output
 
         # Call super
         return super().cli(output=show_output, neighbor=neighbor,
                            address_family=address_family)
+
+    def check_number_of_prefixes(self, output):
+        number_of_prefixes = re.compile(r'Total\s+number\s+of\s+prefixes\s+(?P<number_of_prefixes>\d+)\s*')
+        m = number_of_prefixes.search(output)
+        if not m:
+            return 0
+        return int(m["number_of_prefixes"])
+
+
 # =================================================================================
 # Parser for:
 #   * 'show ip bgp neighbors {neighbor} advertised-routes'
@@ -5084,6 +5582,8 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
         data_on_nextline =  False
         index = 1
         bgp_table_version = local_router_id = ''
+        neighbor_id = str(neighbor)
+        original_address_family = address_family
 
         for line in output.splitlines():
             line = line.rstrip()
@@ -5091,7 +5591,6 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
             # For address family: IPv4 Unicast
             m = p1.match(line)
             if m:
-                neighbor_id = str(neighbor)
                 address_family = str(m.groupdict()['address_family']).lower()
                 original_address_family = address_family
                 continue
@@ -5437,29 +5936,37 @@ class ShowBgpAllNeighborsReceivedRoutes(ShowBgpNeighborsReceivedRoutesSuperParse
 
 # ====================================================================
 # Parser for:
-#   * 'show bgp neighbors {neighbor} received-routes'
+#   * 'show bgp {address_family} vrf {vrf} neighbors {neighbor} received-routes'
 #   * 'show bgp {address_family} neighbors {neighbor} received-routes'
+#   * 'show bgp neighbors {neighbor} received-routes'
 # ====================================================================
 class ShowBgpNeighborsReceivedRoutes(ShowBgpNeighborsReceivedRoutesSuperParser, ShowBgpNeighborsReceivedRoutesSchema):
 
     ''' Parser for:
+        * 'show bgp {address_family} vrf {vrf} neighbors {neighbor} received-routes'
         * 'show bgp {address_family} neighbors {neighbor} received-routes'
         * 'show bgp neighbors {neighbor} received-routes'
     '''
 
-    cli_command = ['show bgp {address_family} neighbors {neighbor} received-routes',
-                   'show bgp neighbors {neighbor} received-routes',
-                   ]
+    cli_command = [
+        'show bgp neighbors {neighbor} received-routes',
+        'show bgp {address_family} neighbors {neighbor} received-routes',
+        'show bgp {address_family} vrf {vrf} neighbors {neighbor} received-routes',
+    ]
 
-    def cli(self, neighbor, address_family='', output=None):
+    def cli(self, neighbor, address_family='', vrf='', output=None):
 
         if output is None:
             # Build command
-            if address_family and neighbor:
-                cmd = self.cli_command[0].format(address_family=address_family,
+            if address_family and vrf and neighbor:
+                cmd = self.cli_command[2].format(address_family=address_family,
+                                                 vrf=vrf,
+                                                 neighbor=neighbor)
+            elif address_family and neighbor:
+                cmd = self.cli_command[1].format(address_family=address_family,
                                                  neighbor=neighbor)
             elif neighbor:
-                cmd = self.cli_command[1].format(neighbor=neighbor)
+                cmd = self.cli_command[0].format(neighbor=neighbor)
             # Execute command
             show_output = self.device.execute(cmd)
         else:
@@ -5565,7 +6072,8 @@ class ShowBgpAllNeighborsRoutesSchema(MetaParser):
     '''
 
     schema = {
-        'vrf':
+        Optional('total_num_of_prefixes'): int,
+        Optional('vrf'):
             {Any():
                 {'neighbor':
                     {Any():
@@ -5719,6 +6227,9 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
                          '( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
                          '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
+        # Total number of prefixes 32
+        p8 = re.compile(r'^Total number of prefixes (?P<total_num_of_prefixes>\d+)$')
+
         for line in output.splitlines():
             line = line.rstrip()
 
@@ -6034,6 +6545,17 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
                     af_dict['routes'] = {}
                     continue
 
+            # Total number of prefixes 32
+            m = p8.match(line.strip())
+            if m:
+                if 'total_num_of_prefixes' in route_dict:
+                    # key already exists, add to it
+                    route_dict['total_num_of_prefixes'] += int(m.groupdict()['total_num_of_prefixes'])
+                else:
+                    # key doesnt exist, create it
+                    route_dict['total_num_of_prefixes'] = int(m.groupdict()['total_num_of_prefixes'])
+                continue
+
         return route_dict
 
 
@@ -7241,3 +7763,294 @@ class ShowIpBgpAllDampeningParameters(ShowIpBgpAllDampeningParametersSchema):
 
 
 #-------------------------------------------------------------------------------
+
+# ===============================================
+# Parser for:
+#   * 'show ip bgp {address_family} mdt vrf {vrf}'
+# ===============================================
+
+class ShowIpBgpMdtVrf(ShowBgpSuperParser, ShowBgpSchema):
+    ''' Parser for
+        show ip bgp {address_family} mdt vrf {vrf}
+    '''
+
+    cli_command = 'show ip bgp {address_family} mdt vrf {vrf}'
+
+    def cli(self, output=None, address_family='', vrf=''):
+        if output is None:
+            output = self.device.execute(self.cli_command.format(address_family=address_family, vrf=vrf))
+
+        # Call Super
+        return super().cli(output=output, address_family=address_family, vrf=vrf)
+
+
+
+# ======================================================
+# Parser for 'show bgp l2vpn evpn evi {evi_id} route-type {route_type} '
+# ======================================================
+
+class ShowBgpL2vpnEvpnEviRouteTypeSchema(MetaParser):
+    """Schema for show bgp l2vpn evpn evi {evi_id} route-type {route_type}"""
+
+    schema = {
+        'bgp_routing_table': str,
+	'version': {
+            Any():{
+                'evi_num': str,
+                'advertise': str,
+                'refresh': str,
+                Optional('import_path'): str,
+                'vtep_loopback': str,
+                'dist_loopback': str,
+                Optional('origin'): str,
+                Optional('metric'): int,
+                Optional('local_pref'): int,
+                Optional('community'): str,
+                'extended_community': str,
+                'encap': int,
+                Optional('originator'): str,
+                Optional('cluster_list'): str,
+                'pmsi_flags': str,
+                'tunnel_type': str,
+                'length': int,
+                'vni_id': int,
+                'tunnel_id': str,
+                Optional('vrf'): str,
+                Optional('l3_vni'): int,
+                Optional('local_router_mac'): str,
+                Optional('core_irb_intf'): str,
+                Optional('vtep_ip'): str,
+                'rx_path_id': str,
+                'tx_path_id': str,
+                'date_time': str,
+            },
+        }
+    }
+
+class ShowBgpL2vpnEvpnEviRouteType(ShowBgpL2vpnEvpnEviRouteTypeSchema):
+    """Parser for show bgp l2vpn evpn evi {evi_id} route-type {route_type}"""
+
+    cli_command = 'show bgp l2vpn evpn evi {evi_id} route-type {route_type}'
+
+    def cli(self, evi_id, route_type, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command.format(evi_id=evi_id, route_type=route_type))
+
+        # BGP routing table entry for [3][172.11.1.22:99][0][32][172.11.1.1]/17, version 264
+        p1 = re.compile(r"^BGP\s+routing\s+table\s+entry\s+for\s+\[+\d+\]+\[+(?P<bgp_routing_table>(\d{1,3}\.){3}\d{1,3}\:\d+)+\]+\S+\s+version+\s(?P<version>\S+)$")
+
+        # Paths: (1 available, best #1, table evi_99)
+        p2 = re.compile(r"^Paths:\s+\(1\s+available,\s+best\s+#1,\s+table\s+(?P<evi_num>\S+)\)$")
+
+        # Not advertised to any peer
+        p3_1 = re.compile(r"^(?P<advertise>\S+\s+\S+)\s+to\s+any\s+peer$")
+
+        # Advertised to update-groups:
+        p3_2 = re.compile(r"^(?P<advertise>\S+)\s+to\s+update-+groups:$")
+
+        # Refresh Epoch 1
+        p4 = re.compile(r"^Refresh\s+(?P<refresh>\S+\s+\d+)$")
+
+        # Local, imported path from [3][172.11.1.2:99][0][32][172.11.1.2]/17 (global)
+        p5 = re.compile(r"^Local,+\s+imported\s+path\s+from\s+(?P<import_path>\S+)+\s+\(+global\)$")
+
+        # 172.11.1.2 (metric 30) (via default) from 172.11.1.11 (172.11.1.11)
+        p6 = re.compile(
+            r"^(?P<vtep_loopback>\S+)\s+\(+metric\s+\d+\)+\s+\(via\s+default+\)+\s+from+\s+(?P<dist_loopback>\S+)\s+\S+$")
+
+        # 0.0.0.0 (via default) from 0.0.0.0 (172.11.1.22)
+        p6_1 = re.compile(r"^(?P<vtep_loopback>(\d{1,3}\.){3}\d{1,3})+\s+\(+via\s+default\)+\s+from\s+(?P<dist_loopback>(\d{1,3}\.){3}\d{1,3})\s+\S+$")
+
+        #      Origin incomplete, metric 0, localpref 100, valid, internal, best
+        p7 = re.compile(
+            r"^Origin\s+(?P<origin>\w+),\s+metric\s+(?P<metric>\d+),\s+localpref\s+(?P<local_pref>\d+),\s+valid,\s+internal,\s+best$")
+
+        # Community: 999:999
+        p7_1 = re.compile(r"^Community:\s+(?P<community>\S+)$")
+
+        #      Extended Community: RT:9999:99 ENCAP:8
+        p8 = re.compile(r"^Extended\s+Community:\s+(?P<extended_community>\S+)\s+ENCAP:(?P<encap>\d+)$")
+
+        #      Originator: 172.11.2.1, Cluster list: 172.11.1.11
+        p9 = re.compile(
+            r"^Originator:\s+(?P<originator>(\d{1,3}\.){3}\d{1,3}),\s+Cluster\s+list:\s+(?P<cluster_list>(\d{1,3}\.){3}\d{1,3})$")
+
+        #      PMSI Attribute: Flags:0x0, Tunnel type:IR, length 4, vni:200199, tunnel identifier: < Tunnel Endpoint: 172.11.1.1 >
+        p10 = re.compile(
+            r"PMSI\s+Attribute:\s+Flags:(?P<pmsi_flags>\S+),\s+Tunnel\s+type:+(?P<tunnel_type>\w+),\s+length\s+(?P<length>\d+),\s+vni:+(?P<vni_id>\d+),\s+tunnel\s+identifier:\s+(?P<tunnel_id>.*)$")
+
+        # Local irb vxlan vtep:
+        p11 = re.compile(r"^Local\s+irb\s+(?P<vxlan_vtep>\w+\s+\w+)$")
+
+        #        vrf:not found, l3-vni:0
+        p12 = re.compile(r"^vrf:+(?P<vrf>\w+\s+\w+),\s+l3-vni:+(?P<l3_vni>\d+)$")
+
+        #        local router mac:0000.0000.0000
+        p13 = re.compile(r"^local\s+router\s+mac:+(?P<local_router_mac>\S+)$")
+
+        #        core-irb interface:(not found)
+        p14 = re.compile(r"^core-irb\s+interface:+(?P<core_irb_intf>\S+\s+\S+)$")
+
+        #        vtep-ip:172.11.1.22
+        p15 = re.compile(r"^vtep-ip:+(?P<vtep_ip>\S+)$")
+
+        #      rx pathid: 0, tx pathid: 0x0
+        p16 = re.compile(r"^rx\s+pathid:\s+(?P<rx_path_id>\S+),\s+tx\s+pathid:\s+(?P<tx_path_id>\S+)$")
+
+        #      Updated on Jan 22 2023 07:59:46 UTC
+        p17 = re.compile(r"^Updated\s+on\s+(?P<date_time>\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
+
+        ret_dict = {}
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            # BGP routing table entry for [3][172.11.1.22:99][0][32][172.11.1.1]/17, version 264
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                ret_dict.update({'bgp_routing_table': group['bgp_routing_table']})
+                version = int(group['version'])
+                bgp_dict = ret_dict.setdefault('version', {})
+                version_dict = bgp_dict.setdefault(version, {})
+                continue
+
+            # Paths: (1 available, best #1, table evi_99)
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict.update({'evi_num': group['evi_num']})
+                continue
+
+            # Not advertised to any peer
+            m = p3_1.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict['advertise'] = group['advertise']
+                continue
+
+            # Advertised to update-groups:
+            m = p3_2.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict['advertise'] = group['advertise']
+                continue
+
+            # Refresh Epoch 1
+            m = p4.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict['refresh'] = group['refresh']
+                continue
+
+            # Local, imported path from [3][172.11.1.2:99][0][32][172.11.1.2]/17 (global)
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict['import_path'] = group['import_path']
+                continue
+
+            # 172.11.1.2 (metric 30) (via default) from 172.11.1.11 (172.11.1.11)
+            m = p6.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict['vtep_loopback'] = group['vtep_loopback']
+                version_dict['dist_loopback'] = group['dist_loopback']
+                continue
+
+            # 0.0.0.0 (via default) from 0.0.0.0 (172.11.1.22)
+            m = p6_1.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict['vtep_loopback'] = group['vtep_loopback']
+                version_dict['dist_loopback'] = group['dist_loopback']
+                continue
+
+            #      Origin incomplete, metric 0, localpref 100, valid, internal, best
+            m = p7.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict['origin'] = group['origin']
+                version_dict['metric'] = int(group['metric'])
+                version_dict['local_pref'] = int(group['local_pref'])
+                continue
+
+            #  Community: 999:999
+            m = p7_1.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict['community'] = group['community']
+                continue
+
+            #      Extended Community: RT:9999:99 ENCAP:8
+            m = p8.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict['extended_community'] = group['extended_community']
+                version_dict['encap'] = int(group['encap'])
+                continue
+
+            #      Originator: 172.11.2.1, Cluster list: 172.11.1.11
+            m = p9.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict['originator'] = group['originator']
+                version_dict['cluster_list'] = group['cluster_list']
+                continue
+
+            #      PMSI Attribute: Flags:0x0, Tunnel type:IR, length 4, vni:200199, tunnel identifier: < Tunnel Endpoint: 172.11.1.1 >
+            m = p10.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict['pmsi_flags'] = group['pmsi_flags']
+                version_dict['tunnel_type'] = group['tunnel_type']
+                version_dict['length'] = int(group['length'])
+                version_dict['vni_id'] = int(group['vni_id'])
+                version_dict['tunnel_id'] = group['tunnel_id']
+                continue
+
+            #        vrf:not found, l3-vni:0
+            m = p12.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict['vrf'] = group['vrf']
+                version_dict['l3_vni'] = int(group['l3_vni'])
+                continue
+
+            #        local router mac:0000.0000.0000
+            m = p13.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict['local_router_mac'] = group['local_router_mac']
+                continue
+
+            #        core-irb interface:(not found)
+            m = p14.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict['core_irb_intf'] = group['core_irb_intf']
+                continue
+
+            #        vtep-ip:172.11.1.22
+            m = p15.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict['vtep_ip'] = group['vtep_ip']
+                continue
+
+            #      rx pathid: 0, tx pathid: 0x0
+            m = p16.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict['rx_path_id'] = group['rx_path_id']
+                version_dict['tx_path_id'] = group['tx_path_id']
+                continue
+
+            #      Updated on Jan 22 2023 07:59:46 UTC
+            m = p17.match(line)
+            if m:
+                group = m.groupdict()
+                version_dict['date_time'] = group['date_time']
+                continue
+
+        return ret_dict
@@ -36,7 +36,7 @@ class ShowClassMapSchema(MetaParser):
 class ShowClassMap(ShowClassMapSchema):
     """Parser for show class-map"""
 
-    cli_command = ['show class-map, show class-map {class_map}']
+    cli_command = ['show class-map', 'show class-map {class_map}']
 
     def cli(self, class_map='', output=None):
         if output is None:
@@ -44,7 +44,7 @@ class ShowClassMap(ShowClassMapSchema):
                 cmd = self.cli_command[1].format(class_map=class_map)
             else:
                 cmd = self.cli_command[0]
-            out = self.device.execute(self.cli_command)
+            out = self.device.execute(cmd)
         else:
             out = output
 
@@ -268,4 +268,4 @@ class ShowClassMap(ShowClassMapSchema):
                 match_index += 1
                 continue
 
-        return class_map_dict
\ No newline at end of file
+        return class_map_dict
@@ -7,12 +7,32 @@
     * show ip interface brief
     * show ip interface brief | include Vlan
     * show interfaces switchport
+    * show interfaces {interface} switchport
     * show ip interface
     * show interfaces <interface>
     * show ipv6 interface
     * show interfaces accounting
+    * show interfaces link
+    * show interfaces {interface} link
     * show interfaces status
-    * show interface {interface} transceiver detail
+    * show interfaces {interface} status
+    * show interfaces transceiver
+    * show interfaces {interface} transceiver
+    * show interfaces transceiver detail
+    * show interfaces {interface} transceiver detail
+    * show macro auto interface
+    * show interfaces summary
+    * show interfaces {interface} summary
+    * show interfaces mtu
+    * show interfaces {interface} mtu
+    * show interfaces mtu module {mod}
+    * show interfaces status module {mod}
+    * show pm vp interface {interface} {vlan}
+    * show pm port interface {interface}
+    * show interfaces transceiver supported-list
+    * show interfaces capabilities
+    * show interfaces {interface} capabilities
+    * show interfaces {interface} vlan mapping
 """
 
 import os
@@ -38,6 +58,7 @@ except Exception:
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util import merge_dict, keynames_convert
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -60,7 +81,10 @@ class ShowInterfacesSchema(MetaParser):
                 Optional('oper_status'): str,
                 Optional('line_protocol'): str,
                 Optional('enabled'): bool,
+                Optional('is_deleted'): bool,
                 Optional('connected'): bool,
+                Optional('err_disabled'): bool,
+                Optional('suspended'): bool,
                 Optional('description'): str,
                 Optional('type'): str,
                 Optional('link_state'): str,
@@ -98,9 +122,20 @@ class ShowInterfacesSchema(MetaParser):
                 Optional('arp_timeout'): str,
                 Optional('last_input'): str,
                 Optional('last_output'): str,
-                Optional('output_hang'): str, 
+                Optional('output_hang'): str,
                 Optional('autostate'): bool,
-                Optional('queues'): {             
+                Optional('tunnel_source_ip'): str,
+                Optional('tunnel_source_interface'): str,
+                Optional('tunnel_destination_ip'): str,
+                Optional('tunnel_protocol'): str,
+                Optional('tunnel_ttl'): int,
+                Optional('tunnel_transport_mtu'): int,
+                Optional('tunnel_transmit_bandwidth'): int,
+                Optional('tunnel_receive_bandwidth'): int,
+                Optional('tunnel_protection'): str,
+                Optional('tunnel_profile'): str,
+                Optional('carrier_transitions'): int,
+                Optional('queues'): {
                     Optional('input_queue_size'): int,
                     Optional('input_queue_max'): int,
                     Optional('input_queue_drops'): int,
@@ -198,17 +233,17 @@ class ShowInterfaces(ShowInterfacesSchema):
                   show interfaces <interface>"""
 
     cli_command = ['show interfaces','show interfaces {interface}']
-    exclude = ['in_octets', 'in_pkts', 'out_octets', 'out_pkts', 
-        'in_rate', 'in_rate_pkts', 'out_rate', 'out_rate_pkts', 
-        'input_queue_size', 'in_broadcast_pkts', 'in_multicast_pkts',
-        'last_output', 'out_unknown_protocl_drops', 'last_input',
-        'input_queue_drops', 'out_interface_resets', 'rxload',
-        'txload', 'last_clear', 'in_crc_errors', 'in_errors',
-        'in_giants', 'unnumbered', 'mac_address', 'phys_address',
-        'out_lost_carrier', '(Tunnel.*)', 'input_queue_flushes',
-        'reliability']
+    exclude = ['in_octets', 'in_pkts', 'out_octets', 'out_pkts',
+               'in_rate', 'in_rate_pkts', 'out_rate', 'out_rate_pkts',
+               'input_queue_size', 'in_broadcast_pkts', 'in_multicast_pkts',
+               'last_output', 'out_unknown_protocl_drops', 'last_input',
+               'input_queue_drops', 'out_interface_resets', 'rxload',
+               'txload', 'last_clear', 'in_crc_errors', 'in_errors',
+               'in_giants', 'unnumbered', 'mac_address', 'phys_address',
+               'out_lost_carrier', '(Tunnel.*)', 'input_queue_flushes',
+               'reliability', 'out_broadcast_pkts']
 
-    def cli(self,interface="",output=None):
+    def cli(self, interface="", output=None):
         if output is None:
             if interface:
                 cmd = self.cli_command[1].format(interface=interface)
@@ -218,17 +253,20 @@ class ShowInterfaces(ShowInterfacesSchema):
         else:
             out = output
 
-        # GigabitEthernet1 is up, line protocol is up 
+        # GigabitEthernet1 is up, line protocol is up
         # Port-channel12 is up, line protocol is up (connected)
         # Vlan1 is administratively down, line protocol is down , Autostate Enabled
         # Dialer1 is up (spoofing), line protocol is up (spoofing)
-        p1 = re.compile(r'^(?P<interface>[\w\/\.\-]+) +is +(?P<enabled>[\w\s]+)(?: '
+        # FastEthernet1 is down, line protocol is down (err-disabled)
+        # GigabitEthernet1/0/2 is up, line protocol is down (suspended)
+
+        p1 = re.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is +(?P<enabled>[\w\s]+)(?: '
                         r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
                         r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$')
-        p1_1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
-                           r' +(?P<enabled>[\w\s]+),'
-                           r' +line +protocol +is +(?P<line_protocol>\w+)'
-                           r'( *, *(?P<attribute>[\w\s]+))?$')
+        p1_1 = re.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is'
+                          r' +(?P<enabled>[\w\s]+),'
+                          r' +line +protocol +is +(?P<line_protocol>\w+)'
+                          r'( *, *(?P<attribute>[\w\s]+))?$')
 
         # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
         # Hardware is Loopback
@@ -236,7 +274,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                         r'(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
                         r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$')
 
-        # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
+        # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS
         p2_2 = re.compile(r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\+ ]+)'
                           r'(?P<mac_address>.*)(?P<phys_address>.*)')
 
@@ -253,9 +291,9 @@ class ShowInterfaces(ShowInterfacesSchema):
                         r'\/(?P<prefix_length>[0-9]+))$')
 
         # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
-        # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
+        # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec,
         # MTU 1600 bytes, sub MTU 1600, BW 3584 Kbit/sec, DLY 410 usec,
-        # MTU 1500 bytes, BW 5200 Kbit/sec, RxBW 25000 Kbit/sec, DLY 100 usec, 
+        # MTU 1500 bytes, BW 5200 Kbit/sec, RxBW 25000 Kbit/sec, DLY 100 usec,
         p6 = re.compile(r'^MTU +(?P<mtu>\d+) +bytes(, +sub +MTU +'
                         r'(?P<sub_mtu>\d+))?, +BW +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?'
                         r'(, +RxBW +[0-9]+ +Kbit(\/sec)?)?, +'
@@ -275,7 +313,7 @@ class ShowInterfaces(ShowInterfacesSchema):
         # Encapsulation(s): AAL5
         p8 = re.compile(r'^Encapsulation(\(s\):)? +(?P<encapsulation>[\w\s\.]+)'
                 r'(, +(?P<rest>.*))?$')
-            
+
         # Keepalive set (10 sec)
         p10 = re.compile(r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
                         r' +sec\)$')
@@ -291,11 +329,12 @@ class ShowInterfaces(ShowInterfacesSchema):
         # auto-duplex, 10 Gb/s, media type is 10G
         # Full Duplex, 10000Mbps, link type is force-up, media type is SFP-LR
         # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
+        # Full-duplex, 10Gb/s, media type is 100/1000/2.5G/5G/10GBaseTX
         p11 = re.compile(r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex\, '
                          r'+(?P<port_speed>[\w\s\/]+|[a|A]uto-[S|s]peed|Auto '
                          r'(S|s)peed)(?:(?:\, +link +type +is '
                          r'+(?P<link_type>\S+))?(?:\, *(media +type +is| )'
-                         r'*(?P<media_type>[\w\/\- ]+)?)(?: +media +type)?)?$')
+                         r'*(?P<media_type>[\w\/\-\. ]+)?)(?: +media +type)?)?$')
 
         # input flow-control is off, output flow-control is unsupported
         p12 = re.compile(r'^(input|output) +flow-control +is +(?P<receive>\w+), +'
@@ -313,9 +352,9 @@ class ShowInterfaces(ShowInterfacesSchema):
         # Members in this channel: Gi1/0/2
         # Members in this channel: Fo1/0/2 Fo1/0/4
         p15 = re.compile(r'^Members +in +this +channel: +'
-                          '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$')   
+                          '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$')
 
-        # No. of active members in this channel: 12 
+        # No. of active members in this channel: 12
         p15_1 = re.compile(r'^No\. +of +active +members +in +this +'
                             'channel: +(?P<active_members>\d+)$')
 
@@ -395,18 +434,17 @@ class ShowInterfaces(ShowInterfacesSchema):
         # 23376 packets output, 3642296 bytes, 0 underruns
         # 13781 packets output, 2169851 bytes
         p28 = re.compile(r'^(?P<out_pkts>[0-9]+) +packets +output, +(?P<out_octets>[0-9]+) '
-                          '+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$')
+                          r'+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$')
 
-        # Received 4173 broadcasts (0 IP multicasts)
-        # Received 535996 broadcasts (535961 multicasts)
-        p29 = re.compile(r'^Received +(?P<out_broadcast_pkts>\d+) +broadcasts +'
-                          '\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$')
+        # Output 0 broadcasts (55 multicasts)
+        p29 = re.compile(r'^Output +(?P<out_broadcast_pkts>\d+) +broadcasts +'
+                          r'\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$')
 
         # 0 output errors, 0 collisions, 2 interface resets
         # 0 output errors, 0 interface resets
         p30 = re.compile(r'^(?P<out_errors>[0-9]+) +output +errors,'
-                          '( *(?P<out_collision>[0-9]+) +collisions,)? +'
-                          '(?P<out_interface_resets>[0-9]+) +interface +resets$')
+                          r'( *(?P<out_collision>[0-9]+) +collisions,)? +'
+                          r'(?P<out_interface_resets>[0-9]+) +interface +resets$')
 
         # 0 unknown protocol drops
         p31 = re.compile(r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
@@ -414,8 +452,8 @@ class ShowInterfaces(ShowInterfacesSchema):
 
         # 0 babbles, 0 late collision, 0 deferred
         p32 = re.compile(r'^(?P<out_babble>[0-9]+) +babbles, +'
-                          '(?P<out_late_collision>[0-9]+) +late +collision, +'
-                          '(?P<out_deferred>[0-9]+) +deferred$')
+                         r'(?P<out_late_collision>[0-9]+) +late +collision, +'
+                         r'(?P<out_deferred>[0-9]+) +deferred$')
 
         # 0 lost carrier, 0 no carrier, 0 pause output
         # 0 lost carrier, 0 no carrier
@@ -432,24 +470,24 @@ class ShowInterfaces(ShowInterfacesSchema):
         p35 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
                           '(?P<unnumbered_intf>[\w\/\.]+) +'
                           '\((?P<unnumbered_ip>[\w\.\:]+)\)$')
-        
+
         # 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
         p36 = re.compile(r'^(?P<maximum_active_vcs>\d+) +maximum +active +VCs, +'
                 r'(?P<vcs_per_vp>\d+) +VCs +per +VP, +(?P<current_vccs>\d+) +current +VCCs$')
-        
+
         # VC Auto Creation Disabled.
         p37 = re.compile(r'^VC +Auto +Creation +(?P<vc_auto_creation>\S+)\.$')
 
         # VC idle disconnect time: 300 seconds
         p38 = re.compile(r'^VC +idle +disconnect +time: +(?P<vc_idle_disconnect_time>\d+) +'
                 r'seconds$')
-        
+
         # AAL5 CRC errors : 0
         p39 = re.compile(r'^(?P<key>\S+ +CRC +errors) +: +(?P<val>\d+)$')
-        
+
         # AAL5 SAR Timeouts : 0
         p40 = re.compile(r'^(?P<key>\S+ +SAR +Timeouts) +: +(?P<val>\d+)$')
-        
+
         # AAL5 Oversized SDUs : 0
         p41 = re.compile(r'^(?P<key>\S+ +Oversized +SDUs) +: +(?P<val>\d+)$')
 
@@ -468,24 +506,58 @@ class ShowInterfaces(ShowInterfacesSchema):
         p45 = re.compile(r'^DTR +is +pulsed +for +(?P<dtr_pulsed>\d+) +'
                 r'seconds +on +reset$')
 
+        # Tunnel source 1.1.10.11
+        # Tunnel source 1.1.1.1 (Loopback1)
+        # Tunnel source 1.1.10.11, destination 1.1.10.10
+        # Tunnel source 172.16.121.201 (GigabitEthernet0/0/1.91), destination 172.16.64.36
+        # Tunnel source UNKNOWN, destination 1.2.3.4
+        #
+        p46 = re.compile(r'^Tunnel +source +(?P<tunnel_source_ip>([a-fA-F\d\:UNKNOWN|0-9\.]+)?),?\s?'
+                        r'(?P<tunnel_source_interface>\([\w\d.\/]+\))?,?\s?'
+                        r'(destination +)?(?P<tunnel_destination_ip>([a-fA-F\d\:0-9\.]+)?)')
+
+        # Tunnel protocol/transport AURP
+        p47 = re.compile(r'^Tunnel +protocol/transport +(?P<tunnel_protocol>[\w\/]+)')
+
+        # Tunnel TTL 255
+        p48 = re.compile(r'^Tunnel +TTL +(?P<tunnel_ttl>\d+)')
+
+        # Tunnel transport MTU 1480 bytes
+        p49 = re.compile(r'^Tunnel +transport +MTU +(?P<tunnel_transport_mtu>\d+)')
+
+        # Tunnel transmit bandwidth 10000000 (kbps)
+        p50 = re.compile(r'^Tunnel +transmit +bandwidth +(?P<tunnel_transmit_bandwidth>\d+)')
+
+        # Tunnel receive bandwidth 10000000 (kbps)
+        p51 = re.compile(r'^Tunnel +receive +bandwidth +(?P<tunnel_receive_bandwidth>\d+)')
+
+        # Tunnel Protection profile
+        p52 = re.compile(r'^Tunnel +protection +via +(?P<tunnel_protection>[\w]+) +\(profile \"(?P<tunnel_profile>[\w]+)\"\)')
+
+        # 3 carrier transitions
+        p53 = re.compile(r'^(?P<carrier_transitions>\d+)\s+carrier transitions$')
+
         interface_dict = {}
         unnumbered_dict = {}
         for line in out.splitlines():
             line = line.strip()
-            # GigabitEthernet1 is up, line protocol is up 
+
+            # GigabitEthernet1 is up, line protocol is up
             # Port-channel12 is up, line protocol is up (connected)
             # Vlan1 is administratively down, line protocol is down , Autostate Enabled
             # Dialer1 is up (spoofing), line protocol is up (spoofing)
+            # FastEthernet1 is down, line protocol is down (err-disabled)
+            # GigabitEthernet1/0/2 is up, line protocol is down (suspended)
 
             m = p1.match(line)
             m1 = p1_1.match(line)
             m = m if m else m1
             if m:
                 interface = m.groupdict()['interface']
+                interface = Common.convert_intf_name(interface)
                 enabled = m.groupdict()['enabled']
                 line_protocol = m.groupdict()['line_protocol']
-                connected = m.groupdict()['attribute']
-                
+                line_attribute = m.groupdict()['attribute']
                 if m.groupdict()['autostate']:
                     autostate = m.groupdict()['autostate'].lower()
                 else:
@@ -497,6 +569,11 @@ class ShowInterfaces(ShowInterfacesSchema):
                     interface_dict[interface]['port_channel']\
                         ['port_channel_member'] = False
 
+                if 'deleted' in enabled:
+                    interface_dict[interface]['is_deleted'] = True
+                else:
+                    interface_dict[interface]['is_deleted'] = False
+
                 if 'administratively down' in enabled or 'delete' in enabled:
                     interface_dict[interface]['enabled'] = False
                 else:
@@ -508,8 +585,10 @@ class ShowInterfaces(ShowInterfacesSchema):
                     interface_dict[interface]\
                                 ['oper_status'] = line_protocol
 
-                if connected:
-                    interface_dict[interface]['connected'] = True if connected == 'connected' else False
+                if line_attribute:
+                    interface_dict[interface]['connected'] = True if line_attribute == 'connected' else False
+                    interface_dict[interface]['err_disabled'] = True if line_attribute == 'err-disabled' else False
+                    interface_dict[interface]['suspended'] = True if line_attribute == 'suspended' else False
 
                 if autostate:
                     interface_dict[interface]['autostate'] = True if autostate == 'enabled' else False
@@ -520,7 +599,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Hardware is Loopback
             m = p2.match(line)
 
-            # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
+            # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS
             m1 = p2_2.match(line)
             m = m if m else m1
             if m:
@@ -579,9 +658,9 @@ class ShowInterfaces(ShowInterfacesSchema):
                 interface_dict[interface]['ipv4'][address]\
                 ['prefix_length'] = prefix_length
                 continue
-            
+
             # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
-            # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
+            # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec,
             m = p6.match(line)
             if m:
                 mtu = m.groupdict()['mtu']
@@ -730,6 +809,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 group = m.groupdict()
                 sub_dict = interface_dict.setdefault(interface, {})
                 sub_dict['carrier_delay'] = int(group['carrier_delay'])
+                continue
 
             # Asymmetric Carrier-Delay Up Timer is 2 sec
             # Asymmetric Carrier-Delay Down Timer is 10 sec
@@ -744,6 +824,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                     sub_dict['carrier_delay_up'] = int(group['carrier_delay'])
                 else:
                     sub_dict['carrier_delay_down'] = int(group['carrier_delay'])
+                continue
 
             # ARP type: ARPA, ARP Timeout 04:00:00
             m = p13.match(line)
@@ -786,7 +867,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                     interface_dict[intf]['port_channel']['port_channel_int'] = interface
                 continue
 
-            # No. of active members in this channel: 12 
+            # No. of active members in this channel: 12
             m = p15_1.match(line)
             if m:
                 group = m.groupdict()
@@ -808,7 +889,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
                 interface_dict[interface]['port_channel']\
                     ['port_channel_member_intfs'].append(intf)
-                    
+
                 continue
 
             # No. of PF_JUMBO supported members in this channel : 0
@@ -822,7 +903,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Last clearing of "show interface" counters 1d02h
             m = p16.match(line)
-            if m:                
+            if m:
                 last_clear = m.groupdict()['last_clear']
                 continue
 
@@ -887,14 +968,14 @@ class ShowInterfaces(ShowInterfacesSchema):
 
                 if 'rate' not in interface_dict[interface]['counters']:
                     interface_dict[interface]['counters']['rate'] = {}
-                
+
                 interface_dict[interface]['counters']['rate']\
                     ['load_interval'] = load_interval
                 interface_dict[interface]['counters']['rate']\
                     ['in_rate'] = in_rate
                 interface_dict[interface]['counters']['rate']\
-                    ['in_rate_pkts'] = in_rate_pkts                    
-                    
+                    ['in_rate_pkts'] = in_rate_pkts
+
                 if 'last_clear' not in interface_dict[interface]['counters']:
                     try:
                         last_clear
@@ -908,6 +989,10 @@ class ShowInterfaces(ShowInterfacesSchema):
             # 5 minute output rate 0 bits/sec, 0 packets/sec
             m = p21.match(line)
             if m:
+                if 'counters' not in interface_dict[interface]:
+                    interface_dict[interface]['counters'] = {}
+                    interface_dict[interface]['counters']['rate'] = {}
+
                 out_rate = int(m.groupdict()['out_rate'])
                 out_rate_pkts = int(m.groupdict()['out_rate_pkts'])
 
@@ -937,9 +1022,9 @@ class ShowInterfaces(ShowInterfacesSchema):
             m = p23.match(line)
             if m:
                 interface_dict[interface]['counters']['in_multicast_pkts'] = \
-                    int(m.groupdict()['in_broadcast_pkts'])
-                interface_dict[interface]['counters']['in_broadcast_pkts'] = \
                     int(m.groupdict()['in_multicast_pkts'])
+                interface_dict[interface]['counters']['in_broadcast_pkts'] = \
+                    int(m.groupdict()['in_broadcast_pkts'])
                 continue
 
             # 0 runts, 0 giants, 0 throttles
@@ -1002,8 +1087,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                         int(m.groupdict()['out_underruns'])
                 continue
 
-            # Received 4173 broadcasts (0 IP multicasts)
-            # Received 535996 broadcasts (535961 multicasts)
+            # Output 0 broadcasts (55 multicasts)
             m = p29.match(line)
             if m:
                 interface_dict[interface]['counters']['out_broadcast_pkts'] = \
@@ -1085,7 +1169,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 interface_dict[interface].update({'vcs_per_vp': vcs_per_vp})
                 interface_dict[interface].update({'current_vccs': current_vccs})
                 continue
-            
+
             # VC Auto Creation Disabled.
             m = p37.match(line)
             if m:
@@ -1108,7 +1192,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_crc_errors': int(group['val'])})
                 continue
-            
+
             # AAL5 SAR Timeouts : 0
             m = p40.match(line)
             if m:
@@ -1155,6 +1239,72 @@ class ShowInterfaces(ShowInterfacesSchema):
                 interface_dict[interface].update({'dtr_pulsed': group['dtr_pulsed']})
                 continue
 
+            # Tunnel source 1.1.10.11
+            # Tunnel source 1.1.1.1 (Loopback1)
+            # Tunnel source 1.1.10.11, destination 1.1.10.10
+            # Tunnel source 172.16.121.201 (GigabitEthernet0/0/1.91), destination 172.16.64.36
+            # Tunnel source UNKNOWN, destination 1.2.3.4
+            m = p46.match(line)
+            if m:
+                group = m.groupdict()
+                interface_dict[interface].update({'tunnel_source_ip': group['tunnel_source_ip']})
+                if group['tunnel_source_interface']:
+                    interface_dict[interface].update({'tunnel_source_interface': (group['tunnel_source_interface']).strip('()')})
+                if group['tunnel_destination_ip']:
+                    interface_dict[interface].update({'tunnel_destination_ip': group['tunnel_destination_ip']})
+                continue
+
+            # Tunnel protocol/transport AURP
+            m = p47.match(line)
+            if m:
+                group = m.groupdict()
+                interface_dict[interface].update({'tunnel_protocol': group['tunnel_protocol']})
+                continue
+
+            # Tunnel TTL 255
+            m = p48.match(line)
+            if m:
+                group = m.groupdict()
+                interface_dict[interface].update({'tunnel_ttl': int(group['tunnel_ttl'])})
+                continue
+
+            # Tunnel transport MTU 1480 bytes
+            m = p49.match(line)
+            if m:
+                group = m.groupdict()
+                interface_dict[interface].update({'tunnel_transport_mtu': int(group['tunnel_transport_mtu'])})
+                continue
+
+            # Tunnel transmit bandwidth 10000000 (kbps)
+            m = p50.match(line)
+            if m:
+                group = m.groupdict()
+                interface_dict[interface].update({'tunnel_transmit_bandwidth': int(group['tunnel_transmit_bandwidth'])})
+                continue
+
+            # Tunnel receive bandwidth 10000000 (kbps)
+            m = p51.match(line)
+            if m:
+                group = m.groupdict()
+                interface_dict[interface].update({'tunnel_receive_bandwidth': int(group['tunnel_receive_bandwidth'])})
+                continue
+
+            m = p52.match(line)
+            if m:
+                group = m.groupdict()
+                if group['tunnel_protection']:
+                    interface_dict[interface].update({'tunnel_protection': group['tunnel_protection']})
+                if group['tunnel_profile']:
+                    interface_dict[interface].update({'tunnel_profile': group['tunnel_profile']})
+                continue
+
+            # 3 carrier transitions
+            m = p53.match(line)
+            if m:
+                group = m.groupdict()
+                interface_dict[interface]['carrier_transitions'] = int(group['carrier_transitions'])
+                continue
+
         # create strucutre for unnumbered interface
         if not unnumbered_dict:
             return(interface_dict)
@@ -1298,7 +1448,7 @@ class ShowIpInterfaceBriefPipeVlan(ShowIpInterfaceBrief):
     # parsing mechanisms (cli(), yang(), xml()).
 
     cli_command = "show ip interface brief | include Vlan"
-    
+
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -1444,56 +1594,64 @@ class ShowIpInterfaceBriefPipeIp(ShowIpInterfaceBriefPipeIpSchema):
 
 
 class ShowInterfacesSwitchportSchema(MetaParser):
-    """Schema for show interfaces switchport"""
+    """Schema for:
+        * show interfaces switchport
+        * show interfaces {interface} switchport
+    """
     schema = {
-                Any(): {
-                    'switchport_enable': bool,
-                    'switchport_mode': str,
-                    Optional('operational_mode'): str,
-                    Optional('port_channel'): {
-                        Optional('port_channel_int'): str,
-                        Optional('port_channel_member_intfs'): list,
-                        Optional('port_channel_member'): bool,
-                    },
-                    Optional('encapsulation'): {
-                        Optional('administrative_encapsulation'): str,
-                        Optional('operational_encapsulation'): str,
-                        Optional('native_vlan'): str,
-                        Optional('native_vlan_name'): str,
-                    },
-                    Optional('negotiation_of_trunk'): bool,
-                    Optional('access_vlan'): str,
-                    Optional('access_vlan_name'): str,
-                    Optional('voice_vlan'): str,
-                    Optional('voice_vlan_name'): str,
+            Any(): {
+                'switchport_enable': bool,
+                Optional('switchport_mode'): str,
+                Optional('operational_mode'): str,
+                Optional('port_channel'): {
+                    Optional('port_channel_int'): str,
+                    Optional('port_channel_member_intfs'): list,
+                    Optional('port_channel_member'): bool,
+                },
+                Optional('encapsulation'): {
+                    Optional('administrative_encapsulation'): str,
+                    Optional('operational_encapsulation'): str,
+                    Optional('native_vlan'): str,
+                    Optional('native_vlan_name'): str,
+                },
+                Optional('negotiation_of_trunk'): bool,
+                Optional('access_vlan'): str,
+                Optional('access_vlan_name'): str,
+                Optional('voice_vlan'): str,
+                Optional('voice_vlan_name'): str,
+                Optional('native_vlan_tagging'): bool,
+                Optional('private_vlan'): {
+                    Optional('host_association'): str,
+                    Optional('mapping'): str,
+                    Optional('native_vlan'): str,
                     Optional('native_vlan_tagging'): bool,
-                    Optional('private_vlan'): {
-                        Optional('host_association'): str,
-                        Optional('mapping'): str,
-                        Optional('native_vlan'): str,
-                        Optional('native_vlan_tagging'): bool,
-                        Optional('encapsulation'): str,
-                        Optional('normal_vlans'): str,
-                        Optional('associations'): str,
-                        Optional('trunk_mappings'): str,
-                        Optional('operational'): str,
-                    },
-                    Optional('trunk_vlans'): str,
-                    Optional('pruning_vlans'): str,
-                    Optional('capture_mode'): bool,
-                    Optional('capture_vlans'): str,
-                    Optional('protected'): bool,
-                    Optional('unknown_unicast_blocked'): bool,
-                    Optional('unknown_multicast_blocked'): bool,
-                    Optional('appliance_trust'): str,
+                    Optional('encapsulation'): str,
+                    Optional('normal_vlans'): str,
+                    Optional('associations'): str,
+                    Optional('trunk_mappings'): str,
+                    Optional('operational'): str,
                 },
-            }
+                Optional('trunk_vlans'): str,
+                Optional('pruning_vlans'): str,
+                Optional('capture_mode'): bool,
+                Optional('capture_vlans'): str,
+                Optional('protected'): bool,
+                Optional('unknown_unicast_blocked'): bool,
+                Optional('unknown_multicast_blocked'): bool,
+                Optional('appliance_trust'): str,
+                Optional('admin_ethertype'): str,
+                Optional('oper_ethertype'): str, 
+            },
+        }
 
 
 class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
-    """parser for show interfaces switchport"""
+    """
+    parser for show interfaces switchport
+
+    """
 
-    cli_command = ['show interfaces switchport','show interfaces {interface} switchport']
+    cli_command = ['show interfaces switchport', 'show interfaces {interface} switchport']
 
     def cli(self, interface='', output=None):
         if output is None:
@@ -1505,6 +1663,122 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
         else:
             out = output
 
+        # Name: Gi1/0/2
+        p1 = re.compile(r'^Name: +(?P<intf>[\w\/\.\-]+)$')
+
+        # Switchport: Enabled
+        p2 = re.compile(r'^Switchport: +(?P<switchport_enable>\w+)$')
+
+        # Administrative Mode: trunk
+        p3 = re.compile(r'^Administrative +Mode: +(?P<switchport_mode>[\w\s]+)$')
+
+        # Operational Mode: trunk (member of bundle Po12)
+        # Operational Mode: down (suspended member of bundle Po12)
+        p4 = re.compile(r'^Operational +Mode: +(?P<operational_mode>[\w\s]+)'
+                        r'( +\((?P<dummy>[\w\s]+)? *member +of +bundle '
+                        r'+(?P<port_channel_int>[\w\/\.\-]+)\))?$')
+
+        # Administrative Trunking Encapsulation: dot1q
+        p5 = re.compile(r'^Administrative +Trunking +Encapsulation: +'
+                        r'(?P<encapsulation>\w+)$')
+
+        # Operational Trunking Encapsulation: dot1q
+        p6 = re.compile(r'^Operational +Trunking +Encapsulation: +'
+                        r'(?P<encapsulation>\w+)$')
+
+        # Negotiation of Trunking: On
+        p7 = re.compile(r'^Negotiation +of +Trunking: +(?P<negotiation_of_trunk>\w+)$')
+
+        # Access Mode VLAN: 1 (default)
+        # Access Mode VLAN: 100 (Falback-Data)
+        p8 = re.compile(r'^Access +Mode +VLAN: +(?P<access_vlan>[\d\-]+)'
+                        r'( *\((?P<access_vlan_name>.+)\))?$')
+
+        # Trunking Native Mode VLAN: 1 (default)
+        p9 = re.compile(r'^Trunking +Native +Mode +VLAN: +(?P<native_vlan>[\d\-]+)'
+                        r'( *\((?P<native_vlan_name>.+)\))?$')
+
+        # Administrative Native VLAN tagging: enabled
+        p10 = re.compile(r'^Administrative +Native +VLAN +tagging: +'
+                         r'(?P<tagging>\w+)$')
+
+        # Voice VLAN: none
+        # Voice VLAN: 100 (Fallback-Voice)
+        p11 = re.compile(r'^Voice +VLAN: +(?P<vlan>[\d\-]+)'
+                         r'( *\((?P<voice_vlan_name>.+)\))?$')
+
+        # Administrative private-vlan host-association: none
+        p12 = re.compile(r'^Administrative +private-vlan +'
+                         r'host-association: +(?P<ret>[\w\-]+)$')
+
+        # Administrative private-vlan mapping: none
+        p13 = re.compile(r'^Administrative +private-vlan +'
+                         r'mapping: +(?P<ret>[\w\-]+)$')
+
+        # Administrative private-vlan trunk native VLAN: none
+        p14 = re.compile(r'^Administrative +private-vlan +'
+                         r'trunk +native +VLAN: +(?P<ret>[\w\-]+)$')
+
+        # Administrative private-vlan trunk Native VLAN tagging: enabled
+        p15 = re.compile(r'^Administrative +private-vlan +'
+                         r'trunk +Native +VLAN +tagging: +(?P<ret>[\w\-]+)$')
+
+        # Administrative private-vlan trunk encapsulation: dot1q
+        p16 = re.compile(r'^Administrative +private-vlan +'
+                         r'trunk +encapsulation: +(?P<ret>[\w\-]+)$')
+
+        # Administrative private-vlan trunk normal VLANs: none
+        p17 = re.compile(r'^Administrative +private-vlan +'
+                         r'trunk +normal +VLANs: +(?P<ret>[\w\-]+)$')
+
+        # Administrative private-vlan trunk associations: none
+        p18 = re.compile(r'^Administrative +private-vlan +'
+                         r'trunk +associations: +(?P<ret>[\w\-]+)$')
+
+        # Administrative private-vlan trunk mappings: none
+        # Administrative private-vlan trunk mappings:
+        p19 = re.compile(r'^Administrative +private-vlan +'
+                         r'trunk +mappings:( *(?P<ret>[\w\-]+))?$')
+
+        # Operational private-vlan: none
+        # Operational private-vlan:
+        p20 = re.compile(r'^Operational +private-vlan:'
+                         r'( *(?P<private_operational>[\w\-]+))?$')
+
+        # Trunking VLANs Enabled: 200-211
+        # Trunking VLANs Enabled: 100,101,110-120,121,130,170,180,
+        p21 = re.compile(r'^Trunking +VLANs +Enabled: +(?P<trunk_vlans>[\w\-\,\s]+)$')
+
+        # 1111,2222,3333, 500-55,
+        p21_1 = re.compile(r'^(?P<trunk_vlans>[\d\,\-]+)$')
+
+        # Pruning VLANs Enabled: 2-1001
+        p22 = re.compile(r'^Pruning +VLANs +Enabled: +(?P<pruning_vlans>[\w\-]+)$')
+
+        # Capture Mode Disabled
+        p23 = re.compile(r'^Capture +Mode +(?P<mode>\w+)$')
+
+        # Capture VLANs Allowed: ALL
+        p24 = re.compile(r'^Capture +VLANs +Allowed: +(?P<capture_vlans>[\w\-]+)$')
+
+        # Protected: false
+        p25 = re.compile(r'^Protected: +(?P<protected>\w+)$')
+
+        # Unknown unicast blocked: disabled
+        p26 = re.compile(r'^Unknown +unicast +blocked: +(?P<block>\w+)$')
+
+        # Unknown multicast blocked: disabled
+        p27 = re.compile(r'^Unknown +multicast +blocked: +(?P<block>\w+)$')
+
+        # Appliance trust: none
+        p28 = re.compile(r'^Appliance +trust: +(?P<trust>[\w\-]+)$')
+
+        #Administrative Dot1q Ethertype: 0x9100
+        p29 = re.compile(r'^Administrative +Dot1q +Ethertype: +(?P<admin_ethertype>\w+)$')
+
+        #Operational Dot1q Ethertype: 0x9100
+        p30 = re.compile(r'^Operational +Dot1q +Ethertype: +(?P<oper_ethertype>\w+)$')        
+
         ret_dict = {}
         private_trunk_mappings = None
         private_operational = None
@@ -1512,7 +1786,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
             line = line.strip()
 
             # Name: Gi1/0/2
-            p1 = re.compile(r'^Name: +(?P<intf>[\w\/\.\-]+)$')
             m = p1.match(line)
             if m:
                 intf = Common.convert_intf_name(m.groupdict()['intf'])
@@ -1521,7 +1794,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Switchport: Enabled
-            p2 = re.compile(r'^Switchport: +(?P<switchport_enable>\w+)$')
             m = p2.match(line)
             if m:
                 if m.groupdict()['switchport_enable'].lower() == 'enabled':
@@ -1532,7 +1804,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Administrative Mode: trunk
-            p3 = re.compile(r'^Administrative +Mode: +(?P<switchport_mode>[\w\s]+)$')
             m = p3.match(line)
             if m:
                 ret_dict[intf]['switchport_mode'] = m.groupdict()['switchport_mode']
@@ -1540,42 +1811,50 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
             # Operational Mode: trunk (member of bundle Po12)
             # Operational Mode: down (suspended member of bundle Po12)
-            p4 = re.compile(r'^Operational +Mode: +(?P<operational_mode>[\w\s]+)'
-                            r'( +\((?P<dummy>[\w\s]+)? *member +of +bundle '
-                            r'+(?P<port_channel_int>[\w\/\.\-]+)\))?$')
             m = p4.match(line)
             if m:
-                ret_dict[intf]['operational_mode'] = m.groupdict()['operational_mode']
-
-                bundle_intf = m.groupdict()['port_channel_int']
-                if bundle_intf:
-                    if 'port_channel' not in ret_dict[intf]:
-                        ret_dict[intf]['port_channel'] = {}
-                    bundle_intf = Common.convert_intf_name(bundle_intf)
-
-                    ret_dict[intf]['port_channel']['port_channel_int'] = bundle_intf
-                    ret_dict[intf]['port_channel']['port_channel_member'] = True
+                if interface:
+                    ret_dict[intf]['operational_mode'] = m.groupdict()['operational_mode']
 
-                    # bundle interface is port_channel interface as well
-                    if bundle_intf not in ret_dict:
-                        ret_dict[bundle_intf] = {}
-                    if 'port_channel' not in ret_dict[bundle_intf]:
-                        ret_dict[bundle_intf]['port_channel'] = {}
+                    bundle_intf = m.groupdict()['port_channel_int']
+                    if bundle_intf:
+                        port_channel_dict = ret_dict[intf].setdefault('port_channel', {})
+                        bundle_intf = Common.convert_intf_name(bundle_intf)
 
-                    ret_dict[bundle_intf]['port_channel']['port_channel_member'] = True
-
-                    # append the list
-                    if 'port_channel_member_intfs' in ret_dict[bundle_intf]['port_channel']:
-                        port_list = ret_dict[bundle_intf]['port_channel']['port_channel_member_intfs']
-                        port_list.append(intf)
-                        ret_dict[bundle_intf]['port_channel']['port_channel_member_intfs'] = port_list
-                    else:
-                        ret_dict[bundle_intf]['port_channel']['port_channel_member_intfs'] = [intf]
+                        port_channel_dict.update({
+                            'port_channel_int': bundle_intf,
+                            'port_channel_member': True
+                        })
+                else:
+                    ret_dict[intf]['operational_mode'] = m.groupdict()['operational_mode']
+
+                    bundle_intf = m.groupdict()['port_channel_int']
+                    if bundle_intf:
+                        if 'port_channel' not in ret_dict[intf]:
+                            ret_dict[intf]['port_channel'] = {}
+                        bundle_intf = Common.convert_intf_name(bundle_intf)
+
+                        ret_dict[intf]['port_channel']['port_channel_int'] = bundle_intf
+                        ret_dict[intf]['port_channel']['port_channel_member'] = True
+
+                        # bundle interface is port_channel interface as well
+                        if bundle_intf not in ret_dict:
+                            ret_dict[bundle_intf] = {}
+                        if 'port_channel' not in ret_dict[bundle_intf]:
+                            ret_dict[bundle_intf]['port_channel'] = {}
+
+                        ret_dict[bundle_intf]['port_channel']['port_channel_member'] = True
+
+                        # append the list
+                        if 'port_channel_member_intfs' in ret_dict[bundle_intf]['port_channel']:
+                            port_list = ret_dict[bundle_intf]['port_channel']['port_channel_member_intfs']
+                            port_list.append(intf)
+                            ret_dict[bundle_intf]['port_channel']['port_channel_member_intfs'] = port_list
+                        else:
+                            ret_dict[bundle_intf]['port_channel']['port_channel_member_intfs'] = [intf]
                 continue
 
             # Administrative Trunking Encapsulation: dot1q
-            p5 =  re.compile(r'^Administrative +Trunking +Encapsulation: +'
-                              '(?P<encapsulation>\w+)$')
             m = p5.match(line)
             if m:
                 if 'encapsulation' not in ret_dict[intf]:
@@ -1585,8 +1864,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Operational Trunking Encapsulation: dot1q
-            p6 = re.compile(r'^Operational +Trunking +Encapsulation: +'
-                              '(?P<encapsulation>\w+)$')
             m = p6.match(line)
             if m:
                 if 'encapsulation' not in ret_dict[intf]:
@@ -1596,20 +1873,17 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Negotiation of Trunking: On
-            p7 = re.compile(r'^Negotiation +of +Trunking: +(?P<negotiation_of_trunk>\w+)$')
             m = p7.match(line)
             if m:
                 negotiation_of_trunk = m.groupdict()['negotiation_of_trunk'].lower()
                 if 'on' in negotiation_of_trunk:
                     ret_dict[intf]['negotiation_of_trunk'] = True
                 elif 'off' in negotiation_of_trunk:
-                    ret_dict[intf]['negotiation_of_trunk'] = False                    
+                    ret_dict[intf]['negotiation_of_trunk'] = False
                 continue
 
             # Access Mode VLAN: 1 (default)
             # Access Mode VLAN: 100 (Falback-Data)
-            p8 =  re.compile(r'^Access +Mode +VLAN: +(?P<access_vlan>[\d\-]+)'
-                              '( *\((?P<access_vlan_name>.+)\))?$')
             m = p8.match(line)
             if m:
                 ret_dict[intf]['access_vlan'] = m.groupdict()['access_vlan']
@@ -1618,8 +1892,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Trunking Native Mode VLAN: 1 (default)
-            p9 = re.compile(r'^Trunking +Native +Mode +VLAN: +(?P<native_vlan>[\d\-]+)'
-                              '( *\((?P<native_vlan_name>.+)\))?$')
             m = p9.match(line)
             if m:
                 if 'encapsulation' not in ret_dict[intf]:
@@ -1630,8 +1902,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Administrative Native VLAN tagging: enabled
-            p10 = re.compile(r'^Administrative +Native +VLAN +tagging: +'
-                               '(?P<tagging>\w+)$')
             m = p10.match(line)
             if m:
                 if 'enable' in m.groupdict()['tagging'].lower():
@@ -1642,8 +1912,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
             # Voice VLAN: none
             # Voice VLAN: 100 (Fallback-Voice)
-            p11 =  re.compile(r'^Voice +VLAN: +(?P<vlan>[\d\-]+)'
-                              '( *\((?P<voice_vlan_name>.+)\))?$')
             m = p11.match(line)
             if m:
                 ret_dict[intf]['voice_vlan'] = m.groupdict()['vlan']
@@ -1651,9 +1919,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['voice_vlan_name'] = m.groupdict()['voice_vlan_name']
                 continue
 
-            # Administrative private-vlan host-association: none 
-            p12 =  re.compile(r'^Administrative +private-vlan +'
-                               'host-association: +(?P<ret>[\w\-]+)$')
+            # Administrative private-vlan host-association: none
             m = p12.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1663,9 +1929,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['private_vlan']['host_association'] = m.groupdict()['ret']
                 continue
 
-            # Administrative private-vlan mapping: none 
-            p13 =  re.compile(r'^Administrative +private-vlan +'
-                               'mapping: +(?P<ret>[\w\-]+)$')
+            # Administrative private-vlan mapping: none
             m = p13.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1676,8 +1940,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Administrative private-vlan trunk native VLAN: none
-            p14 =  re.compile(r'^Administrative +private-vlan +'
-                               'trunk +native +VLAN: +(?P<ret>[\w\-]+)$')
             m = p14.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1688,8 +1950,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Administrative private-vlan trunk Native VLAN tagging: enabled
-            p15 =  re.compile(r'^Administrative +private-vlan +'
-                               'trunk +Native +VLAN +tagging: +(?P<ret>[\w\-]+)$')
             m = p15.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1698,12 +1958,10 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 if 'enable' in ret:
                     ret_dict[intf]['private_vlan']['native_vlan_tagging'] = True
                 else:
-                    ret_dict[intf]['private_vlan']['native_vlan_tagging'] = False                    
+                    ret_dict[intf]['private_vlan']['native_vlan_tagging'] = False
                 continue
 
             # Administrative private-vlan trunk encapsulation: dot1q
-            p16 = re.compile(r'^Administrative +private-vlan +'
-                               'trunk +encapsulation: +(?P<ret>[\w\-]+)$')
             m = p16.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1714,8 +1972,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Administrative private-vlan trunk normal VLANs: none
-            p17 = re.compile(r'^Administrative +private-vlan +'
-                               'trunk +normal +VLANs: +(?P<ret>[\w\-]+)$')
             m = p17.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1726,8 +1982,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Administrative private-vlan trunk associations: none
-            p18 = re.compile(r'^Administrative +private-vlan +'
-                               'trunk +associations: +(?P<ret>[\w\-]+)$')
             m = p18.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1739,8 +1993,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
             # Administrative private-vlan trunk mappings: none
             # Administrative private-vlan trunk mappings:
-            p19 = re.compile(r'^Administrative +private-vlan +'
-                               'trunk +mappings:( *(?P<ret>[\w\-]+))?$')
             m = p19.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1765,8 +2017,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
             # Operational private-vlan: none
             # Operational private-vlan:
-            p20 = re.compile(r'^Operational +private-vlan:'
-                               '( *(?P<private_operational>[\w\-]+))?$')
             m = p20.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1779,10 +2029,10 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
             # Trunking VLANs Enabled: 200-211
             # Trunking VLANs Enabled: 100,101,110-120,121,130,170,180,
-            p21 = re.compile(r'^Trunking +VLANs +Enabled: +(?P<trunk_vlans>[\w\-\,\s]+)$')
             m = p21.match(line)
             if m:
                 ret_dict[intf]['trunk_vlans'] = m.groupdict()['trunk_vlans'].lower()
+                private_operational = None
                 continue
 
             # 10 (VLAN0010) 100 (VLAN0100)
@@ -1798,21 +2048,18 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # 1111,2222,3333, 500-55,
-            p21_1 = re.compile(r'^(?P<trunk_vlans>[\d\,\-]+)$')
             m = p21_1.match(line)
             if m:
                 ret_dict[intf]['trunk_vlans'] += m.groupdict()['trunk_vlans'].lower()
                 continue
 
             # Pruning VLANs Enabled: 2-1001
-            p22 =  re.compile(r'^Pruning +VLANs +Enabled: +(?P<pruning_vlans>[\w\-]+)$')
             m = p22.match(line)
             if m:
                 ret_dict[intf]['pruning_vlans'] = m.groupdict()['pruning_vlans'].lower()
                 continue
 
             # Capture Mode Disabled
-            p23 =  re.compile(r'^Capture +Mode +(?P<mode>\w+)$')
             m = p23.match(line)
             if m:
                 mode = m.groupdict()['mode'].lower()
@@ -1823,14 +2070,12 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Capture VLANs Allowed: ALL
-            p24 =  re.compile(r'^Capture +VLANs +Allowed: +(?P<capture_vlans>[\w\-]+)$')
             m = p24.match(line)
             if m:
                 ret_dict[intf]['capture_vlans'] = m.groupdict()['capture_vlans'].lower()
                 continue
 
             # Protected: false
-            p25 =  re.compile(r'^Protected: +(?P<protected>\w+)$')
             m = p25.match(line)
             if m:
                 if 'false' in m.groupdict()['protected'].lower():
@@ -1840,7 +2085,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Unknown unicast blocked: disabled
-            p26 = re.compile(r'^Unknown +unicast +blocked: +(?P<block>\w+)$')
             m = p26.match(line)
             if m:
                 if 'disabled' in m.groupdict()['block'].lower():
@@ -1850,7 +2094,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Unknown multicast blocked: disabled
-            p27 = re.compile(r'^Unknown +multicast +blocked: +(?P<block>\w+)$')
             m = p27.match(line)
             if m:
                 if 'disabled' in m.groupdict()['block'].lower():
@@ -1860,13 +2103,24 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Appliance trust: none
-            p28 = re.compile(r'^Appliance +trust: +(?P<trust>[\w\-]+)$')
             m = p28.match(line)
             if m:
-                if  m.groupdict()['trust'] != 'none':
+                if m.groupdict()['trust'] != 'none':
                     ret_dict[intf]['appliance_trust'] = m.groupdict()['trust']
                 continue
 
+            # Administrative Dot1q Ethertype: 0x9100    
+            m = p29.match(line)
+            if m:
+                admin_ethertype = m.groupdict()['admin_ethertype']
+                ret_dict[intf]['admin_ethertype'] = admin_ethertype
+
+            # Operational Dot1q Ethertype: 0x9100
+            m = p30.match(line)
+            if m:
+                oper_ethertype = m.groupdict()['oper_ethertype']
+                ret_dict[intf]['oper_ethertype'] = oper_ethertype
+
         return ret_dict
 
 
@@ -1918,7 +2172,7 @@ class ShowIpInterfaceSchema(MetaParser):
                             Any(): {
                                 'status': str,
                             }
-                        },                       
+                        },
                     },
                     Optional('ip_multicast_fast_switching'): bool,
                     Optional('ip_multicast_distributed_fast_switching'): bool,
@@ -1955,6 +2209,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
         else:
             out = output
 
+        read_multicast_reserved_lines = False
+        multicast_groups = []
         interface_dict = {}
         unnumbered_dict = {}
         for line in out.splitlines():
@@ -1962,7 +2218,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
 
             # Vlan211 is up, line protocol is up
             # GigabitEthernet2 is administratively down, line protocol is down
-            p1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
+            p1 =  re.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is'
                             r' +(?P<enabled>[\w\s]+),'
                             r' +line +protocol +is +(?P<oper_status>\w+)$')
             m = p1.match(line)
@@ -1978,8 +2234,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 interface_dict[interface]['oper_status'] = \
                     m.groupdict()['oper_status'].lower()
 
-                # initial variables
-                multicast_groups = []
                 continue
 
             # Internet address is 192.168.76.1/24
@@ -2064,8 +2318,10 @@ class ShowIpInterface(ShowIpInterfaceSchema):
             p3 = re.compile(r'^Broadcast +address +is +(?P<address>[\w\.\:]+)$')
             m = p3.match(line)
             if m:
-                interface_dict[interface]['ipv4'][address]['broadcast_address'] = \
-                    m.groupdict()['address']
+                if 'ipv4' in interface_dict[interface]:
+                    if address in interface_dict[interface]['ipv4']:
+                        interface_dict[interface]['ipv4'][address]['broadcast_address'] = \
+                            m.groupdict()['address']
                 continue
 
             # Address determined by configuration file
@@ -2110,7 +2366,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['helper_address'] = \
                         helper_list
                 continue
-            
+
             # 10.2.2.2
             p5_2 = re.compile(r'^(?P<address>[\d\.]+)$')
             m = p5_2.match(line)
@@ -2128,7 +2384,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['directed_broadcast_forwarding'] = False
                 else:
-                    interface_dict[interface]['directed_broadcast_forwarding'] = True                    
+                    interface_dict[interface]['directed_broadcast_forwarding'] = True
                 continue
 
             # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
@@ -2140,20 +2396,24 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 #Split string of addressed into a list
                 multicast_groups = multicast_groups_address.split()
 
-                interface_dict[interface]['multicast_groups']\
-                 = sorted(multicast_groups)                              
+                interface_dict[interface]['multicast_groups'] = multicast_groups
+                read_multicast_reserved_lines = True
                 continue
 
             # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
-            p41_1 = re.compile(r'(?P<multicast_groups>\d+\.\d+\.\d+\.\d+)')
-            m = p41_1.findall(line)
-            if m and multicast_groups:
-                multicast_groups.extend(m)
-                interface_dict[interface]['multicast_groups']\
-                 = sorted(multicast_groups)                              
-                continue
+            #       224.0.0.5  <----- this extra line
+            if read_multicast_reserved_lines:
+                if not re.match(r"[^\d. ]", line):
+                    p41_1 = re.compile(r'(?P<multicast_groups>\d+\.\d+\.\d+\.\d+)')
+                    m = p41_1.findall(line)
+                    multicast_groups.extend(m)
+                    continue
+                else:
+                    interface_dict[interface]['multicast_groups'] \
+                        = sorted(interface_dict[interface]['multicast_groups'])
+                    read_multicast_reserved_lines = False
 
-            # Outgoing Common access list is not set 
+            # Outgoing Common access list is not set
             p7 = re.compile(r'^Outgoing +Common +access +list +is +'
                             r'(?P<access_list>.+)$')
             m = p7.match(line)
@@ -2378,7 +2638,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
             if m:
                 ret = m.groupdict()['flags'].split(',')
                 ret = [i.strip() for i in ret]
-                interface_dict[interface]['ip_route_cache_flags'] = sorted(ret)                    
+                interface_dict[interface]['ip_route_cache_flags'] = sorted(ret)
                 continue
 
             # Router Discovery is disabled
@@ -2554,7 +2814,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                                 ip_dict['secondary'] = False
                                 break
                 else:
-                    address = unnumbered_ip 
+                    address = unnumbered_ip
                     if 'ipv4' not in interface_dict[interface]:
                         interface_dict[interface]['ipv4'] = {}
                     if address not in interface_dict[interface]['ipv4']:
@@ -2603,7 +2863,7 @@ class ShowIpv6InterfaceSchema(MetaParser):
                             Optional('advertised_retransmit_interval'): int,
                             Optional('router_advertisements_interval'): int,
                             Optional('router_advertisements_live'): int,
-                            Optional('advertised_default_router_preference'): str, 
+                            Optional('advertised_default_router_preference'): str,
                             Optional('advertised_retransmit_interval_unspecified'): bool,
                             Optional('advertised_reachable_time_unspecified'): bool,
                         },
@@ -2645,7 +2905,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
 
             # Vlan211 is up, line protocol is up
             # GigabitEthernet1/0/1 is administratively down, line protocol is down
-            p1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
+            p1 =  re.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is'
                              r' +(?P<enabled>[\w\s]+),'
                              r' +line +protocol +is +(?P<oper_status>\w+)$')
             m = p1.match(line)
@@ -2736,7 +2996,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # Global unicast address(es):
-            #   2001:10::14:1, subnet is 2001:10::14:0/112 
+            #   2001:10::14:1, subnet is 2001:10::14:0/112
             #   2001:DB8:3:3::3, subnet is 2001:DB8:3:3::/64 [ANY/TEN]
             p4 = re.compile(r'^Global +unicast +address\(es\):$')
             m = p4.match(line)
@@ -2825,7 +3085,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
             p6 = re.compile(r'^MTU +is +(?P<mtu>\d+) +bytes$')
             m = p6.match(line)
             if m:
-                ret_dict[intf]['mtu'] = int(m.groupdict()['mtu'])                    
+                ret_dict[intf]['mtu'] = int(m.groupdict()['mtu'])
                 continue
 
             # VPN Routing/Forwarding "VRF1"
@@ -2845,7 +3105,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 if 'icmp' not in ret_dict[intf]['ipv6']:
                     ret_dict[intf]['ipv6']['icmp'] = {}
                 ret_dict[intf]['ipv6']['icmp']['error_messages_limited'] = \
-                    int(m.groupdict()['limited'])                    
+                    int(m.groupdict()['limited'])
                 continue
 
             # ICMP redirects are enabled
@@ -2881,7 +3141,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.setdefault('suppress', False)
-                
+
                 if 'enabled' in m.groupdict()['status']:
                     nd_dict['dad_enabled'] = True
                 else:
@@ -2984,6 +3244,14 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 ret_dict[intf]['addresses_config_method'] = \
                     m.groupdict()['addr_conf_method']
                 continue
+            
+            # Hosts use DHCP to obtain routable addresses.
+            p18_1 = re.compile(r'^Hosts +use +(?P<addr_conf_method>[\w\s]+) +to +obtain +routable +addresses.$')
+            m = p18_1.match(line)
+            if m:
+                ret_dict[intf]['addresses_config_method'] = \
+                    m.groupdict()['addr_conf_method']
+                continue
 
             # Interface is unnumbered. Using address of Loopback0
             p19 = re.compile(r'^Interface +is +unnumbered. +Using +address +of'
@@ -3152,22 +3420,36 @@ class ShowInterfacesCounters(ShowInterfacesCountersSchema):
                 continue
         return ret_dict
 
+class ShowInterfacesCountersEtherchannel(ShowInterfacesCounters):
+    """parser for show interfaces <WORD> counter etherchannel"""
+
+    cli_command = 'show interfaces {interface} counter etherchannel'
+
+    def cli(self, interface,output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command.format(interface=interface))
+            
+        return super().cli(interface=interface, output=output)
 
 class ShowInterfacesAccountingSchema(MetaParser):
     """Schema for show interfaces accounting"""
     schema = {
+        Any(): {
+            Optional('description'): str,
+            'accounting': {
                 Any(): {
-                    Optional('description'): str,
-                    'accounting': {
-                        Any(): {
-                            'pkts_in': int,
-                            'pkts_out': int,
-                            'chars_in': int,
-                            'chars_out': int,
-                        }
-                    }
+                    'pkts_in': int,
+                    'pkts_out': int,
+                    'chars_in': int,
+                    'chars_out': int,
+                    Optional('rxbs'): int,
+                    Optional('rxps'): int,
+                    Optional('txbs'): int,
+                    Optional('txps'): int
                 }
             }
+        }
+    }
 
 
 class ShowInterfacesAccounting(ShowInterfacesAccountingSchema):
@@ -3175,10 +3457,15 @@ class ShowInterfacesAccounting(ShowInterfacesAccountingSchema):
         show interfaces accounting
         show interfaces <interface> accounting
     """
-    cli_command = ['show interfaces {interface} accounting','show interfaces accounting']
-    exclude = ['pkts_in', 'pkts_out', 'chars_in', 'chars_out']
-
-    def cli(self, interface=None,output=None):
+    cli_command = [
+        'show interfaces {interface} accounting', 'show interfaces accounting'
+    ]
+    exclude = [
+        'pkts_in', 'pkts_out', 'chars_in', 'chars_out', 'rxbs', 'rxps', 'txbs',
+        'txps'
+    ]
+
+    def cli(self, interface=None, output=None):
         if output is None:
             if not interface:
                 cmd = self.cli_command[1]
@@ -3194,19 +3481,27 @@ class ShowInterfacesAccounting(ShowInterfacesAccountingSchema):
         # initial regexp pattern
         # GigabitEthernet0/0/0/0
         # GigabitEthernet11 OOB Net
-        p1 = re.compile(r'^(?P<interface>[a-zA-Z\-\d\/\.]+)(?P<description>( (\S)+)*)$')
+        # (need to exclude below line)
+        # -------------------------------------------------------------------------------------------------------------------------
+        p1 = re.compile(
+            r'^(?!-)(?P<interface>[a-zA-Z\-\d\/\.]+)(?P<description>( (\S)+)*)$'
+        )
 
         # Tunnel0 Pim Register Tunnel (Encap) for RP 10.186.1.1
-        p1_1 = re.compile(r'^(?P<interface>Tunnel\d+) +Pim +Register +'
-                           'Tunnel +\(Encap\) +for +RP +(?P<rp>[\w\.]+)$')
+        p1_1 = re.compile(
+            r'^(?P<interface>Tunnel\d+) +Pim +Register +Tunnel +\(Encap\) +for +RP +(?P<rp>[\w\.]+)$'
+        )
 
         #   IPV4_UNICAST             9943           797492           50             3568
-        p2 = re.compile(r'^(?P<protocol>[\w\_\-\s]+)\s+(?P<pkts_in>\d+)\s+'
-                         '(?P<chars_in>\d+)\s+(?P<pkts_out>\d+)\s+'
-                         '(?P<chars_out>\d+)')
+        #   DEC MOP          2        154          2        154
+        #   Other           15          900          861       370708           0            0            0            0
+        p2 = re.compile(
+            r'^(?P<protocol>\S+(\s\S+)?)\s+(?P<pkts_in>\d+)\s+(?P<chars_in>\d+)\s+(?P<pkts_out>\d+)\s+(?P<chars_out>\d+)(\s+(?P<rxbs>\d+)\s+(?P<rxps>\d+)\s+(?P<txbs>\d+)\s+(?P<txps>\d+))?'
+        )
 
         # No traffic sent or received on this interface.
-        p3 = re.compile(r'^No +traffic +sent +or +received +on +this +interface\.$')
+        p3 = re.compile(
+            r'^No +traffic +sent +or +received +on +this +interface\.$')
 
         for line in out.splitlines():
             if line:
@@ -3220,6 +3515,8 @@ class ShowInterfacesAccounting(ShowInterfacesAccountingSchema):
 
             # GigabitEthernet0/0/0/0
             # GigabitEthernet11 OOB Net
+            # (need to exclude below line)
+            # -------------------------------------------------------------------------------------------------------------------------
             m = p1.match(line)
             if m:
                 intf = m.groupdict()['interface']
@@ -3227,6 +3524,8 @@ class ShowInterfacesAccounting(ShowInterfacesAccountingSchema):
                 continue
 
             #   IPV4_UNICAST             9943           797492           50             3568
+            #   DEC MOP          2        154          2        154
+            #   Other           15          900          861       370708           0            0            0            0
             m = p2.match(line)
             if m:
                 protocol_dict = m.groupdict()
@@ -3234,13 +3533,90 @@ class ShowInterfacesAccounting(ShowInterfacesAccountingSchema):
                 ret_dict.setdefault(intf, {}).\
                     setdefault('accounting', {}).setdefault(protocol, {})
                 ret_dict[intf]['accounting'][protocol].update({k: int(v) \
-                    for k, v in protocol_dict.items()})
+                    for k, v in protocol_dict.items() if v is not None})
                 if description:
-                    ret_dict[intf].setdefault('description', description.strip())
+                    ret_dict[intf].setdefault('description',
+                                              description.strip())
                 continue
 
         return ret_dict
 
+# ====================================================
+#  schema for show interfaces link
+# ====================================================
+class ShowInterfacesLinkSchema(MetaParser):
+    """Schema for:
+        show interfaces link
+        show interfaces {interface} link"""
+
+    schema = {
+        'interfaces': {
+            Any(): {
+                Optional('name'): str,
+                'down_time': str,
+                Optional('up_time'): str,
+            }
+        }
+    }
+
+
+# ====================================================
+#  parser for show interfaces link
+# ====================================================
+class ShowInterfacesLink(ShowInterfacesLinkSchema):
+    """parser for
+            * show interfaces link
+            * show interfaces {interface} link
+        """
+
+    cli_command = ['show interfaces link',
+                   'show interfaces {interface} link']
+
+    def cli(self, interface=None, output=None):
+        if output is None:
+            if interface:
+                out = self.device.execute(self.cli_command[1].format(interface=interface))
+            else:
+                out = self.device.execute(self.cli_command[0])
+        else:
+            out = output
+
+        result_dict = {}
+
+        # Port           Name               Down Time      Up Time
+        # Gi1/0/1        Foo                 00:00:00       4w5d
+        # Gi1/0/2        foo bar             00:07:00
+
+        p1 = re.compile(r'^(?P<interface>\S+)'
+                        r'(?:(?P<name>.+?(?=(\d+[dw]\d+[dh])|(\d{2}:\d{2}:\d{2}))))?'
+                        r'(?P<down_time>(\d+[dw]\d+[dh])|(\d{2}:\d{2}:\d{2}))'
+                        r'(?:\s+(?P<up_time>(\d+[dw]\d+[dh])|(\d{2}:\d{2}:\d{2})))?$')
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            m = p1.match(line)
+
+            if m:
+                group = m.groupdict()
+
+                intf_dict = result_dict.setdefault('interfaces', {}).\
+                                        setdefault(Common.convert_intf_name(group['interface']), {})
+
+                name_val = group['name'].strip()
+                if len(name_val):
+                    intf_dict['name'] = name_val
+
+                keys = ['down_time',
+                        'up_time']
+
+                for k in keys:
+                    if group[k]:
+                        intf_dict[k] = group[k].strip()
+                continue
+
+        return result_dict
+
 
 # ====================================================
 #  schema for show interfaces stats
@@ -3254,10 +3630,10 @@ class ShowInterfacesStatsSchema(MetaParser):
         Any(): {
             'switching_path': {
                 Any(): {
-                    'pkts_in': int, 
-                    'pkts_out': int, 
-                    'chars_in': int, 
-                    'chars_out': int, 
+                    'pkts_in': int,
+                    'pkts_out': int,
+                    'chars_in': int,
+                    'chars_out': int,
                 },
             }
         },
@@ -3287,7 +3663,7 @@ class ShowInterfacesStats(ShowInterfacesStatsSchema):
 
         # initialize result dict
         result_dict = {}
-        
+
         # GigabitEthernet0/0/0
         p1 = re.compile(r'^\s*(?P<interface>[\w./]+)$')
 
@@ -3354,14 +3730,14 @@ class ShowInterfacesDescription(ShowInterfacesDescriptionSchema):
         index = 1
 
         #Interface                      Status         Protocol Description
-        #Gi0/0                          up             up 
+        #Gi0/0                          up             up
         #Gi0/1                          admin down     down     to router2
         p1 = re.compile(r'(?P<interface>(\S+)) +(?P<status>(\S+)([\s+](\S+))?) +(?P<protocol>(\S+))(?: +(?P<description>(.*)))?$')
 
         for line in out.splitlines():
             line = line.strip()
             #Interface                      Status         Protocol Description
-            #Gi0/0                          up             up 
+            #Gi0/0                          up             up
             #Gi0/1                          admin down     down     to router2
             m = p1.match(line)
             if m and m.groupdict()['protocol'] != 'Protocol':
@@ -3374,18 +3750,20 @@ class ShowInterfacesDescription(ShowInterfacesDescriptionSchema):
                     intf_dict['description'] = str(group['description'])
                 else:
                     intf_dict['description'] = ""
-                index += 1                
+                index += 1
                 continue
 
         return result_dict
 
 
-# ====================================================
-#  schema for show interfaces status
-# ====================================================
+# =====================================
+#  schema for "show interfaces status"
+# =====================================
 class ShowInterfacesStatusSchema(MetaParser):
     """Schema for:
-        show interfaces status"""
+        * show interfaces status
+        * show interfaces {interface} status
+    """
 
     schema = {
         'interfaces': {
@@ -3405,17 +3783,21 @@ class ShowInterfacesStatusSchema(MetaParser):
 #  parser for show interfaces status
 # ====================================================
 class ShowInterfacesStatus(ShowInterfacesStatusSchema):
-    """parser for 
+    """parser for
             * show interfaces status
+            * show interfaces {interface} status
         """
 
-    cli_command = 'show interfaces status'
+    cli_command = ['show interfaces status',
+                   'show interfaces {interface} status']
 
-    def cli(self, output=None):
+    def cli(self, interface="", output=None):
         if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            output = self.device.execute(cmd)
 
         result_dict = {}
 
@@ -3434,11 +3816,12 @@ class ShowInterfacesStatus(ShowInterfacesStatusSchema):
                         r'\s+(?P<status>(connected|notconnect|suspended|inactive|disabled|err-disabled|monitoring))'
                         r'\s+(?P<vlan>\S+)\s+(?P<duplex_code>[\S\-]+)\s+(?P<port_speed>[\S\-]+)(\s+(?P<type>.+))?$')
 
-        for line in out.splitlines():
+        for line in output.splitlines():
             line = line.strip()
 
             m = p1.match(line)
             if m:
+
                 group = m.groupdict()
 
                 intf_dict = result_dict.setdefault('interfaces', {}).\
@@ -3460,60 +3843,156 @@ class ShowInterfacesStatus(ShowInterfacesStatusSchema):
         return result_dict
 
 
-# ==========================================================
-#  Parser for show interface {interface} transceiver detail
-# ==========================================================
-class ShowInterfaceTransceiverDetailSchema(MetaParser):
+# ====================================================
+#  schema for show interfaces status err-disabled
+# ====================================================
+class ShowInterfacesStatusErrDisabledSchema(MetaParser):
     """Schema for:
-        show interface {interface} transceiver detail"""
+        show interfaces status err-disabled"""
 
     schema = {
         'interfaces': {
-            Any(): {# interface name
-                Optional('cisco_extended_id_number'): str,
-                Optional('cisco_id'): str,
-                Optional('cisco_part_number'): str,
-                Optional('cisco_product_id'): str,
-                Optional('cisco_vendor_id'): str,
+            Any(): {
                 Optional('name'): str,
-                Optional('nominal_bitrate'): str,
-                Optional('number_of_lanes'): str,
-                Optional('part_number'): str,
-                Optional('revision'): str,
-                Optional('serial_number'): str,
-                Optional('transceiver'): str,
-                Optional('type'): str,
-                Any(): str,
+                'status': str,
+                'reason': str,
+                Optional('err_disabled_vlans'): str
             }
         }
     }
 
 
-class ShowInterfaceTransceiverDetail(ShowInterfaceTransceiverDetailSchema):
-    """parser for 
-            * show interface {interface} transceiver detail
+# ====================================================
+#  parser for show interfaces status err-disabled
+# ====================================================
+class ShowInterfacesStatusErrDisabled(ShowInterfacesStatusErrDisabledSchema):
+    """parser for
+            * show interfaces status err-disabled
         """
 
-    cli_command = 'show interface {interface} transceiver detail'
-
-    def cli(self, interface, output=None):
+    cli_command = 'show interfaces status err-disabled'
 
+    def cli(self, output=None):
         if output is None:
-            out = self.device.execute(self.cli_command.format(interface=interface))
+            out = self.device.execute(self.cli_command)
         else:
             out = output
 
-        result_dict = {}
+        ret_dict = {}
 
-        # transceiver is present
-        # type is 10Gbase-LR
+        # Fi1/7/0/13     Hello World  err-disabled loopdetect
+        # Fi1/7/0/14                  err-disabled loopdetect
+        p1= re.compile(r'^(?P<interfaces>\S+)\s+(?P<name>.+?)?\s+(?P<status>err-disabled)\s+(?P<reason>\S+)\s*(?P<err_disabled_vlans>.*)$')
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                intf_dict = ret_dict.setdefault('interfaces', {}).\
+                                        setdefault(Common.convert_intf_name(group['interfaces']), {})
+
+                # Update intf_dict, ignore None or '' empty values. Ignore 'interfaces' key
+                intf_dict.update({k:v for k, v in group.items() if v and k != 'interfaces'})
+                continue
+
+        return ret_dict
+# ==========================================================
+#  Parser for show interface {interface} transceiver detail
+# ==========================================================
+class ShowInterfacesTransceiverDetailSchema(MetaParser):
+    """Schema for:
+        show interfaces {interface} transceiver detail"""
+
+    schema = {
+        'interfaces': {
+            Any(): {  # interface name
+                Optional('transceiver'): str,
+                Optional('type'): str,
+                Optional('name'): str,
+                Optional('part_number'): str,
+                'Temperature': {
+                    'Value': Or(float, str),
+                    Optional('Lane'): str,
+                    'HighAlarmThreshold': float,
+                    'HighWarnThreshold': float,
+                    'LowWarnThreshold': float,
+                    'LowAlarmThreshold': float
+                },
+                'Voltage': {
+                    'Value': Or(float, str),
+                    Optional('Lane'): str,
+                    'HighAlarmThreshold': float,
+                    'HighWarnThreshold': float,
+                    'LowWarnThreshold': float,
+                    'LowAlarmThreshold': float
+                },
+                'Current': {
+                    'Value': Or(float, str),
+                    Optional('Lane'): str,
+                    'HighAlarmThreshold': float,
+                    'HighWarnThreshold': float,
+                    'LowWarnThreshold': float,
+                    'LowAlarmThreshold': float
+                },
+                'OpticalTX': {
+                    'Value': Or(float, str),
+                    Optional('Lane'): str,
+                    'HighAlarmThreshold': float,
+                    'HighWarnThreshold': float,
+                    'LowWarnThreshold': float,
+                    'LowAlarmThreshold': float
+                },
+                'OpticalRX': {
+                    'Value': Or(float, str),
+                    Optional('Lane'): str,
+                    'HighAlarmThreshold': float,
+                    'HighWarnThreshold': float,
+                    'LowWarnThreshold': float,
+                    'LowAlarmThreshold': float
+                },
+            }
+        }
+    }
+
+
+class ShowInterfacesTransceiverDetail(ShowInterfacesTransceiverDetailSchema):
+    """parser for
+            * show interfaces transceiver detail
+            * show interfaces {interface} transceiver detail
+        """
+
+    cli_command = ['show interfaces {interface} transceiver detail',
+                   'show interfaces transceiver detail']
+
+    def cli(self, interface=None, output=None):
+        if output is None:
+            if interface:
+                out = self.device.execute(self.cli_command[0].format(interface=interface))
+            else:
+                out = self.device.execute(self.cli_command[1])
+        else:
+            out = output
+
+        # transceiver is present
+        # type is 10Gbase-LR
         # name is CISCO-FINISAR
         # part number is FTLX1474D3BCL-CS
-        p1 = re.compile(r'^(?P<key>[\S\s]+) +is +(?P<value>[\S\s]+)$')
+        p1 = re.compile(r'^(?P<key>[Tt]ransceiver|[Tt]ype|[Nn]ame|[Pp]art +[Nn]umber) +is +(?P<value>[\S\s]+)$')
 
-        # number of lanes 1
-        p2 = re.compile(r'^number +of +lanes +(?P<lanes>[\d]+)$')
+        # Voltage            Threshold   Threshold  Threshold  Threshold
+        p3_0 = re.compile(r'(?P<statistic>(Temperature|Voltage|Current|Transmit Power|Receive Power)) +Threshold +Threshold +Threshold +Threshold$')
 
+        # Twe2/1/1     25.5                   90.0       85.0       -5.0      -10.0
+        # Twe2/1/1   N/A    5.7                 50.0       40.0        2.0        1.0
+        # Twe2/1/1   N/A    N/A                 50.0       40.0        2.0        1.0
+        p3_1 = re.compile(r'^(?P<port>(\S+)) +(?P<lane>(\S+))? +(?P<value>(\S+)) '
+                          r'+(?P<HAT>(-?[\d\.]+)) +(?P<HWT>(-?[\d\.]+)) +(?P<LWT>(-?[\d\.]+)) +(?P<LAT>(-?[\d\.]+))$')
+
+        result_dict = {}
+        is_dict = {}
+        stat = None
         for line in out.splitlines():
             line = line.strip()
 
@@ -3522,17 +4001,1614 @@ class ShowInterfaceTransceiverDetail(ShowInterfaceTransceiverDetailSchema):
             m = p1.match(line)
             if m:
                 group = m.groupdict()
-                key = group['key'].strip().replace(" ", '_').lower()
+                key = group['key'].lower().replace('the', '').strip()
+                key = key.replace(' ', '_')
                 value = group['value'].strip()
+                is_dict[key] = value
+                continue
 
-                intf_dict = result_dict.setdefault('interfaces', {}).setdefault(interface, {})
-                intf_dict.update({key: value})
+            m = p3_0.match(line)
+            if m:
+                stat = m.groupdict()['statistic']
+                if stat == 'Transmit Power':
+                    stat = 'OpticalTX'
+                elif stat == 'Receive Power':
+                    stat = 'OpticalRX'
                 continue
-            
-            # number of lanes 1
+
+            if stat:
+                m = p3_1.match(line)
+                if m:
+                    interface = m.groupdict()['port']
+                    interface = Common.convert_intf_name(interface)
+                    intf_dict = result_dict.setdefault('interfaces', {}).setdefault(interface, {})
+
+                    intf_dict.update(is_dict)
+                    is_dict = {}
+
+                    intf_dict[stat] = {}
+                    try:
+                        intf_dict[stat]['Value'] = float(m.groupdict()['value'])
+                    except ValueError:
+                        intf_dict[stat]['Value'] = m.groupdict()['value']
+
+                    if m.groupdict()['lane'] is not None:
+                        intf_dict[stat]['Lane'] = m.groupdict()['lane']
+                    intf_dict[stat]['HighAlarmThreshold'] = float(m.groupdict()['HAT'])
+                    intf_dict[stat]['HighWarnThreshold'] = float(m.groupdict()['HWT'])
+                    intf_dict[stat]['LowWarnThreshold'] = float(m.groupdict()['LWT'])
+                    intf_dict[stat]['LowAlarmThreshold'] = float(m.groupdict()['LAT'])
+                    continue
+
+        return result_dict
+
+
+# ==========================================================
+#  Parser for show interface {interface} transceiver
+# ==========================================================
+class ShowInterfacesTransceiverSchema(MetaParser):
+    """Schema for:
+        * show interfaces {interface} transceiver
+    """
+
+    schema = {
+        'interfaces': {
+            Any(): {  # interface name
+                Optional('port'): str,
+                Optional('temp'): str,
+                Optional('voltage'): str,
+                Optional('current'): str,
+                Optional('opticaltx'): str,
+                Optional('opticalrx'): str,
+                Optional('max_power'): str
+            }
+        }
+    }
+
+
+class ShowInterfacesTransceiver(ShowInterfacesTransceiverSchema):
+    """
+    parser for
+        * show interfaces transceiver
+        * show interfaces {interface} transceiver
+    """
+
+    cli_command = ['show interfaces {interface} transceiver', 'show interfaces transceiver']
+
+    def cli(self, interface=None, output=None):
+        if output is None:
+            if interface:
+                out = self.device.execute(self.cli_command[0].format(interface=interface))
+            else:
+                out = self.device.execute(self.cli_command[1])
+
+        else:
+            out = output
+
+        # Gi1/1      40.6       5.09       0.4     -25.2      N/A
+        p = re.compile(r'^(?P<port>([\d\/A-Za-z]+)) +(?P<temp>([\d\.-]+)) '
+                       r'+(?P<voltage>([\d\.-]+)) +(?P<current>([\d\.-]+)) '
+                       r'+(?P<opticaltx>(\S+)) +(?P<opticalrx>(\S+))(\s+(?P<max_power>\S+)\s+W)?$')
+
+        result_dict = {}
+        for line in out.splitlines():
+            line = line.strip()
+
+            m = p.match(line)
+            if m:
+                group = m.groupdict()
+                intf_dict = result_dict.setdefault('interfaces', {}).setdefault(group['port'], {})
+                intf_dict['temp'] = group['temp']
+                intf_dict['voltage'] = group['voltage']
+                intf_dict['current'] = group['current']
+                intf_dict['opticaltx'] = group['opticaltx']
+                intf_dict['opticalrx'] = group['opticalrx']
+                if group['max_power']:
+                    intf_dict['max_power'] = group['max_power']
+                continue
+
+        return result_dict
+
+
+# ====================================================
+#  schema for show macro auto interfaces
+# ====================================================
+class ShowMacroAutoInterfaceSchema(MetaParser):
+    """Schema for:
+        show macro auto interface"""
+
+    schema = {
+        'asp_status': str,
+        'fallback': {
+            'type': str,
+            'status': str
+        },
+        'interfaces': {
+            Any(): {
+                'asp': str,
+                'fallback': str,
+                'macro': str
+            },
+        }
+    }
+# ==========================================================
+#  Parser for show macro auto interface
+# ==========================================================
+class ShowMacroAutoInterface(ShowMacroAutoInterfaceSchema):
+    """
+    parser for
+            * show macro auto interface
+    """
+
+    cli_command = 'show macro auto interface'
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        ret_dict = {}
+
+        # Auto Smart Ports Enabled
+        p1 = re.compile(r'^Auto Smart Ports+\s(?P<asp_status>\S+)')
+        # Fallback : CDP  Disabled
+        p2 = re.compile(r'Fallback :\s+(?P<type>\S+)\s+(?P<status>\S+)')
+        # Gi2/0/21      TRUE              None        CISCO_IPVSC_EVENT
+        p3 = re.compile(
+            r'^(?P<interface>\S+\d+\/\d+\/\d+|\S+)\s+(?P<asp>\w+)\s\s+(?P<fallback>\w+)\s+(?P<macro>\S+|\S+(?:\s+)?\S+(?:\s+)?\S+)$')
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                ret_dict['asp_status'] = group['asp_status']
+
             m = p2.match(line)
             if m:
-                intf_dict['number_of_lanes'] = m.groupdict()['lanes']
+                group = m.groupdict()
+                fallback_dict = ret_dict.setdefault('fallback',{})
+                fallback_dict['type'] = group['type']
+                fallback_dict['status'] = group['status']
+
+
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                interface = Common.convert_intf_name\
+                        (intf=group['interface'].strip())
+                intf_dict = ret_dict.setdefault('interfaces', {}).setdefault(interface, {})
+                intf_dict['asp'] = group['asp']
+                intf_dict['fallback'] = group['fallback']
+                intf_dict['macro'] = group['macro']
+
+        return ret_dict
+# =============================================
+# Schema for 'show interface summary vlan'
+# =============================================
+class ShowInterfaceSummaryVlanSchema(MetaParser):
+    """ Schema for
+        * show interface summary vlan
+    """
+    schema = {
+        'Total_vlan_interface': int,
+        'Configured_vlan_interfaces' : str
+    }
+# ==========================================================
+#  Parser for 'show interface summary vlan'
+# ==========================================================
+
+class ShowInterfaceSummaryVlan(ShowInterfaceSummaryVlanSchema):
+    """ Parser for
+        * show interface summary vlan
+    """
+
+    cli_command = 'show interface summary vlan'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        ret_dict = {}
+
+        #Total number of Vlan interfaces: 256
+        p1 = re.compile(r'Total\s+number\s+of\s+Vlan\s+interfaces:\s+(?P<total_number>\d+)')
+
+        #Vlan interfaces configured:
+        #1,10-264
+        p2 = r'Vlan\s+interfaces\s+configured:\s*(?P<vlan_int>\S+)'
+        #p2 = re.compile(r'Vlan\s+interfaces\s+configured:\s+(?P<vlan_int>\S+)')
+        #p2 = re.compile(r'Vlan\s+interfaces\s+configured:\n(?P<vlan_int>\S+)')
+        for line in output.splitlines():
+            line = line.strip()
+            m1 = p1.match(line)
+            if m1:
+                group = m1.groupdict()
+                ret_dict["Total_vlan_interface"] = int(group["total_number"])
+        #m2 = p2.match(output)
+        m2 = re.search(p2,output,re.M|re.I)
+        if m2:
+           group = m2.groupdict()
+           ret_dict["Configured_vlan_interfaces"] = group["vlan_int"]
+        return ret_dict
+
+# ===================================================
+# Schema for 'show interfaces {interface} summary'
+# ===================================================
+class ShowInterfacesSummarySchema(MetaParser):
+    """ Schema for
+        * show interfaces summary
+        * show interfaces {interface} summary
+    """
+    schema = {
+        'interfaces': {
+            Any(): {
+                'up': bool,
+                'ihq': int,
+                'iqd': int,
+                'ohq': int,
+                'oqd': int,
+                'rxbs': int,
+                'rxps': int,
+                'txbs': int,
+                'txps': int,
+                'trtl': int,
+                'name': str
+            },
+        }
+    }
+
+# ==========================================================
+#  Parser for 'show interfaces {interface} summary'
+# ==========================================================
+class ShowInterfacesSummary(ShowInterfacesSummarySchema):
+    """ Parser for
+        * show interfaces summary
+        * show interfaces {interface} summary
+    """
+
+    cli_command = ['show interfaces summary',
+                   'show interfaces {interface} summary']
+
+    def cli(self, interface=None, output=None):
+        if output is None:
+            if interface:
+                output = self.device.execute(self.cli_command[1].format(interface=interface))
+            else:
+                output = self.device.execute(self.cli_command[0])
+
+        # initial regexp pattern
+        # * GigabitEthernet1/0/9          0         0         0         0         0         0         0         0         0
+        #   GigabitEthernet1/0/10          0         0         0         0         0         0         0         0         0
+        p = re.compile(r'^(?P<up>\*?) *(?P<name>[\w\-\/\.]+) +'
+                       r'(?P<ihq>\d+) +(?P<iqd>\d+) +(?P<ohq>\d+) +'
+                       r'(?P<oqd>\d+) +(?P<rxbs>\d+) +(?P<rxps>\d+) +'
+                       r'(?P<txbs>\d+) +(?P<txps>\d+) +(?P<trtl>\d+)$')
+
+        # initial variables
+        ret_dict = {}
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            # * GigabitEthernet1/0/9          0         0         0         0         0         0         0         0         0
+            #   GigabitEthernet1/0/10          0         0         0         0         0         0         0         0         0
+            m = p.match(line)
+            if m:
+                group = m.groupdict()
+                intf = Common.convert_intf_name(group.pop('name'))
+                intf_dict = ret_dict.setdefault('interfaces', {}).setdefault(intf, {})
+                intf_dict['name'] = intf
+                intf_dict['up'] = True if group.pop('up') == '*' else False
+                intf_dict.update({k: int(v) for k, v in group.items()})
+                continue
+        return ret_dict
+
+
+# ====================================================
+#  schema for show interfaces mtu
+# ====================================================
+class ShowInterfacesMtuSchema(MetaParser):
+    """Schema for:
+        show interfaces mtu
+        show interfaces {interface} mtu
+        show interfaces mtu module {mod}"""
+
+    schema = {
+        'interfaces': {
+            Any(): {
+                Optional('name'): str,
+                'mtu': int
+            }
+        }
+    }
+
+
+# ====================================================
+#  parser for show interfaces mtu
+# ====================================================
+class ShowInterfacesMtu(ShowInterfacesMtuSchema):
+    """parser for
+            * show interfaces mtu
+            * show interfaces {interface} mtu
+            * show interfaces mtu module {mod}
+        """
+
+    cli_command = ['show interfaces mtu',
+                   'show interfaces {interface} mtu',
+                   'show interfaces mtu module {mod}']
+
+    def cli(self, interface=None, mod=None, output=None):
+
+        if output is None:
+            if mod:
+                out = self.device.execute(self.cli_command[2].format(mod=mod))
+            elif interface:
+                out = self.device.execute(self.cli_command[1].format(interface=interface))
+            else:
+                out = self.device.execute(self.cli_command[0])
+
+        result_dict = {}
+
+        #Port          Name                        MTU
+        #Fo1/0/1       Interface1                  1500
+        #Fo1/0/2       Interface2                  1500
+
+        p1 = re.compile(r'^(?P<interfaces>\S+)\s+(?P<name>.+?)?\s+(?P<mtu>\d+)$')
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+
+                intf_dict = result_dict.setdefault('interfaces', {}).\
+                                        setdefault(Common.convert_intf_name(group['interfaces']), {})
+
+                intf_dict.update({k:v for k, v in group.items() if v and k != 'interfaces'})
+                intf_dict['mtu'] = int(intf_dict['mtu'])
                 continue
 
         return result_dict
+
+# ====================================================
+#  schema for show interfaces status module {mod}
+# ====================================================
+
+
+class ShowInterfacesStatusModuleSchema(MetaParser):
+
+    """
+    Schema for show interfaces status module {mod} 
+
+    """
+
+    schema = {
+        Optional('interfaces'): {
+            Any(): {
+                Optional('name'): str,
+                'status': str,
+                'vlan': str,
+                'duplex_code': str,
+                'port_speed': str,
+                Optional('type'): str,
+            }
+        },
+        Optional('var') : str,
+    }
+#====================================================
+#  parser for show interfaces status module {mod}
+# ====================================================
+
+class ShowInterfacesStatusModule(ShowInterfacesStatusModuleSchema):
+
+    ''' Parser for :
+        'show interfaces status module {mod}'
+    '''
+    cli_command = ['show interfaces status module {mod}']
+    def cli(self, mod="", output = None):
+
+        output = self.device.execute(self.cli_command[0].format(mod=mod))
+
+        result_dict = {}
+        
+        p0 = re.compile(r'(?P<var>%.*)')
+
+            # Port         Name               Status       Vlan       Duplex  Speed Type
+            # Hu1/0/1                         connected    1            full    40G QSFP 40G AOC5M 
+
+        p1 = re.compile(r'^(?P<interfaces>\S+)(?:\s+(?P<name>(.+)))?'
+                r'\s+(?P<status>(connected|notconnect|suspended|inactive|disabled|err-disabled|monitoring))'
+                r'\s+(?P<vlan>\d+)\s+(?P<duplex_code>[\S\-]+)\s+(?P<port_speed>[\S\-]+)(\s+(?P<type>.+))?$')
+
+        
+        # %Module1 is not Present
+        
+        m = p0.match(output)
+        if m:
+            
+            var = m.groupdict()['var']
+            result_dict['var'] = var
+            
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            # Port         Name               Status       Vlan       Duplex  Speed Type
+            # Hu1/0/1                         connected    1            full    40G QSFP 40G AOC5M 
+
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+
+                intf_dict = result_dict.setdefault('interfaces', {}).\
+                                        setdefault(Common.convert_intf_name(group['interfaces']), {})
+
+                name_val = group['name'].strip()
+                if len(name_val)>0 :
+                    intf_dict['name'] = name_val
+
+                keys = ['status',
+                        'vlan', 'duplex_code', 'port_speed',
+                        'type']
+
+                for k in keys:
+                    if group[k]:
+                        intf_dict[k] = group[k].strip()
+                continue
+
+        return result_dict
+
+
+#======================================================
+# Schema for 'show pm vp interface <interface> <vlan> '
+# ======================================================
+
+class ShowPmVpInterfaceVlanSchema(MetaParser):
+    """Schema for show pm vp interface <interface> <vlan>"""
+
+    schema = {
+        'pm_vp_info': {
+            Optional('vp'): str,
+            Optional('es'): str,
+            Optional('sm'): str,
+            Optional('running'): str,
+            Optional('state'): str,
+            Optional('last_transition'): str,
+        },
+
+    }
+
+# ======================================================
+# Parser for 'show pm vp interface <interface> <vlan> '
+# ======================================================
+class ShowPmVpInterfaceVlan(ShowPmVpInterfaceVlanSchema):
+    """Parser for show pm vp interface <interface> <vlan>"""
+
+    cli_command = 'show pm vp interface {interface} {vlan}'
+
+    def cli(self, interface=None, vlan=None, output=None):
+        if output is None:
+            cmd = self.cli_command.format(interface=interface, vlan=vlan)
+            output = self.device.execute(cmd)
+
+        # vp: 0x50823F64: 3/3(1001) es: 0, stp forwarding, link up, fwd yes
+        p1 = re.compile(r"^vp:\s+(?P<vp>\S+\s+\S+)\s+es:\s+(?P<es>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
+        # sm(pm_vp 3/3(1001)), running yes, state forwarding
+        p1_1 = re.compile(r"^sm\((?P<sm>\S+\s+\S+)\),\s+running\s+(?P<running>\w+),\s+state\s+(?P<state>\w+)$")
+        # Last transition recorded: (linkup)-> authentication (linkup)-> authentication (authen_enable)-> authen_fail (authen_success)-> notforwarding (forward_notnotify)-> forwarding 
+        p1_2 = re.compile(r"^Last\s+transition\s+recorded:\s+(?P<last_transition>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
+
+
+        ret_dict = {}
+
+        for line in output.splitlines():
+
+            # vp: 0x50823F64: 3/3(1001) es: 0, stp forwarding, link up, fwd yes
+            m = p1.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_vp_info' not in ret_dict:
+                    pm_vp_info = ret_dict.setdefault('pm_vp_info', {})
+                pm_vp_info['vp'] = dict_val['vp']
+                pm_vp_info['es'] = dict_val['es']
+                continue
+
+            # sm(pm_vp 3/3(1001)), running yes, state forwarding
+            m = p1_1.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_vp_info' not in ret_dict:
+                    pm_vp_info = ret_dict.setdefault('pm_vp_info', {})
+                pm_vp_info['sm'] = dict_val['sm']
+                pm_vp_info['running'] = dict_val['running']
+                pm_vp_info['state'] = dict_val['state']
+                continue
+
+            # Last transition recorded: (linkup)-> authentication (linkup)-> authentication (authen_enable)-> authen_fail (authen_success)-> notforwarding (forward_notnotify)-> forwarding 
+            m = p1_2.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_vp_info' not in ret_dict:
+                    pm_vp_info = ret_dict.setdefault('pm_vp_info', {})
+                pm_vp_info['last_transition'] = dict_val['last_transition']
+                continue
+
+        return ret_dict
+
+# ====================================================
+#  schema for show interfaces transceiver supported-list
+# ====================================================
+
+class ShowInterfacesTransceiverSupportedlistSchema(MetaParser):
+    """Schema for:
+        * show interfaces transceiver supported-list
+    """
+
+    schema = {
+        'transceiver_type': {
+            Any() : {
+                'cisco_pin_min_version_supporting_dom' : str,
+            },
+        },
+    }
+
+#====================================================
+#  parser for show interfaces transceiver supported-list
+# ====================================================
+
+class ShowInterfacesTransceiverSupportedlist(ShowInterfacesTransceiverSupportedlistSchema):
+    """parser for show interfaces transceiver supported-list
+    """
+
+    cli_command = 'show interfaces transceiver supported-list'
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        
+        transceivers_supported_list = {}
+        
+        #------------------       ------------------------- 
+        #p1 will match dashes pattern used to create dict that to start adiing the transceiver types
+        p1 = re.compile(r"\-+\s+\-+")
+
+        #   GLC-FE-100FX-RGD         ALL
+        #   GLC-SX-MM                NONE
+        p2 = re.compile(r"^(?P<transceiver>[\w-]+)\s+(?P<pin_version>(ALL|NONE))")
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            #------------------       -------------------------
+            m1 = p1.match(line)
+            if m1:
+                transceiver_dict = transceivers_supported_list.setdefault('transceiver_type',{})
+
+            #   GLC-FE-100FX-RGD         ALL
+            #   GLC-SX-MM                NONE
+            m2 = p2.match(line)
+            if m2:
+                transceiver_dict.update({m2.groupdict()['transceiver'] :
+                                        { "cisco_pin_min_version_supporting_dom" :
+                                        m2.groupdict()['pin_version']}})
+
+        return transceivers_supported_list
+
+
+# ======================================================
+# Schema for 'show pm  port interface <interface> '
+# ======================================================
+
+class ShowPmPortInterfaceSchema(MetaParser):
+    """Schema for show pm port interface <interface>"""
+
+    schema = {
+        'pm_port_info': {
+            'port': str,
+            'pd': str,
+            'sw_idb': str,
+            'sb': str,
+            'hw_idb': str,
+            'if_num': int,
+            'hw_if_index': int,
+            'snmp_if_index': str,
+            'ptrunk_group': str,
+            'admin': str,
+            'line': str,
+            'oper_err': str,
+            'port_mac': str,
+            'idb_port_vlan': int,
+            'def_vlan_id': int,
+            'internal_vlan': str,
+            'dtp_special': str,
+            'pagp_special': str,
+            'speed': str,
+            'duplex': str,
+            'mode': str,
+            'encap': str,
+            'dtp_nonego': str,
+            'flow_ctrl_receive': str,
+            'flow_ctrl_send': str,
+            'link_flap_cnt': int,
+            'dtp_flap_cnt': int,
+            'pagp_flap_cnt': int,
+            'unidirectional': str,
+            'oper_vlan': int,
+            'flag': int,
+            'sm': str,
+            'running': str,
+            'state': str,
+            'last_transition': str,
+            'vp': str,
+            'vlans': str,
+            'trunk_vlans': str,
+            'fwd_vlans': int,
+            'current_pruned_vlans': str,
+            'previous_pruned_vlans': str,
+            'protocols': str,
+        },
+        'config_values': {
+            'access_mode': str,
+            'access_vlan_id': int,
+            'native_vlan_id': int,
+            'trunk_vlans': str,
+            'prune_vlans': str,
+            'primary_host_vlan': int,
+            'sec_host_vlan': int,
+            'pri_promiscuous_vlan': int,
+            'sec_prom_vlan': str,
+            'speed': str,
+            'speed_auto': str,
+            'duplex': str,
+            'mode': str,
+            'encap': str,
+            'nonego': str,
+            'jumbo_cap': str,
+            'jumbo': str,
+            'mtu': int,
+            'sync_delay': int,
+            'hol': str,
+            'bcast_sup_level': int,
+            'mcast_sup_level': int,
+            'ucast_sup_level': int,
+            'disl': str,
+            'dtp_nonego': str,
+            'media': str,
+            'dualmode': int,
+            'tdr_ever_run': str,
+            'tdr_in_progress': str,
+            'tdr_result_valid': str,
+            'tdr_error_code': int,
+            'prbs_err_code': int,
+            'prbs': str,
+            
+        },
+    }
+    
+# ======================================================
+# Parser for 'show pm  port interface <interface> '
+# ======================================================
+
+class ShowPmPortInterface(ShowPmPortInterfaceSchema):
+    """Parser for show pm port interface <interface>"""
+
+    cli_command = 'show pm port interface {interface}'
+
+    def cli(self, interface=None, output=None):
+        if output is None:
+            cmd = self.cli_command.format(interface=interface)
+            output = self.device.execute(cmd)
+
+        # port 1/24  pd 0x7F837FEABD78 swidb 0x7F837EBFA020(switch)  sb 0x7F837EBFCA40 
+        p1 = re.compile(r"^port\s+(?P<port>\S+)\s+pd\s+(?P<pd>\S+)\s+swidb\s+"
+             "(?P<sw_idb>\S+)\s+sb\s+(?P<sb>\S+)$")
+        #  hwidb 0x7F837EBF8C38
+        p1_1 = re.compile(r"^hwidb\s+(?P<hw_idb>\S+)$")
+        # if_number = 32 hw_if_index = 31 snmp_if_index = 32(32) ptrunkgroup = 0(port)
+        p1_2 = re.compile(r"^if_number\s+=\s+(?P<if_num>\d+)\s+hw_if_index\s+="
+               "\s+(?P<hw_if_index>\d+)\s+snmp_if_index\s+=\s+(?P<snmp_if_index>\S+)"
+               "\s+ptrunkgroup\s+=\s+(?P<ptrunk_group>\S+)$")
+        # admin up(up)  line up(up)  operErr none
+        p1_3 = re.compile(r"^admin\s+(?P<admin>\S+)\s+line\s+(?P<line>\S+)\s+"
+               "operErr\s+(?P<oper_err>\w+)$")
+        # port assigned mac address 683b.78f3.3118
+        p1_4 = re.compile(r"^port\s+assigned\s+mac\s+address\s+(?P<port_mac>\S+)$")
+        # idb port vlan id 1  default vlan id 1
+        p1_5 = re.compile(r"^idb\s+port\s+vlan\s+id\s+(?P<idb_port_vlan>\d+)\s+"
+               "default\s+vlan\s+id\s+(?P<def_vlan_id>\d+)$")
+        # internalVlan 0x0  remapVlan 0x0
+        p1_6 = re.compile(r"^internalVlan\s+(?P<internal_vlan>\S+)\s+remapVlan\s+0x0$")
+        # dtp special no  pagp special no
+        p1_7 = re.compile(r"^dtp\s+special\s+(?P<dtp_special>\w+)\s+pagp\s+"
+               "special\s+(?P<pagp_special>\w+)$")
+        # speed: 100M   duplex: full   mode: access   encap: native 
+        p1_8 = re.compile(r"^speed:\s+(?P<speed>\S+)\s+duplex:\s+(?P<duplex>\w+)"
+               "\s+mode:\s+(?P<mode>\w+)\s+encap:\s+(?P<encap>\w+)$")
+        # dtp nonegotiate: FALSE 
+        p1_9 = re.compile(r"^dtp\s+nonegotiate:\s+(?P<dtp_nonego>\w+)$")
+        # flowcontrol receive: on   flowcontrol send: off 
+        p1_10 = re.compile(r"^flowcontrol\s+receive:\s+(?P<flow_ctrl_receive>\w+)"
+                "\s+flowcontrol\s+send:\s+(?P<flow_ctrl_send>\w+)$")
+        # linkflapcnt: 0  dtpflapcnt: 0  pagpflapcnt: 0
+        p1_11 = re.compile(r"^linkflapcnt:\s+(?P<link_flap_cnt>\d+)\s+dtpflapcnt:"
+                "\s+(?P<dtp_flap_cnt>\d+)\s+pagpflapcnt:\s+(?P<pagp_flap_cnt>\d+)$")
+        # unidirectional: off 
+        p1_12 = re.compile(r"^unidirectional:\s+(?P<unidirectional>\w+)$")
+        # operVlan: 0 
+        p1_13 = re.compile(r"^operVlan:\s+(?P<oper_vlan>\d+)$")
+        # flag:     0 
+        p1_14 = re.compile(r"^flag:\s+(?P<flag>\d+)$")
+        # sm(pm_port 1/24), running yes, state access_multi
+        p1_15 = re.compile(r"^sm\((?P<sm>\S+\s+\S+)\),\s+running\s+"
+                "(?P<running>\w+),\s+state\s+(?P<state>\S+)$")
+        # Last transition recorded: (cfg_access_vvlanid)-> pagp_port_cleanup (cfg_access_vvlanid)-> pagp (cfg_access_vvlanid)-> pre_pagp_may_suspend (cfg_access_vvlanid)-> pagp_may_suspend (pagp_continue)-> start_pagp (pagp_continue)-> pagp (dont_bundle)-> pre_post_pagp (dont_bundle)-> post_pagp (dtp_access_multi)-> access_multi (bulk_sync)-> access_multi 
+        p1_16 = re.compile(r"^Last\s+transition\s+recorded:\s+"
+                "(?P<last_transition>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+"
+                "\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+"
+                "\s+\S+\s+\S+)$")
+        # vp:  1 100
+        p1_17 = re.compile(r"^vp:\s+(?P<vp>\S+\s+\S+)$")
+        # vlans:  1 100
+        p1_18 = re.compile(r"^vlans:\s+(?P<vlans>\S+\s+\S+)$")
+        # trunkVlans:  1 100
+        p1_19 = re.compile(r"^trunkVlans:\s+(?P<trunk_vlans>\S+\s+\S+)$")
+        # fwdVlans:  100
+        p1_20 = re.compile(r"^fwdVlans:\s+(?P<fwd_vlans>\d+)$")
+        # currentlyPrunedVlans:  none
+        p1_21 = re.compile(r"^currentlyPrunedVlans:\s+(?P<current_pruned_vlans>\w+)$")
+        # previouslyPrunedVlans:  none
+        p1_22 = re.compile(r"^previouslyPrunedVlans:\s+(?P<previous_pruned_vlans>\w+)$")
+        # protocols: ip=on ipx=on misc=on other=on 
+        p1_23 = re.compile(r"^protocols:\s+(?P<protocols>\S+\s+\S+\s+\S+\s+\S+)$")
+        # access mode: unknown   access vlanid: 1   native vlanid: 1 
+        p2 = re.compile(r"^access\s+mode:\s+(?P<access_mode>\w+)\s+"
+             "access\s+vlanid:\s+(?P<access_vlan_id>\d+)\s+native\s+vlanid:\s+"
+             "(?P<native_vlan_id>\d+)$")
+        # trunkVlans:  1-4094
+        p2_1 = re.compile(r"^trunkVlans:\s+(?P<trunk_vlans>\S+)$")
+        # pruneVlans:  2-1001primary host vlanid: 32767    secondary host vlanid: 32767
+        p2_2 = re.compile(r"^pruneVlans:\s+(?P<prune_vlans>\S+)primary\s+host\s+"
+               "vlanid:\s+(?P<primary_host_vlan>\d+)\s+secondary\s+host\s+"
+               "vlanid:\s+(?P<sec_host_vlan>\d+)$")
+        # primary promiscuous vlanid: 32767
+        p2_3 = re.compile(r"^primary\s+promiscuous\s+vlanid:\s+"
+               "(?P<pri_promiscuous_vlan>\d+)$")
+        # secondary prom vlans:  none
+        p2_4 = re.compile(r"^secondary\s+prom\s+vlans:\s+(?P<sec_prom_vlan>\w+)$")
+        # speed: auto speedauto: auto-default   duplex: auto   mode: access 
+        p2_5 = re.compile(r"^speed:\s+(?P<speed>\w+)\s+speedauto:\s+"
+               "(?P<speed_auto>\S+)\s+duplex:\s+(?P<duplex>\w+)\s+"
+               "mode:\s+(?P<mode>\w+)$")
+        # encap: dot1q   nonegotiate: false 
+        p2_6 = re.compile(r"^encap:\s+(?P<encap>\S+)\s+nonegotiate:\s+"
+               "(?P<nonego>\w+)$")
+        # jumbo cap: true   jumbo: false  mtu: 1500  sync-delay: 210  HOL: Enable
+        p2_7 = re.compile(r"^jumbo\s+cap:\s+(?P<jumbo_cap>\w+)\s+jumbo:\s+"
+               "(?P<jumbo>\w+)\s+mtu:\s+(?P<mtu>\d+)\s+sync-delay:\s+"
+               "(?P<sync_delay>\d+)\s+HOL:\s+(?P<hol>\w+)$")
+        # bcast-supp-level: 10000   mcast-supp-level: 10000   ucast-supp-level: 10000 
+        p2_8 = re.compile(r"^bcast-supp-level:\s+(?P<bcast_sup_level>\d+)\s+"
+               "mcast-supp-level:\s+(?P<mcast_sup_level>\d+)\s+ucast-supp-level:"
+               "\s+(?P<ucast_sup_level>\d+)$")
+        # disl: off   dtp nonegotiate: FALSE   media: unknown   dualmode 0 
+        p2_9 = re.compile(r"^disl:\s+(?P<disl>\w+)\s+dtp\s+nonegotiate:\s+"
+               "(?P<dtp_nonego>\w+)\s+media:\s+(?P<media>\w+)\s+dualmode\s+"
+               "(?P<dualmode>\d+)$")
+        # tdr_ever_run: FALSE tdr_in_progress: FALSE tdr_result_valid: FALSE
+        p2_10 = re.compile(r"^tdr_ever_run:\s+(?P<tdr_ever_run>\w+)\s+"
+                "tdr_in_progress:\s+(?P<tdr_in_progress>\w+)\s+tdr_result_valid:"
+                "\s+(?P<tdr_result_valid>\w+)$")
+        # tdr_err_code: 0, prbs_err_code: 0
+        p2_11 = re.compile(r"^tdr_err_code:\s+(?P<tdr_error_code>\d+),\s+"
+                "prbs_err_code:\s+(?P<prbs_err_code>\d+)$")
+        # PRBS: Stopped PRBS - port was admin down
+        p2_12 = re.compile(r"^PRBS:\s+(?P<prbs>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
+        
+
+        ret_dict = {}
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            # port 1/24  pd 0x7F837FEABD78 swidb 0x7F837EBFA020(switch)  sb 0x7F837EBFCA40 
+            m = p1.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['port'] = dict_val['port']
+                pm_port_info['pd'] = dict_val['pd']
+                pm_port_info['sw_idb'] = dict_val['sw_idb']
+                pm_port_info['sb'] = dict_val['sb']
+                continue
+
+            #  hwidb 0x7F837EBF8C38
+            m = p1_1.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['hw_idb'] = dict_val['hw_idb']
+                continue
+
+            # if_number = 32 hw_if_index = 31 snmp_if_index = 32(32) ptrunkgroup = 0(port)
+            m = p1_2.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['if_num'] = int(dict_val['if_num'])
+                pm_port_info['hw_if_index'] = int(dict_val['hw_if_index'])
+                pm_port_info['snmp_if_index'] = dict_val['snmp_if_index']
+                pm_port_info['ptrunk_group'] = dict_val['ptrunk_group']
+                continue
+
+            # admin up(up)  line up(up)  operErr none
+            m = p1_3.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['admin'] = dict_val['admin']
+                pm_port_info['line'] = dict_val['line']
+                pm_port_info['oper_err'] = dict_val['oper_err']
+                continue
+
+            # port assigned mac address 683b.78f3.3118
+            m = p1_4.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['port_mac'] = dict_val['port_mac']
+                continue
+
+            # idb port vlan id 1  default vlan id 1
+            m = p1_5.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['idb_port_vlan'] = int(dict_val['idb_port_vlan'])
+                pm_port_info['def_vlan_id'] = int(dict_val['def_vlan_id'])
+                continue
+
+            # internalVlan 0x0  remapVlan 0x0
+            m = p1_6.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['internal_vlan'] = dict_val['internal_vlan']
+                continue
+
+            # dtp special no  pagp special no
+            m = p1_7.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['dtp_special'] = dict_val['dtp_special']
+                pm_port_info['pagp_special'] = dict_val['pagp_special']
+                continue
+
+            # speed: 100M   duplex: full   mode: access   encap: native 
+            m = p1_8.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['speed'] = dict_val['speed']
+                pm_port_info['duplex'] = dict_val['duplex']
+                pm_port_info['mode'] = dict_val['mode']
+                pm_port_info['encap'] = dict_val['encap']
+                continue
+
+            # dtp nonegotiate: FALSE 
+            m = p1_9.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['dtp_nonego'] = dict_val['dtp_nonego']
+                continue
+
+            # flowcontrol receive: on   flowcontrol send: off 
+            m = p1_10.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['flow_ctrl_receive'] = dict_val['flow_ctrl_receive']
+                pm_port_info['flow_ctrl_send'] = dict_val['flow_ctrl_send']
+                continue
+
+            # linkflapcnt: 0  dtpflapcnt: 0  pagpflapcnt: 0
+            m = p1_11.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['link_flap_cnt'] = int(dict_val['link_flap_cnt'])
+                pm_port_info['dtp_flap_cnt'] = int(dict_val['dtp_flap_cnt'])
+                pm_port_info['pagp_flap_cnt'] = int(dict_val['pagp_flap_cnt'])
+                continue
+
+            # unidirectional: off 
+            m = p1_12.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['unidirectional'] = dict_val['unidirectional']
+                continue
+
+            # operVlan: 0 
+            m = p1_13.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['oper_vlan'] = int(dict_val['oper_vlan'])
+                continue
+
+            # flag:     0 
+            m = p1_14.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['flag'] = int(dict_val['flag'])
+                continue
+
+            # sm(pm_port 1/24), running yes, state access_multi
+            m = p1_15.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['sm'] = dict_val['sm']
+                pm_port_info['running'] = dict_val['running']
+                pm_port_info['state'] = dict_val['state']
+                continue
+
+            # Last transition recorded: (cfg_access_vvlanid)-> pagp_port_cleanup (cfg_access_vvlanid)-> pagp (cfg_access_vvlanid)-> pre_pagp_may_suspend (cfg_access_vvlanid)-> pagp_may_suspend (pagp_continue)-> start_pagp (pagp_continue)-> pagp (dont_bundle)-> pre_post_pagp (dont_bundle)-> post_pagp (dtp_access_multi)-> access_multi (bulk_sync)-> access_multi 
+            m = p1_16.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['last_transition'] = dict_val['last_transition']
+                continue
+
+            # vp:  1 100
+            m = p1_17.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['vp'] = dict_val['vp']
+                continue
+
+            # vlans:  1 100
+            m = p1_18.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['vlans'] = dict_val['vlans']
+                continue
+
+            # trunkVlans:  1 100
+            m = p1_19.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['trunk_vlans'] = dict_val['trunk_vlans']
+                continue
+
+            # fwdVlans:  100
+            m = p1_20.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['fwd_vlans'] = int(dict_val['fwd_vlans'])
+                continue
+
+            # currentlyPrunedVlans:  none
+            m = p1_21.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['current_pruned_vlans'] = dict_val['current_pruned_vlans']
+                continue
+
+            # previouslyPrunedVlans:  none
+            m = p1_22.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['previous_pruned_vlans'] = dict_val['previous_pruned_vlans']
+                continue
+
+            # protocols: ip=on ipx=on misc=on other=on 
+            m = p1_23.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'pm_port_info' not in ret_dict:
+                    pm_port_info = ret_dict.setdefault('pm_port_info', {})
+                pm_port_info['protocols'] = dict_val['protocols']
+                continue
+
+            # access mode: unknown   access vlanid: 1   native vlanid: 1 
+            m = p2.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'config_values' not in ret_dict:
+                    config_values = ret_dict.setdefault('config_values', {})
+                config_values['access_mode'] = dict_val['access_mode']
+                config_values['access_vlan_id'] = int(dict_val['access_vlan_id'])
+                config_values['native_vlan_id'] = int(dict_val['native_vlan_id'])
+                continue
+
+            # trunkVlans:  1-4094
+            m = p2_1.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'config_values' not in ret_dict:
+                    config_values = ret_dict.setdefault('config_values', {})
+                config_values['trunk_vlans'] = dict_val['trunk_vlans']
+                continue
+
+            # pruneVlans:  2-1001primary host vlanid: 32767    secondary host vlanid: 32767
+            m = p2_2.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'config_values' not in ret_dict:
+                    config_values = ret_dict.setdefault('config_values', {})
+                config_values['prune_vlans'] = dict_val['prune_vlans']
+                config_values['primary_host_vlan'] = int(dict_val['primary_host_vlan'])
+                config_values['sec_host_vlan'] = int(dict_val['sec_host_vlan'])
+                continue
+
+            # primary promiscuous vlanid: 32767
+            m = p2_3.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'config_values' not in ret_dict:
+                    config_values = ret_dict.setdefault('config_values', {})
+                config_values['pri_promiscuous_vlan'] = int(dict_val['pri_promiscuous_vlan'])
+                continue
+
+            # secondary prom vlans:  none
+            m = p2_4.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'config_values' not in ret_dict:
+                    config_values = ret_dict.setdefault('config_values', {})
+                config_values['sec_prom_vlan'] = dict_val['sec_prom_vlan']
+                continue
+
+            # speed: auto speedauto: auto-default   duplex: auto   mode: access 
+            m = p2_5.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'config_values' not in ret_dict:
+                    config_values = ret_dict.setdefault('config_values', {})
+                config_values['speed'] = dict_val['speed']
+                config_values['speed_auto'] = dict_val['speed_auto']
+                config_values['duplex'] = dict_val['duplex']
+                config_values['mode'] = dict_val['mode']
+                continue
+
+            # encap: dot1q   nonegotiate: false 
+            m = p2_6.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'config_values' not in ret_dict:
+                    config_values = ret_dict.setdefault('config_values', {})
+                config_values['encap'] = dict_val['encap']
+                config_values['nonego'] = dict_val['nonego']
+                continue
+                
+             
+            # jumbo cap: true   jumbo: false  mtu: 1500  sync-delay: 210  HOL: Enable
+            m = p2_7.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'config_values' not in ret_dict:
+                    config_values = ret_dict.setdefault('config_values', {})
+                config_values['jumbo_cap'] = dict_val['jumbo_cap']
+                config_values['jumbo'] = dict_val['jumbo']
+                config_values['mtu'] = int(dict_val['mtu'])
+                config_values['sync_delay'] = int(dict_val['sync_delay'])
+                config_values['hol'] = dict_val['hol']
+                continue
+
+            # bcast-supp-level: 10000   mcast-supp-level: 10000   ucast-supp-level: 10000 
+            m = p2_8.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'config_values' not in ret_dict:
+                    config_values = ret_dict.setdefault('config_values', {})
+                config_values['bcast_sup_level'] = int(dict_val['bcast_sup_level'])
+                config_values['mcast_sup_level'] = int(dict_val['mcast_sup_level'])
+                config_values['ucast_sup_level'] = int(dict_val['ucast_sup_level'])
+                continue            
+
+            # disl: off   dtp nonegotiate: FALSE   media: unknown   dualmode 0 
+            m = p2_9.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'config_values' not in ret_dict:
+                    config_values = ret_dict.setdefault('config_values', {})
+                config_values['disl'] = dict_val['disl']
+                config_values['dtp_nonego'] = dict_val['dtp_nonego']
+                config_values['media'] = dict_val['media']
+                config_values['dualmode'] = int(dict_val['dualmode'])
+                continue            
+
+            # tdr_ever_run: FALSE tdr_in_progress: FALSE tdr_result_valid: FALSE
+            m = p2_10.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'config_values' not in ret_dict:
+                    config_values = ret_dict.setdefault('config_values', {})
+                config_values['tdr_ever_run'] = dict_val['tdr_ever_run']
+                config_values['tdr_in_progress'] = dict_val['tdr_in_progress']
+                config_values['tdr_result_valid'] = dict_val['tdr_result_valid']
+                continue
+
+            # tdr_err_code: 0, prbs_err_code: 0
+            m = p2_11.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'config_values' not in ret_dict:
+                    config_values = ret_dict.setdefault('config_values', {})
+                config_values['tdr_error_code'] = int(dict_val['tdr_error_code'])
+                config_values['prbs_err_code'] = int(dict_val['prbs_err_code'])
+                continue
+
+            # PRBS: Stopped PRBS - port was admin down
+            m = p2_12.match(line)
+            if m:
+                dict_val = m.groupdict()
+                if 'config_values' not in ret_dict:
+                    config_values = ret_dict.setdefault('config_values', {})
+                config_values['prbs'] = dict_val['prbs']
+                continue            
+
+        return ret_dict
+
+# ======================================================
+# Parser for 'show interfaces private-vlan mapping'
+# ======================================================
+class ShowInterfacesPrivateVlanMappingSchema(MetaParser):
+    """Schema for show interfaces private-vlan mapping"""
+
+    schema = {
+        'secondary_vlan': {
+            Any(): {
+                'type': str,
+                'interface': str
+            }
+        }
+    }
+
+class ShowInterfacesPrivateVlanMapping(ShowInterfacesPrivateVlanMappingSchema):
+    """Parser for show interfaces private-vlan mapping"""
+
+    cli_command = 'show interfaces private-vlan mapping'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        # vlan70    71             community   
+        p1 = re.compile(r'^(?P<interface>\w+)\s+(?P<secondary_vlan>\d+)\s+(?P<type>\w+)$')
+
+        result_dict = {}
+        for line in output.splitlines():
+            line = line.strip()
+            # vlan70    71             community        
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                intf_dict = result_dict.setdefault('secondary_vlan', {}).setdefault(int(group['secondary_vlan']), {})                
+
+                intf_dict.update({k:v for k, v in group.items() if v and k != 'secondary_vlan'})
+                intf_dict['interface'] = Common.convert_intf_name(intf_dict['interface'])
+                intf_dict['type'] = intf_dict['type']
+                continue
+
+        return result_dict
+
+# ======================================================
+# Schema for 'show interface {interface_id} etherchannel'
+# ====================================================== 
+
+class ShowInterfaceEtherchannelSchema(MetaParser):
+    """Schema for show interface {interface_id} etherchannel"""
+
+    schema = {
+        'port_state': str,
+        'channel_group': int,
+        'mode': str,
+        'gcchange': str,
+        'port_channel': str,
+        'gc': str,
+        'pseudo_port_channel': str,
+        'port_index': int,
+        'load': str,
+        'protocol': str,
+        Optional('flags'): {
+            str: str
+        },
+        Optional('local_information'): {
+            'port': str,
+            'flags': str,
+            'state': str,
+            'priority': str,
+            'admin_key': str,
+            'oper_key': str,
+            'port_number': str,
+            'port_state': str,
+        },
+        'port_age': str
+    }
+
+# ======================================================
+# Parser for 'show interface {interface_id} etherchannel'
+# ====================================================== 
+class ShowInterfaceEtherchannel(ShowInterfaceEtherchannelSchema):
+    """Parser for show interface {interface_id} etherchannel"""
+
+    cli_command = 'show interface {interface_id} etherchannel'
+
+    def cli(self, interface_id, output=None):
+
+        if output is None:
+            cmd = self.cli_command.format(interface_id=interface_id)
+            output = self.device.execute(cmd)
+
+        #Port state    = Up Mstr In-Bndl
+        p1 = re.compile(r'^Port state\s+=\s+(?P<port_state>[\w -]+)$')
+        #Channel group = 2           Mode = On              Gcchange = -
+        p2 = re.compile(r'^Channel group\s+=\s+(?P<channel_group>\d+)\s+Mode\s+=\s+(?P<mode>\w+)\s+Gcchange\s+=\s+(?P<gcchange>\S+)$')
+        #Port-channel  = Po2         GC   =   -             Pseudo port-channel = Po2
+        p3 = re.compile(r'^Port-channel\s+=\s+(?P<port_channel>\w+)\s+GC\s+=\s+(?P<gc>\S+)\s+Pseudo port-channel\s+=\s+(?P<pseudo_port_channel>\S+)$')
+        #Port index    = 0           Load = 0x00            Protocol =    -
+        p4 = re.compile(r'^Port index\s+=\s+(?P<port_index>\d+)\s+Load\s+=\s+(?P<load>\S+)\s+Protocol\s+=\s+(?P<protocol>\S+)$')
+        #Flags:  S - Device is sending Slow LACPDUs   F - Device is sending fast LACPDUs.
+        p5 = re.compile(r'^Flags:\s+(?P<flag>\S+)\s-\s(?P<flag_value>[\S\s]+)\s+(?P<flag2>\w+)\s-\s(?P<flag_value2>[\S\s]+)\.$')
+        #A - Device is in active mode.        P - Device is in passive mode.
+        p5_1 = re.compile(r'^(?P<flag>\S+)\s-\s(?P<flag_value>[\S\s]+)\.\s+(?P<flag2>\S+)\s-\s(?P<flag_value2>[\S\s]+)\.$')
+        #Local information:
+        #                                 LACP port    Admin     Oper    Port        Port
+        # Port          Flags   State     Priority     Key       Key     Number      State
+        # Gi2/0/13      SA      down      32768        0xA       0x0     0x20E       0x4D 
+        p6 = re.compile(r'^(?P<port>Gi[\w\/\d]+)\s+(?P<flags>\w+)\s+(?P<state>\w+)\s+(?P<priority>\d+)'
+                        r'\s+(?P<admin_key>\w+)\s+(?P<oper_key>\w+)\s+(?P<port_number>\w+)\s+(?P<port_state>\w+)$')
+        #Age of the port in the current state: 0d:00h:00m:29s
+        p7 = re.compile(r'^Age of the port in the current state:\s+(?P<age_of_port>\S+)$')
+        
+        ret_dict = {}
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            #Port state    = Up Mstr In-Bndl
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                ret_dict['port_state'] = group['port_state']
+                continue
+
+            #Channel group = 2           Mode = On              Gcchange = -            
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                ret_dict['channel_group'] = int(group['channel_group'])
+                ret_dict['mode'] = group['mode']
+                ret_dict['gcchange'] = group['gcchange']
+                continue
+
+            #Port-channel  = Po2         GC   =   -             Pseudo port-channel = Po2
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                ret_dict['port_channel'] = group['port_channel']
+                ret_dict['gc'] = group['gc']
+                ret_dict['pseudo_port_channel'] = group['pseudo_port_channel']
+                continue
+
+            #Port index    = 0           Load = 0x00            Protocol =    -
+            m = p4.match(line)
+            if m:
+                group = m.groupdict()
+                ret_dict['port_index'] = int(group['port_index'])
+                ret_dict['load'] = group['load']
+                ret_dict['protocol'] = group['protocol']
+                continue
+
+            #Flags:  S - Device is sending Slow LACPDUs   F - Device is sending fast LACPDUs.            
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                flag_dict = ret_dict.setdefault('flags',{})
+                flag_dict[group['flag']] = group['flag_value'].strip()
+                flag_dict[group['flag2']] = group['flag_value2']
+                continue
+
+            #A - Device is in active mode.        P - Device is in passive mode.
+            m = p5_1.match(line)
+            if m:
+                group = m.groupdict()
+                flag_dict = ret_dict.setdefault('flags',{})
+                flag_dict[group['flag']] = group['flag_value']
+                flag_dict[group['flag2']] = group['flag_value2']
+                continue
+
+            #Local information:
+            #                                 LACP port    Admin     Oper    Port        Port
+            # Port          Flags   State     Priority     Key       Key     Number      State
+            # Gi2/0/13      SA      down      32768        0xA       0x0     0x20E       0x4D             
+            m = p6.match(line)
+            if m:
+                group = m.groupdict()
+                info_dict = ret_dict.setdefault('local_information',{})
+                info_dict['port'] = group['port']
+                info_dict['flags'] = group['flags']
+                info_dict['state'] = group['state']
+                info_dict['priority'] = group['priority']
+                info_dict['admin_key'] = group['admin_key']
+                info_dict['oper_key'] = group['oper_key']
+                info_dict['port_number'] = group['port_number']
+                info_dict['port_state'] = group['port_state']
+                continue
+
+            #Age of the port in the current state: 0d:00h:00m:29s
+            m = p7.match(line)
+            if m:
+                group = m.groupdict()
+                ret_dict['port_age'] = group['age_of_port']
+                continue
+
+        return ret_dict
+
+
+class ShowInterfacesCapabilitiesSchema(MetaParser):
+    """
+        Schema for show interfaces capabilities
+    """
+
+    schema = {
+        'interface': {
+            Any() : {
+                Any() : str,
+            }
+        }
+    }
+
+
+class ShowInterfacesCapabilities(ShowInterfacesCapabilitiesSchema):
+    """
+        parser for show interfaces capabilities
+    """
+
+    cli_command = ['show interfaces capabilities', 'show interfaces {interface} capabilities']
+
+    def cli(self, interface=None, output=None):
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            
+            output = self.device.execute(cmd)
+
+        # TenGigabitEthernet3/1/3
+        p1 = re.compile(r'^(?P<interface>[\w\/\d\.]+)$')
+
+        # Model:                 WS-C3650-48PD
+        # Type:                  SFP-10G-ACTIVE-CABLE
+        # Speed:                 10000
+        # Duplex:                full
+        p2 = re.compile(r'^(?P<key_name>[\w\s\.]+):\s+(?P<value>.+)$')
+
+        # tx-(2p6q3t)
+        p3 = re.compile(r'^(?P<qos_tx>tx-.+)$')
+        
+        ret_dict = {}
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            # TenGigabitEthernet3/1/3
+            m = p1.match(line)
+            if m:
+                int_dict = ret_dict.setdefault('interface', {}).setdefault(Common.convert_intf_name(m.groupdict()['interface']), {})
+                continue
+
+            # Model:                 WS-C3650-48PD
+            # Type:                  SFP-10G-ACTIVE-CABLE
+            # Speed:                 10000
+            # Duplex:                full
+            m = p2.match(line)
+            if m:
+                key = m.groupdict()['key_name'].strip().lower().replace(' ', '_').replace('.', '')
+                int_dict[key] = m.groupdict()['value']
+                continue
+            
+            # tx-(2p6q3t)
+            m = p3.match(line)
+            if m:
+                int_dict[key] = f"{int_dict[key]} {m.groupdict()['qos_tx']}"
+        
+        return ret_dict
+
+class ShowInterfaceFlowControlSchema(MetaParser):
+    """Schema for show interfaces {interface_id} flowcontrol"""
+
+    schema = {
+        'interface': {
+            'port': str,
+            'send_fc_admin': str,
+            'send_fc_oper': str,
+            'receive_fc_admin': str,
+            'receive_fc_oper': str,
+            'rx_pause': int,
+            'tx_pause': int,
+        }
+    }
+
+# ======================================================
+# Parser for 'show interface {interface_id} flowcontrol'
+# ====================================================== 
+class ShowInterfaceFlowControl(ShowInterfaceFlowControlSchema):
+    """Parser for show interfaces {interface_id} flowcontrol"""
+
+    cli_command = 'show interfaces {interface_id} flowcontrol'
+
+    def cli(self, interface_id, output=None):
+
+        if output is None:
+            cmd = self.cli_command.format(interface_id=interface_id)
+            output = self.device.execute(cmd)
+
+        # Port            Send FlowControl  Receive FlowControl  RxPause TxPause
+        #                 admin    oper     admin    oper
+        # ------------    -------- -------- -------- --------    ------- -------
+        # Fo2/1/0/10      Unsupp.  Unsupp.  on       on          0       0
+        p1 = re.compile(r'^(?P<port>[\w\/\d]+)\s+(?P<send_fc_admin>[\.\w]+)\s+(?P<send_fc_oper>[\.\w]+)\s+(?P<receive_fc_admin>\w+)\s+(?P<receive_fc_oper>\w+)\s+(?P<rx_pause>\d+)\s+(?P<tx_pause>\d+)$')
+
+        ret_dict = {}
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            # Port            Send FlowControl  Receive FlowControl  RxPause TxPause
+            #                 admin    oper     admin    oper
+            # ------------    -------- -------- -------- --------    ------- -------
+            # Fo2/1/0/10      Unsupp.  Unsupp.  on       on          0       0        
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                info_dict = ret_dict.setdefault('interface',{})
+                info_dict['port'] = Common.convert_intf_name(group['port'])
+                info_dict['send_fc_admin'] = group['send_fc_admin']
+                info_dict['send_fc_oper'] = group['send_fc_oper']
+                info_dict['receive_fc_admin'] = group['receive_fc_admin']
+                info_dict['receive_fc_oper'] = group['receive_fc_oper']
+                info_dict['rx_pause'] = int(group['rx_pause'])
+                info_dict['tx_pause'] = int(group['tx_pause'])
+                continue
+
+        return ret_dict
+
+
+class ShowInterfacesVlanMappingSchema(MetaParser):
+    """Schema for show interfaces {interface} vlan mapping"""
+
+    schema = {
+        'vlan_on_wire': {
+            Any(): {
+                'trans_vlan': int,
+                'operation': str,
+            }
+        }
+    }
+
+
+class ShowInterfacesVlanMapping(ShowInterfacesVlanMappingSchema):
+    """Parser for show interfaces {interface} vlan mapping"""
+
+    cli_command = 'show interface {interface} vlan mapping'
+
+    def cli(self, interface, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        # 20                                    30             1-to-1
+        p1 = re.compile(r"^(?P<vlan_on_wire>\d+)\s+(?P<trans_vlan>\d+)\s+(?P<operation>\S+)$")
+
+        ret_dict = {}
+
+        for line in output.splitlines():
+
+            # 20                                    30             1-to-1
+            m = p1.match(line)
+            if m:
+                dict_val = m.groupdict()
+                vlan_dict = ret_dict.setdefault('vlan_on_wire', {}).setdefault(dict_val['vlan_on_wire'], {})
+                vlan_dict['trans_vlan'] = int(dict_val['trans_vlan'])
+                vlan_dict['operation'] = dict_val['operation']
+                continue
+
+        return ret_dict
+
+# ======================================================
+# Parser for 'show interface <interface> human-readable | i drops'
+# ======================================================
+class ShowInterfaceHumanReadableIncludeDropsSchema(MetaParser):
+    """Schema for show interface human-readable include drops"""
+
+    schema = {
+        'unknown_protocol_drops': int,
+        'size': int,
+        'max': int,
+        'drops': int,
+        'flushes': int,
+        'total_output_drops': int
+    }
+
+class ShowInterfaceHumanReadableIncludeDrops(ShowInterfaceHumanReadableIncludeDropsSchema):
+    """Parser for show interface human-readable include drops"""
+
+    cli_command = 'show interface {interface} human-readable | i drops'
+
+    def cli(self, interface, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command.format(interface=interface))
+            
+        #   Input queue: 0/2000/0/0 (size/max/drops/flushes); Total output drops: 0
+
+        p1 = re.compile(r"^Input queue: (?P<size>\d+)/(?P<max>\d+)/(?P<drops>\d+)/(?P<flushes>\d+)\s+\(size/max/drops/flushes\); Total output drops:\s+(?P<total_output_drops>\d+)$")
+
+        # 0 unknown protocol drops
+        p2 = re.compile(r"^(?P<unknown_protocol_drops>\d+)\s+unknown protocol drops$")
+
+        ret_dict = {}
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            #   Input queue: 0/2000/0/0 (size/max/drops/flushes); Total output drops: 0
+            m = p1.match(line)
+            if m:
+                dict_val = m.groupdict()
+                ret_dict['size'] = int(dict_val['size'])
+                ret_dict['max'] = int(dict_val['max'])
+                ret_dict['drops'] = int(dict_val['drops'])
+                ret_dict['flushes'] = int(dict_val['flushes'])
+                ret_dict['total_output_drops'] = int(dict_val['total_output_drops'])
+                continue
+
+            # 0 unknown protocol drops
+            m = p2.match(line)
+            if m:
+                dict_val = m.groupdict()
+                ret_dict['unknown_protocol_drops'] = int(dict_val['unknown_protocol_drops'])
+
+        return ret_dict
@@ -23,7 +23,9 @@
         *  show mpls ldp parameters
         *  show mpls forwarding-table
         *  show mpls forwarding-table <prefix>
+        *  show mpls forwarding-table interface tunnel <tunnelid>
         *  show mpls forwarding-table detail
+        *  show mpls forwarding-table summary
         *  show mpls forwarding-table vrf <vrf>
         *  show mpls forwarding-table vrf <vrf> detail
         *  show mpls interfaces
@@ -31,7 +33,15 @@
         *  show mpls interfaces <interface> detail
         *  show mpls interfaces detail
         *  show mpls l2transport vc detail
+        *  show mpls l2transport vc <vc_id> detail
         *  show mpls l2transport vc
+        *  show mpls l2transport vc <vc_id>
+        *  show mpls traffic-eng tunnels {tunnel}
+        *  show mpls traffic-eng tunnels
+        *  show mpls traffic-eng tunnels brief
+        *  show mpls traffic-eng autoroute
+        *  show mpls traffic-eng topology
+        *  show mpls traffic-eng fast-reroute database detail
 """
 
 import re
@@ -1056,7 +1066,7 @@ class ShowMplsLdpCapabilities(ShowMplsLdpCapabilitiesSchema):
     def cli(self, all="", output=None):
         if output is None:
             if not all:
-               cmd = self.cli_command[0]
+                cmd = self.cli_command[0]
             else:
                 cmd = self.cli_command[1].format(all=all)
             out = self.device.execute(cmd)
@@ -1601,12 +1611,16 @@ class ShowMplsLdpIgpSync(ShowMplsLdpIgpSyncSchema):
 
 
 class ShowMplsForwardingTableSchema(MetaParser):
-    """Schema for
+    """
+    Schema for
         show mpls forwarding-table
         show mpls forwarding-table {prefix}
         show mpls forwarding-table vrf <vrf>
         show mpls forwarding-table detail
-        show mpls forwarding-table vrf <vrf> detail"""
+        show mpls forwarding-table interface tunnel <tunnelid>
+        show mpls forwarding-table vrf <vrf> detail
+        show mpls forwarding-table <prefix> <mask> algo <algo>
+    """
 
     schema = {
         'vrf':{
@@ -1617,9 +1631,11 @@ class ShowMplsForwardingTableSchema(MetaParser):
                             Any():{
                                 'prefix_or_tunnel_id':{
                                     Any(): {
+                                        Optional('prefix_type'): str,
+                                        Optional('prefix_no'): Any(),
                                         Optional('outgoing_interface'):{
                                             Any():{
-                                                'bytes_label_switched': int,
+                                                Optional('bytes_label_switched'): int,
                                                 Optional('next_hop'): str,
                                                 Optional('tsp_tunnel'): bool,
                                                 Optional('merged'): bool,
@@ -1637,6 +1653,12 @@ class ShowMplsForwardingTableSchema(MetaParser):
                                                     Optional('slots'): list,
                                                 },
                                                 Optional('broadcast'): bool,
+                                                Optional('flexalgo_info'): {
+                                                    'pdb_index': int,
+                                                    'metric': int,
+                                                    'algo': int,
+                                                    'via_srms': int,
+                                                },
                                             }
                                         }
                                     },
@@ -1650,21 +1672,37 @@ class ShowMplsForwardingTableSchema(MetaParser):
     }
 
 class ShowMplsForwardingTable(ShowMplsForwardingTableSchema):
-    """Parser for
+    """
+    Parser for
         show mpls forwarding-table
         show mpls forwarding-table {prefix}
-        show mpls forwarding-table vrf {vrf}"""
+        show mpls forwarding-table vrf {vrf}
+        show mpls forwarding-table interface tunnel <tunnelid>
+        show mpls forwarding-table <prefix> <mask> algo <algo>
+        show mpls forwarding-table | sect <filter>
+    """
 
     cli_command = ['show mpls forwarding-table vrf {vrf}',
                    'show mpls forwarding-table {prefix}',
-                   'show mpls forwarding-table']
+                   'show mpls forwarding-table',
+                   'show mpls forwarding-table interface tunnel {tunnelid}',
+                   'show mpls forwarding-table {prefix} {mask} algo {algo}',
+                   'show mpls forwarding-table | sect {filter}']
+
+    exclude = ['bytes_label_switched']
 
-    def cli(self, vrf="", prefix="", output=None):
+    def cli(self, vrf="", prefix="",tunnelid="", filter="", mask="", algo="", output=None):
         if output is None:
             if vrf:
                 cmd = self.cli_command[0].format(vrf=vrf)
             elif prefix:
                 cmd = self.cli_command[1].format(prefix=prefix)
+            elif tunnelid:
+                cmd = self.cli_command[3].format(tunnelid=tunnelid)
+            elif prefix and mask and algo:
+                cmd = self.cli_command[4].format(prefix=prefix, mask=mask, algo=algo)
+            elif filter:
+                cmd = self.cli_command[5].format(filter=filter)            
             else:
                 cmd = self.cli_command[2]
 
@@ -1685,30 +1723,42 @@ class ShowMplsForwardingTable(ShowMplsForwardingTableSchema):
         #            No Label   10.23.120.0/24[V]   \
         # None       No Label   10.0.0.16/30     0             Gi3        10.0.0.9
         # 39    [M]  16052      10.169.14.241/32   \
-        # 235        211        10.55.0.0/24     0             Te0/2/0.102  192.168.4.1   
+        # 235        211        10.55.0.0/24     0             Te0/2/0.102  192.168.4.1
         # 37         142409     172.16.100.1/32   \
         #                             0             Gi0/1/6    192.168.10.253
         #            107829     172.16.100.1/32   \
         #                             0             Gi0/1/7    192.168.10.254
-        p1 = re.compile(r'((?P<local_label>\d+|[Nn]one) +)?(?:\[(?P<t>(?:T|M)+)\] +)?'
-                        r'(?P<outgoing_label>(\w+|(No|Pop) +Label)) +(?P<prefix_or_tunnel_id>[\S]+) +\\$')
-
-        p2 = re.compile(r'^(?P<bytes_label_switched>\d+)( +(?P<interface>\S+))?( +(?P<next_hop>[\w\.]+))?$')
+        # 25         16021      0-23.23.23.23/32-4 (10:30:130:1)   \
+        #                              0             Et0/2      13.1.1.2
+        p1 = re.compile(r'^((?P<local_label>\d+|[Nn]one) +)?(?:\[(?P<info_tag>(?:T|M)+)\] +)?'
+                        r'(?P<outgoing_label>(\w+|(No|Pop) +Label)) +(?P<prefix_or_tunnel_id>[\S]+) '
+                        r'+\(?(?P<flexalgo_info>\d+:\d+:\d+:\d+)?\)?'
+                        r'(?P<bytes_label_switched>\d*)( +(?P<interface>\S+))?( +(?P<next_hop>[\w\.]+))?$')
 
         #       [T]  16130      10.25.40.40/32   0             Tu1        point2point
         # 22    [M]  Pop Label  192.168.0.1/32   0             Gi2        192.168.0.2
         # 22    [T]  Pop Label  1/1[TE-Bind]     0             Tu1        point2point
-        p2_2 = re.compile(r'^(?:(?P<local_label>\w+) +)?(?:\[(?P<t>(?:T|M)+)\] +)?'
-                           '(?P<outgoing_label>(?:(?:A|a)ggregate|Untagged|(?:No|Pop) '
-                           'Label|(?:No|Pop) (?:T|t)ag|\d\/\w*|\d|\d\/)+)(?:\['
-                           '(?P<t1>(T)+)\] +)? +(?P<prefix_or_tunnel_id>[\w\(\)\:\ |\S]+) +'
-                           '(?P<bytes_label_switched>\d+)(?: +(?P<interface>\S+))?(?: +'
-                           '(?P<next_hop>[\w\.]+))?$')
-
-        p2_3 = re.compile(r'^((?P<local_label>\w+) +)?(\[(?P<t>(T)+)\] +)?'
+        p2_1 = re.compile(r'^(?:(?P<local_label>\w+) +)?(?:\[(?P<info_tag>(?:T|M)+)\] +)?'
+                           r'(?P<outgoing_label>(?:(?:A|a)ggregate|Untagged|(?:No|Pop) '
+                           r'Label|(?:No|Pop) (?:T|t)ag|\d\/\w*|\d|\d\/)+)(?:\['
+                           r'(?P<t1>(T)+)\] +)? +(?P<prefix_or_tunnel_id>[\w\(\)\:|\S]+) '
+                           r'+\(?(?P<flexalgo_info>\d+:\d+:\d+:\d+)?\)?'
+                           r' +(?P<bytes_label_switched>\d*)(?: +(?P<interface>\S+))?(?: +'
+                           r'(?P<next_hop>[\w\.]+))?$')
+
+        # 22    [T]  Pop Label  1/1[TE-Bind]     0             Tu1        point2point
+        p2_2 = re.compile(r'^((?P<local_label>\w+) +)?(\[(?P<info_tag>(T)+)\] +)?'
                           r'(?P<outgoing_label>((A|a)ggregate|(No|Pop) Label|(No|Pop) tag|\d|\d\/)+)?'
-                          r'(\[(?P<t1>(T)+)\] +)? +(?P<prefix_or_tunnel_id>[\w\.\[\]\-\s]+)'
+                          r'(\[(?P<t1>(T)+)\] +)? +(?P<prefix_or_tunnel_id>[\w\.\[\]\-\s]+) '
+                          r'+\(?(?P<flexalgo_info>\d+:\d+:\d+:\d+)?\)?'
                           r' +(?P<bytes_label_switched>\d+)( +(?P<interface>\S+))?( +(?P<next_hop>[\w\.]+))?$')
+        
+        #23    [T]  No Label   [mdt 3001:1 0][V]   \
+        #                               200497062836  aggregate/vrf3001        
+        p2_3 = re.compile(r'^((?P<local_label>\d+|[Nn]one)\s+)?(?:\[(?P<info_tag>(?:T|M)+)\]\s+)?'
+                          r'(?P<outgoing_label>(\w+|(No|Pop) +Label))\s+\[(?P<prefix_type>\w+)\s+'
+                          r'(?P<prefix_or_tunnel_id>\S+)\s+\(*(?P<prefix_no>[a-zA-Z0-9]+)\)*\]\[V\]\s+'
+                          r'(?P<bytes_label_switched>\d*)(\s+(?P<interface>\S+))?(\s+(?P<next_hop>[\w\.]+))?$')
 
         #         MAC/Encaps=18/18, MRU=1530, Label Stack{}
         #         MAC/Encaps=18/18, MRU=1530, Label Stack{}, via Ls0
@@ -1729,12 +1779,24 @@ class ShowMplsForwardingTable(ShowMplsForwardingTableSchema):
         #      Broadcast
         p8 = re.compile(r'^(B|b)roadcast$')
 
+        partial_line = None
+        local_label = "No Label"
+        feature_dict = {}
+
         for line in out.splitlines():
             line = line.strip()
             line = line.replace('\t',' ')
+            if '\\' in line:
+                partial_line = line.replace('\\',' ')
+                continue
+            if partial_line is not None:
+                line = partial_line + line
+                partial_line = None
 
             # 9301       No Label   172.16.100.1/32[V]   \
             #                                       0             Po1.51     192.168.10.253
+            outgoing_label = "No Label"
+            prefix_or_tunnel_id = "None"
             m = p1.match(line)
             if m:
                 group = m.groupdict()
@@ -1744,11 +1806,7 @@ class ShowMplsForwardingTable(ShowMplsForwardingTableSchema):
                         local_label = int(local_label)
                 outgoing_label = group['outgoing_label']
                 prefix_or_tunnel_id = group['prefix_or_tunnel_id'].strip()
-                continue
 
-            m = p2.match(line)
-            if m:
-                group = m.groupdict()
                 base_feature_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {}). \
                                            setdefault('local_label', {}).\
                                            setdefault(local_label, {}).\
@@ -1764,18 +1822,32 @@ class ShowMplsForwardingTable(ShowMplsForwardingTableSchema):
                 feature_dict = base_feature_dict.setdefault('outgoing_interface',{}).setdefault(interface, {})
                 if group['next_hop']:
                     feature_dict.update({'next_hop': group['next_hop']})
-                feature_dict.update({'bytes_label_switched': int(group['bytes_label_switched'])})
-
+                if group['info_tag']:
+                    if 'T' in group['info_tag']:
+                        feature_dict.update({'tsp_tunnel': True})
+                    if 'M' in group['info_tag']:
+                        feature_dict.update({'merged': True})
+                if group['bytes_label_switched']:
+                    feature_dict.update({'bytes_label_switched': int(group['bytes_label_switched'])})
+                if group['flexalgo_info']:
+                    pdb_index, metric, algo, via_srms = group['flexalgo_info'].split(':')
+                    feature_dict.update({'flexalgo_info': {
+                            'pdb_index': int(pdb_index),
+                            'metric': int(metric),
+                            'algo': int(algo),
+                            'via_srms': int(via_srms),
+                        }
+                    })
                 continue
 
-            m = p2_2.match(line)
+            m = p2_1.match(line)
             if m:
                 group = m.groupdict()
                 if group['local_label']:
                     local_label = group['local_label']
                     if local_label.isdigit():
                         local_label = int(local_label)
-                
+
                 outgoing_label = group['outgoing_label']
                 prefix_or_tunnel_id = group['prefix_or_tunnel_id'].strip()
 
@@ -1795,17 +1867,27 @@ class ShowMplsForwardingTable(ShowMplsForwardingTableSchema):
                 feature_dict = base_feature_dict.setdefault('outgoing_interface', {}).setdefault(interface, {})
                 if group['next_hop']:
                     feature_dict.update({'next_hop': group['next_hop']})
-                if group['t']:
-                    if 'T' in group['t']:
+                if group['info_tag']:
+                    if 'T' in group['info_tag']:
                         feature_dict.update({'tsp_tunnel': True})
-                    if 'M' in group['t']:
+                    if 'M' in group['info_tag']:
                         feature_dict.update({'merged': True})
                 if group['t1']:
                     feature_dict.update({'tsp_tunnel': True})
-                feature_dict.update({'bytes_label_switched': int(group['bytes_label_switched'])})
+                if group['bytes_label_switched']:
+                    feature_dict.update({'bytes_label_switched': int(group['bytes_label_switched'])})
+                if group['flexalgo_info']:
+                    pdb_index, metric, algo, via_srms = group['flexalgo_info'].split(':')
+                    feature_dict.update({'flexalgo_info': {
+                            'pdb_index': int(pdb_index),
+                            'metric': int(metric),
+                            'algo': int(algo),
+                            'via_srms': int(via_srms),
+                        }
+                    })
                 continue
 
-            m = p2_3.match(line)
+            m = p2_2.match(line)
             if m:
                 group = m.groupdict()
                 if group['local_label']:
@@ -1816,7 +1898,6 @@ class ShowMplsForwardingTable(ShowMplsForwardingTableSchema):
                 outgoing_label = group['outgoing_label']
                 prefix_or_tunnel_id = group['prefix_or_tunnel_id'].strip()
 
-
                 base_feature_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {}). \
                                            setdefault('local_label', {}). \
                                            setdefault(local_label, {}). \
@@ -1832,13 +1913,63 @@ class ShowMplsForwardingTable(ShowMplsForwardingTableSchema):
                 feature_dict = base_feature_dict.setdefault('outgoing_interface', {}).setdefault(interface, {})
                 if group['next_hop']:
                     feature_dict.update({'next_hop': group['next_hop']})
-                if group['t']:
-                    feature_dict.update({'tsp_tunnel': True})
+                if group['info_tag']:
+                    if 'T' in group['info_tag']:
+                        feature_dict.update({'tsp_tunnel': True})
+                    if 'M' in group['info_tag']:
+                        feature_dict.update({'merged': True})
                 if group['t1']:
                     feature_dict.update({'tsp_tunnel': True})
-                feature_dict.update({'bytes_label_switched': int(group['bytes_label_switched'])})
+                if group['bytes_label_switched']:
+                    feature_dict.update({'bytes_label_switched': int(group['bytes_label_switched'])})
+                if group['flexalgo_info']:
+                    pdb_index, metric, algo, via_srms = group['flexalgo_info'].split(':')
+                    feature_dict.update({'flexalgo_info': {
+                            'pdb_index': int(pdb_index),
+                            'metric': int(metric),
+                            'algo': int(algo),
+                            'via_srms': int(via_srms),
+                        }
+                    })
                 continue
 
+            #23    [T]  No Label   [mdt 3001:1 0][V]   \
+            #                               200497062836  aggregate/vrf3001            
+            m = p2_3.match(line)
+            if m:
+                group = m.groupdict()
+                if group['local_label']:
+                    local_label = group['local_label']
+                    if local_label.isdigit():
+                        local_label = int(local_label)
+
+                outgoing_label = group['outgoing_label']
+                prefix_or_tunnel_id = group['prefix_or_tunnel_id']
+
+                base_feature_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {}). \
+                                           setdefault('local_label', {}). \
+                                           setdefault(local_label, {}). \
+                                           setdefault('outgoing_label_or_vc', {}). \
+                                           setdefault(outgoing_label, {}). \
+                                           setdefault('prefix_or_tunnel_id', {}). \
+                                           setdefault(prefix_or_tunnel_id, {})
+
+                if group['interface']:
+                    interface = Common.convert_intf_name(group['interface'])
+                else:
+                    interface = outgoing_label
+                prefix_no = int(group['prefix_no']) if group['prefix_no'].isdigit() else group['prefix_no']
+                base_feature_dict.update({
+                    'prefix_type': group['prefix_type'],
+                    'prefix_no': prefix_no
+                })
+                feature_dict = base_feature_dict.setdefault('outgoing_interface', {}).setdefault(interface, {})
+                if group['next_hop']:
+                    feature_dict.update({'next_hop': group['next_hop']})
+                if group['bytes_label_switched']:
+                    feature_dict.update({'bytes_label_switched': int(group['bytes_label_switched'])})
+                continue
+                
             #     MAC/Encaps=18/18, MRU=1530, Label Stack{}
             m = p3.match(line)
             if m:
@@ -1891,7 +2022,6 @@ class ShowMplsForwardingTable(ShowMplsForwardingTableSchema):
 
         return result_dict
 
-
 class ShowMplsForwardingTableDetail(ShowMplsForwardingTable):
     """Parser for
         show mpls forwarding-table detail
@@ -2151,7 +2281,9 @@ class ShowMplsInterface(ShowMplsInterfaceSchema):
 class ShowMplsL2TransportSchema(MetaParser):
     """
     Schema for show mpls l2transport vc
+               show mpls l2transport vc <vc_id>
                show mpls l2transport vc detail
+               show mpls l2transport vc <vc_id> detail
     """
 
     schema = {
@@ -2173,6 +2305,7 @@ class ShowMplsL2TransportSchema(MetaParser):
                         Optional('imposed_label_stack'): str,
                         Optional('default_path'): str,
                         Optional('preferred_path'): str,
+                        Optional('preferred_path_state'): str,
                     },
                 },
                 Optional('line_protocol_status'): str,
@@ -2252,11 +2385,16 @@ class ShowMplsL2TransportDetail(ShowMplsL2TransportSchema):
     """
     Parser for show mpls l2transport vc detail
     """
-    cli_command = 'show mpls l2transport vc detail'
+    cli_command = ['show mpls l2transport vc detail',
+                   'show mpls l2transport vc {vc_id} detail'
+                   ]
 
-    def cli(self, output=None):
+    def cli(self, vc_id="", output=None):
         if output is None:
-            out = self.device.execute(self.cli_command)
+            if not vc_id:
+                out = self.device.execute(self.cli_command[0])
+            else:
+                out = self.device.execute(self.cli_command[1].format(vc_id=vc_id))
         else:
             out = output
 
@@ -2277,7 +2415,7 @@ class ShowMplsL2TransportDetail(ShowMplsL2TransportSchema):
                          ' +VC +ID: +(?P<vc_id>\d+), +VC +status: +(?P<vc_status>\w+)$')
 
         #   Preferred path: not configured
-        p3 = re.compile(r'^Preferred +path: +(?P<preferred_path>[\S\s]+)$')
+        p3 = re.compile(r'^Preferred +path: +(?P<preferred_path>[a-zA-Z0-9 ]+)(?:\,\s+(?P<state>\S+)$)?$')
 
         #   Default path: active
         p4 = re.compile(r'^Default +path: +(?P<default_path>[\S\s]+)$')
@@ -2290,16 +2428,18 @@ class ShowMplsL2TransportDetail(ShowMplsL2TransportSchema):
         p5_1 = re.compile(r'^Next +hop: +(?P<next_hop>[\S\s]+)$')
 
         #   Output interface: Se2/0/2, imposed label stack {16}
+        #   Output interface: Et0/1, imposed label stack {24 21}
         p6 = re.compile(r'^Output +interface: +(?P<output_interface>\S+),'
-                         ' +imposed +label +stack +(?P<imposed_label_stack>\S+)$')
+                         ' +imposed +label +stack +(?P<imposed_label_stack>[^}]+})')
 
         #   Create time: 1d00h, last status change time: 00:00:03
         p7 = re.compile(r'^Create +time: +(?P<create_time>\S+),'
                          ' +last +status +change +time: +(?P<last_status_change_time>\S+)$')
 
         #   Signaling protocol: LDP, peer 10.2.2.2:0 down
+        #   Signaling protocol: LDP, peer unknown
         p8 = re.compile(r'^Signaling +protocol: +(?P<signaling_protocol>\S+)(,'
-                         ' +peer +(?P<peer_id>\S+) +(?P<peer_state>\w+))?$')
+                         ' +peer +(?P<peer_id>\S+)( +(?P<peer_state>\w+))?)?$')
 
         #   MPLS VC labels: local 21, remote 16
         #   MPLS VC labels: local 21, remote unassigned
@@ -2351,8 +2491,8 @@ class ShowMplsL2TransportDetail(ShowMplsL2TransportSchema):
         #   packet drops:  receive 0, send 0
         p17_1 = re.compile(r'^(transit +)?packet +drops: +receive +(?P<pkts_drop_receive>\d+), +seq +error +(?P<seq_error>\d+), +send +(?P<pkts_drop_send>\d+)')
 
-        
-        #  Se5/0          FR DLCI 55         10.0.0.1        55         UP   
+
+        #  Se5/0          FR DLCI 55         10.0.0.1        55         UP
         p18 = re.compile(r'^\s*(?P<local_intf>[\w\W]{0,13}) +(?P<local_circuit>' \
             '[\w\W]{0,26}) +(?P<dest_address>[\d\.]+) +(?P<vc_id>\d+) +' \
             '(?P<vc_status>\S+)')
@@ -2410,7 +2550,7 @@ class ShowMplsL2TransportDetail(ShowMplsL2TransportSchema):
                 final_dict['state'] = group['state']
                 final_dict['line_protocol_status'] = group['line_protocol_status']
                 protocol = final_dict.setdefault('protocol_status', {})
-                protocol.update({group['protocol'] : group['status']})  
+                protocol.update({group['protocol'] : group['status']})
                 continue
 
 
@@ -2429,6 +2569,8 @@ class ShowMplsL2TransportDetail(ShowMplsL2TransportSchema):
             if m:
                 group = m.groupdict()
                 new_final_dict['preferred_path'] = group['preferred_path']
+                if group.get('state'):
+                    new_final_dict['preferred_path_state'] = group['state']
                 continue
 
             m = p4.match(line)
@@ -2582,11 +2724,11 @@ class ShowMplsL2TransportDetail(ShowMplsL2TransportSchema):
                     setdefault(Common.convert_intf_name( \
                         group['local_intf'].strip()), {})
 
-                
+
                 dest_address = local_interface.setdefault( \
                     'destination_address', {}). \
                     setdefault(group['dest_address'], {})
-               
+
                 vc_id_dict = dest_address.setdefault('vc_id', {}). \
                     setdefault(group['vc_id'], {})
                 vc_id_dict.update({'vc_status' : group['vc_status']})
@@ -2652,7 +2794,6 @@ class ShowMplsL2TransportDetail(ShowMplsL2TransportSchema):
                 continue
         return ret_dict
 
-
 class ShowMplsL2TransportVC(ShowMplsL2TransportDetail):
     """
     Parser for show mpls l2transport vc
@@ -2660,4 +2801,2298 @@ class ShowMplsL2TransportVC(ShowMplsL2TransportDetail):
     cli_command = 'show mpls l2transport vc'
 
     def cli(self, output=None):
-        return super().cli(output=output)
\ No newline at end of file
+        if not output:
+            output=self.device.execute(self.cli_command)
+        else:
+            output=output
+        return super().cli(output=output)
+
+class ShowMplsL2TransportVC_VC_Id(ShowMplsL2TransportDetail):
+    """
+    Parser for show mpls l2transport vc vc_id
+    """
+    cli_command = 'show mpls l2transport vc {vc_id}'
+
+    def cli(self, vc_id,output=None):
+        if not output:
+            output=self.device.execute(self.cli_command.format(vc_id=vc_id))
+        else:
+            output=output
+        return super().cli(output=output)
+
+class ShowMplsL2TransportDetail_VC_Statistics_Schema(MetaParser):
+    """Schema for show mpls l2 vc <vc_id> detail | sect VC Statistics"""
+
+    schema = {
+        'statistics': {
+            Optional('packets'): {
+                'received': int,
+                'sent': int,
+            },
+            Optional('bytes'): {
+                'received': int,
+                'sent': int,
+            },
+            Optional('packets_drop'): {
+                'received': int,
+                Optional('seq_error'): int,
+                'sent': int,
+            },
+        },
+
+    }
+
+class ShowMplsL2TransportDetail_VC_Statistics(ShowMplsL2TransportDetail_VC_Statistics_Schema):
+    """
+    Parser for show mpls l2transport vc <vc_id> detail | sect VC statistics
+    """
+    cli_command = 'show mpls l2transport vc {vc_id} detail | sect VC statistics'
+
+    def cli(self, vc_id="",output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command.format(vc_id=vc_id))
+        else:
+            out = output
+
+        #   VC statistics:
+        p1 = re.compile(r'^VC +statistics:$')
+
+        #   packet totals: receive 20040, send 28879
+        p2 = re.compile(r'^(transit +)?packet +totals: +receive'
+                          ' +(?P<pkts_receive>\d+), +send +(?P<pkts_send>\d+)$')
+
+        #   byte totals:   receive 25073016, send 25992388
+        p3 = re.compile(r'^(transit +)?byte +totals: +receive'
+                          ' +(?P<byte_receive>\d+), +send +(?P<byte_send>\d+)$')
+
+        #   transit packet drops:  receive 0, seq error 0, send 0
+        p4 = re.compile(r'^(transit +)?packet +drops: +receive'
+                          ' +(?P<pkts_drop_receive>\d+), +send +(?P<pkts_drop_send>\d+)$')
+
+        #   packet drops:  receive 0, send 0
+        p4_1 = re.compile(r'^(transit +)?packet +drops: +receive +(?P<pkts_drop_receive>\d+), +seq +error +(?P<seq_error>\d+), +send +(?P<pkts_drop_send>\d+)')
+        final_dict={}
+        for line in out.splitlines():
+            line = line.strip()
+
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                statistics_final_dict = final_dict.setdefault('statistics', {})
+                continue
+
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                statistics_final_dict.setdefault('packets', {})
+                statistics_final_dict['packets']['received'] = int(group['pkts_receive'])
+                statistics_final_dict['packets']['sent'] = int(group['pkts_send'])
+                continue
+
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                statistics_final_dict.setdefault('bytes', {})
+                statistics_final_dict['bytes']['received'] = int(group['byte_receive'])
+                statistics_final_dict['bytes']['sent'] = int(group['byte_send'])
+                continue
+
+            m = p4.match(line)
+            if m:
+                group = m.groupdict()
+                statistics_final_dict.setdefault('packets_drop', {})
+                statistics_final_dict['packets_drop']['received'] = int(group['pkts_drop_receive'])
+                statistics_final_dict['packets_drop']['sent'] = int(group['pkts_drop_send'])
+                continue
+
+            m = p4_1.match(line)
+            if m:
+                group = m.groupdict()
+                statistics_final_dict.setdefault('packets_drop', {})
+                statistics_final_dict['packets_drop']['received'] = int(group['pkts_drop_receive'])
+                statistics_final_dict['packets_drop']['seq_error'] = int(group['seq_error'])
+                statistics_final_dict['packets_drop']['sent'] = int(group['pkts_drop_send'])
+        return final_dict
+
+class ShowMplsL2TransportDetail_Destination_address_Schema(MetaParser):
+    """Schema for show mpls l2 vc <vc_id> detail | sect Destination address"""
+
+    schema = {
+        'destination_address': {
+            Any():{
+                'vc_id': {
+                    Any() : {
+                        Optional('local_circuit'): str,
+                        'vc_status': str,
+                    },
+                },
+                Optional('tunnel_label'): str,
+                Optional('next_hop'): str,
+                Optional('output_interface'): str,
+                Optional('imposed_label_stack'): list,
+                Optional('default_path'): str,
+                Optional('preferred_path'): str,
+                Optional('preferred_path_state'): str,
+            },
+        },
+    }
+
+class ShowMplsL2TransportDetail_Destination_address(ShowMplsL2TransportDetail_Destination_address_Schema):
+    """
+    Parser for show mpls l2transport vc <vc_id> detail | sect Destination address
+    """
+    cli_command = 'show mpls l2transport vc {vc_id} detail | sect Destination address'
+
+    def cli(self, vc_id="",output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command.format(vc_id=vc_id))
+        else:
+            out = output
+
+        #   Destination address: 10.2.2.2, VC ID: 1002, VC status: recovering
+        p1 = re.compile(r'^Destination +address: +(?P<address>[\d\.]+),'
+                         ' +VC +ID: +(?P<vc_id>\d+), +VC +status: +(?P<vc_status>\w+)$')
+
+        #   Preferred path: not configured
+        p2 = re.compile(r'^Preferred +path: +(?P<preferred_path>[a-zA-Z0-9 ]+)(?:\,\s+(?P<state>\S+)$)?$')
+
+        #   Default path: active
+        p3 = re.compile(r'^Default +path: +(?P<default_path>[\S\s]+)$')
+
+        #   Tunnel label: imp-null, next hop point2point
+        p4 = re.compile(r'^Tunnel +label: +(?P<tunnel_label>\S+),'
+                         ' +next +hop +(?P<next_hop>[\S\s]+)$')
+
+        #   Next hop: point2point
+        p4_1 = re.compile(r'^Next +hop: +(?P<next_hop>[\S\s]+)$')
+
+        #   Output interface: Se2/0/2, imposed label stack {16}
+        p5 = re.compile(r'^Output +interface: +(?P<output_interface>\S+),'
+                         ' +imposed +label +stack +(?P<imposed_label_stack>\{[0-9 ]+\})$')
+
+        final_dict={}
+        for line in out.splitlines():
+            line = line.strip()
+
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                destination_address = group['address']
+                new_final_dict = final_dict.setdefault('destination_address', {}).\
+                    setdefault(destination_address, {})
+                vc_id_dict = new_final_dict.setdefault('vc_id', {}). \
+                    setdefault(group['vc_id'], {})
+                vc_id_dict.update({'vc_status' : group['vc_status']})
+                continue
+
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                new_final_dict['preferred_path'] = group['preferred_path']
+                if group.get('state'):
+                    new_final_dict['preferred_path_state']=group['state'].strip()
+                continue
+
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                new_final_dict['default_path'] = group['default_path']
+                continue
+
+            m = p4.match(line)
+            if m:
+                group = m.groupdict()
+                new_final_dict.update({k:v for k, v in group.items()})
+                continue
+
+            m = p4_1.match(line)
+            if m:
+                group = m.groupdict()
+                new_final_dict.update({k:v for k, v in group.items()})
+                continue
+
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                new_final_dict['output_interface'] = Common.convert_intf_name(
+                    group['output_interface'])
+                new_final_dict['imposed_label_stack'] = re.findall('\d+',group['imposed_label_stack'])
+                continue
+
+        return final_dict
+
+
+class ShowMplsTrafficEngTunnelTunnelidSchema(MetaParser):
+    """Schema for show mpls traffic-eng tunnels {tunnel} """
+
+    schema = {
+        'tunnel': {
+            Any(): {
+                'destination': str,
+                'status': {
+                    'admin': str,
+                    'oper': str,
+                    'path': str,
+                    'signalling': str,
+                    'path_option': {
+                        Optional(Any()): {
+                            'type': str,
+                            Optional('path_name'): str,
+                            Optional('path_weight'): int,
+                            Optional('path_attribute'): str,
+                            Optional('lockdown'): bool,
+                            Optional('attribute'): str,
+                        },
+                    },
+                },
+                'config_parameters': {
+                    'bandwidth': int,
+                    'bandwidth_unit': str,
+                    'bandwidth_type': str,
+                    'priority': {
+                        'setup_priority': int,
+                        'hold_priority': int
+                    },
+                    'affinity': str,
+                    'metric_used': str,
+                    Optional('metric_type'): str,
+                    Optional('path_selection_tiebreaker'): {
+                        'global': str,
+                        'tunnel_specific': str,
+                        'effective': str,
+                        'effective_type': str
+                    },
+                    Optional('hop_limit'): str,
+                    Optional('cost_limit'): str,
+                    Optional('path_invalidation_timeout'): int,
+                    Optional('path_invalidation_timeout_unit'): str,
+                    Optional('path_invalidation_timeout_type'): str,
+                    Optional('action'): str,
+                    Optional('autoroute'): str,
+                    Optional('lockdown'): str,
+                    Optional('loadshare'): int,
+                    Optional('max_load_share'): int,
+                    Optional('load_share_type'): str,
+                    Optional('auto_bw'): str,
+                    Optional('fault_oam'): str,
+                    Optional('wrap_protection'): str,
+                    Optional('wrap_capable'): str,
+                    Optional('autoroute_destination'): str
+                },
+                Optional('active_path_option_parameters'): {
+                    'state': {
+                        'active_path': str,
+                        'path_type': str
+                    },
+                    Optional('bandwidthoverride'): str,
+                    Optional('lockdown'): str,
+                    Optional('verbatim'): str,
+                },
+                Optional('node_hop_count'): int,
+                Optional('inlabel'): list,
+                Optional('outlabel'): list,
+                Optional('next_hop'): list,
+                Optional('rsvp_signalling_info'): {
+                    'src': str,
+                    'dst': str,
+                    'tun_id': int,
+                    'tun_instance': int,
+                    'rsvp_path_info': {
+                        Optional('my_address'): str,
+                        'explicit_route': list,
+                        Optional('record_route'): str,
+                        Optional('tspec'): {
+                            'ave_rate': int,
+                            'ave_rate_unit': str,
+                            'burst': int,
+                            'burst_unit': str,
+                            'peak_rate': int,
+                            'peak_rate_unit': str
+                        }
+                    },
+                    Optional('rsvp_resv_info'): {
+                        'record_route': str,
+                        'fspec': {
+                            'ave_rate': int,
+                            'ave_rate_unit': str,
+                            'burst': int,
+                            'burst_unit': str,
+                            'peak_rate': int,
+                            'peak_rate_unit': str
+                        },
+                    },
+                },
+                Optional('shortest_unconstrained_path_info'): {
+                    'path_weight': Any(),
+                    Optional('path_weight_type'): str,
+                    'explicit_route': list
+                },
+                Optional('history'): {
+                    'tunnel': {
+                        Any(): str,
+                        'number_of_lsp_ids_used': int
+                    },
+                    Optional("current_lsp_id"): {
+                        Any(): {
+                            Any(): str
+                        }
+                    },
+                    Optional('prior_lsp_id'): {
+                        Any(): {
+                            Optional('id'): str,
+                            Optional('removal_trigger'): str,
+                            Optional('last_error'): str
+                        }
+                    },
+                },
+            },
+        },
+    }
+
+
+class ShowMplsTrafficEngTunnelTunnelid(ShowMplsTrafficEngTunnelTunnelidSchema):
+    """Parser show mpls traffic-eng tunnels {tunnel}"""
+
+    cli_command = ['show mpls traffic-eng tunnels {tunnel}']
+
+    def cli(self, tunnel='', output=None):
+        if not output:
+            cmd = self.cli_command[0].format(tunnel=tunnel)
+            output = self.device.execute(cmd)
+
+        res = {}
+        result = 1
+
+        if not output.strip():
+            return res
+
+        ##Regex
+        ###Name: R3_t100                             (Tunnel100) Destination: 2.2.2.2
+        p1 = re.compile(
+            r'^\S+:\s+\S+\s+\((?P<Tunnel>\S+)\)\s+\S+\s+(?P<destination>\S+)')
+
+        ###Eg:Status:,Config Parameters:,Active Path Option Parameters:
+        p2 = re.compile(r'^(?P<key>[a-zA-Z\- ]+)\:$')
+        ###Mentions the keys to be considered
+        p2_1 = re.compile(
+            r'Status:|Config Parameters:|Active Path Option Parameters:|RSVP Signalling Info:|History:|Shortest Unconstrained Path Info:'
+        )
+
+        ###path option 1, type explicit R3_R4_R5_R2 (Basis for Setup, path weight 3)
+        p3 = re.compile(
+            r"^[a-zA-Z ]+(?P<path_option>[0-9 ]+)\,\s+(?P<lockdown>\([A-Z]+\))?"
+            "\s*\S+\s(?P<type>[a-zA-Z_0-9 ]+)\s*(?:\(.*\,[a-z ]+(?P<path_weight>\S+)\))?$"
+        )
+        p3_1 = re.compile(r"^Path-option attribute:\s(?P<path_attribute>\S+)$")
+
+        ###Src 3.3.3.3, Dst 2.2.2.2, Tun_Id 100, Tun_Instance 28
+        p4 = re.compile(r"^Src\s+([0-9\. ]+)\,")
+
+        ###State:
+        p5 = re.compile(r"^State:")
+
+        ###Time since created: 14 minutes, 44 seconds
+        p6 = re.compile(r"^Time\s+")
+
+        ###Bandwidth: 500      kbps (Global)  Priority: 7  7   Affinity: 0x0/0xFFFF
+        p7 = re.compile(
+            r'^Bandwidth:\s+(?P<bandwidth>.*)\s+[a-zA-Z ]+\:\s+(?P<priority>[0-9 ]+)'
+            '\s+[a-zA-Z ]+\:\s+(?P<affinity>\S+)$')
+
+        ### InLabel  :  -
+        ###OutLabel : Port-channel30, 63
+        ###Next Hop : 193.1.1.2
+        p8 = re.compile(r"^([a-zA-Z ]+)\s+\:\s+([a-zA-Z\-0-9\.\, ]+)$")
+
+        ###AutoRoute: enabled  LockDown: disabled Loadshare: 500 [4000000] bw-based
+        p9 = re.compile(
+            r"^AutoRoute\:\s+(?P<autoroute>\S+)\s+\S+\:\s+(?P<lockdown>\S+)"
+            "\s+\S+\:\s+(?P<loadshare>\d+)\s+\[(?P<max_load_share>\d+)\]\s+(?P<load_share_type>\S+)$"
+        )
+
+        ###Record   Route:
+        ###Tspec:,Fspec:
+        p10 = re.compile(r"Record   Route:|[A-Za-z ]+spec\:\s+.*")
+
+        ###Fault-OAM: disabled, Wrap-Protection: disabled, Wrap-Capable: No
+        ###Hop Limit: disabled
+        ###Cost Limit: disabled
+        ###BandwidthOverride: disabled  LockDown: enabled   Verbatim: disabled
+        ###auto-bw: disabled
+        p11 = re.compile(
+            r'Hop|Cost|auto-bw:'
+            '|State:|Path Weight:|BandwidthOverride:|Fault-OAM:|AutoRoute destination:'
+        )
+
+        ###Explicit Route: 193.1.1.2 196.1.1.2 196.1.1.1 198.1.1.1
+        #              198.1.1.2 2.2.2.2
+        p12 = re.compile(r"^\d+\.\d+\.\d+\.\d+")
+
+        ###Admin: up         Oper: up     Path: valid       Signalling: connected
+        p13 = re.compile(
+            r"(Admin|Oper|Path|Signalling):([a-zA-Z\- ]+\s|[a-zA-Z\- ]+)")
+
+        ##Path-invalidation timeout: 10000 msec (default), Action: Tear
+        p14 = re.compile(
+            r"^Path-invalidation.+\:\s+(?P<path_invalidation_timeout>\d+)\s+"
+            "(?P<path_invalidation_timeout_unit>\w+)\s+\((?P<path_invalidation_timeout_type>\S+)\)\,"
+            "\s+\S+\s+(?P<action>\w+)$")
+
+        ###Number of LSP IDs (Tun_Instances) used:
+        p15 = re.compile(r"Number of LSP IDs \(Tun_Instances\) used:\s+\d+")
+
+        ###Current LSP: [ID: 19]
+        p16 = re.compile(r"^Current LSP:\s+\[ID:\s+(?P<id>\d+)\]$")
+
+        ###Uptime: 9 hours, 52 minutes
+        ###Selection: reoptimization
+        p17 = re.compile(r"(Uptime|Selection):\s+([0-9a-zA-Z, ]+)")
+
+        ##Metric Type: TE (default)
+        p18 = re.compile(
+            r"^Metric Type:\s+(?P<metric_used>\S+)(?:\s+\((?P<metric_type>\S+)\))*"
+        )
+
+        ###Prior LSP: [ID: 19]
+        p19 = re.compile(r"^Prior LSP:\s+\[ID:\s+(?P<id>\d+)\]$")
+
+        ##ID: path option 3 [35]
+        ##Removal Trigger: tunnel shutdown
+        ##Last Error: CTRL:: Explicit path has unknown address, 194.1.1.1
+        p20 = re.compile(
+            r"(ID|Removal Trigger|Last Error):\s+([0-9a-zA-Z,.: ]+)")
+
+        ###Global: not set   Tunnel Specific: not set   Effective: min-fill (default)
+        p21 = re.compile(
+            r"^Global:\s+(?P<global>[a-zA-Z ]+)\s+Tunnel Specific:\s+(?P<tunnel_specific>[a-zA-Z ]+)\s+Effective:\s+(?P<effective>\S+)\s*\(?(?P<effective_type>[a-zA-Z ]+)?\)?$"
+        )
+
+        ###Path Weight: 1 (TE)
+        p22 = re.compile(
+            r"^Path Weight:\s+(?P<path_weight>(\d+))\s+\(?(?P<path_weight_type>[A-Za-z]+)?\)?$"
+        )
+
+        path_option = ""
+        id = ''
+        res['tunnel'] = {}
+        for line in output.splitlines():
+            line = line.strip()
+
+            ###Name: R3_t100 (Tunnel100) Destination: 2.2.2.2
+            ##Eg:{tunnel100:{destiantion:2.2.2.2}}
+            m1 = p1.match(line)
+            if m1:
+                r = m1.groupdict()
+                key = r['Tunnel']
+                res['tunnel'][key] = {}
+                res['tunnel'][key]['destination'] = r['destination']
+                continue
+
+            ###Create key,subkeys
+            ###Matched line for key
+            ###Eg:Status:,Config Parameters:,Active Path Option Parameters:
+            ###Then subkeys, Eg:{config_parameters:{path_selection_tiebreaker:{}},...}
+            m2 = p2.match(line)
+            if m2:
+                r1 = m2.groupdict()
+                if r1['key'] == "Path-selection Tiebreaker":
+                    ##{config_parameters:path_selection_tiebreaker}
+                    res['tunnel'][key]["config_parameters"][r1['key'].lower()\
+                        .replace(" ","_").replace("-","_").strip()]={}
+                elif r1['key'] == "RSVP Path Info":
+                    ##{rsvp_signalling_info:{rsvp_path_info:{}}
+                    key3 = r1['key'].lower().replace(" ",
+                                                     "_").replace("-",
+                                                                  "_").strip()
+                    res['tunnel'][key]["rsvp_signalling_info"][key3] = {}
+                elif r1['key'] == "RSVP Resv Info":
+                    ##{rsvp_signalling_info:{rsvp_resv_info:{}}
+                    key3 = r1['key'].lower().replace(" ",
+                                                     "_").replace("-",
+                                                                  "_").strip()
+                    res['tunnel'][key]["rsvp_signalling_info"][key3] = {}
+                elif r1['key'] == "Tunnel":
+                    ##tunnel:
+                    res['tunnel'][key]["history"]['tunnel'] = {}
+                else:
+                    if p2_1.match(line):
+                        key1 = r1['key'].lower().replace(" ", "_").strip()
+                        res['tunnel'][key][key1] = {}
+                continue
+
+            ####path option 1, type explicit R3_R4_R5_R2 (Basis for Setup, path weight 3)
+            m3 = p3.match(line)
+            if m3:
+                fin = m3.groupdict()
+                path_option = "path_option"
+                if result == 1:
+                    res['tunnel'][key][key1][path_option] = {}
+                    result = 0
+                for item, value in fin.items():
+                    if item == "path_option":
+                        path = value
+                        res['tunnel'][key][key1][path_option][path] = {}
+                    else:
+                        if item == "type":
+                            s = value.split()
+                            res['tunnel'][key][key1][path_option][path][
+                                'type'] = s[0].strip()
+                            if s[0] != "dynamic":
+                                res['tunnel'][key][key1][path_option][path][
+                                    'path_name'] = s[1].strip()
+                        elif item == "lockdown":
+                            if fin["lockdown"]:
+                                res['tunnel'][key][key1][path_option][path][
+                                    'lockdown'] = True
+                        else:
+                            if value:
+                                res['tunnel'][key][key1][path_option][path][
+                                    item] = int(value)
+                continue
+
+            ###Path-option attribute: TU1_attrib
+            m3_1 = p3_1.match(line)
+            if m3_1:
+                grp = m3_1.groupdict()
+                for item, value in grp.items():
+                    res['tunnel'][key][key1][path_option][path][item] = value
+
+            ###Src 3.3.3.3, Dst 2.2.2.2, Tun_Id 100, Tun_Instance 28
+            m4 = p4.match(line)
+            if m4:
+                a = line.split(",")
+                for i in a:
+                    i = i.strip()
+                    j = i.split(" ")[1]
+                    res['tunnel'][key][key1][i.split(" ")[0].lower().strip()]=\
+                            int(j) if j.isdigit() else j
+                continue
+
+            ###State: explicit path option 1 is active
+            m5 = p5.match(line)
+            if m5:
+                res['tunnel'][key][key1]['state'] = {}
+                res['tunnel'][key][key1]['state']['active_path']=\
+                                re.findall(r"(\d+)",line.split(":")[1].strip())[0]
+                res['tunnel'][key][key1]['state']['path_type']=\
+                                line.split(":")[1].split()[0]
+                continue
+
+            ###Time since created: 14 minutes, 44 seconds
+            m6 = p6.match(line)
+            if m6:
+                time = line.split(":")[0].lower().strip().replace(" ", "_")
+                res['tunnel'][key][key1]['tunnel'][time] = line.split(
+                    ":")[1].strip()
+                continue
+
+            ###Bandwidth: 500      kbps (Global)  Priority: 7  7   Affinity: 0x0/0xFFFF
+            m7 = p7.match(line)
+            if m7:
+                r4 = m7.groupdict()
+                for item, value in r4.items():
+                    if item == "priority":
+                        res['tunnel'][key][key1]['priority'] = {}
+                        tg = value.split()
+                        res['tunnel'][key][key1]['priority'][
+                            'setup_priority'] = int(tg[0])
+                        res['tunnel'][key][key1]['priority'][
+                            'hold_priority'] = int(tg[1])
+                    elif item == "bandwidth":
+                        bandwidth_detail = value.split()
+                        res['tunnel'][key][key1][item] = int(
+                            bandwidth_detail[0])
+                        res['tunnel'][key][key1][
+                            "bandwidth_unit"] = bandwidth_detail[1]
+                        res['tunnel'][key][key1]["bandwidth_type"]=\
+                                        re.sub(r"[()]","",bandwidth_detail[2])
+                    else:
+                        res['tunnel'][key][key1][item] = value.strip()
+                continue
+
+            ###Match InLabel : -
+            m8 = p8.match(line)
+            if m8:
+                r8 = m8.group()
+                res['tunnel'][key][r8.split(":")[0].strip().lower().replace(" ","_")]=\
+                                    r8.split(":")[1].strip().split(",")
+                continue
+
+            ###AutoRoute: enabled  LockDown: disabled Loadshare: 500 [4000000] bw-based
+            m9 = p9.match(line)
+            if m9:
+                r9 = m9.groupdict()
+                for item, value in r9.items():
+                    res['tunnel'][key][key1][item.strip()]=\
+                    int(value) if value.strip().isdecimal() else value
+                continue
+
+            ###Record   Route:   NONE
+            ###Tspec: ave rate=500 kbits, burst=1000 bytes, peak rate=500 kbits
+            m10 = p10.match(line)
+            if m10:
+                if "=" not in line:
+                    res['tunnel'][key][key1][key3][
+                        "record_route"] = line.split(":")[1].strip()
+                else:
+                    r7 = m10.group()
+                    key5 = r7.split(":")[0].strip().lower()
+                    res['tunnel'][key][key1][key3][key5] = {}
+                    r8 = r7.split(":")[1].split(",")
+                    for i in r8:
+                        res10 = i.split("=")[1].split()
+                        item = i.split("=")[0].lower().strip().replace(
+                            " ", "_")
+                        res['tunnel'][key][key1][key3][key5][item] = int(
+                            res10[0])
+                        res['tunnel'][key][key1][key3][key5][
+                            item + "_unit"] = res10[1]
+                continue
+
+            ###Global: not set   Tunnel Specific: not set   Effective: min-fill (default)
+            ###Make global part of path_selection_tiebreaker
+            m21 = p21.match(line)
+            if m21:
+                re21 = m21.groupdict()
+                for item, value in re21.items():
+                    res['tunnel'][key]['config_parameters']["path_selection_tiebreaker"][item.split(":")[0].strip().replace(" ","_").lower()]=\
+                    value.strip()
+                continue
+
+            ##Path Weight: 1 (TE)
+            m22 = p22.match(line)
+            if m22:
+                re22 = m22.groupdict()
+                for item, value in re22.items():
+                    res['tunnel'][key][key1][item] = value.strip()
+                continue
+
+            ###Make explicit route as part of rsvp_path_info or shortest_unconstrained_path_info respectively
+            ###Make my address as part of rsvp_path_info
+            ###My Address: 192.1.1.1
+            ###Explicit Route: 192.1.1.2 2.2.2.2
+            if re.match("^Explicit Route:|My", line):
+                if "Explicit Route:" in line:
+                    explicit_route = []
+                    explicit_route.extend(line.split(":")[1].split())
+
+                    if key1 == "rsvp_signalling_info":
+                        res['tunnel'][key][key1]['rsvp_path_info'][
+                            'explicit_route'] = explicit_route
+                    elif key1 == "shortest_unconstrained_path_info":
+                        res['tunnel'][key][key1][
+                            'explicit_route'] = explicit_route
+                else:
+                    res['tunnel'][key][key1]['rsvp_path_info'][line.split(":")[0]\
+                    .strip().lower().replace(" ","_")]=line.split(":")[1].lower().strip()
+                continue
+
+            ##  Node Hop Count: 1
+            if "Node Hop Count:" in line:
+                ib = int(line.split(":")[1].lower().strip())
+                res['tunnel'][key][line.split(":")[0].strip().lower().replace(
+                    " ", "_")] = ib
+                continue
+
+            ###Fault-OAM: disabled, Wrap-Protection: disabled, Wrap-Capable: No
+            ###Hop Limit: disabled
+            ###Cost Limit: disabled
+            ###BandwidthOverride: disabled  LockDown: enabled   Verbatim: disabled
+            ###auto-bw: disabled
+            m11 = p11.match(line)
+            if m11:
+                line = re.sub(r'\:\s{2,}', ": ", line.strip())
+                re9 = re.split("\s{2,}|,", line.strip())
+                for i in re9:
+                    ib = i.split(":")[1].strip().replace(
+                        "[ignore", "").replace("(te)", "").strip()
+                    res['tunnel'][key][key1][i.split(":")[0].strip().lower()\
+                    .replace(" ","_").replace("-","_").strip()]=int(ib) if ib.isdecimal() else ib
+                continue
+
+            #Explicit Route: 193.1.1.2 196.1.1.2 196.1.1.1 198.1.1.1
+            #                198.1.1.2 2.2.2.2
+            if p12.match(line):
+                explicit_route.extend(line.split())
+
+            ###Admin: up         Oper: up     Path: valid       Signalling: connected
+            if "Admin:" in line:
+                m13 = p13.findall(line)
+                if m13:
+                    line = re.sub(r'\:\s{1,}', ":", line.strip())
+                    for match in m13:
+                        res['tunnel'][key][key1][match[0].strip().lower(
+                        )] = match[1].strip().lower()
+                continue
+
+            ##Path-invalidation timeout: 10000 msec (default), Action: Tear
+            m14 = p14.match(line)
+            if m14:
+                re14 = m14.groupdict()
+                for item, value in re14.items():
+                    res['tunnel'][key][key1][item] = int(
+                        value) if value.isdecimal() else value
+                continue
+
+            ###Number of LSP IDs (Tun_Instances) used: 19
+            m15 = p15.match(line)
+            if m15:
+                res['tunnel'][key][key1]['tunnel'][
+                    "number_of_lsp_ids_used"] = int(line.split(":")[1])
+                continue
+
+            ###Current LSP: [ID: 19]
+            m16 = p16.match(line)
+            if m16:
+                id = m16.groupdict()
+                res['tunnel'][key][key1]['current_lsp_id'] = {}
+                res['tunnel'][key][key1]['current_lsp_id'][id['id']] = {}
+                continue
+
+            ###Uptime: 9 hours, 52 minutes
+            ###Selection: reoptimization
+            m17 = p17.match(line)
+            if m17:
+                res17 = p17.findall(line)
+                res['tunnel'][key][key1]['current_lsp_id'][id['id']][
+                    res17[0][0].lower()] = res17[0][1]
+                continue
+
+            #Metric Type: TE (default)
+            m18 = p18.match(line)
+            if m18:
+                res18 = m18.groupdict()
+                res['tunnel'][key]["config_parameters"]['metric_used'] = res18[
+                    'metric_used']
+                if res18.get("metric_type", None):
+                    res['tunnel'][key]['config_parameters'][
+                        'metric_type'] = res18['metric_type']
+                continue
+
+            ###Prior LSP: [ID: 19]
+            m19 = p19.match(line)
+            if m19:
+                id = m19.groupdict()
+                res['tunnel'][key][key1]['prior_lsp_id'] = {}
+                res['tunnel'][key][key1]['prior_lsp_id'][id['id']] = {}
+                continue
+
+            ###ID: path option 3 [35]
+            ###Removal Trigger: tunnel shutdown
+            ###Last Error: CTRL:: Explicit path has unknown address, 194.1.1.1
+            m20 = p20.match(line)
+            if m20:
+                res20 = p20.findall(line)
+                for prior_key, prior_value in res20:
+                    res['tunnel'][key][key1]['prior_lsp_id'][id['id']][
+                        prior_key.lower().replace(" ", "_")] = prior_value
+                continue
+
+        return res
+
+
+class ShowMplsTrafficEngTunnelSchema(MetaParser):
+    """Schema for show mpls traffic-eng tunnels"""
+
+    schema = {
+        'tunnel_type': {
+            Any(): {
+                'tunnel_name': {
+                    Any(): {
+                        Optional('destination'): str,
+                        Optional('signalled_state'): bool,
+                        Optional('tunnel_state'): str,
+                        Optional('status'): {
+                            'admin': str,
+                            'oper': str,
+                            'path': str,
+                            'signalling': str,
+                            'path_option': {
+                                Optional(Any()): {
+                                    'type': str,
+                                    Optional('path_name'): str,
+                                    Optional('path_weight'): int,
+                                    Optional('path_attribute'): str,
+                                    Optional('lockdown'): bool,
+                                    Optional('attribute'): str,
+                                },
+                            },
+                        },
+                        Optional('config_parameters'): {
+                            'bandwidth': int,
+                            'bandwidth_unit': str,
+                            'bandwidth_type': str,
+                            'priority': {
+                                'setup_priority': int,
+                                'hold_priority': int
+                            },
+                            'affinity': str,
+                            'metric_used': str,
+                            Optional('metric_type'): str,
+                            Optional('path_selection_tiebreaker'): {
+                                'global': str,
+                                'tunnel_specific': str,
+                                'effective': str,
+                                'effective_type': str
+                            },
+                            Optional('hop_limit'): str,
+                            Optional('cost_limit'): str,
+                            Optional('path_invalidation_timeout'): int,
+                            Optional('path_invalidation_timeout_unit'): str,
+                            Optional('path_invalidation_timeout_type'): str,
+                            Optional('action'): str,
+                            Optional('autoroute'): str,
+                            Optional('lockdown'): str,
+                            Optional('max_load_share'): int,
+                            Optional('load_share_type'): str,
+                            Optional('loadshare'): int,
+                            Optional('auto_bw'): str,
+                            Optional('fault_oam'): str,
+                            Optional('wrap_protection'): str,
+                            Optional('wrap_capable'): str,
+                            Optional('autoroute_destination'): str
+                        },
+                        Optional('active_path_option_parameters'): {
+                            'state': {
+                                'active_path': str,
+                                'path_type': str
+                            },
+                            Optional('bandwidthoverride'): str,
+                            Optional('lockdown'): str,
+                            Optional('verbatim'): str,
+                        },
+                        Optional('node_hop_count'): int,
+                        Optional('inlabel'): list,
+                        Optional('outlabel'): list,
+                        Optional('next_hop'): list,
+                        Optional('prev_hop'): list,
+                        Optional('rsvp_signalling_info'): {
+                            'src': str,
+                            'dst': str,
+                            'tun_id': int,
+                            'tun_instance': int,
+                            'rsvp_path_info': {
+                                Optional('my_address'): str,
+                                'explicit_route': list,
+                                Optional('record_route'): str,
+                                Optional('tspec'): {
+                                    'ave_rate': int,
+                                    'ave_rate_unit': str,
+                                    'burst': int,
+                                    'burst_unit': str,
+                                    'peak_rate': int,
+                                    'peak_rate_unit': str
+                                }
+                            },
+                            Optional('rsvp_resv_info'): {
+                                'record_route': str,
+                                'fspec': {
+                                    'ave_rate': int,
+                                    'ave_rate_unit': str,
+                                    'burst': int,
+                                    'burst_unit': str,
+                                    'peak_rate': int,
+                                    'peak_rate_unit': str
+                                },
+                            },
+                        },
+                        Optional('shortest_unconstrained_path_info'): {
+                            'path_weight': Any(),
+                            Optional('path_weight_type'): str,
+                            'explicit_route': list
+                        },
+                        Optional('history'): {
+                            'tunnel': {
+                                Any(): str,
+                                'number_of_lsp_ids_used': int
+                            },
+                            Optional("current_lsp_id"): {
+                                Any(): {
+                                    Any(): str
+                                }
+                            },
+                            Optional('prior_lsp_id'): {
+                                Any(): {
+                                    Optional('id'): str,
+                                    Optional('removal_trigger'): str,
+                                    Optional('last_error'): str
+                                }
+                            }
+                        },
+                    },
+                },
+            },
+        },
+    }
+
+
+class ShowMplsTrafficEngTunnel(ShowMplsTrafficEngTunnelSchema):
+    """Parser show mpls traffic-eng tunnels"""
+
+    cli_command = ['show mpls traffic-eng tunnels']
+
+    def cli(self, output=None):
+        if not output:
+            cmd = self.cli_command[0]
+
+            output = self.device.execute(cmd)
+
+        res = {}
+        result = 1
+        base_key = ""
+        path_opt, id = "", ""
+        tunnel_types = ["P2P TUNNELS/LSPs", "P2MP TUNNELS", "P2MP SUB-LSPS"]
+        if not output.strip():
+            return res
+
+        ##Regex
+        ###Name: R3_t100                             (Tunnel100) Destination: 2.2.2.2
+        p1 = re.compile(
+            r'^\S+:\s+\S+\s+\((?P<Tunnel>\S+)\)\s+\S+\s+(?P<destination>\S+)')
+
+        ###Eg:Status:,Config Parameters:,Active Path Option Parameters:
+        p2 = re.compile(r'^(?P<key>[a-zA-Z\-0-9/LSPs ]+)\:$')
+        ###Mentions the keys to be considered
+        p2_1 = re.compile(
+            r'Status:|Config Parameters:|Active Path Option Parameters:'
+            '|RSVP Signalling Info:|History:|Shortest Unconstrained Path Info:'
+        )
+
+        ###path option 1, type explicit R3_R4_R5_R2 (Basis for Setup, path weight 3)
+        p3 = re.compile(
+            r"^[a-zA-Z ]+(?P<path_option>[0-9 ]+)\,\s+(?P<lockdown>\([A-Z]+\))?"
+            "\s*\S+\s(?P<type>[a-zA-Z_0-9 ]+)\s*(?:\(.*\,[a-z ]+(?P<path_weight>\S+)\))?"
+        )
+        p3_1 = re.compile(r"^Path-option attribute:\s(?P<path_attribute>\S+)$")
+
+        ###Src 3.3.3.3, Dst 2.2.2.2, Tun_Id 100, Tun_Instance 28
+        p4 = re.compile(r"^Src\s+([0-9\. ]+)\,")
+
+        ###Time since created: 14 minutes, 44 seconds
+        p5 = re.compile(r"^Time\s+")
+
+        ###Bandwidth: 500      kbps (Global)  Priority: 7  7   Affinity: 0x0/0xFFFF
+        p6 = re.compile(
+            r'^Bandwidth:\s+(?P<bandwidth>.*)\s+[a-zA-Z ]+\:\s+(?P<priority>[0-9 ]+)'
+            '\s+[a-zA-Z ]+\:\s+(?P<affinity>\S+)$')
+
+        ### InLabel  :  -
+        ###OutLabel : Port-channel30, 63
+        ###Next Hop : 193.1.1.2
+        p7 = re.compile(r"^([a-zA-Z ]+)\s+\:\s+([a-zA-Z\/\-0-9\.\, ]+)$")
+
+        ###AutoRoute: enabled  LockDown: disabled Loadshare: 500 [4000000] bw-based
+        p8 = re.compile(
+            r"^AutoRoute\:\s+(?P<autoroute>\S+)\s+\S+\:\s+(?P<lockdown>\S+)"
+            "\s+\S+\:\s+(?P<loadshare>\d+)\s+\[(?P<max_load_share>\d+)\]\s+(?P<load_share_type>\S+)$"
+        )
+
+        ###Record   Route:
+        ###Tspec:,Fspec:
+        p9 = re.compile(r"Record   Route:|[A-Za-z ]+spec\:\s+.*")
+
+        ###Fault-OAM: disabled, Wrap-Protection: disabled, Wrap-Capable: No
+        ###Hop Limit: disabled
+        ###Cost Limit: disabled
+        ###BandwidthOverride: disabled  LockDown: enabled   Verbatim: disabled
+        ###auto-bw: disabled
+        p10 = re.compile(
+            r'Hop|Cost|'
+            'auto-bw:|State:|Path Weight:|BandwidthOverride:|Fault-OAM:|AutoRoute destination:'
+        )
+
+        ###Explicit Route: 193.1.1.2 196.1.1.2 196.1.1.1 198.1.1.1
+        #              198.1.1.2 2.2.2.2 --matches line
+        p11 = re.compile(r"^\d+\.\d+\.\d+\.\d+")
+
+        ###State:
+        p12 = re.compile(r"^State:")
+
+        ###Admin: up         Oper: up     Path: valid       Signalling: connected
+        p13 = re.compile(
+            r"(Admin|Oper|Path|Signalling):([a-zA-Z\- ]+\s|[a-zA-Z\- ]+)")
+
+        ##Path-invalidation timeout: 10000 msec (default), Action: Tear
+        p14 = re.compile(
+            r"^Path-invalidation.+\:\s+(?P<path_invalidation_timeout>\d+)\s+"
+            "(?P<path_invalidation_timeout_unit>\w+)\s+\((?P<path_invalidation_timeout_type>\S+)\)"
+            "\,\s+\S+\s+(?P<action>\w+)$")
+
+        ####LSP Tunnel PE1_t100 is signalled, connection is up
+        p15 = re.compile(
+            r"^LSP\sTunnel\s+[a-zA-Z0-9]+\_\w"
+            "(?P<tunnel_id>[0-9]+)\s+is\s+(?P<signalled>\S+)\,\s+connection\s+is\s+(?P<state>\S+)$"
+        )
+
+        ###Number of LSP IDs (Tun_Instances) used:
+        p16 = re.compile(r"Number of LSP IDs \(Tun_Instances\) used:\s+\d+")
+
+        ###Current LSP: [ID: 19]
+        p17 = re.compile(r"^Current LSP:\s+\[ID:\s+(?P<id>\d+)\]$")
+
+        ###Uptime: 9 hours, 52 minutes
+        ###Selection: reoptimization
+        p18 = re.compile(r"(Uptime|Selection):\s+([0-9a-zA-Z, ]+)")
+
+        ##Metric Type: TE (default)
+        p19 = re.compile(
+            r"^Metric Type:\s+(?P<metric_used>\S+)(?:\s+\((?P<metric_type>\S+)\))*"
+        )
+
+        ###Prior LSP: [ID: 19]
+        p20 = re.compile(r"^Prior LSP:\s+\[ID:\s+(?P<id>\d+)\]$")
+
+        ##ID: path option 3 [35]
+        ##Removal Trigger: tunnel shutdown
+        ##Last Error: CTRL:: Explicit path has unknown address, 194.1.1.1
+        p21 = re.compile(
+            r"(ID|Removal Trigger|Last Error):\s+([0-9a-zA-Z,.: ]+)")
+
+        ###Global: not set   Tunnel Specific: not set   Effective: min-fill (default)
+        p22 = re.compile(
+            r"^Global:\s+(?P<global>[a-zA-Z ]+)\s+Tunnel Specific:\s+(?P<tunnel_specific>[a-zA-Z ]+)\s+Effective:\s+(?P<effective>\S+)\s*\(?(?P<effective_type>[a-zA-Z ]+)?\)?$"
+        )
+
+        ###Path Weight: 1 (TE)
+        p23 = re.compile(
+            r"^Path Weight:\s+(?P<path_weight>(\d+))\s+\(?(?P<path_weight_type>[A-Za-z]+)?\)?$"
+        )
+
+        res['tunnel_type'] = {}
+        for line in output.splitlines():
+            line = line.strip()
+
+            ###Matched line for key
+            ###Eg:Status:, Config Parameters:, Active Path Option Parameters:
+            ###P2MP TUNNELS:, P2MP SUB-LSPS, P2P TUNNELS/LSPs
+            m2 = p2.match(line)
+            if m2:
+                r1 = m2.groupdict()
+                if r1['key'] in tunnel_types:
+                    base_key = r1['key'].lower().replace(" ", "_").replace(
+                        "/lsps", "").replace("-", "_")
+                    res['tunnel_type'][base_key] = {}
+                    res['tunnel_type'][base_key]['tunnel_name'] = {}
+                    continue
+                else:
+                    if r1['key'] == "Path-selection Tiebreaker":
+                        res['tunnel_type'][base_key]['tunnel_name'][key]["config_parameters"][r1['key'].\
+                        lower().replace(" ","_").replace("-","_").strip()]={}
+                    elif r1['key'] == "RSVP Path Info":
+                        key3 = r1['key'].lower().replace(" ", "_").replace(
+                            "-", "_").strip()
+
+                        res['tunnel_type'][base_key]['tunnel_name'][key][
+                            "rsvp_signalling_info"][key3] = {}
+                    elif r1['key'] == "RSVP Resv Info":
+                        key3 = r1['key'].lower().replace(" ", "_").replace(
+                            "-", "_").strip()
+                        res['tunnel_type'][base_key]['tunnel_name'][key][
+                            "rsvp_signalling_info"][key3] = {}
+                    elif r1['key'] == "Tunnel":
+                        ##tunnel:
+                        res['tunnel_type'][base_key]['tunnel_name'][key][
+                            "history"]['tunnel'] = {}
+                    else:
+                        if p2_1.match(line):
+                            key1 = r1['key'].lower().replace(" ", "_").strip()
+                            res['tunnel_type'][base_key]['tunnel_name'][key][
+                                key1] = {}
+                    continue
+
+            ###LSP Tunnel PE1_t100 is signalled, connection is up
+            m = p15.match(line)
+            if m:
+                m15 = m.groupdict()
+                key = "Tunnel" + m15['tunnel_id']
+                res['tunnel_type'][base_key]['tunnel_name'][key] = {}
+                if m15['signalled'] == "signalled":
+                    res['tunnel_type'][base_key]['tunnel_name'][key][
+                        'signalled_state'] = True
+                else:
+                    res['tunnel_type'][base_key]['tunnel_name'][key][
+                        'signalled_state'] = False
+                res['tunnel_type'][base_key]['tunnel_name'][key][
+                    'tunnel_state'] = m15['state']
+                continue
+
+            ###Name: R3_t100                             (Tunnel100) Destination: 2.2.2.2
+            ##Eg:{tunnel100:{destiantion:2.2.2.2}}
+            m1 = p1.match(line)
+            if m1:
+                r = m1.groupdict()
+                key = r['Tunnel']
+                res['tunnel_type'][base_key]['tunnel_name'][key] = {}
+                res['tunnel_type'][base_key]['tunnel_name'][key][
+                    'destination'] = r['destination']
+                continue
+
+            ####path option 1, type explicit R3_R4_R5_R2 (Basis for Setup, path weight 3)
+##'path_option': {'1': {'type': 'explicit','path_name':'R3_R4_R5_R2', 'path_weight': 3}}
+            m3 = p3.match(line)
+            if m3:
+                fin = m3.groupdict()
+                path_option = "path_option"
+                if result == 1:
+                    res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                        path_option] = {}
+                    result = 0
+                for item, value in fin.items():
+                    if item == "path_option":
+                        path = value
+                        res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                            path_option][path] = {}
+                    else:
+                        if item == "type":
+                            s = value.split()
+                            res['tunnel_type'][base_key]['tunnel_name'][key][
+                                key1][path_option][path]['type'] = s[0].strip(
+                                )
+                            if s[0] != "dynamic":
+                                res['tunnel_type'][base_key]['tunnel_name'][
+                                    key][key1][path_option][path][
+                                        'path_name'] = s[1].strip()
+                        elif item == "lockdown":
+                            if fin["lockdown"]:
+                                res['tunnel_type'][base_key]['tunnel_name'][
+                                    key][key1][path_option][path][
+                                        'lockdown'] = True
+                        else:
+                            if value:
+                                res['tunnel_type'][base_key]['tunnel_name'][
+                                    key][key1][path_option][path][item] = int(
+                                        value)
+
+                continue
+
+            ###Path-option attribute: TU1_attrib
+            m3_1 = p3_1.match(line)
+            if m3_1:
+                grp = m3_1.groupdict()
+                for item, value in grp.items():
+                    res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                        path_option][path][item] = value
+
+            ###Src 3.3.3.3, Dst 2.2.2.2, Tun_Id 100, Tun_Instance 28
+            ##Eg:{'src': '3.3.3.3', 'dst': '2.2.2.2', 'tun_id': 100, 'tun_instance': 28}
+            m4 = p4.match(line)
+            if m4:
+                a = line.split(",")
+                for i in a:
+                    i = i.strip()
+                    j = i.split(" ")[1]
+                    res['tunnel_type'][base_key]['tunnel_name'][key][key1][i.split(" ")[0].lower().strip()]=\
+                                            int(j) if j.isdigit() else j
+                continue
+
+            ###State: explicit path option 1 is active
+            m12 = p12.match(line)
+            if m12:
+                res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                    'state'] = {}
+                res['tunnel_type'][base_key]['tunnel_name'][key][key1]['state']['active_path']=\
+                            re.findall(r"(\d+)",line.split(":")[1].strip())[0]
+                res['tunnel_type'][base_key]['tunnel_name'][key][key1]['state']['path_type']=\
+                            line.split(":")[1].split()[0]
+                continue
+
+            ###Time since created: 14 minutes, 44 seconds
+            m5 = p5.match(line)
+            if m5:
+                time = line.split(":")[0].lower().strip().replace(" ", "_")
+                res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                    'tunnel'][time] = line.split(":")[1].strip()
+                continue
+
+            ###Bandwidth: 500      kbps (Global)  Priority: 7  7   Affinity: 0x0/0xFFFF
+            m6 = p6.match(line)
+            if m6:
+                result = 1
+                r4 = m6.groupdict()
+                for item, value in r4.items():
+                    if item == "priority":
+                        res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                            'priority'] = {}
+                        tg = value.split()
+                        res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                            'priority']['setup_priority'] = int(tg[0])
+                        res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                            'priority']['hold_priority'] = int(tg[1])
+                    elif item == "bandwidth":
+                        bandwidth_detail = value.split()
+                        res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                            item] = int(bandwidth_detail[0])
+                        res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                            "bandwidth_unit"] = bandwidth_detail[1]
+                        res['tunnel_type'][base_key]['tunnel_name'][key][key1]["bandwidth_type"]=\
+                                            re.sub(r"[()]","",bandwidth_detail[2])
+                    else:
+                        res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                            item] = value.strip()
+                continue
+
+            ###Match InLabel : -
+            m7 = p7.match(line)
+            if m7:
+                r5 = m7.group()
+                res['tunnel_type'][base_key]['tunnel_name'][key][r5.split(":")[0].strip().lower().\
+                                    replace(" ","_")]=list(map(str.strip,r5.split(":")[1].strip().split(",")))
+                continue
+
+            ###AutoRoute: enabled  LockDown: disabled Loadshare: 500 [4000000] bw-based
+            m8 = p8.match(line)
+            if m8:
+                r6 = m8.groupdict()
+                for item, value in r6.items():
+                    res['tunnel_type'][base_key]['tunnel_name'][key][key1][item.strip()]=\
+                                    int(value) if value.strip().isdecimal() else value
+                continue
+
+            ###Record   Route:   NONE
+            ###Tspec: ave rate=500 kbits, burst=1000 bytes, peak rate=500 kbits
+            m9 = p9.match(line)
+            if m9:
+                if "=" not in line:
+                    res['tunnel_type'][base_key]['tunnel_name'][key][key1][key3]["record_route"]=\
+                                    line.split(":")[1].strip()
+                else:
+                    r7 = m9.group()
+                    key4 = r7.split(":")[0].strip().lower()
+                    res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                        key3][key4] = {}
+                    r8 = r7.split(":")[1].split(",")
+                    for i in r8:
+                        res10 = i.split("=")[1].split()
+                        item = i.split("=")[0].lower().strip().replace(
+                            " ", "_")
+                        res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                            key3][key4][item] = int(res10[0])
+                        res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                            key3][key4][item + "_unit"] = res10[1]
+                        continue
+
+            ###Global: not set   Tunnel Specific: not set   Effective: min-fill (default)
+            ###Make global part of path_selection_tiebreaker
+            m22 = p22.match(line)
+            if m22:
+                re22 = m22.groupdict()
+                for item, value in re22.items():
+                    res['tunnel_type'][base_key]['tunnel_name'][key]['config_parameters']["path_selection_tiebreaker"][item.split(":")[0].strip().replace(" ","_").lower()]=\
+                    value.strip()
+                continue
+
+            ##Path Weight: 1 (TE)
+            m23 = p23.match(line)
+            if m23:
+                re23 = m23.groupdict()
+                for item, value in re23.items():
+                    res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                        item] = value.strip()
+                continue
+
+            ###Make explicit route as part of rsvp_path_info or shortest_unconstrained_path_info respectively
+            ###Make my address as part of rsvp_path_info
+            ###My Address: 192.1.1.1
+            ###Explicit Route: 192.1.1.2 2.2.2.2
+            if re.match("^Explicit Route:|My", line):
+                if "Explicit Route:" in line:
+                    explicit_route = []
+                    explicit_route.extend(line.split(":")[1].split())
+
+                    if key1 == "rsvp_signalling_info":
+                        res['tunnel_type'][base_key]['tunnel_name'][key][key1]['rsvp_path_info']\
+                                ['explicit_route']=explicit_route
+                    elif key1 == "shortest_unconstrained_path_info":
+                        res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                            'explicit_route'] = explicit_route
+                else:
+                    res['tunnel_type'][base_key]['tunnel_name'][key][key1]['rsvp_path_info']\
+                    [line.split(":")[0].strip().lower().replace(" ","_")]=line.split(":")[1].\
+                                                                            lower().strip()
+                continue
+
+            ##  Node Hop Count: 1
+            if "Node Hop Count:" in line:
+                ib = int(line.split(":")[1].lower().strip())
+                res['tunnel_type'][base_key]['tunnel_name'][key][line.split(
+                    ":")[0].strip().lower().replace(" ", "_")] = ib
+                continue
+
+            ###Fault-OAM: disabled, Wrap-Protection: disabled, Wrap-Capable: No
+            ###Hop Limit: disabled
+            ###Cost Limit: disabled
+            ###BandwidthOverride: disabled  LockDown: enabled   Verbatim: disabled
+            ###auto-bw: disabled
+            m10 = p10.match(line)
+            if m10:
+                line = re.sub(r'\:\s{2,}', ": ", line.strip())
+                re9 = re.split("\s{2,}|,", line.strip())
+                for i in re9:
+                    ib = i.split(":")[1].strip().replace("[ignore", "").strip()
+                    res['tunnel_type'][base_key]['tunnel_name'][key][key1][i.split(":")[0].strip()\
+                        .lower().replace(" ","_").replace("-","_").strip()]=\
+                        int(ib) if ib.isdecimal() else ib
+                continue
+
+            #Explicit Route: 193.1.1.2 196.1.1.2 196.1.1.1 198.1.1.1
+            #198.1.1.2 2.2.2.2
+            if p11.match(line):
+                explicit_route.extend(line.split())
+
+            ###Admin: up         Oper: up     Path: valid       Signalling: connected
+            if "Admin:" in line:
+                m13 = p13.findall(line)
+                if m13:
+                    line = re.sub(r'\:\s{1,}', ":", line.strip())
+                    for match in m13:
+                        res['tunnel_type'][base_key]['tunnel_name'][key][key1][match[0].strip().lower()]=\
+                                        match[1].strip().lower()
+                continue
+
+            ##Path-invalidation timeout: 10000 msec (default), Action: Tear
+            m14 = p14.match(line)
+            if m14:
+                re14 = m14.groupdict()
+                for item, value in re14.items():
+                    res['tunnel_type'][base_key]['tunnel_name'][key][key1][item]=\
+                                    int(value) if value.isdecimal() else value
+                continue
+
+            ###Number of LSP IDs (Tun_Instances) used: 19
+            m16 = p16.match(line)
+            if m16:
+                res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                    'tunnel']["number_of_lsp_ids_used"] = int(
+                        line.split(":")[1])
+                continue
+
+            ###Current LSP: [ID: 19]
+            m17 = p17.match(line)
+            if m17:
+                id = m17.groupdict()
+                res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                    'current_lsp_id'] = {}
+                res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                    'current_lsp_id'][id['id']] = {}
+                continue
+
+            ###Uptime: 9 hours, 52 minutes
+            ###Selection: reoptimization
+            m18 = p18.match(line)
+            if m18:
+                res18 = p18.findall(line)
+                res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                    'current_lsp_id'][id['id']][res18[0]
+                                                [0].lower()] = res18[0][1]
+                continue
+
+            #Metric Type: TE (default)
+            m19 = p19.match(line)
+            if m19:
+                res19 = m19.groupdict()
+                res['tunnel_type'][base_key]['tunnel_name'][key][
+                    "config_parameters"]['metric_used'] = res19['metric_used']
+                if res19.get("metric_type", None):
+                    res['tunnel_type'][base_key]['tunnel_name'][key][
+                        'config_parameters']['metric_type'] = res19[
+                            'metric_type']
+                continue
+
+            ###Prior LSP: [ID: 19]
+            m20 = p20.match(line)
+            if m20:
+                id = m20.groupdict()
+                res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                    'prior_lsp_id'] = {}
+                res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                    'prior_lsp_id'][id['id']] = {}
+                continue
+
+            ###ID: path option 3 [35]
+            ###Removal Trigger: tunnel shutdown
+            ###Last Error: CTRL:: Explicit path has unknown address, 194.1.1.1
+            m21 = p21.match(line)
+            if m21:
+                res21 = p21.findall(line)
+                for prior_key, prior_value in res21:
+                    res['tunnel_type'][base_key]['tunnel_name'][key][key1][
+                        'prior_lsp_id'][id['id']][prior_key.lower().replace(
+                            " ", "_")] = prior_value
+                continue
+
+        return res
+
+
+# =============================================
+# Parser for 'show mpls traffic-eng tunnels brief'
+# =============================================
+
+
+class ShowMplsTrafficEngTunnelBriefSchema(MetaParser):
+    """Schema for show mpls traffic-eng tunnels brief
+    """
+
+    schema = {
+        Optional('signalling_summary'): {
+            Optional('lsp_tunnels_process'): str,
+            Optional('passive_lsp_listener'): str,
+            Optional('rsvp_process'): str,
+            Optional('forwarding'): str,
+            Optional('auto_tunnel'): {
+                Optional('p2p_state'): str,
+                Optional('min_range'): str,
+                Optional('max_range'): str
+            },
+            Optional('periodic_reoptimization'): str,
+            Optional('periodic_frr_promotion'): str,
+            Optional('periodic_auto_bw_collection'): str,
+            Optional('sr_tunnel_max_label_push'): str
+        },
+        'p2p_tunnels': {
+            Optional('tunnel_id'): {
+                Optional(Any()): {
+                    Optional('destination_ip'): str,
+                    Optional('up_intf'): str,
+                    Optional('down_intf'): str,
+                    Optional('state'): str,
+                    Optional('prot'): str
+                },
+            },
+        },
+        'p2mp_tunnels': {
+            Optional('tunnel_id'): str
+        }
+    }
+
+
+class ShowMplsTrafficEngTunnelBrief(ShowMplsTrafficEngTunnelBriefSchema):
+    """ Parser for show mpls traffic-eng tunnels brief"""
+
+    cli_command = 'show mpls traffic-eng tunnels brief'
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        result_dict = {}
+        res = 1
+
+        #Matches pattern with key:
+        #Eg:
+        #Signalling Summary:
+        #P2P TUNNELS/LSPs:
+        #P2MP TUNNELS:
+        p1 = re.compile(r"^(?P<key>[a-zA-Z\/\d ]+)\:$")
+
+        #Matched lines for p2 regex, all the string with the format, key: value
+        # Eg: LSP Tunnels Process:            running
+        p2 = re.compile(r'^(?P<key1>[\S ]+)\:\s+(?P<value1>[\S ]+)$')
+
+        #Macallan-SVL_t100                2.2.2.2          -         Gi1/1/0/2 up/up
+        p3 = re.compile(
+            r'\S+\_(?P<tunnel_id>\S+)\s+(?P<destination_ip>\S+)\s+(?P<up_intf>\S+)\s+(?P<down_intf>\S+)\s+(?P<state>\S+)\/(?P<prot>\S+)'
+        )
+
+        #p2p    Disabled (0), id-range:62336-64335
+        p4 = re.compile(
+            r'\S+\s+(?P<p2p_state>\S+)\s+\S+\,\s+[a-z\- ]+\:(?P<min_range>\d+)\-(?P<max_range>\d+)'
+        )
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            #P2P TUNNELS/LSPs:
+            #line that contains <key>:
+            m1 = p1.match(line)
+            if m1:
+                r = m1.groupdict()
+                key = r['key'].lower().replace(" ", "_").replace(
+                    "/lsps", "")  ##replace space and /lsps
+                result_dict[key] = {}
+
+            #    Periodic reoptimization:        every 180 seconds, next in 127 seconds
+            m2 = p2.match(line)
+            if m2:
+                r1 = m2.groupdict()
+                #Value that have , or ( fetch the first digit from that line else consider the value as it is.
+                #Eg:Periodic reoptimization: every 180 seconds, next in 127 seconds
+                if ("," in r1['value1']) or ("(" in r1['value1']):
+                    res2 = re.findall('(\d+)', r1['value1'])[0]
+                else:
+                    #LSP Tunnels Process:            running
+                    res2 = r1['value1']
+                result_dict[key][r1['key1'].lower().replace(" ", "_").replace(
+                    "-", "_")] = res2
+
+            #Macallan-SVL_t100                          2.2.2.2          -         Po60      up/up
+            m3 = p3.match(line)
+            if m3:
+                if res == 1:
+                    result_dict[key]['tunnel_id'] = {}
+                    res = 0
+                r3 = m3.groupdict()
+                key1 = r3['tunnel_id']
+                del r3['tunnel_id']
+                result_dict[key]['tunnel_id'][key1] = {}
+                for item, value in r3.items():
+                    result_dict[key]['tunnel_id'][key1][item] = value
+
+            #Add 'auto-tunnel' as key
+            if "auto-tunnel" in line:
+                result_dict[key]['auto_tunnel'] = {}
+
+            #	p2p    Disabled (0), id-range:62336-64335
+            m4 = p4.match(line)
+            if m4:
+                r4 = m4.groupdict()
+                for item, value in r4.items():
+                    result_dict[key]['auto_tunnel'][item] = value
+        return result_dict
+
+class ShowMplsLabelRangeSchema(MetaParser):
+    '''
+    Search for
+    show mpls label range
+    '''
+
+    schema = {
+        'downstream_generic_label_region': {
+            'min_label': int,
+            'max_label': int
+        },
+    }
+
+class ShowMplsLabelRange(ShowMplsLabelRangeSchema):
+    '''
+    Parser for
+    show mpls label range
+    '''
+
+    cli_command = 'show mpls label range'
+
+    def cli(self,output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        ret_dict = {}
+
+        p1 = re.compile(r'^Downstream Generic label region: Min/Max label: (?P<min_label>\d+)\/(?P<max_label>\d+)$')
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            #Downstream Generic label region: Min/Max label: 16/983039
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                if 'downstream_generic_label_region' not in ret_dict:
+                    downstream_generic_label_region = ret_dict.setdefault('downstream_generic_label_region',{})
+                downstream_generic_label_region.update({
+                    'min_label': int(group['min_label']),
+                    'max_label': int(group['max_label'])})
+                continue
+
+        return ret_dict
+
+# ======================================================
+# Parser for 'show mpls traffic-eng autoroute '
+# ======================================================
+
+class ShowMplsTrafficEngAutorouteSchema(MetaParser):
+    """Schema for show mpls traffic-eng autoroute"""
+
+    schema = {
+        'status': str,
+        Optional('destination'): str,
+        Optional('protocol'): str,
+        Optional('number_of_tunnels'): str,
+        Optional('tunnel'): {
+            Optional('tunnel_number'): str,
+            Optional('load_balance_metric'): str,
+            Optional('nexthop'): str,
+            Optional('flags'): str,
+        },
+    }
+
+class ShowMplsTrafficEngAutoroute(ShowMplsTrafficEngAutorouteSchema):
+    """Parser for show mpls traffic-eng autoroute"""
+
+    cli_command = 'show mpls traffic-eng autoroute'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        # MPLS TE autorouting enabled
+        p1 = re.compile(r"^MPLS\s+TE\s+autorouting\s+(?P<status>\w+)|:.+$")
+        #   destination 2.2.2.2, area ospf 1  area 0, has 1 tunnels
+        p2 = re.compile(r"^destination\s+(?P<destination>(\d{1,4}\.){3}\d{1,4}),\s+(?P<protocol>.+),\s+has\s+(?P<number_of_tunnels>\d+)\s+tunnels$")
+        #     Tunnel100   (load balancing metric 4000000, nexthop 2.2.2.2)
+        p3 = re.compile(r"^(?P<tunnel_number>\S+)\s+\(load\s+balancing\s+metric\s+(?P<load_balance_metric>\d+),\s+nexthop\s+(?P<nexthop>(\d{1,3}\.){3}\d{1,3})\)$")
+        #                 (flags: Announce)
+        p3_1 = re.compile(r"^\(flags:\s+(?P<flags>\w+)\)$")
+
+        ret_dict = {}
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            # MPLS TE autorouting enabled
+            m = p1.match(line)
+            if m:
+                dict_val = m.groupdict()
+                ret_dict['status'] = dict_val['status']
+                continue
+
+            #   destination 2.2.2.2, area ospf 1  area 0, has 1 tunnels
+            m = p2.match(line)
+            if m:
+                dict_val = m.groupdict()
+                ret_dict['destination'] = dict_val['destination']
+                ret_dict['protocol'] = dict_val['protocol']
+                ret_dict['number_of_tunnels'] = dict_val['number_of_tunnels']
+                continue
+
+            #     Tunnel100   (load balancing metric 4000000, nexthop 2.2.2.2)
+            m = p3.match(line)
+            if m:
+                dict_val = m.groupdict()
+                tunnel = ret_dict.setdefault('tunnel', {})
+                tunnel['tunnel_number'] = dict_val['tunnel_number']
+                tunnel['load_balance_metric'] = dict_val['load_balance_metric']
+                tunnel['nexthop'] = dict_val['nexthop']
+                continue
+
+            #                 (flags: Announce)
+            m = p3_1.match(line)
+            if m:
+                dict_val = m.groupdict()
+                tunnel = ret_dict.setdefault('tunnel', {})
+                tunnel['flags'] = dict_val['flags']
+                continue
+
+        return ret_dict
+
+# ======================================================
+# Parser for 'show mpls forwarding-table summary '
+# ======================================================
+
+class ShowMplsForwardingTableSummarySchema(MetaParser):
+    """Schema for show mpls forwarding-table summary"""
+
+    schema = {
+        'total_label': int,
+    }
+
+class ShowMplsForwardingTableSummary(ShowMplsForwardingTableSummarySchema):
+    """Parser for show mpls forwarding-table summary"""
+
+    cli_command = 'show mpls forwarding-table summary'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        # 9 total labels
+        p1 = re.compile(r"^(?P<total_label>\d+)\s+total\s+labels$")
+
+        ret_dict = {}
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            # 9 total labels
+            m = p1.match(line)
+            if m:
+                dict_val = m.groupdict()
+                ret_dict['total_label'] = int(dict_val['total_label'])
+                continue
+
+        return ret_dict
+
+
+# ======================================================
+# Parser for 'show mpls traffic-eng link-management advertisements '
+# ======================================================
+class ShowMplsTrafficEngLinkManagementAdvertisementsSchema(MetaParser):
+    """Schema for show mpls traffic-eng link-management advertisements"""
+
+    schema = {
+        'link_id': {
+            Any(): {
+                'interface': str,
+                'link_subnet_type': str,
+                'link_ip_address': str,
+                'designated_router': str,
+                'te_metric': int,
+                'igp_metric': int,
+                'srlgs': str,
+                'physical_bandwidth': int,
+                'reserved_global_bandwidth': int,
+                'reserved_sub_bandwidth': int,
+                'attribute_flags': str,
+                'downstream': {
+                    Any(): {
+                        'global_pool': int,
+                        'sub_pool': int
+                    }
+                }
+            }
+        }
+    }
+
+class ShowMplsTrafficEngLinkManagementAdvertisements(ShowMplsTrafficEngLinkManagementAdvertisementsSchema):
+    """Parser for show mpls traffic-eng link-management advertisements"""
+
+    cli_command = 'show mpls traffic-eng link-management advertisements'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        # Link ID::  2 (Port-channel60)
+        p1 = re.compile(r"^Link\s+ID::\s+(?P<link_id>\d+)\s+\((?P<interface>\S+)\)$")
+        
+        # Link Subnet Type:     Broadcast
+        p2 = re.compile(r"^Link\s+Subnet\s+Type:\s+(?P<link_subnet_type>\w+)$")
+        
+        # Link IP Address:      195.1.1.1
+        p3 = re.compile(r"^Link\s+IP\s+Address:\s+(?P<link_ip_address>(\d{1,3}\.){3}\d{1,3})$")
+        
+        # Designated Router:    195.1.1.1
+        p4 = re.compile(r"^Designated\s+Router:\s+(?P<designated_router>(\d{1,3}\.){3}\d{1,3})$")
+        
+        # TE metric:            1
+        p5 = re.compile(r"^TE\s+metric:\s+(?P<te_metric>\d+)$")
+        
+        # IGP metric:           1
+        p6 = re.compile(r"^IGP\s+metric:\s+(?P<igp_metric>\d+)$")
+        
+        # SRLGs:                None
+        p7 = re.compile(r"^SRLGs:\s+(?P<srlgs>\w+)$")
+        
+        # Physical Bandwidth:   80000000 kbits/sec
+        p8 = re.compile(r"^Physical\s+Bandwidth:\s+(?P<physical_bandwidth>\d+)\s+kbits\/sec$")
+        
+        # Res. Global BW:       50000 kbits/sec
+        p9 = re.compile(r"^Res\.\s+Global\s+BW:\s+(?P<reserved_global_bandwidth>\d+)\s+kbits\/sec$")
+        
+        # Res. Sub BW:          0 kbits/sec
+        p10 = re.compile(r"^Res\.\s+Sub\s+BW:\s+(?P<reserved_sub_bandwidth>\d+)\s+kbits\/sec$")
+
+        # Attribute Flags:      0x00000000
+        p11 = re.compile(r"^Attribute Flags:\s+(?P<attribute_flags>\w+)$")
+
+        # Reservable Bandwidth[0]:        50000            0 kbits/sec
+        p12 = re.compile(r"^(?P<bandwidth_name>.+)\[(?P<count>\d+)\]:\s+(?P<global_pool>\d+)\s+(?P<sub_pool>\d+) kbits\/sec$")
+        
+        ret_dict = {}
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            # Link ID::  2 (Port-channel60)
+            m = p1.match(line)
+            if m:
+                dict_val = m.groupdict()
+                link_dict = ret_dict.setdefault('link_id', {}).setdefault(dict_val['link_id'], {})
+                link_dict['interface'] = dict_val['interface']
+                continue
+
+            # Link Subnet Type:     Broadcast
+            m = p2.match(line)
+            if m:
+                link_dict['link_subnet_type'] = m.groupdict()['link_subnet_type']
+                continue
+
+            # Link IP Address:      195.1.1.1
+            m = p3.match(line)
+            if m:
+                link_dict['link_ip_address'] = m.groupdict()['link_ip_address']
+                continue
+
+            # Designated Router:    195.1.1.1
+            m = p4.match(line)
+            if m:
+                link_dict['designated_router'] = m.groupdict()['designated_router']
+                continue
+
+            # TE metric:            1
+            m = p5.match(line)
+            if m:
+                link_dict['te_metric'] = int(m.groupdict()['te_metric'])
+                continue
+
+            # IGP metric:           1
+            m = p6.match(line)
+            if m:
+                link_dict['igp_metric'] = int(m.groupdict()['igp_metric'])
+                continue
+
+            # SRLGs:                None
+            m = p7.match(line)
+            if m:
+                link_dict['srlgs'] = m.groupdict()['srlgs']
+                continue
+
+            # Physical Bandwidth:   80000000 kbits/sec
+            m = p8.match(line)
+            if m:
+                link_dict['physical_bandwidth'] = int(m.groupdict()['physical_bandwidth'])
+                continue
+
+            # Res. Global BW:       50000 kbits/sec
+            m = p9.match(line)
+            if m:
+                link_dict['reserved_global_bandwidth'] = int(m.groupdict()['reserved_global_bandwidth'])
+                continue
+
+            # Res. Sub BW:          0 kbits/sec
+            m = p10.match(line)
+            if m:
+                link_dict['reserved_sub_bandwidth'] = int(m.groupdict()['reserved_sub_bandwidth'])
+                continue
+
+            # Attribute Flags:      0x00000000
+            m = p11.match(line)
+            if m:
+                link_dict['attribute_flags'] = m.groupdict()['attribute_flags']
+                continue
+
+            # Reservable Bandwidth[0]:        50000            0 kbits/sec
+            m = p12.match(line)
+            if m:
+                dict_val = m.groupdict()
+                name = f"{dict_val['bandwidth_name'].lower().replace(' ', '_')}_{dict_val['count']}"
+                band_dict = link_dict.setdefault('downstream', {}).setdefault(name, {})
+                band_dict['global_pool'] = int(dict_val['global_pool'])
+                band_dict['sub_pool'] = int(dict_val['sub_pool'])
+                continue
+
+        return ret_dict
+
+
+class ShowMplsTrafficEngTopologySchema(MetaParser):
+    """Schema for show mpls traffic-eng topology"""
+
+    schema = {
+        'system_id': str,
+        Optional('ospf_process_id'): int,
+        Optional('area_id'): int,
+        'signalling_error_holddown': int,
+        'global_link_generation': int,
+        'igp_id': {
+            Any(): {
+                'mpls_te_id': str,
+                'node': str,
+                Optional('ospf_process_id'): int,
+                Optional('area_id'): int,
+                'link': {
+                    Any(): {
+                        'type': str,
+                        'dr': str,
+                        'nbr_node_id': int,
+                        'gen': int,
+                        'frag_id': int,
+                        'interface_address': str,
+                        'te_metric': int,
+                        'igp_metric': int,
+                        'attribute_flags': str,
+                        'srlgs': str,
+                        'physical_bw': int,
+                        'max_reservable_bw_global': int,
+                        'max_reservable_bw_sub': int,
+                        'bandwidth': {
+                            Any(): {
+                                'total_allocated_bw': int,
+                                'global_pool_reservable_bw': int,
+                                'sub_pool_reservable_bw': int
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+
+class ShowMplsTrafficEngTopology(ShowMplsTrafficEngTopologySchema):
+    """Parser for show mpls traffic-eng autoroute"""
+
+    cli_command = 'show mpls traffic-eng topology'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+        
+            # My_System_id: 18.18.18.18 (ospf 1  area 0)
+            p1 = re.compile(r'^My_System_id: (?P<system_id>\S+) \(ospf (?P<ospf_process_id>\d+)  area (?P<area_id>\d+)\)$')
+
+            # Signalling error holddown: 30 sec Global Link Generation 30
+            p2 = re.compile(r'^Signalling error holddown: (?P<signalling_error_holddown>\d+)'
+                            r' sec Global Link Generation (?P<global_link_generation>\d+)$')
+            
+            # IGP Id: 1.1.1.1, MPLS TE Id:1.1.1.1 Router Node  (ospf 1  area 0)
+            p3 = re.compile(r'^IGP Id: (?P<igp_id>\S+), MPLS TE Id:(?P<mpls_te_id>\S+)'
+                            r' (?P<node>\S+) Node(  \(ospf (?P<ospf_process_id>\d+)  area (?P<area_id>\d+)\))?$')
+
+            # link[0]: Broadcast, DR: 172.15.145.5, nbr_node_id:2, gen:25
+            p4 = re.compile(r'^link\[(?P<link>\d+)\]: (?P<type>.+), DR: (?P<dr>\S+),'
+                            r' nbr_node_id:(?P<nbr_node_id>\d+), gen:(?P<gen>\d+)$')
+            
+            # frag_id: 110, Intf Address: 172.15.145.14
+            p5 = re.compile(r'^frag_id: (?P<frag_id>\d+), Intf Address: (?P<interface_address>\S+)$')
+            
+            # TE metric: 1, IGP metric: 1, attribute flags: 0x0
+            p6 = re.compile(r'^TE metric: (?P<te_metric>\d+), IGP metric: (?P<igp_metric>\d+),'
+                            r' attribute flags: (?P<attribute_flags>\S+)$')
+            
+            # SRLGs: None 
+            p7 = re.compile(r'^SRLGs: (?P<srlgs>\S+)$')
+
+            # physical_bw: 10000000 (kbps), max_reservable_bw_global: 7499999 (kbps)
+            p8 = re.compile(r'^physical_bw: (?P<physical_bw>\d+) \(kbps\), max_reservable_bw_global:'
+                            r' (?P<max_reservable_bw_global>\d+) \(kbps\)$')
+            
+            # max_reservable_bw_sub: 0 (kbps)
+            p9 = re.compile(r'^max_reservable_bw_sub: (?P<max_reservable_bw_sub>\d+) \(kbps\)$')
+
+            #                     Global Pool       Sub Pool
+            # Total Allocated   Reservable        Reservable
+            # BW (kbps)         BW (kbps)         BW (kbps)
+            # ---------------   -----------       ----------
+            # bw[0]:            0          7499999                0
+            # bw[1]:            0          7499999                0
+            p10 = re.compile(r'^bw\[(?P<bandwidth>\d+)\]:\s+(?P<total_allocated_bw>\d+)'
+                             r'\s+(?P<global_pool_reservable_bw>\d+)\s+(?P<sub_pool_reservable_bw>\d+)$')
+
+            ret_dict = {}
+
+            for line in output.splitlines():
+                line = line.strip()
+
+                # My_System_id: 18.18.18.18 (ospf 1  area 0)
+                m = p1.match(line)
+                if m:
+                    group_dict = m.groupdict()
+                    ret_dict['system_id'] = group_dict['system_id']
+                    if group_dict['ospf_process_id']:
+                        ret_dict['ospf_process_id'] = int(group_dict['ospf_process_id'])
+                        ret_dict['area_id'] = int(group_dict['area_id'])
+                    continue
+
+                # Signalling error holddown: 30 sec Global Link Generation 30
+                m = p2.match(line)
+                if m:
+                    ret_dict['signalling_error_holddown'] = int(m.groupdict()['signalling_error_holddown'])
+                    ret_dict['global_link_generation'] = int(m.groupdict()['global_link_generation'])
+                    continue
+                
+                # IGP Id: 1.1.1.1, MPLS TE Id:1.1.1.1 Router Node  (ospf 1  area 0)
+                m = p3.match(line)
+                if m:
+                    group_dict = m.groupdict()
+                    igp_id_dict = ret_dict.setdefault('igp_id', {}).setdefault(group_dict['igp_id'], {})
+                    igp_id_dict['mpls_te_id'] = group_dict['mpls_te_id']
+                    igp_id_dict['node'] = group_dict['node']
+                    if group_dict['ospf_process_id']:
+                        igp_id_dict['ospf_process_id'] = int(group_dict['ospf_process_id'])
+                        igp_id_dict['area_id'] = int(group_dict['area_id'])
+                    continue
+
+                # link[0]: Broadcast, DR: 172.15.145.5, nbr_node_id:2, gen:25
+                m = p4.match(line)
+                if m:
+                    group_dict = m.groupdict()
+                    link_dict = igp_id_dict.setdefault('link', {}).setdefault(group_dict['link'], {})
+                    link_dict['type'] = group_dict['type']
+                    link_dict['dr'] = group_dict['dr']
+                    link_dict['nbr_node_id'] = int(group_dict['nbr_node_id'])
+                    link_dict['gen'] = int(group_dict['gen'])
+                    continue
+
+                # frag_id: 110, Intf Address: 172.15.145.14
+                m = p5.match(line)
+                if m:
+                    link_dict['frag_id'] = int(m.groupdict()['frag_id'])
+                    link_dict['interface_address'] = m.groupdict()['interface_address']
+                    continue
+
+                # TE metric: 1, IGP metric: 1, attribute flags: 0x0
+                m = p6.match(line)
+                if m:
+                    group_dict = m.groupdict()
+                    link_dict['te_metric'] = int(group_dict['te_metric'])
+                    link_dict['igp_metric'] = int(group_dict['igp_metric'])
+                    link_dict['attribute_flags'] = group_dict['attribute_flags']
+                    continue
+
+                # SRLGs: None 
+                m = p7.match(line)
+                if m:
+                    link_dict['srlgs'] = m.groupdict()['srlgs']
+                    continue
+
+                # physical_bw: 10000000 (kbps), max_reservable_bw_global: 7499999 (kbps)
+                m = p8.match(line)
+                if m:
+                    link_dict['physical_bw'] = int(m.groupdict()['physical_bw'])
+                    link_dict['max_reservable_bw_global'] = int(m.groupdict()['max_reservable_bw_global'])
+                    continue
+
+                # max_reservable_bw_sub: 0 (kbps)
+                m = p9.match(line)
+                if m:
+                    link_dict['max_reservable_bw_sub'] = int(m.groupdict()['max_reservable_bw_sub'])
+                    continue
+
+                #                     Global Pool       Sub Pool
+                # Total Allocated   Reservable        Reservable
+                # BW (kbps)         BW (kbps)         BW (kbps)
+                # ---------------   -----------       ----------
+                # bw[0]:            0          7499999                0
+                # bw[1]:            0          7499999                0
+                m = p10.match(line)
+                if m:
+                    group_dict = m.groupdict()
+                    bandwidth_dict = link_dict.setdefault('bandwidth', {}).setdefault(group_dict['bandwidth'], {})
+                    bandwidth_dict['total_allocated_bw'] = int(group_dict['total_allocated_bw'])
+                    bandwidth_dict['global_pool_reservable_bw'] = int(group_dict['global_pool_reservable_bw'])
+                    bandwidth_dict['sub_pool_reservable_bw'] = int(group_dict['sub_pool_reservable_bw'])
+                    continue
+            
+            return ret_dict
+
+
+class ShowMplsTrafficEngFastRerouteDatabaseDetailSchema(MetaParser):
+    """Schema for show mpls traffic-eng fast-reroute database detail"""
+
+    schema = {
+        'frr_db_summary': {
+            'protected_intfs_num': int,
+            'protected_lsps_num': int,
+            'backup_tunnels_num': int,
+            'active_intfs_num': int,
+            'frr_active_tunnels_num': int,
+
+        },
+        Optional('p2p_lsps'): {
+            Any(): {
+                Any(): {
+                    'src_ip': str,
+                    'dst_ip': str,
+                    'state': str,
+                    'in_label': str,
+                    'out_intf': str,
+                    'out_label': str,
+                    'frr_tunnel': str,
+                    'frr_out_label': str,
+                },
+            },
+        },
+        Optional('p2mp_sub_lsps'): {
+            Any(): {
+                Any(): {
+                    'src_ip': str,
+                    'dst_ip': str,
+                    'state': str,
+                    'in_label': str,
+                    'out_intf': str,
+                    'out_label': str,
+                    'frr_tunnel': str,
+                    'frr_out_label': str,
+                },
+            },
+        }
+    }
+
+
+# ===============================================================
+# Parser for 'show mpls traffic-eng fast-reroute database detail'
+# ===============================================================
+class ShowMplsTrafficEngFastRerouteDatabaseDetail \
+            (ShowMplsTrafficEngFastRerouteDatabaseDetailSchema):
+    """Parser for show mpls traffic-eng fast-reroute database detail"""
+
+    cli_command = 'show mpls traffic-eng fast-reroute database detail'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        # FRR Database Summary:
+        p0 = re.compile(r'^FRR\s+Database\s+Summary\s*:$')
+
+        # Protected interfaces    : 2
+        p1 = re.compile(r'Protected\s+interfaces\s*:\s*'
+                        r'(?P<protected_intfs_num>\d+)$')
+
+        # Protected LSPs/Sub-LSPs : 2
+        p2 = re.compile(r'Protected\s+LSPs\/Sub\-LSPs\s*:\s*'
+                        r'(?P<protected_lsps_num>\d+)$')
+
+        # Backup tunnels          : 3
+        p3 = re.compile(r'Backup\s+tunnels\s*:\s*'
+                        r'(?P<backup_tunnels_num>\d+)$')
+
+        # Active interfaces       : 0
+        p4 = re.compile(r'Active\s+interfaces\s*:\s*'
+                        r'(?P<active_intfs_num>\d+)$')
+
+        # FRR Active tunnels      : 0
+        p5 = re.compile(r'FRR\s+Active\s+tunnels\s*:\s*'
+                        r'(?P<frr_active_tunnels_num>\d+)$')
+
+        # P2P LSPs:
+        p6 = re.compile(r'^P2P\s+LSPs\s*:$')
+
+        # P2MP Sub-LSPs:
+        p7 = re.compile(r'^P2MP\s+Sub\-LSPs\s*:$')
+
+        # Tun ID: 14, LSP ID: 113, Source: 1.1.1.1
+        p8 = re.compile(r'Tun\s+ID\s*:\s*(?P<tun_id>\d+)\s*,\s*'
+                        r'LSP\s+ID\s*:\s*(?P<lsp_id>\d+)\s*,\s*'
+                        r'Source\s*:\s*(?P<src_ip>.+)$')
+
+        # Destination: 4.4.4.4
+        p9 = re.compile(r'Destination\s*:\s*'
+                        r'(?P<dst_ip>.+)$')
+
+        # State        : ready
+        p10 = re.compile(r'State\s*:\s*'
+                         r'(?P<state>.+)$')
+
+        # InLabel      : 30
+        p11 = re.compile(r'InLabel\s*:\s*'
+                         r'(?P<in_label>.+)$')
+
+        # OutLabel     : Twe0/0/16:19
+        p12 = re.compile(r'OutLabel\s*:\s*'
+                         r'(?P<out_intf>.+)\s*:\s*'
+                         r'(?P<out_label>.+)$')
+
+        # FRR OutLabel : Tu231:19
+        p13 = re.compile(r'FRR\s+OutLabel\s*:\s*'
+                         r'(?P<frr_tunnel>.+)\s*:\s*'
+                         r'(?P<frr_out_label>.+)$')
+
+        ret_dict = {}
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            # FRR Database Summary:
+            m = p0.match(line)
+            if m:
+                frr_db_summary_dict = ret_dict.setdefault('frr_db_summary', {})
+                continue
+
+            # Protected interfaces    : 2
+            m = p1.match(line)
+            if m:
+                group_dict = m.groupdict()
+                frr_db_summary_dict['protected_intfs_num'] = \
+                    int(group_dict['protected_intfs_num'])
+                continue
+
+            # Protected LSPs/Sub-LSPs : 2
+            m = p2.match(line)
+            if m:
+                group_dict = m.groupdict()
+                frr_db_summary_dict['protected_lsps_num'] = \
+                    int(group_dict['protected_lsps_num'])
+                continue
+
+            # Backup tunnels          : 3
+            m = p3.match(line)
+            if m:
+                group_dict = m.groupdict()
+                frr_db_summary_dict['backup_tunnels_num'] = \
+                    int(group_dict['backup_tunnels_num'])
+                continue
+
+            # Active interfaces       : 0
+            m = p4.match(line)
+            if m:
+                group_dict = m.groupdict()
+                frr_db_summary_dict['active_intfs_num'] = \
+                    int(group_dict['active_intfs_num'])
+                continue
+
+            # FRR Active tunnels      : 0
+            m = p5.match(line)
+            if m:
+                group_dict = m.groupdict()
+                frr_db_summary_dict['frr_active_tunnels_num'] = \
+                    int(group_dict['frr_active_tunnels_num'])
+                continue
+
+            # P2P LSPs:
+            m = p6.match(line)
+            if m:
+                lsps_dict = ret_dict.setdefault('p2p_lsps', {})
+                continue
+
+            # P2MP Sub-LSPs:
+            m = p7.match(line)
+            if m:
+                lsps_dict = ret_dict.setdefault('p2mp_sub_lsps', {})
+                continue
+
+            # Tun ID: 14, LSP ID: 113, Source: 1.1.1.1
+            m = p8.match(line)
+            if m:
+                group_dict = m.groupdict()
+                tunnel_id = Common.convert_intf_name(
+                    f"tu{group_dict['tun_id']}")
+
+                lsp_dict = lsps_dict. \
+                    setdefault(tunnel_id, {}). \
+                    setdefault(f"lsp{group_dict['lsp_id']}", {})
+
+                lsp_dict['src_ip'] = group_dict['src_ip']
+                continue
+
+            # Destination: 4.4.4.4
+            m = p9.match(line)
+            if m:
+                group_dict = m.groupdict()
+                lsp_dict['dst_ip'] = group_dict['dst_ip']
+                continue
+
+            # State        : ready
+            m = p10.match(line)
+            if m:
+                group_dict = m.groupdict()
+                lsp_dict['state'] = group_dict['state']
+                continue
+
+            # InLabel      : 30
+            m = p11.match(line)
+            if m:
+                group_dict = m.groupdict()
+                lsp_dict['in_label'] = group_dict['in_label']
+                continue
+
+            # OutLabel     : Twe0/0/16:19
+            m = p12.match(line)
+            if m:
+                group_dict = m.groupdict()
+                lsp_dict['out_intf'] = \
+                    Common.convert_intf_name(group_dict['out_intf'])
+                lsp_dict['out_label'] = group_dict['out_label']
+                continue
+
+            # FRR OutLabel : Tu231:19
+            m = p13.match(line)
+            if m:
+                group_dict = m.groupdict()
+                lsp_dict['frr_tunnel'] = Common.convert_intf_name(group_dict['frr_tunnel'])
+                lsp_dict['frr_out_label'] = group_dict['frr_out_label']
+                continue
+
+        return ret_dict
@@ -1,10 +1,28 @@
+''' show_route_map.py
+
+IOSXE parsers for the following show commands:
+
+    * 'show route-map all'
+    * 'show route-map {name}'
+    * 'show table-map {map}'
+    * 'show table-map'
+    
+'''
+
+#Python
 import re
+
+#MetaParser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
 class ShowRouteMapAllSchema(MetaParser):
-    """Schema for show route-map all"""
+    """
+    Schema for 
+    * show route-map all
+    * show route-map {name}
+    """
     schema = {
         Any(): {
             Optional('description'): str,
@@ -22,6 +40,7 @@ class ShowRouteMapAllSchema(MetaParser):
                         Optional('match_as_path_list'): str,
                         Optional('match_interface'): str,
                         Optional('match_prefix_list'): str,
+                        Optional('match_access_list'): str,
                         Optional('match_as_number_list'): str,
                         Optional('match_prefix_list_v6'): str,
                         Optional('match_tag_list'): str,
@@ -65,15 +84,21 @@ class ShowRouteMapAllSchema(MetaParser):
 
 
 class ShowRouteMapAll(ShowRouteMapAllSchema):
-    """Parser for show route-map all"""
-    cli_command = 'show route-map all'
-
-    def cli(self, output=None):
+    """
+    Parser for 
+    * show route-map all
+    * show route-map {name}
+    """
+    cli_command = ['show route-map all',
+                   'show route-map {name}']
+
+    def cli(self, name="", output=None):
         if output is None:
-            # get output from device
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
+            if name:
+                cmd = self.cli_command[1].format(name=name) 
+            else:
+                cmd = self.cli_command[0]
+            output = self.device.execute(cmd)
 
         route_map_dict = {}
         clause_type = ''
@@ -88,7 +113,7 @@ class ShowRouteMapAll(ShowRouteMapAllSchema):
         p1_2 = re.compile(r'^\s*(?P<clause_type>[a-zA-Z]+) +clauses:$')
 
         # description <description>
-        p1_1 = re.compile(r'^\s*description +(?P<description>[a-zA-Z0-9]+)$')
+        p1_1 = re.compile(r'^\s*description +(?P<description>.+)$')
 
         # as-path (as-path filter): aspathlist1
         p2 = re.compile(r'^\s*as-path *\(as-path *filter\):'
@@ -100,20 +125,23 @@ class ShowRouteMapAll(ShowRouteMapAllSchema):
 
         # ip address prefix-lists: test-test
         p3 = re.compile(r'^\s*ip *address *prefix-lists:'
-                        r' *(?P<match_prefix_list>[a-zA-Z0-9\s]+)$')
-
+                        r' *(?P<match_prefix_list>.+)$')
+        
+        #ip address (access-lists): pbr-acl
+        p3_1 = re.compile(r'^\s*ip\saddress\s\(access\-lists\)\:\s(?P<match_access_list>.+)')
+       
         #ip next-hop prefix-lists: test
         #ip next-hop (access-lists): 1
         p4 =  re.compile(r'^\s*ip *next-hop *(?P<match_type>[a-zA-Z0-9\S\(\)]+):'
-                         r' *(?P<match_nexthop_in>[a-zA-Z0-9\S]+)$')
+                         r' *(?P<match_nexthop_in>.+)$')
+        
+        # ipv6 address prefix-list test-test
+        p5 = re.compile(r'^\s*ipv6 *address *prefix-list(?:s\:)?'
+                        r' *(?P<match_prefix_list_v6>.+)$')
 
-        # ipv6 address prefix-lists: test-test
-        p5 = re.compile(r'^\s*ipv6 *address *prefix-lists:'
-                        r' *(?P<match_prefix_list_v6>[a-zA-Z0-9\S]+)$')
-
-        # ipv6 next-hop prefix-lists: test2
-        p6 = re.compile(r'^\s*ipv6 *next-hop *prefix-lists:'
-                        r' *(?P<match_nexthop_in_v6>[a-zA-Z0-9\-\s]+)$')
+        # ipv6 next-hop prefix-list test2
+        p6 = re.compile(r'^\s*ipv6 *next-hop *prefix-list(?:s\:)?'
+                        r' *(?P<match_nexthop_in_v6>.+)$')
 
         #interface GigabitEthernet1
         p7 = re.compile(r'^\s*interface *(?P<match_interface>[a-zA-Z0-9\/\s]+)$')
@@ -123,14 +151,14 @@ class ShowRouteMapAll(ShowRouteMapAllSchema):
 
         #community  (community-list filter): test3
         p10 = re.compile(r'^\s*community *\(community-list *filter\):'
-                         r' *(?P<match_community_list>[a-z0-9\-\s]+)$')
+                         r' *(?P<match_community_list>.+)$')
 
         #route-type: level-1 level-2
         p11 = re.compile(r'^\s*route-type *(?P<match_level_eq>[a-z0-9\-\s]+)$')
 
         # extcommunity  (extcommunity-list filter): testing
         p11_1 = re.compile(r'^\s*extcommunity *\(extcommunity-list *filter\):'
-                           r' *(?P<match_ext_community_list>[a-zA-Z]+)$')
+                           r' *(?P<match_ext_community_list>.+)$')
 
         # ip next-hop 10.64.4.4
         # ip next-hop 10.4.1.1 10.16.2.2
@@ -139,6 +167,9 @@ class ShowRouteMapAll(ShowRouteMapAllSchema):
         # ip next-hop self
         p12_1 = re.compile(r'^\s*ip *next-hop self$')
 
+        #ip default next-hop 100.0.0.2                                          
+        p12_2 = re.compile(r'^\s*ip\s(?P<match_type>\S+)\snext\-hop\s(?P<set_next_hop>.+)$')
+      
         # ipv6 next-hop 2001:db8:1::1
         # ipv6 next-hop 2001:DB8:1::1 2001:DB8:2::1
         p13 = re.compile(r'^\s*ipv6 *next-hop *(?P<set_next_hop_v6>[a-zA-Z0-9\:\s]+)$')
@@ -202,7 +233,7 @@ class ShowRouteMapAll(ShowRouteMapAllSchema):
         # Policy routing matches: 0 packets, 0 bytes
         p26 = re.compile(r'^\s*Policy\s+routing\s+matches:\s+(?P<packets>\d+)\spackets,\s+(?P<bytes>\d+)\s+bytes')
 
-        for line in out.splitlines():
+        for line in output.splitlines():
             line = line.rstrip()
 
             # route-map test, permit, sequence 10
@@ -267,7 +298,14 @@ class ShowRouteMapAll(ShowRouteMapAllSchema):
                 route_map_dict[name]['statements'][statements]['conditions']\
                 ['match_prefix_list'] = str(m.groupdict()['match_prefix_list'])
                 continue
-
+            
+            # ip address (access-lists): pbr-acl
+            m = p3_1.match(line)
+            if m:
+                route_map_dict[name]['statements'][statements]['conditions']\
+                ['match_access_list'] = m.groupdict()['match_access_list']
+                continue
+            
             #ip next-hop prefix-lists: test
             #ip next-hop (access-lists): 1
             m = p4.match(line)
@@ -275,19 +313,19 @@ class ShowRouteMapAll(ShowRouteMapAllSchema):
                 route_map_dict[name]['statements'][statements]['conditions']\
                 ['match_nexthop_in'] = m.groupdict()['match_nexthop_in'].split()
                 continue
-
-            # ipv6 address prefix-lists: test-test
+            
+            # ipv6 address prefix-list test-test
             m = p5.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['conditions']\
                 ['match_prefix_list_v6'] = str(m.groupdict()['match_prefix_list_v6'])
                 continue
 
-            # ipv6 next-hop prefix-lists: test2
+            # ipv6 next-hop prefix-list test2
             m = p6.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['conditions']\
-                ['match_nexthop_in_v6'] = str(m.groupdict()['match_nexthop_in_v6'])
+                ['match_nexthop_in_v6'] = m.groupdict()['match_nexthop_in_v6'].split()
                 continue
 
             #interface GigabitEthernet1
@@ -330,8 +368,7 @@ class ShowRouteMapAll(ShowRouteMapAllSchema):
             m = p11_1.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['conditions']\
-                ['match_ext_community_list'] = str(m.groupdict()\
-                ['match_ext_community_list'])
+                ['match_ext_community_list'] = str(m.groupdict()['match_ext_community_list'])
                 continue
 
             # ip next-hop 10.64.4.4
@@ -353,6 +390,13 @@ class ShowRouteMapAll(ShowRouteMapAllSchema):
                 ['set_next_hop_self'] = True
                 continue
 
+            #ip default next-hop 100.0.0.2                                      
+            m = p12_2.match(line)                                                
+            if m:                                                               
+                route_map_dict[name]['statements'][statements]['actions']\
+                ['set_next_hop'] = m.groupdict()['set_next_hop'].split()
+                continue 
+
             # ipv6 next-hop 2001:db8:1::1
             # ipv6 next-hop 2001:DB8:1::1 2001:DB8:2::1
             m = p13.match(line)
@@ -534,4 +578,84 @@ class ShowRouteMapAll(ShowRouteMapAllSchema):
                     route_map_dict[name]['statements'][statements].setdefault('policy_routing_matches', {}).setdefault(k, int(v))
                     continue
 
-        return route_map_dict
\ No newline at end of file
+        return route_map_dict
+
+# ==========================================================================================
+# Parser Schema for 'show table-map {map}'
+# ==========================================================================================
+
+class ShowTableMapSchema(MetaParser):
+    """Schema for show table-map {map}"""
+    schema = {
+        'table_map':{
+            Any(): {
+                'default': str,
+                'index': {
+                    Any():{
+                        'from': int,
+                        'to': int 
+                    }
+                }
+            }         
+        }
+    } 
+# ==========================================================================================
+# Parser for 'show table-map {map}'
+# ==========================================================================================
+
+class ShowTableMap(ShowTableMapSchema):
+    """Parser for show table-map {map}"""
+    cli_command = ['show table-map', 'show table-map {map}']
+    
+    def cli(self, map=None, output=None):
+        if output is None:
+            if map:
+                cmd = self.cli_command[1].format(map=map)
+            else:
+                cmd = self.cli_command[0]
+            
+            output = self.device.execute(cmd)
+        
+        # Table Map t1
+        p1 = re.compile(r'^Table Map (?P<table_map>\S+)$')
+        
+        # from 8 to 16
+        # from 16 to 32
+        p2 = re.compile(r'^(from (?P<from>\d+)\s+to\s+(?P<to>\d+))$')
+
+        # default copy
+        # default 8
+        p3 = re.compile(r'^default (?P<default>\w+)$')
+
+        ret_dict = {}
+        
+        counter = 0 #counter for events 
+        for line in output.splitlines():
+            line = line.strip()
+            
+            # Table Map t1
+            m = p1.match(line)
+            if m:
+                table_dict = ret_dict.setdefault('table_map', {}).setdefault(m.groupdict()['table_map'], {})
+                counter = 0
+                continue
+            
+            # from 8 to 16
+            # from 16 to 32
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                profile = table_dict.setdefault('index',{}).setdefault(int(counter),{})
+                profile['from'] = int(group['from'])
+                profile['to'] = int(group['to'])
+                counter += 1
+                continue
+            
+            # default copy
+            # default 8
+            m = p3.match(line)
+            if m:
+                table_dict['default'] = m.groupdict()['default']
+                continue
+
+        return ret_dict
@@ -4,7 +4,7 @@ show sdwan bfd history'''
 #Genie Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema,Any,Optional,Or,And,Default,Use
-import genie.parsergen as pg
+from genie.libs.parser.utils.table import TableReader
 #Python
 import re
 
@@ -51,6 +51,10 @@ class ShowSdwanBfdHistory(ShowSdwanBfdHistorySchema):
 
     cli_command= 'show sdwan bfd history'
 
+    table = TableReader(header_fields=["SYSTEM IP", "SITE ID", "COLOR", "STATE", "IP", "PORT", "ENCAP","TIME","PKTS","PKTS","DEL"],
+                        label_fields=["system_ip", "site_id", "color", "state", "dst_public_ip", "dst_public_port","encap","time","rx_pkts","tx_pkts","del"],
+                        index= [1,0,4,7])
+
     def cli(self,output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -65,15 +69,10 @@ class ShowSdwanBfdHistory(ShowSdwanBfdHistorySchema):
             out=out
 
 
-        #parsed output using parsergen
-        parsed_out = pg.oper_fill_tabular(device_output=out,  
-                                    header_fields=["SYSTEM IP", "SITE ID", "COLOR", "STATE", "IP", "PORT", "ENCAP","TIME","PKTS","PKTS","DEL"],
-                                    label_fields=["system_ip", "site_id", "color", "state", "dst_public_ip", "dst_public_port","encap","time","rx_pkts","tx_pkts","del"], 
-                                    index= [1,0,4,7]
-                                    )
-
         #creating a parsed dict using the output
-        parsed_dict = parsed_out.entries
+        parsed_dict = self.table.read(out)
+        if not parsed_dict:
+            return {}
 
         #Parsing the dict according to the schema
         out_dict={}
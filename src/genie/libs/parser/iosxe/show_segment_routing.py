@@ -749,6 +749,7 @@ class ShowSegmentRoutingTrafficEngPolicySchema(MetaParser):
             "name": str,
             "color": int,
             Optional("end_point"): str,
+            Optional("owners"): str,
             "status": {
                 "admin": str,
                 "operational": {
@@ -759,7 +760,8 @@ class ShowSegmentRoutingTrafficEngPolicySchema(MetaParser):
             },
             Optional("candidate_paths"): {
                 "preference": {
-                    Any(): {
+                    Any() : {
+                        Optional("type"): str,
                         Optional("constraints"): {
                             "affinity": {
                                 Any(): list
@@ -803,13 +805,18 @@ class ShowSegmentRoutingTrafficEngPolicySchema(MetaParser):
                 },
             },
             Optional("attributes"): {
-                "binding_sid": {
+                Optional("binding_sid"): {
                     Any(): {
                         "allocation_mode": str,
                         "state": str,
                     },
                 },
+                Optional("auto_route"): str,
+                Optional("auto_route_mode"): str,
+                Optional("auto_route_value"): int
             },
+            Optional("tunnel_id"): str,
+            Optional("interface_handle"): str,
             Optional("forwarding_id"): str,
             Optional("stats"): {
                 "packets": int,
@@ -820,7 +827,9 @@ class ShowSegmentRoutingTrafficEngPolicySchema(MetaParser):
                     "timestamp": str,
                     "client": str,
                     "event_type": str,
-                    "context": str,
+                    "context": {
+                        Any() : str
+                    },
                 },
             },
         },
@@ -849,18 +858,17 @@ class ShowSegmentRoutingTrafficEngPolicy(ShowSegmentRoutingTrafficEngPolicySchem
 
         # Name: test1 (Color: 100 End-point: 10.169.196.241)
         # Name: test_genie_1 (Color: 0 End-point: )
-        p1 = re.compile(r'^Name: +(?P<name>\S+) +\(Color: +(?P<color>\d+) '
-                         '+End-point: *(?P<end_point>\S+)?\)$')
+        p1 = re.compile(r'^Name: +(?P<name>\S+) +\(Color: +(?P<color>\d+)\s+End-point: *(?P<end_point>\S+)?\)$')
 
         # Status:
-        #     Admin: up, Operational: up for 09:38:18 (since 08-28 20:56:55.275)
-        p2 = re.compile(r'^Admin: +(?P<admin>\S+), +Operational: +(?P<oper>\S+) '
-                         '+for +(?P<time>\S+) +\(since +(?P<since>[\S\s]+)\)$')
+        # Admin: up, Operational: up for 09:38:18 (since 08-28 20:56:55.275)
+        p2 = re.compile(r'^Admin: +(?P<admin>\S+), +Operational: +(?P<oper>\S+)'
+                        ' +for +(?P<time>\S+) +\(since (?P<since>\S+\s+\S+)\)$')
 
         # Candidate-paths:
-        #     Preference 400:
-        p3 = re.compile(r'^Preference +(?P<preference>\d+)+\s*\w*:$')
-
+        # Preference 400:
+        # Preference 1 (CLI):
+        p3 = re.compile(r'^Preference +(?P<preference>\d+)[:\s]*(\((?P<type>\w+)\))?\s*\w*:')
         #     Dynamic (pce) (inactive)
         #     Dynamic (active)
         p4 = re.compile(r'^Dynamic( +(?P<pce>\(pce.*\)))? +\((?P<status>\w+)\)$')
@@ -870,9 +878,8 @@ class ShowSegmentRoutingTrafficEngPolicy(ShowSegmentRoutingTrafficEngPolicySchem
                          '+(?P<metric_type>[\S]+)$')
 
         #         Metric Type: IGP, Path Accumulated Metric: 2200
-        p6 = re.compile(r'^Metric +Type: +(?P<metric_type>[\S]+), Path +Accumulated '
-                         '+Metric: +(?P<path_accumulated_metric>[\d]+)$')
-
+        p6 = re.compile(r'^Metric +Type: +(?P<metric_type>[\S]+)(, Path +Accumulated '
+                '+Metric: +(?P<path_accumulated_metric>[\d]+))?$')
         #         16063 [Prefix-SID, 10.169.196.241]
         #         16072 [Prefix-SID, 10.189.5.253 - 10.189.6.253]
         #         16063
@@ -898,13 +905,14 @@ class ShowSegmentRoutingTrafficEngPolicy(ShowSegmentRoutingTrafficEngPolicySchem
 
         # Stats:
         #   Packets: 44         Bytes: 1748
-        p13 = re.compile(r'^Packets: +(?P<packets>[\d]+) +Bytes: +(?P<bytes>[\d]+)$')
+        p13 = re.compile(r'^Packets:\s+(?P<packets>\d+)\s+Bytes:\s+(?P<bytes>\d+)$')
 
         # Event history:
         #   Timestamp                   Client                  Event type              Context: Value
         #   08-29 14:51:29.074          FH Resolution           REOPT triggered         Status: REOPTIMIZED
-        p14 = re.compile(r'^(?P<timestamp>[\d\-]+ [\d:.]+) +(?P<client>(?:[\S]+ )+) '
-                          '+(?P<event_type>(?:[\S]+ )+) +(?P<context>(?: [\S]+)+: +(?:[\s\S]+))$')
+        p14 = re.compile(r'^(?P<timestamp>[\d\-]+ [\d:.]+)\s+(?P<client>(?:[\S]+ )+)'
+                          '\s+(?P<event_type>(?:[\S]+ )+)\s+(?P<context>\S+(\s*\S+))'
+                          ':\s+(?P<value>\S+(\s*\S+)*)\s*(CP:\s+(?P<cp>\d+))?$')
 
         # Affinity:
         p15 = re.compile(r'^Affinity:$')
@@ -918,12 +926,20 @@ class ShowSegmentRoutingTrafficEngPolicy(ShowSegmentRoutingTrafficEngPolicySchem
         # green
         p17 = re.compile(r'^(?P<affinity>\w+)$')
 
+        #Owners : CLI
+        p18 = re.compile(r'^Owners\s*:\s+(?P<owners>\S+)')
+
+        #  Tunnel ID: 65537 (Interface Handle: 0x81)
+        p19 = re.compile(r'^Tunnel ID:\s+(?P<tunnel_id>\d+)\s+\(Interface Handle:\s+(?P<interface_handle>\S+)\)$')
+
+        #Mode: constant, Value: 9
+        p20 = re.compile(r'^Mode:\s+(?P<auto_mode>\S+),\s+Value:\s+(?P<auto_value>\S+)$')
+
         # initial variables
-        aff_flag=False
+        auto_route, aff_flag = False, False
         ret_dict = {}
 
         for line in out.splitlines():
-            line = line.replace('\t', '    ')
             line = line.strip()
             if not line:
                 continue
@@ -968,6 +984,8 @@ class ShowSegmentRoutingTrafficEngPolicy(ShowSegmentRoutingTrafficEngPolicySchem
                 pref = int(group['preference'])
                 pref_dict = policy_dict.setdefault("candidate_paths", {}).\
                             setdefault('preference', {}).setdefault(pref, {})
+                if group['type']:
+                    pref_dict.update({'type': group['type']})
                 hop_index = 0
                 continue
 
@@ -999,8 +1017,9 @@ class ShowSegmentRoutingTrafficEngPolicy(ShowSegmentRoutingTrafficEngPolicySchem
                 group = m.groupdict()
                 path_dict.update({'metric_type': group['metric_type']})
 
-                metric = int(group['path_accumulated_metric'])
-                path_dict.update({'path_accumulated_metric': metric})
+                if group['path_accumulated_metric']:
+                   metric = int(group['path_accumulated_metric'])
+                   path_dict.update({'path_accumulated_metric': metric})
                 continue
 
             #   16063 [Prefix-SID, 10.169.196.241]
@@ -1087,8 +1106,21 @@ class ShowSegmentRoutingTrafficEngPolicy(ShowSegmentRoutingTrafficEngPolicySchem
                 aff_flag = False
                 event_index += 1
                 group = m.groupdict()
+                time = group["timestamp"]
+                client = group["client"].strip()
+                event_type = group["event_type"].strip()
+                context = group["context"]
+                value = group["value"]
+
                 event = policy_dict.setdefault('event_history', {}).setdefault(event_index, {})
-                event.update({k: v.strip() for k, v in group.items()})
+                event.setdefault("timestamp", time)
+                event.setdefault("client", client)
+                event.setdefault("event_type", event_type)
+                context_dict = {context:value}
+
+                if group["cp"]:
+                    context_dict["cp"] = group["cp"]
+                event.setdefault("context", context_dict)
                 continue
 
             # Affinity:
@@ -1116,6 +1148,48 @@ class ShowSegmentRoutingTrafficEngPolicy(ShowSegmentRoutingTrafficEngPolicySchem
                     if temp_list is not None:
                         temp_list.append(m.groupdict()['affinity'])
                         aff_dict.update({aff_type: temp_list})
+            
+            #Owners : CLI
+            m = p18.match(line)
+            if m:
+                group = m.groupdict()
+                owners = group['owners']
+                policy_dict.update({'owners': owners})
+                continue
+            
+            #   Tunnel ID: 65537 (Interface Handle: 0x81)
+            m = p19.match(line)
+            if m:
+                group = m.groupdict()
+                tunnel_id = group['tunnel_id']
+                interface_handle = group['interface_handle']
+                policy_dict.update({'tunnel_id': tunnel_id})
+                policy_dict.update({'interface_handle': interface_handle})
+                continue
+
+            # Autoroute:
+            #   Include all (Strict) 
+            if "Autoroute" in line:
+                auto_route = True
+                continue
+
+            lowercase_line = line.lower()
+            if auto_route:
+                if "include" in lowercase_line or "exclude" in lowercase_line:
+                    policy_dict.setdefault("attributes", {}).setdefault("auto_route", line.strip())
+                else:
+                    policy_dict.setdefault("attributes", {}).setdefault("auto_route", "")
+                auto_route = False
+            
+            m = p20.match(line)
+            if m:
+                
+                group = m.groupdict()
+                mode = group['auto_mode']
+                value = int(group['auto_value'])
+                policy_dict.setdefault("attributes", {}).setdefault("auto_route_mode", mode)
+                policy_dict.setdefault("attributes", {}).setdefault("auto_route_value", value)
+                continue
 
         return ret_dict
 
@@ -1445,3 +1519,180 @@ class ShowSegmentRoutingMplsLbAssignedSids(ShowSegmentRoutingMplsLbAssignedSidsS
                     sid_dict.update({"interface": groups["interface"]})
 
         return ret_dict
+
+
+# ====================================================
+# Schema for:
+#   * 'show segment-routing traffic-eng first-hop-resolution'
+#   * 'show segment-routing traffic-eng first-hop-resolution label <label>'
+# ====================================================
+
+class ShowSegmentRoutingTrafficEngFirstHopResolutionSchema(MetaParser):
+    '''Schema for:
+        * 'show segment-routing traffic-eng first-hop-resolution'
+        * 'show segment-routing traffic-eng first-hop-resolution label <label>'
+    '''
+
+    schema = {
+        Any(): {
+            'status': str,
+            Optional('route_entry'): {
+                'primary': {
+                    'ip': str,
+                    'using': str,
+                    'labels': str,
+                },
+                Optional('repair'): {
+                    'ip': str,
+                    'using': str,
+                    'labels': str,
+                },
+                Optional('weight'): int,
+            },
+            Optional('old_route_entry'): {
+                'primary': {
+                    'ip': str,
+                    'using': str,
+                    'labels': str,
+                },
+                Optional('repair'): {
+                    'ip': str,
+                    'using': str,
+                    'labels': str,
+                },
+                Optional('weight'): int,
+            }
+        }
+    }
+
+# ====================================================
+# Parser for:
+#   * 'show segment-routing traffic-eng first-hop-resolution'
+#   * 'show segment-routing traffic-eng first-hop-resolution label <label>'
+# ====================================================
+
+class ShowSegmentRoutingTrafficEngFirstHopResolution(ShowSegmentRoutingTrafficEngFirstHopResolutionSchema):
+    '''Parser for:
+        * 'show segment-routing traffic-eng first-hop-resolution'
+        * 'show segment-routing traffic-eng first-hop-resolution label <label>'
+    '''
+
+    cli_command = [
+        'show segment-routing traffic-eng first-hop-resolution',
+        'show segment-routing traffic-eng first-hop-resolution label {label}'
+    ]
+
+    def cli(self, label=None, output=None):
+        if label:
+            cmd = self.cli_command[1].format(label=label)
+        else:
+            cmd = self.cli_command[0]
+
+        if not output:
+            output = self.device.execute(cmd)
+
+        ret_dict = {}
+
+        # Entry: 16230, Resolved via igp
+        p1 = re.compile(r'^Entry: (?P<entry>\d+), (?P<status>.+)$')
+        
+        # Route Entry:
+        p2 = re.compile(r'^Route entry:$', re.IGNORECASE)
+
+        # Old Route Entry:
+        p3 = re.compile(r'^Old Route entry:$', re.IGNORECASE)
+
+        # Primary 110.1.1.4 via Eth0/1
+        p4 = re.compile(r'^Primary: (?P<ip>([\d.]+|[a-fA-F\d\:]+)) via (?P<using>.+)$')
+
+        # Repair: 1.2.3.4 via MP2
+        p5 = re.compile(r'^Repair: (?P<ip>([\d.]+|[a-fA-F\d\:]+)) via (?P<using>.+)$')
+        
+        # Labels: 16230
+        # Labels: pop (implicit-null)
+        p6 = re.compile(r'^Labels: (?P<labels>.+)$')
+        
+        # Weight: 1
+        p7 = re.compile(r'^Weight: (?P<weight>\d+)$')
+
+        current_entry = ''
+        current_entry_pos = ''
+        primary_labels = False
+        repair_labels = False
+
+        for line in output.splitlines():
+            line = line.strip()
+            
+            # Entry: 16230, Resolved via igp
+            m = p1.match(line)
+            if m:
+                group_dict = m.groupdict()
+                current_entry = int(group_dict['entry']) \
+                    if group_dict['entry'].isdigit() else group_dict['entry']
+                index_dict = ret_dict.setdefault(current_entry, {})
+                index_dict['status'] = group_dict['status']
+                continue
+
+            if current_entry == '':
+                continue
+
+            # Route Entry:
+            m = p2.match(line)
+            if m:
+                current_entry_pos = 'route_entry'
+                index_dict.setdefault(current_entry_pos, {})
+                continue
+
+            # Old Route Entry:
+            m = p3.match(line)
+            if m:
+                current_entry_pos = 'old_route_entry'
+                index_dict.setdefault(current_entry_pos, {})
+                continue
+
+            if current_entry_pos == '':
+                continue
+
+            entry_dict = index_dict[current_entry_pos]
+
+            # Primary 110.1.1.4 via Eth0/1
+            m = p4.match(line)
+            if m:
+                group_dict = m.groupdict()
+                primary_dict = entry_dict.setdefault('primary', {})
+                primary_dict['ip'] = group_dict['ip']
+                primary_dict['using'] = group_dict['using']
+                primary_labels = True
+                continue
+
+            # Repair: 1.2.3.4 via MP2
+            m = p5.match(line)
+            if m:
+                group_dict = m.groupdict()
+                repair_dict = entry_dict.setdefault('repair', {})
+                repair_dict['ip'] = group_dict['ip']
+                repair_dict['using'] = group_dict['using']
+                repair_labels = True
+                continue
+
+            # Labels: 16230
+            # Labels: pop (implicit-null)
+            m = p6.match(line)
+            if m:
+                group_dict = m.groupdict()
+                if primary_labels:
+                    primary_dict['labels'] = group_dict['labels']
+                    primary_labels = False
+                elif repair_labels:
+                    repair_dict['labels'] = group_dict['labels']
+                    repair_labels = False
+                continue
+
+            # Weight: 1
+            m = p7.match(line)
+            if m:
+                group_dict = m.groupdict()
+                entry_dict['weight'] = int(group_dict['weight'])
+                continue
+
+        return ret_dict
@@ -5,8 +5,8 @@ show_static_route.py
 import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
-                                         Any, \
-                                         Optional
+    Any, \
+    Optional
 
 
 # ====================================================
@@ -28,6 +28,7 @@ class ShowIpStaticRouteSchema(MetaParser):
                                             Optional('outgoing_interface'): str,
                                             Optional('active'): bool,
                                             Optional('preference'): int,
+                                            Optional('owner_code'): str,
                                         },
                                     },
                                     Optional('next_hop_list'): {
@@ -37,6 +38,7 @@ class ShowIpStaticRouteSchema(MetaParser):
                                             Optional('next_hop'): str,
                                             Optional('outgoing_interface'): str,
                                             Optional('preference'): int,
+                                            Optional('owner_code'): str,
                                         },
                                     },
                                 },
@@ -57,11 +59,11 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
        show ip static route
        show ip static route vrf <vrf>
     """
-    cli_command = ['show ip static route vrf {vrf}','show ip static route']
+    cli_command = ['show ip static route vrf {vrf}', 'show ip static route']
     exclude = ['unnumbered', 'interface_ref',
                '(Tunnel.*)', 'joined_group_addresses', 'ipv6']
 
-    def cli(self, vrf="",output=None):
+    def cli(self, vrf="", output=None):
         if output is None:
             if vrf:
                 cmd = self.cli_command[0].format(vrf=vrf)
@@ -77,11 +79,12 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
         result_dict = {}
         for line in out.splitlines():
             if line:
-                line = line.rstrip()
+                line = line.strip()
             else:
                 continue
             # Static local RIB for default
-            p1 = re.compile(r'^\s*Static +local +RIB +for +(?P<vrf>[\w]+)$')
+            # Static local RIB for default-thing
+            p1 = re.compile(r'^Static +local +RIB +for +(?P<vrf>[\w-]+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -155,6 +158,9 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
                         result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
                             ['next_hop']['outgoing_interface'][interface]['preference'] = int(if_preference)
 
+                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
+                            ['next_hop']['outgoing_interface'][interface]['owner_code'] = code
+
                     else:
                         if 'next_hop_list' not in result_dict['vrf'][vrf]['address_family'][af]['routes'][route][
                             'next_hop']:
@@ -180,6 +186,10 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
                                 ['next_hop_list'][index]['outgoing_interface'] = interface
                         result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'] \
                             ['next_hop_list'][index]['preference'] = if_preference_int
+
+                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'] \
+                            ['next_hop_list'][index]['owner_code'] = code
+
                 continue
 
         return result_dict
@@ -266,7 +276,8 @@ class ShowIpv6StaticDetail(ShowIpv6StaticDetailSchema):
                 continue
 
             # IPv6 Static routes Table - default
-            p1 = re.compile(r'^\s*IPv6 +Static +routes +Table -+ (?P<vrf>[\w]+)$')
+            # IPv6 Static routes Table - default-table
+            p1 = re.compile(r'^IPv6 +Static +routes +Table +- +(?P<vrf>[\w-]+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
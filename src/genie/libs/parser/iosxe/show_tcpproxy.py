@@ -94,6 +94,7 @@ class ShowTcpProxyStatisticsSchema(MetaParser):
             'flow_entries_created': int,
             'flow_entries_deleted': int,
             'current_flow_entries': int,
+            Optional('current_valid_flow_entries'): int,
             'current_connections': int,
             'connections_in_progress': int,
             'failed_connections': int,
@@ -114,6 +115,8 @@ class ShowTcpProxyStatisticsSchema(MetaParser):
             'timer_expire_cleanup_enqueue_failed': int,
             'proxy_cleanup_enqueued': int,
             'proxy_cleanup_enqueue_failed': int,
+            Optional('proxy_cleanup_sent_to_ev_flow_q'): int,
+            Optional('proxy_cleanup_enq_done_by_ev_flow_q'): int,
             'cleanup_req_watcher_called': int,
             'pre_tcp_flow_list_enq_failed': int,
             'pre_tcp_flow_list_deq_failed_timer': int,
@@ -131,12 +134,13 @@ class ShowTcpProxyStatisticsSchema(MetaParser):
             Optional('syncache_flow_mismatch'): int,
             Optional('failed_conn_already_accepted_conn'): int,
             'ssl_init_failure': int,
-            'max_queue_length_work': int,
-            'current_queue_length_work': int,
-            'max_queue_length_ism': int,
-            'current_queue_length_ism': int,
-            'max_queue_length_sc': int,
-            'current_queue_length_sc': int,
+            Optional('max_queue_length_work'): int,
+            Optional('current_queue_length_work'): int,
+            Optional('max_queue_length_ism'): int,
+            Optional('current_queue_length_ism'): int,
+            Optional('current_queue_length_work'): int,
+            Optional('max_queue_length_sc'): int,
+            Optional('current_queue_length_sc'): int,
             'total_tx_enq_ign_due_to_conn_close': int,
             'current_rx_epoll': int,
             'current_tx_epoll': int,
@@ -148,8 +152,17 @@ class ShowTcpProxyStatisticsSchema(MetaParser):
             'ssl_resume_done': int,
             'snort_pause_done': int,
             'snort_resume_done': int,
+            Optional('dre_pause_done'): int,
+            Optional('dre_resume_done'): int,
+            Optional('dre_resume_msg_to_be_sent'): int,
+            Optional('dre_resume_msg_sent'): int,
+            Optional('dre_smb_bypass_success_received'): int,
+            Optional('dre_http_bypass_success_received'): int,
+            Optional('dre_bypass_received_from_peer'): int,
+            Optional('dre_bypass_hints_sent'): int,
             'ev_ssl_pause_process': int,
             'ev_snort_pause_process': int,
+            Optional('ev_dre_pause_process'): int,
             'ev_ssl_snort_resume_process': int,
             'socket_pause_done': int,
             'socket_resume_done': int,
@@ -163,6 +176,7 @@ class ShowTcpProxyStatisticsSchema(MetaParser):
             'failed_send': int,
             'tcp_ssl_reset_initiated': int,
             'tcp_snort_reset_initiated': int,
+            Optional('tcp_dre_close_initiated'): int,
             'tcp_fin_received_from_clnt_svr': int,
             'tcp_reset_received_from_clnt_svr': int,
             'ssl_fin_received_sc': int,
@@ -177,7 +191,10 @@ class ShowTcpProxyStatisticsSchema(MetaParser):
             'svc_reset_processed': int,
             'flow_cleaned_with_client_data': int,
             'flow_cleaned_with_server_data': int,
-            'buffers_dropped_in_tx_socket_close': int,
+            Optional('buffers_dropped_in_tx_sock_closed'): int,
+            Optional('buffers_dropped_in_tx_not_writable'): int,
+            Optional('buffers_dropped_in_tx_socket_close'): int,
+            Optional('buffers_dropped_in_tx_socket_closed'): int,
             'tcp_4k_allocated_buffers': int,
             'tcp_16k_allocated_buffers': int,
             'tcp_32k_allocated_buffers': int,
@@ -205,6 +222,7 @@ class ShowTcpProxyStatisticsSchema(MetaParser):
             'flows_dropped_snort_inst_health_yellow': int,
             'flows_dropped_wcapi_channel_health_yellow': int,
             'total_wcapi_snd_flow_create_svc_chain_failed': int,
+            Optional('total_wcapi_snd_flow_delete_svc_chain_failed'): int,
             'total_wcapi_send_data_svc_chain_failed': int,
             'total_wcapi_send_close_svc_chain_failed': int,
             'total_tx_enqueue_failed': int,
@@ -213,6 +231,7 @@ class ShowTcpProxyStatisticsSchema(MetaParser):
             'total_cleanup_flow_msg_rcvd_in_wk_q': int,
             'total_cleanup_flow_ignored_already_done': int,
             'total_cleanup_ssl_msg_add_to_wk_q_failed': int,
+            Optional('total_ssl_trigger_reset_msg_to_wk_q_failed'): int,
             'total_uhi_mmap': int,
             'total_uhi_munmap': int,
             Optional('total_uhi_page_alloc'): int,
@@ -236,11 +255,16 @@ class ShowTcpProxyStatisticsSchema(MetaParser):
             'flow_stats_delete_failure_count': int,
             Optional('aoim_sync_started'): int,
             Optional('aoim_sync_completed'): int,
-            Optional('aoim_sync_errored'): int
+            Optional('aoim_sync_errored'): int,
+            Optional('current_queue_length_sc_0'): int,
+            Optional('current_queue_length_ism_0'): int,
+            Optional('max_queue_length_work_0'): int,
+            Optional('max_queue_length_sc_0'): int,
+            Optional('max_queue_length_ism_0'): int,
+            Optional('current_queue_length_work_0'): int
             }
         }
 
-
 class ShowTcpProxyStatistics(ShowTcpProxyStatisticsSchema):
 
     """ Parser for "show tcpproxy statistics" """
@@ -4,13 +4,30 @@ IOSXE parsers for the following commands
     * 'show telemetry ietf subscription all'
     * 'show telemetry ietf subscription all brief'
     * 'show telemetry ietf subscription all detail'
+    * 'show telemetry ietf subscription all receivers'
     * 'show telemetry ietf subscription {sub_id}'
     * 'show telemetry ietf subscription {sub_id} brief'
     * 'show telemetry ietf subscription {sub_id} detail'
     * 'show telemetry ietf subscription dynamic'
+    * 'show telemetry ietf subscription dynamic brief'
     * 'show telemetry ietf subscription dynamic detail'
+    * 'show telemetry ietf subscription configured'
+    * 'show telemetry ietf subscription configured brief'
+    * 'show telemetry ietf subscription configured detail'
+    * 'show telemetry ietf subscription permanent'
+    * 'show telemetry ietf subscription permanent brief'
+    * 'show telemetry ietf subscription permanent detail'
     * 'show telemetry ietf subscription {sub_id} receiver'
     * 'show telemetry ietf subscription receiver'
+    * 'show telemetry connection {con_idx} detail'
+    * 'show telemetry connection all'
+    * 'show telemetry connection {con_idx} brief'
+    * 'show telemetry internal sensor subscription {sub_id}'
+    * 'show telemetry internal sensor stream {stream_type}'
+    * 'show telemetry internal subscription all stats'
+    * 'show telemetry internal protocol {protocol} manager {peer_ip} {port} source-vrf {vrf_id} {source_ip}'
+    * 'show telemetry receiver name {name}'
+    * 'show telemetry receiver all'
 
 '''
 
@@ -20,15 +37,28 @@ import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Optional, Any, Use, Schema
+from genie import parsergen
 
 # pyATS
 from pyats.utils.exceptions import SchemaTypeError
 
-
 class ShowTelemetryIETFSubscriptionSchema(MetaParser):
     '''schema for:
+        * show telemetry ietf subscription all
+        * show telemetry ietf subscription all brief
+        * show telemetry ietf subscription all detail
         * show telemetry ietf subscription {sub_id}
+        * show telemetry ietf subscription {sub_id} brief
         * show telemetry ietf subscription {sub_id} detail
+        * show telemetry ietf subscription dynamic
+        * show telemetry ietf subscription dynamic brief
+        * show telemetry ietf subscription dynamic detail
+        * show telemetry ietf subscription configured
+        * show telemetry ietf subscription configured brief
+        * show telemetry ietf subscription configured detail
+        * show telemetry ietf subscription permanent
+        * show telemetry ietf subscription permanent brief
+        * show telemetry ietf subscription permanent detail
     '''
 
     schema = {
@@ -37,10 +67,11 @@ class ShowTelemetryIETFSubscriptionSchema(MetaParser):
             Optional('type'): str,
             'state': str,
             Optional('stream'): str,
-            'filter': {
-                'filter_type': str,
+            Optional('filter'): {
+                Optional('filter_type'): str,
                 Optional('xpath'): str,
             },
+            Optional('state_description'): str,
             Optional('update_policy'): {
                 'update_trigger': str,
                 Optional('period'): int,
@@ -66,40 +97,121 @@ class ShowTelemetryIETFSubscriptionSchema(MetaParser):
 class ShowTelemetryIETFSubscription(ShowTelemetryIETFSubscriptionSchema):
     '''parser for:
         * show telemetry ietf subscription {sub_id}
+        * show telemetry connection {con_idx} subscription
+        * show telemetry ietf subscription {sub_id} brief
     '''
 
-    cli_command = 'show telemetry ietf subscription {sub_id}'
+    cli_command = [
+            'show telemetry ietf subscription {sub_id}',
+            'show telemetry connection {con_idx} subscription',
+            'show telemetry ietf subscription {sub_id} brief',
+            ]
 
-    def cli(self, sub_id, output=None):
+    def cli(self, sub_id=None, con_idx=None, output=None):
         if output is None:
-            out = self.device.execute(self.cli_command.format(
-                sub_id=sub_id
-            ))
-        else:
-            out = output
+            if sub_id:
+                output = self.device.execute(self.cli_command[0].format(
+                    sub_id=sub_id
+                ))
+            elif con_idx:
+                output = self.device.execute(self.cli_command[1].format(
+                    con_idx=con_idx
+                ))
         
         # 2147483659       Dynamic     Valid       xpath
-        p1 = re.compile(r'^(?P<id>\d+) +(?P<type>\S+) +(?P<state>\S+) +(?P<filter_type>\S+)$')
+        p = re.compile(r'^(?P<id>\d+) +(?P<type>\S+) +(?P<state>\S+) +(?P<filter_type>\S+)$')
+
+        #New format was added as 17.7
+        #ID         Type       State      State Description
+        pNew = re.compile(r'^(?P<id>\d+) +(?P<type>\S+) +(?P<state>\S+) *(?P<state_description>.*)$')
+        isLatestFormat = False
 
+        if con_idx:
+            p = pNew
+            isLatestFormat = True
+        else:
+            #Determine what format the data is displayed in from the header
+            words = output.strip().split()
+            if words:
+                headerInOutput = (words[0] == "ID")
+
+                if headerInOutput:
+                    isLatestFormat = (words[4] == "Description")
+
+                    if isLatestFormat:
+                        p = pNew
         ret_dict = dict()
 
-        for line in out.splitlines():
+        for line in output.splitlines():
             line = line.strip()
 
-            # 2147483659       Dynamic     Valid       xpath
-            m = p1.match(line)
+            m = p.match(line)
             if m:
                 group = m.groupdict()
                 sub = ret_dict.setdefault('id', {})
                 subscription = sub.setdefault(int(group['id']), {})
-                subscription.update({
-                    'type': group['type'],
-                    'state': group['state'],
-                    'filter': {'filter_type': group['filter_type']},
-                })
-
+                subscription['type'] = group['type']
+                subscription['state'] = group['state']
+                if isLatestFormat:
+                    subscription['state_description'] = group['state_description']
+                else:
+                    subscription['filter'] = {'filter_type': group['filter_type']}
         return ret_dict
 
+
+class ShowTelemetryIETFSubscriptionAll(ShowTelemetryIETFSubscription):
+    '''parser for:
+        * show telemetry ietf subscription all
+        * show telemetry ietf subscription all brief
+    '''
+
+    cli_command = [
+        'show telemetry ietf subscription all',
+        'show telemetry ietf subscription all brief',
+    ]
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command[0])
+        return super().cli(output=output)
+
+
+class ShowTelemetryIETFSubscriptionConfigured(ShowTelemetryIETFSubscriptionAll):
+    '''parser for:
+        * show telemetry ietf subscription configured
+        * show telemetry ietf subscription configured brief
+    '''
+
+    cli_command = [
+        'show telemetry ietf subscription configured',
+        'show telemetry ietf subscription configured brief',
+    ]
+
+
+class ShowTelemetryIETFSubscriptionDynamic(ShowTelemetryIETFSubscriptionAll):
+    '''parser for:
+        * show telemetry ietf subscription dynamic
+        * show telemetry ietf subscription dynamic brief
+    '''
+
+    cli_command = [
+        'show telemetry ietf subscription dynamic',
+        'show telemetry ietf subscription dynamic brief',
+    ]
+
+
+class ShowTelemetryIETFSubscriptionPermanent(ShowTelemetryIETFSubscriptionAll):
+    '''parser for:
+        * show telemetry ietf subscription permanent
+        * show telemetry ietf subscription permanent brief
+    '''
+
+    cli_command = [
+        'show telemetry ietf subscription permanent',
+        'show telemetry ietf subscription permanent brief',
+    ]
+
+
 class ShowTelemetryIETFSubscriptionDetail(ShowTelemetryIETFSubscriptionSchema):
     '''parser for:
         * show telemetry ietf subscription {sub_id} detail
@@ -109,11 +221,9 @@ class ShowTelemetryIETFSubscriptionDetail(ShowTelemetryIETFSubscriptionSchema):
 
     def cli(self, sub_id, output=None):
         if output is None:
-            out = self.device.execute(self.cli_command.format(
+            output = self.device.execute(self.cli_command.format(
                     sub_id=sub_id
             ))
-        else:
-            out = output
         
         # Subscription ID: 2147483659
         p1 = re.compile(r'^Subscription +ID: +(?P<id>\d+)$')
@@ -160,7 +270,7 @@ class ShowTelemetryIETFSubscriptionDetail(ShowTelemetryIETFSubscriptionSchema):
 
         ret_dict = dict()
 
-        for line in out.splitlines():
+        for line in output.splitlines():
             line = line.strip()
 
             # Subscription ID: 2147483659
@@ -280,6 +390,102 @@ class ShowTelemetryIETFSubscriptionDetail(ShowTelemetryIETFSubscriptionSchema):
         return ret_dict
 
 
+class ShowTelemetryIETFSubscriptionAllDetail(ShowTelemetryIETFSubscriptionDetail):
+    '''parser for:
+        * show telemetry ietf subscription all detail
+    '''
+
+    cli_command = 'show telemetry ietf subscription all detail'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+        return super().cli(sub_id=None, output=output)
+
+class ShowTelemetryIETFSubscriptionConfiguredDetail(ShowTelemetryIETFSubscriptionAllDetail):
+    '''parser for:
+        * show telemetry ietf subscription configured detail
+    '''
+
+    cli_command = 'show telemetry ietf subscription configured detail'
+
+
+class ShowTelemetryIETFSubscriptionDynamicDetail(ShowTelemetryIETFSubscriptionAllDetail):
+    '''parser for:
+        * show telemetry ietf subscription dynamic detail
+    '''
+
+    cli_command = 'show telemetry ietf subscription dynamic detail'
+
+
+class ShowTelemetryIETFSubscriptionPermanentDetail(ShowTelemetryIETFSubscriptionAllDetail):
+    '''parser for:
+        * show telemetry ietf subscription permanent detail
+    '''
+
+    cli_command = 'show telemetry ietf subscription permanent detail'
+
+
+class ShowTelemetryIETFSubscriptionAllReceiverSchema(MetaParser):
+    '''schema for:
+        * show telemetry ietf subscription all receivers
+    '''
+    schema = {
+        int:{
+            str: {
+                'connection': int,
+                'state': str,
+                'explanation': str
+            }
+        }
+    }
+
+
+class ShowTelemetryIETFSubscriptionAllReceivers(ShowTelemetryIETFSubscriptionAllReceiverSchema):
+    '''parser for:
+        * show telemetry ietf subscription all receivers
+    '''
+
+    cli_command = 'show telemetry ietf subscription all receivers'
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        ret_dict = dict()
+        # 101              grpc-tcp                           0      Resolving      Resolution request in progress
+        p1 = re.compile(r'^(?P<id>\d+) +'
+                        r'(?P<name>\S+) +'
+                        r'(?P<connection>\S+) +'
+                        r'(?P<state>.\S+) *'
+                        r'(?P<explanation>.*)$')
+
+
+        for line in out.splitlines():
+            # 101              grpc-tcp                           0      Resolving      Resolution request in progress
+            m = p1.match(line)
+            # If whole line matches p1 regex
+            if m:
+                group = m.groupdict()
+
+                id = group.pop('id')
+                name = group.pop('name')
+
+                id_dict = ret_dict.setdefault(int(id), {})
+                name_dict = id_dict.setdefault(name, {})
+
+                name_dict.update({
+                    'connection': int(group['connection']),
+                    'state': group['state'],
+                    'explanation': group['explanation']
+                })
+
+                continue
+        return ret_dict
+
+
 class ShowTelemetryIETFSubscriptionReceiverSchema(MetaParser):
     '''schema for:
         * show telemetry ietf subscription dynamic
@@ -288,17 +494,19 @@ class ShowTelemetryIETFSubscriptionReceiverSchema(MetaParser):
     schema = {
         'id':{
             int: {
-                'address': str,
-                'port': int,
-                'protocol': str,
+                Optional('address'): str,
+                Optional('port'): int,
+                Optional('protocol'): str,
                 Optional('profile'): str,
                 'connection': int,
-                'state': str,
+                Optional('state'): str,
                 Optional('explanation'): str,
+                Optional('name'): str,
             }
         }
     }
 
+
 class ShowTelemetryIETFSubscriptionReceiver(ShowTelemetryIETFSubscriptionReceiverSchema):
     '''parser for:
         * show telemetry ietf subscription receiver
@@ -313,13 +521,10 @@ class ShowTelemetryIETFSubscriptionReceiver(ShowTelemetryIETFSubscriptionReceive
     def cli(self, sub_id=None, output=None):
         if output is None:
             if sub_id:
-                out = self.device.execute(self.cli_command[1].format(
-                    sub_id=sub_id
-                ))
+                cmd = self.cli_command[1].format(sub_id=sub_id)
             else:
-                out = self.device.execute(self.cli_command[0])
-        else:
-            out = output
+                cmd = self.cli_command[0]
+            output = self.device.execute(cmd)
         
         # Subscription ID: 2147483659
         p1 = re.compile(r'^Subscription +ID: +(?P<id>\d+)$')
@@ -340,15 +545,19 @@ class ShowTelemetryIETFSubscriptionReceiver(ShowTelemetryIETFSubscriptionReceive
         p6 = re.compile(r'^Connection: +(?P<connection>\S+)$')
 
         # State: Valid
-        p7 = re.compile(r'^State: +(?P<state>\S+)$')
+        # State: Transport Requested
+        # State: Valid
+        p7 = re.compile(r'^State: +(?P<state>.*)$')
 
         # Explanation:
-        p8 = re.compile(r'^Explanation: +(?P<explanation>\S+)$')
+        p8 = re.compile(r'^Explanation: *(?P<explanation>.*)$')
 
+        # Name: grpc-tcp
+        p9 = re.compile(r'^Name: +(?P<name>\S+)$')
 
         ret_dict = dict()
 
-        for line in out.splitlines():
+        for line in output.splitlines():
             line = line.strip()
 
             # Subscription ID: 2147483659
@@ -408,6 +617,13 @@ class ShowTelemetryIETFSubscriptionReceiver(ShowTelemetryIETFSubscriptionReceive
                 subscription['explanation'] = group['explanation']
                 continue
 
+            # Name
+            m = p9.match(line)
+            if m:
+                group = m.groupdict()
+                subscription['name'] = group['name']
+                continue
+
         return ret_dict
 
 
@@ -449,10 +665,7 @@ class ShowTelemetryInternalConnection(ShowTelemetryInternalConnectionSchema):
 
     def cli(self, output=None):
         if output is None:
-            out = self.device.execute(self.cli_command)
-
-        else:
-            out = output
+            output = self.device.execute(self.cli_command)
 
         # Telemetry connection
 
@@ -472,7 +685,7 @@ class ShowTelemetryInternalConnection(ShowTelemetryInternalConnectionSchema):
 
         tele_info_obj = {}
 
-        for line in out.splitlines():
+        for line in output.splitlines():
             line = line.strip()
 
             match = no_index_capture.match(line)
@@ -512,4 +725,919 @@ class ShowTelemetryInternalConnection(ShowTelemetryInternalConnectionSchema):
 
                 continue
 
-        return tele_info_obj
\ No newline at end of file
+        return tele_info_obj
+
+
+class ShowTelemetryConnectionSchema(MetaParser):
+    """Schema for:
+        show telemetry connection all
+        show telemetry connection {con_idx} detail
+    """
+
+    schema = {
+        "index": {
+            int: {
+                "peer_address": str,
+                "port": int,
+                "vrf": int,
+                "source_address": str,
+                Optional("type"): str,
+                "state": str,
+                Optional("state_description"): str,
+                Optional("peer_id"): str,
+                Optional("receiver_name"): str,
+                Optional("transport"): str,
+                Optional("use_count"): int,
+                Optional("state_change_time"): str,
+            },
+        }
+    }
+
+
+class ShowTelemetryConnectionAll(ShowTelemetryConnectionSchema):
+    """Parser for:
+        show telemetry connection all
+        show telemetry connection {con_idx} brief
+    """
+
+    cli_command = [
+        "show telemetry connection all",
+        "show telemetry connection {con_idx} brief",
+        ]
+
+    def cli(self, con_idx=None, output=None):
+        if output is None:
+            if con_idx:
+                cmd = self.cli_command[1].format(con_idx=con_idx)
+            else:
+                cmd = self.cli_command[0]
+            output = self.device.execute(cmd)
+
+        ret_dict = dict()
+
+        if output:
+            #Index Peer Address               Port  VRF Source Address             State      State Description
+            #----- -------------------------- ----- --- -------------------------- ---------- --------------------
+            #    0 5.40.26.169                49066 0   0.0.0.0                    Active     Connection created for protocol netconf
+            # or
+            #Index Peer Address               Port  VRF Source Address             State      State Description
+            #----- -------------------------- ----- --- -------------------------- ---------- --------------------
+            #    0 5.40.26.169                49066 0 M 0.0.0.0                    Active     Connection created for protocol netconf
+            header = ["Index", "Peer Address", "Port", "VRF", "Source Address", "State", "State Description"]
+            label_fields = ["index", "peer_address", "port", "vrf", "source_address", "state", "state_description"]
+
+            tmp_dict = parsergen.oper_fill_tabular(device_output=output, device_os='iosxe', header_fields=header,
+                    label_fields=label_fields, index=[0]).entries
+
+            for k in tmp_dict:
+                del tmp_dict[k]["index"]
+                ret_dict[int(k)] = tmp_dict[k]
+
+                ret_dict[int(k)]["port"] = int(ret_dict[int(k)]["port"])
+                ret_dict[int(k)]["vrf"] = int(re.sub('M', '', ret_dict[int(k)]["vrf"]))
+
+            ret_dict = {"index": ret_dict}
+
+        return ret_dict
+
+
+class ShowTelemetryConnectionDetail(ShowTelemetryConnectionSchema):
+    """Parser for:
+        show telemetry connection {con_idx} detail
+    """
+
+    cli_command = "show telemetry connection {con_idx} detail"
+
+    def cli(self, con_idx=None, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command.format(con_idx=con_idx))
+
+        ret_dict = {}
+
+        #Index             : 0
+        p1 = re.compile(r'^Index *: *(?P<idx>\d*)$')
+
+        #Peer Address      : 5.40.26.169
+        p2 = re.compile(r'^Peer +Address *: *(?P<peer_addr>\S*)$')
+
+        #Port              : 49066
+        p3 = re.compile(r'^Port *: *(?P<port>\d*)$')
+
+        #VRF               : 0
+        p4 = re.compile(r'^VRF *: *(?P<vrf>\d*)$')
+
+        #Source Address    : 0.0.0.0
+        p5 = re.compile(r'^Source +Address *: *(?P<source_addr>\S*)$')
+
+        #Type              : PROTOCOL
+        p6 = re.compile(r'^Type *: *(?P<type>\S*)$')
+
+        #State             : Active
+        p7 = re.compile(r'^State *: *(?P<state>\S*)$')
+
+        #State Description : Connection created for protocol netconf
+        p8 = re.compile(r'^State +Description *: *(?P<state_description>.*)$')
+
+        #Peer ID           : admin
+        p9 = re.compile(r'^Peer +ID *: *(?P<peer_id>\S*)$')
+
+        #Receiver Name     :
+        p10 = re.compile(r'^Receiver +Name *: *(?P<receiver_name>\S*)$')
+
+        #Transport         : netconf
+        p11 = re.compile(r'^Transport *: *(?P<transport>\S*)$')
+
+        #Use Count         : 1
+        p12 = re.compile(r'^Use +Count *: *(?P<use_count>\d*)$')
+
+        #State Change Time : 10/26/21 17:27:31
+        p13 = re.compile(r'^State +Change +Time *: +(?P<state_change_time>.*)$')
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            # Subscription ID: 2147483659
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                indexDict = ret_dict.setdefault('index', {}).\
+                        setdefault(int(group['idx']), {})
+                continue
+
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                indexDict["peer_address"] = group['peer_addr']
+                continue
+
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                indexDict["port"] = int(group["port"])
+                continue
+
+            m = p4.match(line)
+            if m:
+                group = m.groupdict()
+                indexDict["vrf"] = int(group["vrf"])
+                continue
+
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                indexDict["source_address"] = group["source_addr"]
+                continue
+
+            m = p6.match(line)
+            if m:
+                group = m.groupdict()
+                indexDict["type"] = group["type"]
+                continue
+
+            m = p7.match(line)
+            if m:
+                group = m.groupdict()
+                indexDict["state"] = group["state"]
+                continue
+
+            m = p8.match(line)
+            if m:
+                group = m.groupdict()
+                indexDict["state_description"] = group["state_description"]
+                continue
+
+            m = p9.match(line)
+            if m:
+                group = m.groupdict()
+                indexDict["peer_id"] = group["peer_id"]
+                continue
+
+            m = p10.match(line)
+            if m:
+                group = m.groupdict()
+                indexDict["receiver_name"] = group["receiver_name"]
+                continue
+
+            m = p11.match(line)
+            if m:
+                group = m.groupdict()
+                indexDict["transport"] = group["transport"]
+                continue
+
+            m = p12.match(line)
+            if m:
+                group = m.groupdict()
+                indexDict["use_count"] = int(group["use_count"])
+                continue
+
+            m = p13.match(line)
+            if m:
+                group = m.groupdict()
+                indexDict["state_change_time"] = group["state_change_time"]
+                continue
+
+        return ret_dict
+
+
+class ShowTelemetryInternalSubscriptionAllStatsSchema(MetaParser):
+    '''schema for:
+        * show telemetry internal subscription all stats
+    '''
+
+    schema = {
+        'sub_id':{
+            int: {
+                'msg_sent': int,
+                'msg_drop': int,
+                'record_sent': int,
+                'connection_info': str,
+            }
+        }
+    }
+
+class ShowTelemetryInternalSubscriptionAllStats(ShowTelemetryInternalSubscriptionAllStatsSchema):
+    '''parser for:
+        * show telemetry internal subscription all stats
+    '''
+
+    cli_command = 'show telemetry internal subscription all stats'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        #Subscription ID  Msgs Sent  Msgs Drop  Records Sent Connection Info
+        #---------------- ---------- ---------- ------------ -----------------------------------------
+        #2147483648       246        0          126690       admin
+        header = ["Subscription ID", "Msgs Sent", "Msgs Drop", "Records Sent", "Connection Info"]
+        label_fields = ['sub_id', 'msg_sent', 'msg_drop', 'record_sent', 'connection_info']
+
+        ret_dict = dict()
+        if output:
+            tmp_dict = parsergen.oper_fill_tabular(device_output=output, device_os='iosxe', header_fields=header,
+                    label_fields=label_fields, index=[0]).entries
+
+            for k in tmp_dict:
+                del tmp_dict[k]["sub_id"]
+                ret_dict[int(k)] = tmp_dict[k]
+
+                ret_dict[int(k)]["msg_sent"] = int(ret_dict[int(k)]["msg_sent"])
+                ret_dict[int(k)]["msg_drop"] = int(ret_dict[int(k)]["msg_drop"])
+                ret_dict[int(k)]["record_sent"] = int(ret_dict[int(k)]["record_sent"])
+            ret_dict = {"sub_id": ret_dict}
+
+        return ret_dict
+
+
+class ShowTelemetryInternalSensorSchema(MetaParser):
+    """Schema for:
+        * show telemetry internal sensor subscription {sub_id}
+        * show telemetry internal sensor stream {stream_type}
+    """
+
+    schema = {
+        "instance": {
+            int: {
+                Optional("sensor_type"): {
+                    "type": str,
+                    "filter_type": str,
+                    "filter_selector": str,
+                },
+                Optional("data_collector"): {
+                    Any(): {
+                        "dc_type": str,
+                        "sub_filter": str,
+                    }
+                }
+            }
+        }
+    }
+
+class ShowTelemetryInternalSensor(ShowTelemetryInternalSensorSchema):
+    """Parser for:
+        * show telemetry internal sensor subscription {sub_id}
+        * show telemetry internal sensor stream {stream_type}
+    """
+
+    cli_command = [
+        'show telemetry internal sensor subscription {sub_id}',
+        'show telemetry internal sensor stream {stream_type}',
+    ]
+    def cli(self, sub_id=None, stream_type=None, output=None):
+        if output is None:
+            if sub_id:
+                output = self.device.execute(self.cli_command[0].format(
+                    sub_id=sub_id
+                ))
+            elif stream_type:
+                output = self.device.execute(self.cli_command[1].format(
+                    stream_type=stream_type
+                ))
+            else:
+                return {}
+
+        # Subscription ID: 2147483659
+        p1 = re.compile(r'^Subscription +ID: *(?P<sub_id>\d*)$')
+
+        #  Sensor Type: yang-push periodic
+        p2 = re.compile(r'^Sensor +Type: *(?P<sensor_type>.*)$')
+
+        #    Filter type: xpath
+        p3 = re.compile(r'^Filter +type: *(?P<filter_type>\S*)$')
+
+        #    Filter selector: /if:interfaces-state/interface[name="GigabitEthernet0/0"]/oper-status
+        p4 = re.compile(r'^Filter +selector: *(?P<filter_selector>\S*)$')
+
+        #    DC: confd periodic, SubFilter: /if:interfaces-state/interface[name="GigabitEthernet0/0"]/oper-status
+        p5 = re.compile(r'^DC: *(?P<dc_type>.*), SubFilter: *(?P<sub_filter>\S*)$')
+
+        ret_dict = dict()
+        dcCtr = 0
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            # Subscription ID: 2147483648
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                sensorDict = ret_dict.setdefault('instance', {}).\
+                        setdefault(int(group['sub_id']), {})
+                dcCtr = 0
+                continue
+
+
+            # Sensor Type: yang-push periodic
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                sensorTypeDic = sensorDict.setdefault("sensor_type", {})
+                sensorTypeDic['type'] = group['sensor_type']
+                continue
+
+            # Filter type: xpath
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                sensorTypeDic['filter_type'] = group['filter_type']
+                continue
+
+            # Filter selector: /if:interfaces-state/interface[name="GigabitEthernet0/0"]/oper-status
+            m = p4.match(line)
+            if m:
+                group = m.groupdict()
+                sensorTypeDic['filter_selector'] = group['filter_selector']
+                continue
+
+            # DC: confd periodic, SubFilter: /if:interfaces-state/interface[name="GigabitEthernet0/0"]/oper-status
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                dataCollectorDict = sensorDict.setdefault("data_collector", {})
+
+                dcKey = "dc" + str(dcCtr)
+                dcDic = dataCollectorDict.setdefault(dcKey, {})
+                dcDic['dc_type'] = group['dc_type']
+                dcDic['sub_filter'] = group['sub_filter']
+                dcCtr += 1
+                continue
+        return ret_dict
+
+
+class ShowTelemetryReceiverNameSchema(MetaParser):
+    '''schema for:
+        * show telemetry receiver name {name}
+        * show telemetry receiver all
+    '''
+    schema = {
+            "name": {
+                Any(): {
+                    'profile': str,
+                    'state': str,
+                    Optional('state_description'): str,
+                    Optional('last_change'): str,
+                    'type': str,
+                    Optional('protocol'): str,
+                    Optional('host'): str,
+                    Optional('port'): int,
+                    Optional('explanation'): str
+                    },
+                }
+            }
+
+class ShowTelemetryReceiverName(ShowTelemetryReceiverNameSchema):
+    '''parser for:
+        * show telemetry receiver name {name}
+    '''
+
+    cli_command = 'show telemetry receiver name {name}'
+
+    def cli(self, name, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command.format(
+                name=name
+            ))
+
+        #Name: test0
+        p1 = re.compile("^Name:\s*(?P<name>\S*)$")
+
+        #Profile:
+        p2 = re.compile("^Profile:\s*(?P<profile>\S*)$")
+
+        #State: Valid
+        p3 = re.compile("^State:\s*(?P<state>\S*)$")
+
+        #State Description:
+        p4 = re.compile("^State Description:\s*(?P<state_description>\S*)$")
+
+        #Last State Change: 10/26/21 17:55:47
+        p5 = re.compile("^Last State Change:\s*(?P<last_change>\S* *\S*)$")
+
+        #Type: protocol
+        p6 = re.compile("^Type:\s*(?P<type>\S*)$")
+
+        #Protocol: native
+        p7 = re.compile("^Protocol:\s*(?P<protocol>\S*)$")
+
+        #Host: 161.44.223.172
+        p8 = re.compile("^Host:\s*(?P<host>\S*)$")
+
+        #Port: 123
+        p9 = re.compile("^Port:\s*(?P<port>\S*)$")
+
+        ret_dict = dict()
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                val = group["name"]
+                nameEntry = ret_dict.setdefault("name", {}).setdefault(val, {})
+                continue
+
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                nameEntry["profile"] = group["profile"]
+                continue
+
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                nameEntry["state"] = group["state"]
+                continue
+
+            m = p4.match(line)
+            if m:
+                group = m.groupdict()
+                nameEntry["state_description"] = group["state_description"]
+                continue
+
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                nameEntry["last_change"] = group["last_change"]
+                continue
+
+            m = p6.match(line)
+            if m:
+                group = m.groupdict()
+                nameEntry["type"] = group["type"]
+                continue
+
+            m = p7.match(line)
+            if m:
+                group = m.groupdict()
+                nameEntry["protocol"] = group["protocol"]
+                continue
+            
+            m = p8.match(line)
+            if m:
+                group = m.groupdict()
+                nameEntry["host"] = group["host"]
+                continue
+
+            m = p9.match(line)
+            if m:
+                group = m.groupdict()
+                nameEntry["port"] = int(group["port"])
+                continue
+            
+        return ret_dict
+
+class ShowTelemetryReceiverAll(ShowTelemetryReceiverNameSchema):
+    '''parser for:
+        * show telemetry receiver all
+    '''
+
+    cli_command = 'show telemetry receiver all'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        ret_dict = dict()
+        if output:
+            header = ["Name", "Type", "Profile", "State", "Explanation"]
+            label_fields = [i.lower() for i in header]
+
+            ret_dict = parsergen.oper_fill_tabular(device_output=output, device_os='iosxe', header_fields=header, 
+                    label_fields=label_fields, index=[0]).entries
+
+            for k in ret_dict:
+                del ret_dict[k]["name"]
+
+            ret_dict = {"name": ret_dict}
+        return ret_dict
+
+class ShowTelemetryIETFSubscriptionSummarySchema(MetaParser):
+    """Schema for:
+        show telemetry ietf subscription summary
+    """
+
+    schema = {
+        "max_supported": int,
+        "type": {
+            str: {
+                "total": int,
+                "valid": int,
+                "invalid": int,
+            },
+        }
+    }
+
+class ShowTelemetryIETFSubscriptionSummary(ShowTelemetryIETFSubscriptionSummarySchema):
+    """Parser for:
+        show telemetry ietf subscription summary
+    """
+
+    cli_command = "show telemetry ietf subscription summary"
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        # Maximum supported: 128
+        p1 = re.compile(r'^Maximum +supported: +(?P<max_supported>[0-9]+)$')
+
+        # Subscription     Total       Valid      Invalid
+        # -----------------------------------------------
+        # All              0           0          0
+        # Dynamic          0           0          0
+        # Configured       0           0          0
+        # Permanent        0           0          0
+        p2 = re.compile(r'^(?P<type>(All|Dynamic|Configured|Permanent)+) +(?P<total>[0-9]+) +'
+                        r'(?P<valid>[0-9]+) +(?P<invalid>[0-9]+)$')
+
+        ret_dict = dict()
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            # Maximum supported: 128
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                ret_dict['max_supported'] = int(group['max_supported'])
+                continue
+
+            # Subscription     Total       Valid      Invalid
+            # -----------------------------------------------
+            # All              0           0          0
+            # Dynamic          0           0          0
+            # Configured       0           0          0
+            # Permanent        0           0          0
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                types = ret_dict.setdefault('type', {})
+                states = types.setdefault(group['type'].lower(), {})
+                for state in ['total', 'valid', 'invalid']:
+                    states.update({state: int(group[state])})
+                continue
+
+        return ret_dict
+
+
+class ShowTelemetryInternalProtocolManagerSchema(MetaParser):
+    '''schema for:
+        * show telemetry internal protocol {protocol} manager {peer_ip} {port} source-vrf {vrf_id} {source_ip}
+    '''
+
+    schema = {
+        "con": {
+            str: {
+                "sock_fd": int,
+                "protocol": str,
+                "state": str,
+                Optional("version"): str,
+                Optional("profile"): str,
+                "table_id": int,
+                Optional("wait_mask"): str,
+                Optional("con_retries"): int,
+                Optional("send_retries"): int,
+                Optional("pending_events"): int,
+                Optional("session_reqs"): int,
+                Optional("session_resp"): int,
+                "source_ip": str,
+                "bytes_sent": int,
+                "msgs_sent": int,
+                "msgs_recv": int,
+                Optional("bytes_queued"): int,
+                Optional("creation_time"): str,
+                Optional("last_con_time"): str,
+                Optional("last_discon_time"): str,
+                Optional("last_error"): str,
+                Optional("con_flaps"): int,
+                Optional("last_flap_reason"): str,
+                Optional("keep_alive_timeouts"): int,
+                Optional("last_transport_error"): str
+            }
+        }
+    }
+
+class ShowTelemetryInternalProtocolManager(ShowTelemetryInternalProtocolManagerSchema):
+    '''parser for:
+        * show telemetry internal protocol {protocol} manager {peer_ip} {port} source-vrf {vrf_id} {source_ip}
+    '''
+
+    cli_command = [
+        'show telemetry internal protocol {protocol} manager {peer_ip} {port} source-vrf {vrf_id} {source_ip}'
+    ]
+
+    def cli(self, protocol, peer_ip, port, vrf_id, source_ip=None, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command[0].format(protocol=protocol,
+                                                                    peer_ip=peer_ip,
+                                                                    port=port,
+                                                                    vrf_id=vrf_id,
+                                                                    source_ip=source_ip))
+
+        #Con str                : 161.44.237.28:45000:0:172.16.0.6
+        p1 = re.compile(r'^Con str *: *(?P<con_str>\S*)$')
+
+        #Sockfd                 : 138
+        p2 = re.compile(r'^Sockfd *: *(?P<sock_fd>\d*)$')
+
+        #Protocol               : native
+        p3 = re.compile(r'^Protocol *: *(?P<protocol>\S*)$')
+
+        #State                  : CNDP_STATE_CONNECTED
+        p4 = re.compile(r'^State *: *(?P<state>\w*)$')
+
+        #Version                :
+        p5 = re.compile(r'^Version *: *(?P<version>\S*)$')
+
+        #Profile                :
+        p6 = re.compile(r'^Profile *: *(?P<profile>\S*)$')
+
+        #Table id               : 0
+        p7 = re.compile(r'^Table id *: *(?P<table_id>\d*)$')
+
+        #Wait Mask              :
+        p8 = re.compile(r'^Wait Mask *: *(?P<wait_mask>\S*)$')
+
+        #Connection Retries     : 0
+        p9 = re.compile(r'^Connection Retries *: *(?P<con_retries>\d*)$')
+
+        #Send Retries           : 0
+        p10 = re.compile(r'^Send Retries *: *(?P<send_retries>\d*)$')
+
+        #Pending events         : 0
+        p11 = re.compile(r'^Pending events *: *(?P<pending_events>\d*)$')
+
+        #Session requests       : 1
+        p12 = re.compile(r'^Session requests *: *(?P<session_reqs>\d*)$')
+
+        #Session replies        : 1
+        p13 = re.compile(r'^Session replies *: *(?P<session_resp>\d*)$')
+
+        #Source ip              : 172.16.0.6
+        p14 = re.compile(r'^Source ip *: *(?P<source_ip>\S*)$')
+
+        #Bytes Sent             : 4835
+        p15 = re.compile(r'^Bytes Sent *: *(?P<bytes_sent>\d*)$')
+
+        #Msgs Sent              : 8
+        p16 = re.compile(r'^Msgs Sent *: *(?P<msgs_sent>\d*)$')
+
+        #Msgs Received          : 0
+        p17 = re.compile(r'^Msgs Received *: *(?P<msgs_recv>\d*)$')
+
+        #Bytes in queue         : 0
+        p18 = re.compile(r'^Bytes in queue *: *(?P<bytes_queued>\d*)$')
+
+        #Creation time:         : Mon Jan 15 21:49:23:54
+        p19 = re.compile(r'^Creation time: *: *(?P<creation_time>.*)$')
+
+        #Last connected time:   : Mon Jan 15 21:49:23:59
+        p20 = re.compile(r'^Last connected time: *: *(?P<last_con_time>.*)$')
+
+        #Last disconnect time:  :
+        p21 = re.compile(r'^Last disconnect time: *: *(?P<last_discon_time>.*)$')
+
+        #Last error:            :
+        p22 = re.compile(r'^Last error: *: *(?P<last_error>.*)$')
+
+        #Connection flaps:      : 0
+        p23 = re.compile(r'^Connection flaps: *: *(?P<con_flaps>\d*)$')
+
+        #Last flap Reason:      :
+        p24 = re.compile(r'^Last flap reason: *: *(?P<last_flap_reason>.*)$')
+
+        #Keep Alive Timeouts:   : 0
+        p25 = re.compile(r'^Keep Alive Timeouts: *: *(?P<keep_alive_timeouts>\d*)$')
+
+        #Last Transport Error   :
+        p26 = re.compile(r'^Last Transport Error *: *(?P<last_transport_error>.*)$')
+
+        ret_dict = dict()
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            #Con str                : 161.44.237.28:45000:0:172.16.0.6
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict = ret_dict.setdefault('con', {}).setdefault(group['con_str'], {})
+                continue
+
+            #Sockfd                 : 138
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['sock_fd'] = int(group['sock_fd'])
+                continue
+
+            #Protocol               : native
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['protocol'] = group['protocol']
+                continue
+
+            #State                  : CNDP_STATE_CONNECTED
+            m = p4.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['state'] = group['state']
+                continue
+
+            #Version                :
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['version'] = group['version']
+                continue
+
+            #Profile                :
+            m = p6.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['profile'] = group['profile']
+                continue
+
+            #Table id               : 0
+            m = p7.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['table_id'] = int(group['table_id'])
+                continue
+
+            #Wait Mask              :
+            m = p8.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['wait_mask'] = group['wait_mask']
+                continue
+
+            #Connection Retries     : 0
+            m = p9.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['con_retries'] = int(group['con_retries'])
+                continue
+
+            #Send Retries           : 0
+            m = p10.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['send_retries'] = int(group['send_retries'])
+                continue
+
+            #Pending events         : 0
+            m = p11.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['pending_events'] = int(group['pending_events'])
+                continue
+
+            #Session requests       : 1
+            m = p12.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['session_reqs'] = int(group['session_reqs'])
+                continue
+
+            #Session replies        : 1
+            m = p13.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['session_resp'] = int(group['session_resp'])
+                continue
+
+            #Source ip              : 172.16.0.6
+            m = p14.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['source_ip'] = group['source_ip']
+                continue
+
+            #Bytes Sent             : 4835
+            m = p15.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['bytes_sent'] = int(group['bytes_sent'])
+                continue
+
+            #Msgs Sent              : 8
+            m = p16.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['msgs_sent'] = int(group['msgs_sent'])
+                continue
+
+            #Msgs Received          : 0
+            m = p17.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['msgs_recv'] = int(group['msgs_recv'])
+                continue
+
+            #Bytes in queue         : 0
+            m = p18.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['bytes_queued'] = int(group['bytes_queued'])
+                continue
+
+            #Creation time:         : Mon Jan 15 21:49:23:54
+            m = p19.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['creation_time'] = group['creation_time']
+                continue
+
+            #Last connected time:   : Mon Jan 15 21:49:23:59
+            m = p20.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['last_con_time'] = group['last_con_time']
+                continue
+
+            #Last disconnect time:  :
+            m = p21.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['last_discon_time'] = group['last_discon_time']
+                continue
+
+            #Last error:            :
+            m = p22.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['last_error'] = group['last_error']
+                continue
+
+            #Connection flaps:      : 0
+            m = p23.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['con_flaps'] = int(group['con_flaps'])
+                continue
+
+            #Last flap Reason:      :
+            m = p24.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['last_flap_reason'] = group['last_flap_reason']
+                continue
+
+            #Keep Alive Timeouts:   : 0
+            m = p25.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['keep_alive_timeouts'] = int(group['keep_alive_timeouts'])
+                continue
+
+            #Last Transport Error   :
+            m = p26.match(line)
+            if m:
+                group = m.groupdict()
+                con_dict['last_transport_error'] = group['last_transport_error']
+                continue
+
+        return ret_dict
@@ -1,7 +1,7 @@
 import re
 
 from genie.metaparser import MetaParser
-from genie.metaparser.util.schemaengine import Any, Optional
+from genie.metaparser.util.schemaengine import Any, Optional, Or
 
 
 
@@ -146,9 +146,10 @@ class ShowWirelessProfilePolicyDetailed(ShowWirelessProfilePolicyDetailedSchema)
 
     cli_command = 'show wireless profile policy detailed {policy_name}'
 
-    def cli(self, policy_name="",  output=None):
+    def cli(self, policy_name="", output=None):
         if output is None:
-            output = self.device.execute(self.cli_command)
+            cmd = self.cli_command.format(policy_name=policy_name)
+            output = self.device.execute(cmd)
         else:
             output=output
 
@@ -1179,10 +1180,13 @@ class ShowWirelessFabricClientSummarySchema(MetaParser):
         Optional("mac_address") : {
             Optional(str) : {
                 Optional("ap_name") : str,
+                Optional("type") : str,
                 Optional("wlan") : int,
                 Optional("state") : str,
                 Optional("protocol") : str,
                 Optional("method") : str,
+                Optional("l2_vnid") : int,
+                Optional("rloc_ip") : str,
             }
         }
     }
@@ -1202,7 +1206,7 @@ class ShowWirelessFabricClientSummary(ShowWirelessFabricClientSummarySchema):
         else:
             output=output
 
-        show_wireless_fabric_client_summary_dict = {}
+        ret_dict = {}
 
 
         # Number of Fabric Clients : 8
@@ -1223,18 +1227,12 @@ class ShowWirelessFabricClientSummary(ShowWirelessFabricClientSummarySchema):
         # Number of Fabric Clients : 8
         p_clients = re.compile(r"^Number\s+of\s+Fabric\s+Clients\s+:\s+(?P<clients>\S+)$")
 
-        # MAC Address    AP Name                          WLAN State              Protocol Method
-        p_header = re.compile(r"^MAC\s+Address\s+AP\s+Name\s+WLAN\s+State\s+Protocol\s+Method$")
-
-        # -------------------------------------------------------------------------------------------------------------------------
-        p_delimiter = re.compile(
-            r"^-------------------------------------------------------------------------------------------------------------------------$")
-
         # 58bf.eaff.89a2 a2-11-cap43                   17   Run                11ac     Dot1x
         p_client_info = re.compile(r"^(?P<mac>\S{4}\.\S{4}\.\S{4})\s+(?P<name>\S+)\s+(?P<wlan>\S+)\s+(?P<state>.*)\s+(?P<protocol>\S+)\s+(?P<method>(Dot1x|MAB))$")
 
-
-        show_wireless_fabric_client_summary_dict = {}
+        # MAC Address    AP Name                  Type ID   State              Protocol Method     L2 VNID    RLOC IP
+        # dca6.3249.1877 AP-E6-25C0               WLAN 18   Run                11n(2.4) Dot1x      8189       10.240.240.3
+        p_client_info_n = re.compile(r"(?P<mac>\S{4}\.\S{4}\.\S{4})\s+(?P<name>\S+)\s+(?P<wtype>\w+)\s+(?P<wlan>\d+)\s+(?P<state>(\w+\s*\w+))\s+(?P<protocol>\S+)\s+(?P<method>(Dot1x|MAB))\s+(?P<l2_vnid>\d+)\s+(?P<rloc_ip>((\d{1,3}\.){3}\d{1,3}))")
 
         for line in output.splitlines():
             line = line.strip()
@@ -1242,19 +1240,12 @@ class ShowWirelessFabricClientSummary(ShowWirelessFabricClientSummarySchema):
             if p_clients.match(line):
                 match = p_clients.match(line)
                 client_count = int(match.group('clients'))
-                if not show_wireless_fabric_client_summary_dict.get('number_of_fabric_clients'):
-                    show_wireless_fabric_client_summary_dict.update({'number_of_fabric_clients' : client_count})
-                continue
-            # MAC Address    AP Name                          WLAN State              Protocol Method
-            elif p_header.match(line):
-                match = p_header.match(line)
-                continue
-            # -------------------------------------------------------------------------------------------------------------------------
-            elif p_delimiter.match(line):
-                match = p_delimiter.match(line)
+                if not ret_dict.get('number_of_fabric_clients'):
+                    ret_dict.update({'number_of_fabric_clients' : client_count})
                 continue
+
             # 58bf.eaff.89a2 a2-11-cap43                   17   Run                11ac     Dot1x
-            elif p_client_info.match(line):
+            if p_client_info.match(line):
                 match = p_client_info.match(line)
                 groups = match.groupdict()
                 mac_address = groups['mac']
@@ -1263,11 +1254,38 @@ class ShowWirelessFabricClientSummary(ShowWirelessFabricClientSummarySchema):
                 state = groups['state'].strip()
                 protocol = groups['protocol']
                 method = groups['method']
-                if not show_wireless_fabric_client_summary_dict.get('mac_address'):
-                    show_wireless_fabric_client_summary_dict['mac_address'] = {}
-                show_wireless_fabric_client_summary_dict['mac_address'].update({mac_address : {'ap_name' : ap_name, 'wlan' : wlan, 'state' : state, 'protocol' : protocol, 'method' : method}})
-
-        return show_wireless_fabric_client_summary_dict
+                if not ret_dict.get('mac_address'):
+                    ret_dict['mac_address'] = {}
+                ret_dict['mac_address'].update({mac_address : {'ap_name' : ap_name,
+                                                               'wlan' : wlan,
+                                                               'state' : state,
+                                                               'protocol' : protocol,
+                                                               'method' : method}})
+
+            # dca6.3249.1877 AP-E6-25C0               WLAN 18   Run                11n(2.4) Dot1x      8189       10.240.240.3
+            if p_client_info_n.match(line):
+                match = p_client_info_n.match(line)
+                groups = match.groupdict()
+                mac_address = groups['mac']
+                ap_name = groups['name']
+                wtype = groups['wtype']
+                wlan = int(groups['wlan'])
+                state = groups['state'].strip()
+                protocol = groups['protocol']
+                method = groups['method']
+                l2_vnid = int(groups['l2_vnid'])
+                rloc_ip = groups['rloc_ip']
+                if not ret_dict.get('mac_address'):
+                    ret_dict['mac_address'] = {}
+                ret_dict['mac_address'].update({mac_address : {'ap_name': ap_name,
+                                                               'type': wtype,
+                                                               'wlan': wlan,
+                                                               'state': state,
+                                                               'protocol': protocol,
+                                                               'method': method,
+                                                               'l2_vnid': l2_vnid,
+                                                               'rloc_ip':rloc_ip}})
+        return ret_dict
 
 
 # =================================
@@ -1299,7 +1317,10 @@ class ShowWirelessFabricSummarySchema(MetaParser):
                 }
             }
         }
-    }                    
+    }
+
+
+# =================================
 #  * 'show wireless client summary'
 # =================================
 class ShowWirelessClientSummarySchema(MetaParser):
@@ -1766,109 +1787,6 @@ class ShowWirelessMobilityApList(ShowWirelessMobilityApListSchema):
                 ap_info_obj["ap_name"].update(ap_name_dict)
 
         return ap_info_obj
-      
-      
-# ========================================
-# Schema for:
-#  * 'show wireless fabric client summary'
-# ========================================
-class ShowWirelessFabricClientSummarySchema(MetaParser):
-    """Schema for show wireless fabric client summary."""
-
-    schema = {
-        "number_of_fabric_clients" : int,
-        Optional("mac_address") : {
-            Optional(str) : {
-                Optional("ap_name") : str,
-                Optional("wlan") : int,
-                Optional("state") : str,
-                Optional("protocol") : str,
-                Optional("method") : str,
-            }
-        }
-    }
-
-# ========================================
-# Parser for:
-#  * 'show wireless fabric client summary'
-# ========================================
-class ShowWirelessFabricClientSummary(ShowWirelessFabricClientSummarySchema):
-    """Parser for show wireless fabric client summary"""
-
-    cli_command = 'show wireless fabric client summary'
-
-    def cli(self, output=None):
-        if output is None:
-            output = self.device.execute(self.cli_command)
-        else:
-            output=output
-
-
-        show_wireless_fabric_client_summary_dict = {}
-
-        # Number of Fabric Clients : 8
-
-        # MAC Address    AP Name                          WLAN State              Protocol Method     
-        # --------------------------------------------------------------------------------------------
-        # 58bf.eaff.89a2 a2-11-cap43                   17   Run                11ac     Dot1x     
-        # 58bf.eaff.ac28 a2-11-cap50                   19   IP Learn           11n(2.4) MAB       
-        # 58bf.eaff.6393 a2-11-cap52                   19   Webauth Pending    11n(2.4) MAB       
-        # --------------------------------------------------------------------------------------------
-        # 58bf.eaff.63a0 a2-11-cap46                   17   Run                11ac     Dot1x     
-        # 58bf.eaff.2c06 a2-12-cap15                   19   Webauth Pending    11n(2.4) MAB       
-        # 58bf.eaff.8759 a2-11-cap44                   19   Webauth Pending    11n(2.4) MAB       
-        # --------------------------------------------------------------------------------------------
-        # 58bf.eaff.5e2c a2-12-cap17                   19   Webauth Pending    11ac     MAB       
-        # 58bf.eaff.fc60 a2-12-cap17                   19   Webauth Pending    11ac     MAB   
-
-        # Number of Fabric Clients : 8
-        p_clients = re.compile(r"^Number\s+of\s+Fabric\s+Clients\s+:\s+(?P<clients>\S+)$")
-
-        # MAC Address    AP Name                          WLAN State              Protocol Method
-        p_header = re.compile(r"^MAC\s+Address\s+AP\s+Name\s+WLAN\s+State\s+Protocol\s+Method$")
-
-        # -------------------------------------------------------------------------------------------------------------------------
-        p_delimiter = re.compile(
-            r"^-------------------------------------------------------------------------------------------------------------------------$")
-
-        # 58bf.eaff.89a2 a2-11-cap43                   17   Run                11ac     Dot1x
-        p_client_info = re.compile(r"^(?P<mac>\S{4}\.\S{4}\.\S{4})\s+(?P<name>\S+)\s+(?P<wlan>\S+)\s+(?P<state>.*)\s+(?P<protocol>\S+)\s+(?P<method>(Dot1x|MAB))$")
-
-
-        show_wireless_fabric_client_summary_dict = {}
-
-        for line in output.splitlines():
-            line = line.strip()
-            # Number of Fabric Clients : 8
-            if p_clients.match(line):
-                match = p_clients.match(line)
-                client_count = int(match.group('clients'))
-                if not show_wireless_fabric_client_summary_dict.get('number_of_fabric_clients'):
-                    show_wireless_fabric_client_summary_dict.update({'number_of_fabric_clients' : client_count})
-                continue
-            # MAC Address    AP Name                          WLAN State              Protocol Method
-            elif p_header.match(line):
-                match = p_header.match(line)
-                continue
-            # -------------------------------------------------------------------------------------------------------------------------
-            elif p_delimiter.match(line):
-                match = p_delimiter.match(line)
-                continue
-            # 58bf.eaff.89a2 a2-11-cap43                   17   Run                11ac     Dot1x
-            elif p_client_info.match(line):
-                match = p_client_info.match(line)
-                groups = match.groupdict()
-                mac_address = groups['mac']
-                ap_name = groups['name']
-                wlan = int(groups['wlan'])
-                state = groups['state'].strip()
-                protocol = groups['protocol']
-                method = groups['method']
-                if not show_wireless_fabric_client_summary_dict.get('mac_address'):
-                    show_wireless_fabric_client_summary_dict['mac_address'] = {}
-                show_wireless_fabric_client_summary_dict['mac_address'].update({mac_address : {'ap_name' : ap_name, 'wlan' : wlan, 'state' : state, 'protocol' : protocol, 'method' : method}})
-
-        return show_wireless_fabric_client_summary_dict
 
 
 # ===================================
@@ -1982,7 +1900,7 @@ class ShowWirelessMobilitySummary(ShowWirelessMobilitySummarySchema):
             # N/A
             r"(?P<status>\S+)\s+"
             # N/A
-            r"(?P<pmtu>\S+)\s+$"
+            r"(?P<pmtu>\S+)\s*$"
         )
 
         mobility_info_obj = {}
@@ -2191,6 +2109,7 @@ class ShowWirelessStatsApJoinSummary(ShowWirelessStatsApJoinSummarySchema):
 
         return wireless_info_obj
 
+
 # ====================================
 # Schema for:
 #  * 'show wireless client mac {mac_address} detail'
@@ -2199,178 +2118,206 @@ class ShowWirelessClientMacDetailSchema(MetaParser):
     """Schema for show wireless client mac {mac_address} detail."""
 
     schema = {
-          "client_mac_address": str,
-          "client_mac_type": str,
-          "client_ipv4_address": str,
-          "client_ipv6_addresses": str,
-          "client_username": str,
-          "ap_mac_address": str,
-          "ap_name": str,
-          "ap_slot": int,
-          "client_state": str,
-          "policy_profile": str,
-          "flex_profile": str,
-          "wireless_lan_id": int,
-          "wlan_profile_name": str,
-          "wireless_lan_network_name_ssid": str,
-          "bssid": str,
-          "connected_for_seconds": int,
-          "protocol": str,
-          "channel": int,
-          "client_iif_id": str,
-          "association_id": int,
-          "authentication_alogrithm": str,
-          "idle_state_timeout": str,
-          "re_authentication_timeout_secs": {
-              "configured": int,
-              "remaining_time": int
-          },
-          "input_policy_name": str,
-          "input_policy_state": str,
-          "input_policy_source": str,
-          "output_policy_name": str,
-          "output_policy_state": str,
-          "output_policy_source": str,
-          "wmm_support": str,
-          "u_apsd_support": {
-              "status": str,
-              "u_apsd_value": int,
-              "apsd_acs": list
-          },
-          "fastlane_support": str,
-          "client_active_state": str,
-          "power_save": str,
-          "current_rate": float,
-          "supported_rates": list,
-          "mobility": {
-              "move_count": int,
-              "mobility_role": str,
-              "mobility_roam_type": str,
-              Optional("mobility_complete_timestamp"): str
-          },
-          "client_join_time": str,
-          "client_state_servers": str,
-          "client_acls": str,
-          "policy_manager_state": str,
-          "last_policy_manager_state": str,
-          "client_entry_create_time_secs": int,
-          "policy_type": str,
-          "encryption_cipher": str,
-          "authentication_key_management": str,
-          "user_defined_private_network": str,
-          "user_defined_private_network_drop_unicast": str,
-          "encrypted_traffic_analytics": str,
-          "protected_management_frame__802.11w": str,
-          "eap_type": str,
-          "vlan_override_after_webauth": str,
-          "vlan": str,
-          "multicast_vlan": int,
-          "wifi_direct_capabilities": {
-              "wifi_direct_capable": str
-          },
-          "central_nat": str,
-          "session_manager": {
-              "point_of_attachment": str,
-              "iif_id": str,
-              "authorized": str,
-              "session_timeout": int,
-              "common_session_id": str,
-              "acct_session_id": str,
-              "last_tried_aaa_server_details": {
-                  "server_ip": str
-              },
-              "auth_method_status_list": {
-                  "method": {
-                    str: {
-                        "sm_state": str,
-                        "sm_bend_state": str
+        "client_mac_address": str,
+        "client_mac_type": str,
+        "client_ipv4_address": str,
+        Optional("client_ipv6_addresses"): str,
+        "client_username": str,
+        "ap_mac_address": str,
+        "ap_name": str,
+        "ap_slot": int,
+        "client_state": str,
+        "policy_profile": str,
+        "flex_profile": str,
+        "wireless_lan_id": int,
+        "wlan_profile_name": str,
+        "wireless_lan_network_name_ssid": str,
+        "bssid": str,
+        "connected_for_seconds": int,
+        "protocol": str,
+        "channel": int,
+        "client_iif_id": str,
+        "association_id": int,
+        "authentication_alogrithm": str,
+        "idle_state_timeout": str,
+        Optional("re_authentication_timeout_secs"): {
+            "configured": int,
+            "remaining_time": int
+        },
+        "input_policy_name": str,
+        "input_policy_state": str,
+        "input_policy_source": str,
+        "output_policy_name": str,
+        "output_policy_state": str,
+        "output_policy_source": str,
+        "wmm_support": str,
+        "u_apsd_support": {
+            "status": str,
+            Optional("u_apsd_value"): int,
+            Optional("apsd_acs"): list
+        },
+        "fastlane_support": str,
+        "client_active_state": str,
+        "power_save": str,
+        "current_rate": Or(float, str),
+        "supported_rates": list,
+        Optional("aaa_qos_rate_limit_parameters"): {
+            "upstream": {
+                "qos_average_data_rate_kbps": int,
+                "qos_realtime_average_data_rate_kbps": int,
+                "qos_burst_data_rate_kbps": int,
+                "qos_realtime_burst_data_rate_kbps": int
+            },
+            "downstream": {
+                "qos_average_data_rate_kbps": int,
+                "qos_realtime_average_data_rate_kbps": int,
+                "qos_burst_data_rate_kbps": int,
+                "qos_realtime_burst_data_rate_kbps": int
+            }
+        },
+        "mobility": {
+            "move_count": int,
+            "mobility_role": str,
+            "mobility_roam_type": str,
+            Optional("mobility_complete_timestamp"): str
+        },
+        "client_join_time": str,
+        "client_state_servers": str,
+        "client_acls": str,
+        "policy_manager_state": str,
+        "last_policy_manager_state": str,
+        "client_entry_create_time_secs": int,
+        "policy_type": str,
+        "encryption_cipher": str,
+        Optional("authentication_key_management"): str,
+        "user_defined_private_network": str,
+        "user_defined_private_network_drop_unicast": str,
+        "encrypted_traffic_analytics": str,
+        "protected_management_frame__802.11w": str,
+        "eap_type": str,
+        "vlan_override_after_webauth": str,
+        "vlan": Or(int, str),
+        "multicast_vlan": int,
+        "wifi_direct_capabilities": {
+            "wifi_direct_capable": str
+        },
+        "central_nat": str,
+        "session_manager": {
+            "point_of_attachment": str,
+            "iif_id": str,
+            "authorized": str,
+            "session_timeout": int,
+            "common_session_id": str,
+            "acct_session_id": str,
+            Optional("last_tried_aaa_server_details"): {
+                "server_ip": str
+            },
+            "auth_method_status_list": {
+                "method": {
+                    Any(): {
+                        Optional("sm_state"): str,
+                        Optional("sm_bend_state"): str,
+                        Optional("authen_status"): str
                     }
-                  }
-              },
-              "local_policies": {
-                  "service_template": {
-                    str : {
-                        "vlan_group": str,
+                }
+            },
+            "local_policies": {
+                "service_template": {
+                    Any(): {
+                        Optional("vlan_group"): str,
+                        Optional("vlan"): Or(int, str),
                         "absolute_timer": int
                     }
-                  }
-              },
-              "server_policies": {
-                  "output_sgt": str
-              },
-              "resultant_policies": {
-                  "output_sgt": str,
-                  "vlan_name": str,
-                  "vlan_group": str,
-                  "vlan": int,
-                  "absolute_timer": int
-              }
-          },
-          "dns_snooped_ipv4_addresses": str,
-          "dns_snooped_ipv6_addresses": str,
-          "client_capabilities": {
-              "cf_pollable": str,
-              "cf_poll_request": str,
-              "short_preamble": str,
-              "pbcc": str,
-              "channel_agility": str,
-              "listen_interval": int
-          },
-          "fast_bss_transition_details": {
-              "reassociation_timeout": int
-          },
-          "11v_bss_transition": str,
-          "11v_dms_capable": str,
-          "qos_map_capable": str,
-          "flexconnect_data_switching": str,
-          "flexconnect_dhcp_status": str,
-          "flexconnect_authentication": str,
-          "flexconnect_central_association": str,
-          "client_statistics": {
-              "number_of_bytes_received": int,
-              "number_of_bytes_sent": int,
-              "number_of_packets_received": int,
-              "number_of_packets_sent": int,
-              "number_of_policy_errors": int,
-              "radio_signal_strength_indicator_dbm": int,
-              "signal_to_noise_ration_db": int
-          },
-          "fabric_status": "Disabled",
-          "radio_measurement_enabled_capabilities": {
-              "capabilities": list
-          },
-          "client_scan_report_time": str,
-          "nearby_ap_statistics": {
-              "ap_names": {
-                Optional(str): {
-                  Optional("antenna"): {
-                    Optional(str): {
-                      Optional("seconds_ago"): int,
-                      Optional("dbm"): int
+                }
+            },
+            "server_policies": {
+                Optional("output_sgt"): str,
+                Optional("url_redirect_acl"): str,
+                Optional("url_redirect"): str,
+                Optional("vlan"): Or(int, str)
+            },
+            "resultant_policies": {
+                Optional("output_sgt"): str,
+                "vlan_name": str,
+                Optional("vlan_group"): str,
+                "vlan": Or(int, str),
+                "absolute_timer": int,
+                Optional("url_redirect_acl"): str,
+                Optional("url_redirect"): str,
+            }
+        },
+        "dns_snooped_ipv4_addresses": str,
+        "dns_snooped_ipv6_addresses": str,
+        "client_capabilities": {
+            "cf_pollable": str,
+            "cf_poll_request": str,
+            "short_preamble": str,
+            "pbcc": str,
+            "channel_agility": str,
+            "listen_interval": int
+        },
+        "fast_bss_transition_details": {
+            "reassociation_timeout": int
+        },
+        "11v_bss_transition": str,
+        "11v_dms_capable": str,
+        "qos_map_capable": str,
+        "flexconnect_data_switching": str,
+        "flexconnect_dhcp_status": str,
+        "flexconnect_authentication": str,
+        Optional("flexconnect_central_association"): str,
+        "client_statistics": {
+            "number_of_bytes_received": int,
+            "number_of_bytes_sent": int,
+            "number_of_packets_received": int,
+            "number_of_packets_sent": int,
+            "number_of_policy_errors": int,
+            "radio_signal_strength_indicator_dbm": int,
+            "signal_to_noise_ration_db": int
+        },
+        "fabric_status": str,
+        "radio_measurement_enabled_capabilities": {
+            "capabilities": list
+        },
+        "client_scan_report_time": str,
+        "nearby_ap_statistics": {
+            Optional("ap_names"): {
+                Optional(Any()): {
+                    Optional("antenna"): {
+                        Optional(Any()): {
+                            Optional("seconds_ago"): int,
+                            Optional("dbm"): int
+                        }
                     }
-                  }
                 }
-              }
-          },
-          "eogre": str,
-          "device_info": {
-              "device_type": str,
-              "device_name": str,
-              "protocol_map": str,
-              "device_os": str,
-              "protocols": {
-                str: {
-                  int: {
-                  "type": str,
-                  "data_size": str,
-                  "data": list
-                  }
+            }
+        },
+        "eogre": str,
+        Optional("device_info"): {
+            "device_type": str,
+            "device_name": str,
+            "protocol_map": str,
+            Optional("device_os"): str,
+            "protocols": {
+                Any(): {
+                    Any(): {
+                        "type": str,
+                        "data_size": str,
+                        "data": list
+                    }
                 }
-              }
-          },
-          "max_client_protocol_capability": str,
-          "cellular_capability": str
-          }
+            }
+        },
+        "max_client_protocol_capability": str,
+        "cellular_capability": str,
+        Optional("session_warning_time"): str,
+        Optional("session_timeout"): str,
+        Optional("advanced_scheduling_requests_details"): {
+            Any(): {
+                Optional("regular_asr_support"): str
+            }
+        }
+    }
 
 
 # ====================================
@@ -2378,628 +2325,1266 @@ class ShowWirelessClientMacDetailSchema(MetaParser):
 #  * 'show wireless client mac {mac_address} detail'
 # ====================================
 class ShowWirelessClientMacDetail(ShowWirelessClientMacDetailSchema):
-    """Parser for show wireless client mac {mac_address} detail"""
-    cli_command = 'show wireless client mac detail'
-          
-    def change_data_type(self, value):
-        if value.isdigit():
-            value = value.strip()
-            value = int(value)
-        else:
-            try:
-                # Change strings to float if possible
-                value = float(value)
-            except ValueError:
-                # if the value is not an int or float, leave it as a string.
-                pass
-        return value
+    """
+    Parser for show wireless client mac {mac_address} detail
+
+    arguments:
+    mac_address: mac address of the device to be checked, looks like xxxx.yyyy.zzzz
+    """
+
+    cli_command = 'show wireless client mac {mac_address} detail'
 
     def cli(self, mac_address="", output=None):
         if output is None:
             output = self.device.execute(self.cli_command.format(mac_address=mac_address))
         else:
-          output = output
+            output = output
 
+        # Client Mac Address : abcd:1234:dcba
+        # Client IPv6 Addresses : fe80::1
+        p0 = re.compile(r'^Client (?P<address_type>\S+) (Address|Addresses) : (?P<address>[\S]+)$')
 
-        # Client MAC Address : 0aba.ddff.40c9
         # Client MAC Type : Locally Administered Address
-        # Client IPv4 Address : 10.22.4.19
-        # Client IPv6 Addresses : fe80::8ba:ddff:feff:40c9
-        # Client Username : aking
-        # AP MAC Address : 70b3.18ff.f475
+        p1 = re.compile(r'^Client MAC Type : (?P<client_mac_type>[\S ]+)$')
+
+        p2 = re.compile(r'^Client Username *: (?P<client_username>\S+)')
+
+        # AP MAC Address : bead:4321:dead
+        p3 = re.compile(r'^AP MAC Address : (?P<ap_mac_address>\S+)$')
+
         # AP Name: b1-11-cap9
+        p4 = re.compile(r'^AP Name: (?P<ap_name>\S+)$')
+
         # AP slot : 0
+        p5 = re.compile(r'^AP slot : (?P<ap_slot>\d+)$')
+
         # Client State : Associated
-        # Policy Profile : lizzard_b1
+        p6 = re.compile(r'^Client State : (?P<client_state>\S+)$')
+
+        # Policy Profile : profile_1
+        p7 = re.compile(r'^Policy Profile : (?P<policy_profile>\S+)$')
+
         # Flex Profile : N/A
+        p8 = re.compile(r'^Flex Profile : (?P<flex_profile>\S+)$')
+
         # Wireless LAN Id: 20
+        p9 = re.compile(r'^Wireless LAN Id: (?P<wireless_lan_id>\d+)$')
+
         # WLAN Profile Name: lizzard-l_Global
+        p10 = re.compile(r'^WLAN Profile Name: (?P<wlan_profile_name>\S+)$')
+
         # Wireless LAN Network Name (SSID): lizzard-legacy
+        p11 = re.compile(r'^Wireless LAN Network Name \(SSID\): (?P<wireless_lan_network_name_ssid>\S+)$')
+
         # BSSID : 70b3.18ff.f478
+        p12 = re.compile(r'^BSSID : (?P<bssid>\S+)$')
+
         # Connected For : 3233 seconds
+        p13 = re.compile(r'^Connected For : (?P<connected_for_seconds>\d+) seconds$')
+
         # Protocol : 802.11n - 2.4 GHz
+        p14 = re.compile(r'^Protocol +: (?P<protocol>[\S ]+)$')
+
+        # Protocol : 802.11n - 2.4 GHz
+        p14_1 = re.compile(r'^Device Protocol +: (?P<protocol>[\S ]+)$')
+
         # Channel : 6
-        # Client IIF-ID : 0xa0000012
+        p15 = re.compile(r'^Channel : (?P<channel>\d+)$')
+
+        # Client IIF-ID : 0xa0000001
+        p16 = re.compile(r'^Client IIF-ID : (?P<client_iif_id>\S+)$')
+
         # Association Id : 1
+        p17 = re.compile(r'^Association Id : (?P<association_id>\d+)$')
+
         # Authentication Algorithm : Open System
+        p18 = re.compile(r'^Authentication Algorithm : (?P<authentication_alogrithm>[\S ]+)$')
+
         # Idle state timeout : N/A
+        p19 = re.compile(r'^Idle state timeout : (?P<idle_state_timeout>\S+)$')
+
         # Re-Authentication Timeout : 36000 sec (Remaining time: 32768 sec)
+        p20 = re.compile(r'^Re-Authentication Timeout : (?P<configured>\d+) sec '
+                         r'\(Remaining time: (?P<remaining_time>\d+) sec\)$')
+
         # Session Warning Time : Timer not running
+        p21 = re.compile(r'^Session Warning Time : (?P<session_warning_time>[\S ]+)$')
+
+        # Session Timeout : 1800 sec (Timer not running)
+        p21_1 = re.compile(r'^Session Timeout : (?P<session_timeout>[\S ]+)$')
+
         # Input Policy Name  : client-default
+        p22 = re.compile(r'^Input Policy Name +: (?P<input_policy_name>\S+)$')
+
         # Input Policy State : Installed
+        p23 = re.compile(r'^Input Policy State : (?P<input_policy_state>\S+)$')
+
         # Input Policy Source : QOS Internal Policy
+        p24 = re.compile(r'^Input Policy Source : (?P<input_policy_source>[\S ]+)$')
+
         # Output Policy Name  : client-default
+        p25 = re.compile(r'^Output Policy Name +: (?P<output_policy_name>\S+)$')
+
         # Output Policy State : Installed
+        p26 = re.compile(r'^Output Policy State : (?P<output_policy_state>\S+)$')
+
         # Output Policy Source : QOS Internal Policy
+        p27 = re.compile(r'^Output Policy Source : (?P<output_policy_source>[\S ]+)$')
+
         # WMM Support : Enabled
+        p28 = re.compile(r'^WMM Support : (?P<wmm_support>\S+)$')
+
         # U-APSD Support : Enabled
+        p29 = re.compile(r'^U-APSD Support : (?P<status>\S+)$')
+
         #   U-APSD value : 0
+        p29_1 = re.compile(r'^U-APSD value : (?P<u_apsd_value>\d+)$')
+
         #   APSD ACs    : BK, BE, VI, VO
-        # ...OUTPUT OMITTED...
+        p29_2 = re.compile(r'^APSD ACs +: (?P<apsd_acs>[\S ]+)$')
 
+        # Fastlane Support : Disabled
+        p30 = re.compile(r'^Fastlane Support : (?P<fastlane_support>\S+)$')
 
-        nearby_ap = ''
-        section_tracker = []
-        current_protocol = ''
-        client_mac_dict = {}
-        device_section = False
-        data_counter = 0
-        data_list = []
+        # Client Active State : In-Active
+        p31 = re.compile(r'^Client Active State : (?P<client_active_state>\S+)$')
 
-        # U-APSD Support : Enabled
-        p_uapsd = re.compile(r"^U-APSD\s+Support\s+:\s+(?P<status>\S+)$")
+        # Power Save : ON
+        p32 = re.compile(r'^Power Save : (?P<power_save>\S+)$')
 
-        # Client MAC Type : Universally Administered Address
-        p_client_mac_type = re.compile(r"^Client\s+MAC\s+Type\s+:\s+(?P<value>.*)$")
+        # Current Rate : 6.0
+        p33 = re.compile(r'^Current Rate : (?P<current_rate>[\S ]+)$')
 
-        # Connected For : 3233 seconds
-        p_connected = re.compile(r"^Connected\s+For\s+:\s+(?P<value>\d+)\s+seconds$")
+        # Supported Rates : 24.0,36.0,48.0,54.0
+        p34 = re.compile(r'^Supported Rates : (?P<supported_rates>\S+)$')
+
+        # AAA QoS Rate Limit Parameters:
+        #   QoS Average Data Rate Upstream             : 0 (kbps)
+        #   QoS Realtime Average Data Rate Upstream    : 0 (kbps)
+        #   QoS Burst Data Rate Upstream               : 0 (kbps)
+        #   QoS Realtime Burst Data Rate Upstream      : 0 (kbps)
+        #   QoS Average Data Rate Downstream           : 0 (kbps)
+        #   QoS Realtime Average Data Rate Downstream  : 0 (kbps)
+        #   QoS Burst Data Rate Downstream             : 0 (kbps)
+        #   QoS Realtime Burst Data Rate Downstream    : 0 (kbps)
+        p35 = re.compile(r'^QoS (?P<type>(Average|Realtime Average|Burst|Realtime Burst)) Data Rate '
+                         r'(?P<direction>(Upstream|Downstream)) +: (?P<rate>\d+) \(kbps\)$')
+
+        # Mobility:
+        #   Move Count                  : 0
+        #   Mobility Role               : Local
+        #   Mobility Roam Type          : None
+        #   Mobility Complete Timestamp : 10/22/2020 08:07:55 IST
+        p36 = re.compile(r'^Move Count +: (?P<move_count>\d+)$')
+        p36_1 = re.compile(r'^Mobility (?P<type>Role|Roam Type|Complete Timestamp) +: (?P<value>\S+$|[\S ]+$)')
 
-        # Protocol : 802.11n - 2.4 GHz
-        p_protocol = re.compile(r"^Protocol\s+:\s+(?P<value>.*)")
+        # Client Join Time:
+        #   Join Time Of Client : 10/22/2020 08:46:54 IST
+        p37 = re.compile(r'^Join Time Of Client : (?P<client_join_time>[\S ]+)$')
 
-        # Re-Authentication Timeout : 36000 sec (Remaining time: 32768 sec)
-        p_re_timer = re.compile(r"^Re-Authentication\s+Timeout\s+:\s+(?P<value>\d+)\s+sec\s+\(Remaining\s+time:\s+(?P<remain>\d+)\s+sec\)$")
+        # Client State Servers : None
+        p38 = re.compile(r'^Client State Servers : (?P<client_state_servers>\S+)$')
 
-        # Re-Authentication Timeout : 36000 sec (Timer not running)
-        p_re_timer_not_running = re.compile(r"^^Re-Authentication\s+Timeout\s+:\s+(?P<value>\d+)\s+sec\s+\(Timer\s+not\s+running\)$")
+        # Client ACLs : None
+        p39 = re.compile(r'^Client ACLs : (?P<client_acls>\S+)$')
 
-        # Authentication Algorithm : Open System
-        p_authen_algorithm = re.compile(r"^Authentication\s+Algorithm\s+:\s+(?P<value>.*)$")
+        # Policy Manager State: Webauth Pending
+        p40 = re.compile(r'^Policy Manager State: (?P<policy_manager_state>[\S ]+)$')
 
-        # Input Policy Source : QOS Internal Policy
-        p_input_policy_source = re.compile(r"^Input\s+Policy\s+Source\s+:\s+(?P<value>.*)$")
+        # Last Policy Manager State : IP Learn Complete
+        p41 = re.compile(r'^Last Policy Manager State : (?P<last_policy_manager_state>[\S ]+)$')
 
-        # Output Policy Source : QOS Internal Policy
-        p_output_policy_source = re.compile(r"^Output\s+Policy\s+Source\s+:\s+(?P<value>.*)$")
+        # Client Entry Create Time : 5572 seconds
+        p42 = re.compile(r'^Client Entry Create Time : (?P<client_entry_create_time_secs>\d+) seconds$')
 
-        # APSD ACs    : BK, BE, VI, VO
-        p_uapsd_ac = re.compile(r"^APSD\s+ACs\s+:\s+(?P<ac>.*)$")
+        # Policy Type : WPA2
+        p43 = re.compile(r'^Policy Type : (?P<policy_type>\S+)$')
 
-        # Mobility
-        p_mobility = re.compile(r"^Mobility:$")
+        # Encryption Cipher : CCMP (AES)
+        p44 = re.compile(r'^Encryption Cipher : (?P<encryption_cipher>[\S ]+)$')
 
-        # Mobility Complete Timestamp : 10/22/2020 08:07:55 IST
-        p_mobility_timestamp = re.compile(r"^Mobility\s+Complete\s+Timestamp\s+:\s+(?P<date>.*)$")
+        # Authentication Key Management : 802.1x
+        p45 = re.compile(r'^Authentication Key Management : (?P<authentication_key_management>\S+)$')
 
-        # Mobility Roam Type          : Unknown
-        p_mobility_roam = re.compile(r"^Mobility\s+Roam\s+Type\s+:\s+(?P<value>\S+)$")
+        # User Defined (Private) Network : Disabled
+        p46 = re.compile(r'^User Defined \(Private\) Network : (?P<user_defined_private_network>\S+)$')
 
-        # Supported Rates : 24.0,36.0,48.0,54.0
-        p_supported_rates = re.compile(r"^Supported\s+Rates\s+:\s+(?P<value>.*)$")
+        # User Defined (Private) Network Drop Unicast : Disabled
+        p46_1 = re.compile(r'^User Defined \(Private\) Network Drop Unicast : '
+                           r'(?P<user_defined_private_network_drop_unicast>\S+)$')
 
-        # Client Join Time:
-        p_client_join = re.compile(r"^Client\s+Join\s+Time:$")
+        # Encrypted Traffic Analytics : No
+        p47 = re.compile(r'^Encrypted Traffic Analytics : (?P<encrypted_traffic_analytics>\S+)$')
 
-        # Join Time Of Client : 10/22/2020 08:46:54 IST
-        p_client_join_time = re.compile(r"^Join\s+Time\s+Of\s+Client\s+:\s+(?P<date>.*)$")
+        # Protected Management Frame - 802.11w : No
+        p48 = re.compile(r'^Protected Management Frame - 802.11w : (?P<protected_management_frame>\S+)')
 
-        # Last Policy Manager State : IP Learn Complete
-        p_last_policy = re.compile(r"^Last\s+Policy\s+Manager\s+State\s+:\s+(?P<value>.*)$")
+        # EAP Type : PEAP
+        p49 = re.compile(r'^EAP Type : (?P<eap_type>[\S ]+)$')
 
-        # Client Entry Create Time : 5572 seconds
-        p_client_entry_create = re.compile(r"^Client\s+Entry\s+Create\s+Time\s+:\s+(?P<value>\d+)\s+seconds$")
+        # VLAN Override after Webauth : No
+        p50 = re.compile(r'^VLAN Override after Webauth : (?P<vlan_override_after_webauth>\S+)$')
 
-        # Encryption Cipher : CCMP (AES)
-        p_encryption_cipher = re.compile(r"Encryption\s+Cipher\s+:\s+(?P<value>.*)$")
+        # VLAN : b1-vg-data
+        p51 = re.compile(r'^VLAN +: (?P<vlan>\S+)$')
 
-        # EAP Type : Not Applicable
-        p_eap_type = re.compile(r"^EAP\s+Type\s+:\s+(?P<value>.*)$")
+        # Multicast VLAN : 0
+        p52 = re.compile(r'^Multicast VLAN : (?P<multicast_vlan>\d+)$')
 
         # WiFi Direct Capabilities:
-        p_wifi_capabilities = re.compile(r"WiFi\s+Direct\s+Capabilities:$")
+        #   WiFi Direct Capable           : No
+        p53 = re.compile(r'^WiFi Direct Capable +: (?P<wifi_direct_capable>\S+)$')
 
         # Central NAT : DISABLED
-        p_central_nat = re.compile(r"^Central\s+NAT\s+:\s+(?P<value>\S+)$")
+        p54 = re.compile(r'^Central NAT : (?P<central_nat>\S+)$')
 
         # Session Manager:
-        p_session = re.compile(r"^Session\s+Manager:")
+        p55 = re.compile(r'^Session Manager:$')
 
-        # Last Tried Aaa Server Details:
-        p_last_tried_aaa = re.compile(r"^Last\s+Tried\s+Aaa\s+Server\s+Details:")
+        #   Point of Attachment : capwap_00000aa1
+        p55_1 = re.compile(r'^Point of Attachment : (?P<point_of_attachment>\S+)$')
 
-        # Auth Method Status List
-        p_auth_method = re.compile(r"^Auth\s+Method\s+Status\s+List$")
+        #   IIF ID             : 0x00000AA1
+        p55_2 = re.compile(r'^IIF ID +: (?P<iif_id>\S+)$')
 
-        # Method : Dot1x
-        p_auth_method_check = re.compile(r"^Method\s+:\s+(?P<value>\S+)$")
+        #   Authorized         : TRUE
+        p55_3 = re.compile(r'^Authorized +: (?P<authorized>\S+)$')
 
-        # Local Policies:
-        p_local_policies = re.compile(r"^Local\s+Policies:$")
+        #   Session timeout    : 36000
+        # Not to be confused with "Session Timeout" which is captured by p22_1
+        p55_4 = re.compile(r'^Session timeout +: (?P<session_timeout>\S+)$')
 
-        # Service Template : wlan_svc_lizzard_b1_local (priority 254)
-        p_service_template = re.compile(r"^Service\s+Template\s+:\s+(?P<template>.*)$")
+        #   Common Session ID: B12A400A000007000000700A
+        p55_5 = re.compile(r'^Common Session ID: (?P<common_session_id>\S+)$')
 
-        # Server Policies:
-        p_server_policies = re.compile(r"^Server\s+Policies:$")
+        #   Acct Session ID  : 0x00005512
+        p55_6 = re.compile(r'^Acct Session ID +: (?P<acct_session_id>\S+)$')
+        #   Last Tried Aaa Server Details:
+        #   	Server IP : 10.11.12.13
+        p55_7 = re.compile(r'^Server IP +: (?P<server_ip>\S+)$')
 
-        # Resultant Policies:
-        p_resultant_policies = re.compile(r"^Resultant\s+Policies:$")
+        #   Auth Method Status List
+        #   	Method : Dot1x
+        p56 = re.compile(r'^Method : (?P<method>\S+)$')
 
-        # Client Capabilities
-        p_client_capabilities = re.compile(r"^Client\s+Capabilities$")
+        #   		SM State         : AUTHENTICATED
+        p56_1 = re.compile(r'^SM State +: (?P<sm_state>\S+)$')
 
-        # DNS Snooped IPv4 Addresses : None
-        p_dns_ipv4 = re.compile(r"^DNS\s+Snooped\s+IPv4\s+Addresses\s+:\s+(?P<value>\S+)$")
+        #   		SM Bend State    : IDLE
+        p56_2 = re.compile(r'^SM Bend State +: (?P<sm_bend_state>\S+)$')
+
+        #           Authen Status   : Success
+        p56_3 = re.compile(r'^Authen Status +: (?P<authen_status>\S+)$')
+
+        #   Local Policies:
+        #   	Service Template : wlan_service_template_local (priority 254)
+        p57 = re.compile(r'^Local Policies:$')
+        p57_1 = re.compile(r'^Service Template : (?P<service_template>[\S ]+)$')
+
+        #   Server Policies:
+        p58 = re.compile(r'^Server Policies:$')
+
+        #   Resultant Policies:
+        p59 = re.compile(r'^Resultant Policies:$')
 
+        #   		Vlan Group       : data-group
+        p60 = re.compile(r'^Vlan Group +: (?P<vlan_group>\S+)$')
+
+        #   		Absolute-Timer   : 36000
+        p61 = re.compile(r'^Absolute-Timer +: (?P<absolute_timer>\d+)$')
+
+        #   		Output SGT       : 000a-09
+        p62 = re.compile(r'^Output SGT +: (?P<output_sgt>\S+)$')
+
+        #   		VLAN Name        : b1-data-1
+        p63 = re.compile(r'^VLAN Name +: (?P<vlan_name>\S+)$')
+
+        #                 URL Redirect ACL : ACL_WEBAUTH_REDIRECT
+        p64 = re.compile(r'^URL Redirect ACL : (?P<url_redirect_acl>\S+)$')
+
+        #                 URL Redirect     : https://web.address:8443/portal/gateway
+        p65 = re.compile(r'URL Redirect +: (?P<url_redirect>\S+)$')
+
+        # DNS Snooped IPv4 Addresses : None
         # DNS Snooped IPv6 Addresses : None
-        p_dns_ipv6 = re.compile(r"^DNS\s+Snooped\s+IPv6\s+Addresses\s+:\s+(?P<value>\S+)$")
+        p66 = re.compile(r'^DNS Snooped (?P<ip_ver>(IPv4|IPv6)) Addresses : (?P<addresses>\S+)$')
+
+        # Client Capabilities
+        #   CF Pollable : Not implemented
+        p67 = re.compile(r'^CF Pollable : (?P<cf_pollable>[\S ]+)$')
 
-        # CF Pollable : Not implemented
-        p_cf_pollable = re.compile(r"^CF\s+Pollable\s+:\s+(?P<value>.*)$")
+        #   CF Poll Request : Not implemented
+        p67_1 = re.compile(r'^CF Poll Request : (?P<cf_poll_request>[\S ]+)$')
 
-        # CF Poll Request : Not implemented
-        p_cf_poll_request = re.compile(r"^CF\s+Poll\s+Request\s+:\s+(?P<value>.*)$")
+        #   Short Preamble : Not implemented
+        p67_2 = re.compile(r'^Short Preamble : (?P<short_preamble>[\S ]+)$')
 
-        # Short Preamble : Not implemented
-        p_short_preamble = re.compile(r"^Short\s+Preamble\s+:\s+(?P<value>.*)$")
+        #   PBCC : Not implemented
+        p67_3 = re.compile(r'^PBCC : (?P<pbcc>[\S ]+)$')
 
-        # PBCC : Not implemented
-        p_pbcc = re.compile(r"^PBCC\s+:\s+(?P<value>.*)$")
+        #   Channel Agility : Not implemented
+        p67_4 = re.compile(r'^Channel Agility : (?P<channel_agility>[\S ]+)$')
 
-        # Channel Agility : Not implemented
-        p_channel_agility = re.compile(r"Channel\s+Agility\s+:\s+(?P<value>.*)$")
+        #   Listen Interval : 0
+        p67_5 = re.compile(r'^Listen Interval : (?P<listen_interval>\d+)$')
 
         # Fast BSS Transition Details :
-        p_fast_bss = re.compile(r"^Fast\s+BSS\s+Transition\s+Details\s+:$")
+        #   Reassociation Timeout : 0
+        p68 = re.compile(r'^Reassociation Timeout : (?P<reassociation_timeout>\d+)$')
+
+        # 11v BSS Transition : Implemented
+        p69 = re.compile(r'^11v BSS Transition : (?P<bss_transition>[\S ]+)$')
+
+        # 11v DMS Capable : No
+        p70 = re.compile(r'^11v DMS Capable : (?P<dms_capable>\S+)$')
+
+        # QoS Map Capable : No
+        p71 = re.compile(r'^QoS Map Capable : (?P<qos_map_capable>\S+)$')
 
-        # Reassociation Timeout : 0
-        p_reassoc_timeout = re.compile(r"^Reassociation\s+Timeout\s+:\s+(?P<value>\d+)")
+        # FlexConnect Data Switching : N/A
+        # FlexConnect Dhcp Status : N/A
+        # FlexConnect Authentication : N/A
+        # FlexConnect Central Association : N/A
+        p72 = re.compile(r'^FlexConnect (?P<type>.+?) : (?P<value>\S+)$')
 
         # Client Statistics:
-        p_client_statistics = re.compile(r"^Client\s+Statistics:$")
+        #   Number of Bytes Received : 3083748
+        #   Number of Bytes Sent : 2063114
+        #   Number of Packets Received : 9048
+        #   Number of Packets Sent : 3686
+        # Client Statistics:
+        #   Number of Bytes Received : 3083748
+        #   Number of Bytes Sent : 2063114
+        #   Number of Packets Received : 9048
+        #   Number of Packets Sent : 3686
+        #   Number of Policy Errors : 0
+        p73 = re.compile(r'^Number of (?P<item>(Bytes|Packets)) (?P<direction>(Sent|Received)) ((to|from) Client )?: '
+                         r'(?P<value>\d+)$')
+
+        #   Number of Policy Errors : 0
+        p73_1 = re.compile(r'^Number of Policy Errors : (?P<number_of_policy_errors>\d+)$')
+
+        #   Radio Signal Strength Indicator : -84 dBm
+        p73_2 = re.compile(r'^Radio Signal Strength Indicator : (?P<rssi>[\d-]+) dBm$')
+
+        #   Signal to Noise Ratio : 10 dB
+        p73_3 = re.compile(r'Signal to Noise Ratio : (?P<snr>\d+) dB$')
 
         # Fabric status : Disabled
-        p_fabric_status = re.compile(r"^Fabric\s+status\s+:\s+(?P<value>\S+)$")
+        p74 = re.compile(r'^Fabric status : (?P<fabric_status>\S+)$')
 
         # Radio Measurement Enabled Capabilities
-        p_radio_measurement = re.compile(r"^Radio\s+Measurement\s+Enabled\s+Capabilities$")
+        #   Capabilities: Link Measurement, Neighbor Report, Repeated Measurements, Passive Beacon Measurement, RM MIB
+        p75 = re.compile(r'^Capabilities: (?P<capabilities>[\S ]+)$')
 
         # Client Scan Report Time : Timer not running
-        p_client_scan_report = re.compile(r"^Client\s+Scan\s+Report\s+Time\s+:\s+(?P<value>.*)")
+        p76 = re.compile(r'^Client Scan Report Time : (?P<client_scan_report_time>[\S ]+)$')
 
-        # Radio Signal Strength Indicator : -64 dBm
-        p_radio_strength = re.compile(r"^Radio\s+Signal\s+Strength\s+Indicator\s+:\s+(?P<value>\S+)\s+dBm$")
+        # Nearby AP Statistics:
+        #   prateekk_cos_1 (slot 1)
+        #   	antenna 0: 13 s ago	........ -25  dBm
+        #   	antenna 1: 13 s ago	........ -25  dBm
+        p77 = re.compile(r'^Nearby AP Statistics:$')
+        p77_1 = re.compile(r'^(?P<ap_name>\S+) \(slot (?P<slot>\d+)\)$')
+        p77_2 = re.compile(r'^antenna (?P<antenna>\d+): (?P<time>\d+) s ago\s\.+ (?P<rssi>[\d-]+) +dBm$')
 
-        # Signal to Noise Ratio : 30 dB
-        p_s2n = re.compile(r"^Signal\s+to\s+Noise\s+Ratio\s+:\s+(?P<value>\d+)\s+dB$")
+        # EoGRE : Pending Classification
+        p78 = re.compile(r'^EoGRE : (?P<eogre>[\S ]+)$')
 
-        # Capabilities: Link Measurement, Neighbor Report, Repeated Measurements, Passive Beacon Measurement, Active Beacon Measurement, Table Beacon Measurement, RM MIB
-        p_capabilities = re.compile(r"Capabilities:\s+(?P<value>.*)")
+        # Device Classification Information:
+        # Device Type      : Android
+        p79 = re.compile(r'^Device Type +: (?P<device_type>\S+)$')
 
-        # Client Scan Report Time : Timer not running
-        p_client_scan_report_no = re.compile(r"^Client\s+Scan\s+Report\s+Time\s+:\s+(?P<value>.*)$")
+        # Device Name      : android-dhcp-10
+        # Device Name      : MSFT 5.0
+        p79_1 = re.compile(r'^Device Name +: (?P<device_name>[\S ]+)$')
 
         # Protocol Map     : 0x000029  (OUI, DHCP, HTTP)
-        p_protocol_map = re.compile(r"Protocol\s+Map\s+:\s+(?P<value>.*)$")
+        p79_2 = re.compile(r'^Protocol Map +: (?P<protocol_map>[\S ]+)$')
 
         # Device OS        : Linux; U; Android 10; RMX1825 Build/QP1A.190711.020
-        p_device_os = re.compile(r"^Device\s+OS\s+:\s+(?P<value>.*)$")
+        p79_3 = re.compile(r'^Device OS +: (?P<device_os>.+?)$')
 
         # Type             : 12   12
-        p_device_type_data = re.compile(r"^Type\s+:\s+(?P<value>\d+\s+\d+)")
+        p79_4 = re.compile(r'^Type +: (?P<type>[\d ]+)$')
 
         # Data             : 0c
-        p_device_data_size = re.compile(r"^Data\s+:\s+(?P<value>\S{2})$")
+        p79_5 = re.compile(r'^Data +: (?P<data_size>[\da-f]+)$')
 
         # 00000000  00 0c 00 08 72 65 61 6c  6d 65 2d 33               |....realme-3    |
-        p_device_data = re.compile(r"^(?P<value>0000.*)$")
+        # 00000030  42 75 69 6c 64 2f 51 50  31 41 2e 31 39 30 37 31  |Build/QP1A.19071|
+        # 00000010  44 4a 30                                          |DJ0             |
+        p79_6 = re.compile(r'^(?P<byte>\d{8}) +(?P<hex>[\da-f ]+?) +(?P<piped>\|.+)$')
 
-        # Nearby AP Statistics:
-        p_nearby_ap = re.compile(r"^Nearby\s+AP\s+Statistics:$")
+        # Max Client Protocol Capability: 802.11ac Wave 2
+        p80 = re.compile(r'^Max Client Protocol Capability: (?P<max_client_protocol_capability>[\S ]+)$')
+
+        # Cellular Capability : N/A
+        p81 = re.compile(r'^Cellular Capability : (?P<cellular_capability>[\S ]+)$')
+
+        # Advanced Scheduling Requests Details:
+        #   Apple Specific Requests(ASR) Capabilities/Statistics:
+        #     Regular ASR support: DISABLED
+        p82 = re.compile(r'^Advanced Scheduling Requests Details:$')
+        p82_1 = re.compile(r'^(?P<request_type>Apple Specific Requests.+?):$')
+        p82_2 = re.compile(r'^Regular ASR support: (?P<regular_asr_support>\S+)$')
+
+        ret_dict = {}
+        local_policies, server_policies, resultant_policies = None, None, None
+        device_info = None
+        data_index = None
+        for line in output.splitlines():
+            line = line.strip()
 
-        # b1-72-cap16 (slot 0)
-        p_ap = re.compile(r"^(?P<name>.*)\s+\((?P<slot>slot\s+\d+)\)$")
+            # Client Mac Address : abcd:1234:dcba
+            # Client IPv6 Addresses : fe80::1
+            m = p0.match(line)
+            if m:
+                address_type = m.groupdict()['address_type'].lower()
+                address = m.groupdict()['address']
 
-        # antenna 0: 0 s ago	........ -62  dBm
-        p_ant_0 = re.compile(r"^(?P<ant>\S+\s+\d+):\s+(?P<sec>\d+)\s+s\s+ago\s+........\s+(?P<value>\S+)\s+dBm$")
+                if address_type == "ipv6":
+                    ret_dict.update({f"client_{address_type}_addresses": address})
+                else:
+                    ret_dict.update({f"client_{address_type}_address": address})
+                continue
 
-        # EoGRE : Pending Classification
-        p_eogre = re.compile(r"^EoGRE\s+:\s+(?P<value>.*)$")
+            # Client MAC Type : Locally Administered Address
+            m = p1.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
 
-        # Device Type      : Android
-        p_device_type = re.compile(r"^Device\s+Type\s+:\s+(?P<value>\S+)$")
+            # Client Username : j_doe
+            m = p2.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
 
-        # Device Name      : android-dhcp-10
-        p_device_name = re.compile(r"^Device\s+Name\s+:\s+(?P<value>.*)$")
+            # AP MAC Address : bead:4321:dead
+            m = p3.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
 
-        # Max Client Protocol Capability: 802.11ac Wave 2
-        p_max_client_protocol_capability = re.compile(r"^Max\s+Client\s+Protocol\s+Capability:\s+(?P<value>.*)$")
+            # AP Name: ap1
+            m = p4.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
 
-        # [key] : [value]
-        p_colon_split = re.compile(r"^(?P<key>[\S\s]+\S)\s*: +(?P<value>\S+)$")
+            # AP slot : 0
+            m = p5.match(line)
+            if m:
+                ret_dict.update({"ap_slot": int(m.groupdict()['ap_slot'])})
+                continue
 
+            # Client State : Associated
+            m = p6.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
 
-        for line in output.splitlines():
-            line = line.strip()
-            if p_uapsd.match(line):
-                # U-APSD Support : Enabled
-                match = p_uapsd.match(line)
-                client_mac_dict.update({ "u_apsd_support": {} })
-                client_mac_dict["u_apsd_support"].update({ "status": match.group("status")})
-                section_tracker.append("u_apsd_support")
-                continue
-            elif p_connected.match(line):
-                # Connected For : 3233 seconds
-                match = p_connected.match(line)
-                client_mac_dict.update({ "connected_for_seconds": int(match.group("value")) })
-                continue
-            elif p_client_mac_type.match(line):
-                # Client MAC Type : Universally Administered Address
-                match = p_client_mac_type.match(line)
-                client_mac_dict.update({ "client_mac_type": match.group("value")})
-                continue
-            elif p_protocol.match(line) and device_section == False:
-                # Protocol : 802.11n - 2.4 GHz
-                match = p_protocol.match(line)
-                client_mac_dict.update({ "protocol": match.group("value")})
-                device_section = True
-                continue
-            elif p_authen_algorithm.match(line):
-                # Authentication Algorithm : Open System
-                match = p_authen_algorithm.match(line)
-                client_mac_dict.update({ "authentication_alogrithm": match.group("value")})
-                continue
-            elif p_re_timer.match(line):
-                # Re-Authentication Timeout : 36000 sec (Remaining time: 32768 sec)
-                match = p_re_timer.match(line)
-                client_mac_dict.update({ "re_authentication_timeout_secs": {} })
-                client_mac_dict["re_authentication_timeout_secs"].update({ "configured": int(match.group("value")) })
-                client_mac_dict["re_authentication_timeout_secs"].update({ "remaining_time": int(match.group("remain")) })
-                continue
-            elif p_re_timer_not_running.match(line):
-                # Re-Authentication Timeout : 36000 sec (Timer not running)
-                match = p_re_timer_not_running.match(line)
-                client_mac_dict.update({ "re_authentication_timeout_secs": {} })
-                client_mac_dict["re_authentication_timeout_secs"].update({ "configured": int(match.group("value")) })
-                client_mac_dict["re_authentication_timeout_secs"].update({ "remaining_time": "timer not running" })
-                continue
-            elif p_input_policy_source.match(line):
-                # Input Policy Source : QOS Internal Policy
-                match = p_input_policy_source.match(line)
-                client_mac_dict.update({ "input_policy_source": match.group("value") })
-                continue
-            elif p_output_policy_source.match(line):
-                # Output Policy Source : QOS Internal Policy
-                match = p_output_policy_source.match(line)
-                client_mac_dict.update({ "output_policy_source": match.group("value") })
-                continue
-            elif p_supported_rates.match(line):
-                # Supported Rates : 24.0,36.0,48.0,54.0
-                match = p_supported_rates.match(line)
-                rates_list = [float(x.strip()) for x in match.group("value").split(',')]
-                client_mac_dict.update({ "supported_rates": rates_list })
-            elif p_uapsd_ac.match(line):
-                # APSD ACs    : BK, BE, VI, VO
-                section_tracker.pop()
-                match = p_uapsd_ac.match(line)
-                ac_list = [x.strip() for x in match.group("ac").split(',')]
-                client_mac_dict["u_apsd_support"].update({ "apsd_acs": ac_list })
+            # Policy Profile : profile_1
+            m = p7.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
                 continue
-            elif p_mobility.match(line):
-                # Mobility:
-                client_mac_dict.update({ "mobility": {} })
-                section_tracker.append("mobility")
+
+            # Flex Profile : N/A
+            m = p8.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
                 continue
-            elif p_client_join.match(line):
-                # Client Join Time:
-                client_mac_dict.update({ "client_join_time": {} })
-                section_tracker.append("client_join_time")
+
+            # Wireless LAN Id: 20
+            m = p9.match(line)
+            if m:
+                ret_dict.update({"wireless_lan_id": int(m.groupdict()['wireless_lan_id'])})
                 continue
-            elif p_client_join_time.match(line):
-                # Join Time Of Client : 10/22/2020 08:46:54 IST
-                section_tracker.pop()
-                match = p_client_join_time.match(line)
-                client_mac_dict["client_join_time"] = match.group("date")
+
+            # WLAN Profile Name: global_profile
+            m = p10.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
                 continue
-            elif p_eap_type.match(line):
-                # EAP Type : Not Applicable
-                match = p_eap_type.match(line)
-                client_mac_dict.update({ "eap_type" : match.group("value") })
+
+            # Wireless LAN Network Name (SSID): legitimate-wifi
+            m = p11.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
                 continue
-            elif p_mobility_timestamp.match(line):
-                # Mobility Complete Timestamp : 10/22/2020 08:07:55 IST
-                match = p_mobility_timestamp.match(line)
-                client_mac_dict["mobility"].update({ "mobility_complete_timestamp": match.group("date") })
+
+            # BSSID : 70b3.18ff.f478
+            m = p12.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
                 continue
-            elif p_mobility_roam.match(line):
-                # Mobility Roam Type          : Unknown
-                section_tracker.pop()
-                match = p_mobility_roam.match(line)
-                client_mac_dict["mobility"].update({ "mobility_roam_type": match.group("value") })
-                continue
-            elif p_last_policy.match(line):
-                # Last Policy Manager State : IP Learn Complete
-                match = p_last_policy.match(line)
-                client_mac_dict.update({ "last_policy_manager_state": match.group("value") })
-                continue
-            elif p_client_entry_create.match(line):
-                # Client Entry Create Time : 5572 seconds
-                match = p_client_entry_create.match(line)
-                client_mac_dict.update({ "client_entry_create_time_secs": int(match.group("value")) })
-                continue
-            elif p_encryption_cipher.match(line):
-                # Encryption Cipher : CCMP (AES)
-                match = p_encryption_cipher.match(line)
-                client_mac_dict.update({ "encryption_cipher": match.group("value") })
-                continue
-            elif p_wifi_capabilities.match(line):
-                # WiFi Direct Capabilities:
-                client_mac_dict.update({ "wifi_direct_capabilities": {} })
-                section_tracker.append("wifi_direct_capabilities")
-                continue
-            elif p_central_nat.match(line):
-                # Central NAT : DISABLED
-                match = p_central_nat.match(line)
-                client_mac_dict.update({ "central_nat": match.group("value") })
-                continue
-            elif p_session.match(line):
-                # Session Manager:
-                section_tracker.pop()
-                client_mac_dict.update({ "session_manager": {} })
-                section_tracker.append("session_manager")
-                continue
-            elif p_last_tried_aaa.match(line):
-                # Last Tried Aaa Server Details:
-                client_mac_dict["session_manager"].update({"last_tried_aaa_server_details": {} })
-                section_tracker.append("last_tried_aaa_server_details")
-                continue
-            elif p_dns_ipv4.match(line):
-                # DNS Snooped IPv4 Addresses : None
-                match = p_dns_ipv4.match(line)
-                client_mac_dict.update({ "dns_snooped_ipv4_addresses": match.group("value") })
-                continue
-            elif p_dns_ipv6.match(line):
-                # DNS Snooped IPv6 Addresses : None
-                match = p_dns_ipv6.match(line)
-                client_mac_dict.update({ "dns_snooped_ipv6_addresses": match.group("value") })
-                continue
-            elif p_auth_method.match(line):
-                # Auth Method Status List
-                section_tracker.pop()
-                client_mac_dict["session_manager"].update({ "auth_method_status_list": {"method": {} }})
-                section_tracker.append("auth_method_status_list")
-                section_tracker.append("method")
-                continue
-            elif p_auth_method_check.match(line):
-                # Method : Dot1x
-                match = p_auth_method_check.match(line)
-                auth_method = match.group("value")
-                client_mac_dict["session_manager"]["auth_method_status_list"]["method"].update({ auth_method: {} })
-                section_tracker.append(auth_method)
-                continue
-            elif p_local_policies.match(line):
-                # Local Policies:
-                section_tracker.pop()
-                section_tracker.pop()
-                section_tracker.pop()
-                client_mac_dict["session_manager"].update({ "local_policies": {"service_template": {} } })
-                section_tracker.append("local_policies")
-                section_tracker.append("service_template")
-                continue
-            elif p_service_template.match(line):
-                # Service Template : wlan_svc_lizzard_b1_local (priority 254)
-                match = p_service_template.match(line)
-                template = match.group("template")
-                client_mac_dict["session_manager"]["local_policies"]["service_template"].update({ template: {} })
-                section_tracker.append(template)
-                continue
-            elif p_server_policies.match(line):
-                # Server Policies:
-                section_tracker.pop()
-                section_tracker.pop()
-                section_tracker.pop()
-                client_mac_dict["session_manager"].update({ "server_policies": {} })
-                section_tracker.append("server_policies")
+
+            # Connected For : 3233 seconds
+            m = p13.match(line)
+            if m:
+                ret_dict.update({"connected_for_seconds": int(m.groupdict()['connected_for_seconds'])})
                 continue
-            elif p_resultant_policies.match(line):
-                # Resultant Policies:
-                section_tracker.pop()
-                client_mac_dict["session_manager"].update({ "resultant_policies": {} })
-                section_tracker.append("resultant_policies")
+
+            # Protocol : 802.11n - 2.4 GHz
+            # Protocol         : DHCP
+            m = p14.match(line)
+            if m:
+                if device_info:
+                    protocol_dict = device_info_dict.setdefault("protocols", {}). \
+                        setdefault(m.groupdict()['protocol'], {})
+                    data_index = None
+                    continue
+                ret_dict.update(m.groupdict())
                 continue
-            elif p_client_capabilities.match(line):
-                # Client Capabilities
-                section_tracker.pop()
-                section_tracker.pop()
-                client_mac_dict.update({ "client_capabilities": {} })
-                section_tracker.append("client_capabilities")
-                continue
-            elif p_cf_pollable.match(line):
-                # CF Pollable : Not implemented
-                match = p_cf_pollable.match(line)
-                client_mac_dict["client_capabilities"].update({ "cf_pollable": match.group("value") })
-                continue
-            elif p_cf_poll_request.match(line):
-                # CF Poll Request : Not implemented
-                match = p_cf_poll_request.match(line)
-                client_mac_dict["client_capabilities"].update({ "cf_poll_request": match.group("value") })
-                continue
-            elif p_short_preamble.match(line):
-                # Short Preamble : Not implemented
-                match = p_short_preamble.match(line)
-                client_mac_dict["client_capabilities"].update({ "short_preamble": match.group("value") })
-                continue
-            elif p_channel_agility.match(line):
-                # Channel Agility : Not implemented
-                match = p_channel_agility.match(line)
-                client_mac_dict["client_capabilities"].update({ "channel_agility": match.group("value") })
-                continue
-            elif p_pbcc.match(line):
-                # Listen Interval : 0
-                match = p_pbcc.match(line)
-                client_mac_dict["client_capabilities"].update({ "pbcc": match.group("value") })
-                continue
-            elif p_fast_bss.match(line):
-                # Fast BSS Transition Details :
-                section_tracker.pop()
-                client_mac_dict.update({ "fast_bss_transition_details": {} })
-                continue
-            elif p_reassoc_timeout.match(line):
-                # Reassociation Timeout : 0
-                match = p_reassoc_timeout.match(line)
-                client_mac_dict["fast_bss_transition_details"].update({ "reassociation_timeout": int(match.group("value"))})
-            elif p_client_statistics.match(line):
-                # Client Statistics:
-                client_mac_dict.update({"client_statistics": {} })
-                section_tracker.append("client_statistics")
-                continue
-            elif p_fabric_status.match(line):
-                # Fabric status : Disabled
-                match = p_fabric_status.match(line)
-                client_mac_dict.update({ "fabric_status": match.group("value") })
-                continue
-            elif p_radio_measurement.match(line):
-                # Radio Measurement Enabled Capabilities
-                section_tracker.pop()
-                client_mac_dict.update({ "radio_measurement_enabled_capabilities": {} })
-                continue
-            elif p_capabilities.match(line):
-                # Capabilities: Link Measurement, Neighbor Report, Repeated Measurements, Passive Beacon Measurement, Active Beacon Measurement, Table Beacon Measurement, RM MIB
-                match = p_capabilities.match(line)
-                cap_list = [x.strip() for x in match.group("value").split(",")]
-                client_mac_dict["radio_measurement_enabled_capabilities"].update({ "capabilities": cap_list })
-                continue
-            elif p_radio_strength.match(line):
-                # Radio Signal Strength Indicator : -84 dBm
-                match = p_radio_strength.match(line)
-                client_mac_dict["client_statistics"].update({ "radio_signal_strength_indicator_dbm": int(match.group("value")) })
-                continue
-            elif p_s2n.match(line):
-                # Signal to Noise Ratio : 30 dB
-                match = p_s2n.match(line)
-                client_mac_dict["client_statistics"].update({ "signal_to_noise_ration_db": int(match.group("value")) })
-                continue
-            elif p_nearby_ap.match(line):
-                # Nearby AP Statistics:
-                client_mac_dict.update({ "nearby_ap_statistics": { "ap_names": {} }})
-                continue
-            elif p_ap.match(line):
-                # b1-72-cap16 (slot 0)
-                match = p_ap.match(line)
-                nearby_ap = match.group("name") + " (" + match.group("slot") + ")"
-                client_mac_dict["nearby_ap_statistics"]["ap_names"].update({ nearby_ap: {} })
-                client_mac_dict["nearby_ap_statistics"]["ap_names"][nearby_ap].update({ "antenna": {} })
-                continue
-            elif p_ant_0.match(line):
-                # antenna 0: 0 s ago	........ -62  dBm
-                match = p_ant_0.match(line)
-                antenna = match.group("ant")
-                client_mac_dict["nearby_ap_statistics"]["ap_names"][nearby_ap]["antenna"].update({ antenna: {} })
-                client_mac_dict["nearby_ap_statistics"]["ap_names"][nearby_ap]["antenna"][antenna].update({ "seconds_ago": int(match.group("sec")) })
-                client_mac_dict["nearby_ap_statistics"]["ap_names"][nearby_ap]["antenna"][antenna].update({ "dbm": int(match.group("value")) })
-                continue
-            elif p_eogre.match(line):
-                # EoGRE : Pending Classification
-                match = p_eogre.match(line)
-                client_mac_dict.update({ "eogre": match.group("value") })
-                continue
-            elif p_device_type.match(line):
-                # Device Type      : Android
-                match = p_device_type.match(line)
-                client_mac_dict.setdefault("device_info", {} )
-                client_mac_dict["device_info"].update({ "device_type": match.group("value") })
-                continue
-            elif p_device_name.match(line):
-                # Device Name      : android-dhcp-10
-                match = p_device_name.match(line)
-                client_mac_dict["device_info"].update({ "device_name": match.group("value") })
-                continue
-            elif p_client_scan_report_no.match(line):
-                # Client Scan Report Time : Timer not running
-                match = p_client_scan_report_no.match(line)
-                client_mac_dict.update({ "client_scan_report_time": match.group("value") })
-                continue
-            elif p_protocol_map.match(line):
-                # Protocol Map     : 0x000029  (OUI, DHCP, HTTP)
-                match = p_protocol_map.match(line)
-                client_mac_dict["device_info"].update({ "protocol_map": match.group("value") })
-                continue
-            elif p_device_os.match(line):
-                # Device OS        : Linux; U; Android 10; RMX1825 Build/QP1A.190711.020`
-                match = p_device_os.match(line)
-                client_mac_dict["device_info"].update({ "device_os" : match.group("value") })
-                continue
-            elif p_protocol.match(line) and device_section == True:
-                # Protocol         : DHCP
-                data_counter = 0
-                match = p_protocol.match(line)
-                current_protocol = match.group("value")
-                client_mac_dict["device_info"].setdefault("protocols", {} )
-                client_mac_dict["device_info"]["protocols"].update({ current_protocol: {} })
-                device_section = True
-                continue
-            elif p_device_type_data.match(line):
-                # Type             : 12   12
-                data_counter += 1
-                data_list = []
-                match = p_device_type_data.match(line)
-                client_mac_dict["device_info"]["protocols"][current_protocol].update({ data_counter: {} })
-                client_mac_dict["device_info"]["protocols"][current_protocol][data_counter].update({ "type": match.group("value") })
-                continue
-            elif p_device_data_size.match(line):
-                # Data             : 0c
-                match = p_device_data_size.match(line)
-                client_mac_dict["device_info"]["protocols"][current_protocol][data_counter].update({ "data_size": match.group("value") })
-                continue
-            elif p_device_data.match(line):
-                # 00000000  00 0c 00 08 72 65 61 6c  6d 65 2d 33               |....realme-3    |
-                match = p_device_data.match(line)
-                data_list.append(match.group("value"))
-                client_mac_dict["device_info"]["protocols"][current_protocol][data_counter].update({ "data": data_list })
-                continue
-            elif p_max_client_protocol_capability.match(line):
-                # Max Client Protocol Capability: 802.11ac Wave 2
-                match = p_max_client_protocol_capability.match(line)
-                client_mac_dict.update({ "max_client_protocol_capability": match.group("value") })
+
+            # Device Protocol  : DHCP
+            m = p14_1.match(line)
+            if m:
+                if device_info:
+                    protocol_dict = device_info_dict.setdefault("protocols", {}). \
+                        setdefault(m.groupdict()['protocol'], {})
+                    data_index = None
                 continue
-            elif p_colon_split.match(line):
-                # [key] : [value]
-                match = p_colon_split.match(line)
-                group = match.groupdict()
 
-                if group["key"][-1] == ")":
-                    group["key"] = group["key"][:-1]
+            # Channel : 6
+            m = p15.match(line)
+            if m:
+                ret_dict.update({"channel": int(m.groupdict()['channel'])})
+                continue
 
-                group["key"] = group["key"].replace(" ", "_").replace("-", "_").replace("(", "_").replace(")", "_").replace("__", "_").lower()
-                group["value"] = self.change_data_type(group["value"])
+            # Client IIF-ID : 0xa0000001
+            m = p16.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Association Id : 1
+            m = p17.match(line)
+            if m:
+                ret_dict.update({"association_id": int(m.groupdict()['association_id'])})
+                continue
+
+            # Authentication Algorithm : Open System
+            m = p18.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Idle state timeout : N/A
+            m = p19.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Re-Authentication Timeout : 36000 sec (Remaining time: 32768 sec)
+            m = p20.match(line)
+            if m:
+                reauthentication_dict = ret_dict.setdefault("re_authentication_timeout_secs", {})
+                reauthentication_dict.update({
+                    "configured": int(m.groupdict()['configured']),
+                    "remaining_time": int(m.groupdict()['remaining_time'])
+                })
+                continue
+
+            # Session Warning Time : Timer not running
+            m = p21.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Session Timeout : 1800 sec (Timer not running)
+            m = p21_1.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Input Policy Name  : client-default
+            m = p22.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Input Policy State : Installed
+            m = p23.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Input Policy Source : QOS Internal Policy
+            m = p24.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Output Policy Name  : client-default
+            m = p25.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Output Policy State : Installed
+            m = p26.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Output Policy Source : QOS Internal Policy
+            m = p27.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # WMM Support : Enabled
+            m = p28.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # U-APSD Support : Enabled
+            m = p29.match(line)
+            if m:
+                u_apsd_dict = ret_dict.setdefault("u_apsd_support", {})
+                u_apsd_dict.update({"status": m.groupdict()['status']})
+                continue
+
+            #   U-APSD value : 0
+            m = p29_1.match(line)
+            if m:
+                u_apsd_dict.update({"u_apsd_value": int(m.groupdict()['u_apsd_value'])})
+                continue
+
+            #   APSD ACs    : BK, BE, VI, VO
+            m = p29_2.match(line)
+            if m:
+                apsd_acs = m.groupdict()['apsd_acs'].split(', ')
+                u_apsd_dict.update({"apsd_acs": apsd_acs})
+                continue
+
+            # Fastlane Support : Disabled
+            m = p30.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Client Active State : In-Active
+            m = p31.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Power Save : ON
+            m = p32.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Current Rate : 6.0
+            m = p33.match(line)
+            if m:
+                try:
+                    current_rate = float(m.groupdict()['current_rate'])
+                except ValueError:
+                    current_rate = m.groupdict()['current_rate']
+                ret_dict.update({"current_rate": current_rate})
+                continue
+
+            # Supported Rates : 24.0,36.0,48.0,54.0
+            m = p34.match(line)
+            if m:
+                supported_rates = [float(rate) for rate in m.groupdict()['supported_rates'].split(',')]
+                ret_dict.update({"supported_rates": supported_rates})
+                continue
+
+            # AAA QoS Rate Limit Parameters:
+            #   QoS Average Data Rate Upstream             : 0 (kbps)
+            #   QoS Realtime Average Data Rate Upstream    : 0 (kbps)
+            #   QoS Burst Data Rate Upstream               : 0 (kbps)
+            #   QoS Realtime Burst Data Rate Upstream      : 0 (kbps)
+            #   QoS Average Data Rate Downstream           : 0 (kbps)
+            #   QoS Realtime Average Data Rate Downstream  : 0 (kbps)
+            #   QoS Burst Data Rate Downstream             : 0 (kbps)
+            #   QoS Realtime Burst Data Rate Downstream    : 0 (kbps)
+            m = p35.match(line)
+            if m:
+                qos_rate_limit_dict = ret_dict.setdefault("aaa_qos_rate_limit_parameters", {})
+
+                group = {k: v.lower() for k, v in m.groupdict().items()}
+                limit_type = f"qos_{group['type'].replace(' ', '_')}_data_rate_kbps"
+
+                if group['direction'] == "upstream":
+                    qos_upstream_dict = qos_rate_limit_dict.setdefault("upstream", {})
+                    qos_upstream_dict.update({limit_type: int(group['rate'])})
+                elif group['direction'] == "downstream":
+                    qos_downstream_dict = qos_rate_limit_dict.setdefault("downstream", {})
+                    qos_downstream_dict.update({limit_type: int(group['rate'])})
+                continue
+
+            # Mobility:
+            #   Move Count                  : 0
+            m = p36.match(line)
+            if m:
+                mobility_dict = ret_dict.setdefault("mobility", {})
+                mobility_dict.update({"move_count": int(m.groupdict()['move_count'])})
+                continue
+
+            #   Mobility Role               : Local
+            #   Mobility Roam Type          : None
+            #   Mobility Complete Timestamp : 10/22/2020 08:07:55 IST
+            m = p36_1.match(line)
+            if m:
+                type = m.groupdict()['type'].lower().replace(' ', '_')
+                mobility_dict.update({f"mobility_{type}": m.groupdict()['value']})
+                continue
+
+            # Client Join Time:
+            #   Join Time Of Client : 10/22/2020 08:46:54 IST
+            m = p37.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Client State Servers : None
+            m = p38.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Client ACLs : None
+            m = p39.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Policy Manager State: Webauth Pending
+            m = p40.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Last Policy Manager State : IP Learn Complete
+            m = p41.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Client Entry Create Time : 5572 seconds
+            m = p42.match(line)
+            if m:
+                ret_dict.update({"client_entry_create_time_secs": int(m.groupdict()['client_entry_create_time_secs'])})
+                continue
+
+            # Policy Type : WPA2
+            m = p43.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Encryption Cipher : CCMP (AES)
+            m = p44.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
 
-                if group["key"] == "data":
+            # Authentication Key Management : 802.1x
+            m = p45.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # User Defined (Private) Network : Disabled
+            m = p46.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # User Defined (Private) Network Drop Unicast : Disabled
+            m = p46_1.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Encrypted Traffic Analytics : No
+            m = p47.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Protected Management Frame - 802.11w : No
+            m = p48.match(line)
+            if m:
+                ret_dict.update({"protected_management_frame__802.11w": m.groupdict()['protected_management_frame']})
+                continue
+
+            # EAP Type : PEAP
+            m = p49.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # VLAN Override after Webauth : No
+            m = p50.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # VLAN : b1-vg-data
+            # VLAN             : 20
+            m = p51.match(line)
+            if m:
+                try:
+                    vlan = int(m.groupdict()['vlan'])
+                except ValueError:
+                    vlan = m.groupdict()['vlan']
+                if local_policies:
+                    local_policies_dict.update({"vlan": vlan})
+                elif server_policies:
+                    server_policies_dict.update({"vlan": vlan})
+                elif resultant_policies:
+                    resultant_policies_dict.update({"vlan": vlan})
+                else:
+                    ret_dict.update({"vlan": vlan})
+                continue
+
+            # Multicast VLAN : 0
+            m = p52.match(line)
+            if m:
+                ret_dict.update({"multicast_vlan": int(m.groupdict()['multicast_vlan'])})
+                continue
+
+            # WiFi Direct Capabilities:
+            #   WiFi Direct Capable           : No
+            m = p53.match(line)
+            if m:
+                wifi_direct_dict = ret_dict.setdefault("wifi_direct_capabilities", {})
+                wifi_direct_dict.update(m.groupdict())
+                continue
+
+            # Central NAT : DISABLED
+            m = p54.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Session Manager:
+            m = p55.match(line)
+            if m:
+                session_dict = ret_dict.setdefault("session_manager", {})
+                continue
+
+            #   Point of Attachment : capwap_00000aa1
+            m = p55_1.match(line)
+            if m:
+                session_dict.update(m.groupdict())
+                continue
+
+            #   IIF ID             : 0x00000AA1
+            m = p55_2.match(line)
+            if m:
+                session_dict.update(m.groupdict())
+                continue
+
+            #   Authorized         : TRUE
+            m = p55_3.match(line)
+            if m:
+                session_dict.update(m.groupdict())
+                continue
+
+            #   Session timeout    : 36000
+            m = p55_4.match(line)
+            if m:
+                session_dict.update({"session_timeout": int(m.groupdict()['session_timeout'])})
+                continue
+
+            #   Common Session ID: B12A400A000007000000700A
+            m = p55_5.match(line)
+            if m:
+                session_dict.update(m.groupdict())
+                continue
+
+            #   Acct Session ID  : 0x00005512
+            m = p55_6.match(line)
+            if m:
+                session_dict.update(m.groupdict())
+                continue
+
+            #   Last Tried Aaa Server Details:
+            #   	Server IP : 10.11.12.13
+            m = p55_7.match(line)
+            if m:
+                session_dict.update({"last_tried_aaa_server_details": m.groupdict()})
+                continue
+
+            #   Auth Method Status List
+            #   	Method : Dot1x
+            m = p56.match(line)
+            if m:
+                auth_method_status_dict = session_dict.setdefault("auth_method_status_list", {}). \
+                    setdefault('method', {}).setdefault(m.groupdict()['method'], {})
+                continue
+
+            #   		SM State         : AUTHENTICATED
+            m = p56_1.match(line)
+            if m:
+                auth_method_status_dict.update(m.groupdict())
+                continue
+
+            #   		SM Bend State    : IDLE
+            m = p56_2.match(line)
+            if m:
+                auth_method_status_dict.update(m.groupdict())
+                continue
+
+            #           Authen Status   : Success
+            m = p56_3.match(line)
+            if m:
+                auth_method_status_dict.update(m.groupdict())
+                continue
+
+            #   Local Policies:
+            if p57.match(line):
+                local_policies_dict = session_dict.setdefault("local_policies", {}).setdefault("service_template", {})
+                local_policies = True
+                continue
+
+            #   	Service Template : wlan_service_template_local (priority 254)
+            m = p57_1.match(line)
+            if m:
+                local_policies_dict = local_policies_dict.setdefault(m.groupdict()['service_template'], {})
+                continue
+
+            #   Server Policies:
+            if p58.match(line):
+                server_policies_dict = session_dict.setdefault("server_policies", {})
+                local_policies = None
+                server_policies = True
+                continue
+
+            #   Resultant Policies:
+            if p59.match(line):
+                resultant_policies_dict = session_dict.setdefault("resultant_policies", {})
+                server_policies = None
+                resultant_policies = True
+                continue
+
+            #   		Vlan Group       : data-group
+            m = p60.match(line)
+            if m:
+                if local_policies:
+                    local_policies_dict.update(m.groupdict())
+                    continue
+                if resultant_policies:
+                    resultant_policies_dict.update(m.groupdict())
                     continue
 
-                if len(section_tracker) == 0:
-                    client_mac_dict.update({ group["key"]: group["value"] })
-                elif len(section_tracker) == 1:
-                    client_mac_dict[section_tracker[-1]].update({ group["key"]: group["value"] })
-                elif len(section_tracker) == 2:
-                    client_mac_dict[section_tracker[-2]][section_tracker[-1]].update({ group["key"]: group["value"] })
-                elif len(section_tracker) == 3:
-                    client_mac_dict[section_tracker[-3]][section_tracker[-2]][section_tracker[-1]].update({ group["key"]: group["value"] })
-                elif len(section_tracker) == 4:
-                    client_mac_dict[section_tracker[-4]][section_tracker[-3]][section_tracker[-2]][section_tracker[-1]].update({ group["key"]: group["value"] })
+            #   		Absolute-Timer   : 36000
+            m = p61.match(line)
+            if m:
+                if local_policies:
+                    local_policies_dict.update({"absolute_timer": int(m.groupdict()['absolute_timer'])})
+                    continue
+                if resultant_policies:
+                    resultant_policies_dict.update({"absolute_timer": int(m.groupdict()['absolute_timer'])})
+                    continue
+
+            #   		Output SGT       : 000a-09
+            m = p62.match(line)
+            if m:
+                if server_policies:
+                    server_policies_dict.update(m.groupdict())
+                    continue
+                if resultant_policies:
+                    resultant_policies_dict.update(m.groupdict())
+                    continue
+
+            #   		VLAN Name        : b1-data-1
+            m = p63.match(line)
+            if m:
+                resultant_policies_dict.update(m.groupdict())
+                continue
+
+            #                 URL Redirect ACL : ACL_WEBAUTH_REDIRECT
+            m = p64.match(line)
+            if m:
+                if server_policies:
+                    server_policies_dict.update(m.groupdict())
+                    continue
+                if resultant_policies:
+                    resultant_policies_dict.update(m.groupdict())
+                    continue
+
+            #                 URL Redirect     : https://web.address:8443/portal/gateway
+            m = p65.match(line)
+            if m:
+                if server_policies:
+                    server_policies_dict.update(m.groupdict())
+                    continue
+                if resultant_policies:
+                    resultant_policies_dict.update(m.groupdict())
+                    continue
+
+            # DNS Snooped IPv4 Addresses : None
+            # DNS Snooped IPv6 Addresses : None
+            m = p66.match(line)
+            if m:
+                ip_version = m.groupdict()['ip_ver'].lower()
+                ret_dict.update({f"dns_snooped_{ip_version}_addresses": m.groupdict()['addresses']})
+                continue
+
+            # Client Capabilities
+            #   CF Pollable : Not implemented
+            m = p67.match(line)
+            if m:
+                client_capabilites_dict = ret_dict.setdefault("client_capabilities", {})
+                client_capabilites_dict.update(m.groupdict())
+                continue
+
+            #   CF Poll Request : Not implemented
+            m = p67_1.match(line)
+            if m:
+                client_capabilites_dict.update(m.groupdict())
+                continue
+
+            #   Short Preamble : Not implemented
+            m = p67_2.match(line)
+            if m:
+                client_capabilites_dict.update(m.groupdict())
+                continue
+
+            #   PBCC : Not implemented
+            m = p67_3.match(line)
+            if m:
+                client_capabilites_dict.update(m.groupdict())
+                continue
+
+            #   Channel Agility : Not implemented
+            m = p67_4.match(line)
+            if m:
+                client_capabilites_dict.update(m.groupdict())
+                continue
+
+            #   Listen Interval : 0
+            m = p67_5.match(line)
+            if m:
+                client_capabilites_dict.update({"listen_interval": int(m.groupdict()['listen_interval'])})
+                continue
+
+            # Fast BSS Transition Details :
+            #   Reassociation Timeout : 0
+            m = p68.match(line)
+            if m:
+                fast_bss_transition_dict = ret_dict.setdefault("fast_bss_transition_details", {})
+                fast_bss_transition_dict.update({"reassociation_timeout": int(m.groupdict()['reassociation_timeout'])})
+                continue
+
+            # 11v BSS Transition : Implemented
+            m = p69.match(line)
+            if m:
+                ret_dict.update({"11v_bss_transition": m.groupdict()['bss_transition']})
+                continue
+
+            # 11v DMS Capable : No
+            m = p70.match(line)
+            if m:
+                ret_dict.update({"11v_dms_capable": m.groupdict()['dms_capable']})
+                continue
+
+            # QoS Map Capable : No
+            m = p71.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # FlexConnect Data Switching : Central
+            # FlexConnect Dhcp Status : N/A
+            # FlexConnect Authentication : N/A
+            # FlexConnect Central Association : N/A
+            m = p72.match(line)
+            if m:
+                flexconnect_key = f"flexconnect_{m.groupdict()['type'].lower().replace(' ', '_')}"
+                ret_dict.update({flexconnect_key: m.groupdict()['value']})
+                continue
+
+            # Client Statistics:
+            #   Number of Bytes Received : 3083748
+            #   Number of Bytes Sent : 2063114
+            #   Number of Packets Received : 9048
+            #   Number of Packets Sent : 3686
+            #
+            # Client Statistics:
+            #   Number of Bytes Received : 3083748
+            #   Number of Bytes Sent : 2063114
+            #   Number of Packets Received : 9048
+            #   Number of Packets Sent : 3686
+            #   Number of Policy Errors : 0
+            m = p73.match(line)
+            if m:
+                client_statistics_dict = ret_dict.setdefault("client_statistics", {})
+
+                key = f"number_of_{m.groupdict()['item'].lower()}_{m.groupdict()['direction'].lower()}"
+                client_statistics_dict.update({key: int(m.groupdict()['value'])})
+                continue
+
+            #   Number of Policy Errors : 0
+            m = p73_1.match(line)
+            if m:
+                client_statistics_dict.update({
+                    "number_of_policy_errors": int(m.groupdict()['number_of_policy_errors'])
+                })
+                continue
+
+            #   Radio Signal Strength Indicator : -84 dBm
+            m = p73_2.match(line)
+            if m:
+                client_statistics_dict.update({"radio_signal_strength_indicator_dbm": int(m.groupdict()['rssi'])})
+                continue
+
+            #   Signal to Noise Ratio : 10 dB
+            m = p73_3.match(line)
+            if m:
+                client_statistics_dict.update({"signal_to_noise_ration_db": int(m.groupdict()['snr'])})
+                continue
+
+            # Fabric status : Disabled
+            m = p74.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Radio Measurement Enabled Capabilities
+            #   Capabilities: Link Measurement, Neighbor Report, Repeated Measurements, Passive Beacon Measurement
+            m = p75.match(line)
+            if m:
+                radio_measurement_capabilities_dict = ret_dict.setdefault("radio_measurement_enabled_capabilities", {})
+                radio_measurement_capabilities_dict.update({
+                    "capabilities": [capability for capability in m.groupdict()['capabilities'].split(', ')]
+                })
+                continue
+
+            # Client Scan Report Time : Timer not running
+            m = p76.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Nearby AP Statistics:
+            if p77.match(line):
+                nearby_ap_dict = ret_dict.setdefault("nearby_ap_statistics", {})
+                continue
+
+            #   prateekk_cos_1 (slot 1)
+            m = p77_1.match(line)
+            if m:
+                ap_name = line
+                ap_dict = nearby_ap_dict.setdefault("ap_names", {}).setdefault(ap_name, {})
+                continue
+
+            #   	antenna 0: 13 s ago	........ -25  dBm
+            #   	antenna 1: 13 s ago	........ -25  dBm
+            m = p77_2.match(line)
+            if m:
+                antenna_dict = ap_dict.setdefault("antenna", {})
+                antenna_dict.update({
+                    f"antenna {m.groupdict()['antenna']}": {
+                        "seconds_ago": int(m.groupdict()['time']),
+                        "dbm": int(m.groupdict()['rssi'])
+                    }
+                })
+                continue
+
+            # EoGRE : Pending Classification
+            m = p78.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Device Type      : Android
+            m = p79.match(line)
+            if m:
+                device_info_dict = ret_dict.setdefault("device_info", {})
+                device_info_dict.update(m.groupdict())
+                device_info = True
+                continue
+
+            # Device Name      : android-dhcp-10
+            m = p79_1.match(line)
+            if m:
+                device_info_dict.update(m.groupdict())
+                continue
+
+            # Protocol Map     : 0x000029  (OUI, DHCP, HTTP)
+            m = p79_2.match(line)
+            if m:
+                device_info_dict.update(m.groupdict())
+                continue
+
+            # Device OS        : Linux; U; Android 10; RMX1825 Build/QP1A.190711.020
+            m = p79_3.match(line)
+            if m:
+                device_info_dict.update(m.groupdict())
+                continue
+
+            # Type             : 12   12
+            m = p79_4.match(line)
+            if m:
+                if data_index:
+                    data_index += 1
+                else:
+                    data_index = 1
+
+                data_dict = protocol_dict.setdefault(data_index, {})
+                data_dict.update(m.groupdict())
+                continue
+
+            # Data             : 0c
+            # 00000000  00 0c 00 08 72 65 61 6c  6d 65 2d 33               |....realme-3    |
+            # 00000030  42 75 69 6c 64 2f 51 50  31 41 2e 31 39 30 37 31  |Build/QP1A.19071|
+            # 00000010  44 4a 30                                          |DJ0             |
+            m = p79_5.match(line)
+            if m:
+                data_dict.update(m.groupdict())
+                data_dict.update({"data": []})
+                continue
+
+            m = p79_6.match(line)
+            if m:
+                packet = f"{m.groupdict()['byte']} {m.groupdict()['hex']} {m.groupdict()['piped']}"
+                data_dict.setdefault("data", []).append(packet)
+                continue
+
+            # Max Client Protocol Capability: 802.11ac Wave 2
+            m = p80.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Cellular Capability : N/A
+            m = p81.match(line)
+            if m:
+                ret_dict.update(m.groupdict())
+                continue
+
+            # Advanced Scheduling Requests Details:
+            if p82.match(line):
+                advanced_scheduling_dict = ret_dict.setdefault("advanced_scheduling_requests_details", {})
+                continue
+
+            #   Apple Specific Requests(ASR) Capabilities/Statistics:
+            m = p82_1.match(line)
+            if m:
+                specific_request_dict = advanced_scheduling_dict.setdefault(m.groupdict()['request_type'], {})
+                continue
+
+            #     Regular ASR support: DISABLED
+            m = p82_2.match(line)
+            if m:
+                specific_request_dict.update(m.groupdict())
+                continue
+
+        return ret_dict
+
 
-        return client_mac_dict
-    
 # ======================================
 # Schema for:
 #  * 'show wireless fabric vnid mapping'
@@ -3021,7 +3606,7 @@ class ShowWirelessFabricVnidMappingSchema(MetaParser):
       }
     }
     
-    
+
 # ======================================    
 # Parser for:
 #  * 'show wireless fabric vnid mapping'
@@ -4338,7 +4923,6 @@ class ShowWirelessStatsClientDetail(ShowWirelessStatsClientDetailSchema):
               match = p_colon_split.match(line)
               group = match.groupdict()
               group["key"] = group["key"].replace(" ", "_").replace(".", "_").replace("-", "_").replace("___", "_").replace("__", "_").replace("/", "_").lower()
-              print(group["key"])
               group["value"] = int(group["value"])
               if len(section_tracker) == 1:
                   client_detail_dict[section_tracker[-1]].update({ group["key"]: group["value"] })
@@ -4596,3 +5180,481 @@ class ShowWirelessStatsMobility(ShowWirelessStatsMobilitySchema):
 
 
         return wireless_info_obj
+
+
+# ========================================
+# Schema for:
+#  * 'show wireless management trustpoint'
+# ========================================
+class ShowWirelessManagementTrustPointSchema(MetaParser):
+    """ Schema for :
+        show wireless management trustpoint"""
+
+    schema = {
+        "trustpoint_name": str,
+        "certificate_info": str,
+        "private_key_info": str,
+        "fips_suitability": str,
+        Optional("certificate_type"): str,
+        Optional("certificate_hash"): str
+    }
+
+
+# ========================================
+# Parser for:
+#  * 'show wireless management trustpoint'
+# ========================================
+
+class ShowWirelessManagementTrustPoint(ShowWirelessManagementTrustPointSchema):
+    """Parser for :
+        show wireless management trustpoint"""
+
+    cli_command = 'show wireless management trustpoint'
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+        ret_dict = {}
+
+        # Trustpoint Name : ewlc-tp1  
+        p1 = re.compile('^Trustpoint +Name +:( +(?P<trustpoint_name>.*))?$')
+        
+        # Certificate Info : Available
+        p2 = re.compile(r'^Certificate +Info +: +(?P<certificate_info>.*)$')
+        
+        # Certificate Type : SSC
+        p3 = re.compile(r'^Certificate +Type +: +(?P<certificate_type>.*)$')
+        
+        # FIPS suitability : Not Applicable
+        p4 = re.compile(r'^FIPS +suitability +: +(?P<fips_suitability>.*)$')
+        
+        # Private key Info : Available
+        p5 = re.compile(r'^Private +key +Info +: +(?P<private_key_info>.*)$')
+        
+        # Certificate Hash : 4a5d777c5b2071c17faef376febc08398702184e       
+        p6 = re.compile(r'^Certificate +Hash +: +(?P<certificate_hash>.*)$')
+        
+         
+        for line in out.splitlines():
+        
+            # Trustpoint Name : ewlc-tp1
+            m = p1.match(line)            
+            if m:
+                trustpoint_name = m.groupdict()['trustpoint_name']
+                if trustpoint_name:
+                    ret_dict["trustpoint_name"] = trustpoint_name.strip()
+                else:
+                    ret_dict["trustpoint_name"] = ""
+                
+            # Certificate Info : Available                
+            m = p2.match(line)
+            if m:
+                ret_dict["certificate_info"] = m.groupdict()['certificate_info'].strip()
+        
+            # Certificate Type : SSC        
+            m = p3.match(line)
+            if m:
+                ret_dict["certificate_type"] = m.groupdict()['certificate_type'].strip()
+                
+            # FIPS suitability : Not Applicable        
+            m = p4.match(line)
+            if m:
+                ret_dict["fips_suitability"] = m.groupdict()['fips_suitability'].strip()
+        
+            # Private key Info : Available         
+            m = p5.match(line)
+            if m:
+                ret_dict["private_key_info"] = m.groupdict()['private_key_info'].strip()
+        
+            # Certificate Hash : 4a5d777c5b2071c17faef376febc08398702184e
+            m = p6.match(line)
+            if m:
+                ret_dict["certificate_hash"] = m.groupdict()['certificate_hash'].strip()
+              
+        return ret_dict   
+
+
+# ========================================
+# Schema for:
+#  * 'show wireless multicast'
+# ========================================
+class ShowWirelessMulticastSchema(MetaParser):
+    """ Schema for :
+        show wireless multicast"""
+
+    schema = {
+        "multicast": bool,
+        "ap_capwap_multicast": str,
+        "wireless_broadcast": bool,
+        "mcast_no_ip_mcast": bool,
+        "mcast_link_local": bool,
+        Optional("ipv4_mcast_group_address"): str,
+        Optional("ipv6_mcast_group_address"): str,
+    }
+
+
+# ========================================
+# Parser for:
+#  * 'show wireless multicast'
+# ========================================
+class ShowWirelessMulticast(ShowWirelessMulticastSchema):
+    """Parser for :
+        show wireless multicast"""
+
+    cli_command = 'show wireless multicast'
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+        ret_dict = {}
+
+        str_to_bool_map = {
+            'Enabled': True,
+            'Disabled': False
+        }
+
+        # Multicast                               : Enabled
+        p1_rgx = r'Multicast\s+:\s+(?P<multicast>(Enabled|Disabled))'
+
+        # AP Capwap Multicast                     : Unicast
+        p2_rgx = r'Capwap Multicast\s+:\s+(?P<ap_capwap_multicast>(Unicast|Multicast))'
+
+        # Wireless Broadcast                      : Disabled
+        p3_rgx = r'Broadcast\s+:\s+(?P<wireless_broadcast>(Enabled|Disabled))'
+
+        # Wireless Multicast non-ip-mcast         : Disabled
+        p4_rgx = r'non-ip-mcast\s+:\s+(?P<mcast_no_ip_mcast>(Enabled|Disabled))'
+
+        # Wireless Multicast link-local           : Enabled
+        p5_rgx = r'link-local\s+:\s+(?P<mcast_link_local>(Enabled|Disabled))'
+
+        # AP Capwap IPv4 Multicast group Address  : 239.1.1.1
+        p6_rgx = r'IPv4[\s\w]+:\s+(?P<ipv4>((\d{1,3}\.){3}\d{1,3}))'
+
+        # AP Capwap IPv6 Multicast group Address  : ff11::1
+        p7_rgx = r'IPv6[\s\w]+:\s+(?P<ipv6>(([a-fA-F\d]{1,4}:*:?){1,7}[a-fA-F\d]{1,4}))'
+
+        for line in out.splitlines():
+
+            # # Multicast                               : Enabled
+            m = re.search(p1_rgx, line)
+            if m:
+                multicast = m.groupdict()['multicast']
+                ret_dict['multicast'] = str_to_bool_map[multicast]
+                continue
+
+            # AP Capwap Multicast                     : Unicast
+            m = re.search(p2_rgx, line)
+            if m:
+                ap_capwap_multicast = m.groupdict()['ap_capwap_multicast']
+                ret_dict['ap_capwap_multicast'] = ap_capwap_multicast
+                continue
+
+            # Wireless Broadcast                      : Disabled
+            m = re.search(p3_rgx, line)
+            if m:
+                wireless_broadcast = m.groupdict()['wireless_broadcast']
+                ret_dict['wireless_broadcast'] = str_to_bool_map[wireless_broadcast]
+                continue
+
+            # Wireless Multicast non-ip-mcast         : Disabled
+            m = re.search(p4_rgx, line)
+            if m:
+                mcast_no_ip_mcast = m.groupdict()['mcast_no_ip_mcast']
+                ret_dict['mcast_no_ip_mcast'] = str_to_bool_map[mcast_no_ip_mcast]
+                continue
+
+            # Wireless Multicast link-local           : Enabled
+            m = re.search(p5_rgx, line)
+            if m:
+                mcast_link_local = m.groupdict()['mcast_link_local']
+                ret_dict['mcast_link_local'] = str_to_bool_map[mcast_link_local]
+                continue
+
+            # AP Capwap IPv4 Multicast group Address  : 239.1.1.1
+            m = re.search(p6_rgx, line)
+            if m:
+                ipv4 = m.groupdict()['ipv4']
+                ret_dict['ipv4_mcast_group_address'] = ipv4
+                continue
+
+            # AP Capwap IPv6 Multicast group Address  : ff11::1
+            m = re.search(p7_rgx, line)
+            if m:
+                ipv6 = m.groupdict()['ipv6']
+                ret_dict['ipv6_mcast_group_address'] = ipv6
+
+        return ret_dict
+
+
+# ========================================
+# Schema for:
+#  * 'show wireless profile flex summary'
+# ========================================
+class ShowWirelessProfileFlexSummarySchema(MetaParser):
+    """ Schema for :
+        show wireless profile flex summary"""
+
+    schema = {
+        "count": int,
+        "flex_profiles": {
+            Any(): {
+                'description': Optional(str)
+            }
+        }
+    }
+
+
+# ========================================
+# Parser for:
+#  * 'show wireless profile flex summary'
+# ========================================
+class ShowWirelessProfileFlexSummary(ShowWirelessProfileFlexSummarySchema):
+    """Parser for :
+        show wireless profile flex summary"""
+
+    cli_command = 'show wireless profile flex summary'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        ret_dict = {}
+        # Number of Flex Profiles: 4
+        p_count = re.compile(r'Number\sof\sFlex\sProfiles:\s(?P<count>\d+)')
+        # ------------------------------------------------------------------------
+        p_line = re.compile(r'-+$')
+        # Flex Profile Name                 Description
+        p_header = re.compile(r'Flex\sProfile\sName\s+Description')
+        # myflexp1                          My first profile
+        # myflexp2
+        # myflexp3                          2023 profile
+        p_line_double = re.compile(r'^(?P<flexp_name>[\w\.-]+)\s+(?P<desc>(\w+\s?)+)$|(?P<flexp_name_single>[\w\.-]+)')
+        for line in output.splitlines():
+            line = line.strip()
+            flex_dict = ret_dict.setdefault('flex_profiles', {})
+            # Flex Profile Name                 Description
+            m = re.match(p_header, line)
+            if m:
+                continue
+            # ------------------------------------------------------------------------
+            m = re.match(p_line, line)
+            if m:
+                continue
+            # Number of Flex Profiles: 4
+            m = re.match(p_count, line)
+            if m:
+                ret_dict.update({'count': int(m.groupdict().get('count'))})
+                continue
+            # myflexp1                          My first profile
+            # myflexp2
+            # myflexp3                          2023 profile
+            m = re.match(p_line_double, line)
+            if m:
+                m_dict = m.groupdict()
+                flexp_name_single = m_dict.get('flexp_name_single')
+                flexp_name = m_dict.get('flexp_name')
+                flex_dict.update({flexp_name or flexp_name_single:{
+                   'description': "" if flexp_name_single else m_dict['desc'].strip()
+                   }})
+                continue
+            continue
+
+        return ret_dict
+
+
+# ========================================
+# Schema for:
+#  * 'show wireless tag site summary'
+# ========================================
+class ShowWirelessTagSiteSummarySchema(MetaParser):
+    """ Schema for :
+        show wireless tag site summary"""
+
+    schema = {
+        "count": int,
+        "site_tags": {
+            Any(): {
+                'description': str
+            }
+        }
+    }
+
+
+# ========================================
+# Parser for:
+#  * 'show wireless tag site summary'
+# ========================================
+class ShowWirelessTagSiteSummary(ShowWirelessTagSiteSummarySchema):
+    """Parser for :
+        show wireless tag site summary"""
+
+    cli_command = 'show wireless tag site summary'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+        ret_dict = {}
+        # Number of Site Tags: 7
+        p_count = re.compile(r'Number\sof\sSite\sTags:\s(?P<count>\d+)')
+        # ------------------------------------------------------------------------
+        p_line = re.compile(r'-+$')
+        # Site Tag Name                     Description
+        p_header = re.compile(r'Site\sTag\sName\s+Description')
+        # sometag                           Some description
+        # sometagwithnodescription
+        p_line_double = re.compile(r'^(?P<site_name>[\w\.-]+)\s+(?P<desc>(\w+\s?)+)$|(?P<site_name_single>[\w\.-]+)')
+        for line in output.splitlines():
+            line = line.strip()
+            site_dict = ret_dict.setdefault('site_tags', {})
+            # Site Tag Name                     Description
+            m = re.match(p_header, line)
+            if m:
+                continue
+            # ------------------------------------------------------------------------
+            m = re.match(p_line, line)
+            if m:
+                continue
+            # Number of Site Tags: 7
+            m = re.match(p_count, line)
+            if m:
+                ret_dict.update({'count': int(m.groupdict().get('count'))})
+                continue
+            # sometag                           Some description
+            # sometagwithnodescription
+            m = re.match(p_line_double, line)
+            if m:
+                m_dict = m.groupdict()
+                site_name_single = m_dict.get('site_name_single')
+                site_name = m_dict.get('site_name')
+                site_dict.update({site_name or site_name_single:{
+                   'description': "" if site_name_single else m_dict['desc'].strip()
+                   }})
+                continue
+
+        return ret_dict
+
+
+# ========================================
+# Schema for:
+#  * 'show wireless mesh ap backhaul'
+# ========================================
+class ShowWirelessMeshApBackhaulSchema(MetaParser):
+    """ Schema for :
+        show wireless mesh ap backhaul"""
+
+    schema = {
+        Any(): {'backhaul_slot': str,
+                'radio_type': str,
+                'radio_subband': str,
+                'mesh_radio_role': str,
+                'admin_state': str,
+                'oper_state': str,
+                'current_channel': str,
+                'antenna_type': str,
+                'antenna_gain': str}
+    }
+
+
+# ========================================
+# Parser for:
+#  * 'show wireless mesh ap backhaul'
+# ========================================
+class ShowWirelessMeshApBackhaul(ShowWirelessMeshApBackhaulSchema):
+    """Parser for :
+        show wireless mesh ap backhaul"""
+
+    cli_command = 'show wireless mesh ap backhaul'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        ret_dict = {}
+        # MAC Address : 488b.0a78.c8a0
+        p_mac_addr = re.compile(r"MAC\sAddress\s:\s+(?P<mac_add>(([0-9a-fA-F]{4}\.){2}[0-9a-fA-F]{4}))")
+        # Current Backhaul Slot: 1
+        p_backhaul_slot = re.compile(r"^Current\sBackhaul\sSlot:\s+(?P<backhaul_slot>(\d))$")
+        # Radio Type: Main
+        p_radio_type = re.compile(r"^Radio\sType:\s+(?P<radio_type>(\w+))$")
+        # Radio Subband: All
+        p_radio_subband = re.compile(r"^Radio\sSubband:\s+(?P<radio_subband>(\w+))$")
+        # Mesh Radio Role: Downlink
+        p_mesh_radio_role = re.compile(r"^Mesh\sRadio\sRole:\s+(?P<mesh_radio_role>(\w+))$")
+        # Administrative State: Disabled
+        p_admin_state = re.compile(r"^Administrative\sState:\s+(?P<admin_state>(\w+))$")
+        # Operation State: Down
+        p_oper_state = re.compile(r"^Operation\sState:\s+(?P<oper_state>(\w+))$")
+        # Current Tx Power Level: *4
+        p_current_tx_power = re.compile(r"^CurrentsTx\sPower\sLevel:\s+(?P<current_tx_power>(\*?\d+))$")
+        # Current Channel: (157,161)*
+        p_current_channel = re.compile(r"^Current\sChannel:\s+(?P<current_channel>(\(\d+[,\d]+?\)\*?))$")
+        # Antenna Type: C-ANT-DART-RPTNC
+        p_antenna_type = re.compile(r"^Antenna\sType:\s?(?P<antenna_type>(N\/A|[\w-]+|$))")
+        # Internal Antenna Gain (in .5 dBm units): 1
+        p_antenna_gain = re.compile(r".* Gain \(.*\):\s(?P<antenna_gain>(\d+))$")
+
+        for line in output.splitlines():
+            line = line.strip()
+            # MAC Address : 488b.0a78.c8a0
+            m = re.match(p_mac_addr, line)
+            if m:
+                curr_mac = m.groupdict().get('mac_add').strip()
+                mac_dict = ret_dict.setdefault(curr_mac, {})
+                continue
+            # Current Backhaul Slot: 1
+            m = re.match(p_backhaul_slot, line)
+            if m:
+                mac_dict['backhaul_slot'] = m.groupdict().get('backhaul_slot')
+                continue
+            # Radio Type: Main
+            m = re.match(p_radio_type, line)
+            if m:
+                mac_dict['radio_type'] = m.groupdict().get('radio_type')
+                continue
+            # Radio Subband: All
+            m = re.match(p_radio_subband, line)
+            if m:
+                mac_dict['radio_subband'] = m.groupdict().get('radio_subband')
+                continue
+            # Mesh Radio Role: Downlink
+            m = re.match(p_mesh_radio_role, line)
+            if m:
+                mac_dict['mesh_radio_role'] = m.groupdict().get('mesh_radio_role')
+                continue
+            # Administrative State: Disabled
+            m = re.match(p_admin_state, line)
+            if m:
+                mac_dict['admin_state'] = m.groupdict().get('admin_state')
+                continue
+            # Operation State: Down
+            m = re.match(p_oper_state, line)
+            if m:
+                mac_dict['oper_state'] = m.groupdict().get('oper_state')
+                continue
+            # Current Tx Power Level: *4
+            m = re.match(p_current_tx_power, line)
+            if m:
+                mac_dict['current_tx_power'] = m.groupdict().get('current_tx_power')
+                continue
+            # Current Channel: (157,161)*
+            m = re.match(p_current_channel, line)
+            if m:
+                mac_dict['current_channel'] = m.groupdict().get('current_channel')
+                continue
+            # Antenna Type: C-ANT-DART-RPTNC|N/A
+            m = re.match(p_antenna_type, line)
+            if m:
+                mac_dict['antenna_type'] = m.groupdict().get('antenna_type')
+                continue
+            # Internal Antenna Gain (in .5 dBm units): 1
+            m = re.match(p_antenna_gain, line)
+            if m:
+                mac_dict['antenna_gain'] = m.groupdict().get('antenna_gain')
+                continue
+
+        return ret_dict
@@ -27,10 +27,10 @@ class ShowBfdSessionSchema(MetaParser):
             Any(): {
                 'dest_ip_address': {
                     Any(): {
-                        'echo_total_msec': int,
+                        Optional('echo_total_msec'): int,
                         Optional('echo_multiplier'): int,
                         Optional('echo_msec'): int,
-                        'async_total_msec': int,
+                        Optional('async_total_msec'): int,
                         Optional('async_multiplier'): int,
                         Optional('async_msec'): int,
                         'state': str,
@@ -60,19 +60,27 @@ class ShowBfdSession(ShowBfdSessionSchema):
             out = output
 
         result_dict = {}
+        
         #Gi0/0/0/36.52       10.129.196.34   450ms(150ms*3)   6s(2s*3)         UP
         p1 = re.compile(
             r'^(?P<intf>\S+) +(?P<dest>\d+\.\d+\.\d+\.\d+) +(?P<echo_total_msec>\d+\w+)\((?P<echo_msec>\d+\w+)\*(?P<echo_multiplier>\d+)\) +(?P<async_total_msec>\d+\w+)\((?P<async_msec>\d+\w+)\*(?P<async_multiplier>\d+)\) +(?P<state>\S+)')
+        
         #Gi0/0/0/26.110      10.0.221.98     0s               0s               DOWN DAMP
         p2 = re.compile(
             r'^(?P<intf>\S+) +(?P<dest>\d+\.\d+\.\d+\.\d+) +(?P<echo_total_msec>\d+\w+) +(?P<async_total_msec>\d+\w+) +(?P<state>\S+) ?(?P<damp>\S+)?')
+        
         #BE300               172.16.253.53   n/a              n/a              UP
         p3 = re.compile(
             r'^(?P<intf>\S+) +(?P<dest>\d+\.\d+\.\d+\.\d+) +(?P<echo_total_msec>\w+\/\w+) +(?P<async_total_msec>\w+\/\w+) +(?P<state>\S+) ?(?P<damp>\S+)?')
+        
         #                                                             No    n/a
         p4 = re.compile(
             r'(?P<hw>[No|Yes]+) +(?P<npu>\S+)')
 
+        #Gi0/0/0/1.10        192.168.1.2     0s               10s(2s*5)        INIT
+        p5 = re.compile(
+            r'^(?P<intf>\S+) +(?P<dest>\d+\.\d+\.\d+\.\d+) +(?P<echo_total_msec>\d+\w+) +(?P<async_total_msec>\d+\w+)\((?P<async_msec>\d+\w+)\*(?P<async_multiplier>\d+)\) +(?P<state>\S+)')
+
         for line in out.splitlines():
             if line:
                 line = line.strip()
@@ -147,8 +155,6 @@ class ShowBfdSession(ShowBfdSessionSchema):
                 interface = Common.convert_intf_name(group['intf'])
                 destaddress = group['dest']
                 bfd_dict = result_dict.setdefault('interface',{}).setdefault(interface,{}).setdefault('dest_ip_address',{}).setdefault(destaddress,{})
-                bfd_dict.update({'echo_total_msec': group['echo_total_msec']})
-                bfd_dict.update({'async_total_msec': group['async_total_msec']})
                 bfd_dict.update({'state': group['state']})
                 if group['damp']:
                     bfd_dict.update({'dampening': group['damp']})
@@ -162,6 +168,36 @@ class ShowBfdSession(ShowBfdSessionSchema):
                 bfd_dict.update({'npu': group['npu']})
                 continue
 
+            #Gi0/0/0/1.10        192.168.1.2     0s               10s(2s*5)        INIT
+            m = p5.match(line)
+
+            if m:
+                group = m.groupdict()
+                interface = Common.convert_intf_name(group['intf'])
+                destaddress = group['dest']
+                bfd_dict = result_dict.setdefault('interface',{}).setdefault(interface,{}).setdefault('dest_ip_address',{}).setdefault(destaddress,{})
+                if group['echo_total_msec'] and re.findall(r'\d+ms',group['echo_total_msec']) != []:
+                    group['echo_total_msec'] = group['echo_total_msec'].rstrip('ms')
+                    bfd_dict.update({'echo_total_msec': int(group['echo_total_msec'])})
+                else:
+                    group['echo_total_msec'] = int(group['echo_total_msec'].rstrip('s'))*1000
+                    bfd_dict.update({'echo_total_msec': int(group['echo_total_msec'])})
+                if group['async_total_msec'] and re.findall(r'\d+ms',group['async_total_msec']) != []:
+                    group['async_total_msec'] = group['async_total_msec'].rstrip('ms')
+                    bfd_dict.update({'async_total_msec': int(group['async_total_msec'])})
+                else:
+                    group['async_total_msec'] = int(group['async_total_msec'].rstrip('s'))*1000
+                    bfd_dict.update({'async_total_msec': int(group['async_total_msec'])})
+                if group['async_msec'] and re.findall(r'\d+ms',group['async_msec']) != []:
+                    group['async_msec'] = group['async_msec'].rstrip('ms')
+                    bfd_dict.update({'async_msec': int(group['async_msec'])})
+                else:
+                    group['async_msec'] = int(group['async_msec'].rstrip('s'))*1000
+                    bfd_dict.update({'async_msec': int(group['async_msec'])})
+                bfd_dict.update({'async_multiplier': int(group['async_multiplier'])})
+                bfd_dict.update({'state': group['state']})
+                continue
+
         return result_dict
 
 
@@ -648,22 +684,26 @@ class ShowBfdSessionDestinationSchema(MetaParser):
     schema = {
         'dest':{
             Any():{
-                'interface': str,
-                Optional('session'):{
-                    'state': str,
-                },
-                Optional('hardware'): str,
-                Optional('npu'): str,
-                'timer_vals':{
-                    'async_detection_time': str,
-                    'async_detection_time_ms': int,
-                    Optional('async_detection_interval_ms'): int,
-                    Optional('async_detection_multiplier'): int,
-                    'echo_detection_time': str,
-                    'echo_detection_time_ms': int,
-                    Optional('echo_detection_interval_ms'): int,
-                    Optional('echo_detection_multiplier'): int,
-                },
+                'interfaces':{
+                    Any():{
+                        'interface': str,
+                        Optional('session'):{
+                            'state': str,
+                        },
+                        Optional('hardware'): str,
+                        Optional('npu'): str,
+                        'timer_vals':{
+                            'async_detection_time': str,
+                            Optional('async_detection_time_ms'): int,
+                            Optional('async_detection_interval_ms'): int,
+                            Optional('async_detection_multiplier'): int,
+                            'echo_detection_time': str,
+                            Optional('echo_detection_time_ms'): int,
+                            Optional('echo_detection_interval_ms'): int,
+                            Optional('echo_detection_multiplier'): int,
+                        },
+                    }
+                }
             }       
         }
     }
@@ -702,6 +742,12 @@ class ShowBfdSessionDestination(ShowBfdSessionDestinationSchema):
             r'(?P<async_detection_time>(?P<async_time>\d+) *(?P<async_time_unit>\w+)(\((?P<async_detection_interval_ms>\d+)[\w ]+\*(?P<async_detection_multiplier>\d+)\))?) +'
             r'(?P<state>\S+)$')
 
+        # No                  n/a             n/a              n/a              UP
+        p3 = re.compile(r'(?P<hardware>(No|Yes))\s+(?P<npu>[n\/a]+)\s+(?P<echo_detection_time>[n\/a]+)\s+(?P<async_detection_time>[n\/a]+)\s+(?P<state>\S+)')
+
+        # BE10                1.1.1.1         n/a              n/a              DOWN
+        p4 = re.compile(r'^(?P<interface>\S+)\s+(?P<dest>\S+)\s+(?P<echo_detection_time>[n\/a]+)\s+(?P<async_detection_time>[n\/a]+)\s+(?P<state>\S+)$')
+
 
         for line in out.splitlines():
             line = line.strip()
@@ -715,13 +761,15 @@ class ShowBfdSessionDestination(ShowBfdSessionDestinationSchema):
                 if intf and ip_address:
                     dest_dict = ret_dict.setdefault('dest', {}). \
                         setdefault(ip_address, {})
-                    dest_dict.update({'interface': intf})
+                    int_dict = dest_dict.setdefault('interfaces', {}). \
+                        setdefault(intf, {})
+                    int_dict.update({'interface': intf})
 
                 hardware = group.get('hardware', None)
                 npu = group.get('npu', None)
                 if hardware and npu:
-                    dest_dict.update({'hardware': hardware})
-                    dest_dict.update({'npu': npu})
+                    int_dict.update({'hardware': hardware})
+                    int_dict.update({'npu': npu})
 
                 continue
             
@@ -743,15 +791,17 @@ class ShowBfdSessionDestination(ShowBfdSessionDestinationSchema):
                 if intf and ip_address:
                     dest_dict = ret_dict.setdefault('dest', {}). \
                         setdefault(ip_address, {})
-                    dest_dict.update({'interface': intf})
-                
+                    int_dict = dest_dict.setdefault('interfaces', {}). \
+                        setdefault(intf, {})
+                    int_dict.update({'interface': intf})
+
                 hardware = group.get('hardware', None)
                 npu = group.get('npu', None)
                 if hardware and npu:
-                    dest_dict.update({'hardware': hardware})
-                    dest_dict.update({'npu': npu})
+                    int_dict.update({'hardware': hardware})
+                    int_dict.update({'npu': npu})
 
-                timer_vals_dict = dest_dict.setdefault('timer_vals', {})
+                timer_vals_dict = int_dict.setdefault('timer_vals', {})
                 timer_vals_dict.update({'echo_detection_time': echo_detection_time})
                 if echo_detection_interval_ms:
                     timer_vals_dict.update({'echo_detection_interval_ms': int(echo_detection_interval_ms)})
@@ -764,7 +814,7 @@ class ShowBfdSessionDestination(ShowBfdSessionDestinationSchema):
                 if async_detection_multiplier:
                     timer_vals_dict.update({'async_detection_multiplier': int(async_detection_multiplier)})
 
-                session_dict = dest_dict.setdefault('session', {})
+                session_dict = int_dict.setdefault('session', {})
                 session_dict.update({'state': state})
 
                 echo_time = int(group['echo_time'])
@@ -777,5 +827,52 @@ class ShowBfdSessionDestination(ShowBfdSessionDestinationSchema):
                 timer_vals_dict.update({'echo_detection_time_ms': echo_time,
                                    'async_detection_time_ms': async_time})
                 continue
-        
+
+            # No                  n/a             n/a              n/a              UP
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                echo_detection_time = group['echo_detection_time']
+                async_detection_time = group['async_detection_time']                
+                state = group['state']
+                
+                hardware = group.get('hardware', None)
+                npu = group.get('npu', None)
+                if hardware and npu:
+                    int_dict.update({'hardware': hardware})
+                    int_dict.update({'npu': npu})
+
+                timer_vals_dict = int_dict.setdefault('timer_vals', {})
+                timer_vals_dict.update({'echo_detection_time': echo_detection_time})
+                timer_vals_dict.update({'async_detection_time': async_detection_time})
+
+                session_dict = int_dict.setdefault('session', {})
+                session_dict.update({'state': state})
+                continue
+
+            # BE10                1.1.1.1         n/a              n/a              DOWN
+            m = p4.match(line)
+            if m:
+                group = m.groupdict()
+                echo_detection_time = group['echo_detection_time']
+                async_detection_time = group['async_detection_time']                
+                state = group['state']
+
+                intf = group.get('interface', None)
+                ip_address = group.get('dest', None)
+                if intf and ip_address:
+                    dest_dict = ret_dict.setdefault('dest', {}). \
+                        setdefault(ip_address, {})
+                    int_dict = dest_dict.setdefault('interfaces', {}). \
+                        setdefault(intf, {})
+                    int_dict.update({'interface': intf})
+
+                timer_vals_dict = int_dict.setdefault('timer_vals', {})
+                timer_vals_dict.update({'echo_detection_time': echo_detection_time})
+                timer_vals_dict.update({'async_detection_time': async_detection_time})
+
+                session_dict = int_dict.setdefault('session', {})
+                session_dict.update({'state': state})
+                continue
+
         return ret_dict
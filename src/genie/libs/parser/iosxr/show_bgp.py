@@ -42,6 +42,19 @@ IOSXR parsers for the following show commands:
     * 'show bgp instance all sessions'
     * 'show bgp instance {instance} sessions'
     * 'show bgp egress-engineering'
+    * 'show bgp all all nexthops'
+    * 'show bgp {address_family} {ip_address} brief'
+    * 'show bgp {address_family} {ip_address} bestpath-compare'
+    * 'show bgp vrf {vrf_name} {address_family} {prefix}'
+    * 'show bgp {address_family} vrf {vrf_name} {prefix}'
+    * 'show bgp vrf {vrf_name} {address_family} {prefix} detail'
+    * 'show bgp vrf {vrf}'
+    * 'show bgp vrf {vrf} {summary}'
+    * 'show bgp vrf {vrf} {address_family} summary'
+    * 'show bgp vrf {vrf} {address_family} {value}'
+    * 'show bgp'
+    * 'show bgp {address_family}'
+    * 'show bgp l2vpn evpn summary'
 """
 
 # Python
@@ -49,12 +62,13 @@ import re
 import logging
 import collections
 from ipaddress import ip_address, ip_network
+from sys import version
 
 # Metaparser
 from genie.libs.parser.base import *
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
-                                         Default, Use
+                                         Default, Use, ListOf
 
 # Parser
 from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
@@ -1018,7 +1032,7 @@ class ShowBgpInstanceProcessDetailSchema(MetaParser):
                          Optional('route_distinguisher'): str,
                          Optional('router_id'): str,
                          Optional('as_system_number_format'): str,
-                         Optional('as_number'): int,
+                         Optional('as_number'): Or(int, str),
                          Optional('default_cluster_id'): str,
                          Optional('active_cluster_id'): str,
                          Optional('fast_external_fallover'): bool,
@@ -1203,7 +1217,9 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
                         '(?P<operation_mode>\w+) *mode$')
         p3 = re.compile(r'^Autonomous *System *number *format: *'
                         '(?P<as_format>[a-zA-Z]+)$')
-        p4 = re.compile(r'^Autonomous *System: *(?P<as_number>[0-9]+)$')
+
+        #Autonomous System: 65108.65108
+        p4 = re.compile(r'^Autonomous *System: *(?P<as_number>[0-9\.]+)$')
         p5 = re.compile(r'^Router *ID: *(?P<router_id>[\w\.\:]+) *'
                         '(\([\w\s]+\))?$')
         p6_1 = re.compile(r'^Default *Cluster *ID: *'
@@ -1413,7 +1429,12 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             m = p4.match(line)
             if m:
-                as_number = int(m.groupdict()['as_number'])
+                as_number = "NA"
+                try:
+                    as_number = int(m.groupdict()['as_number'])
+                except:
+                    as_number = m.groupdict()['as_number']
+
 
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['as_number'] = as_number
@@ -2287,6 +2308,8 @@ class ShowBgpInstanceNeighborsDetailSchema(MetaParser):
                                  Optional('remove_private_as'): bool,
                                  Optional('keepalive_interval'): int,
                                  Optional('holdtime'): int,
+                                 Optional('configured_keepalive_interval'): int,
+                                 Optional('configured_holdtime'): int,
                                  Optional('min_acceptable_hold_time'): int,
                                  Optional('link_state'): str,
                                  Optional('router_id'): str,
@@ -2354,6 +2377,19 @@ class ShowBgpInstanceNeighborsDetailSchema(MetaParser):
                                  Optional('minimum_time_between_adv_runs'): int,
                                  Optional('inbound_message'): str,
                                  Optional('outbound_message'): str,
+                                 Optional('bfd'):{
+                                    Optional('bfd_status'): str,
+                                    Optional('session_status'): str,
+                                    Optional('mininterval'): int,
+                                    Optional('multiplier'): int
+                                 },
+                                 Optional('messages'): {
+                                    Optional(Any()): {
+                                        Optional('messages_count'): int,
+                                        Optional('notifications'): int,
+                                        Optional('queue'): int
+                                    }
+                                 },
                                  Optional('address_family'):
                                     {Any():
                                         {Optional('enabled'): bool,
@@ -2412,7 +2448,9 @@ class ShowBgpInstanceNeighborsDetailSchema(MetaParser):
                                          Optional('last_reset'): str,
                                          Optional('reset_reason'): str,                                                     
                                          Optional('connections_established'): int,
-                                         Optional('connections_dropped'): int
+                                         Optional('connections_dropped'): int,
+                                         Optional('ttl_security'): str,
+                                         Optional('external_bgp_neighbor_hop_count'): int
                                         },
                                     Optional('transport'):
                                         {Optional('local_host'): str,
@@ -2510,9 +2548,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
                             '(?P<instance>[a-zA-Z0-9\-\_\']+)$')
         p2 =  re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
         p2_1 =  re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+), +vrf +(?P<vrf>\S+)$')
-        p3 = re.compile(r'^Remote +AS +(?P<remote_as>[0-9]+), +local +AS'
-                            ' +(?P<local_as_as_no>[0-9]+)'
-                            '(?:, +(?P<link_state>[a-zA-Z\s]+))?$')
+        p3 = re.compile(r'^Remote +AS +(?P<remote_as>[0-9]+), +local +AS +(?P<local_as_as_no>[0-9]+)(?:, +(?P<local_as_no_prepend>no-prepend))?(?:, +(?P<local_as_replace_as>replace-as))?(?:, +(?P<local_as_dual_as>dual-as))?(?:, +(?P<link_state>[a-zA-Z\s]+))?$')
         p4 = re.compile(r'^Remote *router *ID *(?P<router_id>[a-zA-Z0-9\.\:]+)$')
         p5 = re.compile(r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)'
                             '(?:, +up +for +(?P<up_time>[\w\:]+))?$')
@@ -2545,8 +2581,9 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
         p24 = re.compile(r'^TCP *Initial *Sync *Done :(?: *(?P<tcp_initial_sync_done>[a-zA-Z0-9\-\s]+))?$')
         p25 = re.compile(r'^Enforcing *first *AS is *(?P<enforcing_first_as>[a-z]+)$')
         p26 =  re.compile(r'^Multi-protocol *capability *(?P<multiprotocol_capability>[a-zA-Z\s]+)$')
-        p27 = re.compile(r'^Neighbor +capabilities: +Adv +Rcvd$')
-        p27_1= re.compile(r'^(Address +family +)?(?P<name>[a-zA-Z0-9\s\-]+): *(?P<adv>(Y|y)es|(N|n)o) *(?P<rcvd>(Y|y)es|(N|n)o+)$')
+        p27 = re.compile(r'^Neighbor +capabilities:?:( +Adv +Rcvd)?$')
+        p27_1= re.compile(r'^(Address +family +)?(?P<name>[a-zA-Z0-9\s\-]+)(?: +\(GR Awareness\))?: *(?:(?P<adv>(Y|y)es|(N|n)o|advertised+)'
+                          r'(?: \(old \+ new\))?)?(?:( +and))? *(?:(?P<rcvd>(Y|y)es|(N|n)o|received+)(?: \(old \+ new\))?)$')
         p28 = re.compile(r'^InQ *depth: *(?P<message_stats_input_queue>[0-9]+), *OutQ *depth: *(?P<message_stats_output_queue>[0-9]+)$')
         p29 = re.compile(r'^(?P<name>[a-zA-Z\s]+) *: *'
                             '(?P<last_sent>\w+ *\d+ *[\d\:\.]+) *'
@@ -2603,6 +2640,14 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
         p65 = re.compile(r'^AS +override +is +set$')
         p66 = re.compile(r'^Default +information +originate: +(?P<route_map>[\w\s\-]:)$')
         p67 = re.compile(r'^site\-of\-origin +(?P<soo>[\w\:]+)$')
+        p68 = re.compile(r'^TTL\s+security\s+is\s+(?P<ttl_security>\w+)$')
+        p69 = re.compile(r'^External\s+BGP\s+neighbor\s+may\s+be\s+up\s+to\s+(?P<external_bgp_neighbor_hop_count>\d+)\s+hops\s+away\.$')
+        p70 = re.compile(r'^BFD\s+(?P<bfd_status>\w+)\s+\(session\s+(?P<session_status>\w+)\):\s+mininterval:\s+(?P<mininterval>\d+)\s+multiplier:\s+(?P<multiplier>\d+)$')
+        p71 = re.compile(r'^Graceful\s+restart\s+is\s+(?P<graceful_restart>[a-zA-Z]+)$')
+        p72 = re.compile(r'^Restart\s+time\s+is\s+(?P<graceful_restart_restart_time>\d+)\s+seconds$')
+        p73 = re.compile(r'^Stale\s+path\s+timeout\s+time\s+is\s+(?P<graceful_restart_stalepath_time>\d+)\s+seconds$')
+        p74 = re.compile(r'^(?P<messages_type>[Received|Sent]+)\s+(?P<messages_count>\d+)\s+messages,\s+(?P<notifications>\d+)\s+notifications,\s+(?P<queue>\d+)\s+in\s+queue$')
+
         for line in out.splitlines():
             line = line.strip()
 
@@ -2663,6 +2708,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
                 continue
             
             # Remote AS 200, local AS 100, external link
+            # Remote AS 200, local AS 100, no-prepend, replace-as, dual-as, external link
             m = p3.match(line)
             if m:
                 sub_dict['remote_as'] = int(m.groupdict()['remote_as'])
@@ -2670,10 +2716,18 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
                     sub_dict['link_state'] = m.groupdict()['link_state']
                 sub_dict['local_as_as_no'] = int(m.groupdict()['local_as_as_no'])
 
-                # Default the values - overwritten if configured
-                sub_dict['local_as_no_prepend'] = False
-                sub_dict['local_as_replace_as'] = False
-                sub_dict['local_as_dual_as'] = False
+                if m.groupdict()['local_as_no_prepend']:
+                    sub_dict['local_as_no_prepend'] = True
+                else:
+                    sub_dict['local_as_no_prepend'] = False
+                if m.groupdict()['local_as_replace_as']:
+                    sub_dict['local_as_replace_as'] = True
+                else:
+                    sub_dict['local_as_replace_as'] = False
+                if m.groupdict()['local_as_dual_as']:
+                    sub_dict['local_as_dual_as'] = True
+                else:
+                    sub_dict['local_as_dual_as'] = False
                 continue
 
             # Remote router ID 10.1.5.5
@@ -2739,8 +2793,8 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             m = p9.match(line)
             if m:
-                sub_dict['holdtime'] = int(m.groupdict()['holdtime'])
-                sub_dict['keepalive_interval'] = \
+                sub_dict['configured_holdtime'] = int(m.groupdict()['holdtime'])
+                sub_dict['configured_keepalive_interval'] = \
                     int(m.groupdict()['keepalive_interval'])
                 sub_dict['min_acceptable_hold_time'] = \
                     int(m.groupdict()['min_acceptable_hold_time'])
@@ -2931,6 +2985,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
                 continue
 
             # Neighbor capabilities:            Adv         Rcvd
+            # Neighbor capabilities:
 
             m = p27.match(line)
             if m:
@@ -2940,12 +2995,20 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             #    Route refresh:                  Yes         No
             #    4-byte AS:                      Yes         No
             #    Address family IPv4 Unicast:    Yes         Yes
+            #    Route refresh: advertised (old + new) and received (old + new)
+            #    Graceful Restart (GR Awareness): received
+            #    4-byte AS: advertised and received
+            #    Address family IPv4 Unicast: advertised and received
 
             m = p27_1.match(line)
             if m:
+                adv = ''
+                rcvd = ''
                 name = m.groupdict()['name'].lower()
-                adv = 'advertised' if m.groupdict()['adv'].lower() == 'yes' else ''
-                rcvd = 'received' if m.groupdict()['rcvd'].lower() == 'yes' else ''
+                if m.groupdict()['adv']:
+                    adv = 'advertised' if m.groupdict()['adv'].lower() in ['yes', 'advertised'] else ''
+                if m.groupdict()['rcvd']:
+                    rcvd = 'received' if m.groupdict()['rcvd'].lower() in ['yes', 'received'] else ''
                 # mapping ops name
 
                 if 'enhanced refresh' in name:
@@ -3415,6 +3478,84 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
                 sub_dict['address_family'][address_family]['soo'] = m.groupdict()['soo']
                 continue
 
+            # TTL security is configured
+
+            m = p68.match(line)
+            if m:
+                if 'bgp_session_transport' not in sub_dict:
+                    sub_dict['bgp_session_transport'] = {}
+                if 'connection' not in sub_dict['bgp_session_transport']:
+                    sub_dict['bgp_session_transport']['connection'] = {}
+
+                # ttl_security = m.groupdict()['ttl_security']
+                ttl_security = 'enabled'
+
+                sub_dict['bgp_session_transport']['connection']['ttl_security'] = ttl_security
+                continue
+
+            # External BGP neighbor may be up to 100 hops away.
+
+            m = p69.match(line)
+            if m:
+                if 'bgp_session_transport' not in sub_dict:
+                    sub_dict['bgp_session_transport'] = {}
+                if 'connection' not in sub_dict['bgp_session_transport']:
+                    sub_dict['bgp_session_transport']['connection'] = {}
+
+                external_bgp_neighbor_hop_count = int(m.groupdict()['external_bgp_neighbor_hop_count'])
+
+                sub_dict['bgp_session_transport']['connection']['external_bgp_neighbor_hop_count'] = external_bgp_neighbor_hop_count
+                continue
+
+            # BFD enabled (session up): mininterval: 150 multiplier: 3
+
+            m = p70.match(line)
+            if m:
+                sub_dict['bfd'] = {}
+                sub_dict['bfd']['bfd_status'] = m.groupdict()['bfd_status']
+                sub_dict['bfd']['session_status'] = m.groupdict()['session_status']
+                sub_dict['bfd']['mininterval'] = int(m.groupdict()['mininterval'])
+                sub_dict['bfd']['multiplier'] = int(m.groupdict()['multiplier'])
+                continue
+
+            # Graceful restart is enabled
+
+            m = p71.match(line)
+            if m:
+                if m.groupdict()['graceful_restart'] == 'enabled':
+                    graceful_restart = True
+                sub_dict['graceful_restart'] = graceful_restart
+                continue
+
+            # Restart time is 120 seconds
+
+            m = p72.match(line)
+            if m:
+                sub_dict['graceful_restart_restart_time'] = int(m.groupdict()['graceful_restart_restart_time'])
+                continue
+
+            # Stale path timeout time is 360 seconds
+
+            m = p73.match(line)
+            if m:
+                sub_dict['graceful_restart_stalepath_time'] = int(m.groupdict()['graceful_restart_stalepath_time'])
+                continue
+
+            # Received 86 messages, 0 notifications, 0 in queue
+            # Sent 86 messages, 0 notifications, 0 in queue
+
+            m = p74.match(line)
+            if m:
+                messages_type = m.groupdict()['messages_type'].lower()
+                if 'messages' not in sub_dict:
+                    sub_dict['messages'] = {}
+                if messages_type not in sub_dict['messages']:
+                    sub_dict['messages'][messages_type] = {}
+                sub_dict['messages'][messages_type]['messages_count'] = int(m.groupdict()['messages_count'])
+                sub_dict['messages'][messages_type]['notifications'] = int(m.groupdict()['notifications'])
+                sub_dict['messages'][messages_type]['queue'] = int(m.groupdict()['queue'])
+                continue
+
         return ret_dict
 
     def yang(self, vrf_type, af_type=''):
@@ -3484,7 +3625,7 @@ class ShowBgpInstanceNeighborsReceivedRoutesSchema(MetaParser):
                                 {Any():
                                     {Optional('router_identifier'): str,
                                      Optional('route_distinguisher'): str,
-                                     Optional('local_as'): int,
+                                     Optional('local_as'): Or(int, str,),
                                      Optional('state'): str,
                                      Optional('vrf_id'): str,
                                      Optional('generic_scan_interval'): int,
@@ -3592,7 +3733,8 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
         p15_1 = re.compile(r'^BGP Route Distinguisher: *(?P<route_distinguisher>\S+)')
         p16 = re.compile(r'^\s*VRF *ID: *(?P<vrf_id>[a-z0-9]+)$')
         p2 = re.compile(r'^Address *Family: *(?P<address_family>[a-zA-Z0-9\s]+)$')
-        p3 = re.compile(r'^BGP *router *identifier *(?P<router_identifier>[0-9\.]+), *local *AS *number *(?P<local_as>[0-9]+)$')
+        p3 = re.compile(r'^BGP *router *identifier *(?P<router_identifier>[0-9\.]+), *'
+                        r'local *AS *number *(?P<local_as>[0-9\.]+)$')
         p4 = re.compile(r'^BGP *generic *scan *interval *(?P<generic_scan_interval>[0-9]+) +secs$')
         p5 = re.compile(r'^(?P<non_stop_routing>(Non-stop routing is enabled))$')
         p6 = re.compile(r'^BGP *table *state: *(?P<table_state>[a-zA-Z]+)$')
@@ -3605,9 +3747,9 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
                             '(\(default +for +vrf +(?P<default_vrf>[a-zA-Z0-9]+)\))?$')
         p13 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)? *'
                             '(?P<prefix>(?P<ip>[\w\.\:\/\[\]]+)\/(?P<mask>\d+))?( +'
-                            '(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\s\{\}]+)?'
-                            '(?: *(?P<origin_codes>(i|e|\?)))?)?$')
-        p13_1 = re.compile(r'(?P<path>[\d\s]+)'
+                            '(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\.\s\{\}]+)?'
+                            '(?: *(?P<origin_codes>(i|e|\?)))?)?$')      
+        p13_1 = re.compile(r'(?P<path>[\d\.\s]+)'
                         ' *(?P<origin_codes>(i|e|\?))?$')
 
         p14 = re.compile(r'^Processed *(?P<processed_prefixes>[0-9]+) *'
@@ -3702,7 +3844,10 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
             m = p3.match(line)
             if m:
                 router_identifier = m.groupdict()['router_identifier']
-                local_as = int(m.groupdict()['local_as'])
+                try:
+                    local_as = int(m.groupdict()['local_as'])
+                except Exception:
+                    local_as = m.groupdict()['local_as']
                 continue
 
             # BGP generic scan interval 60 secs
@@ -3975,22 +4120,22 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
                     m1 = re.compile(r'^(?P<metric>[0-9]+)  +'
                                  '(?P<locprf>[0-9]+)  +'
                                  '(?P<weight>[0-9]+) '
-                                 '(?P<path>[0-9\{\}\s]+)$').match(group_num)
+                                 '(?P<path>[0-9\.\{\}\s]+)$').match(group_num)
     
                     # metric   locprf  weight path
                     # 2219                0 200 33299 51178 47751 {27016}
                     # locprf   weight path
-                    # 211         0 200 33299 51178 47751 {27016}
+                    # 211         0 200 33299 51178 47751 {27016} 65000.65000
     
                     m2 = re.compile(r'^(?P<value>[0-9]+)'
                                  '(?P<space>\s{2,20})'
                                  '(?P<weight>[0-9]+) '
-                                 '(?P<path>[0-9\{\}\s]+)$').match(group_num)
+                                 '(?P<path>[0-9\.\{\}\s]+)$').match(group_num)
     
                     # weight path
-                    # 0 200 33299 51178 47751 {27016}
+                    # 0 200 33299 51178 47751 {27016} 65000.65000
                     m3 = re.compile(r'^(?P<weight>[0-9]+) '
-                                 '(?P<path>((\d+\s)|(\{\d+\}\s))+)$')\
+                                 '(?P<path>(([\d\.]+\s)|(\{[\d\.]+\}\s))+)$')\
                                .match(group_num)
 
                     if m1:
@@ -4154,6 +4299,11 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
             else:
                 af = 'vpnv4 unicast'
         address_family = None
+
+        # p0 is for instances where the line has been wrapped around due to the network name being too long
+        # [5][0][64][2002:60:60:60::]/176
+        p0 = re.compile(r'^[\d\:\[\]\.]+/\d+$')
+
         p1 = re.compile(
             r'^BGP *instance *(?P<instance_number>[0-9]+): *(?P<instance>['
             r'a-zA-Z0-9\-\_\']+)$')
@@ -4162,16 +4312,25 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
         p3 = re.compile(r'^Route *Distinguisher: *(?P<route_distinguisher>\S+) *'
                         '(\(default *for *vrf (?P<default_vrf>[0-9A-Z]+)\))?$')
         p4 = re.compile(
-            r'^(?P<prefix>(?P<ip>[\w\.\:]+)/(?P<mask>\d+)) *(?P<next_hop>[\w\.\:]+) *('
+            r'^(?P<prefix>(?P<ip>[\w\.\:\[\]]+)/(?P<mask>\d+)) *(?P<next_hop>[\w\.\:]+) *('
             r'?P<froms>[\w\.\:]+) *'
-            '(?P<path>[\d\{\}\s]+)?(?P<origin_code>[e|i\?])?$')
-        p5_1 = re.compile(r'(?P<path>[\d\{\}\s]+)(?P<origin_code>e|i)?$')
+            r'(?P<path>[\d\.\{\}\s]+)?(?P<origin_code>[e|i\?])?$')
+        p5_1 = re.compile(r'(?P<path>[\d\.\{\}\s]+)(?P<origin_code>e|i)?$')
         p6 = re.compile(
             r'^Processed *(?P<processed_prefixes>[0-9]+) *prefixes, *(?P<processed_paths>[0-9]+) *paths$')
 
-        for line in out.splitlines():
+        line_iterator = iter(out.splitlines())
+        for line in line_iterator:
             line = line.strip()
 
+            # [5][0][64][2002:60:60:60::]/176
+            m = p0.match(line)
+            if m:
+                # Long network name has split the line, so combine the network
+                # name with the next line it goes with
+                line += next(line_iterator, None)
+                line = line.strip()
+
             # BGP instance 0: 'default'
 
             m = p1.match(line)
@@ -4231,6 +4390,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
             # 10.169.1.0/24        10.186.5.1        10.16.2.2         100 300 33299 51178 47751 {27016}e
             # 2001:db8:cdc9:121::/64     10.4.1.1         2001:db8:20:1:5::5
             # 10.4.1.1/32         10.4.1.1         Local           ?
+            # 10.8.8.8/32        10.10.10.108    Local           65108.65108?
 
             m = p4.match(line)
             if m:
@@ -4275,6 +4435,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
                     continue
 
             #                                                    200 33299 51178 47751 {27017}e
+            #                                                    200 33299 51178 65000.47751 {27017}e
 
             m = p5_1.match(line)
             if m:
@@ -4299,6 +4460,51 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
 
         return ret_dict
 
+# ===============================================================================
+# Parser for:
+# 'show <address_family> neighbors <neighbor> advertised-count'
+# ===============================================================================
+class ShowBgpNeighborsAdvertisedCountSchema(MetaParser):
+
+    """ Schema for:
+        show bgp <address_family> neighbors <neighbor> advertised-count
+    """
+
+    schema = {'prefixes_advertised': int}
+
+class ShowBgpNeighborsAdvertisedCount(ShowBgpNeighborsAdvertisedCountSchema):
+
+    """ Parser for:
+        show bgp <address_family> neighbors <neighbor> advertised-count
+
+
+        For checking any output with the parser ,below mandatory keys have to be in cli command.
+        - address_family
+        - neighbor
+    """
+    cli_command = ['show bgp {address_family} neighbors {neighbor} advertised-count']
+
+    def cli(self, address_family='', neighbor='', output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command[0].format(address_family=address_family,
+                                                  neighbor=neighbor))
+        else:
+            out = output
+
+        ret_dict = {}
+
+        # No of prefixes Advertised: 673
+        p0 = re.compile(r'^No of prefixes Advertised: (?P<prefixes_advertised>\d+)$')
+
+        line_iterator = iter(out.splitlines())
+        for line in line_iterator:
+            line = line.strip()
+            m = p0.match(line)
+            if m:
+                prefixes_advertised = m.groupdict()['prefixes_advertised']
+                ret_dict['prefixes_advertised'] = int(prefixes_advertised)
+
+        return ret_dict
 
 # ====================================================================
 # Parser for:
@@ -4325,7 +4531,7 @@ class ShowBgpInstanceNeighborsRoutesSchema(MetaParser):
                         {Optional('address_family'):
                             {Any():
                                 {Optional('router_identifier'): str,
-                                 Optional('local_as'): int,
+                                 Optional('local_as'): Or(int, str,),
                                  Optional('state'): str,
                                  Optional('vrf_id'): str,
                                  Optional('generic_scan_interval'): int,
@@ -4380,8 +4586,10 @@ class ShowBgpInstanceNeighborsRoutes(ShowBgpInstanceNeighborsRoutesSchema, ShowB
     """
 
     def cli(self, vrf_type='all', neighbor='', vrf='all', instance='all', address_family='', route_type='routes', output=None):
+        if 'received' in route_type:
+            self.schema = ShowBgpInstanceNeighborsReceivedRoutes.schema.copy()
         return super().cli(neighbor=neighbor, vrf_type=vrf_type, address_family=address_family,
-            route_type='routes', vrf=vrf, instance=instance, output=output)
+            route_type=route_type, vrf=vrf, instance=instance, output=output)
 
 
 # ====================================================
@@ -4521,7 +4729,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
         p10 = re.compile(r'^\s*BGP *table *state:'
                          ' *(?P<table_state>[a-zA-Z]+)$')
         p11 = re.compile(r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
-                         ' *RD *version: (?P<rd_version>[0-9]+)$')
+                         '(?: *RD *version: (?P<rd_version>[0-9]+))?$')
         p12 = re.compile(r'^\s*BGP *main *routing *table *version'
                          ' *(?P<bgp_table_version>[0-9]+)$')
         p13 = re.compile(r'^\s*BGP *NSR *Initial *initsync *version'
@@ -4530,7 +4738,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
         p14 = re.compile(r'^\s*BGP *NSR/ISSU *Sync-Group *versions'
                          ' *(?P<nsr_issu_sync_group_versions>[0-9\/]+)$')
         p15 = re.compile(
-            r'^\s*BGP *generic *scan *interval *(?P<scan_interval>[0-9]+) *secs$')
+            r'^\s*BGP *scan *interval *(?P<scan_interval>[0-9]+) *secs$')
         p16 = re.compile(
             r'^\s*BGP *is *operating *in *(?P<operation_mode>[a-zA-Z]+) *mode.$')
         p17 = re.compile(r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
@@ -4538,11 +4746,11 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
                          ' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
                          ' *(?P<standbyver>[0-9]+)$')
         p17_1 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
-        p17_2 = re.compile(r'^\s*(?P<spk>[0-9]+) +(?P<remote_as>[0-9]+)'
-                           ' +(?P<msg_rcvd>[0-9]+) +(?P<msg_sent>[0-9]+)'
-                           ' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
-                           ' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
-                           ' +(?P<state_pfxrcd>.+)$')
+        p17_2 = re.compile(r'^\s*(?P<spk>[0-9]+)\s+(?P<remote_as>[0-9\.]+)'
+                           '\s+(?P<msg_rcvd>[0-9]+)\s+(?P<msg_sent>[0-9]+)'
+                           '\s+(?P<tbl_ver>[0-9]+)\s+(?P<input_queue>[0-9]+)'
+                           '\s+(?P<output_queue>[0-9]+)\s+(?P<up_down>[a-z0-9\:]+)'
+                           '\s+(?P<state_pfxrcd>.+)$')
         p17_3 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
                            ' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
                            ' +(?P<msg_sent>[0-9]+)'
@@ -4701,9 +4909,10 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
             m = p11.match(line)
             if m:
                 table_id = str(m.groupdict()['table_id'])
-                rd_version = int(m.groupdict()['rd_version'])
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['table_id'] = table_id
-                bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['rd_version'] = rd_version
+                if m.groupdict()['rd_version']:
+                    rd_version = int(m.groupdict()['rd_version'])
+                    bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['rd_version'] = rd_version
                 continue
 
             # BGP main routing table version 63
@@ -4779,9 +4988,10 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
                     bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['neighbor'][neighbor] = {}
                     continue
             
-            # Neighbor        Spk    AS msg_rcvd msg_sent   TblVer  InQ OutQ  Up/Down  St/PfxRcd
-            #                   3   200       0       0        0    0    0 00:00:00 Idle
-            #                   0   200       0       0        0    0    0 00:00:00 Idle (Admin)!
+            # Neighbor        Spk    AS         msg_rcvd msg_sent   TblVer  InQ OutQ  Up/Down  St/PfxRcd
+            #                   3   200             0       0        0    0    0 00:00:00 Idle
+            #                   0   200             0       0        0    0    0 00:00:00 Idle (Admin)!
+            #                   0   60000.60001     0       0        0    0    0 00:00:00 Idle (Admin)!
 
             m = p17_2.match(line)
             if m and data_on_nextline:
@@ -4791,7 +5001,11 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
                 if address_family not in bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['neighbor'][neighbor]['address_family']:
                     bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['neighbor'][neighbor]['address_family'][address_family] = {}
 
-                bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['neighbor'][neighbor]['remote_as'] = int(m.groupdict()['remote_as'])
+                try:
+                    bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['neighbor'][neighbor]['remote_as'] = int(m.groupdict()['remote_as'])
+                except:
+                    bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['neighbor'][neighbor]['remote_as'] = m.groupdict()['remote_as']
+                
                 if route_distinguisher is not None:
                         bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['neighbor'][neighbor]['address_family'][address_family]['route_distinguisher'] =  route_distinguisher
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['neighbor'][neighbor]['address_family'][address_family]['spk'] = int(m.groupdict()['spk'])                
@@ -4868,7 +5082,7 @@ class ShowBgpInstanceAllAllSchema(MetaParser):
                                 {Optional('router_identifier'): str,
                                  Optional('vrf_id'): str,
                                  Optional('instance_number'): str,
-                                 Optional('local_as'): int,
+                                 Optional('local_as'): Or(int, str),
                                  Optional('vrf_state'): str,
                                  Optional('bgp_vrf'): str,
                                  Optional('generic_scan_interval'): str,
@@ -4997,8 +5211,9 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
         p5 = re.compile(r'^\s*VRF +ID: +(?P<vrf_id>(\S+))$')
 
         # BGP router identifier 10.4.1.1, local AS number 100
+        # BGP router identifier 10.10.10.108, local AS number 65108.65108
         p6 = re.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
-                        r' +local +AS +number +(?P<local_as>(\d+))$')
+                        r' +local +AS +number +(?P<local_as>([\d\.]+))$')
 
         # BGP generic scan interval 60 secs
         p7 =  re.compile(r'^\s*BGP +generic +scan +interval'
@@ -5046,8 +5261,9 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                            r'(?: +(?P<next_hop>\S+))?$')
 
         # 2219             0 200 33299 51178 47751 {27016} e
+        # 2219             0 200 33299 51178 47751 {27016} 65107.65107 e
         p16_2 = re.compile(r'^\s*(?P<metric>[0-9]+) +(?P<weight>[0-9]+)'
-                           r' +(?P<path>[0-9\{\}\s]+) '
+                           r' +(?P<path>[0-9\.\{\}\s]+) '
                            r'+(?P<origin_codes>(i|e|\?))$')
 
         # Network            Next Hop   Metric LocPrf Weight Path
@@ -5063,12 +5279,14 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
         # *>i10.9.2.0/24        10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
         # *>i10.169.1.0/24      10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
         # *>i192.168.111.0/24       10.189.99.98                                                    0       0 i
+        # *> 10.7.7.7/32        10.10.10.107             0             0 65107.65107 ?
         p16 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
-                         r' *(?P<prefix>(?P<ip>[0-9\.\:\[\]]+)/(?P<mask>\d+))?'
-                         r' +(?P<next_hop>\S+) +(?P<number>[\d\s\{\}]+)'
+                         r' *(?P<prefix>(?P<ip>[0-9\.\:\[\]]+)\/(?P<mask>\d+))?'
+                         r' +(?P<next_hop>\S+) +(?P<number>[\d\.\s\{\}]+)'
                          r'(?: *(?P<origin_codes>(i|e|\?)))?$')
 
-        p17 = re.compile(r'(?P<path>[\d\s]+)'
+        #                                                                 65107.65107 ?
+        p17 = re.compile(r'(?P<path>[\d\.\s]+)'
                          r' *(?P<origin_codes>(i|e|\?))?$')
 
         # Processed 40 prefixes, 50 paths
@@ -5142,11 +5360,16 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # BGP router identifier 10.4.1.1, local AS number 100
+            # BGP router identifier 10.10.10.108, local AS number 65108.65108
             m = p6.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['router_identifier'] = group['router_identifier']
-                af_dict['local_as'] = int(group['local_as'])
+              
+                try:
+                    af_dict['local_as']= int(group['local_as'])
+                except:
+                    af_dict['local_as']= group['local_as']
                 continue 
 
             # BGP generic scan interval 60 secs 
@@ -5239,6 +5462,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # 2219             0 200 33299 51178 47751 {27016} e
+            # 2219             0 200 33299 51178 47751 {27016} 65107.65107 e
             m = p16_2.match(line)
             if m:
                 group = m.groupdict()
@@ -5268,6 +5492,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             # *>i10.9.2.0/24        10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
             # *>i10.169.1.0/24      10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
             # *>i192.168.111.0/24       10.189.99.98                                                    0       0 i
+            # *> 10.7.7.7/32        10.10.10.107             0             0 65107.65107 ?
             m = p16.match(line)
             if m:
                 group = m.groupdict()
@@ -5288,9 +5513,9 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 
                 # Parse and set the numbers
                 group_num = group['number']
-                m1 = re.compile(r'^(?P<metric>[0-9]+)  +(?P<locprf>[0-9]+)  +(?P<weight>[0-9]+) (?P<path>[0-9\{\}\s]+)$').match(group_num)
-                m2 = re.compile(r'^(?P<value>[0-9]+)(?P<space>\s{2,20})(?P<weight>[0-9]+) (?P<path>[0-9\{\}\s]+)$').match(group_num)
-                m3 = re.compile(r'^(?P<weight>[0-9]+) (?P<path>((\d+\s)|(\{\d+\}\s))+)$').match(group_num)
+                m1 = re.compile(r'^(?P<metric>[0-9]+)  +(?P<locprf>[0-9]+)  +(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
+                m2 = re.compile(r'^(?P<value>[0-9]+)(?P<space>\s{2,20})(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
+                m3 = re.compile(r'^(?P<weight>[0-9]+) (?P<path>(([\d\.]+\s)|(\{[\d\.]+\}\s))+)$').match(group_num)
                 m4 = re.compile(r'^(?P<locprf>(\d+)) +(?P<weight>(\d+))$').match(group_num.strip())
                 if m1:
                     pfx_dict['metric'] = m1.groupdict()['metric']
@@ -5313,7 +5538,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                     pfx_dict['weight'] = m4.groupdict()['weight']
                 continue
 
-            # 
+            #                                                                 65107.65107 ?
             m = p17.match(line)
             if m:
                 group = m.groupdict()
@@ -6664,4 +6889,2875 @@ class ShowBgpSummary(ShowBgpInstanceSummary):
         # Call super
         return super().cli(output=out, address_family=address_family)
 
-# vim: ft=python ts=8 sw=4 et
+
+class ShowBgpL2vpnEvpnSummary(ShowBgpInstanceSummary):
+
+    ''' Parser for:
+        * 'show bgp l2vpn evpn summary'
+    '''
+
+    cli_command = ['show bgp l2vpn evpn summary']
+
+    def cli(self, output=None):
+
+        out = self.device.execute(self.cli_command[0])
+
+        # Call super
+        return super().cli(output=out, address_family='l2vpn evpn')
+
+
+# ===========================================
+# Schema for 'show bgp nexthops {ipaddress}'
+# ===========================================
+class ShowBgpNexthopsSchema(MetaParser):
+    '''Schema for:
+        * 'show bgp nexthops {ipaddress}'
+    '''
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'address_family': {
+                    Any(): {
+                        'nexthop': {
+                            Any(): {
+                                'nexthop_id': str,
+                                'version': str,
+                                'nexthop_flags': str,
+                                'nexthop_handle': str,
+                                'rib_related_information': {
+                                    'first_interface_handle': {
+                                        Any(): {
+                                            'gateway_tbl_id': str,
+                                            'gateway_flags': str,
+                                            'gateway_handle': str,
+                                            'gateway': str,
+                                            'resolving_route': str,
+                                            'paths': int,
+                                            'rib_nexthop_id': str,
+                                            'status': str,
+                                            'metric': int,
+                                            'registration': str,
+                                            'completed': str,
+                                            'events': str,
+                                            'last_received': str,
+                                            'last_gw_update': str,
+                                            'reference_count': int,
+                                        },
+                                    }
+                                },
+                                'prefix_related_information': {
+                                    'active_tables': str,
+                                    'metrics': str,
+                                    'reference_counts': int,
+                                },
+                                'interface_handle': str,
+                                'attr_ref_count': int,
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+
+# ===========================================
+# Parser for 'show bgp nexthops {ipaddress}'
+# ===========================================
+class ShowBgpNexthops(ShowBgpNexthopsSchema):
+    '''Parser for:
+        * 'show bgp nexthops {ipaddress}'
+    '''
+
+    cli_command = ['show bgp nexthops {ipaddress}']
+
+    def cli(self, ipaddress, output=None):
+
+        if output is None:
+            if ipaddress:
+                out = self.device.execute(self.cli_command[0].format(ipaddress=ipaddress))
+        else:
+            out = output
+
+        # Initialize dictionaries
+        ret_dict = {}
+        ipaddress_dict = {}
+        nexthop_address_dict = {}
+        nexthop_dict = {}        
+
+
+        # VRF: default
+        p1 = re.compile(r'^VRF:\s+(?P<vrf>([\w]+))$')
+
+        # Nexthop ID: 0x6000074, Version: 0x0
+        p2 = re.compile(r'^Nexthop ID:\s+(?P<nexthop_id>([\w]+)),\s+Version:\s+((?P<version>[\w]+))$')
+
+        # Nexthop Flags: 0x00000000
+        p3 = re.compile(r'^Nexthop Flags:\s+((?P<nexthop_flags>[\w]+))$')
+
+        # Nexthop Handle: 0x7fba00aafccc
+        p4 = re.compile(r'^Nexthop Handle:\s+((?P<nexthop_handle>[\w]+))$')
+
+        # Firsthop interface handle 0x0c001cc0
+        p5 = re.compile(r'^Firsthop interface handle\s+((?P<first_interface_handle>[\w]+))$')
+
+        # Gateway TBL Id: 0xe0000000    Gateway Flags: 0x00000080
+        p6 = re.compile(r'^Gateway TBL Id:\s+((?P<gateway_tbl_id>[\w]+)\s+)Gateway Flags:\s+((?P<gateway_flags>[\w]+))$')
+
+        # Gateway Handle: 0x7fba14059ce0
+        p7 = re.compile(r'^Gateway Handle:\s+((?P<gateway_handle>[\w]+))$')
+
+        # Gateway: reachable, non-Connected route, prefix length 32
+        p8 = re.compile(r'^Gateway:\s+((?P<gateway>[\s\S]+))$')
+
+        # Resolving Route: 10.4.16.16/32 (static)
+        p9 = re.compile(r'^Resolving Route:\s+((?P<resolving_route>[\s\S]+))$')        
+
+        # Paths: 0
+        p10 = re.compile(r'^Paths:\s+((?P<paths>[\d]+)\s*)$')
+
+        # RIB Nexhop ID: 0x0
+        p11 = re.compile(r'^RIB Nexhop ID:\s+((?P<rib_nexthop_id>[\w]+))$')
+
+        # Status: [Reachable][Not Connected][Not Local]
+        p12 = re.compile(r'^Status:\s+((?P<status>[\s\S]+))$')
+
+        # Metric: 0
+        p13 = re.compile(r'^Metric:\s+((?P<metric>[\d]+))$')
+
+        # Registration: Asynchronous, Completed: 00:02:15
+        p14 = re.compile(r'^Registration:\s+(?P<registration>[\w]+),\s+Completed:\s+((?P<completed>[\w\:]+))$')
+
+        # Events: Critical (1)/Non-critical (0)
+        p15 = re.compile(r'^Events:\s+((?P<events>[\s\S]+))$')
+
+        # Last Received: 00:02:14 (Critical)
+        p16 = re.compile(r'^Last Received:\s+((?P<last_received>[\s\S]+))$')
+
+        # Last gw update: (Crit-notif) 00:02:14(rib)
+        p17 = re.compile(r'^Last gw update:\s+((?P<last_gw_update>[\s\S]+))$')
+
+        # Reference Count: 1
+        p18 = re.compile(r'^Reference Count:\s+((?P<reference_count>[\d]+))$')
+
+        # Active Tables: [IPv4 Unicast]
+        p19 = re.compile(r'^Active Tables:\s+((?P<active_tables>[\s\S]+))$')
+
+        # Metrices: [0x0]
+        p20 = re.compile(r'^Metrices:\s+((?P<metrics>[\s\S]+))$')
+
+        # Reference Counts: [1]
+        p21 = re.compile(r'^Reference Counts:\s+(\[(?P<reference_counts>[\d]+)\])$')
+
+        # Interface Handle: 0x0
+        p22 = re.compile(r'^Interface Handle:\s+((?P<interface_handle>[\w]+))$')                        
+
+        # Attr ref-count: 4
+        p23 = re.compile(r'^Attr ref-count:\s+((?P<attr_ref_count>[\d]+))$')
+        
+        for line in out.splitlines():
+            line = line.strip()
+                
+            # VRF: default
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                vrf = group['vrf']
+
+                #define vrf_dict dictionary and set to 'vrf'
+                vrf_dict = ret_dict.setdefault('vrf', {})
+                
+                #define def_dict dictionary and assigned to vrf_dict
+                def_dict = vrf_dict.setdefault(vrf,{})
+
+                #define af_dict dictionary and set to 'address_family'
+                af_dict = def_dict.setdefault('address_family',{})                
+                continue
+            
+            # Nexthop ID: 0x6000074, Version: 0x0
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                #update nexthop_address_dict               
+                nexthop_address_dict.update({'nexthop_id': group['nexthop_id']})
+                nexthop_address_dict.update({'version': group['version']})
+                continue
+
+            # Nexthop Flags: 0x00000000
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                #update nexthop_address_dict
+                nexthop_address_dict.update({'nexthop_flags': group['nexthop_flags']})
+                continue
+
+            # Nexthop Handle: 0x7fba00aafccc
+            m = p4.match(line)
+            if m:
+                group = m.groupdict()
+                nexthop_address_dict.update({'nexthop_handle': group['nexthop_handle']})  
+                rib_related_dict = nexthop_address_dict.setdefault('rib_related_information',{})
+                continue
+
+            # Firsthop interface handle 0x0c001cc0
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                #set first_interface_handle_dict
+                first_interface_handle = group['first_interface_handle']
+                first_interface_handle_dict = rib_related_dict.setdefault('first_interface_handle',{})\
+                                                                .setdefault(first_interface_handle,{})                                                                             
+                continue            
+
+            # Gateway TBL Id: 0xe0000000    Gateway Flags: 0x00000080
+            m = p6.match(line)
+            if m:
+                group = m.groupdict()
+                #update first_interface_handle_dict
+                first_interface_handle_dict.update({'gateway_tbl_id':group['gateway_tbl_id']})
+                first_interface_handle_dict.update({'gateway_flags':group['gateway_flags']})
+                continue
+            
+            # Gateway Handle: 0x7fba14059ce0
+            m = p7.match(line)
+            if m:
+                group = m.groupdict()
+                #update first_interface_handle_dict
+                first_interface_handle_dict.update({'gateway_handle':group['gateway_handle']})
+                continue 
+            
+            # Gateway: reachable, non-Connected route, prefix length 32
+            m = p8.match(line)
+            if m:
+                group = m.groupdict()
+                #update first_interface_handle_dict
+                first_interface_handle_dict.update({'gateway':group['gateway']})
+                continue         
+            
+            # Resolving Route: 10.4.16.16/32 (static)
+            m = p9.match(line)
+            if m:
+                group = m.groupdict()
+                #update first_interface_handle_dict
+                first_interface_handle_dict.update({'resolving_route':group['resolving_route']})
+                continue 
+
+            # Paths: 0
+            m = p10.match(line)
+            if m:
+                group = m.groupdict()
+                #update first_interface_handle_dict
+                first_interface_handle_dict.update({'paths':int(group['paths'])}) 
+                continue       
+
+            # RIB Nexhop ID: 0x0
+            m = p11.match(line)
+            if m:
+                group = m.groupdict()
+                #update first_interface_handle_dict
+                first_interface_handle_dict.update({'rib_nexthop_id':group['rib_nexthop_id']})
+                continue 
+            
+            # Status: [Reachable][Not Connected][Not Local]
+            m = p12.match(line)
+            if m:
+                group = m.groupdict()
+                #update first_interface_handle_dict
+                first_interface_handle_dict.update({'status':group['status']})
+                continue         
+            
+            # Metric: 0
+            m = p13.match(line)
+            if m:
+                group = m.groupdict()
+                #update first_interface_handle_dict
+                first_interface_handle_dict.update({'metric':int(group['metric'])})
+                continue                      
+
+            # Registration: Asynchronous, Completed: 00:02:15
+            m = p14.match(line)
+            if m:
+                group = m.groupdict()
+                #update first_interface_handle_dict
+                first_interface_handle_dict.update({'registration':group['registration']})
+                first_interface_handle_dict.update({'completed':group['completed']})
+                continue   
+
+            # Events: Critical (1)/Non-critical (0)
+            m = p15.match(line)
+            if m:
+                group = m.groupdict()
+                #update first_interface_handle_dict
+                first_interface_handle_dict.update({'events':group['events']})
+                continue   
+
+            # Last Received: 00:02:14 (Critical)
+            m = p16.match(line)
+            if m:
+                group = m.groupdict()
+                #update first_interface_handle_dict
+                first_interface_handle_dict.update({'last_received':group['last_received']})
+                continue   
+
+            # Last gw update: (Crit-notif) 00:02:14(rib)
+            m = p17.match(line)
+            if m:
+                group = m.groupdict()
+                #update first_interface_handle_dict
+                first_interface_handle_dict.update({'last_gw_update':group['last_gw_update']})
+                continue                                      
+
+            # Reference Count: 1
+            m = p18.match(line)
+            if m:
+                group = m.groupdict()
+                #update first_interface_handle_dict
+                first_interface_handle_dict.update({'reference_count':int(group['reference_count'])})                
+                continue      
+
+            # Active Tables: [IPv4 Unicast]
+            m = p19.match(line)
+            if m:
+                group = m.groupdict()
+                #set prefix_related_dict
+                prefix_related_dict = nexthop_address_dict.setdefault('prefix_related_information',{}) 
+                #remove [] from [IPv4]
+                active_tables = group['active_tables'].replace('[','').replace(']','')
+                #update prefix_related_dict
+                prefix_related_dict.update({'active_tables':active_tables})
+                
+                #update top ipaddress_dict with child nexthop_address_dict dictionary
+                ipaddress_dict.update({ipaddress:nexthop_address_dict})
+
+                #update top nexthop_dict with child ipaddress_dict dictionary
+                nexthop_dict.update({'nexthop':ipaddress_dict})
+
+                #update top af_dict with child nexthop_dict dictionary
+                af_dict.update({active_tables:nexthop_dict})
+                continue  
+
+            # Metrices: [0x0]
+            m = p20.match(line)
+            if m:
+                group = m.groupdict()
+                metrics = group['metrics'].replace('[','').replace(']','')
+                #update prefix_related_dict
+                prefix_related_dict.update({'metrics':metrics})
+                continue 
+
+            # Reference Counts: [1]
+            m = p21.match(line)
+            if m:
+                group = m.groupdict()
+                #update prefix_related_dict
+                prefix_related_dict.update({'reference_counts':int(group['reference_counts'])})
+                continue   
+
+            # Interface Handle: 0x0
+            m = p22.match(line)
+            if m:
+                group = m.groupdict()
+                #update nexthop_address_dict
+                nexthop_address_dict.update({'interface_handle': group['interface_handle']})
+                continue   
+
+            # Attr ref-count: 4
+            m = p23.match(line)
+            if m:
+                group = m.groupdict()
+                #update nexthop_address_dict
+                nexthop_address_dict.update({'attr_ref_count': int(group['attr_ref_count'])})  
+                continue  
+
+        return ret_dict
+
+
+# ===========================================
+# Schema for 'show bgp all all nexthops'
+# ===========================================
+class ShowBgpAllAllNexthopsSchema(MetaParser):
+    '''Schema for:
+        * 'show bgp all all nexthops'
+    '''
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'address_family': {
+                    Any(): {
+                        Optional('total_next_hop'):{
+                            'time_spent_secs': float
+                        },
+                        Optional('maximum_next_hop'): {
+                            'received': str,
+                            'best_paths_deleted': int,
+                            'best_paths_changed': int,
+                            'time_spent_secs': float
+                        },
+                        Optional('last_notification'): {
+                            'received': str,
+                            'time_spent_secs': float
+                        },
+                        Optional('gateway_address_family'): str,
+                        Optional('table_id'): str,
+                        Optional('next_hop_count'): int,
+                        Optional('critical_trigger_delay'): str,
+                        Optional('non_critical_trigger_delay'): str,
+                        Optional('next_hop_version'):int,
+                        Optional('rib_version'):int,
+                        Optional('epe_table_version'): int,
+                        Optional('epe_label_version'): int,
+                        Optional('epe_downloaded_version'): int,
+                        Optional('epe_standby_version'): int,
+                        Optional('next_hops'):{
+                            Any():{
+                                'status': ListOf(str),
+                                'metric': int,
+                                'tbl_id': str,
+                                'notf': str,
+                                'last_rib_event': str,
+                                'ref_count': str
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+
+# ===========================================
+# Parser for 'show bgp all all nexthops'
+# ===========================================
+class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
+    '''Parser for:
+        * 'show bgp all all nexthops'
+    '''
+
+    cli_command = ['show bgp all all nexthops']
+
+    def cli(self, output=None):
+
+        if output is None:
+            out = self.device.execute(self.cli_command[0])
+        else:
+            out = output
+
+        # Initialize dictionaries
+        ret_dict = {}
+
+        # reference dict
+        ref_dict = {}
+
+        # Address Family: VPNv4 Unicast
+        p1 =  re.compile(r'^Address +Family: +(?P<address_family>[\S\s]+)$')
+
+        # Total Nexthop Processing
+        p2 = re.compile(r'^Total +Nexthop +Processing$')
+
+        # Maximum Nexthop Processing
+        p3 = re.compile(r'^Maximum +Nexthop +Processing$')
+
+        # Last Notification Processing
+        p4 = re.compile(r'^Last +Notification +Processing$')
+
+        # Time Spent: 0.000 secs
+        p5 = re.compile(r'^Time +Spent: +(?P<time_spent_secs>[\d\.]+) secs$')
+
+        # Received: 00:00:00
+        p6 = re.compile(r'^Received: +(?P<received>.+)$')
+
+        # Bestpaths Deleted: 0
+        p7 = re.compile(r'^Bestpaths +Deleted: +(?P<best_paths_deleted>[\S\s]+)$')
+
+        # Bestpaths Changed: 0
+        p8 = re.compile(r'^Bestpaths +Changed: +(?P<best_paths_changed>[\S\s]+)$')
+
+        # Gateway Address Family: IPv4 Unicast
+        p9 = re.compile(r'^Gateway +Address +Family: +(?P<gateway_address_family>[\S\s]+)$')
+
+        # Table ID: 0xe0000000
+        p10 = re.compile(r'^Table +ID: +(?P<table_id>[\S\s]+)$')
+
+        # Nexthop Count: 2
+        p11 = re.compile(r'^Nexthop +Count: +(?P<next_hop_count>[\S\s]+)$')
+
+        # Critical Trigger Delay: 0msec
+        p12 = re.compile(r'^Critical +Trigger +Delay: +(?P<critical_trigger_delay>[\S\s]+)$')
+
+        # Non-critical Trigger Delay: 10000msec
+        p13 = re.compile(r'^Non-critical +Trigger +Delay: +(?P<non_critical_trigger_delay>[\S\s]+)$')
+
+        # Nexthop Version: 1, RIB version: 1
+        p14 = re.compile(r'^Nexthop +Version: +(?P<next_hop_version>[\d]+), +RIB +version:'
+                         r' +(?P<rib_version>\d+)$')
+
+        # EPE Table Version: 1, EPE Label version: 1
+        p15 = re.compile(r'^EPE +Table +Version: +(?P<epe_table_version>[\d]+), +EPE +Label '
+                         r'+version: +(?P<epe_label_version>[\d]+)$')
+
+        # EPE Downloaded Version: 1, EPE Standby Version: 1
+        p16 = re.compile(r'^EPE +Downloaded +Version: +(?P<epe_downloaded_version>[\d]+), '
+                         r'+EPE +Standby +Version: +(?P<epe_standby_version>[\d]+)$')
+
+        # 108.10.10.1     [R][NC][NL]          2   e0000000   1/0    00:13:49 (Cri)        1/4
+        p17 = re.compile('^(?P<next_hop>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+(?P<status>[\S]+)\s+'
+                         '(?P<metric>\d+)\s+(?P<tbl_id>\S+)\s+(?P<notf>\S+)\s+(?P<last_rib_event>\S+'
+                         '\s\(\w+\))\s+(?P<ref_count>\S+)$')
+
+        # 2000:108:10:10::1
+        p18 = re.compile(r'^(?P<next_hop_ipv6>[a-fA-F\d\:]+)$')
+
+        # [R][NC][NL]          1   e0800000   1/0    00:12:06 (Cri)        0/3
+        p19 = re.compile(r'^(?P<status>[\S]+)\s+(?P<metric>\d+)\s+(?P<tbl_id>\S+)\s+(?P<notf>\S+)\s+'
+                         r'(?P<last_rib_event>\S+\s\(\w+\))\s+(?P<ref_count>\S+)$')
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            # Address Family: VPNv4 Unicast
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                address_family = group['address_family']
+
+                # define vrf_dict dictionary and set to 'vrf'
+                vrf_dict = ret_dict.setdefault('vrf', {})
+
+                # define def_dict dictionary and assigned to vrf_dict
+                def_dict = vrf_dict.setdefault('default', {})
+
+                # define af_dict dictionary and set to 'address_family'
+                af_dict = def_dict.setdefault('address_family', {})\
+                          .setdefault(address_family, {})
+                continue
+
+            # Total Nexthop Processing
+            m = p2.match(line)
+            if m:
+                ref_dict = af_dict.setdefault('total_next_hop', {})
+
+            # Maximum Nexthop Processing
+            m = p3.match(line)
+            if m:
+                ref_dict = af_dict.setdefault('maximum_next_hop', {})
+
+            # Last Notification Processing
+            m = p4.match(line)
+            if m:
+                ref_dict = af_dict.setdefault('last_notification', {})
+
+            # Time Spent: 0.000 secs
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                time_spent_secs = float(group['time_spent_secs'])
+                ref_dict.update({'time_spent_secs':time_spent_secs})
+                continue
+
+            # Received: 00:00:00
+            m = p6.match(line)
+            if m:
+                group = m.groupdict()
+                received = group['received']
+                ref_dict.update({'received' : received})
+                continue
+
+            # Bestpaths Deleted: 0
+            m = p7.match(line)
+            if m:
+                group = m.groupdict()
+                best_path_deleted = int(group['best_paths_deleted'])
+                af_dict['maximum_next_hop']['best_paths_deleted'] = best_path_deleted
+                continue
+
+            # Bestpaths Changed: 0
+            m = p8.match(line)
+            if m:
+                group = m.groupdict()
+                best_path_changed = int(group['best_paths_changed'])
+                af_dict['maximum_next_hop']['best_paths_changed'] =  best_path_changed
+                continue
+
+            # Gateway Address Family: IPv4 Unicast
+            m = p9.match(line)
+            if m:
+                group = m.groupdict()
+                gateway_address_family = group['gateway_address_family']
+                af_dict.setdefault('gateway_address_family', gateway_address_family)
+                continue
+
+            # Table ID: 0xe0000000
+            m = p10.match(line)
+            if m:
+                group = m.groupdict()
+                table_id = group['table_id']
+                af_dict.setdefault('table_id', table_id)
+                continue
+
+            # Nexthop Count: 2
+            m = p11.match(line)
+            if m:
+                group = m.groupdict()
+                next_hop_count = int(group['next_hop_count'])
+                af_dict.setdefault('next_hop_count', next_hop_count)
+                continue
+
+            # Critical Trigger Delay: 0msec
+            m = p12.match(line)
+            if m:
+                group = m.groupdict()
+                critical_trigger_delay = group['critical_trigger_delay']
+                af_dict.setdefault('critical_trigger_delay', critical_trigger_delay)
+                continue
+
+            # Non-critical Trigger Delay: 10000msec
+            m = p13.match(line)
+            if m:
+                group = m.groupdict()
+                non_critical_trigger_delay = group['non_critical_trigger_delay']
+                af_dict.setdefault('non_critical_trigger_delay', non_critical_trigger_delay)
+                continue
+
+            # Nexthop Version: 1, RIB version: 1
+            m = p14.match(line)
+            if m:
+                group = m.groupdict()
+                next_hop_version = int(group['next_hop_version'])
+                rib_version = int(group['rib_version'])
+                af_dict.update({
+                    'next_hop_version': next_hop_version,
+                    'rib_version': rib_version
+                })
+                continue
+
+            # EPE Table Version: 1, EPE Label version: 1
+            m = p15.match(line)
+            if m:
+                group = m.groupdict()
+                epe_table_version = int(group['epe_table_version'])
+                epe_label_version = int(group['epe_label_version'])
+                af_dict.update({
+                    'epe_table_version': epe_table_version,
+                    'epe_label_version': epe_label_version
+                })
+                continue
+
+            # EPE Downloaded Version: 1, EPE Standby Version: 1
+            m = p16.match(line)
+            if m:
+                group = m.groupdict()
+                epe_downloaded_version = int(group['epe_downloaded_version'])
+                epe_standby_version = int(group['epe_standby_version'])
+                af_dict.update({
+                    'epe_downloaded_version': epe_downloaded_version,
+                    'epe_standby_version': epe_standby_version
+                })
+                continue
+
+            # 108.10.10.1     [R][NC][NL]          2   e0000000   1/0    00:13:49 (Cri)        1/4
+            m = p17.match(line)
+            if m:
+                group = m.groupdict()
+                next_hop = group['next_hop']
+                status_dict = af_dict.setdefault('next_hops', {}).setdefault(next_hop, {})
+                status_dict.update({
+                    'status' : group['status'].replace("[", "").split("]")[:-1],
+                    'metric' :  int(group['metric']),
+                    'tbl_id' : group['tbl_id'],
+                    'notf' : group['notf'],
+                    'last_rib_event' : group['last_rib_event'],
+                    'ref_count' : group['ref_count']
+                })
+                continue
+
+            # 2000:108:10:10::1
+            m = p18.match(line)
+            if m:
+                group = m.groupdict()
+                next_hop_ipv6 = group['next_hop_ipv6']
+                status_dict = af_dict.setdefault('next_hops', {}).setdefault(next_hop_ipv6, {})
+                continue
+
+            # [R][NC][NL]          1   e0800000   1/0    00:12:06 (Cri)        0/3
+            m = p19.match(line)
+            if m:
+                group = m.groupdict()
+                status_dict.update({
+                    'status': group['status'].replace("[", "").split("]")[:-1],
+                    'metric': int(group['metric']),
+                    'tbl_id': group['tbl_id'],
+                    'notf': group['notf'],
+                    'last_rib_event': group['last_rib_event'],
+                    'ref_count': group['ref_count']
+                })
+                continue
+
+        return ret_dict
+
+
+# ==========================================================
+# Schema for 'show bgp {address_family} {ip_address} brief'
+# ==========================================================
+class ShowBgpBriefSchema(MetaParser):
+    '''Schema for:
+        * 'show bgp {address_family} {ip_address} brief'
+    '''
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'address_family': {
+                    Any(): {
+                        'network': {
+                            Any(): {
+                                'next_hops': {
+                                    Any(): {
+                                        'metric': int,
+                                        'locprf': int,
+                                        'weight': int,
+                                        'path': str
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+# ==========================================================
+# Parser for 'show bgp {address_family} {ip_address} brief'
+# ==========================================================
+class ShowBgpBrief(ShowBgpBriefSchema):
+    '''Parser for:
+        * 'show bgp {address_family} {ip_address} brief'
+    '''
+
+    cli_command = ['show bgp {address_family} {ip_address} brief']
+
+    def cli(self, address_family, ip_address, output=None):
+
+        if output is None:
+            out = self.device.execute(self.cli_command[0].\
+                                      format(address_family=address_family,\
+                                      ip_address=ip_address))
+        else:
+            out = output
+
+        # Initialize dictionaries
+        ret_dict = {}
+
+        # *> 111.111.111.111/32 108.10.0.2               0           100 65401 i
+        # *                     108.11.0.2               0             0 65401 i
+        p1 = re.compile('^.*\s(?P<next_hop>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
+                        '(?P<metric>\d+)\s+(?P<locprf>\d+)\s+(?P<weight>\d+)\s+'
+                        '(?P<path>\D)$')
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            # *> 111.111.111.111/32 108.10.0.2               0           100 65401 i
+            # *                     108.11.0.2               0             0 65401 i
+            m = p1.match(line)
+            if m:
+                # define vrf_dict dictionary and set to 'vrf'
+                vrf_dict = ret_dict.setdefault('vrf', {})
+
+                # define def_dict dictionary and assigned to vrf_dict
+                def_dict = vrf_dict.setdefault('default', {})
+
+                # define af_dict dictionary and set to 'address_family'
+                af_dict = def_dict.setdefault('address_family', {}) \
+                          .setdefault(address_family, {})
+
+                # define net_dict and assigned to af_dict dictionary
+                net_dict = af_dict.setdefault('network', {}) \
+                           .setdefault(ip_address, {})
+
+                group = m.groupdict()
+                next_hop = group['next_hop']
+
+                # define next_hops_dict and assigned to net_dict dictionary
+                next_hops_dict = net_dict.setdefault('next_hops', {}) \
+                                 .setdefault(next_hop, {})
+
+                next_hops_dict.update({
+                    'metric': int(group['metric']),
+                    'locprf': int(group['locprf']),
+                    'weight': int(group['weight']),
+                    'path': group['path']
+                })
+                continue
+
+        return ret_dict
+
+
+
+# ======================================================================
+# Schema for 'show bgp {address_family} {ip_address} bestpath-compare'
+# ======================================================================
+class ShowBgpBestpathCompareSchema(MetaParser):
+    '''Schema for:
+        * 'show bgp {address_family} {ip_address} bestpath-compare'
+    '''
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'address_family': {
+                    Any(): {
+                        'network': {
+                            Any(): {
+                                Optional('versions'): {
+                                    Optional('process'):{
+                                        Optional(Any()):{
+                                            Optional('brib/rib'): int,
+                                            Optional('send_tbl_ver'): int,
+                                        }
+                                    },
+                                },
+                                Optional('last_modified'): str,
+                                Optional('available_paths'): int,
+                                Optional('best_path'): int,
+                                Optional('paths'): {
+                                    Optional(Any()):{
+                                        Optional('paths_to_update_groups'): ListOf(str),
+                                        Optional('next_hop'): str,
+                                        Optional('gateway'): str,
+                                        Optional('originator'): str,
+                                        Optional('metric'): int,
+                                        Optional('localpref'): int,
+                                        Optional('weight'): int,
+                                        Optional('status_codes'): str,
+                                        Optional('origin_codes'): str,
+                                        Optional('received_path_id'): int,
+                                        Optional('local_path_id'): int,
+                                        Optional('version'): int,
+                                        Optional('origin_as_validity'): str
+                                    }
+                                },
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+# ======================================================================
+# Parser for 'show bgp {address_family} {ip_address} bestpath-compare'
+# ======================================================================
+class ShowBgpBestpathCompare(ShowBgpBestpathCompareSchema):
+    '''Parser for:
+        * 'show bgp {address_family} {ip_address} bestpath-compare'
+    '''
+
+    cli_command = ['show bgp {address_family} {ip_address} bestpath-compare']
+
+    def cli(self, address_family, ip_address, output=None):
+
+        if output is None:
+            out = self.device.execute(self.cli_command[0].\
+                                      format(address_family=address_family,\
+                                             ip_address=ip_address))
+        else:
+            out = output
+
+        # Initialize dictionary
+        ret_dict = {}
+        next_line_update_group = False
+
+        # Speaker                  5           5
+        p1 = re.compile('^(?P<process>\w+)\s+(?P<brib_rib>\d+)\s+(?P<send_tbl_ver>\d+)$')
+
+        # Last Modified: Mar  9 02:23:41.504 for 00:00:35
+        p2 = re.compile('^Last +Modified: (?P<last_modified>.*)$')
+
+        # Paths: (2 available, best #1)
+        p3 = re.compile('^Paths: +\((?P<available_paths>\d+) +available\, '
+                        '+best +\#(?P<best_path>\d+)\)$')
+
+        # Path #1: Received by speaker 0
+        p4 = re.compile('^Path+ #(?P<path_num>\d+).*$')
+
+        # Advertised IPv4 Unicast paths to update-groups (with more than one peer):
+        p5 = re.compile('^.*(?P<group2>update-groups).*$')
+
+        # Not advertised to any peer
+        p6 = re.compile(r'^Not +advertised +to +any +peer$')
+
+        # 0.1 0.3
+        p7 = re.compile('^(?P<group1>[\d\.]+)(?: +(?P<group2>[\d\.]+))$')
+
+        # 108.10.0.2 from 108.10.0.2 (192.68.33.108)
+        p8 = re.compile('^((?P<next_hop>[0-9\.]+)+ from +(?P<gateway>[0-9\.]+) '
+                        '+\((?P<originator>[0-9\.]+)\))$')
+
+        # Origin IGP, metric 0, localpref 100, weight 100, valid, external, best, group-best
+        p9 = re.compile('^Origin +(?P<origin>[a-zA-Z]+),(?: '
+                        '+metric (?P<metric>[0-9]+),?)?(?: '
+                        '+localpref (?P<localpref>[0-9]+),?)?(?: '
+                        '+weight (?P<weight>[0-9]+),?)?(?: '
+                        '+(?P<valid>valid?,))?(?: '
+                        '+(?P<state>(internal|external|local)\,?))?(\,)?(?: '
+                        '(?P<best>best))?(\,)?(?: (?P<group_best>group-best))?$')
+
+        #  Received Path ID 0, Local Path ID 0, version 0
+        p10 = re.compile('^Received Path ID (?P<received_path_id>(\d+)), Local Path ID '
+                        '(?P<local_path_id>(\d+)), version (?P<version>(\d+))$')
+
+        # Origin-AS validity: (disabled)
+        p11 = re.compile('^Origin-AS validity: \((?P<origin_as_validity>\w+)\)$')
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            #  Speaker                  5           5
+            m = p1.match(line)
+            if m:
+                # define vrf_dict dictionary and set to 'vrf'
+                vrf_dict = ret_dict.setdefault('vrf', {})
+
+                # define def_dict dictionary and assigned to vrf_dict
+                def_dict = vrf_dict.setdefault('default', {})
+
+                # define af_dict dictionary and set to 'address_family'
+                af_dict = def_dict.setdefault('address_family', {}) \
+                          .setdefault(address_family, {})
+
+                # define net_dict and assigned to af_dict dictionary
+                net_dict = af_dict.setdefault('network', {}) \
+                           .setdefault(ip_address, {})
+
+                group = m.groupdict()
+                process = group['process']
+
+                # define ver_dict and assigned to net_dict dictionary
+                ver_dict = net_dict.setdefault('versions', {})
+
+                # define process_dict and assigned to ver_dict dictionary
+                process_dict = ver_dict.setdefault('process', {}).\
+                                        setdefault(process, {})
+
+                process_dict.update({
+                    'brib/rib': int(group['brib_rib']),
+                    'send_tbl_ver': int(group['send_tbl_ver'])
+                })
+                continue
+
+            # Last Modified: Mar  9 02:23:41.504 for 00:00:35
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                net_dict.update({'last_modified': group['last_modified']})
+                continue
+
+            # Paths: (2 available, best #1)
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                net_dict.update({
+                    'available_paths': int(group['available_paths']),
+                    'best_path': int(group['best_path'])
+                })
+                #Initialize paths_dict
+                paths_dict = net_dict.setdefault('paths', {})
+                continue
+
+            # Path #1: Received by speaker 0
+            m = p4.match(line)
+            if m:
+                group = m.groupdict()
+                path = int(group['path_num'])
+                each_path_dict = paths_dict.setdefault(path,{})
+                continue
+
+            #  Advertised IPv4 Unicast paths to update-groups (with more than one peer):
+            m = p5.match(line)
+            if m:
+                next_line_update_group = True
+                continue
+
+            # Not advertised to any peer
+            m = p6.match(line)
+            if m:
+                next_line_update_group = False
+                continue
+
+            # 0.1 0.3
+            m = p7.match(line)
+            if m and next_line_update_group:
+                group = m.group()
+                update_group = group.split(" ")
+                next_line_update_group = False
+
+                try:
+                    if update_group:
+                        each_path_dict['paths_to_update_groups'] = update_group
+                except Exception:
+                    pass
+                continue
+
+            #  108.10.0.2 from 108.10.0.2 (192.68.33.108)
+            m = p8.match(line)
+            if m:
+                group = m.groupdict()
+                each_path_dict.update({
+                    'next_hop': group['next_hop'],
+                    'gateway': group['gateway'],
+                    'originator': group['originator']
+                })
+                continue
+
+            # Origin IGP, metric 0, localpref 100, valid, external
+            # Origin IGP, metric 0, localpref 100, weight 100, valid, external, best, group-best
+            m = p9.match(line)
+            if m:
+                group = m.groupdict()
+                status_codes = ''
+                if group['metric']:
+                    each_path_dict['metric'] = int(group['metric'])
+                if group['localpref']:
+                    each_path_dict['localpref'] = int(group['localpref'])
+                if group['weight']:
+                    each_path_dict['weight'] = int(group['weight'])
+
+                if group['origin']:
+                    origin = str(group['origin'])
+                    if origin == 'incomplete':
+                        each_path_dict['origin_codes'] = '?'
+                    elif origin == 'EGP':
+                        each_path_dict['origin_codes'] = 'e'
+                    else:
+                        each_path_dict['origin_codes'] = 'i'
+
+                if group['valid']:
+                    status_codes += '*'
+                if group['best']:
+                    status_codes = status_codes.rstrip()
+                    status_codes += '>'
+                if group['state']:
+                    state = group['state']
+                    if state == 'internal':
+                        status_codes += 'i'
+                each_path_dict['status_codes'] = status_codes
+                continue
+
+            # Received Path ID 0, Local Path ID 0, version 0
+            m = p10.match(line)
+            if m:
+                group = m.groupdict()
+                each_path_dict.update({
+                    'received_path_id': int(group['received_path_id']),
+                    'local_path_id': int(group['local_path_id']),
+                    'version': int(group['version'])
+                })
+                continue
+
+            # Origin-AS validity: (disabled)
+            m = p11.match(line)
+            if m:
+                group = m.groupdict()
+                each_path_dict.update({
+                    'origin_as_validity': group['origin_as_validity']
+                })
+                continue
+        return ret_dict
+
+
+# ======================================================================
+# Schema for 'show bgp vrf {vrf_name} {address_family} {prefix}'
+# ======================================================================
+class ShowBgpVrfAfPrefixSchema(MetaParser):
+    '''Schema for:
+        * 'show bgp vrf {vrf_name} {address_family} {prefix}'
+        * 'show bgp {address_family} vrf {vrf_name} {prefix}'
+    '''
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'address_family': {
+                    Any(): {
+                        'prefix': str,
+                        Optional('rd'): str,
+                        'last_modified': str,
+                        Optional('local_label'): str,
+                        'paths': {
+                            'total_available_paths': int,
+                            'best_path': int,
+                            'path': {
+                                Any(): {
+                                    Optional('advertised_peer_pe'): str,
+                                    Optional('advertised_peer_ce'): str,
+                                    'as_path': {
+                                        Any(): {
+                                            'bgp_peer_neighbor_ip': {
+                                                Any(): {
+                                                    Optional('metric'): int,
+                                                    'origin_neighbors_ip': str,
+                                                    'origin_router_id': str,
+                                                    Optional('if_handle'): str,
+                                                    'bgp_peer_neighbor_ip': str,
+                                                    Optional('originator'): str,
+                                                    Optional('received_label'): str,
+                                                    Optional('origin_metric'): int,
+                                                    Optional('weight'): int,
+                                                    'localpref': int,
+                                                    'origin_codes': str,
+                                                    'status_codes': str,
+                                                    Optional('group_best'): str,
+                                                    Optional('backup'): str,
+                                                    Optional('add_path'): str,
+                                                    Optional('import_candidate'): str,
+                                                    Optional('imported'): str,
+                                                    Optional('not_in_vrf'): str,
+                                                    Optional('redistributed'): str,
+                                                    'received_path_id': int,
+                                                    'local_path_id': int,
+                                                    'version': int,
+                                                    Optional('extended_community'): str,
+                                                    Optional('cluster_list'): str,
+                                                    Optional('source_afi'): str,
+                                                    Optional('source_vrf'): str,
+                                                    Optional('source_rd'): str,
+                                                    Optional('psid_type'): {
+                                                        Any(): {
+                                                            'psid_type': str,
+                                                            'subtlv_count': int,
+                                                            Optional('r_value'): str,
+                                                            Optional('subtlv'): {
+                                                                't_value': str,
+                                                                'sid_value': str,
+                                                                'f_value': str,
+                                                                'r2_value': str,
+                                                                'behaviour': str,
+                                                                'r3_value': str,
+                                                                'sstlv_count': int,
+                                                                Optional('subsubtlv'): {
+                                                                    't': {
+                                                                        Any(): {
+                                                                            'loc_blk': str,
+                                                                            'loc_node': str,
+                                                                            'func': str,
+                                                                            'arg': str,
+                                                                            'tpose_len': str,
+                                                                            'tpose_offset': str
+                                                                        }
+                                                                    }
+                                                                }
+                                                            }
+                                                        }
+                                                    }
+                                                }
+                                            }
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+# ======================================================================
+# Parser for 'show bgp vrf {vrf_name} {address_family} {prefix}'
+# ======================================================================
+class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
+    '''Parser for:
+        * 'show bgp vrf {vrf_name} {address_family} {prefix}'
+        * 'show bgp {address_family} vrf {vrf_name} {prefix}'
+    '''
+
+    cli_command = ['show bgp vrf {vrf_name} {address_family} {prefix}',
+                   'show bgp {address_family} vrf {vrf_name} {prefix}',
+                   'show bgp {address_family} rd {route_rd} detail',
+                   'show bgp {address_family} {route} detail']
+
+    def cli(self, vrf_name=None, address_family=None, prefix=None, route=None, route_rd=None, output=None):
+
+        if output is None:
+            if route_rd:
+                out = self.device.execute(self.cli_command[2].\
+                                      format(address_family=address_family,\
+                                             route_rd=route_rd))
+            elif route:
+                out = self.device.execute(self.cli_command[3].\
+                                      format(address_family=address_family,\
+                                             route=route))
+            elif address_family == 'ipv4' or address_family == 'ipv6':
+                out = self.device.execute(self.cli_command[0].\
+                                      format(vrf_name=vrf_name,\
+                                             address_family=address_family,\
+                                             prefix=prefix))
+            else:
+                out = self.device.execute(self.cli_command[1].\
+                                      format(vrf_name=vrf_name,\
+                                             address_family=address_family,\
+                                             prefix=prefix))
+        else:
+            out = output
+        
+        # BGP routing table entry for 2000:71:1:1::1/128, Route Distinguisher: 50.1.1.4:2
+        # BGP routing table entry for [1][0000.0000.0000.0001.0500][10001]/120, Route Distinguisher: 10.0.0.1:1001
+        # BGP routing table entry for fc00:a000:1000:101::2/128
+        p1 = re.compile(r'^BGP\s+routing\s+table\s+entry\s+for\s+(?P<prefix>(?P<ip>[a-z0-9.:\/\[\]]+)\/(?P<mask>\d+))'
+                        r'(?:,\s+Route\s+Distinguisher:\s+(?P<rd>[\d.:]+))?$')
+
+        # Last Modified: Mar 27 02:45:20.105 for 1d15h
+        p2 = re.compile(r'^Last +Modified: (?P<last_modified>.*)$')
+
+        # Paths: (1 available, best #1)
+        p3 = re.compile(r'^Paths:\s+\((?P<total_available_paths>\d+)\s+available,\s+best\s+#(?P<best_path>\d+)\)$')
+
+        # Not advertised to any peer
+        p4 = re.compile(r'^Not\s+advertised\s+to\s+any\s+peer$')
+
+        # Advertised to PE peers (in unique update groups):
+        # Advertised to CE peers (in unique update groups):
+        p5 = re.compile(r'^Advertised\s+to\s+(?P<peer_name>[a-zA-Z0-9]+)\s+peers\s+\(in\s+unique\s+update\s+groups\):$')
+
+        # Path #1: Received by speaker 0
+        p6 = re.compile(r'^Path\s+#(?P<path_num>\d+):.*$')
+
+        # 50.1.1.8
+        # 2000:90:11:1::2
+        # fd00:ffff:100:11::2
+        p7 = re.compile(r'^(?P<advertised_peer>[a-f0-9.:]+)$') # ^(?P<advertised_peer>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})$
+
+        # 7000
+        # Local
+        p8 = re.compile(r'^(?P<as_path>[a-zA-Z0-9]+)$')
+
+        # 50.1.1.1 (metric 4) from 50.1.1.8 (50.1.1.1)
+        # 2000:90:33:1::2 from 2000:90:33:1::2 (70.3.3.3)
+        # :: from :: (50.1.1.4)
+        # fc00:a000:1000::1 (metric 30) from fc00:a000:2000::14 (10.0.0.1), if-handle 0x00000000
+        p9 = re.compile(r'^(?P<bgp_peer_neighbor_ip>[\w.:]+)\s+(?:\(metric\s+(?P<metric>\d+)\)\s+)?'
+                        r'from\s+(?P<origin_neighbors_ip>[\w.:]+)\s*(?:\((?P<origin_router_id>[\w.:]+)\))?'
+                        r'(?:,\s+if-handle\s+(?P<if_handle>[\w]+))?')
+
+        # Local Label: 24023
+        # Received Label 24000
+        # Received Label 0xe0030
+        p10 = re.compile(r'^(?P<label_name>\w+)\s+Label:*\s+(?P<label_value>\w+)$')
+
+        # Origin incomplete, metric 0, localpref 100, valid, internal, best, group-best, import-candidate, imported
+        # Origin IGP, metric 0, localpref 100, valid, external, best, group-best, import-candidate
+        # Origin incomplete, metric 0, localpref 100, weight 32768, valid, redistributed, best, group-best, import-candidate
+        # Origin incomplete, metric 0, localpref 100, valid, internal, backup, add-path, import-candidate, imported
+        # Origin IGP, localpref 100, valid, internal, best, group-best, import-candidate, not-in-vrf
+        p11 = re.compile(r'^Origin +(?P<origin>[a-zA-Z]+),'
+                         r'(?: +metric (?P<metric>[0-9]+),?)?'
+                         r'(?: +localpref (?P<localpref>[0-9]+),?)?'
+                         r'(?: +weight (?P<weight>[0-9]+),?)?'
+                         r'(?: +(?P<valid>valid?),)?'
+                         r'(?: (?P<redistributed>redistributed?),)?'
+                         r'(?: +(?P<state>(internal|external|local)?),)?(\,*)?'
+                         r'(?: (?P<best>best))?(\,*)?'
+                         r'(?: (?P<group_best>group-best?),*)?'
+                         r'(?: (?P<backup>backup),*)?'
+                         r'(?: (?P<add_path>add-path),*)?'
+                         r'(?: (?P<import_candidate>import-candidate?),*)?'
+                         r'(?: (?P<imported>imported?),*)?'
+                         r'(?:\s+(?P<not_in_vrf>not-in-vrf))?')
+
+        #  Received Path ID 0, Local Path ID 0, version 715
+        p12 = re.compile(r'^Received\s+Path\s+ID\s+(?P<received_path_id>(\d+)),\s+'
+                         r'Local\s+Path\s+ID\s+(?P<local_path_id>(\d+)),\s+'
+                         r'version\s+(?P<version>(\d+))$')
+
+        # Extended community: RT:100:1001
+        p13 = re.compile(r'^Extended\s+community:(?:\s+(?P<extended_community>.*))?$')
+
+        # Originator: 50.1.1.1, Cluster list: 50.1.1.8
+        # Originator: 10.0.0.3, Cluster list: 10.0.0.11, 10.0.0.13
+        p14 = re.compile(r'^Originator:\s+(?P<originator>[\d.]+),\s+Cluster\s+list:\s+(?P<cluster_list>[\d., ]+)$')
+
+        # Source AFI: VPNv6 Unicast, Source VRF: default, Source Route Distinguisher: 50.1.1.1:0
+        # Source AFI: VPNv6 Unicast, Source VRF: SRV6_L3VPN_BE, Source Route Distinguisher: 100:1
+        p15 = re.compile(r'^Source\s+AFI:\s+(?P<source_afi>[a-zA-Z0-9 ]+),\s+Source\s+VRF:\s+(?P<source_vrf>[a-zA-Z0-9_]+)'
+                         r',\s+Source\s+Route\s+Distinguisher:\s+(?P<source_rd>[\d.:]+)$')
+        
+        # PSID-Type:L3, SubTLV Count:1, R:0x00,
+        p16 = re.compile(r'^PSID-Type:(?P<psid_type>\w+),\s+SubTLV\s+Count:(?P<subtlv_count>\d+)(?:(,\s+R:(?P<r_value>\w+),))?$')
+
+        # SubTLV:
+        # SubSubTLV:
+        p17 = re.compile(r'^(?P<tlv_name>SubTLV|SubSubTLV):$')
+
+        # T:1(Sid information), Sid:fc00:c000:2003::, F:0x00, R2:0x00, Behavior:62, R3:0x00, SS-TLV Count:1
+        p18 = re.compile(r'^T:(?P<t_value>\d+)\(Sid\s+information\),\s+Sid:(?P<sid_value>[a-f0-9.:]+),\s+'
+                         r'F:(?P<f_value>\w+),\s+R2:(?P<r2_value>\w+),\s+Behavior:(?P<behaviour>\d+),\s+'
+                         r'R3:(?P<r3_value>\w+),\s+SS-TLV\s+Count:(?P<sstlv_count>\d+)$')
+        
+        # T:1(Sid structure):
+        p19 = re.compile(r'^T:(?P<t_value>\d+)\(Sid\s+structure\):$')
+
+        # Length [Loc-blk,Loc-node,Func,Arg]:[32,16,16,0], Tpose-len:16, Tpose-offset:48
+        p20 = re.compile(r'^Length\s+\[Loc-blk,Loc-node,Func,Arg\]:\[(?P<loc_blk>\d+),(?P<loc_node>\d+),'
+                         r'(?P<func>\d+),(?P<arg>\d+)\],\s+Tpose-len:(?P<tpose_len>\d+),\s+Tpose-offset:(?P<tpose_offset>\d+)$')
+
+        # Initialize dictionary
+        ret_dict = {}
+        if vrf_name == None:
+            vrf_name = 'default'
+        next_line_update_group = False
+        if address_family:
+            if 'ipv4' in address_family:
+                address_family = 'ipv4 unicast'
+            elif 'ipv6' in address_family:
+                address_family = 'ipv6 unicast'
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            # BGP routing table entry for 2000:71:1:1::1/128, Route Distinguisher: 50.1.1.4:2
+            # BGP routing table entry for [1][0000.0000.0000.0001.0500][10001]/120, Route Distinguisher: 10.0.0.1:1001
+            # BGP routing table entry for fc00:a000:1000:101::2/128
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                address_family = address_family.replace(' ','_')
+                vrf_dict = ret_dict.setdefault('vrf', {}).\
+                                    setdefault(vrf_name, {}).\
+                                    setdefault('address_family', {}).\
+                                    setdefault(address_family, {})
+                
+                vrf_dict['prefix'] = group['prefix']
+                if group['rd']:
+                    vrf_dict['rd'] = group['rd']
+                continue
+
+            # Last Modified: Mar 27 02:45:20.105 for 1d15h
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                vrf_dict['last_modified'] = group['last_modified']
+                continue
+
+            # Paths: (1 available, best #1)
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                paths_dict = vrf_dict.setdefault('paths', {})
+                paths_dict['total_available_paths'] = int(group['total_available_paths'])
+                paths_dict['best_path'] = int(group['best_path'])
+                continue
+
+            # Not advertised to any peer
+            m = p4.match(line)
+            if m:
+                next_line_update_group = False
+                continue
+
+            # Advertised to PE peers (in unique update groups):
+            # Advertised to CE peers (in unique update groups):
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                peer_name = group['peer_name']
+                next_line_update_group = True
+                continue
+
+            # Path #1: Received by speaker 0
+            m = p6.match(line)
+            if m:
+                group = m.groupdict()
+                path = group['path_num']
+                each_path_dict = paths_dict.setdefault('path', {}).setdefault(path,{})
+                continue
+
+            # 50.1.1.8
+            # 2000:90:11:1::2
+            # fd00:ffff:100:11::2
+            m = p7.match(line)
+            if m and next_line_update_group:
+                group = m.groupdict()
+                advertised_peer = group['advertised_peer']
+                next_line_update_group = False
+
+                try:
+                    if advertised_peer:
+                        peer_name = 'advertised_peer_' + peer_name.lower()
+                        each_path_dict[peer_name] = advertised_peer
+                except Exception:
+                    pass
+                continue
+
+            # 7000
+            # Local
+            m = p8.match(line)
+            if m:
+                group = m.groupdict()
+                as_path = group['as_path']
+                as_path_dict = each_path_dict.setdefault('as_path', {}).setdefault(as_path, {})
+                continue
+
+            # 50.1.1.1 (metric 4) from 50.1.1.8 (50.1.1.1)
+            # 2000:90:33:1::2 from 2000:90:33:1::2 (70.3.3.3)
+            # :: from :: (50.1.1.4)
+            # fc00:a000:1000::1 (metric 30) from fc00:a000:2000::14 (10.0.0.1), if-handle 0x00000000
+            m = p9.match(line)
+            if m:
+                group = m.groupdict()
+                bgp_peer_neighbor_ip = group['bgp_peer_neighbor_ip']
+                next_hop_dict = as_path_dict.setdefault('bgp_peer_neighbor_ip', {}).setdefault(bgp_peer_neighbor_ip, {})
+                if group['metric']:
+                    next_hop_dict['metric'] = int(group['metric'])
+                next_hop_dict['bgp_peer_neighbor_ip'] = bgp_peer_neighbor_ip
+                next_hop_dict['origin_neighbors_ip'] = group['origin_neighbors_ip']
+                next_hop_dict['origin_router_id'] = group['origin_router_id']
+                if group['if_handle']:
+                    next_hop_dict['if_handle'] = group['if_handle']
+                continue
+
+            # Local Label: 24023
+            # Received Label 24000
+            # Received Label 0xe0030
+            m = p10.match(line)
+            if m:
+                group = m.groupdict()
+                label_name = group['label_name']
+                label_full_name = label_name.lower() + '_label'
+                if label_name == 'Local':
+                    vrf_dict[label_full_name] = group['label_value']
+                else:
+                    next_hop_dict[label_full_name] = group['label_value']
+                continue
+
+            # Origin incomplete, metric 0, localpref 100, valid, internal, best, group-best, import-candidate, imported
+            # Origin IGP, metric 0, localpref 100, valid, external, best, group-best, import-candidate
+            # Origin incomplete, metric 0, localpref 100, weight 32768, valid, redistributed, best, group-best, import-candidate
+            # Origin incomplete, metric 0, localpref 100, valid, internal, backup, add-path, import-candidate, imported
+            # Origin IGP, localpref 100, valid, internal, best, group-best, import-candidate, not-in-vrf
+            m = p11.match(line)
+            if m:
+                group = m.groupdict()
+                status_codes = ''
+                if group['metric']:
+                    next_hop_dict['origin_metric'] = int(group['metric'])
+                if group['localpref']:
+                    next_hop_dict['localpref'] = int(group['localpref'])
+                if group['weight']:
+                    next_hop_dict['weight'] = int(group['weight'])
+
+                if group['origin']:
+                    origin = str(group['origin'])
+                    if origin == 'incomplete':
+                        next_hop_dict['origin_codes'] = '?'
+                    elif origin == 'EGP':
+                        next_hop_dict['origin_codes'] = 'e'
+                    else:
+                        next_hop_dict['origin_codes'] = 'i'
+                
+                if group['group_best']:
+                    next_hop_dict['group_best'] = group['group_best']
+                if group['backup']:
+                    next_hop_dict['backup'] = group['backup']
+                if group['add_path']:
+                    next_hop_dict['add_path'] = group['add_path']
+                if group['import_candidate']:
+                    next_hop_dict['import_candidate'] = group['import_candidate']
+                if group['imported']:
+                    next_hop_dict['imported'] = group['imported']
+                if group['redistributed']:
+                    next_hop_dict['redistributed'] = group['redistributed']
+                if group['not_in_vrf']:
+                    next_hop_dict['not_in_vrf'] = group['not_in_vrf']
+
+                if group['valid']:
+                    status_codes += '*'
+                if group['best']:
+                    status_codes = status_codes.rstrip()
+                    status_codes += '>'
+                if group['state']:
+                    state = group['state']
+                    if state == 'internal':
+                        status_codes += 'i'
+                next_hop_dict['status_codes'] = status_codes
+                continue
+
+            # Received Path ID 0, Local Path ID 0, version 715
+            m = p12.match(line)
+            if m:
+                group = m.groupdict()
+                next_hop_dict['received_path_id'] = int(group['received_path_id'])
+                next_hop_dict['local_path_id'] = int(group['local_path_id'])
+                next_hop_dict['version'] = int(group['version'])
+                continue
+
+            # Extended community: RT:100:1001
+            m = p13.match(line)
+            if m:
+                group = m.groupdict()
+                value = group['extended_community']
+                next_hop_dict['extended_community'] = value
+                continue
+
+            # Originator: 50.1.1.1, Cluster list: 50.1.1.8
+            # Originator: 10.0.0.3, Cluster list: 10.0.0.11, 10.0.0.13
+            m = p14.match(line)
+            if m:
+                group = m.groupdict()
+                next_hop_dict['originator'] = group['originator']
+                next_hop_dict['cluster_list'] = group['cluster_list']
+                continue
+
+            # Source AFI: VPNv6 Unicast, Source VRF: default, Source Route Distinguisher: 50.1.1.1:0
+            # Source AFI: VPNv6 Unicast, Source VRF: SRV6_L3VPN_BE, Source Route Distinguisher: 100:1
+            m = p15.match(line)
+            if m:
+                group = m.groupdict()
+                next_hop_dict['source_afi'] = group['source_afi']
+                next_hop_dict['source_vrf'] = group['source_vrf']
+                next_hop_dict['source_rd'] = group['source_rd']
+                continue
+
+            # PSID-Type:L3, SubTLV Count:1, R:0x00,
+            m = p16.match(line)
+            if m:
+                group = m.groupdict()
+                psid_type = group['psid_type']
+                psid_dict = next_hop_dict.setdefault('psid_type', {}). \
+                    setdefault(psid_type, {})
+                psid_dict['psid_type'] = psid_type
+                psid_dict['subtlv_count'] = int(group['subtlv_count'])
+                if group['r_value']:
+                    psid_dict['r_value'] = group['r_value']
+                continue
+
+            # SubTLV:
+            # SubSubTLV:
+            m = p17.match(line)
+            if m:
+                group = m.groupdict()
+                tlv_name = group['tlv_name'].lower()
+                if tlv_name == 'subtlv':
+                    subtlv_dict = psid_dict.setdefault(tlv_name, {})
+                else:
+                    subsubtlv_dict = subtlv_dict.setdefault(tlv_name, {})
+                continue
+
+            # T:1(Sid information), Sid:fc00:c000:2003::, F:0x00, R2:0x00, Behavior:62, R3:0x00, SS-TLV Count:1
+            m = p18.match(line)
+            if m:
+                group = m.groupdict()
+                subtlv_dict['t_value'] = group['t_value']
+                subtlv_dict['sid_value'] = group['sid_value']
+                subtlv_dict['f_value'] = group['f_value']
+                subtlv_dict['r2_value'] = group['r2_value']
+                subtlv_dict['behaviour'] = group['behaviour']
+                subtlv_dict['r3_value'] = group['r3_value']
+                subtlv_dict['sstlv_count'] = int(group['sstlv_count'])
+                continue
+
+            # T:1(Sid structure):
+            m = p19.match(line)
+            if m:
+                group = m.groupdict()
+                t_value = group['t_value']
+                t_dict = subsubtlv_dict.setdefault('t', {}). \
+                    setdefault(t_value, {})
+                continue
+
+            # Length [Loc-blk,Loc-node,Func,Arg]:[32,16,16,0], Tpose-len:16, Tpose-offset:48
+            m = p20.match(line)
+            if m:
+                group = m.groupdict()
+                t_dict['loc_blk'] = group['loc_blk']
+                t_dict['loc_node'] = group['loc_node']
+                t_dict['func'] = group['func']
+                t_dict['arg'] = group['arg']
+                t_dict['tpose_len'] = group['tpose_len']
+                t_dict['tpose_offset'] = group['tpose_offset']
+                continue
+
+        return ret_dict
+
+# ========================================
+# Parser for 'show bgp vrf {vrf_name} {address_family} {prefix} detail'
+# ========================================
+
+class ShowBgpVrfAfPrefixDetail(ShowBgpVrfAfPrefix):
+
+    ''' Parser for:
+        show bgp vrf {vrf_name} {address_family} {prefix} detail
+    '''
+
+    cli_command = ['show bgp vrf {vrf_name} {address_family} {prefix} detail']
+
+    def cli (self, vrf_name=None, address_family=None, prefix=None, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command[0].\
+                                      format(vrf_name=vrf_name,\
+                                             address_family=address_family,\
+                                             prefix=prefix))
+        else:
+            output = output
+
+        # Call super
+        return super().cli(vrf_name=vrf_name, address_family=address_family, prefix=prefix, output=output)
+
+# ============================================
+# Parser for:
+# 'show bgp vrf {vrf}'
+# 'show bgp vrf {vrf} {summary}'
+# 'show bgp vrf {vrf} {address_family} summary'
+# 'show bgp vrf {vrf} {address_family} {value}'
+# ============================================
+
+class ShowBgpVrfSchema(MetaParser):
+
+    """ Schema for:
+        'show bgp vrf {vrf}'
+        'show bgp vrf {vrf} {summary}'
+        'show bgp vrf {vrf} {address_family} summary'
+        'show bgp vrf {vrf} {address_family} {value}'
+    """
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'address_family': {
+                    Any(): {
+                        Optional('router_identifier'): str,
+                        Optional('vrf_id'): str,
+                        Optional('local_as'): Or(int, str),
+                        Optional('vrf_state'): str,
+                        Optional('bgp_vrf'): str,
+                        Optional('bgp_route_distinguisher'): str,
+                        Optional('non_stop_routing'): bool,
+                        Optional('table_state'): str,
+                        Optional('table_id'): str,
+                        Optional('rd_version'): int,
+                        Optional('bgp_table_version'): int,
+                        Optional('nsr_initial_initsync_version'): str,
+                        Optional('nsr_issu_sync_group_versions'): str,
+                        Optional('nsr_initial_init_ver_status'): str,
+                        Optional('processed_prefix'): int,
+                        Optional('processed_paths'): int,
+                        Optional('default_vrf'): str,
+                        Optional('route_distinguisher'): str,
+                        Optional('prefix'): {
+                            Any(): {
+                                Optional('index'): {
+                                    Any(): {
+                                        Optional('next_hop'): str,
+                                        Optional('status_codes'): str,
+                                        Optional('metric'): str,
+                                        Optional('locprf'): str,
+                                        Optional('weight'): str,
+                                        Optional('path'): str,
+                                        Optional('origin_codes'): str,
+                                        Optional('local_sid'): str,
+                                        Optional('alloc_mode'): str,
+                                        Optional('locator'): str
+                                    },
+                                },
+                            },
+                        },
+                        Optional('process'): {
+                            Any(): {
+                                'rcvtblver': int,
+                                'brib_rib': int,
+                                'labelver': int,
+                                'importver': int,
+                                'sendtblver': int,
+                                'standbyver': int
+                            }
+                        },
+                        Optional('neighbor'): {
+                            Any(): {
+                                'remote_as': Or(int, str),
+                                'tbl_ver': int,
+                                'spk': int,   
+                                'msg_rcvd': int,
+                                'msg_sent': int,
+                                'input_queue': int,
+                                'output_queue': int,
+                                'up_down': str,
+                                'state_pfxrcd': str,
+                            }
+                        },
+                    },
+                },
+            },
+        },
+    }
+
+# ============================================================
+# Parser for:
+# 'show bgp vrf {vrf}'
+# 'show bgp vrf {vrf} {summary}'
+# 'show bgp vrf {vrf} {address_family} summary'
+# 'show bgp vrf {vrf} {address_family} {value}'
+# ============================================================
+class ShowBgpVrf(ShowBgpVrfSchema):
+
+    '''Parser for:
+        'show bgp vrf {vrf}'
+        'show bgp vrf {vrf} {summary}'
+        'show bgp vrf {vrf} {address_family} summary'
+        'show bgp vrf {vrf} {address_family} {value}'
+    '''
+
+    cli_command = ['show bgp vrf {vrf}',
+                   'show bgp vrf {vrf} {summary}',
+                   'show bgp vrf {vrf} {address_family} summary',
+                   'show bgp vrf {vrf} {address_family} {value}']
+
+    def cli(self, vrf=None, address_family=None, summary=None, value=None, output=None):
+
+        # Execute command
+        if output is None:
+            if value:
+                command = self.cli_command[3].format(vrf=vrf,address_family=address_family,value=value)
+            elif vrf and address_family:
+                command = self.cli_command[2].format(vrf=vrf,address_family=address_family)
+            elif vrf and summary:
+                command = self.cli_command[1].format(vrf=vrf,summary=summary)
+            else:
+                command = self.cli_command[0].format(vrf=vrf)
+            output = self.device.execute(command)
+
+        # initial return dictionary
+        ret_dict = {}
+        last_prefix = None
+        pfx_dict = None
+
+        if address_family == None:
+            address_family = 'ipv4 unicast'
+
+        if address_family:
+            if value != None and 'ipv4' in address_family:
+                address_family = 'ipv4 unicast'
+            elif value != None and 'ipv6' in address_family:
+                address_family = 'ipv6 unicast'
+
+        # VRF: VRF1
+        p1 = re.compile(r'^\s*VRF: +(?P<vrf>(\S+))$')
+
+        # BGP VRF VRF1, state: Active
+        p2 = re.compile(r'^\s*BGP +VRF +(?P<bgp_vrf>(\S+)), +state:'
+                        r' +(?P<vrf_state>(\S+))$')
+
+        # BGP Route Distinguisher: 1.100.1.1:0
+        # BGP Route Distinguisher: 200:1
+        # BGP Route Distinguisher: 172.16.2.90:1
+        p3 = re.compile(r'^BGP\s+Route\s+Distinguisher:\s+(?P<route_distinguisher>\S+)$')
+
+        # VRF ID: 0x60000001
+        p4 = re.compile(r'^\s*VRF +ID: +(?P<vrf_id>(\S+))$')
+
+        # BGP router identifier 10.4.1.1, local AS number 100
+        # BGP router identifier 10.10.10.108, local AS number 65108.65108
+        p5 = re.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
+                        r' +local +AS +number +(?P<local_as>([\d\.]+))$')
+
+        # Non-stop routing is enabled
+        p6 = re.compile(r'^\s*Non-stop +routing is enabled$')
+
+        # BGP table state: Active
+        p7 = re.compile(r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$')
+
+        # Table ID: 0xe0000010   RD version: 43
+        p8 = re.compile(r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
+                         r' +(?P<rd_version>[0-9]+)$')
+
+        # BGP main routing table version 43
+        p9 = re.compile(r'^\s*BGP +main +routing +table +version'
+                         r' +(?P<bgp_table_version>[0-9]+)$')
+
+        # BGP NSR Initial initsync version 11 (Reached)
+        p10 = re.compile(r'^\s*BGP +NSR +Initial +initsync +version'
+                         r' +(?P<nsr_initial_initsync_version>[0-9]+)'
+                         r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+
+        # BGP NSR/ISSU Sync-Group versions 0/0
+        p11 = re.compile(r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
+                         r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
+
+        # Route Distinguisher: 200:1 (default for vrf VRF1)
+        # Route Distinguisher: 172.16.2.90:1000 (default for vrf EVPN-Multicast-BTV)
+        # Route Distinguisher: 172.16.2.88:1000
+        p12 = re.compile(r'^\s*Route +Distinguisher:'
+                         r' +(?P<route_distinguisher>\S+)'
+                         r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$')
+
+        # *> 10.1.1.0/24        10.186.5.5              2219             0 200 33299 51178 47751 {27016} e
+        # * i                   10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
+        # *>i10.9.2.0/24        10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
+        # *>i10.169.1.0/24      10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
+        # *>i192.168.111.0/24       10.189.99.98                                                    0       0 i
+        # *> 10.7.7.7/32        10.10.10.107             0             0 65107.65107 ?
+        p13 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
+                         r' *(?P<prefix>(?P<ip>[0-9\.\:\[\]]+)\/(?P<mask>\d+))?'
+                         r' +(?P<next_hop>\S+) +(?P<number>[\d\.\s\{\}]+)'
+                         r'(?: *(?P<origin_codes>(i|e|\?)))?$')
+
+        # Processed 40 prefixes, 50 paths
+        p14 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
+                         r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
+
+        # BGP is operating in STANDALONE mode.
+        p15 = re.compile(r'BGP *is *operating *in *'
+                        '(?P<operation_mode>\w+) *mode$')
+
+        # Process       RcvTblVer   bRIB/RIB   LabelVer  ImportVer  SendTblVer  StandbyVer
+        #Speaker              19         19         19         19          19           0
+        p16 = re.compile(r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
+                         ' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
+                         ' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
+                         ' *(?P<standbyver>[0-9]+)$')
+
+        # Neighbor        Spk    AS MsgRcvd MsgSent   TblVer  InQ OutQ  Up/Down  St/PfxRcd
+        # 192.168.2.2       0   200     353     353       19    0    0 05:49:05          3
+        p17 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
+                           ' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
+                           ' +(?P<msg_sent>[0-9]+)'
+                           ' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
+                           ' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
+                           ' +(?P<state_pfxrcd>.+)$')
+
+        # *> 1.1.1.1/32         fc00:c000:1001:e000::                       per-vrf      MAIN
+        # *>i3.3.3.3/32         NO SRv6 Sid                                 -            -
+        # * i                   NO SRv6 Sid                                 -            -
+        p18 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)\s*'
+                         '(?P<prefix>(?P<ip>[.0-9a-fA-F:]+)\/(?P<mask>\d+))?\s+'
+                         '(?P<local_sid>[ \w:]+)\s+(?P<alloc_mode>[\w-]+)\s+'
+                         '(?P<locator>[\w-]+)$')
+
+        # *>ifc00:a000:2000:200::3/128
+        # *> fd00:ffff:100:11::/64
+        p19 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)\s*'
+                         '(?P<prefix>(?P<ip>[\w:]+)\/(?P<mask>\d+))$')
+
+        # fc00:c000:1001:e001::                       per-vrf      MAIN
+        # NO SRv6 Sid                                 -            -
+        p20 = re.compile(r'^(?P<local_sid>[\da-fA-F:|NO SRv6 Sid]+)\s+(?P<alloc_mode>[\w-]+)'
+                         '\s+(?P<locator>[\w-]+)$')
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            # VRF: VRF1
+            m = p1.match(line)
+            if m:
+                vrf = m.groupdict()['vrf'].lower()
+                vrf_dict = ret_dict.setdefault('vrf', {}).setdefault(vrf, {})
+
+                address_family = address_family.replace(' ','_').lower()
+                af_dict = vrf_dict.setdefault('address_family', {}).setdefault(address_family, {})
+                continue
+
+            # BGP VRF VRF1, state: Active
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                bgp_vrf = group['bgp_vrf'].lower()
+                vrf_state = group['vrf_state'].lower()
+                if 'vrf' in ret_dict:
+                    af_dict['bgp_vrf'] = bgp_vrf
+                    af_dict['vrf_state'] = vrf_state
+                else:
+                    vrf_dict = ret_dict.setdefault('vrf', {}).setdefault(bgp_vrf, {})
+
+                    address_family = address_family.replace(' ','_').lower()
+                    af_dict = vrf_dict.setdefault('address_family', {}).setdefault(address_family, {})
+
+                    af_dict['bgp_vrf'] = bgp_vrf
+                    af_dict['vrf_state'] = vrf_state
+                continue
+
+            # BGP Route Distinguisher: 1.100.1.1:0
+            # BGP Route Distinguisher: 200:1
+            # BGP Route Distinguisher: 172.16.2.90:1
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                af_dict['bgp_route_distinguisher'] = group['route_distinguisher']
+                continue
+
+            # VRF ID: 0x60000001
+            m = p4.match(line)
+            if m:
+                vrf_id = m.groupdict()['vrf_id']
+                af_dict['vrf_id'] = vrf_id
+                continue
+
+            # BGP router identifier 10.4.1.1, local AS number 100
+            # BGP router identifier 10.10.10.108, local AS number 65108.65108
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                af_dict['router_identifier'] = group['router_identifier']
+              
+                try:
+                    af_dict['local_as']= int(group['local_as'])
+                except:
+                    af_dict['local_as']= group['local_as']
+                continue 
+
+            # Non-stop routing is enabled
+            m = p6.match(line)
+            if m:
+                af_dict['non_stop_routing'] = True
+                continue
+
+            # BGP table state: Active
+            m = p7.match(line)
+            if m:
+                af_dict['table_state'] = m.groupdict()['table_state'].lower()
+                continue
+
+            # Table ID: 0x0   RD version: 0
+            m = p8.match(line)
+            if m:
+                group = m.groupdict()
+                af_dict['table_id'] = group['table_id']
+                af_dict['rd_version'] = int(group['rd_version'])
+                continue
+
+            # BGP main routing table version 43
+            m = p9.match(line)
+            if m:
+                af_dict['bgp_table_version'] = int(m.groupdict()['bgp_table_version'])
+                continue
+
+            # BGP NSR Initial initsync version 11 (Reached)
+            m = p10.match(line)
+            if m:
+                group = m.groupdict()
+                af_dict['nsr_initial_initsync_version'] = group['nsr_initial_initsync_version']
+                af_dict['nsr_initial_init_ver_status'] = group['nsr_initial_init_ver_status'].lower()
+                continue
+
+            # BGP NSR/ISSU Sync-Group versions 0/0
+            m = p11.match(line)
+            if m:
+                af_dict['nsr_issu_sync_group_versions'] = \
+                                m.groupdict()['nsr_issu_sync_group_versions']
+                continue
+
+            # Route Distinguisher: 200:1 (default for vrf VRF1)
+            m = p12.match(line)
+            if m:
+                group = m.groupdict()
+                rd = group['route_distinguisher']
+                
+                af_dict['route_distinguisher'] = rd
+                if group['default_vrf']:
+                    af_dict['default_vrf'] = group['default_vrf'].lower()
+                continue
+
+            # *> 10.1.1.0/24        10.186.5.5              2219             0 200 33299 51178 47751 {27016} e
+            # * i                   10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
+            # *>i10.9.2.0/24        10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
+            # *>i10.169.1.0/24      10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
+            # *>i192.168.111.0/24       10.189.99.98                                                    0       0 i
+            # *> 10.7.7.7/32        10.10.10.107             0             0 65107.65107 ?
+            m = p13.match(line)
+            if m:
+                group = m.groupdict()
+                prefix = group['prefix']
+                if prefix:
+                    last_prefix = prefix
+                    index = 1
+                else:
+                    index += 1
+                # Set dict
+                pfx_dict = af_dict.setdefault('prefix', {}).setdefault(last_prefix, {}).\
+                                   setdefault('index', {}).setdefault(index, {})
+                # Set keys
+                pfx_dict['next_hop'] = group['next_hop']
+                pfx_dict['status_codes'] = group['status_codes'].strip().replace(" ", "")
+                if group['origin_codes']:
+                    pfx_dict['origin_codes'] = group['origin_codes']
+                
+                # Parse and set the numbers
+                group_num = group['number']
+                m1 = re.compile(r'^(?P<metric>[0-9]+)  +(?P<locprf>[0-9]+)  +(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
+                m2 = re.compile(r'^(?P<value>[0-9]+)(?P<space>\s{2,20})(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
+                m3 = re.compile(r'^(?P<weight>[0-9]+) (?P<path>(([\d\.]+\s)|(\{[\d\.]+\}\s))+)$').match(group_num)
+                m4 = re.compile(r'^(?P<locprf>(\d+)) +(?P<weight>(\d+))$').match(group_num.strip())
+                if m1:
+                    pfx_dict['metric'] = m1.groupdict()['metric']
+                    pfx_dict['locprf'] = m1.groupdict()['locprf']
+                    pfx_dict['weight'] = m1.groupdict()['weight']
+                    pfx_dict['path'] = m1.groupdict()['path'].strip()
+                elif m2:
+                    if len(m2.groupdict()['space']) > 8:
+                        pfx_dict['metric'] = m2.groupdict()['value']
+                    else:
+                        pfx_dict['locprf'] = m2.groupdict()['value']
+
+                    pfx_dict['weight'] = m2.groupdict()['weight']
+                    pfx_dict['path'] = m2.groupdict()['path'].strip()
+                elif m3:
+                    pfx_dict['weight'] = m3.groupdict()['weight']
+                    pfx_dict['path'] = m3.groupdict()['path'].strip()
+                elif m4:
+                    pfx_dict['locprf'] = m4.groupdict()['locprf']
+                    pfx_dict['weight'] = m4.groupdict()['weight']
+                continue
+
+            # Processed 40 prefixes, 50 paths
+            m = p14.match(line)
+            if m:
+                group = m.groupdict()
+                af_dict['processed_prefix'] = int(group['processed_prefix'])
+                af_dict['processed_paths'] = int(group['processed_paths'])
+                continue
+
+            # BGP is operating in STANDALONE mode.
+            m = p15.match(line)
+            if m:
+                operation_mode = m.groupdict()['operation_mode'].lower()
+                af_dict['operation_mode'] = operation_mode
+                continue
+
+            # Process       RcvTblVer   bRIB/RIB   LabelVer  ImportVer  SendTblVer  StandbyVer
+            # Speaker              63         63         63         63          63           0
+            m = p16.match(line)
+            if m:
+                process = str(m.groupdict()['process'])
+                if 'process' not in af_dict:
+                    af_dict['process'] = {}
+                if process not in af_dict['process']:
+                    af_dict['process'][process] = {}
+                af_dict['process'][process]['rcvtblver'] =  int(m.groupdict()['rcvtblver'])
+                af_dict['process'][process]['brib_rib'] =  int(m.groupdict()['brib_rib'])
+                af_dict['process'][process]['labelver'] =  int(m.groupdict()['labelver'])
+                af_dict['process'][process]['importver'] =  int(m.groupdict()['importver'])
+                af_dict['process'][process]['sendtblver'] =  int(m.groupdict()['sendtblver'])
+                af_dict['process'][process]['standbyver'] =  int(m.groupdict()['standbyver'])
+                continue 
+
+            # Neighbor        Spk    AS msg_rcvd msg_sent   TblVer  InQ OutQ  Up/Down  St/PfxRcd
+            # 10.1.5.5          0   200      60      62       63    0    0 00:57:32          0
+            # 10.16.2.2           0   100       0       0        0    0    0 00:00:00 Idle
+            # 10.0.0.35         0   200       0       0        0    0    0 00:00:00 Idle (Admin)!
+            m = p17.match(line)
+            if m:
+                neighbor = str(m.groupdict()['neighbor'])
+                if 'neighbor' not in af_dict:
+                    af_dict['neighbor'] = {}
+                if neighbor not in af_dict['neighbor']:
+                    af_dict['neighbor'][neighbor] = {}
+
+                try:
+                    af_dict['neighbor'][neighbor]['remote_as'] = int(m.groupdict()['remote_as'])
+                except:
+                    af_dict['neighbor'][neighbor]['remote_as'] = m.groupdict()['remote_as']
+
+                af_dict['neighbor'][neighbor]['spk'] = int(m.groupdict()['spk'])                
+                af_dict['neighbor'][neighbor]['msg_rcvd'] = int(m.groupdict()['msg_rcvd'])
+                af_dict['neighbor'][neighbor]['msg_sent'] = int(m.groupdict()['msg_sent'])
+                af_dict['neighbor'][neighbor]['tbl_ver'] = int(m.groupdict()['tbl_ver'])
+                af_dict['neighbor'][neighbor]['input_queue'] = int(m.groupdict()['input_queue'])
+                af_dict['neighbor'][neighbor]['output_queue'] = int(m.groupdict()['output_queue'])
+                af_dict['neighbor'][neighbor]['up_down'] =  str(m.groupdict()['up_down'])
+                af_dict['neighbor'][neighbor]['state_pfxrcd'] = str(m.groupdict()['state_pfxrcd'])
+                continue
+
+            # *> 1.1.1.1/32         fc00:c000:1001:e000::                       per-vrf      MAIN
+            # *>i3.3.3.3/32         NO SRv6 Sid                                 -            -
+            # * i                   NO SRv6 Sid                                 -            -
+            m = p18.match(line)
+            if m:
+                group = m.groupdict()
+                prefix = group['prefix']
+                if prefix:
+                    last_prefix = prefix
+                    index = 1
+                else:
+                    index += 1
+                # Set dict
+                pfx_dict = af_dict.setdefault('prefix', {}).setdefault(last_prefix, {}).\
+                                   setdefault('index', {}).setdefault(index, {})
+                # Set keys
+                pfx_dict['local_sid'] = group['local_sid'].strip()
+                pfx_dict['status_codes'] = group['status_codes'].strip().replace(" ", "")
+                pfx_dict['alloc_mode'] = group['alloc_mode']
+                pfx_dict['locator'] = group['locator'].lower()
+                continue
+
+            # *>ifc00:a000:2000:200::3/128
+            # *> fd00:ffff:100:11::/64
+            m = p19.match(line)
+            if m:
+                group = m.groupdict()
+                prefix = group['prefix']
+                if prefix:
+                    last_prefix = prefix
+                    index = 1
+                else:
+                    index += 1
+                # Set dict
+                pfx_dict = af_dict.setdefault('prefix', {}).setdefault(last_prefix, {}).\
+                                   setdefault('index', {}).setdefault(index, {})
+                # Set keys
+                pfx_dict['status_codes'] = group['status_codes'].strip().replace(" ", "")
+                continue
+
+            # fc00:c000:1001:e001::                       per-vrf      MAIN
+            # NO SRv6 Sid                                 -            -
+            m = p20.match(line)
+            if m:
+                group = m.groupdict()
+                pfx_dict['local_sid'] = group['local_sid'].strip()
+                pfx_dict['alloc_mode'] = group['alloc_mode']
+                pfx_dict['locator'] = group['locator'].lower()
+                continue
+
+        return ret_dict
+
+# ============================================
+# Parser for:
+# 'show bgp'
+# 'show bgp {address_family}'
+# ============================================
+
+class ShowBgpAddressFamilySchema(MetaParser):
+
+    """ Schema for:
+        'show bgp'
+        'show bgp {address_family}'
+    """
+
+    schema = {
+        'address_family': {
+            Any(): {
+                Optional('router_identifier'): str,
+                Optional('local_as'): Or(int, str),
+                Optional('generic_scan_interval'): int,
+                Optional('non_stop_routing'): bool,
+                Optional('table_state'): str,
+                Optional('table_id'): str,
+                Optional('rd_version'): int,
+                Optional('bgp_table_version'): int,
+                Optional('dampening_status'): str,
+                Optional('nsr_initial_initsync_version'): str,
+                Optional('nsr_issu_sync_group_versions'): str,
+                Optional('nsr_initial_init_ver_status'): str,
+                Optional('scan_interval'): int,
+                Optional('processed_prefix'): int,
+                Optional('processed_paths'): int,
+                Optional('route_distinguisher'): {
+                    Any(): {
+                        Optional('default_vrf'): str,
+                        Optional('prefix'): {
+                            Any(): {
+                                Optional('index'): {
+                                    Any(): {
+                                        Optional('next_hop'): str,
+                                        Optional('status_codes'): str,
+                                        Optional('metric'): str,
+                                        Optional('locprf'): str,
+                                        Optional('weight'): str,
+                                        Optional('path'): str,
+                                        Optional('origin_codes'): str
+                                    }
+                                }
+                            },
+                        },
+                    },
+                },
+                Optional('prefix'): {
+                    Any(): {
+                        Optional('index'): {
+                            Any(): {
+                                Optional('next_hop'): str,
+                                Optional('status_codes'): str,
+                                Optional('metric'): str,
+                                Optional('locprf'): str,
+                                Optional('weight'): str,
+                                Optional('path'): str,
+                                Optional('origin_codes'): str
+                            }
+                        }
+                    },
+                },
+                Optional('operation_mode'): str,
+                Optional('process'): {
+                    Any(): {
+                        'rcvtblver': int,
+                        'brib_rib': int,
+                        'labelver': int,
+                        'importver': int,
+                        'sendtblver': int,
+                        'standbyver': int
+                    }
+                },
+                Optional('neighbor'): {
+                    Any(): {
+                        'remote_as': Or(int, str),
+                        'tbl_ver': int,
+                        'spk': int,   
+                        'msg_rcvd': int,
+                        'msg_sent': int,
+                        'input_queue': int,
+                        'output_queue': int,
+                        'up_down': str,
+                        'state_pfxrcd': str,
+                    }
+                },
+            },
+        },
+    }
+
+# ============================================================
+# Parser for:
+# 'show bgp'
+# 'show bgp {address_family}'
+# ============================================================
+class ShowBgpAddressFamily(ShowBgpAddressFamilySchema):
+
+    '''Parser for:
+        'show bgp'
+        'show bgp {address_family}'
+    '''
+
+    cli_command = ['show bgp',
+                   'show bgp {address_family}']
+
+    def cli(self, address_family=None, output=None):
+
+        # Execute command
+        if output is None:
+            if address_family:
+                command = self.cli_command[1].format(address_family=address_family)
+            else:
+                command = self.cli_command[0]
+            output = self.device.execute(command)
+
+        # initial return dictionary
+        ret_dict = {}
+        last_prefix = None
+        rd = None
+        if not address_family:
+            address_family = 'ipv4 unicast'
+
+        # BGP router identifier 10.4.1.1, local AS number 100
+        # BGP router identifier 10.10.10.108, local AS number 65108.65108
+        p1 = re.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
+                        r' +local +AS +number +(?P<local_as>([\d\.]+))$')
+
+        # BGP generic scan interval 60 secs
+        p2 =  re.compile(r'^\s*BGP +generic +scan +interval'
+                         r' +(?P<interval>(\d+)) +secs$')
+
+        # Non-stop routing is enabled
+        p3 = re.compile(r'^\s*Non-stop +routing is enabled$')
+
+        # BGP table state: Active
+        p4 = re.compile(r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$')
+
+        # Table ID: 0xe0000010   RD version: 43
+        p5 = re.compile(r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
+                         r' +(?P<rd_version>[0-9]+)$')
+
+        # BGP main routing table version 43
+        p6 = re.compile(r'^\s*BGP +main +routing +table +version'
+                         r' +(?P<bgp_table_version>[0-9]+)$')
+
+        # BGP NSR Initial initsync version 11 (Reached)
+        p7 = re.compile(r'^\s*BGP +NSR +Initial +initsync +version'
+                         r' +(?P<nsr_initial_initsync_version>[0-9]+)'
+                         r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+
+        # BGP NSR/ISSU Sync-Group versions 0/0
+        p8 = re.compile(r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
+                         r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
+
+        # BGP scan interval 60 secs 
+        p9 = re.compile(r'^\s*BGP +scan +interval +(?P<scan_interval>[0-9]+)'
+                         r' +secs$')
+
+        # Route Distinguisher: 200:1 (default for vrf VRF1)
+        # Route Distinguisher: 172.16.2.90:1000 (default for vrf EVPN-Multicast-BTV)
+        # Route Distinguisher: 172.16.2.88:1000
+        p10 = re.compile(r'^\s*Route +Distinguisher:'
+                         r' +(?P<route_distinguisher>\S+)'
+                         r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$')
+
+        # *> 10.1.1.0/24        10.186.5.5              2219             0 200 33299 51178 47751 {27016} e
+        # * i                   10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
+        # *>i10.9.2.0/24        10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
+        # *>i10.169.1.0/24      10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
+        # *>i192.168.111.0/24       10.189.99.98                                                    0       0 i
+        # *> 10.7.7.7/32        10.10.10.107             0             0 65107.65107 ?
+        p11 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
+                         r' *(?P<prefix>(?P<ip>[0-9\.\:\[\]]+)\/(?P<mask>\d+))?'
+                         r' +(?P<next_hop>\S+) +(?P<number>[\d\.\s\{\}]+)'
+                         r'(?: *(?P<origin_codes>(i|e|\?)))?$')
+
+        # Processed 40 prefixes, 50 paths
+        p12 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
+                         r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
+
+        # BGP is operating in STANDALONE mode.
+        p13 = re.compile(r'BGP *is *operating *in *'
+                        '(?P<operation_mode>\w+) *mode.$')
+
+        # Process       RcvTblVer   bRIB/RIB   LabelVer  ImportVer  SendTblVer  StandbyVer
+        #Speaker              19         19         19         19          19           0
+        p14 = re.compile(r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
+                         ' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
+                         ' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
+                         ' *(?P<standbyver>[0-9]+)$')
+
+        # Neighbor        Spk    AS MsgRcvd MsgSent   TblVer  InQ OutQ  Up/Down  St/PfxRcd
+        # 192.168.2.2       0   200     353     353       19    0    0 05:49:05          3
+        p15 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
+                           ' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
+                           ' +(?P<msg_sent>[0-9]+)'
+                           ' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
+                           ' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
+                           ' +(?P<state_pfxrcd>.+)$')
+        
+        # Dampening is not enabled
+        # Dampening enabled
+        p16 = re.compile(r'^Dampening +(?:(is +))?(?P<dampening_status>[\w\s]+)$')
+
+        for line in output.splitlines():
+            line = line.rstrip()
+
+            # BGP router identifier 10.4.1.1, local AS number 100
+            # BGP router identifier 10.10.10.108, local AS number 65108.65108
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                address_family = address_family.replace(" ", "_").lower()
+                af_dict = ret_dict.setdefault('address_family', {}).setdefault(address_family, {})
+                af_dict['router_identifier'] = group['router_identifier']
+              
+                try:
+                    af_dict['local_as']= int(group['local_as'])
+                except:
+                    af_dict['local_as']= group['local_as']
+                continue 
+
+            # BGP generic scan interval 60 secs
+            m = p2.match(line)
+            if m:
+                af_dict['generic_scan_interval'] = int(m.groupdict()['interval'])
+                continue          
+
+            # Non-stop routing is enabled
+            m = p3.match(line)
+            if m:
+                af_dict['non_stop_routing'] = True
+                continue
+
+            # BGP table state: Active
+            m = p4.match(line)
+            if m:
+                af_dict['table_state'] = m.groupdict()['table_state'].lower()
+                continue
+
+            # Table ID: 0x0   RD version: 0
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                af_dict['table_id'] = group['table_id']
+                af_dict['rd_version'] = int(group['rd_version'])
+                continue
+
+            # BGP main routing table version 43
+            m = p6.match(line)
+            if m:
+                af_dict['bgp_table_version'] = int(m.groupdict()['bgp_table_version'])
+                continue
+
+            # BGP NSR Initial initsync version 11 (Reached)
+            m = p7.match(line)
+            if m:
+                group = m.groupdict()
+                af_dict['nsr_initial_initsync_version'] = group['nsr_initial_initsync_version']
+                af_dict['nsr_initial_init_ver_status'] = group['nsr_initial_init_ver_status'].lower()
+                continue
+
+            # BGP NSR/ISSU Sync-Group versions 0/0
+            m = p8.match(line)
+            if m:
+                af_dict['nsr_issu_sync_group_versions'] = \
+                                m.groupdict()['nsr_issu_sync_group_versions']
+                continue
+
+            # BGP scan interval 60 secs
+            m = p9.match(line)
+            if m:
+               af_dict['scan_interval'] = int(m.groupdict()['scan_interval'])
+               continue
+
+            # Route Distinguisher: 200:1 (default for vrf VRF1)
+            m = p10.match(line)
+            if m:
+                group = m.groupdict()
+                rd = group['route_distinguisher']
+
+                rd_dict = af_dict.setdefault('route_distinguisher', {}).setdefault(rd, {})
+                if group['default_vrf']:
+                    default_vrf = group['default_vrf'].lower()
+
+                    if 'default_vrf' not in rd_dict:
+                        rd_dict['default_vrf'] = default_vrf
+                continue
+
+            # *> 10.1.1.0/24        10.186.5.5              2219             0 200 33299 51178 47751 {27016} e
+            # * i                   10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
+            # *>i10.9.2.0/24        10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
+            # *>i10.169.1.0/24      10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
+            # *>i192.168.111.0/24       10.189.99.98                                                    0       0 i
+            # *> 10.7.7.7/32        10.10.10.107             0             0 65107.65107 ?
+            m = p11.match(line)
+            if m:
+                group = m.groupdict()
+                prefix = group['prefix']
+                if prefix:
+                    last_prefix = prefix
+                    index = 1
+                else:
+                    index += 1
+                # Set dict
+                if 'route_distinguisher' in af_dict:
+                    pfx_dict = af_dict['route_distinguisher'][rd].setdefault('prefix', {}).setdefault(last_prefix, {}).\
+                                       setdefault('index', {}).setdefault(index, {})
+                else:
+                    pfx_dict = af_dict.setdefault('prefix', {}).setdefault(last_prefix, {}).\
+                                       setdefault('index', {}).setdefault(index, {})
+                # Set keys
+                pfx_dict['next_hop'] = group['next_hop']
+                pfx_dict['status_codes'] = group['status_codes'].strip().replace(" ", "")
+                if group['origin_codes']:
+                    pfx_dict['origin_codes'] = group['origin_codes']
+                
+                # Parse and set the numbers
+                group_num = group['number']
+                m1 = re.compile(r'^(?P<metric>[0-9]+)  +(?P<locprf>[0-9]+)  +(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
+                m2 = re.compile(r'^(?P<value>[0-9]+)(?P<space>\s{2,20})(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
+                m3 = re.compile(r'^(?P<weight>[0-9]+) (?P<path>(([\d\.]+\s)|(\{[\d\.]+\}\s))+)$').match(group_num)
+                m4 = re.compile(r'^(?P<locprf>(\d+)) +(?P<weight>(\d+))$').match(group_num.strip())
+                if m1:
+                    pfx_dict['metric'] = m1.groupdict()['metric']
+                    pfx_dict['locprf'] = m1.groupdict()['locprf']
+                    pfx_dict['weight'] = m1.groupdict()['weight']
+                    pfx_dict['path'] = m1.groupdict()['path'].strip()
+                elif m2:
+                    if len(m2.groupdict()['space']) > 8:
+                        pfx_dict['metric'] = m2.groupdict()['value']
+                    else:
+                        pfx_dict['locprf'] = m2.groupdict()['value']
+
+                    pfx_dict['weight'] = m2.groupdict()['weight']
+                    pfx_dict['path'] = m2.groupdict()['path'].strip()
+                elif m3:
+                    pfx_dict['weight'] = m3.groupdict()['weight']
+                    pfx_dict['path'] = m3.groupdict()['path'].strip()
+                elif m4:
+                    pfx_dict['locprf'] = m4.groupdict()['locprf']
+                    pfx_dict['weight'] = m4.groupdict()['weight']
+                continue
+
+            # Processed 40 prefixes, 50 paths
+            m = p12.match(line)
+            if m:
+                group = m.groupdict()
+                af_dict['processed_prefix'] = int(group['processed_prefix'])
+                af_dict['processed_paths'] = int(group['processed_paths'])
+                continue
+
+            # BGP is operating in STANDALONE mode.
+            m = p13.match(line)
+            if m:
+                operation_mode = m.groupdict()['operation_mode'].lower()
+                af_dict['operation_mode'] = operation_mode
+                continue
+
+            # Process       RcvTblVer   bRIB/RIB   LabelVer  ImportVer  SendTblVer  StandbyVer
+            # Speaker              63         63         63         63          63           0
+
+            m = p14.match(line)
+            if m:
+                group = m.groupdict()
+                process = groupdict.pop('process')
+                process_dict = af_dict.setdefault('process', {}).setdefault(process, {})
+                process_dict.update({k:int(v) for k,v in group.items()})
+                continue 
+
+            # Neighbor        Spk    AS msg_rcvd msg_sent   TblVer  InQ OutQ  Up/Down  St/PfxRcd
+            # 10.1.5.5          0   200      60      62       63    0    0 00:57:32          0
+            # 10.16.2.2           0   100       0       0        0    0    0 00:00:00 Idle
+            # 10.0.0.35         0   200       0       0        0    0    0 00:00:00 Idle (Admin)!
+            m = p15.match(line)
+            if m:
+                group = m.groupdict()
+                neighbor = groupdict.pop('neighbor')
+                neighbor_dict = af_dict.setdefault('neighbor', {}).setdefault(neighbor, {})
+                neighbor_dict.update({k:int(v) for k,v in group.items()})
+                continue
+
+            # Dampening is not enabled
+            # Dampening enabled
+            m = p16.match(line)
+            if m:
+                group = m.groupdict()
+                af_dict['dampening_status'] = group['dampening_status']
+                continue
+
+        return ret_dict
+
+# ======================================================================
+# Schema for 'show bgp {address_family} {prefix}'
+# ======================================================================
+class ShowBgpAddressfamilyPrefixSchema(MetaParser):
+    '''Schema for:
+        * 'show bgp {address_family} {bgp_prefix}'
+    '''
+
+    schema = {
+        'address_family': {
+            Any(): {
+                'prefix': str,
+                'last_modified': str,
+                'paths':{
+                    'total_available_paths': int,
+                    'best_path': int,
+                    'path': {
+                        Any(): {
+                            Optional('advertised_peer_pe'): str,
+                            Optional('advertised_peer_ce'): str,
+                            'as_path': {
+                                Any(): {
+                                    'bgp_peer_neighbor_ip': {
+                                        Any(): 
+                                        {
+                                            Optional('metric'): int,
+                                            'origin_neighbors_ip': str,
+                                            'origin_router_id': str,
+                                            'bgp_peer_neighbor_ip': str,
+                                            Optional('originator'): str,
+                                            Optional('received_label'): str,
+                                            'origin_metric': int,
+                                            Optional('weight'): int,
+                                            'localpref': int,
+                                            'origin_codes': str,
+                                            'status_codes': str,
+                                            'received_path_id': int,
+                                            'local_path_id': int,
+                                            'version': int,
+                                            Optional('cluster_list'): ListOf(str),
+                                            Optional('source_afi'): str,
+                                            Optional('source_vrf'): str,
+                                            Optional('source_rd'): str,
+                                            Optional('psid_type'): {
+                                                Any(): {
+                                                    'psid_type': str,
+                                                    'subtlv_count': int,
+                                                    'subtlv': {
+                                                        't_value': int,
+                                                        'sid_value': str,
+                                                        'behaviour': str,
+                                                        'sstlv_count': int,
+                                                         Optional('subsubtlv'): {
+                                                             't_value':int
+                                                             
+                                                         }
+                                                        
+                                                    }
+                                                }
+                                            }
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+    
+# ======================================================================
+# Parser for 'show bgp {address_family} {bgp_prefix}'
+# ======================================================================
+class ShowBgpAddressfamilyPrefix(ShowBgpAddressfamilyPrefixSchema):
+    '''Parser for:
+        * 'show bgp {address_family} {bgp_prefix}'
+    '''
+
+    cli_command = ['show bgp {address_family} {bgp_prefix}']
+
+    def cli(self, address_family='', bgp_prefix='', output=None):
+        
+        ret_dict = {}
+        
+        if output is None:
+            out = self.device.execute(self.cli_command[0].format(address_family=address_family, bgp_prefix=bgp_prefix))
+        else:
+            out = output
+        
+        # BGP routing table entry for fc00:a000:1000:101::1/128    
+        p1 = re.compile(r'^BGP +routing +table +entry +for +(?P<prefix>[a-z0-9+.:]+.[0-9]+)')
+        
+        # Last Modified: Nov  2 09:48:44.893 for 05:33:53
+        p2 = re.compile(r'^Last +Modified: (?P<last_modified>.*)$')
+        
+        # Paths: (2 available, best #1)
+        p3 = re.compile(r'^Paths:\s+\((?P<total_available_paths>\d+)\s+available,\s+best\s+#(?P<best_path>\d+)\)$')
+        
+        # Not advertised to any peer
+        p4 = re.compile(r'^Not\s+advertised\s+to\s+any\s+peer$')
+
+        # Advertised to PE peers (in unique update groups):
+        # Advertised to CE peers (in unique update groups):
+        p5 = re.compile(r'^Advertised\s+to\s+(?P<peer_name>[a-zA-Z0-9]+)\s+peers\s+\(in\s+unique\s+update\s+groups\):$')
+        
+        # Path #1: Received by speaker 0
+        p6 = re.compile(r'^Path\s+#(?P<path_num>\d+):.*$')
+        
+        # 7000
+        # Local
+        p7 = re.compile(r'^(?P<as_path>[a-zA-Z0-9]+)$')
+
+        # 50.1.1.1 (metric 4) from 50.1.1.8 (50.1.1.1)
+        # 2000:90:33:1::2 from 2000:90:33:1::2 (70.3.3.3)
+        # :: from :: (50.1.1.4)
+        p8 = re.compile(r'^(?P<bgp_peer_neighbor_ip>[\w.:]+)\s+(?:\(metric\s+(?P<metric>\d+)\)\s+)?'
+                        r'from\s+(?P<origin_neighbors_ip>[\w.:]+)\s*(?:\((?P<origin_router_id>[\w.:]+)\))?')
+        
+        # Origin incomplete, metric 0, localpref 100, valid, internal, best, group-best, import-candidate, imported
+        # Origin IGP, metric 0, localpref 100, valid, external, best, group-best, import-candidate
+        # Origin incomplete, metric 0, localpref 100, weight 32768, valid, redistributed, best, group-best, import-candidate
+        # Origin incomplete, metric 0, localpref 100, valid, internal, backup, add-path, import-candidate, imported
+        p9 = re.compile(r'^Origin +(?P<origin>[a-zA-Z]+),'
+                         r'(?: +metric (?P<metric>[0-9]+),?)?'
+                         r'(?: +localpref (?P<localpref>[0-9]+),?)?'
+                         r'(?: +weight (?P<weight>[0-9]+),?)?'
+                         r'(?: +(?P<valid>valid?),)?'
+                         r'(?: (?P<redistributed>redistributed?),)?'
+                         r'(?: +(?P<state>(internal|external|local)?),)?(\,*)?'
+                         r'(?: (?P<best>best))?(\,*)?'
+                         r'(?: (?P<group_best>group-best?),*)?'
+                         r'(?: (?P<backup>backup),*)?'
+                         r'(?: (?P<add_path>add-path),*)?'
+                         r'(?: (?P<import_candidate>import-candidate?),*)?'
+                         r'(?: (?P<imported>imported?),*)?')
+                         
+         #  Received Path ID 0, Local Path ID 0, version 715
+        p10 = re.compile(r'^Received\s+Path\s+ID\s+(?P<received_path_id>(\d+)),\s+'
+                         r'Local\s+Path\s+ID\s+(?P<local_path_id>(\d+)),\s+'
+                         r'version\s+(?P<version>(\d+))$')
+                         
+        # Extended community: RT:100:1001
+        p11 = re.compile(r'^Extended\s+community:(?:\s+(?P<extended_community>.*))?$')
+        
+        # Originator: 50.1.1.1, Cluster list: 50.1.1.8
+        # Originator: 10.0.0.3, Cluster list: 10.0.0.11, 10.0.0.13
+        p12 = re.compile(r'^Originator:\s+(?P<originator>[\d.]+),\s+Cluster\s+list:\s+(?P<cluster_list>[\d., ]+)$')
+        
+        # PSID-Type:L3, SubTLV Count:1, R:0x00,
+        p13 = re.compile(r'^PSID-Type:(?P<psid_type>\w+),\s+SubTLV\s+Count:(?P<subtlv_count>\d+)$')
+        
+         # SubTLV:
+        # SubSubTLV:
+        p14 = re.compile(r'^(?P<tlv_name>SubTLV|SubSubTLV):$')
+        
+        # T:1(Sid information), Sid:fc00:c000:2003::, F:0x00, R2:0x00, Behavior:62, R3:0x00, SS-TLV Count:1
+        p15 = re.compile(r'T:(?P<t_value>\d+)\(Sid\s+information\),\s+Sid:(?P<sid_value>[a-f0-9.:]+),\s+Behavior:(?P<behaviour>\d+),\s+SS-TLV\s+Count:(?P<sstlv_count>\d+)$')
+        
+        # T:1(Sid structure):
+        p16 = re.compile(r'^T:(?P<t_value>\d+)\(Sid\s+structure\):$')
+        
+        # Initialize dictionary
+       
+        next_line_update_group = False
+        if address_family:
+            if 'ipv4' in address_family:
+                address_family = 'ipv4 unicast'
+            elif 'ipv6' in address_family:
+                address_family = 'ipv6 unicast'
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            # BGP routing table entry for 101.0.0.1/32
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                address_family = address_family.replace(' ','_')
+                vrf_dict = ret_dict.setdefault('address_family', {}).\
+                                    setdefault(address_family, {})
+                vrf_dict['prefix'] = group['prefix']
+                continue
+            
+            # Last Modified: Mar 27 02:45:20.105 for 1d15h
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                vrf_dict['last_modified'] = group['last_modified']
+                continue
+            
+            # Paths: (1 available, best #1)
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                paths_dict = vrf_dict.setdefault('paths', {})
+                paths_dict['total_available_paths'] = int(group['total_available_paths'])
+                paths_dict['best_path'] = int(group['best_path'])
+                continue
+            
+            # Not advertised to any peer
+            m = p4.match(line)
+            if m:
+                next_line_update_group = False
+                continue
+
+            # Advertised to PE peers (in unique update groups):
+            # Advertised to CE peers (in unique update groups):
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                peer_name = group['peer_name']
+                next_line_update_group = True
+                continue
+            
+            # Path #1: Received by speaker 0
+            m = p6.match(line)
+            if m:
+                group = m.groupdict()
+                path = int(group['path_num'])
+                each_path_dict = paths_dict.setdefault('path', {}).setdefault(path,{})
+                continue
+            
+            # 7000
+            # Local
+            m = p7.match(line)
+            if m:
+                group = m.groupdict()
+                as_path = group['as_path']
+                as_path_dict = each_path_dict.setdefault('as_path', {}).setdefault(as_path, {})
+                continue
+
+            # 50.1.1.1 (metric 4) from 50.1.1.8 (50.1.1.1)
+            # 2000:90:33:1::2 from 2000:90:33:1::2 (70.3.3.3)
+            # :: from :: (50.1.1.4)
+            m = p8.match(line)
+            if m:
+                group = m.groupdict()
+                bgp_peer_neighbor_ip = group['bgp_peer_neighbor_ip']
+                next_hop_dict = as_path_dict.setdefault('bgp_peer_neighbor_ip', {}).setdefault(bgp_peer_neighbor_ip, {})
+                if group['metric']:
+                    next_hop_dict['metric'] = int(group['metric'])
+                next_hop_dict['bgp_peer_neighbor_ip'] = bgp_peer_neighbor_ip
+                next_hop_dict['origin_neighbors_ip'] = group['origin_neighbors_ip']
+                next_hop_dict['origin_router_id'] = group['origin_router_id']
+                continue
+            
+            # Origin incomplete, metric 0, localpref 100, valid, internal, best, group-best, import-candidate, imported
+            # Origin IGP, metric 0, localpref 100, valid, external, best, group-best, import-candidate
+            # Origin incomplete, metric 0, localpref 100, weight 32768, valid, redistributed, best, group-best, import-candidate
+            m = p9.match(line)
+            if m:
+                group = m.groupdict()
+                status_codes = ''
+                if group['metric']:
+                    next_hop_dict['origin_metric'] = int(group['metric'])
+                if group['localpref']:
+                    next_hop_dict['localpref'] = int(group['localpref'])
+                if group['weight']:
+                    next_hop_dict['weight'] = int(group['weight'])
+
+                if group['origin']:
+                    origin = str(group['origin'])
+                    if origin == 'incomplete':
+                        next_hop_dict['origin_codes'] = '?'
+                    elif origin == 'EGP':
+                        next_hop_dict['origin_codes'] = 'e'
+                    else:
+                        next_hop_dict['origin_codes'] = 'i'
+
+                if group['valid']:
+                    status_codes += '*'
+                if group['best']:
+                    status_codes = status_codes.rstrip()
+                    status_codes += '>'
+                if group['state']:
+                    state = group['state']
+                    if state == 'internal':
+                        status_codes += 'i'
+                next_hop_dict['status_codes'] = status_codes
+                continue
+            
+            # Received Path ID 0, Local Path ID 0, version 715
+            m = p10.match(line)
+            if m:
+                group = m.groupdict()
+                next_hop_dict['received_path_id'] = int(group['received_path_id'])
+                next_hop_dict['local_path_id'] = int(group['local_path_id'])
+                next_hop_dict['version'] = int(group['version'])
+                continue
+            
+            # Extended community: RT:100:1001
+            m = p11.match(line)
+            if m:
+                group = m.groupdict()
+                value = group['extended_community']
+                next_hop_dict['extended_community'] = value
+                continue
+            
+            # Originator: 50.1.1.1, Cluster list: 50.1.1.8
+            # Originator: 10.0.0.3, Cluster list: 10.0.0.11, 10.0.0.13
+            m = p12.match(line)
+            if m:
+                group = m.groupdict()
+                next_hop_dict['originator'] = group['originator']
+                cluster_list = group['cluster_list']
+                cluster_list_str = cluster_list
+                cluster_list = cluster_list_str.split(', ')
+                next_hop_dict['cluster_list'] = cluster_list
+                continue
+            
+            #  PSID-Type:L3, SubTLV Count:1
+            m = p13.match(line)
+            if m:
+                group = m.groupdict()
+                psid_type = group['psid_type']
+                psid_dict = next_hop_dict.setdefault('psid_type', {}). \
+                    setdefault(psid_type, {})
+                psid_dict['psid_type'] = psid_type
+                psid_dict['subtlv_count'] = int(group['subtlv_count'])
+                continue
+            # SubTLV:    
+            m = p14.match(line)
+            if m:
+                group = m.groupdict()
+                subtlv_dict = psid_dict.setdefault('subtlv',{})
+            
+            # T:1(Sid information), Sid:fc00:c000:2003::, F:0x00, R2:0x00, Behavior:62, R3:0x00, SS-TLV Count:1
+            m = p15.match(line)
+            if m:
+                group = m.groupdict()
+                subtlv_dict['t_value'] = int(group['t_value'])
+                subtlv_dict['sid_value'] = group['sid_value']
+                subtlv_dict['behaviour'] = group['behaviour']
+                subtlv_dict['sstlv_count'] = int(group['sstlv_count'])
+                continue
+            
+            # T:1(Sid structure):
+            m = p16.match(line)
+            if m:
+                group = m.groupdict()
+                t_dict = subtlv_dict.setdefault('subsubtlv' , {})
+                t_dict['t_value'] = int(group['t_value'])
+                continue
+        return ret_dict
+        
+        
@@ -5,6 +5,7 @@
      *  show lldp interface
      *  show lldp neighbors detail
      *  show lldp traffic
+     *  show lldp neighbors {interface_id} detail
 """
 import re
 
@@ -87,6 +88,7 @@ class ShowLldpEntrySchema(MetaParser):
                                 'chassis_id': str,
                                 'port_description': str,
                                 Optional('system_name'): str,
+                                Optional('age'): int,
                                 Optional('system_description'): str,
                                 'time_remaining': int,
                                 Optional('neighbor_id'): str,
@@ -174,6 +176,8 @@ class ShowLldpEntry(ShowLldpEntrySchema):
         p11 = re.compile(r'Time +remaining: +(?P<time_remaining>\d+) +seconds$')
         # Hold Time: 120 seconds
         p12 = re.compile(r'Hold +Time: +(?P<hold_time>\d+) +seconds$')
+        # Age: 142641 seconds
+        p18 = re.compile(r'Age: +(?P<age>\d+) +seconds$')
         # System Capabilities: B,R
         p13 = re.compile(r'System +Capabilities: +(?P<system>[\w+,]+)$')
         # Enabled Capabilities: R
@@ -292,6 +296,13 @@ class ShowLldpEntry(ShowLldpEntrySchema):
                 group = m.groupdict()
                 sub_dict['hold_time'] = int(group['hold_time'])
                 continue
+            
+            # Age: 142641 seconds
+            m = p18.match(line)
+            if m:
+                group = m.groupdict()
+                sub_dict['age'] = int(group['age'])
+                continue
 
             # System Capabilities: B,R
             m = p13.match(line)
@@ -354,7 +365,9 @@ class ShowLldpTrafficSchema(MetaParser):
             "frame_discard": int,
             "tlv_discard": int,
             'tlv_unknown': int,
-            'entries_aged_out': int
+            'entries_aged_out': int,
+            Optional('tlv_accepted'): int,
+            Optional('last_clear'): int
         }
     }
 
@@ -388,6 +401,12 @@ class ShowLldpTraffic(ShowLldpTrafficSchema):
         # Total TLVs unrecognized: 119
         p3 = re.compile(r'Total +TLVs +(discarded: +(?P<tlv_discard>\d+))?'
             '(unrecognized: +(?P<tlv_unknown>\d+))?')
+        
+        #Total TLVs accepted: 1183
+        p4 = re.compile(r'^Total TLVs accepted: (?P<tlv_accepted>\d+)$')
+
+        # Last Clear: 245522 seconds
+        p5 = re.compile(r'Last +Clear: +(?P<last_clear>\d+) +seconds$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -416,6 +435,21 @@ class ShowLldpTraffic(ShowLldpTrafficSchema):
                 counters = ret_dict.setdefault('counters', {})
                 group = m.groupdict()
                 counters.update({k:int(v) for k, v in group.items() if v is not None})
+            
+            #Total TLVs accepted: 1183
+            m = p4.match(line)
+            if m:
+                counters = ret_dict.setdefault('counters', {})
+                group = m.groupdict()
+                counters.update({k:int(v) for k, v in group.items() if v is not None})
+            
+            # Last Clear: 245522 seconds
+            m = p5.match(line)
+            if m:
+                counters = ret_dict.setdefault('counters', {})
+                group = m.groupdict()
+                counters.update({k:int(v) for k, v in group.items() if v is not None})
+
         
         return ret_dict
 
@@ -478,4 +512,363 @@ class ShowLldpInterface(ShowLldpInterfaceSchema):
                 intf_dict.update({k:v.lower() for k, v in group.items() if v is not None})
                 continue
         
-        return ret_dict
\ No newline at end of file
+        return ret_dict
+
+class ShowLldpTrafficInterfaceIdSchema(MetaParser):
+    """Schema for show lldp traffic interface {id}"""
+    schema = {
+        'interface_id': {
+            'frame_out': int,
+            'frame_in': int,
+            'frame_error_in': int,
+            'frame_error_out': int,
+            'frame_discard': int,
+            'tlv_discard': int,
+            'tlv_unknown': int,
+            Optional('last_clear'): int,
+        }
+    }
+class ShowLldpTrafficInterfaceId(ShowLldpTrafficInterfaceIdSchema):
+    """Parser for show lldp traffic interface {id}"""
+
+    cli_command = 'show lldp traffic interface {id}'
+
+    def cli(self, id, output=None):
+        
+        if output is None:
+            out = self.device.execute(
+                self.cli_command.format(id=id))
+        else:
+            out = output
+
+        # initial return dictionary
+        ret_dict = {}
+        # initial regexp pattern
+
+        # Total frames out: 1777
+        p1 = re.compile(r'^Total frames out: (?P<frame_out>\d+)$')
+
+        # Total frames in: 1776
+        p2 = re.compile(r'^Total frames in: (?P<frame_in>\d+)$')
+
+        # Total frames received in error: 0
+        p3 = re.compile(r'^Total frames received in error: (?P<frame_error_in>\d+)$')
+
+        # Total frames out error: 0
+        p4 = re.compile(r'^Total frames out error: (?P<frame_error_out>\d+)$')
+
+        # Total frames discarded: 9
+        p5 = re.compile(r'^Total frames discarded: (?P<frame_discard>\d+)$')
+
+        # Total TLVs discarded: 0
+        p6 = re.compile(r'^Total TLVs discarded: (?P<tlv_discard>\d+)$')
+
+        # Total TLVs unrecognized: 0
+        p7 = re.compile(r'^Total TLVs unrecognized: (?P<tlv_unknown>\d+)$')
+        
+        # Last Clear: 245522 seconds
+        p8 = re.compile(r'Last +Clear: +(?P<last_clear>\d+) +seconds$')
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            # Total frames out: 1777
+            m = p1.match(line)
+            if m:
+                interface_id = ret_dict.setdefault('interface_id', {})
+                group = m.groupdict()
+                interface_id.update({'frame_out': int(group['frame_out'])})
+                continue
+
+            # Total frames in: 1776
+            m = p2.match(line)
+            if m:
+                interface_id = ret_dict.setdefault('interface_id', {})
+                group = m.groupdict()
+                interface_id.update({'frame_in': int(group['frame_in'])})
+                continue
+
+            # Total frames received in error: 0
+            m = p3.match(line)
+            if m:
+                interface_id = ret_dict.setdefault('interface_id', {})
+                group = m.groupdict()
+                interface_id.update({'frame_error_in': int(group['frame_error_in'])})
+                continue
+
+            # Total frames out error: 0
+            m = p4.match(line)
+            if m:
+                interface_id = ret_dict.setdefault('interface_id', {})
+                group = m.groupdict()
+                interface_id.update({'frame_error_out': int(group['frame_error_out'])})
+                continue
+            
+            # Total frames discarded: 9
+            m = p5.match(line)
+            if m:
+                interface_id = ret_dict.setdefault('interface_id', {})
+                group = m.groupdict()
+                interface_id.update({'frame_discard': int(group['frame_discard'])})
+                continue
+
+            # Total TLVs discarded: 0
+            m = p6.match(line)
+            if m:
+                interface_id = ret_dict.setdefault('interface_id', {})
+                group = m.groupdict()
+                interface_id.update({'tlv_discard': int(group['tlv_discard'])})
+                continue
+            
+            # Total TLVs unrecognized: 0
+            m = p7.match(line)
+            if m:
+                interface_id = ret_dict.setdefault('interface_id', {})
+                group = m.groupdict()
+                interface_id.update({'tlv_unknown': int(group['tlv_unknown'])})
+                continue
+            
+            # Last Clear: 245522 seconds
+            m = p8.match(line)
+            if m:
+                interface_id = ret_dict.setdefault('interface_id', {})
+                group = m.groupdict()
+                interface_id.update({'last_clear': int(group['last_clear'])})
+                continue
+                
+        return ret_dict
+
+class ShowLldpNeighborsInterfaceIdDetailSchema(MetaParser):
+    """Schema for show lldp neighbors {interface_id} detail"""
+    schema = {
+        'total_entries': int,
+        Optional('interfaces'): {
+            Any(): {
+                'port_id': {
+                    Any(): {
+                        'neighbors': {
+                            Any(): {
+                                Optional('peer_mac'): str,
+                                'chassis_id': str,
+                                'port_description': str,
+                                Optional('system_name'): str,
+                                Optional('age'): int,
+                                Optional('system_description'): str,
+                                'time_remaining': int,
+                                Optional('neighbor_id'): str,
+                                'hold_time': int,
+                                Optional('capabilities'): {
+                                    Any():{
+                                        Optional('system'): bool,
+                                        Optional('enabled'): bool
+                                    }
+                                },
+                                Optional('management_address'): str,
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+class ShowLldpNeighborsInterfaceIdDetail(ShowLldpNeighborsInterfaceIdDetailSchema):
+    """Parser for show lldp neighbors {interface_id} detail"""
+
+    # Capability codes:
+    #    (R) Router, (B) Bridge, (T) Telephone, (C) DOCSIS Cable Device
+    #    (W) WLAN Access Point, (P) Repeater, (S) Station, (O) Other
+    CAPABILITY_CODES = {'R': 'router',
+                        'B': 'bridge',
+                        'T': 'telephone',
+                        'C': 'docsis_cable_device',
+                        'W': 'wlan_access_point',
+                        'P': 'repeater',
+                        'S': 'station_only',
+                        'O': 'other'}
+
+    cli_command = 'show lldp neighbors {interface_id} detail'
+
+    def cli(self, interface_id, output=None):
+        
+        if output is None:
+            output = self.device.execute(
+                self.cli_command.format(interface_id=interface_id))
+
+        # initial return dictionary
+        ret_dict = {}
+        description_found = False
+        sub_dict_inserted = False
+
+        # Local Interface: GigabitEthernet0/0/0/0
+        p1 = re.compile(r'^Local +Interface: +(?P<local_interface>\S+)$')
+        # Chassis id: 001e.49ff.24f7
+        p2 = re.compile(r'^Chassis +id: +(?P<chassis_id>[\w\.]+)$')
+        # Port id: Gi2
+        # Port id: xe-0/1/2
+        p3 = re.compile(r'^Port +id: +(?P<port_id>\S+)$')
+
+        #Port Description - not advertised
+        p4 = re.compile(r'^Port +Description(\:|\s\-) '
+                        r'+(?P<port_description>[\s\S]+)$')
+
+        # System Name: ncs540
+        p5 = re.compile(r'System +Name: +(?P<system_name>\S+)$')
+        # System Description:
+                #7.8.1.02I, NCS-540 
+        p6 = re.compile(r'^System +Description:$')
+        # Cisco IOS Software [Everest], Virtual XE Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Version 16.6.1, RELEASE SOFTWARE (fc2)
+        # Cisco Nexus Operating System (NX-OS) Software 7.0(3)I7(1)
+        p15 = re.compile(r'^(?P<system_description>\d+[\S\s]+)$')
+        # Time remaining: 117 seconds
+        p7 = re.compile(r'Time +remaining: +(?P<time_remaining>\d+) +seconds$')
+        # Hold Time: 120 seconds
+        p8 = re.compile(r'Hold +Time: +(?P<hold_time>\d+) +seconds$')
+        # Age: 142641 seconds
+        p9 = re.compile(r'Age: +(?P<age>\d+) +seconds$')
+        # System Capabilities: B,R
+        p10 = re.compile(r'System +Capabilities: +(?P<system>[\w+,]+)$')
+        # Enabled Capabilities: R
+        p11 = re.compile(r'Enabled +Capabilities: +(?P<enabled>[\w+,]+)$')
+        # IPv4 address: 10.1.2.1
+        p12 = re.compile(r'IPv4 +address: +(?P<management_address>[\d\.]+)$')
+        # Total entries displayed: 2
+        p13 = re.compile(r'Total +entries +displayed: +(?P<total_entries>\d+)$')
+        # Peer MAC Address: 30:b2:b1:ff:ce:56
+        p14 = re.compile(r'Peer +MAC +Address: +(?P<mac>[\s\S]+)$')
+
+        for line in output.splitlines():
+            line = line.strip()
+            
+            # Local Interface: GigabitEthernet0/0/0/0
+            m = p1.match(line)
+            if m:
+                sub_dict_inserted = False
+                sub_dict = {}
+                group = m.groupdict()
+                intf = Common.convert_intf_name(group['local_interface'])
+                intf_dict = ret_dict.setdefault('interfaces', {}).setdefault(intf, {})
+                continue
+            
+            # Chassis id: 001e.49ff.24f7
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                sub_dict.update({'chassis_id': group['chassis_id']})
+                continue
+            
+            # Port id: Gi1/0/4
+            # Port id: xe-0/1/2
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                port_id = group['port_id']
+                # check if it is Junos interface name
+                # Port id: xe-0/1/2
+                match = re.search(r'([\w]+)-([\d\/\.]+)', port_id)
+                if not match:
+                    port_id = Common.convert_intf_name(group['port_id'])
+                port_dict = intf_dict.setdefault('port_id', {}). \
+                    setdefault(port_id, {})
+
+                continue
+
+            # Port Description: GigabitEthernet1/0/4
+            # Port Description - not advertised
+            # Port Description: to genie-3 genie 0/0/1/1 via genie3.genie 00-01
+            # Port Description: 10G to bl2-genie port Ge8/8/8:GG8
+            # Port Description: "10G link to Genie2 port Ge8/8/8/8/8"
+            # Port Description: 10G link to genie3-genie port GEN 8/8/8/8 in BE 43 (with port 0/4/0/3)
+            m = p4.match(line)
+            if m:
+                group = m.groupdict()
+                sub_dict.setdefault('port_description', group['port_description'])
+                continue
+
+            # System Name: R5
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                system_name = group['system_name']
+                sub_dict.update({'system_name': system_name})
+                sub_dict.update({'neighbor_id' : system_name})
+
+                port_dict.setdefault('neighbors', {}).setdefault(system_name, sub_dict)
+                sub_dict_inserted = True
+                continue
+
+            # System Description: 
+            m = p6.match(line)
+            if m:
+                description_found = True
+                continue
+            # # 7.8.1.02I, NCS-540 
+            m = p15.match(line)
+            if m and description_found:
+                group = m.groupdict()
+                sub_dict.update({'system_description': group['system_description']})
+                description_found = False
+
+            # Time remaining: 112 seconds
+            m = p7.match(line)
+            if m:
+                group = m.groupdict()
+                sub_dict['time_remaining'] = int(m.groupdict()['time_remaining'])
+                continue
+
+            # Hold Time: 120 seconds
+            m = p8.match(line)
+            if m:
+                group = m.groupdict()
+                sub_dict['hold_time'] = int(group['hold_time'])
+                continue
+            
+            # Age: 142641 seconds
+            m = p9.match(line)
+            if m:
+                group = m.groupdict()
+                sub_dict['age'] = int(group['age'])
+                continue
+
+            # System Capabilities: B,R
+            m = p10.match(line)
+            if m:
+                for item in m.groupdict()['system'].split(','):
+                    cap_dict = sub_dict.setdefault('capabilities', {}).\
+                        setdefault(self.CAPABILITY_CODES[item], {})
+                    cap_dict['system'] = True
+                continue
+
+            # Enabled Capabilities: B,R
+            m = p11.match(line)
+            if m:
+                for item in m.groupdict()['enabled'].split(','):
+                    cap_dict = sub_dict.setdefault('capabilities', {}).\
+                        setdefault(self.CAPABILITY_CODES[item], {})
+                    cap_dict['enabled'] = True
+                continue   
+
+            # IPv4 address: 10.1.2.1
+            m = p12.match(line)
+            if m:
+                group = m.groupdict()
+                sub_dict['management_address'] = group['management_address']
+                continue  
+            # Total entries displayed: 2
+            m = p13.match(line)
+            if m:
+                group = m.groupdict()
+                ret_dict['total_entries'] = int(group['total_entries'])
+                continue
+
+            # Peer MAC Address: 30:b2:b1:ff:ce:56
+            m = p14.match(line)
+            if m:
+                peer_mac = m.groupdict()['mac']
+                sub_dict.update({'peer_mac': peer_mac})
+                if not sub_dict_inserted:
+                    sub_dict_inserted = True
+                    port_dict.setdefault('neighbors', {}).setdefault(peer_mac, sub_dict)
+
+        return ret_dict
+
@@ -1,6 +1,7 @@
 ''' show_mpls.py
 
 IOSXR parsers for the following show commands:
+    * 'show mpls ldp interface'
     * 'show mpls label range'
     * 'show mpls ldp neighbor'
     * 'show mpls ldp neighbor {interface}'
@@ -13,6 +14,13 @@ IOSXR parsers for the following show commands:
     * 'show mpls interfaces {interface}'
     * 'show mpls forwarding'
     * 'show mpls forwarding vrf {vrf}'
+    * 'show mpls forwarding prefix {prefix}'
+    * 'show mpls ldp igp sync'
+    * 'show mpls ldp graceful-restart'
+    * 'show mpls ldp nsr summary'
+    * 'show mpls traffic-eng tunnels tabular'
+    * 'show mpls traffic-eng tunnels {tunnel_id}'
+    * 'show mpls ldp interface brief'
 '''
 
 # Python
@@ -20,11 +28,165 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
-from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
+from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, ListOf, And,\
                                          Default, Use
+
 # import parser utils
 from genie.libs.parser.utils.common import Common
 
+# ======================================================
+# Parser for 'show mpls ldp interface'
+# ======================================================
+class ShowMplsLdpInterfaceSchema(MetaParser):
+
+    """Schema for show mpls ldp interface"""
+
+    schema =  {
+        'vrf': {
+            Any(): {  
+                'vrf_index': str,
+                'interfaces': {
+                    Any(): { 
+                    'interface_index': str,
+                        Optional('enabled'): {
+                            Any(): {
+                                'via': str,
+                            }
+                        },
+                        Optional('disabled'): {
+                            Any(): {
+                                'via': str,
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+
+class ShowMplsLdpInterface(ShowMplsLdpInterfaceSchema):
+
+    '''Parser for show mpls ldp interface'''
+
+    cli_command = ['show mpls ldp interface']
+
+    """
+    Interface HundredGigE0/5/0/0 (0xe0000c0)
+        VRF: 'default' (0x60000000)
+        Disabled: 
+    Interface HundredGigE0/5/0/0.100 (0xe0001c0)
+        VRF: 'default' (0x60000000)
+        Disabled: 
+    Interface TenGigE0/3/0/0 (0xa0004c0)
+        VRF: 'default' (0x60000000)
+        Enabled via config: LDP interface
+    Interface TenGigE0/3/0/1.100 (0xa001940)
+        VRF: 'default' (0x60000000)
+        Disabled: 
+    """
+
+    def cli (self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command[0])
+        else:
+            out = output
+        
+        #Init returned dictionary        
+        ret_dict = {}
+
+        #Interface HundredGigE0/5/0/0.100 (0xe0001c0)
+        p1 = re.compile(r'Interface\s+(?P<interface_name>[\w\/\.]+)\s+\((?P<interface_index>[\w]+)\)\s*$') 
+
+        #VRF: 'default' (0x60000000)
+        p2_1 = re.compile(r'(^VRF\:\s+(?P<vrf>\'(\w)+\')\s+\((?P<vrf_index>[\s\S]+)\)\s*$)') 
+
+        #Enabled via config: LDP interface
+        p2_2 = re.compile(r'^Enabled\s+via\s+(?P<via>[\w]+):\s+(?P<enabled>.*?)$') 
+
+        #Disabled:
+        #Disabled via config: LDP interface
+        p2_3 = re.compile(r'^(?P<dis>Disabled\:)|Disabled\s+via\s+(?P<via>[\w]+):\s+(?P<disabled>.*?)$')                 
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            #Interface HundredGigE0/5/0/0.100 (0xe0001c0)
+            m1 = p1.match(line)
+                           
+            if m1:
+                interface_group = m1.groupdict()
+                inter_name = interface_group['interface_name']
+                inter_index = interface_group['interface_index']
+                continue
+            
+            #VRF: 'default' (0x60000000)
+            m2_1 = p2_1.match(line)
+            if m2_1:
+                vrf_group = m2_1.groupdict()
+                #remove single code from 'default'
+                vrf = vrf_group['vrf'].replace("'","")
+                vrf_index = vrf_group['vrf_index']
+                
+                #define top level dictionary vrf and set to 'vrf'
+                top_dict = ret_dict.setdefault('vrf', {})
+                
+                #define sub-default dictionary and set to 'default'
+                def_dict = top_dict.setdefault(vrf, {})
+                
+                #set 'sub-default' dictionary
+                def_dict['vrf_index'] = vrf_index  
+
+                #define sub-interface dictionary and set to 'interfaces'
+                int_dict = def_dict.setdefault('interfaces', {})
+
+                #set sub-interfaces dictionary
+                int_dict[inter_name] = {'interface_index':inter_index}
+                
+                #update top level dictionary 'sub-default dictionalry'                           
+                top_dict.update({vrf:def_dict})
+                continue                
+            
+            #Enabled via config: LDP interface
+            m2_2 = p2_2.match(line)
+            if m2_2:
+                enabled_group = m2_2.groupdict()
+                enabled = enabled_group['enabled']
+                via = enabled_group['via']
+
+                #define enabled_dict sub-dictionary within interface dictionary and set to 'enabled'
+                enabled_dict = int_dict[inter_name].setdefault('enabled', {}).setdefault(enabled, {})
+
+                #set enabled_dict
+                enabled_dict['via'] = via                
+                continue                
+
+            #Disabled:
+            m2_3 = p2_3.match(line)
+            if m2_3:
+                disabled_group = m2_3.groupdict()
+
+                #Disabled via config: LDP interface | Disabled:
+                disabled = disabled_group['disabled']
+
+                #via:'config'  disable:'LDP interface'
+                if disabled_group['via']:
+                    via = disabled_group['via']
+
+                    #define disabled_dic dictionary within interface dictionary and set to 'disabled'
+                    disabled_dict = int_dict[inter_name].setdefault('disabled', {}).setdefault(disabled, {})
+                    # disabled_dict['disabled'] = disabled
+                    disabled_dict['via'] = via 
+                
+                #Disabled:      
+                else:
+                    disabled = disabled_group['disabled']
+
+                    #define disabled_dic dictionary within interface dictionary and set to 'disabled'
+                    disabled_dict = int_dict[inter_name].setdefault('disabled', {})
+                continue               
+        return ret_dict
+
 
 # ======================================================
 # Parser for 'show mpls label range'
@@ -114,6 +276,17 @@ class ShowMplsLdpDiscoverySchema(MetaParser):
                                             Optional('transport_ip_addr'): str
                                         }
                                     }
+                                },
+                            }
+                        },
+                        Optional('targeted_hellos'): {
+                            Any(): {
+                                Any(): {
+                                    Optional('xmit'): bool,
+                                    Optional('recv'): bool,
+                                    Optional('active'): bool,
+                                    Optional('passive'): bool,
+                                    Optional('active/passive'): bool
                                 }
                             }
                         }
@@ -339,11 +512,289 @@ class ShowMplsLdpDiscovery(ShowMplsLdpDiscoverySchema):
                 targeted_dict.update({'xmit': True if group['xmit'] else False})
                 targeted_dict.update({'recv': True if group['recv'] else False})
                 targeted_dict.update({'active': True if group['status'] == 'active' else False})
+                targeted_dict.update({'passive': True if group['status'] == 'passive' else False})
+                targeted_dict.update({'active/passive': True if group['status'] == 'active/passive' else False})
                 continue
             
         return result_dict
 
 
+# ==============================================
+#   Show mpls ldp discovery detail
+# ==============================================
+class ShowMplsLdpDiscoveryDetailSchema(MetaParser):
+    """
+    Schema for show mpls ldp discovery detail
+    """
+    schema = {
+        'vrf': {
+            Optional('local_ldp_identifier'): str,
+            'vrfs': ListOf({
+                'vrf_name': str,
+                'interfaces': ListOf({
+                    Optional('interface'): str,
+                    Optional('vrf_hex'): str,
+                    Optional('source_ip_addr'): str,
+                    Optional('transport_ip_addr'): str,
+                    Optional('xmit'): str,
+                    Optional('recv'): str,
+                    Optional('hello_interval_ms'): str,
+                    Optional('hello_due_time_ms'): str,
+                    Optional('quick_start'): str,
+                    Optional('ldp_id'): {
+                        Optional('network_addr'): str,
+                        "ldp_entries": ListOf({
+                            Optional('source_ip_addr'): str,
+                            Optional('transport_ip_addr'): str,
+                            Optional('holdtime_sec'): str,
+                            Optional('proposed_local'): str,
+                            Optional('proposed_peer'): str,
+                            Optional('expiring_in'): str,
+                            Optional('established_date'): str,
+                            Optional('established_elapsed'): str,
+                            Optional('last_session_connection_failures'): ListOf({
+                                Optional('timestamp'): str,
+                                Optional('reason'): str,
+                                Optional('last_up_for'): str,
+                            })
+                        })
+                    }
+                })
+            })
+        }
+    }
+
+
+class ShowMplsLdpDiscoveryDetail(ShowMplsLdpDiscoveryDetailSchema):
+    """
+        Parser for show mpls ldp discovery detail
+    """
+    cli_command = 'show mpls ldp discovery detail'
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        # initial return dictionary
+        result_dict = {}
+        discovery_flag = False
+
+        # Local LDP Identifier: 10.94.1.1:0
+        p1 = re.compile(r'^Local +LDP +Identifier: '
+                        '(?P<local_ldp_identifier>[\d\.\:]+)$')
+
+        # Discovery Sources:
+        p2 = re.compile(r'^Discovery +Sources:$')
+
+        # TenGigE0/3/0/0 (0xa0004c0) : xmit/recv
+        p3 = re.compile(r'^(?P<interface>\S+) \((?P<interface_hex>[\w]+)\)'
+                        ' : (?P<xmit>xmit)?\/?(?P<recv>recv)?$')
+
+        # VRF: 'default' (0x60000000)
+        p4 = re.compile(r'^VRF: \'(?P<vrf>\S+)\' +\((?P<vrf_hex>[\w]+)\)$')
+
+        # LDP Id: 10.144.96.96:0
+        p5 = re.compile(r'^(?P<ldp_tdp>\w+) +Id:\s*(?P<ldp_tdp_id>[\S]+)$')
+
+        # Source address: 10.120.0.1; Transport address: 10.94.1.1
+        p6 = re.compile(r'^Source +address: +(?P<source_ip_addr>[\d\.]+);'
+                        ' +Transport +address: +(?P<transport_ip_addr>[\d\.]+)$')
+
+        # Hold time: 15 sec (local:15 sec, peer:45 sec)
+        p7 = re.compile(r'^Hold +time: +(?P<holdtime_sec>\d+) +sec '
+                        '\(local:(?P<proposed_local>\d+) +sec, '
+                        'peer:(?P<proposed_peer>\d+) +sec\)$')
+
+        # (expiring in 11 sec)
+        # (expiring in 14.5 sec)
+        p8 = re.compile(r'^\(expiring +in +(?P<expiring_in>\d.*) +sec\)$')
+
+        # Established: Nov  6 14:39:26.164 (5w2d ago)
+        p9 = re.compile(r'^Established: +(?P<established_date>\S.*) '
+                        '+\((?P<established_elapsed>\S*) +ago\)$')
+
+        # Hello interval: 5 sec (due in 563 msec)
+        p10 = re.compile(r'^Hello +interval: +(?P<hello_interval>\d+) +sec'
+                        ' +\(due +in +(?P<hello_due_time>\S+ +\S+)\)$')
+
+        # Quick-start: Enabled
+        p11 = re.compile(r'^Quick-start: +(?P<quick_start>\S+)$')
+
+        # Last session connection failures:
+        p12 = re.compile(r'^Last +session +connection +failures:$')
+
+        #     Jan  4 05:20:34.814: User cleared session manually
+        #     Jan  4 05:28:48.641: User cleared session manually
+        p13 = re.compile(r'^(?P<timestamp>[A-Z][a-z]{2}\s+[0-9]{1,2}\s[0-9:.]+)'
+                         ':\s+(?P<reason>[\w\s]+)$')
+
+        #         (Last up for 00:06:56)
+        #         (Last up for 00:08:05)
+        p14 = re.compile(r'\(Last +up +for +(?P<last_up_for>[\d:]+)\)$')
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            # Local LDP Identifier: 10.94.1.1:0
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                ldp_dict = result_dict.setdefault('vrf', {})
+                ldp_dict.update(
+                    {'local_ldp_identifier': group['local_ldp_identifier']})
+                continue
+
+            # Discovery Sources:
+            m = p2.match(line)
+            if m:
+                discovery_flag = True
+                continue
+
+            # TenGigE0/3/0/0 (0xa0004c0) : xmit/recv
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                interface = group['interface'] if group['interface'] \
+                    else "default"
+
+                interface_dict = {'interface': interface}
+                interface_dict.update(
+                    {'xmit': 'True' if group['xmit'] else 'False'})
+                interface_dict.update(
+                    {'recv': 'True' if group['recv'] else 'False'})
+                continue
+
+            # VRF: 'default' (0x60000000)
+            m = p4.match(line)
+            if m:
+                group = m.groupdict()
+                vrf_name = group['vrf'] if group['vrf'] else "default"
+                vrf_list = result_dict.setdefault('vrf', {}).\
+                    setdefault('vrfs', [])
+
+                vrf = next(
+                    (i for i in vrf_list if i['vrf_name'] == vrf_name), None)
+
+                if vrf is None:
+                    vrf = {'vrf_name': vrf_name, 'interfaces': []}
+                    vrf_list.append(vrf)
+
+                if interface:
+                    vrf_hex = group['vrf_hex']
+                    interface_dict.update({'vrf_hex': vrf_hex})
+                    vrf['interfaces'].append(interface_dict)
+
+                continue
+
+            # LDP Id: 10.144.96.96:0
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                ldp_tdp = group['ldp_tdp'].lower()
+                ldp_tdp_id = group['ldp_tdp_id']
+                if discovery_flag:
+                    ldp_dict = interface_dict.\
+                        setdefault('{}_id'.format(ldp_tdp), {})
+
+                    net_addr = next((i for i in ldp_dict
+                                    if i['network_addr'] == ldp_tdp_id
+                                    ), None)
+
+                    if net_addr is None:
+                        net_addr = {
+                            'network_addr': ldp_tdp_id,
+                            'ldp_entries': []
+                        }
+                        ldp_dict.update(net_addr)
+
+                continue
+
+            # Source address: 10.166.0.57; Transport address: 10.52.31.247
+            m = p6.match(line)
+            if m:
+                group = m.groupdict()
+                if 'source_ip_addr' in interface_dict.keys():
+                    item_dict = {k: v for k, v in group.items() if v}
+                    net_addr['ldp_entries'].append(item_dict)
+                else:
+                    interface_dict.update(
+                        {k: v for k, v in group.items() if v})
+                continue
+
+            # Hold time: 15 sec (local:15 sec, peer:45 sec)
+            m = p7.match(line)
+            if m:
+                group = m.groupdict()
+                item_dict.update(
+                    {k: v for k, v in group.items() if v})
+                continue
+
+            # (expiring in 14.5 sec)
+            m = p8.match(line)
+            if m:
+                group = m.groupdict()
+                item_dict.update(
+                    {'expiring_in': group['expiring_in']})
+
+            m = p9.match(line)
+            if m:
+                group = m.groupdict()
+                item_dict.update({
+                    'established_date': group['established_date'],
+                    'established_elapsed': group['established_elapsed']
+                })
+
+            # Hello interval: 5 sec (due in 563 msec)
+            m = p10.match(line)
+            if m:
+                group = m.groupdict()
+                interface_dict.update({'hello_interval_ms': str(
+                    1000*int(group['hello_interval']))})
+                if ' sec' in group['hello_due_time']:
+                    hello_due_time_ms = str(
+                        int(1000*float(group['hello_due_time'].split(' ')[0])))
+                else:
+                    hello_due_time_ms = str(
+                        int(group['hello_due_time'].split(' ')[0]))
+                interface_dict.update({'hello_due_time_ms': hello_due_time_ms})
+                continue
+
+            # Quick-start: Enabled
+            m = p11.match(line)
+            if m:
+                group = m.groupdict()
+                interface_dict.update(
+                    {'quick_start': group['quick_start'].lower()})
+                continue
+
+            # Last session connection failures:
+            m = p12.match(line)
+            if m:
+                item_dict['last_session_connection_failures'] = []
+
+            m = p13.match(line)
+            if m:
+                group = m.groupdict()
+                connection_failure_dict = {
+                    'timestamp': group['timestamp'],
+                    'reason': group['reason']
+                }
+
+                item_dict['last_session_connection_failures'].append(
+                    connection_failure_dict)
+                continue
+
+            m = p14.match(line)
+            if m:
+                group = m.groupdict()
+                connection_failure_dict.update(
+                    {'last_up_for': group['last_up_for']})
+
+        return result_dict
+
+
 # ======================================================
 # Parser for 'show mpls ldp neighbor'
 # ======================================================
@@ -1443,6 +1894,7 @@ class ShowMplsForwardingVrf(ShowMplsForwardingVrfSchema):
 # ======================================================
 # Schema for
 #   * 'show mpls forwarding'
+#   * 'show mpls forwarding prefix {prefix}'
 # ======================================================
 class ShowMplsForwardingSchema(MetaParser):
     schema = {
@@ -1470,15 +1922,20 @@ class ShowMplsForwardingSchema(MetaParser):
 # ======================================================
 # Parser for 
 #   * 'show mpls forwarding'
+#   * 'show mpls forwarding prefix {prefix}'
 # ======================================================
 class ShowMplsForwarding(ShowMplsForwardingSchema, ShowMplsForwardingVrf):
 
-    cli_command = ['show mpls forwarding']
+    cli_command = ['show mpls forwarding','show mpls forwarding prefix {prefix}']
 
-    def cli(self, output=None):
+    def cli(self,prefix=None, output=None):
 
         if output is None:
-            out = self.device.execute(self.cli_command[0])
+            if prefix:
+                command = self.cli_command[1].format(prefix=prefix)
+            else:
+                command = self.cli_command[0]
+            out = self.device.execute(command)
         else:
             out = output
 
@@ -1487,3 +1944,1623 @@ class ShowMplsForwarding(ShowMplsForwardingSchema, ShowMplsForwardingVrf):
                     'vrf', {}).get('default', {})
 
         return ret_dict
+
+
+# ======================================================
+# Parser for 'show mpls ldp bindings'
+# ======================================================
+class ShowMplsLdpBindingsSchema(MetaParser):
+
+    """Schema for 'show mpls ldp bindings' """
+
+    schema =  {
+        'lib_entry': {
+            Any(): {
+                'rev': int,
+                Optional('local_binding'): {
+                    'label': str,
+                },
+                Optional('remote_bindings'): {
+                    Optional('peer_count'): int,
+                    'label': {
+                        Any(): { 
+                            'lsr_id': {
+                                Any(): {
+                                    'label': str,
+                                    'lsr_id': str
+                                }
+                            }
+                        }
+                    },
+                }
+            }
+        }
+    }
+
+class ShowMplsLdpBindings(ShowMplsLdpBindingsSchema):
+
+    """ Parser for 'show mpls ldp bindings' """
+
+    cli_command = ['show mpls ldp bindings']
+
+    def cli (self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command[0])
+        
+        # intialize bindings dictionary for parsed results
+        result_dict = {}
+
+        # 10.145.95.95/32, rev 20
+        # 10.9.9.98/32 , rev 6 
+        p1 = re.compile(r'^(?P<lib_entry>[\d\.\/]+) ?, +rev +(?P<rev>\d+)')
+        
+        # Local binding: label: ImpNull
+        # local binding: label:IMP-NULL
+        p2 = re.compile(r'^[lL]ocal +binding: +label: ?(?P<local_label>\S+)')
+        
+        # Remote bindings: (2 peers)
+        # remote bindings : 
+        p3 = re.compile(r'^[rR]emote +bindings ?:(?: +\((?P<peer_count>\d+) +peers\))?')
+        
+        # 10.145.95.95:0       16002
+        # lsr:10.255.255.255:0, label:16 
+        p4 = re.compile(r'^(?:lsr:)?(?P<lsr_id>[\d\.\:]+),? +(?:label:)?(?P<remote_label>\S+)')
+
+        for line in output.splitlines():
+            line = line.strip() # strip whitespace from beginning and end
+
+            # 10.145.95.95/32, rev 20
+            # 10.9.9.98/32 , rev 6 
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                lib_entry_dict = result_dict.setdefault('lib_entry', {}).setdefault(group['lib_entry'], {})
+                lib_entry_dict.update({'rev': int(group['rev'])})
+                continue
+            
+            # Local binding: label: ImpNull
+            # local binding: label:IMP-NULL
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                local_dict = lib_entry_dict.setdefault('local_binding', {})
+                local_dict.update({'label': group['local_label']})
+                continue
+                
+            # Remote bindings: (2 peers)
+            # remote bindings : 
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                remote_dict = lib_entry_dict.setdefault('remote_bindings', {})
+                if group['peer_count']: 
+                    remote_dict.update({'peer_count': int(group['peer_count'])})
+                continue
+
+            # 10.145.95.95:0       16002
+            # lsr:10.255.255.255:0, label:16 
+            m = p4.match(line)
+            if m:
+                group = m.groupdict()
+                lsr_id = remote_dict.setdefault('label', {}).\
+                            setdefault(group['remote_label'],{}).\
+                            setdefault('lsr_id', {}).\
+                            setdefault(group['lsr_id'],{})
+                            
+                lsr_id.update({'label': group['remote_label']})
+                lsr_id.update({'lsr_id': group['lsr_id']})
+                continue
+            
+        return result_dict
+
+
+# ==============================================
+#  Schema for show mpls ldp parameters
+# ==============================================
+
+class ShowMplsLdpParametersSchema(MetaParser):
+    """ Schema for
+        * show mpls ldp parameters
+    """
+    schema = {
+        "ldp-parameters": {
+            "role": str,
+            "protocol-version": str,
+            "router-id": str,
+            "null-label": {
+                "null-label-ipv4-address": str
+            },
+            "session": {
+                "session-holdtime-sec": int,
+                "session-keepalive-interval-sec": int,
+                "session-backoff": {
+                    "backoff-initial-sec": int,
+                    "backoff-maximum-sec": int
+                },
+                "global-md5-password": str
+            },
+            "discovery": {
+                "discovery-link-hellos": {
+                    "link-hellos-hold-time-sec": int,
+                    "link-hellos-interval-sec": int
+                },
+                "discovery-target-hellos": {
+                    "target-hellos-hold-time-sec": int,
+                    "target-hellos-interval-sec": int
+                },
+                "discovery-quick-start": str,
+                "discovery-transport-address": {
+                    "transport-ipv4-address": str
+                },
+            },
+            "graceful-restart": {
+                "graceful-restart-status": str,
+                "graceful-restart-reconnect-timeout": {
+                    "reconnect-timeout-time-sec": int,
+                    "reconnect-timeout-forward-state-holdtime-sec": int
+                }
+            },
+            "nsr": {
+                "nsr-status": str,
+                Optional("nsr-sync-ed-status"): str
+            },
+            "timeouts": {
+                "housekeeping-periodic-timer-timeouts-sec": int,
+                "local-binding-timeouts-sec": int,
+                "forward-state-lsd-timeouts-sec": int
+            },
+            "delay-af-bind-peer-sec": int,
+            "max": {
+                "interfaces": {
+                    "max-interfaces-units": int,
+                    Optional("attached-interfaces-units"): int,
+                    Optional("te-tunnel-interfaces-units"): int
+                },
+                "max-peers-units": int
+            },
+            "oor-state": {
+                "oor-memory": str
+            },
+        },
+    }
+
+
+# ==============================================
+#  Parser for show mpls ldp parameters
+# ==============================================
+
+class ShowMplsLdpParameters(ShowMplsLdpParametersSchema):
+    """ For Parsing
+        * show mpls ldp parameters
+    """
+
+    cli_command = 'show mpls ldp parameters'
+
+    def cli(self, output=None):
+        if not output:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        ret_dict = {}
+
+        # LDP Parameters:
+        p1 = re.compile(r'^LDP +Parameters:$')
+
+        # Role: Active
+        p2 = re.compile(r'^Role: +(?P<role_value>\w+)$')
+
+        # Protocol Version: 1
+        p3 = re.compile(r'^Protocol +Version: +(?P<protocol_version_number>\S+)$')
+
+        # Router ID: 10.4.1.1
+        p4 = re.compile(r'^Router +ID: +(?P<router_id_ip>[\d.]+)$')
+
+        # Null Label:
+        p5 = re.compile(r'^Null +Label:$')
+
+        # IPv4: Implicit
+        p6 = re.compile(r'^IPv4: +(?P<null_labels_ipv4>\w+)$')
+
+        # Session:
+        p7 = re.compile(r'^Session:$')
+
+        # Hold time: 180 sec
+        p8 = re.compile(r'^Hold +time: +(?P<hold_time_seconds>\d+) +sec$')
+
+        # Keepalive interval: 60 sec
+        p9 = re.compile(r'^Keepalive +interval: +(?P<keepalive_interval_seconds>\d+) +sec$')
+
+        # Backoff: Initial:15 sec, Maximum:120 sec
+        p10 = re.compile(
+            r'^Backoff: +Initial:(?P<initial_seconds>\d+) +sec'
+            r', +Maximum:(?P<maximum_seconds>\d+) +sec$')
+
+        # Global MD5 password: Disabled
+        p11 = re.compile(
+            r'^Global +MD5 +password: +(?P<global_md5_password>\w+)$')
+
+        # Discovery:
+        p12 = re.compile(r'^Discovery:$')
+
+        # Link Hellos: Holdtime:15 sec, Interval:5 sec
+        p13 = re.compile(
+            r'^Link +Hellos: +Holdtime:(?P<link_hellos_hold_time_seconds>\d+) +sec,'
+            r' +Interval:(?P<link_hellos_interval_seconds>\d+) +sec$')
+
+        # Targeted Hellos: Holdtime:90 sec, Interval:10 sec
+        p14 = re.compile(
+            r'^Targeted +Hellos: +Holdtime:(?P<targeted_hellos_hold_time_seconds>\d+) +sec'
+            r', +Interval:(?P<targeted_hellos_interval_seconds>\d+) +sec$')
+
+        # Quick-start: Enabled (by default)
+        p15 = re.compile(r'^Quick-start: +(?P<quick_start>.*)$')
+
+        # Transport address:
+        p16 = re.compile(r'^Transport +address:$')
+
+        # IPv4: 10.4.1.1
+        p17 = re.compile(r'^IPv4: +(?P<transport_address_ipv4_ip>[\d.]+)$')
+
+        # Graceful Restart:
+        p18 = re.compile(r'^Graceful +Restart:$')
+
+        # Enabled
+        p19 = re.compile(r'^(?P<graceful_restart_value>(Enabled|Disabled))$')
+
+        # Reconnect Timeout:120 sec, Forwarding State Holdtime:180 sec
+        p20 = re.compile(
+            r'^Reconnect +Timeout:(?P<reconnect_timeout_seconds>\d+) +sec,'
+            r' +Forwarding +State +Holdtime:(?P<forwarding_state_holdtime_seconds>\d+) +sec$')
+
+        # NSR: Enabled, Sync-ed
+        p21 = re.compile(r'^NSR: +(?P<nsr_value>\w+)(, +(?P<synced_value>Sync-ed))?$')
+
+        # Timeouts:
+        p22 = re.compile(r'^Timeouts:$')
+
+        # Housekeeping periodic timer: 10 sec
+        p23 = re.compile(
+            r'^Housekeeping +periodic +timer: +(?P<housekeeping_periodic_timer_seconds>\d+) +sec$')
+
+        # Local binding: 300 sec
+        p24 = re.compile(r'^Local +binding: +(?P<local_binding_seconds>\d+) +sec$')
+
+        # Forwarding state in LSD: 360 sec
+        p25 = re.compile(
+            r'^Forwarding +state +in +LSD: +(?P<forwarding_state_lsd_seconds>\d+) +sec$')
+
+        # Delay in AF Binding withdrawl from peer: 180 sec
+        p26 = re.compile(
+            r'^Delay +in +AF +Binding +Withdrawl +from +peer:'
+            r' +(?P<delay_af_binding_peer_seconds>\d+) +sec$')
+
+        # Max:
+        p27 = re.compile(r'^Max:$')
+
+        # 5000 interfaces (4000 attached, 1000 TE tunnel), 2000 peers
+        p28 = re.compile(
+            r'^(?P<max_interface_number>\d+) +interfaces(,| )(\(| )'
+            r'((?P<attached_interfaces_number>\d+) +attached(\)|,))?'
+            r'((,| )*)?((?P<te_tunnel_number>\d+) +TE +tunnel\))?((,| )*)?((?P<peers_number>\d+) +peers)?')
+
+        # OOR state
+        p29 = re.compile(r'^OOR +state$')
+
+        # Memory: Normal
+        p30 = re.compile(
+            r'^Memory: +(?P<oor_memory_value>(Normal|Major|Critical))$')
+
+        # Looping through each line
+        for line in out.splitlines():
+            line = line.strip()
+
+            # LDP Parameters:
+            m = p1.match(line)
+            if m:
+                parameters_dict = ret_dict.setdefault('ldp-parameters', {})
+                continue
+
+            # Role: Active
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                parameters_dict['role'] = group['role_value']
+                continue
+
+            # Protocol Version: 1
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                parameters_dict['protocol-version'] = group['protocol_version_number']
+                continue
+
+            # Router ID: 10.4.1.1
+            m = p4.match(line)
+            if m:
+                group = m.groupdict()
+                parameters_dict['router-id'] = group['router_id_ip']
+                continue
+
+            # Null Label:
+            m = p5.match(line)
+            if m:
+                null_label_dict = parameters_dict.setdefault('null-label', {})
+                continue
+
+            # ipv4: Implicit
+            m = p6.match(line)
+            if m:
+                group = m.groupdict()
+                null_label_dict['null-label-ipv4-address'] = group['null_labels_ipv4']
+                continue
+
+            # Session:
+            m = p7.match(line)
+            if m:
+                session_dict = parameters_dict.setdefault('session', {})
+                continue
+
+            # Hold time: 180 sec
+            m = p8.match(line)
+            if m:
+                group = m.groupdict()
+                session_dict['session-holdtime-sec'] = int(group['hold_time_seconds'])
+                continue
+
+            # Keepalive interval: 60 sec
+            m = p9.match(line)
+            if m:
+                group = m.groupdict()
+                session_dict['session-keepalive-interval-sec'] = int(group['keepalive_interval_seconds'])
+                continue
+
+            # Backoff: Initial:15 sec, Maximum:120 sec
+            m = p10.match(line)
+            if m:
+                group = m.groupdict()
+                backoff_dict = session_dict.setdefault('session-backoff', {})
+                backoff_dict['backoff-initial-sec'] = int(group['initial_seconds'])
+                backoff_dict['backoff-maximum-sec'] = int(group['maximum_seconds'])
+                continue
+
+            # Global MD5 password: Disabled
+            m = p11.match(line)
+            if m:
+                group = m.groupdict()
+                session_dict['global-md5-password'] = group['global_md5_password']
+                continue
+
+            # Discovery:
+            m = p12.match(line)
+            if m:
+                discovery_dict = parameters_dict.setdefault('discovery', {})
+                continue
+
+            # Link Hellos: Holdtime:15 sec, Interval:5 sec
+            m = p13.match(line)
+            if m:
+                group = m.groupdict()
+                link_hellos_dict = discovery_dict.setdefault('discovery-link-hellos', {})
+                link_hellos_dict['link-hellos-hold-time-sec'] = int(group['link_hellos_hold_time_seconds'])
+                link_hellos_dict['link-hellos-interval-sec'] = int(group['link_hellos_interval_seconds'])
+                continue
+
+            # Targeted Hellos: Holdtime:90 sec, Interval:10 sec
+            m = p14.match(line)
+            if m:
+                group = m.groupdict()
+                target_hellos_dict = discovery_dict.setdefault('discovery-target-hellos', {})
+                target_hellos_dict['target-hellos-hold-time-sec'] = int(group['targeted_hellos_hold_time_seconds'])
+                target_hellos_dict['target-hellos-interval-sec'] = int(group['targeted_hellos_interval_seconds'])
+                continue
+
+            # Quick-start: Enabled (by default)
+            m = p15.match(line)
+            if m:
+                group = m.groupdict()
+                discovery_dict['discovery-quick-start'] = group['quick_start']
+                continue
+
+            # Transport address:
+            m = p16.match(line)
+            if m:
+                transport_address_dict = discovery_dict.setdefault('discovery-transport-address', {})
+                continue
+
+            # IPv4: 10.4.1.1
+            m = p17.match(line)
+            if m:
+                group = m.groupdict()
+                transport_address_dict['transport-ipv4-address'] = group['transport_address_ipv4_ip']
+                continue
+
+            # Graceful Restart:
+            m = p18.match(line)
+            if m:
+                graceful_restart_dict = parameters_dict.setdefault('graceful-restart', {})
+                continue
+
+            # Enabled
+            m = p19.match(line)
+            if m:
+                group = m.groupdict()
+                graceful_restart_dict['graceful-restart-status'] = group['graceful_restart_value']
+                continue
+
+            # Reconnect Timeout:120 sec, Forwarding State Holdtime:180 sec
+            m = p20.match(line)
+            if m:
+                group = m.groupdict()
+                reconnect_timeout_dict =\
+                    graceful_restart_dict.setdefault('graceful-restart-reconnect-timeout', {})
+                reconnect_timeout_dict['reconnect-timeout-time-sec'] =\
+                    int(group['reconnect_timeout_seconds'])
+                reconnect_timeout_dict['reconnect-timeout-forward-state-holdtime-sec'] =\
+                    int(group['forwarding_state_holdtime_seconds'])
+                continue
+
+            # NSR: Enabled, Sync-ed
+            m = p21.match(line)
+            if m:
+                group = m.groupdict()
+                nrs_dict = parameters_dict.setdefault('nsr', {})
+                nrs_dict['nsr-status'] = group['nsr_value']
+
+                if group['synced_value']:
+                    nrs_dict['nsr-sync-ed-status'] = group['synced_value']
+                continue
+
+            # Timeouts:
+            m = p22.match(line)
+            if m:
+                timeouts_dict = parameters_dict.setdefault('timeouts', {})
+                continue
+
+            # Housekeeping periodic timer: 10 sec
+            m = p23.match(line)
+            if m:
+                group = m.groupdict()
+                timeouts_dict['housekeeping-periodic-timer-timeouts-sec'] =\
+                    int(group['housekeeping_periodic_timer_seconds'])
+                continue
+
+            # Local binding: 300 sec
+            m = p24.match(line)
+            if m:
+                group = m.groupdict()
+                timeouts_dict['local-binding-timeouts-sec'] =\
+                    int(group['local_binding_seconds'])
+                continue
+
+            # Forwarding state in LSD: 360 sec
+            m = p25.match(line)
+            if m:
+                group = m.groupdict()
+                timeouts_dict['forward-state-lsd-timeouts-sec'] =\
+                    int(group['forwarding_state_lsd_seconds'])
+                continue
+
+            # Delay in AF Binding Withdrawl from peer: 180 sec
+            m = p26.match(line)
+            if m:
+                group = m.groupdict()
+                parameters_dict['delay-af-bind-peer-sec'] =\
+                    int(group['delay_af_binding_peer_seconds'])
+                continue
+
+            # Max:
+            m = p27.match(line)
+            if m:
+                max_dict = parameters_dict.setdefault('max', {})
+                continue
+
+            # 5000 interfaces (4000 attached, 1000 TE tunnel), 2000 peers
+            m = p28.match(line)
+            if m:
+                group = m.groupdict()
+
+                max_interfaces_dict = max_dict.setdefault('interfaces', {})
+                max_interfaces_dict['max-interfaces-units'] =\
+                    int(group['max_interface_number'])
+
+                if group['attached_interfaces_number']:
+                    max_interfaces_dict['attached-interfaces-units'] =\
+                        int(group['attached_interfaces_number'])
+
+                if group['te_tunnel_number']:
+                    max_interfaces_dict['te-tunnel-interfaces-units'] = \
+                        int(group['te_tunnel_number'])
+
+                max_dict['max-peers-units'] = \
+                    int(group['peers_number'])
+                continue
+
+            # OOR state
+            m = p29.match(line)
+            if m:
+                oor_state_dict = parameters_dict.setdefault('oor-state', {})
+                continue
+
+            # Memory: Normal
+            m = p30.match(line)
+            if m:
+                group = m.groupdict()
+                oor_state_dict['oor-memory'] = group['oor_memory_value']
+                continue
+
+        return ret_dict
+
+
+# ================================================
+#   Show mpls ldp igp sync
+# ================================================
+class ShowMplsLdpIgpSyncSchema(MetaParser):
+    """
+    Schema for show mpls ldp igp sync
+    """
+    schema = {
+        'vrf': {
+            Any(): {
+                Optional('vrf_index'): str,
+                'interfaces': {
+                    Any(): {
+                        Optional('sync'): {
+                        Optional('status'): str,
+                        Optional('delay'): Or(int, str),
+                        Optional('peers'):{
+                            Any():{
+                                Optional('graceful_restart'): bool
+                            }
+                          }
+                        }
+                    },
+                },
+            },
+        }
+    }
+
+class ShowMplsLdpIgpSync(ShowMplsLdpIgpSyncSchema):
+    """
+        Parser for show mpls ldp igp sync
+    """
+    cli_command = ['show mpls ldp igp sync']
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command[0])
+        else:
+            out = output
+
+        # Vrf is default
+        vrf = "default"
+
+        # initial return dictionary
+        ret_dict = {}
+
+        # HundredGigE0/0/0/0:
+        # Bundle-Ether40051:
+        p1 = re.compile(r'^(?P<interface>[\w-]+[\/\d]+):$')
+
+        # VRF: 'default' (0x60000000)
+        p2 = re.compile(r'^VRF:\s+\'(?P<vrf>\S+)\'\s+\((?P<vrf_index>.+)\)$')
+
+        # Sync delay: Disabled
+        # Sync delay: 5 sec
+        p3 = re.compile(r'^Sync +delay:\s+(?P<delay>\w+)(?: sec)?$')
+
+        # Sync status: Ready
+        p4 = re.compile(r'^Sync +status:\s+(?P<status>.+)$')
+
+        # 63.63.63.63:0   (GR)
+        # 10.120.0.10:0
+        p5 = re.compile(r'^(?P<peers>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}:\d{1,3})\s*(?P<gr_flag>\(GR\))?$')
+
+        for line in out.splitlines():
+            line = line.strip()
+
+
+            # HundredGigE0/0/0/0:
+            # Bundle-Ether40051:
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                interface = group['interface']
+                continue
+
+            # VRF: 'default' (0x60000000)
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                vrf = group['vrf']
+                vrf_dict = ret_dict.setdefault('vrf', {}). \
+                    setdefault(vrf, {})
+                interface_dict = vrf_dict.setdefault('interfaces', {}). \
+                    setdefault(interface, {})
+                vrf_dict.update({'vrf_index': group['vrf_index']})
+                continue
+
+            # Sync delay: Disabled
+            # Sync delay: 5 sec
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                sync_dict = interface_dict.setdefault('sync', {})
+                try:
+                    sync_dict.update({'delay': int(group['delay'])})
+                except ValueError:
+                    sync_dict.update({'delay': group['delay']})
+                continue
+
+            # Sync status: Ready
+            m = p4.match(line)
+            if m:
+                group = m.groupdict()
+                status = group['status']
+                sync_status_dict = sync_dict.setdefault('status', status)
+                continue
+
+            # 63.63.63.63:0   (GR)
+            # 10.120.0.10:0
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                peers = group['peers']
+                peers_dict = sync_dict.setdefault('peers', {})\
+                                      .setdefault(peers, {})
+
+                gr_flag = False
+                if group['gr_flag']:
+                    gr_flag = True
+                peers_dict.update({'graceful_restart': gr_flag})
+                continue
+
+        return ret_dict
+
+
+# ================================================
+#   show mpls ldp graceful-restart
+# ================================================
+class ShowMplsLdpGracefulRestartSchema(MetaParser):
+    """
+    Schema for show mpls ldp graceful-restart
+    """
+    schema = {
+        'vrf': {
+            'default': {
+                'forwarding_state_hold_timer': str,
+                'gr_neighbors': int,
+                'neighbor_id': {
+                    Any(): {
+                        Optional('up'): str,
+                        Optional('connect_count'): str,
+                        Optional('liveness_timer'): str,
+                        Optional('recovery_timer'): str
+                        }
+                    },
+                },
+            },
+        }
+
+
+class ShowMplsLdpGracefulRestart(ShowMplsLdpGracefulRestartSchema):
+    """
+        Parser for show mpls ldp graceful-restart
+    """
+    cli_command = ['show mpls ldp graceful-restart']
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command[0])
+        else:
+            out = output
+
+        # initial return dictionary
+        ret_dict = {}
+
+        # Forwarding State Hold timer : Not Running
+        p1 = re.compile(r'^Forwarding +State +Hold +timer\s+:\s+(?P<state_hold_timer>.+)$')
+
+        # GR Neighbors                : 1
+        p2 = re.compile(r'^GR +Neighbors\s+:\s+(?P<gr_neighbors>.+)$')
+
+        # 17.17.17.17      Y        4                -                   -
+        # 17.17.17.17      Y        4                5                   6
+        p3 = re.compile(r'^(?P<neighbor_id>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+(?P<up>\w+)\s+'
+                        r'(?P<connect_count>[\d\-]+)\s+(?P<liveness_timer>[\d\-]+)\s+'
+                        r'(?P<recovery_timer>[\d\-]+)$')
+
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            # Forwarding State Hold timer : Not Running
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                vrf_dict = ret_dict.setdefault('vrf', {}). \
+                    setdefault('default', {})
+                vrf_dict.update({'forwarding_state_hold_timer': group['state_hold_timer']})
+                continue
+
+            # GR Neighbors                : 1
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                vrf_dict.update({'gr_neighbors': int(group['gr_neighbors'])})
+
+            # 17.17.17.17      Y        4                -                   -
+            # 17.17.17.17      Y        4                5                   6
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                neighbor_dict = vrf_dict.setdefault('neighbor_id', {}).\
+                    setdefault(group['neighbor_id'], {})
+
+                neighbor_dict.update({
+                    'up': group['up'],
+                    'connect_count': group['connect_count'],
+                    'liveness_timer': group['liveness_timer'],
+                    'recovery_timer': group['recovery_timer']
+                })
+
+        return ret_dict
+
+# ================================================
+#   show mpls ldp nsr summary
+# ================================================
+class ShowMplsLdpNsrSummarySchema(MetaParser):
+    """
+    Schema for show mpls ldp nsr summary
+    """
+    schema = {
+        'sessions': {
+            'total': int,
+            'nsr_eligible': int,
+            'sync_ed': int,
+            Optional('oper'): int,
+            Optional('ready'): int
+        }
+    }
+
+class ShowMplsLdpNsrSummary(ShowMplsLdpNsrSummarySchema):
+    """
+        Parser for show mpls ldp nsr summary
+    """
+    cli_command = ['show mpls ldp nsr summary']
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command[0])
+        else:
+            out = output
+
+        # initial return dictionary
+        ret_dict = {}
+
+        # Total: 1, NSR-eligible: 1, Sync-ed: 1
+        p1 = re.compile(r'^Total:\s+(?P<total>\d+)\,\s+NSR-eligible:\s+'
+                        r'(?P<nsr_eligible>\d+)\,\s+Sync-ed:\s+(?P<sync_ed>\d+)$')
+
+        # (1 Oper)
+        p2 = re.compile(r'^\((?P<oper>\d+)\s+Oper\)$')
+
+        # (1 Ready)
+        p3 = re.compile(r'^\((?P<ready>\d+)\s+Ready\)$')
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            # Total: 1, NSR-eligible: 1, Sync-ed: 1
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                sessions_dict = ret_dict.setdefault('sessions', {})
+                sessions_dict.update({
+                 'total': int(group['total']),
+                 'nsr_eligible': int(group['nsr_eligible']),
+                 'sync_ed': int(group['sync_ed'])
+                })
+                continue
+
+            # (1 Oper)
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                sessions_dict.update({'oper': int(group['oper'])})
+                continue
+
+            # (1 Ready)
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                sessions_dict.update({'ready': int(group['ready'])})
+                continue
+
+        return ret_dict
+
+
+# ======================================================
+# Schema for 'show mpls traffic-eng tunnels tabular'
+# ======================================================
+class ShowMplsTrafficEngTunnelsTabularSchema(MetaParser):
+    """Schema for
+    show mpls traffic-eng tunnels tabular
+    """
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'tunnel': {
+                    Any(): {
+                        'lsp_id': int,
+                        'destination_address': str,
+                        'source_address': str,
+                        'tunnel_state': str,
+                        'frr_state': str,
+                        'lsp_role': str,
+                        Optional('path_prot'): str
+                        }
+                    },
+                }
+            },
+        }
+
+class ShowMplsTrafficEngTunnelsTabular(ShowMplsTrafficEngTunnelsTabularSchema):
+    """
+        Parser for show mpls traffic-eng tunnels tabular
+    """
+    cli_command = ['show mpls traffic-eng tunnels tabular']
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command[0])
+        else:
+            out = output
+
+        # initial return dictionary
+        ret_dict = {}
+
+        # tunnel-te50000     4 109.109.109.109     17.17.17.17     up  Ready Head Inact
+        p1 = re.compile(r'^(?P<tunnel>\S+)\s+(?P<lsp_id>\d+)\s+(?P<destination_address>\S+)\s+'
+                        r'(?P<source_address>\S+)\s+(?P<tunnel_state>\w+)\s+(?P<frr_state>\w+)\s+'
+                        r'(?P<lsp_role>\w+)[\s+]?(?P<path_prot>[\w]+)?$')
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            # tunnel-te50000     4 109.109.109.109     17.17.17.17     up  Ready Head Inact
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                tunnel = group.pop('tunnel')
+                lsp_id = int(group.pop('lsp_id'))
+                vrf_dict = ret_dict.setdefault('vrf', {}).setdefault('default', {})
+                tunnel_dict = vrf_dict.setdefault('tunnel', {}).\
+                    setdefault(tunnel, {})
+                tunnel_dict.update({'lsp_id': lsp_id})
+                tunnel_dict.update(
+                    {k: v for k, v in group.items() if v is not None}
+                )
+                continue
+
+        return ret_dict
+
+
+# ======================================================
+# Schema for 'show mpls traffic-eng tunnels {tunnel_id}'
+# ======================================================
+class ShowMplsTrafficEngTunnelsTunnelidSchema(MetaParser):
+    """Schema for
+    show mpls traffic-eng tunnels {tunnel_id}
+    """
+
+    schema = {
+        'tunnel': {
+            Any(): {
+                'destination': str,
+                'ifhandle': str,
+                'signalled_name': str,
+                'status':{
+                    'admin': str,
+                    'oper': str,
+                    'path': str,
+                    'signalling': str,
+                    Optional('path_option'): {
+                        Optional(Any()): {
+                            Optional('type'): str,
+                            Optional('path_weight'): int,
+                            Optional('accumulative_metrics'): {
+                                Optional('te'): int,
+                                Optional('igp'): int,
+                                Optional('path'): int,
+                            }
+                        }
+                    },
+                    Optional('last_pcalc_error'): {
+                        'time': str,
+                        'info': str,
+                        'reverselink': str
+                    },
+                    'g_pid': str,
+                    'bandwidth_requested': int,
+                    'bandwidth_requested_unit': str,
+                    'creation_time': str,
+                },
+                'config_parameters': {
+                    'bandwidth': int,
+                    'bandwidth_unit': str,
+                    'priority': int,
+                    'affinity': str,
+                    'metric_type': str,
+                    'path_selection': {
+                        'tiebreaker': str
+                    },
+                    'hop_limit': str,
+                    'cost_limit': str,
+                    'delay_limit': str,
+                    'delay_measurement': str,
+                    'path_invalidation_timeout': int,
+                    'path_invalidation_timeout_unit': str,
+                    'action': str,
+                    'autoroute': str,
+                    'lockdown': str,
+                    'policy_class': str,
+                    'forward_class': int,
+                    'forward_class_state': str,
+                    'forwarding_adjacency': str,
+                    'autoroute_destinations': int,
+                    'loadshare': int,
+                    'loadshare_state': str,
+                    'auto_bw': str,
+                    'auto_capacity': str,
+                    'fast_reroute': str,
+                    'protection_desired': str,
+                    'path_protection': str,
+                    'bfd_fast_detection': str,
+                    'reoptimization_after_affinity_failure': str,
+                    'soft_preemption': str,
+                },
+                'history': {
+                    'tunnel_up_time': str,
+                    'current_lsp': {
+                        'uptime': str
+                    },
+                    'reopt_lsp': {
+                        'lsp_failure': {
+                            'lsp': str,
+                            'lsp_status': str,
+                            'date_time': str
+                        }
+                    },
+                    'prior_lsp': {
+                        'id': int,
+                        'path_option': int,
+                        'removal_trigger': str
+                    }
+                },
+                'path_info': {
+                    Any():{
+                        'node_hop_count': int,
+                        'hop': {
+                            Any(): {
+                                'ip_address': str
+                            }
+                        }
+                    }
+                },
+                'displayed': {
+                    'heads_displayed': int,
+                    'total_heads': int,
+                    'midpoints_displayed': int,
+                    'total_midpoints': int,
+                    'tails_displayed': int,
+                    'total_tails': int,
+                    'status': {
+                        'up': int,
+                        'down': int,
+                        'recovering': int,
+                        'recovered_heads': int
+                    }
+                }
+            }
+        }
+    }
+
+class ShowMplsTrafficEngTunnelsTunnelid(ShowMplsTrafficEngTunnelsTunnelidSchema):
+    """
+        Parser for show mpls traffic-eng tunnels {tunnel_id}
+    """
+    cli_command = ['show mpls traffic-eng tunnels {tunnel_id}']
+
+    def cli(self, output=None, tunnel_id=None):
+        if output is None:
+            out = self.device.execute(self.cli_command[0].format(tunnel_id=tunnel_id))
+        else:
+            out = output
+
+        # initial return dictionary
+        ret_dict = {}
+
+        # Name: tunnel-te50000  Destination: 109.109.109.109  Ifhandle:0x20e0
+        p1 = re.compile(r'^Name:\s+(?P<tunnel>\S+)\s+Destination:\s+(?P<destination>\S+)'
+                        r'\s+Ifhandle:(?P<ifhandle>\S+)$')
+
+        # Signalled-Name: 50000_F17-ASR9922_F109-ASR9001
+        p2 = re.compile(r'^Signalled-Name:\s+(?P<signalled_name>\S+)$')
+
+        # Admin:    up Oper:   up   Path:  valid   Signalling: connected
+        p3 = re.compile(r'^Admin:\s+(?P<admin>\S+)\s+Oper:\s+(?P<oper>\S+)\s+Path:\s+(?P<path>\S+)'
+                        r'\s+Signalling:\s+(?P<signalling>\S+)$')
+
+        # path option 10,  type explicit 50000-EPath_10 (Basis for Setup, path weight 160)
+        p4 = re.compile(r'^path +option\s+(?P<path_option>\d+),\s+type\s+(?P<type>\S+)'
+                        r'\s+?(?P<path_name>\S+)?\s+\((?P<path_status>.*),\s+path weight\s+(?P<path_weight>\d+)\)$')
+
+        # path option 20,  type explicit 50000-EPath_20
+        # path option 100,  type dynamic
+        p4_1 = re.compile(r'^path +option\s+(?P<path_option>\d+),\s+type\s+(?P<type>\S+)'
+                          r'[\s+]?(?P<path_name>\S+)?$')
+
+        # Accumulative metrics: TE 160 IGP 160 Delay 600000
+        p5 = re.compile(r'^Accumulative +metrics:\s+TE\s+(?P<te>\d+)\s+IGP\s+'
+                        r'(?P<igp>\d+)\s+Delay\s+(?P<path>\d+)$')
+
+        # Last PCALC Error: Tue Apr 27 16:21:21 2021
+        p6 = re.compile(r'^Last PCALC Error:(?P<last_pcalc_error>.+)$')
+
+        # Info: No path to destination, 109.109.109.109 (reverselink)
+        p7 = re.compile(r'^Info:\s+(?P<info>.*)\, (?P<reverselink>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}).+$')
+
+        # G-PID: 0x0800 (derived from egress interface properties)
+        p8 = re.compile(r'^G-PID:\s+(?P<g_pid>\S+).+$')
+
+        # Bandwidth Requested: 0 kbps  CT0
+        p9 = re.compile(r'^Bandwidth Requested:\s+(?P<bandwidth_requested>\S+)\s+'
+                        r'(?P<bandwidth_requested_unit>\S+).+$')
+
+        # Creation Time: Tue Apr 27 16:21:14 2021 (01:36:30 ago)
+        p10 = re.compile(r'^Creation Time:\s+(?P<creation_time>.+)$')
+
+        # Bandwidth:        0 kbps (CT0) Priority:  3  3 Affinity: 0x0/0xffff
+        p11 = re.compile(r'^Bandwidth:\s+(?P<bandwidth>\d+)\s+(?P<bandwidth_unit>\S+)'
+                         r'.*Priority:\s+(?P<priority>\d+).*Affinity:\s+(?P<affinity>\S+)$')
+
+        # Metric Type: IGP (interface)
+        p12 = re.compile(r'^Metric Type:\s+(?P<metric_type>.+)$')
+
+        # Tiebreaker: Min-fill (default)
+        p13 = re.compile(r'^Tiebreaker:\s+(?P<tiebreaker>.+)$')
+
+        # Hop-limit: disabled
+        p14 = re.compile(r'^Hop-limit:\s+(?P<hop_limit>.+)$')
+
+        # Cost-limit: disabled
+        p15 = re.compile(r'^Cost-limit:\s+(?P<cost_limit>.+)$')
+
+        # Delay-limit: disabled
+        p16 = re.compile(r'^Delay-limit:\s+(?P<delay_limit>.+)$')
+
+        # Delay-measurement: disabled
+        p17 = re.compile(r'^Delay-measurement:\s+(?P<delay_measurement>.+)$')
+
+        # Path-invalidation timeout: 10000 msec (default), Action: Tear (default)
+        p18 = re.compile(r'^Path-invalidation timeout:\s+(?P<timeout>\d+)\s+(?P<timeout_unit>\S+)'
+                         r'.*,\s+Action:\s+(?P<action>\S+).+$')
+
+        # AutoRoute:  enabled  LockDown: disabled   Policy class: not set
+        p19 = re.compile(r'^AutoRoute:\s+(?P<autoroute>\S+)\s+LockDown:\s+(?P<lockdown>.+)\s+'
+                         r'Policy class:\s+(?P<policy_class>.+)$')
+
+        # Forward class: 0 (not enabled)
+        p20 = re.compile(r'^Forward class:\s+(?P<forward_class>\S+)\s+\((?P<forward_class_state>.+)?\)$')
+
+        # Forwarding-Adjacency: disabled
+        p21 = re.compile(r'^Forwarding-Adjacency:\s+(?P<forwarding_adjacency>.+)$')
+
+        # Autoroute Destinations: 0
+        p22 = re.compile(r'^Autoroute Destinations:\s+(?P<autoroute_destinations>.+)$')
+
+        # Loadshare:          0 equal loadshares
+        p23 = re.compile(r'^Loadshare:\s+(?P<loadshare>\d+)\s+(?P<loadshare_state>.+)$')
+
+        # Auto-bw: disabled
+        p24 = re.compile(r'^Auto-bw:\s+(?P<auto_bw>.+)$')
+
+        # Auto-Capacity: Disabled:
+        p25 = re.compile(r'^Auto-Capacity:\s+(?P<auto_capacity>\w+)\:?$')
+
+        # Fast Reroute: Enabled, Protection Desired: Any
+        p26 = re.compile(r'^Fast Reroute:\s+(?P<fast_reroute>\S+), Protection Desired:'
+                         r'\s+(?P<protection_desired>.+)$')
+
+        # Path Protection: Not Enabled
+        p27 = re.compile(r'^Path Protection:\s+(?P<path_protection>.+)$')
+
+        # BFD Fast Detection: Disabled
+        p28 = re.compile(r'^BFD Fast Detection:\s+(?P<bfd_fast_detection>.+)$')
+
+        # Reoptimization after affinity failure: Enabled
+        p29 = re.compile(r'^Reoptimization after affinity failure:\s+(?P<reoptimization>.+)$')
+
+        # Soft Preemption: Disabled
+        p30 = re.compile(r'^Soft Preemption:\s+(?P<soft_preemption>.+)$')
+
+        # Tunnel has been up for: 01:36:23 (since Tue Apr 27 16:21:21 JST 2021)
+        p31 = re.compile(r'^Tunnel has been up for:\s+(?P<tunnel_up_time>.+)$')
+
+        # Uptime: 00:26:32 (since Tue Apr 27 17:31:12 JST 2021)
+        p32 = re.compile(r'^Uptime:\s+(?P<uptime>.+)$')
+
+        # LSP not signalled, identical to the [CURRENT] LSP
+        p33 = re.compile(r'^LSP\s+(?P<lsp>.+),\s+(?P<lsp_status>.+)$')
+
+        # Date/Time: Tue Apr 27 16:26:11 JST 2021 [01:31:33 ago]
+        p34 = re.compile(r'^Date/Time:\s+(?P<date_time>.+)$')
+
+        # ID: 5 Path Option: 20
+        p35 = re.compile(r'^ID:\s+(?P<id>\d+)\s+Path Option:\s+(?P<path_option>\d+)$')
+
+        # Removal Trigger: reoptimization completed
+        p36 = re.compile(r'^Removal Trigger:\s+(?P<removal_trigger>.+)$')
+
+        # Path info (OSPF mpls1 area 0):
+        p37 = re.compile(r'^Path info \((?P<path_info>.+)\):$')
+
+        # Node hop count: 2
+        p38 = re.compile(r'^Node hop count:\s+(?P<node_hop_count>.+)$')
+
+        # Hop0: 20.50.0.1
+        # Hop1: 21.50.0.2
+        # Hop2: 109.109.109.109
+        p39 = re.compile(r'^Hop(?P<hop>\d+):\s+(?P<ip_address>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})$')
+
+        # Displayed 1 (of 9) heads, 0 (of 10) midpoints, 0 (of 6) tails
+        p40 = re.compile(r'^Displayed\s+(?P<heads_displayed>\d+)\s+\(of\s+(?P<total_heads>\d+)\)'
+                         r'\s+heads,\s+(?P<midpoints_displayed>\d+)\s+\(of\s+(?P<total_midpoints>\d+)'
+                         r'\)\s+midpoints,\s+(?P<tails_displayed>\d+)\s+\(of\s+(?P<total_tails>\d+)\)\s+tails$')
+
+        # Displayed 1 up, 0 down, 0 recovering, 0 recovered heads
+        p41 = re.compile(r'^Displayed\s+(?P<up>\d+)\s+up,\s+(?P<down>\d+)\s+down,'
+                         r'\s+(?P<recovering>\d+)\s+recovering,\s+(?P<recovered_heads>\d+).+$')
+
+
+        for line in out.splitlines():
+            line = line.strip()
+
+            # Name: tunnel-te50000  Destination: 109.109.109.109  Ifhandle:0x20e0
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                tunnel_dict = ret_dict.setdefault('tunnel', {}).setdefault(group['tunnel'], {})
+                tunnel_dict.update({
+                    'destination': group['destination'],
+                    'ifhandle': group['ifhandle']
+                })
+                continue
+
+            # Signalled-Name: 50000_F17-ASR9922_F109-ASR9001
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                tunnel_dict.update({'signalled_name': group['signalled_name']})
+                continue
+
+            # Admin:    up Oper:   up   Path:  valid   Signalling: connected
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                status_dict = tunnel_dict.setdefault('status', {})
+                status_dict.update(
+                    {k: v for k, v in group.items() if v is not None}
+                )
+                continue
+
+            # path option 10,  type explicit 50000-EPath_10 (Basis for Setup, path weight 160)
+            m = p4.match(line)
+            if m:
+                group = m.groupdict()
+                path_option = int(group['path_option'])
+                path_option_dict = status_dict.setdefault('path_option', {}).setdefault(path_option, {})
+                path_option_dict.update({
+                      'type': group['type'],
+                     'path_weight': int(group['path_weight'])
+                })
+                continue
+
+            # path option 20,  type explicit 50000-EPath_20
+            # path option 100,  type dynamic
+            m = p4_1.match(line)
+            if m:
+                group = m.groupdict()
+                path_option = int(group['path_option'])
+                path_option_dict = status_dict.setdefault('path_option', {}).setdefault(path_option, {})
+                path_option_dict.update({'type': group['type']})
+                continue
+
+            # Accumulative metrics: TE 160 IGP 160 Delay 600000
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                accumulative_metrics_dict = path_option_dict.setdefault('accumulative_metrics', {})
+                accumulative_metrics_dict.update(
+                    {k: int(v) for k, v in group.items() if v is not None}
+                )
+                continue
+
+            # Last PCALC Error: Tue Apr 27 16:21:21 2021
+            m = p6.match(line)
+            if m:
+                group = m.groupdict()
+                last_pcalc_error_dict = status_dict.setdefault('last_pcalc_error', {})
+                last_pcalc_error_dict.update({'time': group['last_pcalc_error']})
+                continue
+
+            # Info: No path to destination, 109.109.109.109 (reverselink)
+            m = p7.match(line)
+            if m:
+                group = m.groupdict()
+                last_pcalc_error_dict.update({
+                    'info': group['info'],
+                    'reverselink': group['reverselink']
+                })
+                continue
+
+            # G-PID: 0x0800 (derived from egress interface properties)
+            m = p8.match(line)
+            if m:
+                group = m.groupdict()
+                status_dict.update({'g_pid': group['g_pid']})
+                continue
+
+            # Bandwidth Requested: 0 kbps  CT0
+            m = p9.match(line)
+            if m:
+                group = m.groupdict()
+                status_dict.update({'bandwidth_requested': int(group['bandwidth_requested']),
+                                    'bandwidth_requested_unit': group['bandwidth_requested_unit']})
+                continue
+
+            # Creation Time: Tue Apr 27 16:21:14 2021 (01:36:30 ago)
+            m = p10.match(line)
+            if m:
+                group = m.groupdict()
+                status_dict.update({'creation_time': group['creation_time']})
+                continue
+
+            # Bandwidth:        0 kbps (CT0) Priority:  3  3 Affinity: 0x0/0xffff
+            m = p11.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict = tunnel_dict.setdefault('config_parameters', {})
+                config_parameters_dict.update({'bandwidth': int(group['bandwidth']),
+                                               'bandwidth_unit': group['bandwidth_unit'],
+                                               'priority': int(group['priority']),
+                                               'affinity': group['affinity']})
+                continue
+
+            # Metric Type: IGP (interface)
+            m = p12.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update({'metric_type': group['metric_type']})
+                continue
+
+            # Tiebreaker: Min-fill (default)
+            m = p13.match(line)
+            if m:
+                group = m.groupdict()
+                path_selection = config_parameters_dict.setdefault('path_selection', {})
+                path_selection.update({'tiebreaker': group['tiebreaker']})
+                continue
+
+            # Hop-limit: disabled
+            m = p14.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update({'hop_limit': group['hop_limit']})
+                continue
+
+            # Cost-limit: disabled
+            m = p15.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update({'cost_limit': group['cost_limit']})
+                continue
+
+            # Delay-limit: disabled
+            m = p16.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update({'delay_limit': group['delay_limit']})
+                continue
+
+            # Delay-measurement: disabled
+            m = p17.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update({'delay_measurement': group['delay_measurement']})
+                continue
+
+            # Path-invalidation timeout: 10000 msec (default), Action: Tear (default)
+            m = p18.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update({'path_invalidation_timeout': int(group['timeout']),
+                                               'path_invalidation_timeout_unit': group['timeout_unit'],
+                                               'action': group['action']})
+                continue
+
+            # AutoRoute:  enabled  LockDown: disabled   Policy class: not set
+            m = p19.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update(
+                    {k: v for k, v in group.items() if v is not None}
+                )
+                continue
+
+            # Forward class: 0 (not enabled)
+            m = p20.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update({'forward_class': int(group['forward_class']),
+                                               'forward_class_state': group['forward_class_state']})
+                continue
+
+            # Forwarding-Adjacency: disabled
+            m = p21.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update({'forwarding_adjacency': group['forwarding_adjacency']})
+                continue
+
+            # Autoroute Destinations: 0
+            m = p22.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update({'autoroute_destinations': int(group['autoroute_destinations'])})
+                continue
+
+            # Loadshare:          0 equal loadshares
+            m = p23.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update({'loadshare': int(group['loadshare']),
+                                               'loadshare_state': group['loadshare_state']})
+                continue
+
+            # Auto-bw: disabled
+            m = p24.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update({'auto_bw': group['auto_bw']})
+                continue
+
+            # Auto-Capacity: Disabled:
+            m = p25.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update({'auto_capacity': group['auto_capacity']})
+                continue
+
+            # Fast Reroute: Enabled, Protection Desired: Any
+            m = p26.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update({'fast_reroute': group['fast_reroute'],
+                                               'protection_desired': group['protection_desired']})
+                continue
+
+            # Path Protection: Not Enabled
+            m = p27.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update({'path_protection': group['path_protection']})
+                continue
+
+            # BFD Fast Detection: Disabled
+            m = p28.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update({'bfd_fast_detection': group['bfd_fast_detection']})
+                continue
+
+            # Reoptimization after affinity failure: Enabled
+            m = p29.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update({'reoptimization_after_affinity_failure': group['reoptimization']})
+                continue
+
+            # Soft Preemption: Disabled
+            m = p30.match(line)
+            if m:
+                group = m.groupdict()
+                config_parameters_dict.update({'soft_preemption': group['soft_preemption']})
+                continue
+
+            # Tunnel has been up for: 01:36:23 (since Tue Apr 27 16:21:21 JST 2021)
+            m = p31.match(line)
+            if m:
+                group = m.groupdict()
+                history_dict = tunnel_dict.setdefault('history', {})
+                history_dict.update({'tunnel_up_time': group['tunnel_up_time']})
+                continue
+
+            # Uptime: 00:26:32 (since Tue Apr 27 17:31:12 JST 2021)
+            m = p32.match(line)
+            if m:
+                group = m.groupdict()
+                current_lsp_dict = history_dict.setdefault('current_lsp', {})
+                current_lsp_dict.update({'uptime': group['uptime']})
+                continue
+
+            # LSP not signalled, identical to the [CURRENT] LSP
+            m = p33.match(line)
+            if m:
+                group = m.groupdict()
+                reopt_lsp_dict = history_dict.setdefault('reopt_lsp', {}).\
+                    setdefault('lsp_failure', {})
+                reopt_lsp_dict.update({'lsp': group['lsp'],
+                                       'lsp_status': group['lsp_status']})
+                continue
+
+            # Date/Time: Tue Apr 27 16:26:11 JST 2021 [01:31:33 ago]
+            m = p34.match(line)
+            if m:
+                group = m.groupdict()
+                reopt_lsp_dict.update({'date_time': group['date_time']})
+                continue
+
+            # ID: 5 Path Option: 20
+            m = p35.match(line)
+            if m:
+                group = m.groupdict()
+                prior_lsp_dict = history_dict.setdefault('prior_lsp', {})
+                prior_lsp_dict.update({'id': int(group['id']),
+                                       'path_option': int(group['path_option'])})
+                continue
+
+            # Removal Trigger: reoptimization completed
+            m = p36.match(line)
+            if m:
+                group = m.groupdict()
+                prior_lsp_dict.update({'removal_trigger': group['removal_trigger']})
+                continue
+
+            # Path info (OSPF mpls1 area 0):
+            m = p37.match(line)
+            if m:
+                group = m.groupdict()
+                path_info_temp_dict = tunnel_dict.setdefault('path_info', {}).\
+                    setdefault(group['path_info'], {})
+                continue
+
+            # Node hop count: 2
+            m = p38.match(line)
+            if m:
+                group = m.groupdict()
+                path_info_temp_dict.update({'node_hop_count': int(group['node_hop_count'])})
+                continue
+
+            # Hop0: 20.50.0.1
+            # Hop1: 21.50.0.2
+            # Hop2: 109.109.109.109
+            m = p39.match(line)
+            if m:
+                group = m.groupdict()
+                hop_dict = path_info_temp_dict.setdefault('hop', {}). \
+                    setdefault(int(group['hop']), {})
+                hop_dict.update({'ip_address': group['ip_address']})
+                continue
+
+            # Displayed 1 (of 9) heads, 0 (of 10) midpoints, 0 (of 6) tails
+            m = p40.match(line)
+            if m:
+                group = m.groupdict()
+                displayed_dict = tunnel_dict.setdefault('displayed', {})
+                displayed_dict.update(
+                    {k: int(v) for k, v in group.items() if v is not None}
+                )
+                continue
+
+            # Displayed 1 up, 0 down, 0 recovering, 0 recovered heads
+            m = p41.match(line)
+            if m:
+                group = m.groupdict()
+                displayed_status_dict = displayed_dict.setdefault('status', {})
+                displayed_status_dict.update(
+                    {k: int(v) for k, v in group.items() if v is not None}
+                )
+                continue
+
+        return ret_dict
+
+
+# ======================================================
+# Schema for 'show mpls ldp interface brief'
+# ======================================================
+class ShowMplsLdpInterfaceBriefSchema(MetaParser):
+    """Schema for
+    show mpls ldp interface brief
+    """
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'interface_name': {
+                    Any(): {
+                        'config': str,
+                        'enabled': str,
+                        'igp_auto_cfg': int,
+                        'te_mesh_grp_cfg': str
+                    }
+                }
+            }
+        }
+    }
+
+class ShowMplsLdpInterfaceBrief(ShowMplsLdpInterfaceBriefSchema):
+    """
+        Parser for show mpls ldp interface brief
+    """
+    cli_command = ['show mpls ldp interface brief']
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command[0])
+        else:
+            output = output
+
+        # initial return dictionary
+        result_dict = {}
+
+        # BE10            default             Y      Y       1            N/A
+        # Gi0/0/0/1       default             Y      Y       1            N/A
+        # Gi0/0/0/2       vrf_1             Y      Y       1            N/A
+        # Gi0/0/0/2.200   -                   N      N       0            N/A
+        p1 = re.compile(r'^(?P<interface_name>\S+)\s+(?P<vrf_name>[_\w-]+)\s+(?P<config>[Y|N])\s+(?P<enabled>[Y|N])\s+(?P<igp_auto_cfg>\d+)\s+(?P<te_mesh_grp_cfg>[N\/A]+)$')
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            # BE10            default             Y      Y       1            N/A
+            # Gi0/0/0/1       default             Y      Y       1            N/A
+            # Gi0/0/0/2       vrf_1             Y      Y       1            N/A
+            # Gi0/0/0/2.200   -                   N      N       0            N/A
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                intf = Common.convert_intf_name(group['interface_name'])
+                vrf_dict = result_dict.setdefault('vrf', {}). \
+                    setdefault(group['vrf_name'], {})
+                int_dict = vrf_dict.setdefault('interface_name', {}). \
+                    setdefault(intf, {})
+                int_dict['config'] = group['config']
+                int_dict['enabled'] = group['enabled']
+                int_dict['igp_auto_cfg'] = int(group['igp_auto_cfg'])
+                int_dict['te_mesh_grp_cfg'] = group['te_mesh_grp_cfg']
+                continue
+
+        return result_dict
+
+# =========================================================
+# Parser for
+#   * 'show mpls forwarding prefix ipv4 unicast {prefix}'
+# =========================================================
+class ShowMplsForwardingPrefixIPV4Unicast(ShowMplsForwardingSchema, ShowMplsForwardingVrf):
+    """parser details for:
+    * show mpls forwarding prefix ipv4 unicast <prefix>
+    """
+    cli_command = ['show mpls forwarding prefix ipv4 unicast {prefix}']
+
+    def cli(self, prefix="", output=None):
+
+        if output is None:
+            output = self.device.execute(self.cli_command[0].format(prefix=prefix))
+        vrf = 'default'
+        ret_dict = super().cli(vrf=vrf, output=output).get(
+                    'vrf', {}).get('default', {})
+
+        return ret_dict
\ No newline at end of file
@@ -299,8 +299,9 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
                 continue
 
             # Propagation delay : 500
+            # Propagation delay : 500   (config: 500)
             p9 = re.compile(r'^Propagation +delay *:'
-                             ' +(?P<propagation_delay>[0-9]+)$')
+                             ' +(?P<propagation_delay>[0-9]+)')
             m = p9.match(line)
             if m:
                 sub_dict['propagation_delay'] = \
@@ -308,8 +309,9 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
                 continue
 
             # Override Interval : 2500
+            # Override Interval : 2500   (config: 2500)
             p10 = re.compile(r'^Override +Interval *:'
-                              ' +(?P<override_interval>[0-9]+)$')
+                              ' +(?P<override_interval>[0-9]+)')
             m = p10.match(line)
             if m:
                 sub_dict['override_interval'] = \
@@ -13,8 +13,12 @@ IOSXR parsers for the following show commands:
     * 'show redundancy summary'
     * 'show redundancy'
     * 'dir'
+    * 'dir {directory}'
+    * 'dir location {location}'
+    * 'dir {directory} location {location}'
     * 'show processes memory detail'
     * 'show processes memory detail | include <WORD>'
+    * 'show filesystem location all'
 '''
 
 # Python
@@ -53,6 +57,9 @@ class ShowVersionSchema(MetaParser):
               Optional('config_register'): str,
               Optional('rp_config_register'): str,
               Optional('main_mem'): str,
+              Optional('built_by'): str,
+              Optional('built_on'): str,
+              Optional('built_host'): str,
              }
 
 class ShowVersion(ShowVersionSchema):
@@ -103,6 +110,15 @@ class ShowVersion(ShowVersionSchema):
         # ASR 9006 4 Line Card Slot Chassis with V2 AC PEM
         p7 = re.compile(r'\s*.*Chassis.*$')
 
+        # Built By     : xyz
+        p8 = re.compile(r'^Built\s+By\s*:\s+(?P<built_by>\S+)$')
+
+        # Built On     : Fri Dec 13 16:42:11 PST 2019
+        p9 = re.compile(r'^Built\s+On\s*:\s+(?P<built_on>[a-zA-Z0-9\:\/\.\-\s]+)$')
+
+        # Built Host   : iox-abc-123
+        p10 = re.compile(r'^Built\s+Host\s*:\s*(?P<built_host>\S+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
@@ -155,6 +171,21 @@ class ShowVersion(ShowVersionSchema):
                 show_version_dict['chassis_detail'] = str(line.strip())
                 continue
 
+            m = p8.match(line)
+            if m:
+                show_version_dict['built_by'] = m.groupdict()['built_by']
+                continue
+
+            m = p9.match(line)
+            if m:
+                show_version_dict['built_on'] = m.groupdict()['built_on']
+                continue
+
+            m = p10.match(line)
+            if m:
+                show_version_dict['built_host'] = m.groupdict()['built_host']
+                continue
+
         return show_version_dict
 
 # ============================
@@ -339,6 +370,23 @@ class ShowPlatform(ShowPlatformSchema):
         else:
             out = output
 
+
+        # 0/RSP0/CPU0     A9K-RSP440-TR(Active)     IOS XR RUN       PWR,NSHUT,MON
+        # 0/0/CPU0        RP(Active)      N/A             IOS XR RUN      PWR,NSHUT,MON
+        # 0/0/CPU0        RP(Active)      N/A             OPERATIONAL      PWR,NSHUT,MON
+        # 0/0               NCS1K4-OTN-XP              POWERED_ON        NSHUT
+        # 0/1               NCS1K4-1.2T-K9             OPERATIONAL       NSHUT
+        # 0/0               NCS1K4-OTN-XP              POWERED_ON        NSHUT
+        # 1/3/3         MSC(SPA)          OC192RPR-XFP       DISABLED        NPWR,SHUT,MON
+        # 1/10/CPU0     FP-X              N/A                UNPOWERED       NPWR,NSHUT,MON
+        
+        p1 = re.compile(r'^\s*(?P<node>[a-zA-Z0-9\/]+)'
+                            '\s+(?P<name>[a-zA-Z0-9\-\.]+)'
+                            '(?:\((?P<redundancy_state>[a-zA-Z]+)\))?'
+                            '(?: +(?P<plim>[a-zA-Z0-9(\/|\-| )]+))?'
+                            '\s+(?P<state>(UNPOWERED|DISABLED|IOS XR RUN|OK|OPERATIONAL|POWERED_ON))'
+                            '\s+(?P<config_state>[a-zA-Z\,]+)$')            
+
         # Init vars
         show_platform = {}
         daughtercard_dict = {}
@@ -347,18 +395,7 @@ class ShowPlatform(ShowPlatformSchema):
             entry_is_daughter = False
             line = line.rstrip()
 
-            # 0/RSP0/CPU0     A9K-RSP440-TR(Active)     IOS XR RUN       PWR,NSHUT,MON
-            # 0/0/CPU0        RP(Active)      N/A             IOS XR RUN      PWR,NSHUT,MON
-            # 0/0/CPU0        RP(Active)      N/A             OPERATIONAL      PWR,NSHUT,MON
-            # 0/0               NCS1K4-OTN-XP              POWERED_ON        NSHUT
-            # 0/1               NCS1K4-1.2T-K9             OPERATIONAL       NSHUT
-            # 0/0               NCS1K4-OTN-XP              POWERED_ON        NSHUT
-            p1 = re.compile(r'^\s*(?P<node>[a-zA-Z0-9\/]+)'
-                             '\s+(?P<name>[a-zA-Z0-9\-\.]+)'
-                             '(?:\((?P<redundancy_state>[a-zA-Z]+)\))?'
-                             '(?: +(?P<plim>[a-zA-Z0-9(\/|\-| )]+))?'
-                             '\s+(?P<state>(IOS XR RUN|OK|OPERATIONAL|POWERED_ON))'
-                             '\s+(?P<config_state>[a-zA-Z\,]+)$')
+
             m = p1.match(line)
             if m:
                 # Parse regexp
@@ -370,14 +407,17 @@ class ShowPlatform(ShowPlatformSchema):
                 config_state = str(m.groupdict()['config_state']).strip()
 
                 # Parse node for rack, slot, subslot details
-                parse_node = re.compile(r'\s*(?P<rack>[0-9]+)\/(?P<slot>[0-9A-Z]+)(?:\/(?P<last_entry>[0-9A-Z]+))?$').match(node)
+                parse_node = re.compile(r'\s*(?P<rack>[A-Z0-9]+)\/(?P<slot>[0-9A-Z]+)(?:\/(?P<last_entry>[0-9A-Z]+))?$').match(node)
                 rack = str(parse_node.groupdict()['rack'])
                 slot = rack + '/' + str(parse_node.groupdict()['slot'])
                 last_entry = str(parse_node.groupdict()['last_entry'])
 
                 # Check if subslot/daughtercard
+                # 0/3/0 
+                # 1/3/0  
                 parse_subslot = re.compile(r'.*(0\/[0-9]\/[0-9]+).*').match(node)
-                if parse_subslot and last_entry.isdigit():
+                parse_subslot2 = re.compile(r'.*(1\/[0-9]\/[0-9]+).*').match(node)
+                if (parse_subslot or parse_subslot2) and last_entry.isdigit():
                     # This entry is a daughtercard/subslot
                     entry_is_daughter = True
                     subslot = last_entry
@@ -1323,6 +1363,16 @@ class ShowRedundancy(ShowRedundancySchema):
                 if 'standby' in str(m.groupdict()['role']).lower():
                     redundancy_dict['node'][node]['standby_node'] = str(m.groupdict()['node'])
                 continue
+            
+            # Partner node (0/RP1/CPU0) is in STANDBY role (eXR)
+            p3_2 =  re.compile(r'\s*Partner *node'
+                                ' *\((?P<node>[a-zA-Z0-9\/]+)\) *is *in'
+                                ' *(?P<role>[a-zA-Z]+) *role$')
+            m = p3_2.match(line)
+            if m:
+                if 'standby' in str(m.groupdict()['role']).lower():
+                    redundancy_dict['node'][node]['standby_node'] = str(m.groupdict()['node'])
+                continue
 
             # Process Redundancy Partner (0/RSP0/CPU0) is in BACKUP role
             p3_3 =  re.compile(r'\s*Process *Redundancy *Partner'
@@ -1501,12 +1551,19 @@ class ShowRedundancy(ShowRedundancySchema):
 # Schema for 'dir'
 # ================
 class DirSchema(MetaParser):
-    """Schema for dir"""
+    """Schema for 
+        * dir
+        * dir {directory}
+        * dir location {location}
+        * dir {directory} location {location}
+    """
+
     schema = {
         'dir': {
             'dir_name': str,
             'total_bytes': str,
             'total_free_bytes': str,
+            Optional('location'): str,
             Optional('files'):
                 {Any():
                     {Optional('size'): str,
@@ -1520,14 +1577,31 @@ class DirSchema(MetaParser):
         }
 
 class Dir(DirSchema):
-    """Parser for dir"""
-    cli_command = ['dir', 'dir {directory}']
+    """Parser for
+        * dir
+        * dir {directory}
+        * dir location {location}
+        * dir {directory} location {location}
+    """
+
+    cli_command = [
+        'dir', 'dir {directory}', 'dir location {location}',
+        'dir {directory} location {location}'
+    ]
+
     exclude = ['size', 'time', 'total_free_bytes', 'date', 'index']
 
-    def cli(self, directory='', output=None):
+    def cli(self, directory='', location='', output=None):
         if output is None:
-            if directory:
-                out = self.device.execute(self.cli_command[1].format(directory=directory))
+            if directory and location:
+                out = self.device.execute(self.cli_command[3].format(
+                    directory=directory, location=location))
+            elif location:
+                out = self.device.execute(
+                    self.cli_command[2].format(location=location))
+            elif directory:
+                out = self.device.execute(
+                    self.cli_command[1].format(directory=directory))
             else:
                 out = self.device.execute(self.cli_command[0])
         else:
@@ -1541,13 +1615,15 @@ class Dir(DirSchema):
 
             # Directory of /misc/scratch
             # Directory of disk0a:/usr
-            p1 = re.compile(r'\s*Directory +of'
-                             ' +(?P<dir_name>[a-zA-Z0-9\:\/]+)$')
+            # Directory of net/node0_RSP1_CPU0/harddisk:/dumper
+            p1 = re.compile(r'\s*Directory\s+of\s+(?P<dir_name>\S+)$')
             m = p1.match(line)
             if m:
                 if 'dir' not in dir_dict:
                     dir_dict['dir'] = {}
                     dir_dict['dir']['dir_name'] = str(m.groupdict()['dir_name'])
+                    if location:
+                        dir_dict['dir']['location'] = location
                 continue
 
             # 1012660 kbytes total (939092 kbytes free)
@@ -1600,8 +1676,6 @@ class Dir(DirSchema):
 
         return dir_dict
 
-# vim: ft=python et sw=4
-
 
 class ShowProcessesMemorySchema(MetaParser):
     """Schema for show processes memory
@@ -1756,3 +1830,72 @@ class ShowProcessesMemoryDetail(ShowProcessesMemoryDetailSchema):
                 })
 
         return ret_dict
+
+# ==============================================
+# Parser for 'show filesystem location all'
+# ==============================================
+
+class ShowFilesystemLocationAllSchema(MetaParser):
+    """Schema for show filesystem location all"""
+
+    schema = {
+        'node': {
+            Any(): {
+                'file_systems': {
+                    Any(): {
+                    'total_size': int,
+                    'free_size': int,
+                    'type': str,
+                    'flags': str,
+                    'prefixes': str,
+                    }
+                }
+            }
+        }
+    }
+
+class ShowFilesystemLocationAll(ShowFilesystemLocationAllSchema):
+
+    cli_command = ['show filesystem location all']
+
+    def cli(self, output=None):
+
+        if output is None:
+            output = self.device.execute(self.cli_command[0])
+
+        # node:  node0_RP0_CPU0
+        p1 = re.compile(r'^node:\s+(?P<node>\S+)$')
+
+        # 3962216448   3926405120  flash-disk     rw  apphost:
+        p2 = re.compile(r'^(?P<total_size>\d+)\s*(?P<free_size>\d+)\s*(?P<type>\S*)\s*(?P<flags>\S*)\s*(?P<prefixes>[\S\s]+)$')
+
+        # initial return dictionary
+        ret_dict = {}
+
+        for line in output.splitlines():
+            line = line.strip()
+
+            # node:  node0_RP0_CPU0
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                node_dict = ret_dict.setdefault('node', {}).setdefault(group['node'], {})
+                index = 0
+                continue
+
+            # 3962216448   3926405120  flash-disk     rw  apphost:
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                index += 1
+                file_systems_dict = node_dict.setdefault('file_systems', {}).setdefault(index, {})
+                file_systems_dict.update({
+                    'total_size': int(group['total_size']),
+                    'free_size': int(group['free_size']),
+                    'type': group['type'],
+                    'flags': group['flags'],
+                    'prefixes': group['prefixes'],
+                    })
+                continue
+
+        return ret_dict
@@ -1,4 +1,4 @@
-"""ping.py
+"""monitor.py
 
 JunOS parsers for the following show commands:
     * monitor interface traffic
@@ -44,13 +44,21 @@ class MonitorInterfaceTraffic(MonitorInterfaceTrafficSchema):
     def cli(self, output=None, timeout=10):
         if not output:
             self.device.sendline(self.cli_command[0])
-            out = self.device.expect(
-                [r'{}[\S\s]+Time:\s+\S+'.format(self.device._hostname)],
-                timeout=timeout).match_output
+            try:
+                out = self.device.expect(
+                    [r'{}[\S\s]+Time:\s+\S+'.format(self.device._hostname)],
+                    timeout=timeout).match_output
+                skip_timeout=False
+            except AttributeError:
+                out = self.device.expect(
+                    [r'{}[\S\s]+Time:\s+\S+'.format(self.device._hostname)],
+                    timeout=timeout)
+                skip_timeout=True
             ansi_escape = re.compile(r'(\x00|\x9B|\x1B\[[0-?]*[ -\/]*[@-~])')
             out = ansi_escape.sub('\t', out)
             self.device.sendline('q')
-            time.sleep(5)
+            if not skip_timeout:
+                time.sleep(5)
             self.device.expect('.*')
         else:
             out = output
@@ -106,4 +114,4 @@ class MonitorInterfaceTraffic(MonitorInterfaceTrafficSchema):
                     setdefault(monitor_time, monitor_time_sub_dict)
                 continue
 
-        return ret_dict
\ No newline at end of file
+        return ret_dict
@@ -2,7 +2,7 @@
 
 JunOS parsers for the following show commands:
     * ping {addr}
-    * ping {addr} count {count} 
+    * ping {addr} count {count}
     * ping mpls rsvp {rsvp}
     * ping {addr} ttl {ttl} count {count} wait {wait}
     * ping {addr} source {source} count {count}
@@ -14,8 +14,9 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
-from genie.metaparser.util.schemaengine import (Any, 
-        Optional, Use, SchemaTypeError, Schema)
+from genie.metaparser.util.schemaengine import (Any,
+        Optional, Use, SchemaTypeError, Schema, ListOf)
+
 
 class PingSchema(MetaParser):
     """
@@ -48,12 +49,14 @@ class PingSchema(MetaParser):
             }
         }
     """
-    def validate_ping_result_list(value):
-        # Pass ping result list of dict in value
-        if not isinstance(value, list):
-            raise SchemaTypeError('ping result is not a list')
-        # Create Arp Entry Schema
-        ping_result_schema = Schema({
+
+    # Main Schema
+    schema = {
+        'ping': {
+            Optional('address'): str,
+            Optional('source'): str,
+            Optional('data-bytes'): int,
+            Optional('result'): ListOf({
                     'bytes': int,
                     'from': str,
                     Optional('icmp-seq'): int,
@@ -62,19 +65,7 @@ class PingSchema(MetaParser):
                     Optional('time'): str,
                     Optional('message'): str,
                     Optional('mtu'): int,
-                })
-        # Validate each dictionary in list
-        for item in value:
-            ping_result_schema.validate(item)
-        return value
-    
-    # Main Schema
-    schema = {
-        'ping': {
-            Optional('address'): str,
-            Optional('source'): str,
-            Optional('data-bytes'): int,
-            Optional('result'): Use(validate_ping_result_list),
+                }),
             'statistics': {
                 'send': int,
                 'received': int,
@@ -101,8 +92,8 @@ class Ping(PingSchema):
         'ping {addr} size {size} count {count} do-not-fragment'
     ]
 
-    def cli(self, addr, count=None, ttl=None, 
-            wait=None, source=None, size=None, 
+    def cli(self, addr, count=None, ttl=None,
+            wait=None, source=None, size=None,
             tos=None, output=None):
 
         if not output:
@@ -115,10 +106,10 @@ class Ping(PingSchema):
                         wait=wait)
                 elif source and size and tos:
                     cmd = self.cli_command[5].format(
-                        addr=addr, 
-                        source=source, 
-                        size=size, 
-                        count=count, 
+                        addr=addr,
+                        source=source,
+                        size=size,
+                        count=count,
                         tos=tos)
                 elif source and size:
                     cmd = self.cli_command[4].format(
@@ -126,33 +117,33 @@ class Ping(PingSchema):
                         source=source,
                         size=size,
                         count=count,
-                    )   
+                    )
                 elif source:
                     cmd = self.cli_command[3].format(
-                        addr=addr, 
+                        addr=addr,
                         source=source,
-                        count=count) 
+                        count=count)
                 elif size:
                     cmd = self.cli_command[6].format(
-                        addr=addr, 
+                        addr=addr,
                         size=size,
-                        count=count)                                   
+                        count=count)
                 else:
                     cmd = self.cli_command[1].format(
-                        addr=addr, 
+                        addr=addr,
                         count=count)
             else:
                 cmd = self.cli_command[0].format(addr=addr)
             out = self.device.execute(cmd)
         else:
             out = output
-        
+
         ret_dict = {}
 
         # PING 10.189.5.94 (10.189.5.94): 56 data bytes
         p1 = re.compile(r'^PING +(?P<address>\S+) +\((?P<source>\S+)\): +'
                 r'(?P<data_bytes>\d+) +data +bytes$')
-        
+
         # PING6(56=40+8+8 bytes) 2001:db8:223c:2c16::1 --> 2001:db8:223c:2c16::2
         p1_1 = re.compile(r'^PING6\((?P<data_bytes>\d+)=\S+ +bytes\) +'
                 r'(?P<source>\S+) --> +(?P<address>\S+)$')
@@ -162,7 +153,7 @@ class Ping(PingSchema):
                 r'(:|,)\s+icmp_seq=(?P<icmp_seq>\d+)\s+'
                 r'(ttl=(?P<ttl>\d+)|hlim=(?P<hlim>\d+)) +'
                 r'time=(?P<time>\S+) +ms$')
-        
+
         # 36 bytes from 10.136.0.1: frag needed and DF set (MTU 1186)
         # 1240 bytes from 2001:34::1: Packet too big mtu = 1386
         p2_2 = re.compile(r'^(?P<bytes>\d+)\s+bytes\s+from\s+(?P<from>\S+)'
@@ -173,13 +164,13 @@ class Ping(PingSchema):
         p3 = re.compile(r'^(?P<send>\d+) +packets +transmitted, +'
                 r'(?P<received>\d+) +packets +received, +'
                 r'(?P<loss_rate>\d+)\% +packet +loss$')
-        
+
         # round-trip min/avg/max/stddev = 1.823/2.175/2.399/0.191 ms
         # round-trip min/avg/max/std-dev = 0.677/98.186/973.514/291.776 ms
         p4 = re.compile(r'^round-trip +min\/avg\/max\/std(\-)?'
                 r'dev +\= +(?P<min>[\d\.]+)\/(?P<avg>[\d\.]+)\/'
                 r'(?P<max>[\d\.]+)\/(?P<stddev>[\d\.]+) +ms$')
-        
+
         for line in out.splitlines():
             line = line.strip()
 
@@ -188,7 +179,7 @@ class Ping(PingSchema):
             if m:
                 group = m.groupdict()
                 ping_dict = ret_dict.setdefault('ping', {})
-                ping_dict.update({k.replace('_', '-'): (int(v) 
+                ping_dict.update({k.replace('_', '-'): (int(v)
                     if v.isdigit() else v) for k, v in group.items() if v is not None})
                 continue
 
@@ -196,10 +187,10 @@ class Ping(PingSchema):
             if m:
                 group = m.groupdict()
                 ping_dict = ret_dict.setdefault('ping', {})
-                ping_dict.update({k.replace('_', '-'): (int(v) 
+                ping_dict.update({k.replace('_', '-'): (int(v)
                     if v.isdigit() else v) for k, v in group.items() if v is not None})
                 continue
-            
+
             # 64 bytes from 10.189.5.94: icmp_seq=0 ttl=62 time=2.261 ms
 
             # 36 bytes from 10.136.0.1: frag needed and DF set (MTU 1186)
@@ -209,11 +200,11 @@ class Ping(PingSchema):
                 group = m.groupdict()
                 result_list = ping_dict.setdefault('result', [])
                 result_dict = {}
-                result_dict.update({k.replace('_', '-'): (int(v) 
+                result_dict.update({k.replace('_', '-'): (int(v)
                     if v.isdigit() else v) for k, v in group.items() if v is not None})
                 result_list.append(result_dict)
                 continue
-         
+
             # 5 packets transmitted, 5 packets received, 0% packet loss
             m = p3.match(line)
             if m:
@@ -223,7 +214,7 @@ class Ping(PingSchema):
                 ping_statistics_dict.update({k.replace('_', '-'): (
                     int(v) if v.isdigit() else v) for k, v in group.items() if v is not None})
                 continue
-            
+
             # round-trip min/avg/max/stddev = 1.823/2.175/2.399/0.191 ms
             m = p4.match(line)
             if m:
@@ -248,13 +239,13 @@ class PingMplsRsvp(PingMplsRsvpSchema):
     cli_command = 'ping mpls rsvp {rsvp}'
 
     def cli(self, rsvp, output=None):
-        
+
         if not output:
             cmd = self.cli_command.format(rsvp=rsvp)
             out = self.device.execute(cmd)
         else:
             out = output
-        
+
         ret_dict = {}
 
         # 5 packets transmitted, 5 packets received, 0% packet loss
@@ -273,5 +264,5 @@ class PingMplsRsvp(PingMplsRsvpSchema):
                 ping_statistics_dict.update({k.replace('_', '-'): (
                     int(v) if v.isdigit() else v) for k, v in group.items() if v is not None})
                 continue
-        
+
         return ret_dict
\ No newline at end of file
@@ -10,8 +10,9 @@ import re
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
-from genie.metaparser.util.schemaengine import (Any, 
-        Optional, Use, Schema)
+from genie.metaparser.util.schemaengine import (Any,
+        Optional, Use, Schema, ListOf)
+
 
 class ShowArpSchema(MetaParser):
     """ Schema for:
@@ -33,28 +34,17 @@ class ShowArpSchema(MetaParser):
         }
     }"""
 
-    def validate_arp_table_entry_list(value):
-        # Pass arp-entry list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('arp-table-entry is not a list')
-        # Create Arp Entry Schema
-        entry_schema = Schema({
-            "arp-table-entry-flags": str,
-            "hostname": str,
-            "interface-name": str,
-            "ip-address": str,
-            "mac-address": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
-    
     # Main Schema
     schema = {
         "arp-table-information": {
             "arp-entry-count": str,
-            "arp-table-entry": Use(validate_arp_table_entry_list)
+            "arp-table-entry": ListOf({
+                "arp-table-entry-flags": str,
+                "hostname": str,
+                "interface-name": str,
+                "ip-address": str,
+                "mac-address": str
+            })
         }
     }
 
@@ -63,7 +53,7 @@ class ShowArp(ShowArpSchema):
             * show arp
     """
     cli_command = 'show arp'
-    
+
     def cli(self, output=None):
 
         if not output:
@@ -76,13 +66,13 @@ class ShowArp(ShowArpSchema):
         # 00:50:56:ff:ba:6f 10.1.0.1         10.1.0.1                   fxp0.0                  none
         p1 = re.compile(r'^(?P<mac_address>[\w:]+) +(?P<ip_address>\S+) +(?P<hostname>\S+) +'
                 r'(?P<interface_name>\S+) +(?P<arp_table_entry_flags>\S+)$')
-        
+
         # Total entries: 7
         p2 = re.compile(r'^Total +entries: +(?P<total_entries>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
-            
+
             # 00:50:56:ff:ba:6f 10.1.0.1         10.1.0.1                   fxp0.0                  none
             m = p1.match(line)
             if m:
@@ -94,7 +84,7 @@ class ShowArp(ShowArpSchema):
                     v for k, v in group.items() if v is not None})
                 arp_table_entry_list.append(arp_table_entry_dict)
                 continue
-        
+
             m = p2.match(line)
             if m:
                 group = m.groupdict()
@@ -115,7 +105,7 @@ class ShowArpNoMore(ShowArp):
             out = self.device.execute(self.cli_command)
         else:
             out = output
-        
+
         return super().cli(output=out)
 
 
@@ -140,27 +130,16 @@ class ShowArpNoResolveSchema(MetaParser):
         }
     }"""
 
-    def validate_arp_table_entry_list(value):
-        # Pass arp-entry list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('arp-table-entry is not a list')
-        # Create Arp Entry Schema
-        entry_schema = Schema({
-            "arp-table-entry-flags": str,
-            "interface-name": str,
-            "ip-address": str,
-            "mac-address": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
-    
     # Main Schema
     schema = {
         "arp-table-information": {
             "arp-entry-count": str,
-            "arp-table-entry": Use(validate_arp_table_entry_list)
+            "arp-table-entry": ListOf({
+                "arp-table-entry-flags": str,
+                "interface-name": str,
+                "ip-address": str,
+                "mac-address": str
+            })
         }
     }
 
@@ -169,7 +148,7 @@ class ShowArpNoResolve(ShowArpNoResolveSchema):
             * show arp no-resolve
     """
     cli_command = 'show arp no-resolve'
-    
+
     def cli(self, output=None):
 
         if not output:
@@ -183,25 +162,25 @@ class ShowArpNoResolve(ShowArpNoResolveSchema):
         p1 = re.compile(r'^(?P<mac_address>[\w:]+) +'
                         r'(?P<ip_address>\S+) +(?P<interface_name>\S+) '
                         r'+(?P<arp_table_entry_flags>\S+)$')
-        
+
         # Total entries: 7
         p2 = re.compile(r'^Total +entries: +(?P<total_entries>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
-            
+
             #00:50:56:ff:ba:6f 10.1.0.1         fxp0.0                   none
             m = p1.match(line)
             if m:
                 group = m.groupdict()
-                arp_table_dict = ret_dict.setdefault('arp-table-information', {})                
+                arp_table_dict = ret_dict.setdefault('arp-table-information', {})
                 arp_table_entry_list =  arp_table_dict.setdefault('arp-table-entry', [])
                 arp_table_entry_dict = {}
                 arp_table_entry_dict.update({k.replace('_', '-'):
                     v for k, v in group.items() if v is not None})
                 arp_table_entry_list.append(arp_table_entry_dict)
                 continue
-        
+
             m = p2.match(line)
             if m:
                 group = m.groupdict()
@@ -0,0 +1,5 @@
+from genie.libs.parser.apic.ls import Ls
+
+class Ls(Ls):
+    pass
+
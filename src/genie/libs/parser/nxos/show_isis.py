@@ -524,20 +524,20 @@ class ShowIsisInterfaceSchema(MetaParser):
                             Any(): {
                                 'name': str,
                                 'status': str,
-                                'ipv4': str,
-                                'ipv4_subnet': str,
-                                'ipv6': {
+                                Optional('ipv4'): str,
+                                Optional('ipv4_subnet'): str,
+                                Optional('ipv6'): {
                                     Any(): {
                                         'state': str,
                                     }
                                 },
-                                'ipv6_subnet': str,
-                                'ipv6_link_local_address': str,
-                                'authentication': {
+                                Optional('ipv6_subnet'): str,
+                                Optional('ipv6_link_local_address'): str,
+                                Optional('authentication'): {
                                     Any(): { # level_1 level_2
                                         Optional('authentication_type'): {
                                         },
-                                        'auth_check': str,
+                                        Optional('auth_check'): str,
                                     },
                                 },
                                 'index': str,
@@ -1111,7 +1111,8 @@ class ShowIsisAdjacency(ShowIsisAdjacencySchema):
         # System ID       SNPA            Level  State  Hold Time  Interface
         # R2_xr           fa16.3eff.4abd  1      UP     00:00:09   Ethernet1/1.115
         # 2222.22ff.4444  fa16.3eff.4abd  1      INIT   00:00:32   Ethernet1/1.415
-        p2 = re.compile(r'^(?P<sysid>\S+) +(?P<snpa>[\w\.]+) +(?P<level>\d+) '
+        # plum-fx-1       N/A             1-2    UP     00:00:30   Vlan100
+        p2 = re.compile(r'^(?P<sysid>\S+) +(?P<snpa>[/\w\.]+) +(?P<level>[\d-]+) '
                         r'+(?P<state>\S+) +(?P<hold_time>[\d\:]+) +(?P<interface>\S+)$')
 
         for line in out.splitlines():
@@ -1136,7 +1137,7 @@ class ShowIsisAdjacency(ShowIsisAdjacencySchema):
                 group = m.groupdict()
                 sysid = group['sysid']
                 snpa = group['snpa']
-                level = int(group['level'])
+                level = group['level']
                 state = group['state']
                 hold_time = group['hold_time']
                 interface = Common.convert_intf_name(group['interface'])
@@ -4,6 +4,8 @@ NXOS parsers for the following show commands:
 
     * show ip mroute vrf all
     * Show ipv6 mroute vrf all
+    * Show ipv6 mroute summary vrf all
+    * Show ip mroute summary vrf all
     * Show ip static-route multicast
     * Show ipv6 static-route multicast
 
@@ -11,7 +13,6 @@ NXOS parsers for the following show commands:
 
 # Python
 import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
@@ -86,7 +87,7 @@ class ShowIpMrouteVrfAll(ShowIpMrouteVrfAllSchema):
             # IP Multicast Routing Table for VRF "default" 
             p1 = re.compile(r'^\s*(?P<address_family>[\w\W]+) [mM]ulticast'
                              ' +[rR]outing +[tT]able +for +VRF '
-                            '+(?P<vrf>[a-zA-Z0-9\"]+)$')
+                            '+(?P<vrf>\S+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -239,13 +240,14 @@ class ShowIpv6MrouteVrfAllSchema(MetaParser):
                                              Optional('incoming_interface_list'):
                                                 {Any(): 
                                                     {Optional('rpf_nbr'): str,
+                                                     Optional('internal'): bool
                                                     },
                                                 },
                                              Optional('outgoing_interface_list'): 
                                                 {Any(): 
                                                     {Optional('oil_uptime'): str,
                                                      Optional('oil_flags'): str,
-                                                     Optional('oif_rpf'): bool          
+                                                     Optional('oif_rpf'): str
                                                     },
                                                 },
                                             },
@@ -276,14 +278,40 @@ class ShowIpv6MrouteVrfAll(ShowIpv6MrouteVrfAllSchema):
             out = output
 
         ipv6_mroute_vrf_all_dict = {}
+        # IPv6 Multicast Routing Table for VRF "default
+        # IPv6 Multicast Routing Table for VRF " vxlan-1001"
+        p1 = re.compile(r'^\s*(?P<address_family>[\w\W]+) [mM]ulticast'
+                            r' +[rR]outing +[tT]able +for +VRF'
+                            r' +(?P<vrf>\S+)$')
+        # (*, ff30::/12), uptime: 3d11h, pim6 ipv6
+        # (*, ff03:3::/64), bidir, uptime: 10w5d, pim6 
+        p2 = re.compile(r'^\s*\((?P<source_address>(\S+)),'
+                            r' +(?P<multicast_group>(\S+))\),'
+                            r' *(?P<bidir>(\S+),)? *uptime:'
+                            r' +(?P<uptime>[0-9a-zA-Z\:\.]+)(,)?(?:'
+                            r' *(?P<flag>[a-zA-Z0-9\s]+))?$')
+        # Incoming interface: Null, RPF nbr: 0::
+        # Incoming interface: Vlan71, RPF nbr: 2001:1:1:4d::1, internal
+        p3 =  re.compile(r'^\s*Incoming +interface: +(?P<incoming_interface>[a-zA-Z0-9\/\.]+),'
+                             r' +RPF +nbr: +(?P<rpf_nbr>[a-zA-Z0-9\:\.]+),? *(?P<internal>internal)?$')
+        # Outgoing interface list: (count: 0)
+        # Outgoing interface list: (count: 2) (Fabric OIF)
+        p4 =  re.compile(r'^\s*Outgoing +interface +list: +\(count:'
+                             ' +(?P<oil_count>[0-9]+)\) *(?P<fabric_oif>\(Fabric +OIF\))?$')
+        # loopback2, uptime: 3d11h, igmp
+        # port-channel80, uptime: 3d23h, pim6
+        p5 = re.compile(r'^\s*(?:(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+),'
+                            r')? +uptime: +(?:(?P<oil_uptime>[a-zA-Z0-9\:]+),)?'
+                            r' +(?:(?P<rpf>[a-zA-Z0-9\s]+),)?(?P<oil_flags>\w+)$')
+        #Vlan71, uptime: 06:53:02, m6rib, (RPF)
+        #Vlan71, uptime: 06:53:02, m6rib, (bridge-only)
+        p5_1 = re.compile(r'^\s*(?:(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+)'
+                            r',)? +uptime: +(?:(?P<oil_uptime>[a-zA-Z0-9\:]+),)?'
+                            r' +(?:(?P<rpf>[a-zA-Z0-9\s]+),)?(?P<oil_flags>\w+)'
+                            r'(, +\((?P<oif_rpf>RPF|bridge-only)\))?$')
 
         for line in out.splitlines():
             line = line.rstrip()
-
-            # IPv6 Multicast Routing Table for VRF "default
-            p1 = re.compile(r'^\s*(?P<address_family>[\w\W]+) [mM]ulticast'
-                            r' +[rR]outing +[tT]able +for +VRF'
-                            r' +(?P<vrf>[a-zA-Z0-9\"]+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -298,14 +326,6 @@ class ShowIpv6MrouteVrfAll(ShowIpv6MrouteVrfAllSchema):
                 if address_family not in ipv6_mroute_vrf_all_dict['vrf'][vrf]['address_family']:
                     ipv6_mroute_vrf_all_dict['vrf'][vrf]['address_family'][address_family] = {}
                 continue
-
-            # (*, ff30::/12), uptime: 3d11h, pim6 ipv6
-            # (*, ff03:3::/64), bidir, uptime: 10w5d, pim6 
-            p2 = re.compile(r'^\s*\((?P<source_address>(\S+)),'
-                            r' +(?P<multicast_group>(\S+))\),'
-                            r' *(?P<bidir>(\S+),)? *uptime:'
-                            r' +(?P<uptime>[0-9a-zA-Z\:\.]+)(,)?(?:'
-                            r' *(?P<flag>[a-zA-Z0-9\s]+))?$')
             m = p2.match(line)
             if m:
                 source_address = m.groupdict()['source_address']
@@ -338,15 +358,11 @@ class ShowIpv6MrouteVrfAll(ShowIpv6MrouteVrfAllSchema):
                     ipv6_mroute_vrf_all_dict['vrf'][vrf]['address_family'][address_family]['multicast_group']\
                     [multicast_group]['source_address'][source_address]['bidir'] = True
                 continue
-
-            # Incoming interface: Null, RPF nbr: 0::
-            p3 =  re.compile(r'^\s*Incoming +interface: +(?P<incoming_interface>[a-zA-Z0-9\/\.]+),'
-                             r' +RPF +nbr: +(?P<rpf_nbr>[a-zA-Z0-9\:\,\s]+)$')
             m = p3.match(line)
             if m:
                 incoming_interface = m.groupdict()['incoming_interface']
                 rpf_nbr = m.groupdict()['rpf_nbr']
-                
+                internal = m.groupdict().get('internal') 
                 if 'incoming_interface_list' not in ipv6_mroute_vrf_all_dict['vrf']\
                 [vrf]['address_family'][address_family]['multicast_group'][multicast_group]['source_address'][source_address]:
                     ipv6_mroute_vrf_all_dict['vrf'][vrf]['address_family'][address_family]['multicast_group'][multicast_group]\
@@ -360,24 +376,17 @@ class ShowIpv6MrouteVrfAll(ShowIpv6MrouteVrfAllSchema):
                 ipv6_mroute_vrf_all_dict['vrf'][vrf]['address_family'][address_family]['multicast_group']\
                 [multicast_group]['source_address'][source_address]\
                 ['incoming_interface_list'][incoming_interface]['rpf_nbr'] = rpf_nbr
+                if internal:
+                    ipv6_mroute_vrf_all_dict['vrf'][vrf]['address_family'][address_family]['multicast_group'][multicast_group]['source_address'][source_address]['incoming_interface_list'][incoming_interface]['internal'] = True
                 continue
-
-            # Outgoing interface list: (count: 0)
-            p4 =  re.compile(r'^\s*Outgoing +interface +list: +\(count:'
-                              ' +(?P<oil_count>[0-9]+)\)$')
             m = p4.match(line)
             if m:
                 oil_count = str(m.groupdict()['oil_count'])
                 ipv6_mroute_vrf_all_dict['vrf'][vrf]['address_family'][address_family]['multicast_group'][multicast_group]\
                 ['source_address'][source_address]['oil_count'] = oil_count
                 continue
-
-            # loopback2, uptime: 3d11h, igmp
-            # port-channel80, uptime: 3d23h, pim6
-            p5 = re.compile(r'^\s*(?:(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+),'
-                            r')? +uptime: +(?:(?P<oil_uptime>[a-zA-Z0-9\:]+),)?'
-                            r' +(?:(?P<rpf>[a-zA-Z0-9\s]+),)?(?P<oil_flags>\w+)$')
             m = p5.match(line)
+
             if m:
                 outgoing_interface = m.groupdict()['outgoing_interface']
                 oil_uptime = m.groupdict()['oil_uptime']
@@ -400,11 +409,6 @@ class ShowIpv6MrouteVrfAll(ShowIpv6MrouteVrfAllSchema):
                 ['source_address'][source_address]['outgoing_interface_list']\
                 [outgoing_interface]['oil_flags'] = oil_flags
                 continue
-
-            p5_1 = re.compile(r'^\s*(?:(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+)'
-                              r',)? +uptime: +(?:(?P<oil_uptime>[a-zA-Z0-9\:]+),)?'
-                              r' +(?:(?P<oif_rpf>[a-zA-Z0-9\s]+),)?'
-                              r' +(?P<oil_flags>(\(RPF\))+)*$')
             m = p5_1.match(line)
             if m:
                 outgoing_interface = m.groupdict()['outgoing_interface']
@@ -429,11 +433,12 @@ class ShowIpv6MrouteVrfAll(ShowIpv6MrouteVrfAllSchema):
                 [outgoing_interface]['oil_flags'] = oil_flags
                 ipv6_mroute_vrf_all_dict['vrf'][vrf]['address_family'][address_family]['multicast_group'][multicast_group]\
                 ['source_address'][source_address]['outgoing_interface_list']\
-                [outgoing_interface]['oif_rpf'] = True
-
+                [outgoing_interface]['oif_rpf'] = oif_rpf
+            
         return ipv6_mroute_vrf_all_dict
 
 
+
 # ===========================================
 # Schema for 'show ip static route multicast'
 # ===========================================
@@ -989,3 +994,277 @@ class ShowForwardingDistributionMulticastRoute(ShowForwardingDistributionMultica
                 continue
 
         return result_dict
+
+
+# ===================================
+# Parser for 'show ip mroute summary vrf all'
+# ===================================
+
+class ShowIpMrouteSummarySchema(MetaParser):
+    """Schema for show ip mroute summary vrf all"""
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'address_family': {
+                    Any(): {
+                        'count_multicast_starg': int,
+                        'count_multicast_sg': int,
+                        'count_multicast_starg_prefix': int,
+                        'count_multicast_total': int,
+                        'group_count': int,
+                        'avg_source_per_group': float,
+                        'groups': {
+                            Any(): {
+                                'source_count': int,
+                                'source': {
+                                    Any(): {
+                                        'packets': int,
+                                        'bytes': int,
+                                        'aps': int,
+                                        'pps': int,
+                                        'bitrate': float,
+                                        'bitrate_unit': str,
+                                        'oifs': int
+                                    },
+                                },
+                            }
+                        },
+                    },
+                }
+            },
+        }
+    }
+
+
+class ShowIpMrouteSummary(ShowIpMrouteSummarySchema):
+    """parser for:
+        show ip mroute summary
+        show ip mroute summary vrf <vrf>
+        show ip mroute summary vrf all"""
+
+    cli_command = ['show ip mroute summary vrf {vrf}',
+                   'show ip mroute summary']
+    def cli(self, vrf="default", output=None):
+        if vrf != 'default':
+            cmd = self.cli_command[0].format(vrf=vrf)
+        else:
+            cmd = self.cli_command[1]
+
+        if output is None:
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        mroute_dict = {}
+        #IP Multicast Routing Table for VRF "vxlan-1001" 
+        p1 = re.compile(r'^\s*(?P<address_family>[\w\W]+) [mM]ulticast'
+                         ' +[rR]outing +[tT]able +for +VRF '
+                         '+(?P<vrf>\S+)$')
+        # Total number of (*,G) routes: 34
+        p2 = re.compile(r'^\s*Total +number +of +\(\*,G\) +routes:'
+                         r' +(?P<count>[0-9]+)$')
+        # Total number of (S,G) routes: 17
+        p3 = re.compile(r'^\s*Total +number +of +\(S,G\) +routes:'
+                         r' +(?P<count>[0-9]+)$')
+        # Total number of routes: 51
+        p4 = re.compile(r'^\s*Total +number +of +routes:'
+                         r' +(?P<count>[0-9]+)$')
+        #Total number of (*,G-prefix) routes: 0
+        p5 = re.compile(r'^\s*Total +number +of +\(\*,G-prefix\) +routes:'
+                         r' +(?P<count>[0-9]+)$')
+        #Group count: 41, rough average sources per group: 3.0
+        p6 = re.compile(r'^\s*Group +count: +(?P<count>[0-9]+),'
+                        r' +rough +average +sources +per +group: +(?P<avg_count>[0-9.]+)$')
+        #Group: 225.0.0.2/32, Source count: 3
+        p7 = re.compile(r'^\s*Group: +(?P<group_ip>\S+), +Source count: +(?P<src_count>[0-9]+)$')
+        #100.100.100.5   1743         88893           51    0         27.200  bps  1
+        #(*,G)           0            0               0     0         0.000   bps  2
+        p8 = re.compile(r'^\s*(?P<source>\S+) +(?P<packets>[0-9]+) +(?P<bytes>[0-9]+) +(?P<aps>[0-9]+) +(?P<pps>[0-9]+) +'
+                        r'(?P<bitrate>[0-9.]+) +bps +(?P<oifs>[0-9]+)$')
+
+        for line in out.splitlines():
+            line = line.strip()
+            m = p1.match(line)
+            if m:
+                vrf = m.groupdict()['vrf']
+                vrf = vrf.replace('"',"")
+                address_family = m.groupdict()['address_family'].lower()
+                address_family += 'v4'
+                address_family_dict = mroute_dict.setdefault('vrf', {}).setdefault(vrf,{}).setdefault('address_family', {}).setdefault(address_family, {})
+                continue
+            m = p2.match(line)
+            if m:
+                count_multicast_starg = m.groupdict()['count']
+                address_family_dict.setdefault('count_multicast_starg', int(count_multicast_starg))
+                continue
+            m = p3.match(line)
+            if m:
+                count_multicast_sg = m.groupdict()['count']
+                address_family_dict.setdefault('count_multicast_sg', int(count_multicast_sg))
+                continue
+            m = p4.match(line)
+            if m:
+                count_multicast_total = m.groupdict()['count']
+                address_family_dict.setdefault('count_multicast_total', int(count_multicast_total))
+                continue
+            m = p5.match(line)
+            if m:
+                count_multicast_starg_prefix = m.groupdict()['count']
+                address_family_dict.setdefault('count_multicast_starg_prefix', int(count_multicast_starg_prefix))
+                continue
+            m = p6.match(line)
+            if m:
+                address_family_dict.setdefault('group_count', int(m.groupdict()['count']))
+                address_family_dict.setdefault('avg_source_per_group', float(m.groupdict()['avg_count']))
+                continue
+            m = p7.match(line)
+            if m:
+                group_ip = m.groupdict()['group_ip']
+                source_count = m.groupdict()['src_count']
+                group_dict = address_family_dict.setdefault('groups',{}).setdefault(group_ip,{})
+                group_dict.update({'source_count': int(source_count)})    
+                continue
+            m = p8.match(line)
+            if m:
+                src_dict = group_dict.setdefault('source',{}).setdefault(m.groupdict()['source'],{})
+                src_dict.update({'packets': int(m.groupdict()['packets']),'bytes': int(m.groupdict()['bytes']),'aps': int(m.groupdict()['aps']),'pps': int(m.groupdict()['pps']),'bitrate': float(m.groupdict()['bitrate']),'bitrate_unit':'bps','oifs': int(m.groupdict()['oifs'])})    
+                continue
+        return mroute_dict
+
+
+# ===================================
+# Parser for 'show ipv6 mroute summary vrf all'
+# ===================================
+
+class ShowIpv6MrouteSummarySchema(MetaParser):
+    """Schema for show ipv6 mroute summary vrf all"""
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'address_family': {
+                    Any(): {
+                        'count_multicast_starg': int,
+                        'count_multicast_sg': int,
+                        'count_multicast_starg_prefix': int,
+                        'count_multicast_total': int,
+                        'group_count': int,
+                        'avg_source_per_group': float,
+                        'groups': {
+                            Any(): {
+                                'source_count': int,
+                                'source': {
+                                    Any(): {
+                                        'packets': int,
+                                        'bytes': int,
+                                        'aps': int,
+                                        'pps': int,
+                                        'bitrate': float,
+                                        'bitrate_unit': str,
+                                        'oifs': int
+                                    },
+                                },
+                            }
+                        },
+                    },
+                }
+            },
+        }
+    }
+
+
+class ShowIpv6MrouteSummary(ShowIpv6MrouteSummarySchema):
+    """parser for:
+        show ipv6 mroute summary
+        show ipv6 mroute summary vrf <vrf>
+        show ipv6 mroute summary vrf all"""
+
+    cli_command = ['show ipv6 mroute summary vrf {vrf}',
+                   'show ipv6 mroute summary']
+    def cli(self, vrf="default", output=None):
+        if vrf != 'default':
+            cmd = self.cli_command[0].format(vrf=vrf)
+        else:
+            cmd = self.cli_command[1]
+
+        if output is None:
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        mroute_dict = {}
+        #IP Multicast Routing Table for VRF "vxlan-1001" 
+        p1 = re.compile(r'^\s*(?P<address_family>[\w\W]+) [mM]ulticast'
+                         ' +[rR]outing +[tT]able +for +VRF '
+                         '+(?P<vrf>\S+)$')
+        # Total number of (*,G) routes: 34
+        p2 = re.compile(r'^\s*Total +number +of +\(\*,G\) +routes:'
+                         r' +(?P<count>[0-9]+)$')
+        # Total number of (S,G) routes: 17
+        p3 = re.compile(r'^\s*Total +number +of +\(S,G\) +routes:'
+                         r' +(?P<count>[0-9]+)$')
+        # Total number of routes: 51
+        p4 = re.compile(r'^\s*Total +number +of +routes:'
+                         r' +(?P<count>[0-9]+)$')
+        #Total number of (*,G-prefix) routes: 0
+        p5 = re.compile(r'^\s*Total +number +of +\(\*,G-prefix\) +routes:'
+                         r' +(?P<count>[0-9]+)$')
+        #Group count: 41, rough average sources per group: 3.0
+        p6 = re.compile(r'^\s*Group +count: +(?P<count>[0-9]+),'
+                        r' +rough +average +sources +per +group: +(?P<avg_count>[0-9.]+)$')
+        #Group: ff32::/32, Source count: 0
+        #Group: ff33:0:0:1197::1/128, Source count: 1
+        p7 = re.compile(r'^\s*Group: +(?P<group_ip>\S+), +Source count: +(?P<src_count>[0-9]+)$')
+        #2001:180:1:57::1181  968          49478           51    0     0.000   bps  1
+        #(*,G)           0            0               0     0         0.000   bps  2
+        p8 = re.compile(r'^\s*(?P<source>\S+) +(?P<packets>[0-9]+) +(?P<bytes>[0-9]+) +(?P<aps>[0-9]+) +(?P<pps>[0-9]+) +'
+                        r'(?P<bitrate>[0-9.]+) +bps +(?P<oifs>[0-9]+)$')
+
+        for line in out.splitlines():
+            line = line.strip()
+            m = p1.match(line)
+            if m:
+                vrf = m.groupdict()['vrf']
+                vrf = vrf.replace('"',"")
+                address_family = m.groupdict()['address_family'].lower()
+                address_family_dict = mroute_dict.setdefault('vrf', {}).setdefault(vrf,{}).setdefault('address_family', {}).setdefault(address_family, {})
+                continue
+            m = p2.match(line)
+            if m:
+                count_multicast_starg = m.groupdict()['count']
+                address_family_dict.setdefault('count_multicast_starg', int(count_multicast_starg))
+                continue
+            m = p3.match(line)
+            if m:
+                count_multicast_sg = m.groupdict()['count']
+                address_family_dict.setdefault('count_multicast_sg', int(count_multicast_sg))
+                continue
+            m = p4.match(line)
+            if m:
+                count_multicast_total = m.groupdict()['count']
+                address_family_dict.setdefault('count_multicast_total', int(count_multicast_total))
+                continue
+            m = p5.match(line)
+            if m:
+                count_multicast_starg_prefix = m.groupdict()['count']
+                address_family_dict.setdefault('count_multicast_starg_prefix', int(count_multicast_starg_prefix))
+                continue
+            m = p6.match(line)
+            if m:
+                address_family_dict.setdefault('group_count', int(m.groupdict()['count']))
+                address_family_dict.setdefault('avg_source_per_group', float(m.groupdict()['avg_count']))
+                continue
+            m = p7.match(line)
+            if m:
+                group_ip = m.groupdict()['group_ip']
+                source_count = m.groupdict()['src_count']
+                group_dict = address_family_dict.setdefault('groups',{}).setdefault(group_ip,{})
+                group_dict.update({'source_count': int(source_count)})    
+                continue
+            m = p8.match(line)
+            if m:
+                src_dict = group_dict.setdefault('source',{}).setdefault(m.groupdict()['source'],{})
+                src_dict.update({'packets': int(m.groupdict()['packets']),'bytes': int(m.groupdict()['bytes']),'aps': int(m.groupdict()['aps']),'pps': int(m.groupdict()['pps']),'bitrate': float(m.groupdict()['bitrate']),'bitrate_unit':'bps','oifs': int(m.groupdict()['oifs'])})    
+                continue
+        return mroute_dict
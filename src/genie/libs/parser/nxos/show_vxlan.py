@@ -62,16 +62,16 @@ class ShowL2routeEvpnImetAllDetail(ShowL2routeEvpnImetAllDetailSchema):
         # excute command to get output
         out = output if output else self.device.execute(self.cli_command)
 
-        # Topology ID  VNI         Prod  IP Addr                                 Eth Tag PMSI-Flags Flags   Type Label(VNI)  Tunnel ID                               NFN Bitmap  
+        # Topology ID  VNI         Prod  IP Addr                                 Eth Tag PMSI-Flags Flags   Type Label(VNI)  Tunnel ID                               NFN Bitmap
         # -----------  ----------- ----- --------------------------------------- ------- ---------- ------- ---- ----------- --------------------------------------- ----------
-        # 201          20001       BGP   2001:db8:646:a2bb:0:abcd:1234:3                  0       0          -       6    20001        2001:db8:646:a2bb:0:abcd:1234:3                  32          
-        # 201          20001       BGP   2001:db8:646:a2bb:0:abcd:5678:1                  0       0          -       6    20001        2001:db8:646:a2bb:0:abcd:5678:1                  32          
+        # 201          20001       BGP   2001:db8:646:a2bb:0:abcd:1234:3                  0       0          -       6    20001        2001:db8:646:a2bb:0:abcd:1234:3                  32
+        # 201          20001       BGP   2001:db8:646:a2bb:0:abcd:5678:1                  0       0          -       6    20001        2001:db8:646:a2bb:0:abcd:5678:1                  32
 
 
-        p1 = re.compile(r'^(?P<topo_id>[\d]+) + (?P<vni>[\d]+)' 
-                         ' + (?P<prod_type>[\w]+) * (?P<ip_addr>[\w\:]+)' 
-                         ' + (?P<eth_tag_id>[\d]+) + + (?P<pmsi_flags>[\d]+)' 
-                         ' + (?P<flags>[\w-]) + (?P<type>[\d]+) + (?P<vni_label>[\d]+)' 
+        p1 = re.compile(r'^(?P<topo_id>[\d]+) + (?P<vni>[\d]+)'
+                         ' + (?P<prod_type>[\w]+) * (?P<ip_addr>[\w\:]+)'
+                         ' + (?P<eth_tag_id>[\d]+) + + (?P<pmsi_flags>[\d]+)'
+                         ' + (?P<flags>[\w-]) + (?P<type>[\d]+) + (?P<vni_label>[\d]+)'
                          ' + (?P<tunnel_id>[\w\:]+) + (?P<client_nfn>[\d]+)$')
 
         result_dict = {}
@@ -88,7 +88,7 @@ class ShowL2routeEvpnImetAllDetail(ShowL2routeEvpnImetAllDetailSchema):
                             setdefault(vni, {}).\
                             setdefault('ip', {}).\
                             setdefault(ip, {})
-                
+
                 vni_dict['topo_id'] = int(group['topo_id'])
                 vni_dict['vni'] = vni
                 vni_dict['prod_type'] = group['prod_type']
@@ -150,11 +150,12 @@ class ShowNvePeers(ShowNvePeersSchema):
         # Interface Peer-IP          State LearnType Uptime   Router-Mac
         # nve1      192.168.16.1      Up    CP        01:15:09 n/a
         # nve1      192.168.106.1        Up    CP        00:03:05 5e00.00ff.0209
-        # nve1      2001:db8:646:a2bb:0:abcd:1234:3                  Up    CP        21:47:20 5254.00ff.3162   
-        # nve1      2001:db8:646:a2bb:0:abcd:1234:5                  Up    CP        21:47:20 5254.00ff.3a82   
+        # nve1      2001:db8:646:a2bb:0:abcd:1234:3                  Up    CP        21:47:20 5254.00ff.3162
+        # nve1      2001:db8:646:a2bb:0:abcd:1234:5                  Up    CP        21:47:20 5254.00ff.3a82
+        # nve1      172.31.201.40   Down  CP        0.000000 n/a
 
         p1 = re.compile(r'^\s*(?P<nve_name>[\w\/]+) +(?P<peer_ip>[\w\.\:]+) +(?P<peer_state>[\w]+)'
-                        ' +(?P<learn_type>[\w]+) +(?P<uptime>[\w\:]+) +(?P<router_mac>[\w\.\/]+)$')
+                        ' +(?P<learn_type>[\w]+) +(?P<uptime>[\w\:\.]+) +(?P<router_mac>[\w\.\/]+)$')
 
         for line in out.splitlines():
             if line:
@@ -378,6 +379,7 @@ class ShowNveInterfaceDetailSchema(MetaParser):
             Optional('host_reach_mode'): str,
             Optional('source_if'): str,
             Optional('primary_ip'): str,
+            Optional('anycast_if'): str,
             Optional('secondary_ip'): str,
             Optional('src_if_state'): str,
             Optional('ir_cap_mode'): str,
@@ -418,12 +420,16 @@ class ShowNveInterfaceDetail(ShowNveInterfaceDetailSchema):
 
         if interface:
             nve_list.append(interface)
-        if not interface:
+        elif output:
+            # Output is given, do not attempt discovery of interfaces from a
+            # different command.
+            # Add a placeholder to the nve_list just to perform one iteration of
+            # the parsing loop.
+            nve_list.append('placeholder')
+        elif not interface and not output:
+            # No interface given, and no output given, find nve interfaces
             cmd1 = 'show interface | i nve'
-            if not output:
-                out1 = self.device.execute(cmd1)
-            else:
-                out1 = output
+            out1 = self.device.execute(cmd1)
             # Init vars
 
             # nve1 is down (other)
@@ -454,6 +460,9 @@ class ShowNveInterfaceDetail(ShowNveInterfaceDetailSchema):
         p5_1 = re.compile(r'^\s*Source-Interface: +(?P<source_if>[\w\/]+) +\(primary: +(?P<primary_ip>[\w\.\:]+)\)')
         p5_2 = re.compile(r'^\s*Anycast-Interface: +(?P<anycast_if>[\w\/]+) +\(secondary: +(?P<secondary_ip>[\w\.\:]+)\)')
 
+        # Source - Interface: loopback1(primary: 100: 100:100::6, secondary: 0.0.0.0)
+        p5_3 = re.compile(r'^\s*Source-Interface: +(?P<source_if>[\w\/]+)'                      
+                        ' +\(primary: +(?P<primary_ip>[\w\.\:]+), +secondary: +(?P<secondary_ip>[\w\.]+)\)$')
 
         p6 = re.compile(r'^\s*Source +Interface +State: +(?P<source_state>[\w]+)$')
         p7 = re.compile(r'^\s*IR +Capability +Mode: +(?P<mode>[\w]+)$')
@@ -484,9 +493,12 @@ class ShowNveInterfaceDetail(ShowNveInterfaceDetailSchema):
         p25 = re.compile(r'Multisite +delay-restore +time +left: +(?P<multisite_convergence_time_left>\d+) +seconds$')
         # Multisite dci-advertise-pip configured: True
         p26 = re.compile(r'Multisite +dci-advertise-pip +configured: +(?P<multisite_dci_advertise_pip>\S+)')
-        
+
         for nve in nve_list:
-            out = self.device.execute(self.cli_command.format(interface=nve))
+            if not output:
+                out = self.device.execute(self.cli_command.format(interface=nve))
+            else:
+                out = output
             for line in out.splitlines():
                 if line:
                     line = line.rstrip()
@@ -529,6 +541,7 @@ class ShowNveInterfaceDetail(ShowNveInterfaceDetailSchema):
                 m = p5.match(line)
                 m_1 = p5_1.match(line)
                 m_2 = p5_2.match(line)
+                m_3 = p5_3.match(line)
                 if m:
                     group = m.groupdict()
                     nve_dict.update({k:v for k,v in group.items()})
@@ -542,6 +555,9 @@ class ShowNveInterfaceDetail(ShowNveInterfaceDetailSchema):
                     nve_dict.update({'anycast_if': group2.pop('anycast_if')})
                     nve_dict.update({'secondary_ip': group2.pop('secondary_ip')})
                     continue
+                if m_3:
+                    group3 = m_3.groupdict()
+                    nve_dict.update({k:v for k,v in group3.items()})
 
                 m = p5.match(line)
                 if m:
@@ -1299,9 +1315,14 @@ class ShowL2routeMacAllDetailSchema(MetaParser):
                             'next_hop1': str,
                             'rte_res': str,
                             'fwd_state': str,
+                            Optional('label'): int,
                             Optional('peer_id'): int,
+                            Optional('res_pl'): str,
                             Optional('sent_to'): str,
                             Optional('soo'): int,
+                            Optional('esi'): str,
+                            Optional('encap'): int,
+                            Optional('pl_flag'): bool,
                         }
                     }
                 }
@@ -1313,16 +1334,24 @@ class ShowL2routeMacAllDetailSchema(MetaParser):
 # ====================================================
 class ShowL2routeMacAllDetail(ShowL2routeMacAllDetailSchema):
     """parser for:
-        show l2route mac all detail"""
+            show l2route mac all detail"""
 
-    cli_command = 'show l2route mac all detail'
+    cli_command = ['show l2route evpn mac all detail',
+                   'show l2route evpn mac evi {evi} detail',
+                   'show l2route evpn mac evi {evi} mac {mac} detail']
     exclude = [
         'mac']
 
-    def cli(self, output=None):
+    def cli(self, output=None, evi=None, mac=None):
         # excute command to get output
         if output is None:
-            out = self.device.execute(self.cli_command)
+            if evi and mac:
+                cmd = self.cli_command[2].format(evi=evi, mac=mac)
+            elif evi:
+                cmd = self.cli_command[1].format(evi=evi)
+            else:
+                cmd = self.cli_command[0]
+            out = self.device.execute(cmd, timeout=180)
         else:
             out = output
 
@@ -1334,28 +1363,50 @@ class ShowL2routeMacAllDetail(ShowL2routeMacAllDetailSchema):
         #            Forwarding State: Resolved (PeerID: 2)
         #            Sent To: BGP
         #            SOO: 774975538
+        #
+        # 11          0000.1111.0108 BGP    Spl           0          3.2.2.1 (Label: 10011)
+        #                                                            3.2.2.2 (Label: 10011)
+        #             Route Resolution Type: ESI
+        #             Forwarding State: Resolved (PL)
+        #             Resultant PL: 3.2.2.1, 3.2.2.2
+        #             Sent To: L2FM
+        #             ESI : 0300.0000.0000.0000.0347
+        #             Encap: 1
+
+        #  11          0000.1111.0108 BGP    Spl           0          3.2.2.1 (Label: 10011)
         p1 = re.compile(r'^\s*(?P<topo_id>[\d]+) +(?P<mac_addr>[\w\.]+) +(?P<prod_type>[\w\,]+)'
-                        ' +(?P<flags>[\w\,\-]+) +(?P<seq_num>[\d]+) +(?P<next_hop1>[\w\/\.]+)$')
-
-        p2 = re.compile(r'^\s*Route +Resolution +Type: +(?P<rte_res>[\w]+)$')
-        p3 = re.compile(r'^\s*Forwarding +State: +(?P<fwd_state>[\w]+)( +\(PeerID: +(?P<peer_id>[\d]+)\))?$')
-        p4 = re.compile(r'^\s*Sent +To: +(?P<sent_to>[\w\,]+)$')
-        p5 = re.compile(r'^\s*SOO: +(?P<soo>[\d]+)$')
+                        ' +(?P<flags>[\w\,\-]+) +(?P<seq_num>[\d]+) +(?P<next_hop1>[\w\/\.]+)\s*'
+                        '(?:\(Label: (?P<label>\d+)\).*)?$')
+        #  3.2.2.2 (Label: 10011)
+        p2 = re.compile(r'^\s*(?P<next_hop2>[\d\/\.]+)')
+        #  Route Resolution Type: ESI
+        p3 = re.compile(r'^\s*Route +Resolution +Type: +(?P<rte_res>[\w]+)$')
+        #  Forwarding State: Resolved (PeerID: 2)
+        p4 = re.compile(r'^\s*Forwarding +State: +(?P<fwd_state>[\w]+)( +\(PeerID: +(?P<peer_id>[\d]+)\))?$')
+        #  Forwarding State: Resolved
+        p10 = re.compile(r'^\s*Forwarding +State: +(?P<fwd_state>[\w]+)$')
+        #  Forwarding State: Resolved (PL)
+        p11 = re.compile(r'^\s*Forwarding +State: +(?P<fwd_state>[\w]+)( +\(PL\))$')
+        #  Resultant PL: 3.2.2.1, 3.2.2.2
+        p5 = re.compile(r'^\s*Resultant +PL: +(?P<res_pl>.*$)')
+        #  ESI : 0300.0000.0000.0000.0347
+        p6 = re.compile(r'^\s*ESI\s*: +(?P<esi>[\w\.]+)\s*$')
+        #  Sent To: L2FM
+        #  SOO: 774975538
+        #  Encap: 1
+        p7 = re.compile(r'^\s*(?P<key>[\w ]+) *: +(?P<value>\S+)\s*$')
 
         for line in out.splitlines():
             if line:
                 line = line.rstrip()
-            else:
-                continue
-
 
             m = p1.match(line)
             if m:
                 group = m.groupdict()
                 topo_id = int(group.pop('topo_id'))
                 mac_addr = group.pop('mac_addr')
-                topo_dict = result_dict.setdefault('topology', {}).setdefault('topo_id', {}).setdefault(topo_id,{}).\
-                                        setdefault('mac',{}).setdefault(mac_addr,{})
+                topo_dict = result_dict.setdefault('topology', {}).setdefault('topo_id', {}).setdefault(topo_id, {}). \
+                                        setdefault('mac', {}).setdefault(mac_addr, {})
 
                 flags = group.pop('flags')
                 if flags.endswith(','):
@@ -1363,27 +1414,40 @@ class ShowL2routeMacAllDetail(ShowL2routeMacAllDetailSchema):
 
                 topo_dict.update({'flags':  flags.lower()})
                 topo_dict.update({'prod_type':  group.pop('prod_type').lower()})
-                topo_dict.update({'seq_num': int(group.pop('seq_num'))})
-                topo_dict.update({'mac_addr': mac_addr})
+                topo_dict.update({'seq_num':  int(group.pop('seq_num'))})
+                topo_dict.update({'mac_addr':  mac_addr})
                 try:
                     next_hop1 = Common.convert_intf_name(group.pop('next_hop1'))
                 except:
                     next_hop1 = group.pop('next_hop1')
                 topo_dict.update({'next_hop1': next_hop1})
+                if group['label']:
+                    topo_dict['label'] = int(group['label'])
+
+                continue
 
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                next_hop2 = group['next_hop2']
+                prev_nexthop = topo_dict['next_hop1']
+                next_hops = prev_nexthop + ',' + next_hop2
+                topo_dict['next_hop1'] = next_hops
                 continue
 
             m1 = ""
-            if p2.match(line):
-                m1 = p2.match(line)
-            if p4.match(line):
-                m1 = p4.match(line)
+            if p3.match(line):
+                m1 = p3.match(line)
+            if p5.match(line):
+                m1 = p5.match(line)
+            if p6.match(line):
+                m1 = p6.match(line)
             if m1:
                 group = m1.groupdict()
-                topo_dict.update({k:v.lower() for k,v in group.items() })
+                topo_dict.update({k:v.lower() for k,v in group.items()})
                 continue
 
-            m = p3.match(line)
+            m = p4.match(line)
             if m:
                 group = m.groupdict()
                 topo_dict.update({'fwd_state': group.get('fwd_state')})
@@ -1391,12 +1455,28 @@ class ShowL2routeMacAllDetail(ShowL2routeMacAllDetailSchema):
                     topo_dict.update({'peer_id': int(group.get('peer_id'))})
                 continue
 
-            m = p5.match(line)
+            m = p10.match(line)
             if m:
                 group = m.groupdict()
-                topo_dict.update({k:int(v) for k, v in group.items()})
+                topo_dict.update({'fwd_state': group.get('fwd_state')})
                 continue
 
+            m = p11.match(line)
+            if m:
+                group = m.groupdict()
+                topo_dict.update({
+                    'fwd_state': group.get('fwd_state'),
+                    'pl_flag': True
+                })
+                continue
+
+            m = p7.match(line)
+            if m:
+                groups = m.groupdict()
+                key = groups['key'].replace(' ', '_').replace('-', '_').lower()
+                value = int(groups['value']) if groups['value'].isdigit() else groups['value'].lower()
+                topo_dict.update({key:value})
+
         return result_dict
 
 # ====================================================
@@ -1452,11 +1532,12 @@ class ShowL2routeMacIpAllDetail(ShowL2routeMacIpAllDetailSchema):
         #            SOO: 774975538
         #            L3-Info: 10001
         # 101         fa16.3eff.0987 HMM    --            0          10.111.1.3    Local
-        # 101         fa16.3eff.e94e BGP    --            0          10.111.8.3    10.84.66.66 
+        # 101         fa16.3eff.e94e BGP    --            0          10.111.8.3    10.84.66.66
         # 101         0011.00ff.0034 BGP  10.36.3.2                      10.70.0.2
+        # 202         0011.01ff.0002 BGP    --            0         2001:db8:646::5678:1 6:1:1::2
         p1 = re.compile(r'^\s*(?P<topo_id>[\d]+) +(?P<mac_addr>[\w\.]+) +(?P<mac_ip_prod_type>[\w\,]+)'
-                        '( +(?P<mac_ip_flags>[\w\,\-]+))?( +(?P<seq_num>[\d]+))? +(?P<host_ip>[\w\/\.]+)'
-                        ' +(?P<next_hop1>[\w\/\.]+)$')
+                        '( +(?P<mac_ip_flags>[\w\,\-]+))?( +(?P<seq_num>[\d]+))? +(?P<host_ip>[\w\/\.\:]+)'
+                        ' +(?P<next_hop1>[\w\/\.\:]+)$')
 
         p2 = re.compile(r'^\s*Sent +To: +(?P<sent_to>[\w]+)$')
         p3 = re.compile(r'^\s*SOO: +(?P<soo>[\d]+)$')
@@ -1465,10 +1546,11 @@ class ShowL2routeMacIpAllDetail(ShowL2routeMacIpAllDetailSchema):
         # Topology    Mac Address    Host IP         Prod   Flags         Seq No     Next-Hops
         # ----------- -------------- --------------- ------ ---------- ---------------
         # 101         0000.9cff.2293 10.111.1.3     BGP    --            0         10.76.23.23
-        # 201         0011.01ff.0001 10.1.1.2       BGP    --            0         2001:db8:646:a2bb:0:abcd:5678:1   
-        p5 = re.compile(r'^\s*(?P<topo_id>[\d]+) +(?P<mac_addr>[\w\.]+) +(?P<host_ip>[\w\/\.]+)'
+        # 201         0011.01ff.0001 10.1.1.2       BGP    --            0         2001:db8:646:a2bb:0:abcd:5678:1
+        # 202         0011.01ff.0001 5:1:1:1::2     BGP    --            0         2001:db8:646:a2bb:0:abcd:5678:1
+        p5 = re.compile(r'^\s*(?P<topo_id>[\d]+) +(?P<mac_addr>[\w\.]+) +(?P<host_ip>[\w\/\.\:]+)'
                         ' +(?P<mac_ip_prod_type>[\w\,]+)'
-                        ' +(?P<mac_ip_flags>[\w\,\-]+) +(?P<seq_num>[\d]+) +(?P<next_hop1>[\w\/\.]+)$')
+                        ' +(?P<mac_ip_flags>[\w\,\-]+) +(?P<seq_num>[\d]+) +(?P<next_hop1>[\w\/\.\:]+)$')
 
         for line in out.splitlines():
             if line:
@@ -1742,7 +1824,10 @@ class ShowRunningConfigNvOverlaySchema(MetaParser):
                         Optional('vni'): int,
                         Optional('associated_vrf'): bool,
                         Optional('multisite_ingress_replication'): bool,
+                        Optional('multisite_ingress_replication_optimized'): bool,
+                        Optional('ingress_replication_protocol_bgp'): bool,
                         Optional('mcast_group'): str,
+                        Optional('multisite_mcast_group'): str,
                         Optional('suppress_arp'): bool,
                         Optional('vni_type'): str,
                     },
@@ -1774,7 +1859,7 @@ class ShowRunningConfigNvOverlay(ShowRunningConfigNvOverlaySchema):
     cli_command = 'show running-config nv overlay'
 
     def cli(self, output=None):
-        # excute command to get output
+        # execute command to get output
         if output is None:
             out = self.device.execute(self.cli_command)
         else:
@@ -1816,6 +1901,13 @@ class ShowRunningConfigNvOverlay(ShowRunningConfigNvOverlaySchema):
         p14 = re.compile(r'^global +suppress-arp$')
         # global mcast-group 192.168.0.1 L2
         p15 = re.compile(r'^global +mcast-group +(?P<address>[\d\.]+) +(?P<layer>L2|L3)')
+        #   multisite ingress-replication optimized
+        p16 = re.compile(r'^multisite +ingress-replication +optimized$')
+        #   ingress-replication protocol bgp
+        p17 = re.compile(r'^ingress-replication +protocol +bgp$')
+        #   multisite mcast-group 226.1.1.1
+        p18 = re.compile(r'^multisite mcast-group +(?P<multisite_mcast_group>[\d\.]+)$')
+
 
         for line in out.splitlines():
             line = line.strip()
@@ -1922,7 +2014,7 @@ class ShowRunningConfigNvOverlay(ShowRunningConfigNvOverlaySchema):
             if m:
                 interface = m.groupdict().pop('interface')
                 continue
-            
+
             # interface port-channel11
             # interface Ethernet1/1
             m = p13.match(line)
@@ -1947,6 +2039,30 @@ class ShowRunningConfigNvOverlay(ShowRunningConfigNvOverlaySchema):
             m = p15.match(line)
             if m:
                 global_mcast_group_flag = (m.groupdict()['address'], m.groupdict()['layer'])
+                continue
+
+            m = p16.match(line)
+            if m:
+                for vni in nve_vni_list:
+                    vni_dict = nve_dict.setdefault('vni', {}).setdefault(vni, {})
+                    vni_dict.update({'multisite_ingress_replication_optimized': True})
+                continue
+
+            m = p17.match(line)
+            if m:
+                for vni in nve_vni_list:
+                    vni_dict = nve_dict.setdefault('vni', {}).setdefault(vni, {})
+                    vni_dict.update({'ingress_replication_protocol_bgp': True})
+                continue
+
+            m = p18.match(line)
+            if m:
+                multisite_mcast = m.groupdict().pop('multisite_mcast_group')
+
+                for vni in nve_vni_list:
+                    vni_dict = nve_dict.setdefault('vni', {}).setdefault(vni, {})
+                    vni_dict.update({'multisite_mcast_group': multisite_mcast})
+                continue
 
         return result_dict
 
@@ -2262,21 +2378,25 @@ class ShowFabricMulticastIpSaAdRoute(ShowFabricMulticastIpSaAdRouteSchema):
         p1 = re.compile(r'^\s*VRF +\"(?P<vrf_name>\S+)\" +MVPN +SA +AD +Route +Database'
                         ' +VNI: +(?P<vnid>[\d]+)$')
 
-        # Src Active AD Route: (10.111.1.3/32, 238.8.4.101/32) uptime: 00:01:01
-        p2 = re.compile(r'^\s*Src +Active +AD +Route: +\((?P<saddr>[\w\/\.]+), +(?P<gaddr>[\w\/\.]+)\)'
+        # Src Active AD route: (1.1.11.3/32, 226.0.0.1/32) uptime: 00:12:32
+        # SA-AD Route: (1.1.11.3/32, 226.0.0.1/32) uptime: 00:12:32
+        p2 = re.compile(r'((^\s*SA\-AD +Route:)|(^\s*Src +Active +AD +route:)) +\((?P<saddr>[\w\/\.]+), +(?P<gaddr>[\w\/\.]+)\)'
                         ' +uptime: +(?P<uptime>[\w\.\:]+)$')
+
         #  Interested Fabric Nodes:
         p3 = re.compile(r'^\s*Interested Fabric Nodes:$')
 
+
         #    This node, uptime: 00:01:01
+        #    100.100.100.4, uptime: 00:01:01
         p4 = re.compile(r'^\s*(?P<interested_fabric_nodes>[\w\s\.]+), +uptime: +(?P<interest_uptime>[\w\.\:]+)$')
 
         for line in out.splitlines():
-            if line:
-                line = line.rstrip()
-            else:
+            if not line:
                 continue
+            line = line.strip()
 
+            # VRF "vni_10100" MVPN SA AD Route Database VNI: 10100
             m = p1.match(line)
             if m:
                 group = m.groupdict()
@@ -2285,6 +2405,7 @@ class ShowFabricMulticastIpSaAdRoute(ShowFabricMulticastIpSaAdRouteSchema):
                 vrf_dict.update({'vnid': group['vnid']})
                 continue
 
+            # SA-AD Route: (1.1.11.3/32, 226.0.0.1/32) uptime: 00:12:32
             m = p2.match(line)
             if m:
                 group = m.groupdict()
@@ -2300,6 +2421,8 @@ class ShowFabricMulticastIpSaAdRoute(ShowFabricMulticastIpSaAdRouteSchema):
                 saddr_dict.update({'uptime': group['uptime']})
                 continue
 
+            #    This node, uptime: 00:01:01
+            #    100.100.100.4, uptime: 00:01:01
             m = p4.match(line)
             if m:
                 group = m.groupdict()
@@ -2311,6 +2434,150 @@ class ShowFabricMulticastIpSaAdRoute(ShowFabricMulticastIpSaAdRouteSchema):
 
         return result_dict
 
+# ==========================================================
+#  schema for show fabric multicast ipv4 mroute vrf all
+# ==========================================================
+class ShowFabricMulticastIpMrouteSchema(MetaParser):
+    """Schema for:
+        show fabric multicast ipv4 mroute
+        show fabric multicast ipv4 mroute vrf <vrf>
+        show fabric multicast ipv4 mroute vrf all"""
+
+    schema ={
+        "multicast": {
+            "vrf": {
+                Any(): {
+                    "vnid": str,
+                    Optional("address_family"): {
+                        Any(): {
+                            "fabric_mroutes": {
+                                "gaddr": {
+                                    Any(): {
+                                        "grp_len": int,
+                                        "saddr": {
+                                            Any(): {
+                                                Optional("src_len"): int,
+                                                "uptime": str,
+                                                Optional("rd_rt_ext_vri"): str,
+                                                Optional("interested_fabric_nodes"): {
+                                                    Any(): {
+                                                        "uptime": str,
+                                                        "rpfneighbor": str,
+                                                        Optional("loc"): str,
+                                                    }
+                                                }
+                                            }
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+# ===========================================================
+#  Parser for show fabric multicast ipv4 mroute vrf all
+# ==========================================================
+class ShowFabricMulticastIpMroute(ShowFabricMulticastIpMrouteSchema):
+    """parser for:
+        show fabric multicast ipv4 mroute
+        show fabric multicast ipv4 mroute vrf <vrf>
+        show fabric multicast ipv4 mroute vrf all"""
+
+    cli_command = ['show fabric multicast ipv4 mroute vrf {vrf}','show fabric multicast ipv4 mroute']
+    exclude = [
+        'uptime']
+
+    def cli(self,vrf="",output=None):
+        if vrf:
+            cmd = self.cli_command[0].format(vrf=vrf)
+        else:
+            vrf = "default"
+            cmd = self.cli_command[1]
+
+        if output is None:
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        result_dict = {}
+
+        # VRF "trm-vxlan-3001" Fabric mroute Database VNI: 203001
+
+        p1 = re.compile(r'^\s*VRF +\"(?P<vrf_name>\S+)\" +Fabric +mroute +Database'\
+                        ' +VNI: +(?P<vnid>[\d]+)$')
+
+
+        # Fabric Mroute: (179.1.12.11 / 32, 225.1.1.1 / 32) ptr: 0x56207780cbcc flags:0 uptime:00:01:01
+
+        p2 = re.compile(r'^\s*Fabric +Mroute: +\((?P<saddr>[\w\/\.\*]+), +(?P<gaddr>[\w\/\.]+)\) +ptr: +0[xX][0-9a-'\
+                        'fA-F]+ flags: +[0-9]+ +uptime: +(?P<uptime>[\w\.\:]+)$')
+
+        # RD-RT ext comm Route-Import:  0b 64 64 64 06 0b b9 00 01 5a 5a 5a 06 80 0b e8 03 00 00
+        p3 = re.compile(r'^\s*RD-RT ext comm Route-Import: +(?P<vri>[\w\s]+)$')
+        #  Interested Fabric Nodes:
+        p4 = re.compile(r'^\s*Interested Fabric Nodes:$')
+
+        #   This node, uptime: 00:30:25    RPF Neighbor: 102.1.1.1
+        #   100.100.100.1 (core), uptime: 00:30:25    RPF Neighbor: 102.1.1.1
+        p5 = re.compile(r'^\s*(?P<interested_fabric_nodes>[\w\s\.]+) *(\((?P<loc>[\w]+)\))? *, +uptime: +'\
+                         '(?P<interest_uptime>[\w\.\:]+) +RPF +Neighbor: +(?P<rpfneighbor>[\w\/\.]+)$')
+
+        for line in out.splitlines():
+            if not line:
+                continue
+            line = line.strip()
+
+            # VRF "trm-vxlan-3001" Fabric mroute Database VNI: 203001
+            m = p1.match(line)
+            if m:
+                group = m.groupdict()
+                vrf_dict = result_dict.setdefault('multicast', {}).setdefault('vrf', {}).\
+                    setdefault(group['vrf_name'], {})
+                vrf_dict.update({'vnid': group['vnid']})
+                continue
+
+            # Fabric Mroute: (179.1.12.11 / 32, 225.1.1.1 / 32) ptr: 0x56207780cbcc flags:0 uptime:00:01:01
+            m = p2.match(line)
+            if m:
+                group = m.groupdict()
+                address_family_dict = vrf_dict.setdefault('address_family', {}).setdefault('ipv4', {})
+                saddr = group['saddr']
+                gaddr = group['gaddr']
+                gaddr_dict = address_family_dict.setdefault('fabric_mroutes', {}).\
+                    setdefault('gaddr', {}).setdefault(gaddr ,{})
+                gaddr_dict.update({'grp_len': int(gaddr.split('/')[1])})
+                saddr_dict = gaddr_dict.setdefault('saddr', {}).setdefault(saddr, {})
+                if saddr != "*":
+                    saddr_dict.update({'src_len': int(saddr.split('/')[1])})
+                saddr_dict.update({'uptime': group['uptime']})
+                continue
+            # RD-RT ext comm Route-Import:  0b 64 64 64 06 0b b9 00 01 5a 5a 5a 06 80 0b e8 03 00 00
+            m = p3.match(line)
+            if m:
+                group = m.groupdict()
+                group["rd_rt_ext_vri"] = group['vri'].strip()
+                saddr_dict.update({'rd_rt_ext_vri': group['rd_rt_ext_vri']})
+
+            #   This node, uptime: 00:30:25    RPF Neighbor: 102.1.1.1
+            #   100.100.100.1 (core), uptime: 00:30:25    RPF Neighbor: 102.1.1.1
+            m = p5.match(line)
+            if m:
+                group = m.groupdict()
+                group['interested_fabric_nodes'] = group['interested_fabric_nodes'].strip()
+                group['loc'] = group['loc']
+                interested_dict = saddr_dict.setdefault('interested_fabric_nodes', {}).\
+                    setdefault(group['interested_fabric_nodes'], {})
+                interested_dict.update({'uptime': group['interest_uptime']})
+                interested_dict.update({'rpfneighbor': group['rpfneighbor']})
+                if group.get('loc',None):
+                    interested_dict.update({'loc': group['loc']})
+                continue
+        return result_dict
+
 
 # ==========================================================
 #  schema for show fabric multicast ipv4 l2-mroute vni all
@@ -2457,4 +2724,3 @@ class ShowL2routeEvpnMacIpEvi(ShowL2routeMacIpAllDetail):
         else:
             show_output = output
         return super().cli(output=show_output)
-
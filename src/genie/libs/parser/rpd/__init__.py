@@ -0,0 +1,3 @@
+from genie import abstract
+
+abstract.declare_token(__name__)
@@ -0,0 +1,5 @@
+from genie.libs.parser.linux.docker import DockerStatsNoStream as DockerStatsNoStream_linux
+
+
+class DockerStatsNoStream(DockerStatsNoStream_linux):
+    pass
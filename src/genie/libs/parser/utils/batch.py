@@ -0,0 +1,116 @@
+'''Execute the sub-commands of a parser as one batch'''
+
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import contextvars
+except ImportError:
+    # python 3.6
+    contextvars = None
+
+from .common import _get_config
+
+PARSER_BATCH_EXECUTE = 'genie.libs.parser.batch_execute'
+
+
+def _is_batch_execute():
+    '''whether the sub-commands of a parser are executed as a batch, enabled
+       by default'''
+    return str(_get_config(PARSER_BATCH_EXECUTE, '')).lower() not in \
+                                                ('0', 'false', 'no', 'off')
+
+
+def _default_connection(device):
+    '''return the default connection of a pyATS device, or None'''
+    try:
+        return device.connectionmgr.connections.get(
+            device.default_connection_alias)
+    except Exception:
+        return None
+
+
+def _is_instance(obj, module, name):
+    '''isinstance() of a class which is only imported when its package is
+       installed'''
+    try:
+        cls = getattr(__import__(module, fromlist=[name]), name)
+    except ImportError:
+        return False
+    return isinstance(obj, cls)
+
+
+def _split_outputs(commands, result):
+    '''map the result of a unicon execute() of a list of commands back to
+       the commands, or return None when it cannot be'''
+    if not isinstance(result, dict):
+        # a single command was executed, possibly several times
+        if len(set(commands)) != 1:
+            return None
+        result = {commands[0]: result}
+
+    # the outputs of a repeated command are listed in order
+    pending = {command: list(output) for command, output in result.items()
+               if isinstance(output, list)}
+    outputs = []
+    for command in commands:
+        if command in pending:
+            outputs.append(pending[command].pop(0)
+                           if pending[command] else '')
+        else:
+            outputs.append(result.get(command, ''))
+    return outputs
+
+
+def execute_commands(device, commands):
+    '''Execute the commands a parser fans out to, such as one per vrf or
+       interface, and return their outputs in the order of the commands.
+
+       When the default connection of the device is a connection pool, the
+       commands run concurrently over its workers. When it is a unicon
+       connection, they are sent in a single execute() call on the session.
+       Otherwise, such as for a mocked device, each command goes through
+       device.execute() in turn.
+
+       The batch can be disabled with the genie.libs.parser.batch_execute
+       pyATS configuration key, or the GENIE_LIBS_PARSER_BATCH_EXECUTE
+       environment variable, set to 'false'.
+
+        Args:
+            device (`Device`): device to execute the commands on
+            commands (`list`): commands to execute
+
+        Returns:
+            list of `str`
+
+        example:
+
+            >>> vrfs = ['VRF1', 'VRF2']
+            >>> outputs = execute_commands(
+            ...     device, ['show running-config vrf ' + v for v in vrfs])
+            >>> for vrf, out in zip(vrfs, outputs):
+            ...     ...
+    '''
+    commands = list(commands)
+    if len(commands) > 1 and _is_batch_execute():
+        connection = _default_connection(device)
+
+        if _is_instance(connection, 'pyats.connections.pool',
+                        'ConnectionPool'):
+            workers = min(len(commands), getattr(connection, 'size', 1) or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                if contextvars is None:
+                    return list(executor.map(device.execute, commands))
+                # the commands are executed in the context of the parser,
+                # such as its timings
+                contexts = [contextvars.copy_context() for _ in commands]
+                return list(executor.map(
+                    lambda context, command: context.run(device.execute,
+                                                         command),
+                    contexts, commands))
+
+        if _is_instance(connection, 'unicon.bases.connection', 'Connection'):
+            outputs = _split_outputs(commands, device.execute(commands))
+            if outputs is not None:
+                return outputs
+
+    return [device.execute(command) for command in commands]
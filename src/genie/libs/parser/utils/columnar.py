@@ -0,0 +1,240 @@
+'''Export parsed results as columns, one row per record'''
+
+import array
+
+from genie.metaparser.util.schemaengine import Schema, Any, Use
+
+from .schema import ListOfDicts
+
+# compiled plans, by id of their schema, with the schema kept alive so its id
+# is not reused
+_plans = {}
+
+
+class _Node(object):
+    '''Plan of a dictionary of the schema
+
+        leaves: (key, column) of the values
+        fixed: (key, node) of the nested dictionaries with fixed keys
+        dynamic: (key column, node or value column) of the dictionaries with
+                 any keys, and their literal keys to skip
+        records: (key, key column, node) of the lists of dictionaries
+        span: columns of the node and all its descendants
+    '''
+
+    __slots__ = ('leaves', 'fixed', 'dynamic', 'literals', 'records', 'span')
+
+    def __init__(self):
+        self.leaves = []
+        self.fixed = []
+        self.dynamic = None
+        self.literals = set()
+        self.records = []
+        self.span = []
+
+
+class _Plan(object):
+
+    def __init__(self, schema):
+        self.names = []
+        self.root = self._compile(schema, ())
+
+    def _column(self, path):
+        self.names.append('.'.join(path))
+        return len(self.names) - 1
+
+    def _compile(self, schema, path):
+        node = _Node()
+        start = len(self.names)
+        for key, value in schema.items():
+            literal = _literal(key)
+            if literal is None:
+                if node.dynamic is not None:
+                    # a second dynamic key shares the first one's columns
+                    continue
+                key_path = path + ('*',)
+                key_column = self._column(key_path)
+                if isinstance(value, dict):
+                    child = self._compile(value, key_path)
+                else:
+                    child = self._column(key_path + ('value',))
+                node.dynamic = (key_column, child)
+                continue
+
+            node.literals.add(literal)
+            child_path = path + (literal,)
+            if isinstance(value, dict):
+                node.fixed.append((literal, self._compile(value, child_path)))
+            elif isinstance(value, Use) and \
+                    isinstance(value.schema, ListOfDicts):
+                key_column = self._column(child_path + ('*',))
+                child = self._compile(value.schema.schema,
+                                      child_path + ('*',))
+                node.records.append((literal, key_column, child))
+            else:
+                node.leaves.append((literal, self._column(child_path)))
+        node.span = list(range(start, len(self.names)))
+        return node
+
+
+def _literal(key):
+    '''the literal of a schema key, None for the keys matching any key'''
+    while isinstance(key, Schema) and not isinstance(key, Any):
+        key = key.schema
+    return key if isinstance(key, str) else None
+
+
+def _plan(schema):
+    try:
+        return _plans[id(schema)][1]
+    except KeyError:
+        plan = _Plan(schema)
+        _plans[id(schema)] = (schema, plan)
+        return plan
+
+
+def _set(node, data, row, collections):
+    '''set the values of node and of its fixed nested dictionaries in row,
+       add their collections of records to collections, and return whether
+       any value was set'''
+    found = False
+    for key, column in node.leaves:
+        if key in data:
+            row[column] = data[key]
+            found = True
+    for key, child in node.fixed:
+        value = data.get(key)
+        if isinstance(value, dict):
+            found = _set(child, value, row, collections) or found
+    if node.dynamic is not None:
+        items = [(key, value) for key, value in data.items()
+                 if key not in node.literals]
+        if items:
+            collections.append((node.dynamic, items))
+    for key, key_column, child in node.records:
+        value = data.get(key)
+        if isinstance(value, dict):
+            value = [value]
+        if isinstance(value, list) and value:
+            collections.append(((key_column, child), enumerate(value)))
+    return found
+
+
+def _walk(node, data, row, emit, force=True):
+    '''emit a row per record of data, or a single row for data without
+       records, and return the number of rows emitted'''
+    collections = []
+    found = _set(node, data, row, collections)
+    count = 0
+    for (key_column, child), items in collections:
+        for key, value in items:
+            row[key_column] = key
+            if isinstance(child, int):
+                row[child] = value
+                emit(row)
+                row[child] = None
+                count += 1
+                continue
+            if isinstance(value, dict):
+                count += _walk(child, value, row, emit)
+            else:
+                emit(row)
+                count += 1
+            for column in child.span:
+                row[column] = None
+        row[key_column] = None
+    if not count and (force or found):
+        emit(row)
+        count = 1
+    return count
+
+
+def _to_array(values, arrays):
+    '''values as an array when all of them are numbers, else as they are'''
+    if not values or not all(type(value) in (int, float) for value in values):
+        return values
+    typecode = 'q' if all(type(value) is int for value in values) else 'd'
+    if arrays == 'numpy':
+        import numpy
+        return numpy.array(values, dtype='int64' if typecode == 'q'
+                                                 else 'float64')
+    try:
+        return array.array(typecode, values)
+    except OverflowError:
+        return values
+
+
+def to_columns(parsed, schema, arrays=None):
+    '''Flatten a parsed dictionary into columns, one row per record, such as
+       one per interface, for the data frames and time series stores.
+
+       The columns are named after the path of their key in the schema, with
+       the keys matching any key as '*', and are the same for all the outputs
+       of a parser. The key of each record is in the column of its '*', and
+       the values of the enclosing dictionaries are repeated in each of their
+       records. A dictionary holding several collections of records has rows
+       for each of them, with the columns of the others left to None. The
+       lists of dictionaries validated with ListOfDicts are records too, the
+       index of each item in its list being its key.
+
+       The plan of the columns is compiled once per schema.
+
+        Args:
+            parsed (`dict`): result of the parser
+            schema (`dict`): schema of the parser, or the parser class
+            arrays (`str`): None to keep the columns as lists, 'array' for
+                            the columns of numbers as array.array, 'numpy'
+                            for them as numpy arrays
+
+        Returns:
+            `dict` of column name to its values, all of the same length
+
+        example:
+
+            >>> to_columns(parsed, ShowInterfaceStatus)
+            {'interfaces.*': ['Eth1/1', 'Eth1/2'],
+             'interfaces.*.name': [None, 'uplink'],
+             'interfaces.*.status': ['connected', 'notconnect'],
+             ...}
+    '''
+    if arrays not in (None, 'array', 'numpy'):
+        raise ValueError("arrays must be None, 'array' or 'numpy', "
+                         "not {!r}".format(arrays))
+    schema = getattr(schema, 'schema', schema)
+    plan = _plan(schema)
+    columns = [[] for _ in plan.names]
+
+    def emit(row):
+        for column, value in zip(columns, row):
+            column.append(value)
+
+    _walk(plan.root, parsed, [None] * len(columns), emit, force=False)
+
+    if arrays:
+        columns = [_to_array(values, arrays) for values in columns]
+    return dict(zip(plan.names, columns))
+
+
+class ColumnarParser(object):
+    '''Parser mixin adding parse_columns(), for the parsers of tables whose
+       results are exported as rows, such as to data frames or time series
+       stores.
+
+        example:
+
+            >>> class ShowArp(ColumnarParser, ShowArpSchema):
+            ...
+            >>> ShowArp(device=dev).parse_columns(arrays='numpy')
+    '''
+
+    def parse_columns(self, arrays=None, **kwargs):
+        '''Parse, and return the result as columns, see to_columns()
+
+            Args:
+                arrays (`str`): None, 'array' or 'numpy', see to_columns()
+                kwargs: the arguments of parse()
+
+            Returns:
+                `dict` of column name to its values
+        '''
+        return to_columns(self.parse(**kwargs), self.schema, arrays=arrays)
@@ -9,65 +9,225 @@ import math
 import logging
 import warnings
 import importlib
+import pkg_resources
+from json.decoder import JSONDecodeError
+
+from pyats.log.utils import banner
+from pyats.configuration import configuration as cfg
 
 from genie.libs import parser
 from genie.abstract import Lookup
 from genie.metaparser.util import merge_dict
 
-from pyats import configuration as cfg
 from .extension import ExtendParsers
 
 PYATS_EXT_PARSER = 'pyats.libs.external.parser'
+ENTRY_POINT_NAME = 'genie.libs.parser'
 
 log = logging.getLogger(__name__)
 
+try:
+    from genie.libs.cisco.telemetry import add_parser_usage_data
+    INTERNAL = True
+except:
+    INTERNAL = False
+
+
+class ParserNotFound(Exception):
+    '''raise exception if parser command is not found
+       first argument is parser class
+       second argument is token '''
+    def __init__(self, *args):
+        self.parser_command = args[0]
+        self.token = args[1]
+
+    def __str__(self):
+        return (
+            f"Could not find parser for {self.parser_command} under {self.token}"
+        )
+
+
+def deprecated_add_parser(parser, os_name):
+    """
+    *** DEPRECATED This is only here for backward compatibility ***
+
+    Dynamically add the parser class found in module `mod` for the given
+    network OS name `os_name`
+    Notes
+    -----
+    The parser class is presumed to have a class attribute `cli_command` which
+    is a list of command to add into the genie parser framework.
+    Parameters
+    ----------
+    parser : class
+        The parser class that implements a MetaParser
+    os_name : str
+        The NOS name for which the parser is supported, for example "nxos"
+    """
+    global parser_data
+
+    try:
+        parser_data = parser_data or {}
+    except NameError:
+        parser_data = {}
+
+    mod = sys.modules[parser.__module__]
+    module_name = mod.__name__.rsplit('.', 1)[-1]
+    package = mod.__package__
+
+    cli_commands = parser.cli_command
+    if isinstance(cli_commands, str):
+        cli_commands = [cli_commands]
+
+    for cmd in cli_commands:
+
+        if cmd not in parser_data:
+            parser_data[cmd] = {}
+            log.debug(f'Adding parser for command {cmd} os {os_name} '
+                      f'using {package}.{module_name}.{parser.__name__}')
+        else:
+            log.warning(f'Overriding parser for command {cmd} os {os_name} '
+                        f'using {package}.{module_name}.{parser.__name__}')
+
+        parser_data[cmd][os_name] = {
+            'module_name': module_name,
+            'package': package,
+            'class': parser.__name__
+        }
+
+
+def deprecated_parser_loading(parser_package):
+    """
+    *** DEPRECATED This is only here for backward compatibility ***
+
+    Enables external packages to dynamically add parsers using the setuptools
+    entry_point mechanism.  The developer is required to add the following to
+    their setup() invocation:
+
+        setup(...
+            entry_points={
+                'genie.libs.parser': [
+                    "packagename = module.function"
+                ]
+            }
+        )
+
+    where <packagename> is the name of their specific package <module> is the
+    module within their package that contains the function <function> is a
+    callable that returns a dictionary of parsers
+
+    Notes
+    -----
+    The following is an example User provided function that returns a dictionary
+    of parser to be added into the genie framework.  The key is the os_name, for
+    example 'nxos', and the value is a list of MetaParser class definitions.
+
+        def add_my_parsers():
+            return {
+                'iosxe': [
+                    iosxe.show_interface_transceiver.ShowInterfaceTransceiver
+                ], 'nxos': [
+                    nxos.show_interface_transceiver.ShowInterfaceTransceiver
+                ]
+            }
+    """
+    parser_dict = parser_package()
+    for os_name, parser_list in parser_dict.items():
+        for parser in parser_list:
+            deprecated_add_parser(parser=parser, os_name=os_name)
+
+
 def _load_parser_json():
     '''get all parser data in json file'''
+
+    global parser_data
+
     try:
         mod = importlib.import_module('genie.libs.parser')
         parsers = os.path.join(mod.__path__[0], 'parsers.json')
     except Exception:
         parsers = ''
+
     if not os.path.isfile(parsers):
         log.warning('parsers.json does not exist, make sure you '
                     'are running with latest version of '
                     'genie.libs.parsers')
-        parser_data = {}
-    else:
+        return {}
+
+    try:
         # Open all the parsers in json file
         with open(parsers) as f:
-            parser_data = json.load(f)
+            try:
+                parser_data = json.load(f)
+            except JSONDecodeError:
+                log.error(
+                    banner(
+                        "parser json file could be corrupted. Please try 'make json'"
+                    ))
+                raise
+    except Exception:
+        log.error(f'Could not load parser json from file {parsers}',
+                    exc_info=True)
+        return {}
+
+    ext_parser_packages = []
+
+    ext_parser_package_conf = cfg.get(PYATS_EXT_PARSER)
+    if ext_parser_package_conf:
+        ext_parser_packages.append(cfg.get(PYATS_EXT_PARSER))
+
+    PYATS_EXT_PARSER_ENV_VAR = PYATS_EXT_PARSER.upper().replace('.', '_')
+    ext_parser_package_env = os.environ.get(PYATS_EXT_PARSER_ENV_VAR)
+    if ext_parser_package_env:
+        ext_parser_packages_from_env = ext_parser_package_env.split(',')
+        ext_parser_packages.extend(ext_parser_packages_from_env)
+
+    for ep in pkg_resources.iter_entry_points(ENTRY_POINT_NAME):
+        parser_package = ep.load()
+        if callable(parser_package):
+            log.warning(
+                f'{ep.name}: callable parser loading is deprecated. '
+                'Please create an abstracted package instead.')
+            deprecated_parser_loading(parser_package)
+        else:
+            ext_parser_packages.append(ep.module_name)
 
-        # check if provided external parser packages
-        ext_parser_package = cfg.get(PYATS_EXT_PARSER, None) or \
-            os.environ.get(PYATS_EXT_PARSER.upper().replace('.', '_'))
-        if ext_parser_package:
-            ext = ExtendParsers(ext_parser_package)
-            ext.extend()
+    log.debug(f'External parser packages: {ext_parser_packages}')
+    for ext_parser_package in ext_parser_packages:
+        log.debug(f'Extending {ext_parser_package}')
+        ext = ExtendParsers(ext_parser_package)
+        ext.extend()
 
-            ext.output.pop('tokens', None)
-            summary = ext.output.pop('extend_info', None)
+        # tokens are not used for lookup
+        ext.output.pop('tokens', [])
 
-            merge_dict(parser_data, ext.output, update=True)
-            log.warning("External parser counts: {}\nSummary:\n{}"
-                .format(len(summary), json.dumps(summary, indent=2)))
+        # extend_info is only used for summary information
+        summary = ext.output.pop('extend_info', None)
+
+        merge_dict(parser_data, ext.output, update=True)
+        log.debug("External parser {} count: {}\nSummary: {}\n".format(
+            ext_parser_package, len(summary),
+            json.dumps(summary, indent=2)))
 
     return parser_data
 
-# Parser within Genie
-parser_data = _load_parser_json()
 
-def get_parser_commands(device, data=parser_data):
+def get_parser_commands(device, data=None):
     '''Remove all commands which contain { as this requires
        extra kwargs which cannot be guessed dynamically
        Remove the ones that arent related to this os'''
 
-    commands = []
-    for command, values in data.items():
-        if '{' in command or command == 'tokens' or device.os not in values:
-            continue
-        commands.append(command)
-    return commands
+    if data is None:
+        try:
+            data = parser_data
+        except NameError:
+            data = _load_parser_json()
+
+    return [
+        command for command, values in data.items()
+        if '{' not in command and command != 'tokens' and device.os in values
+    ]
+
 
 def format_output(parser_data, tab=2):
     '''Format the parsed output in an aligned intended structure'''
@@ -75,21 +235,20 @@ def format_output(parser_data, tab=2):
     s = ['{\n']
     if parser_data is None:
         return parser_data
-    for k,v in sorted(parser_data.items()):
-        if isinstance(v, dict):
-            v = format_output(v, tab+2)
-        else:
-            v = repr(v)
-        s.append('%s%r: %s,\n' % ('  '*tab, k, v))
-    s.append('%s}' % ('  '*(tab-2)))
+    for k, v in sorted(parser_data.items()):
+        v = format_output(v, tab + 2) if isinstance(v, dict) else repr(v)
+        s.append('%s%r: %s,\n' % ('  ' * tab, k, v))
+    s.append('%s}' % ('  ' * (tab - 2)))
     return ''.join(s)
 
+
 def get_parser_exclude(command, device):
     try:
         return get_parser(command, device)[0].exclude
     except AttributeError:
         return []
 
+
 def get_parser(command, device, fuzzy=False):
     '''From a show command and device, return parser class and kwargs if any'''
 
@@ -101,7 +260,7 @@ def get_parser(command, device, fuzzy=False):
     lookup = Lookup.from_device(device, packages={'parser': parser})
     results = _fuzzy_search_command(command, fuzzy, device.os, order_list)
     valid_results = []
-    
+
     for result in results:
         found_command, data, kwargs = result
 
@@ -114,27 +273,52 @@ def get_parser(command, device, fuzzy=False):
                 data = data[token]
 
         try:
-            valid_results.append((found_command, 
-                                        _find_parser_cls(device, data), kwargs))
+            valid_results.append(
+                (found_command, _find_parser_cls(device, data), kwargs))
         except KeyError:
             # Case when the show command is only found under one of
             # the child level tokens
             continue
 
     if not valid_results:
-        raise Exception("Could not find parser for "
-                        "'{c}' under {l}".format(c=command, l=lookup._tokens))
+        '''result is not valid. raise custom ParserNotFound exception'''
+        raise ParserNotFound(command, lookup._tokens)
 
-    if not fuzzy:
-        return valid_results[0][1], valid_results[0][2]
+    # Try to add parser to telemetry data
+    if INTERNAL:
+        try:
+            # valid_results is a list of found parsers for a given show command
+            #  - first element in this list is the closest parser match found
+            #  - each element has the format (show command, class, kwargs)
+            # valid_results[0] is the best parser match
+            add_parser_usage_data(valid_results[0], device)
+        except Exception as e:
+            log.debug("Encountered an unexpected error while adding parser "
+                      "telemetry data: %s" % e)
 
+    if not fuzzy:
+        # valid_results is a list of found parsers for a given show command
+        #  - first element in this list is the closest parser match found
+        #  - each element has the format (show command, class, kwargs)
+        # valid_results[0][1] is the class of the best match
+        # valid_results[0][2] is a dict of parser kwargs
+        parser_class = valid_results[0][1]
+        parser_kwargs = valid_results[0][2]
+        log.debug(f'Parser class: {parser_class} arguments: {parser_kwargs}')
+        return parser_class, parser_kwargs
+
+    log.debug(f'Parser search results: {valid_results}')
     return valid_results
 
-def _fuzzy_search_command(search, fuzzy, os=None, order_list=None, 
-                                                                device=None):
+
+def _fuzzy_search_command(search,
+                          fuzzy,
+                          os=None,
+                          order_list=None,
+                          device=None):
     """ Find commands that match the search criteria.
 
-        Args: 
+        Args:
             search (`str`): the search query
             fuzzy (`bool`): whether or not fuzzy mode should be used
             os (`str`): the device os that the search space is limited to
@@ -144,16 +328,22 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
         Returns:
             list: the result of the search
     """
-    # Perfect match should return 
-    if search in parser_data:
-        return [(search, parser_data[search], {})]
+
+    try:
+        data = parser_data
+    except NameError:
+        data = _load_parser_json()
+
+    # Perfect match should return
+    if search in data:
+        return [(search, data[search], {})]
 
     # Preprocess if fuzzy
     if fuzzy:
         search = search.lstrip('^').rstrip('$').replace(r'\ ', ' ').replace(
             r'\-', '-').replace('\\"', '"').replace('\\,', ',').replace(
-            '\\\'', '\'').replace('\\*', '*').replace('\\:', ':').replace(
-            '\\^', '^').replace('\\/', '/')
+                '\\\'', '\'').replace('\\*', '*').replace('\\:', ':').replace(
+                    '\\^', '^').replace('\\/', '/')
 
     # Fix search to remove extra spaces
     search = ' '.join(filter(None, search.split()))
@@ -161,16 +351,15 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
     best_score = -math.inf
     result = []
 
-    for command, source in parser_data.items():
+    for command, source in data.items():
         # Tokens and kwargs parameter must be non reference
-        match_result = _matches_fuzzy(0, 0, tokens.copy(),
-                                                        command, {}, fuzzy)
+        match_result = _matches_fuzzy(0, 0, tokens.copy(), command, {}, fuzzy)
 
-        if match_result: 
+        if match_result:
             kwargs, score = match_result
-            
+
             if order_list and device and \
-                                getattr(device, order_list[0]) not in source:
+                    getattr(device, order_list[0]) not in source:
                 continue
 
             if os and os not in source:
@@ -195,26 +384,27 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
         # Check if the result regex match the search
         for instance in result:
             s = re.sub('{.*?}', '(.*)', instance[0])
-            p =re.compile(s)
+            p = re.compile(s)
             if p.match(search):
                 return [instance]
 
-        if len(set(re.sub('{.*?}', '---', instance[0]) 
-                                                for instance in result)) == 1:
+        if (len({re.sub('{.*?}', '---', instance[0])
+                 for instance in result}) == 1):
             return [result[0]]
         else:
             # Search is ambiguous
-            raise Exception("\nSearch for '" + search +  "' is ambiguous. " + 
+            raise Exception("\nSearch for '" + search + "' is ambiguous. " +
                             "Please be more specific in your keywords.\n\n" +
-                            "Results matched:\n" + '\n'.join(
-                                                '> ' + i[0] for i in result))
+                            "Results matched:\n" + '\n'.join('> ' + i[0]
+                                                             for i in result))
 
     return result
 
+
 def _is_regular_token(token):
     """ Checks if a token is regular (does not contain regex symbols).
 
-        Args: 
+        Args:
             token (`str`): the token to be tested
 
         Returns:
@@ -238,15 +428,22 @@ def _is_regular_token(token):
         candidate = candidate.replace(r'\|', '')
 
         token_is_regular = candidate.isalnum() or candidate == ''
-    
+
     return token_is_regular
 
-def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy, 
-                                            required_arguments=None, score=0):
+
+def _matches_fuzzy(i,
+                   j,
+                   tokens,
+                   command,
+                   kwargs,
+                   fuzzy,
+                   required_arguments=None,
+                   score=0):
     """ Compares between given tokens and command to see if they match.
 
-        Args: 
-            i (`int`): current end of tokens 
+        Args:
+            i (`int`): current end of tokens
             j (`int`): current index of command tokens
             tokens (`list`): the search tokens
             command (`str`): the command to be compared with
@@ -275,17 +472,12 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
         token_is_regular = True
 
         if fuzzy:
-            if token == '*':
-                # Special case for `show lldp entry *`
-                token_is_regular = True
-            else:
-                # Check if it is nonregex token
-                token_is_regular = _is_regular_token(token)
-
-            if token_is_regular: 
+            token_is_regular = True if token == '*' else _is_regular_token(
+                token)
+            if token_is_regular:
                 # Special case for `:\|Swap:`
                 token = token.replace(r'\|', '|')
-                
+
                 # Special case for command `vim-cmd vmsvc/snapshot.get {vmid}`
                 token = token.replace(r'\.', '.')
 
@@ -310,36 +502,37 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
                             end = re.escape(end)
 
                             # Find the argument using the escaped start and end
-                            kwargs[
-                                re.search('{(.*)}', command_token).groups()[0]
-                            ] = re.match('{}(.*){}'
-                                        .format(start, end), token).groups()[0]
+                            kwargs[re.search(
+                                '{(.*)}',
+                                command_token).groups()[0]] = re.match(
+                                    '{}(.*){}'.format(start, end),
+                                    token).groups()[0]
 
                             is_found = True
                             score += 103
-                    
+
                     if not is_found:
                         return None
                 else:
-                    argument_key = re.search('{(.*)}', 
-                                                    command_token).groups()[0]
+                    argument_key = re.search('{(.*)}',
+                                             command_token).groups()[0]
                     i += 1
                     j += 1
-                    
+
                     # Plus 101 once to favor nongreedy argument fit
                     score += 100
 
                     # If argument is any of these, argument can only be 1 token
                     # Else argument can be up to 2 tokens
-                    endpoint = i + 1 \
-                        if argument_key == 'vrf' \
-                            or argument_key == 'rd' \
-                            or argument_key == 'instance' \
-                            or argument_key == 'vrf_type' \
-                            or argument_key == 'feature' \
-                            or argument_key == 'fileA' \
-                            or argument_key == 'fileB' \
-                        else i + 2
+                    endpoint = (i + 1 if argument_key in [
+                        'vrf',
+                        'rd',
+                        'instance',
+                        'vrf_type',
+                        'feature',
+                        'fileA',
+                        'fileB',
+                    ] else i + 2)
 
                     # Try out ways we can assign search tokens into argument
                     for index in range(i, endpoint):
@@ -347,40 +540,42 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
                             return None
 
                         # Make sure not to use regex expression as argument
-                        if index > i: 
-                            if fuzzy and not _is_regular_token(tokens[
-                                                                    index - 1]): 
-                                return None
+                        if (index > i and fuzzy
+                                and not _is_regular_token(tokens[index - 1])):
+                            return None
 
                         # Currently spanned argument
                         if 'match' in tokens or 'include' in tokens:
-                            argument_value = ' '.join(tokens[i - 1:index]).replace('\\', '')
+                            argument_value = ' '.join(
+                                tokens[i - 1:index]).replace('\\', '')
                         else:
-                            argument_value = ' '.join(tokens[i - 1:index]).rstrip(
-                                                            '"').replace('\\', '')
+                            argument_value = ' '.join(
+                                tokens[i - 1:index]).rstrip('"').replace(
+                                    '\\', '')
 
                         # argument_value = ' '.join(tokens[i - 1:index]).replace('\\', '')
-                        
+
                         # Delete the extra tokens if spanning more than one
                         tokens_copy = tokens[:i] + tokens[index:]
                         tokens_copy[i - 1] = command_token
                         kwargs_copy = kwargs.copy()
                         kwargs_copy.setdefault(argument_key, argument_value)
-                        
+
                         result = _matches_fuzzy(i, j, tokens_copy, command,
-                                kwargs_copy, fuzzy, required_arguments, score)
-                            
+                                                kwargs_copy, fuzzy,
+                                                required_arguments, score)
+
                         if result:
                             result_kwargs, score = result
 
                             if len(result_kwargs) == required_arguments:
-                                    return result_kwargs, score
+                                return result_kwargs, score
 
                     return None
             elif token == command_token:
                 # Same token, assign higher score
                 score += 102
-            elif not token == command_token:
+            else:
                 # Not matching, check if prefix
                 if not command_token.startswith(token):
                     return None
@@ -405,113 +600,113 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
             # Match current span with command
             test = re.match(' '.join(tokens[:i + 1]), command)
 
-            if test:
-                # Perform command token lookahead
-                _, end = test.span()
-
-                # Expression matches command to end
-                if i + 1 == len(tokens) and end == len(command): 
-                    # Return result if from start to end there are no arguments
-                    if all(not '{' in ct for ct in command_tokens[j:]):
-                        return kwargs, score
-                    else: 
-                        # Else in range we have another unspecified argument
-                        return None
+            if not test:
+                # Failed to match fuzzy
+                return None
 
-                if end == 0: 
-                    # If regex matched nothing, we stop because
-                    # expression = "d? a b c" search in "a b c"
-                    # expression = "a b d? c" search in "a b c"
-                    return None
+            # Perform command token lookahead
+            _, end = test.span()
 
-                # Span single command token
-                if abs(
-                    end - sum(len(ct) for ct in command_tokens[:j + 1]) - j
-                ) <= 1:
-                    if not '{' in command_token:
-                        # Span single token if it is not argument
-                        i += 1
-                        j += 1
-
-                        continue
-                    else:
-                        # Faulty match
-                        return None
+            # Expression matches command to end
+            if i + 1 == len(tokens) and end == len(command):
+                # Return result if from start to end there are no arguments
+                if all('{' not in ct for ct in command_tokens[j:]):
+                    return kwargs, score
                 else:
-                    # Span multiple command tokens
-                    # Find which command token it spans up to
-                    current_sum = 0
-                    token_end = 0
-
-                    while current_sum + len(command_tokens[token_end]) <= end:
-                        current_sum += len(command_tokens[token_end])
-                        
-                        if current_sum < end:
-                            # Account for space 
-                            current_sum += 1
-                            token_end += 1
-                        else:
-                            break
+                    # Else in range we have another unspecified argument
+                    return None
 
-                    # Incrememt token index
-                    i += 1
-                
-                    # For matched range, perform submatches on next real token
-                    for subindex in range(j + skipped, token_end + 1):
-                        # Make sure items are passed by copies, not by reference
-                        submatch_result = _matches_fuzzy(i, subindex, 
-                            tokens.copy(), command, kwargs.copy(),
-                                            fuzzy, required_arguments, score)
-                        
-                        # If any match is found, return true
-                        if submatch_result:
-                            result_kwargs, score = submatch_result
-
-                            # Result kwargs must match 
-                            # number of arguments this command requires
-                            if required_arguments == len(result_kwargs):
-                                return result_kwargs, score
+            if end == 0:
+                # If regex matched nothing, we stop because
+                # expression = "d? a b c" search in "a b c"
+                # expression = "a b d? c" search in "a b c"
+                return None
 
-                    # Fail to match
+                # Span single command token
+            if abs(end - sum(len(ct)
+                             for ct in command_tokens[:j + 1]) - j) <= 1:
+                if '{' in command_token:
+                    # Faulty match
                     return None
+                # Span single token if it is not argument
+                i += 1
+                j += 1
+
+                continue
             else:
-                # Failed to match fuzzy
-                return None
+                # Span multiple command tokens
+                # Find which command token it spans up to
+                current_sum = 0
+                token_end = 0
+
+                while current_sum + len(command_tokens[token_end]) <= end:
+                    current_sum += len(command_tokens[token_end])
+
+                    if current_sum >= end:
+                        break
 
+                    # Account for space
+                    current_sum += 1
+                    token_end += 1
+                # Incrememt token index
+                i += 1
+
+                # For matched range, perform submatches on next real token
+                for subindex in range(j + skipped, token_end + 1):
+                    # Make sure items are passed by copies, not by reference
+                    submatch_result = _matches_fuzzy(i, subindex,
+                                                     tokens.copy(), command,
+                                                     kwargs.copy(), fuzzy,
+                                                     required_arguments, score)
+
+                    # If any match is found, return true
+                    if submatch_result:
+                        result_kwargs, score = submatch_result
+
+                        # Result kwargs must match
+                        # number of arguments this command requires
+                        if required_arguments == len(result_kwargs):
+                            return result_kwargs, score
+
+                # Fail to match
+                return None
     # Reached end of tokens
     if len(command_tokens) == j:
         # If command pointer is at end then it matches
         return kwargs, score
-    else: 
+    else:
         # It doesn't match
         return None
 
 
 def _find_parser_cls(device, data):
-    lookup = Lookup.from_device(device, packages={'parser':importlib.import_module(data['package'])})
+    lookup = Lookup.from_device(
+        device, packages={'parser': importlib.import_module(data['package'])})
 
     return getattr(getattr(lookup.parser, data['module_name']), data['class'])
 
 
-class Common():
+class Common:
     '''Common functions to be used in parsers.'''
-
     @classmethod
     def regexp(self, expression):
         def match(value):
             if re.match(expression, value):
                 return value
             else:
-                raise TypeError("Value '%s' doesnt match regex '%s'"
-                                % (value, expression))
+                raise TypeError("Value '%s' doesnt match regex '%s'" %
+                                (value, expression))
+
         return match
 
     @classmethod
-    def convert_intf_name(self, intf):
+    def convert_intf_name(self, intf, os='generic', ignore_case=False):
         '''return the full interface name
 
             Args:
                 intf (`str`): Short version of the interface name
+                os (`str`): picks what operating system the interface needs to be translated for.
+                ignore_case (`bool`): Case in-sensitive matching of names
 
             Returns:
                 Full interface name fit the standard
@@ -524,55 +719,141 @@ class Common():
                 >>> convert_intf_name(intf='Eth2/1')
         '''
 
-        # Please add more when face other type of interface
-        convert = {'Eth': 'Ethernet',
-                   'Lo': 'Loopback',
-                   'lo': 'Loopback',
-                   'Fa': 'FastEthernet',
-                   'Fas': 'FastEthernet',
-                   'Po': 'Port-channel',
-                   'PO': 'Port-channel',
-                   'Null': 'Null',
-                   'Gi': 'GigabitEthernet',
-                   'Gig': 'GigabitEthernet',
-                   'GE': 'GigabitEthernet',
-                   'Te': 'TenGigabitEthernet',
-                   'Ten': 'TenGigabitEthernet',
-                   'Tw': 'TwoGigabitEthernet',
-                   'Two': 'TwoGigabitEthernet',
-                   'Twe': 'TwentyFiveGigE',
-                   'mgmt': 'mgmt',
-                   'Vl': 'Vlan',
-                   'Tu': 'Tunnel',
-                   'Fe': '',
-                   'Hs': 'HSSI',
-                   'AT': 'ATM',
-                   'Et': 'Ethernet',
-                   'BD': 'BDI',
-                   'Se': 'Serial',
-                   'Fo': 'FortyGigabitEthernet',
-                   'For': 'FortyGigabitEthernet',
-                   'Hu': 'HundredGigE',
-                   'Hun': 'HundredGigE',
-                   'vl': 'vasileft',
-                   'vr': 'vasiright',
-                   'BE': 'Bundle-Ether'
-                   }
-        m = re.search(r'([a-zA-Z]+)', intf) 
-        m1 = re.search(r'([\d\/\.]+)', intf)
+        # takes in the words preceding a digit e.g. the Ge in Ge0/0/1
+        m = re.search(r'([-a-zA-Z]+)', intf)
+        # takes in everything after the first encountered digit, e.g. the 0/0/1 in Ge0/0/1
+        m1 = re.search(r'(\d[\w./]*)', intf)
+
+        # checks if an interface has both Ge and 0/0/1 in the example of Ge0/0/1
         if hasattr(m, 'group') and hasattr(m1, 'group'):
+            # fetches the interface type
             int_type = m.group(0)
+
+            # fetch the interface number
             int_port = m1.group(0)
-            if int_type in convert.keys():
-                return(convert[int_type] + int_port)
+
+            # Please add more when face other type of interface
+            convert = {
+                'generic':
+                # generic keys for when no OS detected
+                {
+                    'Eth': 'Ethernet',
+                    'Lo': 'Loopback',
+                    'lo': 'Loopback',
+                    'Fa': 'FastEthernet',
+                    'Fas': 'FastEthernet',
+                    'Po': 'Port-channel',
+                    'PO': 'Port-channel',
+                    'Null': 'Null',
+                    'Gi': 'GigabitEthernet',
+                    'Gig': 'GigabitEthernet',
+                    'GE': 'GigabitEthernet',
+                    'Te': 'TenGigabitEthernet',
+                    'Ten': 'TenGigabitEthernet',
+                    'Tw': 'TwoGigabitEthernet',
+                    'Two': 'TwoGigabitEthernet',
+                    'Twe': 'TwentyFiveGigE',
+                    'Fi': 'FiveGigabitEthernet',
+                    'Fiv': 'FiveGigabitEthernet',
+                    'Fif': 'FiftyGigE',
+                    'Fifty': 'FiftyGigabitEthernet',
+                    'mgmt': 'mgmt',
+                    'Vl': 'Vlan',
+                    'Tu': 'Tunnel',
+                    'Fe': '',
+                    'Hs': 'HSSI',
+                    'AT': 'ATM',
+                    'Et': 'Ethernet',
+                    'BD': 'BDI',
+                    'Se': 'Serial',
+                    'Fo': 'FortyGigabitEthernet',
+                    'For': 'FortyGigabitEthernet',
+                    'Hu': 'HundredGigE',
+                    'Hun': 'HundredGigE',
+                    'TwoH': 'TwoHundredGigabitEthernet',
+                    'Fou': 'FourHundredGigE',
+                    'vl': 'vasileft',
+                    'vr': 'vasiright',
+                    'BE': 'Bundle-Ether',
+                    'tu': 'Tunnel',
+                    'M-E': 'M-Ethernet',  # comware
+                    'BAGG': 'Bridge-Aggregation',  # comware
+                    'Ten-GigabitEthernet': 'TenGigabitEthernet',  # HP
+                    'Wl': 'Wlan-GigabitEthernet',
+                    'Di': 'Dialer',
+                    'Vi': 'Virtual-Access',
+                    'Ce': 'Cellular',
+                    'Vp': 'Virtual-PPP',
+                    'pw': 'pseudowire'
+                },
+                'iosxr':
+                # interface formats specific to iosxr
+                {
+                    'BV': 'BVI',
+                    'BE': 'Bundle-Ether',
+                    'BP': 'Bundle-POS',
+                    'Eth': 'Ethernet',
+                    'Fa': 'FastEthernet',
+                    'Gi': 'GigabitEthernet',
+                    'Te': 'TenGigE',
+                    'Tf': 'TwentyFiveGigE',
+                    'Fo': 'FortyGigE',
+                    'Fi': 'FiftyGigE',
+                    'Hu': 'HundredGigE',
+                    'Th': 'TwoHundredGigE',
+                    'Fh': 'FourHundredGigE',
+                    'Tsec': 'tunnel-ipsec',
+                    'Ti': 'tunnel-ip',
+                    'Tm': 'tunnel-mte',
+                    'Tt': 'tunnel-te',
+                    'Tp': 'tunnel-tp',
+                    'IMA': 'IMA',
+                    'IL': 'InterflexLeft',
+                    'IR': 'InterflexRight',
+                    'Lo': 'Loopback',
+                    'Mg': 'MgmtEth',
+                    'Ml': 'Multilink',
+                    'Nu': 'Null',
+                    'POS': 'POS',
+                    'Pw': 'PW-Ether',
+                    'Pi': 'PW-IW',
+                    'SRP': 'SRP',
+                    'Se': 'Serial',
+                    'CS': 'CSI',
+                    'G0': 'GCC0',
+                    'G1': 'GCC1',
+                    'nG': 'nVFabric-GigE',
+                    'nT': 'nVFabric-TenGigE',
+                    'nF': 'nVFabric-FortyGigE',
+                    'nH': 'nVFabric-HundredGigE'
+                }
+            }
+
+            try:
+                os_type_dict = convert[os]
+            except KeyError as k:
+                log.error((
+                    "Check '{}' is in convert dict in utils/common.py, otherwise leave blank.\nMissing key {}\n"
+                    .format(os, k)))
+                return intf
+
+            if ignore_case:
+                mapping = {k.lower():v for k,v in os_type_dict.items()}
+                name = int_type.lower()
+                if name in mapping:
+                    return mapping[name] + int_port
+                else:
+                    return intf[0].capitalize() + intf[1:].replace(
+                        ' ', '').replace('ethernet', 'Ethernet')
             else:
-                # Unifying interface names
-                converted_intf = intf[0].capitalize()+intf[1:].replace(
-                    ' ','').replace('ethernet', 'Ethernet')
-                return(converted_intf)
-        else:
-            return(intf)
+                if int_type in os_type_dict.keys():
+                    return os_type_dict[int_type] + int_port
+                else:
+                    return intf[0].capitalize() + intf[1:].replace(
+                        ' ', '').replace('ethernet', 'Ethernet')
 
+        else:
+            return intf
 
     @classmethod
     def retrieve_xml_child(self, root, key):
@@ -598,10 +879,8 @@ class Common():
         for item in root:
             if key in item.tag:
                 return item
-            else:
-                root = item
-                return self.retrieve_xml_child(root, key)
-
+            root = item
+            return self.retrieve_xml_child(root, key)
 
     @classmethod
     def compose_compare_command(self, root, namespace, expect_command):
@@ -630,7 +909,7 @@ class Common():
                         expect_command='show bgp all dampening flap-statistics')
         '''
         # get to data node
-        cmd_node = root.getchildren()[0]
+        cmd_node = list(root)[0]
         # compose command from element tree
         # ex.  <nf:data>
         #        <show>
@@ -643,7 +922,7 @@ class Common():
         while True:
             # get next node
             try:
-                cmd_node = cmd_node.getchildren()
+                cmd_node = list(cmd_node)
                 if len(cmd_node) == 1:
 
                     # when only have one child
@@ -657,15 +936,15 @@ class Common():
 
                 elif len(cmd_node) > 1:
 
-                   # <__XML__PARAM__interface>
-                   #   <__XML__value>loopback100</__XML__value>
-                   #   <vrf>
-                   for item in cmd_node:
-                       if '__XML__value' in item.tag:
-                           cli += ' ' + item.text
-                       else:
-                           cmd_node = item
-                           break
+                    # <__XML__PARAM__interface>
+                    #   <__XML__value>loopback100</__XML__value>
+                    #   <vrf>
+                    for item in cmd_node:
+                        if '__XML__value' in item.tag:
+                            cli += ' ' + item.text
+                        else:
+                            cmd_node = item
+                            break
                 else:
                     break
             except Exception:
@@ -675,29 +954,27 @@ class Common():
             tag = cmd_node.tag.replace(namespace, '')
 
             # __readonly__ is the end of the command
-            if '__readonly__' not in tag:
-                if '__XML__PARAM__' not in tag and \
-                   '__XML__value' not in tag and \
-                   'TABLE' not in tag:
-                    cli += ' ' + tag
-            else:
+            if '__readonly__' in tag:
                 break
 
+            if '__XML__PARAM__' not in tag and \
+                    '__XML__value' not in tag and \
+                    'TABLE' not in tag:
+                cli += ' ' + tag
             # if there is no __readonly__ but the command has outputs
             # should be warining
             if 'TABLE' in tag:
-                warnings.warn('Tag "__readonly__" should exsist in output when '
-                              'there are actual values in output')
+                warnings.warn(
+                    'Tag "__readonly__" should exsist in output when '
+                    'there are actual values in output')
                 break
 
         cli = cli.strip()
         # compare the commands
         assert cli == expect_command, \
-            'Cli created from XML tags does not match the actual cli:\n'\
+            'Cli created from XML tags does not match the actual cli:\n' \
             'XML Tags cli: {c}\nCli command: {e}'.format(c=cli, e=expect_command)
 
-
-
     @classmethod
     def convert_xml_time(self, xml_time):
         '''Convert xml time "PT1H4M41S" to normal time "01:04:41"
@@ -718,24 +995,26 @@ class Common():
         '''
         # P4DT12M38S
         # PT1H4M41S
-        p = re.compile(r'^P((?P<day>\d+)D)?T((?P<hour>\d+)H)?((?P<minute>\d+)M)?((?P<second>\d+)S)?$')
+        p = re.compile(
+            r'^P((?P<day>\d+)D)?T((?P<hour>\d+)H)?((?P<minute>\d+)M)?((?P<second>\d+)S)?$'
+        )
         m = p.match(xml_time)
         if m:
             day = m.groupdict()['day']
             hour = m.groupdict()['hour']
             hour = 0 if not hour else int(hour)
             minute = m.groupdict()['minute']
-            minute = 0 if not  minute else int(minute)
+            minute = 0 if not minute else int(minute)
             second = m.groupdict()['second']
-            second = 0 if not  second else int(second)
+            second = 0 if not second else int(second)
 
             if day:
-                standard_time = "{d}d{h}h".format(d=day, h="%02d"% (hour))
+                standard_time = "{d}d{h}h".format(d=day, h="%02d" % (hour))
             else:
                 standard_time = ''
-                standard_time += format("%02d"% (hour))
-                standard_time += ' ' + format("%02d"% (minute))
-                standard_time += ' ' +  format("%02d"% (second))
+                standard_time += format("%02d" % (hour))
+                standard_time += ' ' + format("%02d" % (minute))
+                standard_time += ' ' + format("%02d" % (second))
 
                 standard_time = ':'.join(standard_time.strip().split())
         else:
@@ -743,7 +1022,6 @@ class Common():
             standard_time = xml_time
         return standard_time
 
-
     @classmethod
     def find_keys(self, key, dictionary):
         '''
@@ -758,13 +1036,10 @@ class Common():
             if k == key:
                 yield v
             elif isinstance(v, dict):
-                for result in self.find_keys(key, v):
-                    yield result
+                yield from self.find_keys(key, v)
             elif isinstance(v, list):
                 for d in v:
-                    for result in self.find_keys(key, d):
-                        yield result
-
+                    yield from self.find_keys(key, d)
 
     @classmethod
     def combine_units_of_time(self, hours=None, minutes=None, seconds=None):
@@ -809,7 +1084,4 @@ class Common():
         if final_hours <= 9:
             final_hours = "0{}".format(final_hours)
 
-        normal_time = "{}:{}:{}".format(final_hours, final_minutes,
-                                        final_seconds)
-
-        return normal_time
+        return "{}:{}:{}".format(final_hours, final_minutes, final_seconds)
@@ -0,0 +1,719 @@
+'''Route each output line to the regular expressions which can match it'''
+
+# python
+import re
+import functools
+
+try:
+    # python 3.11+
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+from .common import _get_config
+
+PARSER_LINE_DISPATCH = 'genie.libs.parser.line_dispatch'
+PARSER_ADAPTIVE_DISPATCH = 'genie.libs.parser.adaptive_dispatch'
+
+
+def _is_line_dispatch():
+    '''whether parsers route lines to their candidate patterns, enabled by
+       default'''
+    return str(_get_config(PARSER_LINE_DISPATCH, '')).lower() not in \
+                                                ('0', 'false', 'no', 'off')
+
+
+def _is_adaptive_dispatch():
+    '''whether the dispatchers order the candidate patterns of the lines by
+       their hits, disabled by default'''
+    return str(_get_config(PARSER_ADAPTIVE_DISPATCH, '')).lower() in \
+                                                ('1', 'true', 'yes', 'on')
+
+
+# Lines are routed on their first character when it is ascii
+ASCII = [chr(i) for i in range(128)]
+
+_CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: re.compile(r'\d'),
+    sre_constants.CATEGORY_NOT_DIGIT: re.compile(r'\D'),
+    sre_constants.CATEGORY_SPACE: re.compile(r'\s'),
+    sre_constants.CATEGORY_NOT_SPACE: re.compile(r'\S'),
+    sre_constants.CATEGORY_WORD: re.compile(r'\w'),
+    sre_constants.CATEGORY_NOT_WORD: re.compile(r'\W'),
+}
+
+
+def literal_prefix(pattern):
+    '''Return the literal text every string matched by pattern.match()
+       starts with, or '' when the pattern can start with anything
+
+        Args:
+            pattern (`re.Pattern`): compiled regular expression
+
+        Returns:
+            str: literal prefix
+
+        example:
+
+            >>> literal_prefix(re.compile(r'^Hardware +is +(?P<type>.+)$'))
+            'Hardware '
+    '''
+    prefix = []
+    _literal_prefix(sre_parse.parse(pattern.pattern, pattern.flags),
+                    prefix, bool(pattern.flags & re.IGNORECASE))
+    return ''.join(prefix)
+
+
+def _literal_prefix(items, prefix, ignore_case):
+    '''Append the leading literal characters of parsed regex items to prefix.
+       Return True when all the items were consumed'''
+    for op, av in items:
+        if op is sre_constants.AT and not prefix and \
+                av in (sre_constants.AT_BEGINNING,
+                       sre_constants.AT_BEGINNING_STRING,
+                       sre_constants.AT_BEGINNING_LINE):
+            # match() is anchored anyway
+            continue
+        elif op is sre_constants.LITERAL:
+            char = chr(av)
+            if ignore_case and char.lower() != char.upper():
+                return False
+            prefix.append(char)
+        elif op is sre_constants.SUBPATTERN:
+            add_flags, del_flags, sub = av[-3], av[-2], av[-1]
+            if (add_flags | del_flags) & re.IGNORECASE:
+                return False
+            if not _literal_prefix(sub, prefix, ignore_case):
+                return False
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            # ' +' -> at least one space
+            min_, max_, sub = av
+            sub = list(sub)
+            if min_ < 1 or len(sub) != 1 or \
+                                        sub[0][0] is not sre_constants.LITERAL:
+                return False
+            if not _literal_prefix(sub * min_, prefix, ignore_case):
+                return False
+            if min_ != max_:
+                return False
+        else:
+            return False
+    return True
+
+
+def first_chars(pattern):
+    '''Return the ascii characters a string matched by pattern.match() can
+       start with, or None when unknown
+
+        Args:
+            pattern (`re.Pattern`): compiled regular expression
+
+        Returns:
+            set: ascii characters
+
+        example:
+
+            >>> sorted(first_chars(re.compile(r'^(?P<pkts>[0-9]+) +packets')))
+            ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9']
+    '''
+    chars = _first_chars(sre_parse.parse(pattern.pattern, pattern.flags))
+    if chars is not None and pattern.flags & re.IGNORECASE:
+        chars |= {char.swapcase() for char in chars}
+    return chars
+
+
+def _first_chars(items):
+    '''Possible first characters of parsed regex items, None if unknown'''
+    for op, av in items:
+        if op is sre_constants.AT and \
+                av in (sre_constants.AT_BEGINNING,
+                       sre_constants.AT_BEGINNING_STRING,
+                       sre_constants.AT_BEGINNING_LINE):
+            continue
+        elif op is sre_constants.LITERAL:
+            return {chr(av)}
+        elif op is sre_constants.NOT_LITERAL:
+            return set(ASCII) - {chr(av)}
+        elif op is sre_constants.ANY:
+            return set(ASCII)
+        elif op is sre_constants.IN:
+            return _in_chars(av)
+        elif op is sre_constants.SUBPATTERN:
+            add_flags, del_flags, sub = av[-3], av[-2], av[-1]
+            if (add_flags | del_flags) & re.IGNORECASE:
+                return None
+            return _first_chars(sub)
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            if av[0] < 1:
+                return None
+            return _first_chars(av[2])
+        elif op is sre_constants.BRANCH:
+            chars = set()
+            for branch in av[1]:
+                branch_chars = _first_chars(branch)
+                if branch_chars is None:
+                    return None
+                chars |= branch_chars
+            return chars
+        else:
+            return None
+    return None
+
+
+def _in_chars(items):
+    '''Ascii characters of a character set'''
+    chars = set()
+    negate = False
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            chars.add(chr(av))
+        elif op is sre_constants.RANGE:
+            chars.update(chr(i) for i in range(av[0], min(av[1], 127) + 1))
+        elif op is sre_constants.CATEGORY and av in _CATEGORIES:
+            chars.update(char for char in ASCII if _CATEGORIES[av].match(char))
+        else:
+            return None
+    if negate:
+        chars = set(ASCII) - chars
+    return chars
+
+
+def required_literal(pattern):
+    '''Return the longest literal text every string matched by
+       pattern.match() contains, besides its literal prefix
+
+        Args:
+            pattern (`re.Pattern`): compiled regular expression
+
+        Returns:
+            str: literal text, '' if none
+
+        example:
+
+            >>> required_literal(re.compile(
+            ...     r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+)'))
+            ' packets '
+    '''
+    if pattern.flags & re.IGNORECASE:
+        return ''
+    runs = [[]]
+    _required_literals(sre_parse.parse(pattern.pattern, pattern.flags), runs)
+    literals = [''.join(run) for run in runs]
+    if literal_prefix(pattern):
+        # already checked by the dispatcher trie
+        literals.pop(0)
+    return max(literals, key=len, default='')
+
+
+def _required_literals(items, runs):
+    '''Split parsed regex items into runs of contiguous literal characters
+       present in every match'''
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            runs[-1].append(chr(av))
+        elif op is sre_constants.SUBPATTERN:
+            add_flags, del_flags, sub = av[-3], av[-2], av[-1]
+            if (add_flags | del_flags) & re.IGNORECASE:
+                runs.append([])
+            else:
+                _required_literals(sub, runs)
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and \
+                len(av[2]) == 1 and av[2][0][0] is sre_constants.LITERAL:
+            # 'is +up' contains 'is ' and ' up'
+            min_, max_, sub = av
+            char = chr(sub[0][1])
+            runs[-1].extend(char * min_)
+            if min_ != max_:
+                runs.append([char] * min_)
+        elif op is sre_constants.AT and av in (
+                sre_constants.AT_BEGINNING, sre_constants.AT_BEGINNING_STRING,
+                sre_constants.AT_BEGINNING_LINE):
+            continue
+        else:
+            runs.append([])
+
+
+# Character sets of the automatons of patterns_overlap(): the characters of
+# the set, and whether it has non ascii characters it does not list
+_ANY_CHAR = (frozenset(ASCII), True)
+
+_CATEGORY_CHARS = {category: frozenset(char for char in ASCII
+                                       if regex.match(char))
+                   for category, regex in _CATEGORIES.items()}
+
+# Copies of a repeated item, the longer repeats being any number of them
+_MAX_COPIES = 8
+
+_REPEATS = tuple(getattr(sre_constants, name) for name in
+                 ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT')
+                 if hasattr(sre_constants, name))
+
+
+def _char_set(op, av, ignore_case):
+    '''The character set of a single character item, None if it is not
+       one'''
+    if op is sre_constants.LITERAL:
+        chars, other = {chr(av)}, False
+    elif op is sre_constants.NOT_LITERAL:
+        chars, other = set(ASCII) - {chr(av)}, True
+    elif op is sre_constants.ANY:
+        return _ANY_CHAR
+    elif op is sre_constants.IN:
+        chars, other, negate = set(), False, False
+        for item_op, item_av in av:
+            if item_op is sre_constants.NEGATE:
+                negate = True
+            elif item_op is sre_constants.LITERAL:
+                chars.add(chr(item_av))
+            elif item_op is sre_constants.RANGE:
+                chars.update(chr(i) for i in
+                             range(item_av[0], min(item_av[1], 127) + 1))
+                other = other or item_av[1] > 127
+            elif item_op is sre_constants.CATEGORY and \
+                    item_av in _CATEGORIES:
+                # \d and \w match non ascii digits and letters too
+                chars.update(_CATEGORY_CHARS[item_av])
+                other = True
+            else:
+                return _ANY_CHAR
+        if negate:
+            chars, other = set(ASCII) - chars, True
+    else:
+        return None
+    if ignore_case:
+        # the non ascii characters have other case foldings
+        chars |= {char.swapcase() for char in chars}
+        other = True
+    return frozenset(chars), other
+
+
+def _intersect(a, b):
+    '''whether two character sets have a character in common'''
+    if a[0] & b[0] or (a[1] and b[1]):
+        return True
+    return (a[1] and any(ord(char) > 127 for char in b[0])) or \
+        (b[1] and any(ord(char) > 127 for char in a[0]))
+
+
+class _Automaton(object):
+    '''Nondeterministic automaton of the strings a pattern.match() matches,
+       or of more of them, when the pattern has items such as lookaheads,
+       which are left out, or backreferences, which match anything'''
+
+    def __init__(self, pattern, flags):
+        # per state, the (character set, state) transitions, and the states
+        # reached without a character
+        self.edges = []
+        self.epsilons = []
+        self.start = self._state()
+        self.accept = self._items(
+            sre_parse.parse(pattern, flags), self.start,
+            bool(flags & re.IGNORECASE))
+        self.live = self._live()
+
+    def _state(self):
+        self.edges.append([])
+        self.epsilons.append([])
+        return len(self.edges) - 1
+
+    def _items(self, items, state, ignore_case):
+        for op, av in items:
+            state = self._item(op, av, state, ignore_case)
+        return state
+
+    def _item(self, op, av, state, ignore_case):
+        chars = _char_set(op, av, ignore_case)
+        if chars is not None:
+            end = self._state()
+            self.edges[state].append((chars, end))
+            return end
+
+        if op is sre_constants.SUBPATTERN:
+            add_flags, del_flags, sub = av[-3], av[-2], av[-1]
+            if add_flags & re.IGNORECASE:
+                ignore_case = True
+            elif del_flags & re.IGNORECASE:
+                ignore_case = False
+            return self._items(sub, state, ignore_case)
+
+        if op is getattr(sre_constants, 'ATOMIC_GROUP', None):
+            return self._items(av, state, ignore_case)
+
+        if op is sre_constants.BRANCH:
+            end = self._state()
+            for branch in av[1]:
+                start = self._state()
+                self.epsilons[state].append(start)
+                self.epsilons[self._items(branch, start, ignore_case)] \
+                    .append(end)
+            return end
+
+        if op in _REPEATS:
+            min_, max_, sub = av
+            for _ in range(min(min_, _MAX_COPIES)):
+                state = self._items(sub, state, ignore_case)
+            if min_ == max_ <= _MAX_COPIES:
+                return state
+            if max_ - min_ > _MAX_COPIES or min_ > _MAX_COPIES:
+                loop = self._state()
+                self.epsilons[state].append(loop)
+                self.epsilons[self._items(sub, loop, ignore_case)] \
+                    .append(loop)
+                return loop
+            end = self._state()
+            self.epsilons[state].append(end)
+            for _ in range(max_ - min_):
+                state = self._items(sub, state, ignore_case)
+                self.epsilons[state].append(end)
+            return end
+
+        if op in (sre_constants.AT, sre_constants.ASSERT,
+                  sre_constants.ASSERT_NOT):
+            return state
+
+        # backreferences and the other items: any string
+        loop = self._state()
+        self.epsilons[state].append(loop)
+        self.edges[loop].append((_ANY_CHAR, loop))
+        return loop
+
+    def _live(self):
+        '''the states from which the accepting state can be reached'''
+        sources = [[] for _ in self.edges]
+        for state, (edges, epsilons) in enumerate(zip(self.edges,
+                                                      self.epsilons)):
+            for target in epsilons + [target for _, target in edges]:
+                sources[target].append(state)
+        live = {self.accept}
+        todo = [self.accept]
+        while todo:
+            for source in sources[todo.pop()]:
+                if source not in live:
+                    live.add(source)
+                    todo.append(source)
+        return live
+
+
+@functools.lru_cache(maxsize=1024)
+def _automaton(pattern, flags):
+    return _Automaton(pattern, flags)
+
+
+def patterns_overlap(a, b):
+    '''Return whether a line can be matched by both a.match() and b.match(),
+       so that the order they are attempted in matters
+
+       The answer is True whenever the patterns are not proven disjoint, such
+       as for the patterns which cannot be analysed.
+
+        Args:
+            a (`re.Pattern`): compiled regular expression
+            b (`re.Pattern`): compiled regular expression
+
+        Returns:
+            bool
+
+        example:
+
+            >>> patterns_overlap(re.compile(r'^(?P<pkts>\\d+) +packets input'),
+            ...                  re.compile(r'^(?P<rate>\\d+) +minute'))
+            False
+    '''
+    try:
+        first = _automaton(a.pattern, a.flags)
+        second = _automaton(b.pattern, b.flags)
+    except Exception:
+        return True
+
+    # the pairs of states the same string leads to, until one of the
+    # patterns matches while the other still can
+    start = (first.start, second.start)
+    if first.start not in first.live or second.start not in second.live:
+        return False
+    seen = {start}
+    todo = [start]
+    while todo:
+        state_a, state_b = todo.pop()
+        if state_a == first.accept or state_b == second.accept:
+            return True
+        pairs = [(target, state_b) for target in first.epsilons[state_a]]
+        pairs.extend((state_a, target)
+                     for target in second.epsilons[state_b])
+        pairs.extend((target_a, target_b)
+                     for chars_a, target_a in first.edges[state_a]
+                     for chars_b, target_b in second.edges[state_b]
+                     if _intersect(chars_a, chars_b))
+        for pair in pairs:
+            if pair not in seen and pair[0] in first.live and \
+                    pair[1] in second.live:
+                seen.add(pair)
+                todo.append(pair)
+    return False
+
+
+class _PrefixNode(object):
+    '''Path compressed trie node, children maps the first character of an
+       edge to the (edge label, child node) and candidates holds the
+       (pattern, required literal) which can match a line ending the walk on
+       this node, in the dispatcher order. In adaptive mode, ranked holds
+       the (pattern, required literal, index in candidates) in the order
+       they are attempted, and hits the number of lines each candidate
+       matched'''
+
+    __slots__ = ('children', 'patterns', 'candidates', 'ranked', 'hits',
+                 'count', 'before')
+
+    def __init__(self):
+        self.children = {}
+        self.patterns = set()
+        self.candidates = ()
+        self.ranked = ()
+        self.hits = []
+        self.count = 0
+        # per candidate, the candidates before it which can match the same
+        # lines, computed when first ranked
+        self.before = None
+
+
+class LineDispatcher(object):
+    '''Route output lines to the regular expressions which can match them.
+
+       Parsers try their patterns one after the other on each line until one
+       matches, which costs a regex attempt per pattern on most lines. The
+       dispatcher indexes the patterns by their literal prefix ('Hardware '
+       for r'^Hardware +is +...') in a character trie, or by the characters
+       they can start with (digits for r'^(?P<pkts>\\d+) +packets'), so that
+       only the few patterns which can match a line are attempted.
+
+       match() returns the first pattern, in the dispatcher order, matching
+       the line. For a parser checking the same patterns in the same order,
+       and moving to the next line once one of them matched, reading
+       `found if pattern is self.p2 else None` instead of running
+       self.p2.match(line) gives the same result.
+
+       In adaptive mode, the candidates of the lines are attempted in the
+       order of the number of lines they matched so far, the most frequent
+       first, a pattern being moved before another one only when no line
+       can match both, so that the result is the same.
+
+        Args:
+            patterns (`list`): compiled regular expressions, in the order the
+                               parser checks them
+
+        example:
+
+            >>> dispatcher = LineDispatcher([p1, p2])
+            >>> for line in out.splitlines():
+            ...     line = line.strip()
+            ...     pattern, found = dispatcher.match(line)
+            ...
+            ...     m = found if pattern is p1 else None
+            ...     if m:
+            ...         ...
+            ...         continue
+            ...
+            ...     m = found if pattern is p2 else None
+            ...     if m:
+            ...         ...
+            ...         continue
+    '''
+
+    # Disabled with 'genie.libs.parser.line_dispatch: False' pyATS
+    # configuration or GENIE_LIBS_PARSER_LINE_DISPATCH=0, every pattern is
+    # then attempted in order
+    enabled = _is_line_dispatch()
+
+    # Enabled with 'genie.libs.parser.adaptive_dispatch: True' pyATS
+    # configuration or GENIE_LIBS_PARSER_ADAPTIVE_DISPATCH=1
+    adaptive = _is_adaptive_dispatch()
+
+    # lines matched by the candidates of a trie node between two rankings
+    rank_interval = 64
+
+    def __init__(self, patterns):
+        self.patterns = tuple(patterns)
+        self.order = {id(pattern): index
+                      for index, pattern in enumerate(self.patterns)}
+        self.literals = {id(pattern): required_literal(pattern)
+                         for pattern in self.patterns}
+        self.root = _PrefixNode()
+        anywhere = set()
+        by_first_char = {}
+
+        for pattern in self.patterns:
+            prefix = literal_prefix(pattern)
+            if prefix:
+                node = self.root
+                for char in prefix:
+                    node = node.children.setdefault(char, _PrefixNode())
+                node.patterns.add(pattern)
+                continue
+
+            # r'^(?P<in_pkts>[0-9]+) +packets' only for lines starting with
+            # a digit
+            chars = first_chars(pattern)
+            if chars is None:
+                anywhere.add(pattern)
+            else:
+                by_first_char[pattern] = chars
+
+        # Empty lines and lines starting with a non ascii character stop on
+        # the root
+        self.root.patterns = anywhere | set(by_first_char)
+        if by_first_char:
+            for char in ASCII:
+                node = self.root.children.setdefault(char, _PrefixNode())
+                node.patterns.update(pattern for pattern, chars
+                                     in by_first_char.items() if char in chars)
+
+        self._set_candidates(self.root, self.root.patterns)
+        # whether two patterns can match the same line, computed on demand
+        self._overlaps = {}
+        for child in self.root.children.values():
+            self._freeze(child, anywhere)
+        self._compress(self.root)
+
+    def _set_candidates(self, node, patterns):
+        node.candidates = tuple(
+            (pattern, self.literals[id(pattern)]) for pattern in
+            sorted(patterns, key=lambda pattern: self.order[id(pattern)]))
+        node.ranked = tuple((pattern, literal, index) for index,
+                            (pattern, literal) in enumerate(node.candidates))
+        node.hits = [0] * len(node.candidates)
+
+    def _freeze(self, node, reachable):
+        '''Compute the candidate patterns of each node'''
+        reachable = reachable | node.patterns
+        self._set_candidates(node, reachable)
+        for child in node.children.values():
+            self._freeze(child, reachable)
+
+    def _compress(self, node):
+        '''Merge the chains of nodes without patterns nor branches, a line
+           leaving the chain midway has the candidates of its first node'''
+        for char, child in list(node.children.items()):
+            label = char
+            while len(child.children) == 1 and not child.patterns:
+                (next_char, next_child), = child.children.items()
+                label += next_char
+                child = next_child
+            node.children[char] = (label, child)
+            self._compress(child)
+
+    def _node(self, line):
+        '''Walk the trie along line'''
+        node = self.root
+        pos = 0
+        while True:
+            edge = node.children.get(line[pos:pos + 1])
+            if edge is None or not line.startswith(edge[0], pos):
+                return node
+            pos += len(edge[0])
+            node = edge[1]
+
+    def candidates(self, line):
+        '''Return the patterns which can match line, in order'''
+        if not self.enabled:
+            return self.patterns
+        return tuple(pattern for pattern, _ in self._node(line).candidates)
+
+    def match(self, line):
+        '''Return the first pattern matching line and its match object,
+           (None, None) if none of them does'''
+        if not self.enabled:
+            for pattern in self.patterns:
+                m = pattern.match(line)
+                if m:
+                    return pattern, m
+            return None, None
+
+        if self.adaptive:
+            return self._match_ranked(line)
+
+        for pattern, literal in self._node(line).candidates:
+            # substring lookups are much cheaper than regex attempts
+            if literal in line:
+                m = pattern.match(line)
+                if m:
+                    return pattern, m
+        return None, None
+
+    def _match_ranked(self, line):
+        '''match() attempting the candidates in their ranked order'''
+        node = self._node(line)
+        for pattern, literal, index in node.ranked:
+            if literal in line:
+                m = pattern.match(line)
+                if m:
+                    node.hits[index] += 1
+                    node.count += 1
+                    if node.count % self.rank_interval == 0:
+                        self._rank(node)
+                    return pattern, m
+        return None, None
+
+    def _overlap(self, a, b):
+        key = (id(a), id(b))
+        try:
+            return self._overlaps[key]
+        except KeyError:
+            return self._overlaps.setdefault(key, patterns_overlap(a, b))
+
+    def _rank(self, node):
+        '''Order the candidates of a node by their hits, each one staying
+           after the candidates before it which can match the same lines'''
+        candidates = node.candidates
+        if node.before is None:
+            node.before = [
+                {before for before in range(index)
+                 if self._overlap(candidates[before][0], pattern)}
+                for index, (pattern, _) in enumerate(candidates)]
+        hits = node.hits
+        remaining = list(range(len(candidates)))
+        placed = set()
+        ranked = []
+        while remaining:
+            index = max((index for index in remaining
+                         if node.before[index] <= placed),
+                        key=lambda index: (hits[index], -index))
+            remaining.remove(index)
+            placed.add(index)
+            ranked.append(candidates[index] + (index,))
+        node.ranked = tuple(ranked)
+
+
+class ParserDispatcher(object):
+    '''Class attribute building the LineDispatcher of the given class
+       patterns of a parser on first access, per parser class
+
+        Args:
+            names (`str`): pattern attribute names, in the order the parser
+                           checks them
+
+        example:
+
+            >>> class ShowInterfaces(ShowInterfacesSchema):
+            ...     p1 = LazyPattern(r'^(?P<interface>\\S+) +is +...')
+            ...     p2 = LazyPattern(r'^Hardware +is +...')
+            ...     dispatcher = ParserDispatcher('p1', 'p2')
+            ...
+            ...     def cli(self, output=None):
+            ...         ...
+            ...         pattern, found = self.dispatcher.match(line)
+    '''
+
+    def __init__(self, *names):
+        self.names = names
+        self.dispatchers = {}
+
+    def __get__(self, instance, owner):
+        try:
+            return self.dispatchers[owner]
+        except KeyError:
+            dispatcher = LineDispatcher(getattr(owner, name)
+                                        for name in self.names)
+            return self.dispatchers.setdefault(owner, dispatcher)
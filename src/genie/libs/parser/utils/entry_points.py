@@ -37,7 +37,8 @@ import sys
 import pkg_resources
 import logging
 
-from .common import parser_data
+from .common import parser_data, invalidate_parser_lookup
+from .extension import load_scan_cache, save_scan_cache
 
 log = logging.getLogger(__name__)
 
@@ -65,11 +66,7 @@ def add_parser(parser, os_name):
     mod = sys.modules[parser.__module__]
     package = mod.__package__
 
-    cli_commands = parser.cli_command
-    if isinstance(cli_commands, str):
-        cli_commands = [cli_commands]
-
-    for cmd in cli_commands:
+    for cmd in _cli_commands(parser):
         if cmd not in parser_data:
             parser_data[cmd] = {}
 
@@ -79,9 +76,40 @@ def add_parser(parser, os_name):
             'class': parser.__name__
         }
 
+    invalidate_parser_lookup()
+
+
+def _cli_commands(parser):
+    cli_commands = parser.cli_command
+    if isinstance(cli_commands, str):
+        cli_commands = [cli_commands]
+    return cli_commands
+
+
+def load_entry_points(cache_dir=None):
+    """
+    Add the parsers of all the registered entry points
 
-def load_entry_points():
-    for ep in pkg_resources.iter_entry_points(ENTRY_POINT_NAME):
+    Parameters
+    ----------
+    cache_dir : str
+        When provided, the parser_data entries added are saved in this
+        directory and reused as long as the installed entry points and their
+        distribution versions are the same, without importing them
+    """
+    entry_points = list(pkg_resources.iter_entry_points(ENTRY_POINT_NAME))
+
+    if cache_dir:
+        signature = sorted('{} {}'.format(ep, ep.dist) for ep in entry_points)
+        cached = load_scan_cache(cache_dir, ENTRY_POINT_NAME, signature)
+        if cached is not None:
+            for cmd, entries in cached.items():
+                parser_data.setdefault(cmd, {}).update(entries)
+            invalidate_parser_lookup()
+            return
+
+    loaded = {}
+    for ep in entry_points:
         loader_function = ep.load()
         if not callable(loader_function):
             log.warning('unable to load parsers from entry point '
@@ -92,6 +120,14 @@ def load_entry_points():
         for os_name, parser_list in parser_dict.items():
             for parser in parser_list:
                 add_parser(parser=parser, os_name=os_name)
+                for cmd in _cli_commands(parser):
+                    loaded.setdefault(cmd, {})[os_name] = \
+                                                    parser_data[cmd][os_name]
+
+    if cache_dir:
+        save_scan_cache(cache_dir, ENTRY_POINT_NAME, signature, loaded)
 
 
-load_entry_points()
+# In lazy mode, entry points are loaded by parser_data.load_extensions
+if not parser_data.lazy:
+    load_entry_points()
@@ -0,0 +1,335 @@
+'''Timings of the parsers, per parser class and command
+
+Each parse is timed in phases: executing the commands on the device, parsing
+their output in cli() (or xml(), yang(), rest()), the parsers it calls, and
+validating the result against the schema. The size of the outputs and of the
+result are recorded with them, and aggregated per parser class and command
+executed.
+
+The instrumentation is enabled with enable_instrumentation(), or the
+genie.libs.parser.instrumentation configuration (or the
+GENIE_LIBS_PARSER_INSTRUMENTATION environment variable), the statistics being
+dumped as JSON to the file of genie.libs.parser.instrumentation_dump every
+genie.libs.parser.instrumentation_interval seconds when it is set. When it is
+not enabled, MetaParser.parse is the original one, so nothing is timed.
+'''
+
+import os
+import json
+import time
+import logging
+import tempfile
+import functools
+import threading
+import collections
+
+from genie.metaparser import MetaParser
+
+from .parse_cache import _context_var
+
+log = logging.getLogger(__name__)
+
+# phases of a parse, the total being the whole parse
+PHASES = ('execute', 'parse', 'nested', 'validate', 'total')
+
+# number of the last parses kept
+HISTORY_SIZE = 1000
+
+# seconds between the dumps of the statistics
+DUMP_INTERVAL = 60
+
+_original_parse = MetaParser.parse
+
+# parses in progress, innermost last
+_frames = _context_var('genie.libs.parser.instrumentation', ())
+
+_lock = threading.Lock()
+# aggregates per (parser, command)
+_stats = {}
+_history = collections.deque(maxlen=HISTORY_SIZE)
+_dump = None
+
+
+class _Frame(object):
+    '''a parse in progress'''
+
+    __slots__ = ('command', 'execute', 'method', 'nested', 'output_bytes',
+                 'output_lines')
+
+    def __init__(self):
+        self.command = None
+        self.execute = 0.0
+        self.method = 0.0
+        self.nested = 0.0
+        self.output_bytes = 0
+        self.output_lines = 0
+
+    def add_output(self, output):
+        if isinstance(output, dict):
+            # several commands executed at once
+            for value in output.values():
+                self.add_output(value)
+        elif isinstance(output, (list, tuple)):
+            for value in output:
+                self.add_output(value)
+        elif isinstance(output, str) and output:
+            self.output_bytes += len(output.encode('utf-8', 'replace'))
+            self.output_lines += output.count('\n') + 1
+
+
+class _TimedDevice(object):
+    '''the device of the instrumented parsers, timing execute() for the
+       innermost parse, all the other attributes being the device's
+
+       The device is its __wrapped__, as for functools.wraps, so that the
+       caches keyed by the device are the same with or without it.'''
+
+    def __init__(self, device):
+        object.__setattr__(self, '_device', device)
+        object.__setattr__(self, '__wrapped__', device)
+
+    def __getattr__(self, name):
+        return getattr(self._device, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._device, name, value)
+
+    def __repr__(self):
+        return repr(self._device)
+
+    def execute(self, command, *args, **kwargs):
+        start = time.perf_counter()
+        output = self._device.execute(command, *args, **kwargs)
+        elapsed = time.perf_counter() - start
+        frames = _frames.get()
+        if frames:
+            frame = frames[-1]
+            with _lock:
+                frame.execute += elapsed
+                frame.add_output(output)
+                if frame.command is None:
+                    frame.command = command if isinstance(command, str) \
+                        else '; '.join(command)
+        return output
+
+
+def _timed_device(device):
+    if device is None or isinstance(device, _TimedDevice):
+        return device
+    return _TimedDevice(device)
+
+
+def _timed_method(method, frame):
+    @functools.wraps(method)
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            frame.method += time.perf_counter() - start
+    return timed
+
+
+def _result_size(value):
+    '''number of the keys and items of a result'''
+    if isinstance(value, dict):
+        return sum(1 + _result_size(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(1 + _result_size(item) for item in value)
+    return 0
+
+
+def _instrumented_parse(self, *args, **kwargs):
+    frame = _Frame()
+    parents = _frames.get()
+    token = _frames.set(parents + (frame,))
+    device = self.__dict__.get('device')
+    self.device = _timed_device(device)
+    for context in MetaParser.CONTEXT_LIST:
+        method = getattr(self, context, None)
+        if method is not None:
+            self.__dict__[context] = _timed_method(method, frame)
+    if isinstance(kwargs.get('output'), str):
+        frame.add_output(kwargs['output'])
+
+    result = None
+    error = None
+    start = time.perf_counter()
+    try:
+        result = _original_parse(self, *args, **kwargs)
+        return result
+    except Exception as e:
+        error = type(e).__name__
+        raise
+    finally:
+        total = time.perf_counter() - start
+        _frames.reset(token)
+        self.device = device
+        for context in MetaParser.CONTEXT_LIST:
+            self.__dict__.pop(context, None)
+        if parents:
+            with _lock:
+                parents[-1].nested += total
+        _record(type(self), frame, total, result, error)
+
+
+def _record(cls, frame, total, result, error):
+    record = {
+        'parser': '{}.{}'.format(cls.__module__, cls.__qualname__),
+        'command': frame.command,
+        'time': time.time(),
+        'execute': frame.execute,
+        'parse': max(frame.method - frame.execute - frame.nested, 0.0),
+        'nested': frame.nested,
+        'validate': max(total - frame.method, 0.0),
+        'total': total,
+        'output_bytes': frame.output_bytes,
+        'output_lines': frame.output_lines,
+        'result_size': _result_size(result),
+        'error': error,
+    }
+    with _lock:
+        _history.append(record)
+        key = (record['parser'], record['command'])
+        stats = _stats.get(key)
+        if stats is None:
+            stats = _stats[key] = {
+                'count': 0, 'errors': 0,
+                'timings': {phase: [0.0, 0.0] for phase in PHASES},
+                'sizes': {size: [0, 0] for size in
+                          ('output_bytes', 'output_lines', 'result_size')},
+            }
+        stats['count'] += 1
+        if error:
+            stats['errors'] += 1
+        for name, values in (*stats['timings'].items(),
+                             *stats['sizes'].items()):
+            values[0] += record[name]
+            values[1] = max(values[1], record[name])
+
+
+def _matches(name, parser):
+    # the parser as its class name or its full path
+    return parser is None or name == parser or \
+        name.rsplit('.', 1)[-1] == parser
+
+
+def get_stats(parser=None, command=None):
+    '''The statistics of the parses, per parser class and command
+
+        Args:
+            parser (`str`): only the parser of this class name, or full path
+                            such as genie.libs.parser.iosxe.show_bgp.ShowBgp
+            command (`str`): only the parses of this command, the command
+                             being None when the output is given to parse()
+
+        Returns:
+            `list` of `dict`, the total, mean and max of each phase in
+            seconds, and of the sizes of the outputs and results
+
+        example:
+
+            >>> get_stats('ShowBgpAllDetail')
+            [{'parser': 'genie.libs.parser.iosxe.show_bgp.ShowBgpAllDetail',
+              'command': 'show bgp all detail', 'count': 2, 'errors': 0,
+              'timings': {'execute': {'total': 1.6, 'mean': 0.8,
+                                      'max': 0.9},
+            ...
+    '''
+    stats = []
+    with _lock:
+        for (name, cmd), values in _stats.items():
+            if not _matches(name, parser) or \
+                    (command is not None and cmd != command):
+                continue
+            count = values['count']
+            entry = {'parser': name, 'command': cmd, 'count': count,
+                     'errors': values['errors']}
+            for group in ('timings', 'sizes'):
+                entry[group] = {
+                    key: {'total': total, 'mean': total / count, 'max': max_}
+                    for key, (total, max_) in values[group].items()}
+            stats.append(entry)
+    return stats
+
+
+def get_records(parser=None):
+    '''the timings and sizes of each of the last parses, the oldest first'''
+    with _lock:
+        return [dict(record) for record in _history
+                if _matches(record['parser'], parser)]
+
+
+def reset_stats():
+    '''forget the statistics and the last parses'''
+    with _lock:
+        _stats.clear()
+        _history.clear()
+
+
+def dump_stats(path):
+    '''write the statistics to a JSON file, replaced at once so that it is
+       never read half written'''
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'time': time.time(), 'stats': get_stats()}, f,
+                      indent=2)
+        os.replace(tmp, path)
+    except Exception:
+        os.unlink(tmp)
+        raise
+
+
+class _StatsDump(threading.Thread):
+    '''dump the statistics to a file periodically, and when stopped'''
+
+    def __init__(self, path, interval):
+        super().__init__(name='genie.libs.parser.instrumentation', daemon=True)
+        self.path = path
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.dump()
+
+    def dump(self):
+        try:
+            dump_stats(self.path)
+        except Exception as e:
+            log.warning('Could not dump the parser statistics to {}: {}'
+                        .format(self.path, e))
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        self.dump()
+
+
+def enable_instrumentation(enabled=True, dump=None, interval=DUMP_INTERVAL):
+    '''Time the parses of all the parsers, or stop timing them
+
+        Args:
+            enabled (`bool`): whether the parses are timed
+            dump (`str`): JSON file the statistics are dumped to periodically
+            interval (`int`): seconds between the dumps
+
+        example:
+
+            >>> enable_instrumentation(dump='/tmp/parsers.json')
+            >>> dev.parse('show bgp all detail')
+            >>> get_stats('ShowBgpAllDetail')
+    '''
+    global _dump
+    if _dump is not None:
+        _dump.stop()
+        _dump = None
+    if not enabled:
+        MetaParser.parse = _original_parse
+        return
+    MetaParser.parse = functools.wraps(_original_parse)(_instrumented_parse)
+    if dump:
+        _dump = _StatsDump(dump, float(interval))
+        _dump.start()
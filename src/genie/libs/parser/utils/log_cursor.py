@@ -0,0 +1,109 @@
+'''Cursors of the log buffers, to parse only the messages logged since the
+last poll
+
+A cursor is the hashes of the last lines of the log read, the newest last, as
+a string which can be kept between polls. The lines are found again in the
+next output by scanning it from its end, so that the lines before them, the
+messages already read, are neither scanned nor parsed. This does not need
+the log to have sequence numbers or timestamps.
+
+When the lines of the cursor are repeated at the end of the log, such as a
+message logged again and again, the cursor also counts their occurrences
+which overlap or follow each other there, and the new occurrences logged
+after them are told apart from the ones already read.
+
+An empty cursor starts from the beginning of the log, and so does a cursor
+whose lines are no longer in the log, such as after it wrapped or was
+cleared.
+'''
+
+import hashlib
+
+# number of lines of a cursor, so that a repeated message does not match
+# the lines of another one
+CURSOR_DEPTH = 3
+
+
+def line_hash(line):
+    '''short hash of a stripped line of a log'''
+    return hashlib.blake2b(line.encode(), digest_size=6).hexdigest()
+
+
+def _iter_entries(lines, entry):
+    # index and stripped text of the lines of the log, from the end
+    for index in range(len(lines) - 1, -1, -1):
+        line = lines[index].strip()
+        if line and (entry is None or entry(line)):
+            yield index, line
+
+
+def _occurrences(lines, hashes, entry):
+    # index of the last line of the occurrences of the lines of hashes, from
+    # the newest one, then each one overlapping or followed by the previous
+    # one, so that only the lines up to the occurrences are scanned
+    depth = len(hashes)
+    window = []
+    positions = []
+    last = None
+    for count, (index, line) in enumerate(_iter_entries(lines, entry)):
+        if last is not None and count > last + depth:
+            return
+        window.insert(0, line_hash(line))
+        positions.insert(0, index)
+        if len(window) > depth:
+            window.pop()
+            positions.pop()
+        if window == hashes:
+            last = count
+            yield positions[-1]
+
+
+def find_cursor(lines, cursor, entry=None):
+    '''Find the lines of a cursor in the lines of an output
+
+        Args:
+            lines (`list`): lines of the output
+            cursor (`str`): cursor of a previous output, '' for none
+            entry (`callable`): whether a stripped line is a line of the log,
+                                all the lines which are not empty by default
+
+        Returns:
+            `int`: index of the first line after the lines of the cursor, 0
+                   when they are not found
+    '''
+    hashes, _, count = cursor.partition(';')
+    hashes = hashes.split(',') if hashes else []
+    if not hashes:
+        return 0
+    # the newest first, the last count ones being the ones of the cursor
+    found = list(_occurrences(lines, hashes, entry))
+    if not found:
+        return 0
+    return found[max(len(found) - int(count or 1), 0)] + 1
+
+
+def make_cursor(lines, entry=None, depth=CURSOR_DEPTH):
+    '''The cursor of the last lines of an output
+
+        Args:
+            lines (`list`): lines of the output
+            entry (`callable`): whether a stripped line is a line of the log,
+                                all the lines which are not empty by default
+            depth (`int`): number of lines of the cursor
+
+        Returns:
+            `str`: cursor, '' when the output has no line
+    '''
+    hashes = []
+    for _, line in _iter_entries(lines, entry):
+        if len(hashes) == depth:
+            break
+        hashes.insert(0, line_hash(line))
+    if not hashes:
+        return ''
+    cursor = ','.join(hashes)
+    # the lines repeated at the end of the output
+    count = sum(1 for _ in _occurrences(lines, hashes, entry))
+    if count > 1:
+        cursor += ';{}'.format(count)
+    return cursor
@@ -0,0 +1,231 @@
+'''Parse directories of captured device outputs, without any device
+
+The captures are laid out as <device>/<os>/<command>.txt, or as
+<device>/<os>/<platform>/<command>.txt for the parsers of a platform, such as:
+
+    captures/
+        R1/iosxe/show_version.txt
+        R1/iosxe/show_ip_route_vrf_red.txt
+        R1/iosxe/show_interfaces_GigabitEthernet1%2F0%2F1.txt
+        S1/iosxe/cat9k/show_platform.txt
+        N1/nxos/show bgp process vrf all.txt
+
+The file name is the command, with its spaces as underscores when it has no
+space, and its other characters, such as '/', quoted as in URLs.
+
+usage: python -m genie.libs.parser.utils.offline captures
+                                                 [-o results.jsonl] [-j 8]
+                                                 [--platform cat9k]
+
+Each capture gives a JSON line with its device, os, platform, command, file,
+parser, parsing time, and either its parsed result or its error. The exit
+status is 1 when any capture could not be parsed.
+'''
+
+import os
+import sys
+import json
+import time
+import argparse
+from urllib.parse import quote, unquote
+from concurrent.futures import ProcessPoolExecutor
+
+from .common import get_parser
+
+CAPTURE_SUFFIX = '.txt'
+
+
+def command_from_file(name):
+    '''the command of a capture file name
+
+        example:
+
+            >>> command_from_file('show_interfaces_Gi1%2F0%2F1.txt')
+            'show interfaces Gi1/0/1'
+    '''
+    if name.endswith(CAPTURE_SUFFIX):
+        name = name[:-len(CAPTURE_SUFFIX)]
+    if ' ' not in name:
+        name = name.replace('_', ' ')
+    return unquote(name)
+
+
+def file_from_command(command):
+    '''the capture file name of a command, the reverse of
+       command_from_file()'''
+    return quote(' '.join(command.split()), safe=' ').replace(
+        '_', '%5F').replace(' ', '_') + CAPTURE_SUFFIX
+
+
+class OfflineDevice(object):
+    '''Device of the captures of a directory, carrying the os and platform
+       tokens the parsers are looked up with.
+
+       The commands a parser executes itself, such as the sub-commands it
+       fans out to, are read from the captures of the same directory.
+    '''
+
+    def __init__(self, name, os, platform=None, directory=None):
+        self.name = name
+        self.os = os
+        self.platform = platform
+        self.directory = directory
+        order = ['os', 'platform'] if platform else ['os']
+        self.custom = {'abstraction': {'order': order}}
+
+    def execute(self, command, **kwargs):
+        if isinstance(command, (list, tuple)):
+            return {cmd: self.execute(cmd) for cmd in command}
+        names = [file_from_command(command),
+                 quote(' '.join(command.split()), safe=' ') + CAPTURE_SUFFIX]
+        for name in names:
+            path = os.path.join(self.directory or '', name)
+            if os.path.isfile(path):
+                with open(path) as f:
+                    return f.read()
+        raise FileNotFoundError('No capture of {c!r} for {d} in {p}'.format(
+            c=command, d=self.name, p=self.directory))
+
+    def __repr__(self):
+        return '{}({!r}, os={!r}, platform={!r})'.format(
+            type(self).__name__, self.name, self.os, self.platform)
+
+
+def find_captures(root, platform=None):
+    '''Find the captures under root
+
+        Args:
+            root (`str`): directory of the captures
+            platform (`str`): platform of the captures not under a platform
+                              directory
+
+        Returns:
+            `list` of the (path, device, os, platform, command) of each
+            capture, sorted by path
+    '''
+    captures = []
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+        parts = os.path.relpath(directory, root).split(os.sep)
+        if len(parts) == 2:
+            device, os_name = parts
+            capture_platform = platform
+        elif len(parts) == 3:
+            device, os_name, capture_platform = parts
+        else:
+            continue
+        for name in sorted(files):
+            if name.startswith('.') or not name.endswith(CAPTURE_SUFFIX):
+                continue
+            captures.append((os.path.join(directory, name), device, os_name,
+                             capture_platform, command_from_file(name)))
+    return captures
+
+
+def parse_capture(capture):
+    '''Parse a capture found by find_captures()
+
+        Returns:
+            `dict` of the capture, its parser, the time of its parse() in
+            seconds, and its 'parsed' result or its 'error'
+    '''
+    path, device, os_name, platform, command = capture
+    result = {
+        'device': device,
+        'os': os_name,
+        'platform': platform,
+        'command': command,
+        'file': path,
+        'parser': None,
+        'time': None,
+    }
+    try:
+        with open(path) as f:
+            output = f.read()
+        dev = OfflineDevice(device, os_name, platform,
+                            directory=os.path.dirname(path))
+        cls, kwargs = get_parser(command, dev)
+        result['parser'] = '{}.{}'.format(cls.__module__, cls.__name__)
+        start = time.perf_counter()
+        try:
+            result['parsed'] = cls(device=dev).parse(output=output, **kwargs)
+        finally:
+            result['time'] = time.perf_counter() - start
+    except Exception as e:
+        result['error'] = '{}: {}'.format(type(e).__name__, e)
+    return result
+
+
+def parse_captures(root, jobs=None, platform=None):
+    '''Parse the captures under root, see the module for their layout
+
+        Args:
+            root (`str`): directory of the captures
+            jobs (`int`): number of worker processes, the captures are parsed
+                          in this process when 1, and with as many worker
+                          processes as CPUs when None
+            platform (`str`): platform of the captures not under a platform
+                              directory
+
+        Returns:
+            iterator of the result of each capture, see parse_capture(), in
+            the order of their paths
+
+        example:
+
+            >>> for result in parse_captures('captures', jobs=8):
+            ...     if 'error' in result:
+            ...         print(result['file'], result['error'])
+    '''
+    captures = find_captures(root, platform=platform)
+    if jobs == 1 or len(captures) < 2:
+        for capture in captures:
+            yield parse_capture(capture)
+        return
+
+    jobs = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # chunks of consecutive captures keep the captures of a device, and
+        # so of the same parsers, on the same worker
+        chunksize = max(1, len(captures) // (jobs * 8))
+        yield from executor.map(parse_capture, captures, chunksize=chunksize)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m genie.libs.parser.utils.offline',
+        description='Parse the <device>/<os>/[<platform>/]<command>.txt '
+                    'captures of a directory into JSON lines')
+    parser.add_argument('root', help='directory of the captures')
+    parser.add_argument('-o', '--output', default=None,
+                        help='JSON lines file of the results, stdout by '
+                             'default')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='number of worker processes, one per CPU by '
+                             'default')
+    parser.add_argument('--platform', default=None,
+                        help='platform of the captures not under a platform '
+                             'directory, such as cat9k')
+    args = parser.parse_args(argv)
+
+    out = open(args.output, 'w') if args.output else sys.stdout
+    count = errors = 0
+    start = time.perf_counter()
+    try:
+        for result in parse_captures(args.root, jobs=args.jobs,
+                                     platform=args.platform):
+            count += 1
+            if 'error' in result:
+                errors += 1
+            out.write(json.dumps(result, default=str) + '\n')
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print('Parsed {} captures in {:.3f}s, {} errors'.format(
+        count, time.perf_counter() - start, errors), file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,171 @@
+'''Reuse the results of the parsers called by other parsers'''
+
+import copy
+import time
+import threading
+
+try:
+    from contextvars import ContextVar
+except ImportError:
+    # python 3.6
+    ContextVar = None
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+
+class _ThreadLocalVar(object):
+    '''ContextVar of the pythons without contextvars, whose value is per
+       thread rather than per context'''
+
+    def __init__(self, name, default):
+        self.name = name
+        self.default = default
+        self._local = threading.local()
+
+    def get(self):
+        return getattr(self._local, 'value', self.default)
+
+    def set(self, value):
+        # the token is the previous value
+        token = self.get()
+        self._local.value = value
+        return token
+
+    def reset(self, token):
+        self._local.value = token
+
+
+def _context_var(name, default):
+    '''a ContextVar, or a per thread variable when contextvars is missing'''
+    if ContextVar is None:
+        return _ThreadLocalVar(name, default)
+    return ContextVar(name, default=default)
+
+
+def _unwrap(device):
+    '''the device of a wrapper of the device, such as the timed devices of
+       the instrumentation, as its __wrapped__'''
+    return getattr(device, '__dict__', {}).get('__wrapped__', device)
+
+
+# caches in effect, innermost last
+_active = _context_var('genie.libs.parser.parse_cache', ())
+
+
+class ParseCache(object):
+    '''Cache of parsed results, per device, parser class and arguments.
+
+       While the cache is in effect, as a context manager, the parsers which
+       call other parsers through cached_parse(), such as ShowVrf to find the
+       vrfs to parse, hit the device once per sub-parser and arguments rather
+       than once per call. It can be kept for a whole collection cycle, so the
+       parsers collected one after the other share their sub-parses, or
+       called directly to cache the top level parses too.
+
+       A parser which needs fresh data opts out of the cache with its
+       parse_cache class attribute set to False.
+
+        Args:
+            ttl (`int`): seconds a result is reused for, forever by default
+
+        example:
+
+            >>> with ParseCache(ttl=60) as cache:
+            ...     for cls in (ShowBgpAllSummary, ShowIpBgpAllSummary):
+            ...         results.append(cache.parse(cls, device))
+            >>> cache.stats
+            {'hits': 1, 'misses': 3, 'size': 3}
+    '''
+
+    def __init__(self, ttl=None):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._results = {}
+        self._tokens = []
+
+    def __enter__(self):
+        self._tokens.append(_active.set(_active.get() + (self,)))
+        return self
+
+    def __exit__(self, *exc_info):
+        _active.reset(self._tokens.pop())
+
+    @property
+    def stats(self):
+        '''hits, misses and number of cached results'''
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._results)}
+
+    def clear(self, device=None):
+        '''forget the results of all devices, or of one device'''
+        if device is None:
+            self._results.clear()
+        else:
+            device = _unwrap(device)
+            for key in [key for key, (dev, *_) in self._results.items()
+                        if dev is device]:
+                del self._results[key]
+
+    def parse(self, parser_class, device, **kwargs):
+        '''parse with parser_class on device, or return a copy of its result
+           with the same arguments when cached
+
+            Args:
+                parser_class (`class`): parser to parse with
+                device (`Device`): device the parser executes its commands on
+                kwargs: the arguments of parse()
+
+            Returns:
+                parsed `dict`
+        '''
+        if not getattr(parser_class, 'parse_cache', True) or \
+                kwargs.get('output') is not None:
+            return parser_class(device=device).parse(**kwargs)
+
+        key = (id(_unwrap(device)), parser_class,
+               tuple(sorted(kwargs.items())))
+        try:
+            cached = self._results.get(key)
+        except TypeError:
+            # an argument which is not hashable, such as a list
+            return parser_class(device=device).parse(**kwargs)
+        if cached and (self.ttl is None or
+                       time.monotonic() - cached[1] < self.ttl):
+            self.hits += 1
+            result = cached[2]
+        else:
+            self.misses += 1
+            try:
+                result = parser_class(device=device).parse(**kwargs)
+            except SchemaEmptyParserError as e:
+                # an empty output is cached as well
+                result = e
+            # the device is kept, so its id is not reused by another one
+            self._results[key] = (_unwrap(device), time.monotonic(), result)
+
+        if isinstance(result, SchemaEmptyParserError):
+            raise result
+        return copy.deepcopy(result)
+
+
+def cached_parse(parser_class, device, **kwargs):
+    '''Parse with parser_class on device, through the innermost ParseCache in
+       effect if any
+
+        Args:
+            parser_class (`class`): parser to parse with
+            device (`Device`): device the parser executes its commands on
+            kwargs: the arguments of parse()
+
+        Returns:
+            parsed `dict`
+
+        example:
+
+            >>> vrfs = cached_parse(ShowVrf, self.device)
+    '''
+    caches = _active.get()
+    if caches:
+        return caches[-1].parse(parser_class, device, **kwargs)
+    return parser_class(device=device).parse(**kwargs)
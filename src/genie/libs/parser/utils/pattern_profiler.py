@@ -0,0 +1,277 @@
+'''Count the attempts and hits of the regular expressions of the parsers
+
+While a PatternProfiler is in effect, the patterns of the parsers count the
+lines they are attempted on and the lines they match: the patterns compiled
+in their methods, such as p1 = re.compile(...) in cli(), the ones used
+directly as re.match(r'...', line), and the patterns of the class
+attributes, LazyPattern included, and of the module of the parsers parsing.
+
+The patterns which were never attempted are dead code for the outputs
+parsed, and the ones attempted which never matched are either dead too or
+only attempted before the pattern matching the line. Both are reported, with
+the patterns attempted the most often, which are the candidates to move or
+to route with a LineDispatcher.
+
+The profiler replaces re._compile and MetaParser.parse, so it is meant for
+profiling runs over a corpus of outputs, such as the golden outputs of the
+tests, not for production.
+'''
+
+import re
+import sys
+import inspect
+import linecache
+import threading
+
+from genie.metaparser import MetaParser
+
+from .dispatch import ParserDispatcher
+from .patterns import LazyPattern, _PATTERN_TYPE
+
+# modules whose patterns are profiled, and the ones which are not parsers
+PARSER_PACKAGE = 'genie.libs.parser.'
+UTILS_PACKAGE = 'genie.libs.parser.utils'
+
+# p1 = re.compile(...)
+_ASSIGNMENT = re.compile(r'^\s*(?P<name>\w+)\s*=\s*re\.compile\(')
+
+
+class PatternStats(object):
+    '''Attempts and hits of a pattern of a parser'''
+
+    __slots__ = ('parser', 'name', 'pattern', 'attempts', 'hits')
+
+    def __init__(self, parser, name, pattern):
+        self.parser = parser
+        self.name = name
+        self.pattern = pattern
+        self.attempts = 0
+        self.hits = 0
+
+    def to_dict(self):
+        return {'parser': self.parser, 'name': self.name,
+                'pattern': self.pattern, 'attempts': self.attempts,
+                'hits': self.hits}
+
+
+class _ProfiledPattern(object):
+    '''Compiled pattern counting the calls of match(), search() and
+       fullmatch(), all its other attributes being the pattern's'''
+
+    __slots__ = ('_pattern', '_stats')
+
+    def __init__(self, pattern, stats):
+        self._pattern = pattern
+        self._stats = stats
+
+    def __getattr__(self, name):
+        return getattr(self._pattern, name)
+
+    def __repr__(self):
+        return repr(self._pattern)
+
+    def _count(self, m):
+        self._stats.attempts += 1
+        if m:
+            self._stats.hits += 1
+        return m
+
+    def match(self, *args, **kwargs):
+        return self._count(self._pattern.match(*args, **kwargs))
+
+    def search(self, *args, **kwargs):
+        return self._count(self._pattern.search(*args, **kwargs))
+
+    def fullmatch(self, *args, **kwargs):
+        return self._count(self._pattern.fullmatch(*args, **kwargs))
+
+
+def _is_parser_module(name):
+    return name.startswith(PARSER_PACKAGE) and \
+        not name.startswith(UTILS_PACKAGE)
+
+
+class PatternProfiler(object):
+    '''Count the attempts and hits of the patterns of the parsers parsing
+       while in effect, as a context manager
+
+       The patterns are counted per parser class, the class whose code
+       holds the pattern, and per pattern, named after the attribute or the
+       variable it is assigned to, or its line number.
+
+        example:
+
+            >>> with PatternProfiler() as profiler:
+            ...     for output in outputs:
+            ...         ShowInterfaces(device=device).parse(output=output)
+            >>> print(profiler.report())
+            >>> profiler.never_matched()
+            [{'parser': 'genie.libs.parser.iosxe.show_interface.ShowInterfaces',
+              'name': 'p27', 'pattern': '^Encapsulation +(?P<encapsulation>...',
+              'attempts': 1520, 'hits': 0}, ...
+    '''
+
+    _lock = threading.Lock()
+    _active = None
+
+    def __init__(self):
+        self._stats = {}
+        # the class and module attributes replaced, to restore them
+        self._replaced = []
+        self._profiled = set()
+        self._compile = None
+        self._parse = None
+
+    def __enter__(self):
+        with self._lock:
+            if PatternProfiler._active is not None:
+                raise RuntimeError('a PatternProfiler is already in effect')
+            PatternProfiler._active = self
+        self._compile = re._compile
+        self._parse = MetaParser.parse
+        re._compile = self._profiled_compile
+        profiler = self
+        parse = self._parse
+
+        def profiled_parse(parser, *args, **kwargs):
+            profiler._profile_class(type(parser))
+            return parse(parser, *args, **kwargs)
+
+        MetaParser.parse = profiled_parse
+        return self
+
+    def __exit__(self, *exc_info):
+        re._compile = self._compile
+        MetaParser.parse = self._parse
+        for owner, name, value in reversed(self._replaced):
+            if isinstance(owner, dict):
+                owner[name] = value
+            else:
+                setattr(owner, name, value)
+        self._replaced = []
+        self._profiled = set()
+        with self._lock:
+            PatternProfiler._active = None
+
+    def _pattern_stats(self, parser, name, pattern):
+        key = (parser, name, pattern.pattern)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = PatternStats(parser, name,
+                                                    pattern.pattern)
+        return stats
+
+    def _profiled_compile(self, pattern, flags):
+        if isinstance(pattern, _ProfiledPattern):
+            pattern = pattern._pattern
+        compiled = self._compile(pattern, flags)
+
+        # the caller of re, if it is a method or function of a parser
+        frame = sys._getframe(1)
+        while frame is not None and frame.f_globals.get('__name__') == 're':
+            frame = frame.f_back
+        if frame is None or \
+                not _is_parser_module(frame.f_globals.get('__name__', '')) or \
+                not frame.f_code.co_flags & inspect.CO_OPTIMIZED:
+            return compiled
+
+        code = frame.f_code
+        qualname = getattr(code, 'co_qualname', code.co_name)
+        owner = qualname.split('.<locals>')[0].rpartition('.')[0]
+        parser = '{}.{}'.format(frame.f_globals['__name__'],
+                                owner or qualname)
+        m = _ASSIGNMENT.match(linecache.getline(code.co_filename,
+                                                frame.f_lineno))
+        name = m.group('name') if m else 'line {}'.format(frame.f_lineno)
+        return _ProfiledPattern(compiled,
+                                self._pattern_stats(parser, name, compiled))
+
+    def _profile_class(self, cls):
+        '''replace the patterns of the attributes of a parser class and its
+           bases, and of their modules, once'''
+        for klass in cls.__mro__:
+            if klass in self._profiled or \
+                    not _is_parser_module(klass.__module__):
+                continue
+            self._profiled.add(klass)
+            parser = '{}.{}'.format(klass.__module__, klass.__qualname__)
+            for name, value in list(vars(klass).items()):
+                if isinstance(value, LazyPattern):
+                    value = getattr(klass, name)
+                if isinstance(value, _PATTERN_TYPE):
+                    self._replace(klass, name, value, _ProfiledPattern(
+                        value, self._pattern_stats(parser, name, value)))
+                elif isinstance(value, ParserDispatcher):
+                    # rebuilt from the profiled patterns
+                    self._replace(value, 'dispatchers', value.dispatchers, {})
+
+            module = sys.modules.get(klass.__module__)
+            if module is not None and module not in self._profiled:
+                self._profiled.add(module)
+                for name, value in list(vars(module).items()):
+                    if isinstance(value, _PATTERN_TYPE):
+                        self._replace(vars(module), name, value,
+                                      _ProfiledPattern(value,
+                                                       self._pattern_stats(
+                                                           module.__name__,
+                                                           name, value)))
+
+    def _replace(self, owner, name, value, replacement):
+        self._replaced.append((owner, name, value))
+        if isinstance(owner, dict):
+            owner[name] = replacement
+        else:
+            setattr(owner, name, replacement)
+
+    def stats(self, parser=None):
+        '''The attempts and hits of each pattern
+
+            Args:
+                parser (`str`): only the patterns of this parser class name,
+                                or full path
+
+            Returns:
+                `list` of `dict`, per parser then the most attempted first
+        '''
+        stats = [stats.to_dict() for stats in self._stats.values()
+                 if parser is None or parser in
+                 (stats.parser, stats.parser.rpartition('.')[2])]
+        return sorted(stats, key=lambda stats: (stats['parser'],
+                                                -stats['attempts']))
+
+    def never_attempted(self, parser=None):
+        '''the patterns no line was attempted on'''
+        return [stats for stats in self.stats(parser)
+                if not stats['attempts']]
+
+    def never_matched(self, parser=None):
+        '''the patterns attempted on lines which matched none of them'''
+        return [stats for stats in self.stats(parser)
+                if stats['attempts'] and not stats['hits']]
+
+    def report(self, parser=None, top=10):
+        '''Text report of the patterns attempted the most often, and of the
+           ones never attempted or never matched, per parser'''
+        lines = []
+        parsers = {}
+        for stats in self.stats(parser):
+            parsers.setdefault(stats['parser'], []).append(stats)
+        for name, patterns in parsers.items():
+            attempts = sum(stats['attempts'] for stats in patterns)
+            hits = sum(stats['hits'] for stats in patterns)
+            lines.append('{}: {} patterns, {} attempts, {} hits'.format(
+                name, len(patterns), attempts, hits))
+            for stats in patterns[:top]:
+                lines.append('    {:<12} {:>10} attempts {:>10} hits  {}'
+                             .format(stats['name'], stats['attempts'],
+                                     stats['hits'], stats['pattern']))
+            for title, found in (
+                    ('never attempted',
+                     [stats for stats in patterns if not stats['attempts']]),
+                    ('never matched',
+                     [stats for stats in patterns
+                      if stats['attempts'] and not stats['hits']])):
+                if found:
+                    lines.append('    {}: {}'.format(
+                        title, ', '.join(stats['name'] for stats in found)))
+        return '\n'.join(lines)
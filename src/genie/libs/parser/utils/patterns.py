@@ -0,0 +1,72 @@
+'''Regular expression helpers for parsers'''
+
+# python
+import re
+
+# re.Pattern is only available from python 3.7
+_PATTERN_TYPE = type(re.compile(''))
+
+
+class LazyPattern(object):
+    r'''Class attribute holding a regular expression compiled once per class.
+
+       Declaring the patterns of a parser as class attributes instead of
+       compiling them in cli() avoids recompiling (or looking up the small re
+       module cache) on every call. The pattern is compiled the first time it
+       is used, then the compiled pattern replaces the LazyPattern on the
+       class so following accesses are plain attribute lookups and importing
+       a parser module stays cheap.
+
+        Args:
+            pattern (`str`): the regular expression
+            flags (`int`): re flags
+
+        example:
+
+            >>> class ShowClock(ShowClockSchema):
+            ...     # 10:33:54.123 UTC Mon Feb 1 2021
+            ...     p1 = LazyPattern(r'^(?P<time>[\d\:\.]+) +(?P<timezone>\w+)')
+            ...
+            ...     def cli(self, output=None):
+            ...         ...
+            ...         m = self.p1.match(line)
+    '''
+
+    def __init__(self, pattern, flags=0):
+        self.pattern = pattern
+        self.flags = flags
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        compiled = re.compile(self.pattern, self.flags)
+
+        # Replace it on the class which defines it, so subclasses share it
+        for klass in owner.__mro__:
+            if klass.__dict__.get(self.name) is self:
+                setattr(klass, self.name, compiled)
+                break
+
+        return compiled
+
+
+def class_patterns(cls):
+    '''Return the compiled regular expressions defined as class attributes of
+       a parser class and its base classes, in definition order
+
+        Args:
+            cls (`class`): parser class
+
+        Returns:
+            dict: attribute name -> compiled pattern
+    '''
+    names = []
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).items():
+            if isinstance(value, (LazyPattern, _PATTERN_TYPE)) and \
+                                                        name not in names:
+                names.append(name)
+
+    return {name: getattr(cls, name) for name in names}
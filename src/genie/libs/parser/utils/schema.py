@@ -0,0 +1,71 @@
+'''Schema helpers shared by the parsers'''
+
+import threading
+
+from genie.metaparser.util.schemaengine import Schema
+from genie.metaparser.util.exceptions import SchemaError
+
+
+class ListOfDicts(object):
+    '''Validator of a list of dictionaries sharing the same schema, for the
+       lists of the xml based outputs such as junos ones, used with Use().
+
+       The Schema of the dictionaries is built once per thread and reused for
+       all the dictionaries of all the lists it validates, rather than built
+       again by a nested function on each validation. A Schema keeps the
+       state of the validation in progress, and leaves it behind when the
+       validation fails, so it is not shared between threads and is built
+       again after a failure.
+
+        Args:
+            schema (`dict`): schema of each dictionary of the list
+            name (`str`): name of the list, for the error message
+            allow_dict (`bool`): accept a single dictionary, validated as a
+                                 list of one
+
+        example:
+
+            >>> class ShowRouteSchema(MetaParser):
+            ...     validate_rt_list = ListOfDicts({
+            ...         "rt-destination": str,
+            ...         Optional("rt-entry"): dict,
+            ...     }, 'rt')
+            ...
+            ...     schema = {
+            ...         "route-table": {
+            ...             Optional("rt"): Use(validate_rt_list),
+            ...         }
+            ...     }
+    '''
+
+    def __init__(self, schema, name='list', allow_dict=False):
+        self.schema = schema
+        self.name = name
+        self.allow_dict = allow_dict
+        # Use() names its callable in its error messages
+        self.__name__ = self.__class__.__name__
+        self._local = threading.local()
+
+    def __set_name__(self, owner, name):
+        self.__name__ = name
+
+    def __call__(self, value):
+        if self.allow_dict and isinstance(value, dict):
+            value = [value]
+        if not isinstance(value, list):
+            raise SchemaError('{} is not a list'.format(self.name))
+
+        try:
+            schema = self._local.schema
+        except AttributeError:
+            schema = self._local.schema = Schema(self.schema)
+        try:
+            for item in value:
+                schema.validate(item)
+        except Exception:
+            del self._local.schema
+            raise
+        return value
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.name)
@@ -0,0 +1,396 @@
+'''Compile the schemas of the parsers into Python code validating their
+outputs
+
+MetaParser.parse() validates the output of each parser with a Schema, which
+tries the keys of the schema in turn for each key of the output, building a
+Schema for each of their values. The compiler turns a schema into functions
+written for it, one per dictionary of the schema, which look up the check of
+each key of the output in a table, an isinstance() for most of them, and so
+validate an output in a single pass.
+
+The compiled validators give the same results as Schema.validate(). When an
+output is not valid, they validate it again with Schema, so that the error
+raised is the same. The parts of the schemas which are not compiled, such as
+And() or the keys which are types, are validated with Schema.
+
+    >>> validate = compile_schema(ShowIpRoute.schema)
+    >>> validate(output)
+
+use_compiled_schemas(), or the genie.libs.parser.compiled_schema pyATS
+configuration key, or the GENIE_LIBS_PARSER_COMPILED_SCHEMA environment
+variable, set to 'true', makes MetaParser.parse() validate the outputs of all
+the parsers with their compiled schema, compiled once per schema.
+'''
+
+import os
+import hashlib
+import threading
+
+import genie.metaparser._metaparser as _metaparser
+from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use, Or
+
+from .schema import ListOfDicts
+
+# names of the types the generated code uses as is
+_BUILTIN_TYPES = {t: t.__name__ for t in (str, int, float, bool, list, dict,
+                                          tuple, set, object)}
+_BUILTIN_TYPES[type(None)] = 'NoneType'
+
+# types of the values and keys compared as is
+_LITERALS = (str, int, float, bool, type(None))
+
+
+class _Invalid(Exception):
+    '''The output is not valid for the compiled code'''
+
+
+def _key_kind(key):
+    '''('any',), ('literal', key, required), or None for the keys which are
+       not compiled'''
+    if type(key) is Any:
+        return ('any',)
+    if type(key) is Optional:
+        if type(key.schema) is Any:
+            return ('any',)
+        if type(key.schema) in (str, int):
+            return ('literal', key.schema, False)
+        return None
+    if type(key) in (str, int):
+        return ('literal', key, True)
+    return None
+
+
+class _Compiler(object):
+    '''Write the source of the validator of a schema.
+
+       Each value of the schema is compiled into a check: a tuple of types,
+       checked with isinstance(), or the name of a function returning the
+       validated value, flagged when that value is not always the value
+       checked, such as with Use().
+    '''
+
+    def __init__(self):
+        self.functions = []
+        self.tables = []
+        self.namespace = {'Invalid': _Invalid, 'Schema': Schema,
+                          'NoneType': type(None)}
+        self.count = 0
+        # checks of the values of the schema already compiled, by id
+        self.compiled = {}
+
+    def name(self, prefix):
+        self.count += 1
+        return '_{}{}'.format(prefix, self.count)
+
+    def constant(self, value):
+        name = self.name('c')
+        self.namespace[name] = value
+        return name
+
+    def type_name(self, type_):
+        return _BUILTIN_TYPES.get(type_) or self.constant(type_)
+
+    def source_of(self, check):
+        '''source of a check, as found in the tables'''
+        if check[0] == 'types':
+            names = [self.type_name(type_) for type_ in check[1]]
+            return '({},)'.format(', '.join(names))
+        return check[1]
+
+    def check(self, value, path):
+        try:
+            return self.compiled[id(value)][1]
+        except KeyError:
+            pass
+        if isinstance(value, dict):
+            check = self.dict_check(value, path)
+        elif isinstance(value, type):
+            check = ('types', (value,))
+        elif type(value) in _LITERALS:
+            check = self.values_check((value,), path)
+        elif type(value) is Any:
+            check = ('types', (object,))
+        elif type(value) is Use and isinstance(value.schema, ListOfDicts):
+            check = self.list_check(value.schema, path)
+        elif type(value) is Use and callable(value.schema):
+            # the function is called as Use() does
+            check = ('call', self.constant(value.schema), True)
+        elif type(value) is Or:
+            check = self.or_check(value, path)
+        else:
+            check = self.schema_check(value, path)
+        # the value is kept so that its id is not reused
+        self.compiled[id(value)] = (value, check)
+        return check
+
+    def schema_check(self, value, path):
+        '''validate with Schema the values which are not compiled'''
+        name = self.name('schema')
+        self.functions.append(
+            '# {path}\n'
+            'def {name}(value):\n'
+            '    return Schema({schema}).validate(value)\n'.format(
+                path=path or 'schema', name=name,
+                schema=self.constant(value)))
+        return ('call', name, True)
+
+    def values_check(self, values, path):
+        name = self.name('values')
+        self.functions.append(
+            '# {path}\n'
+            'def {name}(value):\n'
+            '    if value in {values}:\n'
+            '        return value\n'
+            '    raise Invalid\n'.format(path=path, name=name,
+                                         values=self.constant(values)))
+        return ('call', name, False)
+
+    def or_check(self, value, path):
+        # only the types and the values are compiled, the schemas of the
+        # others are validated as a whole output, such as an empty
+        # dictionary which is not valid
+        if not all(isinstance(schema, type) or type(schema) in _LITERALS
+                   for schema in value.schemas):
+            return self.schema_check(value, path)
+        types = tuple(schema for schema in value.schemas
+                      if isinstance(schema, type))
+        values = tuple(schema for schema in value.schemas
+                       if not isinstance(schema, type))
+        if not values:
+            return ('types', types)
+
+        if not types:
+            return self.values_check(values, path)
+
+        name = self.name('or')
+        self.functions.append(
+            '# {path}\n'
+            'def {name}(value):\n'
+            '    if isinstance(value, {types}) or value in {values}:\n'
+            '        return value\n'
+            '    raise Invalid\n'.format(
+                path=path, name=name, types=self.source_of(('types', types)),
+                values=self.constant(values)))
+        return ('call', name, False)
+
+    def list_check(self, validator, path):
+        '''ListOfDicts, the list itself being the validated value'''
+        item = self.check(validator.schema, path + '[]')
+        name = self.name('list')
+        lines = ['# {}'.format(path or 'schema'),
+                 'def {}(value):'.format(name)]
+        if validator.allow_dict:
+            lines += ['    if isinstance(value, dict):',
+                      '        value = [value]']
+        lines += ['    if not isinstance(value, list):',
+                  '        raise Invalid',
+                  '    for item in value:',
+                  # each dictionary is validated as a whole output
+                  '        if not item:',
+                  '            raise Invalid']
+        if item[0] == 'types':
+            lines += ['        if not isinstance(item, {}):'.format(
+                          self.source_of(item)),
+                      '            raise Invalid']
+        else:
+            lines.append('        {}(item)'.format(item[1]))
+        lines.append('    return value')
+        self.functions.append('\n'.join(lines) + '\n')
+        return ('call', name, validator.allow_dict)
+
+    def dict_check(self, schema, path):
+        kinds = [(_key_kind(key), value) for key, value in schema.items()]
+        literals = [kind[1] for kind, _ in kinds
+                    if kind is not None and kind[0] == 'literal']
+        anys = [value for kind, value in kinds
+                if kind is not None and kind[0] == 'any']
+        if any(kind is None for kind, _ in kinds) or len(anys) > 1 or \
+                len(set(literals)) != len(literals):
+            return self.schema_check(schema, path)
+
+        # the check of the value of each key of the schema
+        checks = {}
+        required = []
+        for kind, value in kinds:
+            if kind[0] == 'literal':
+                checks[kind[1]] = self.check(
+                    value, '{}.{}'.format(path, kind[1]).lstrip('.'))
+                if kind[2]:
+                    required.append(kind[1])
+        any_check = self.check(anys[0], (path + '.*').lstrip('.')) \
+            if anys else None
+
+        every = list(checks.values()) + ([any_check] if any_check else [])
+        calls = any(check[0] == 'call' for check in every)
+        transforms = any(check[0] == 'call' and check[2] for check in every)
+
+        name = self.name('dict')
+        table = self.name('keys')
+        self.tables.append('{} = {{{}}}\n'.format(table, ''.join(
+            '\n    {!r}: {},'.format(key, self.source_of(check))
+            for key, check in checks.items())))
+
+        lines = ['# {}'.format(path or 'schema'),
+                 'def {}(value):'.format(name),
+                 '    if not isinstance(value, dict):',
+                 '        raise Invalid']
+        if required:
+            required_name = self.name('required')
+            self.tables.append('{} = frozenset({!r})\n'.format(
+                required_name, sorted(required, key=repr)))
+            lines += ['    if not value.keys() >= {}:'.format(required_name),
+                      '        raise Invalid']
+        if transforms:
+            lines.append('    new = None')
+        lines.append('    for key, item in value.items():')
+        if any_check:
+            any_name = self.name('any')
+            self.tables.append('{} = {}\n'.format(
+                any_name, self.source_of(any_check)))
+            lines.append('        check = {}.get(key, {})'.format(
+                table, any_name))
+        else:
+            # a key which is not in the schema raises a KeyError
+            lines.append('        check = {}[key]'.format(table))
+
+        if not calls:
+            lines += ['        if not isinstance(item, check):',
+                      '            raise Invalid']
+        else:
+            lines += ['        if check.__class__ is tuple:',
+                      '            if not isinstance(item, check):',
+                      '                raise Invalid']
+            if transforms:
+                lines += ['        else:',
+                          '            result = check(item)',
+                          '            if result is not item:',
+                          '                if new is None:',
+                          '                    new = dict(value)',
+                          '                new[key] = result',
+                          '    return value if new is None else new']
+            else:
+                lines += ['        else:',
+                          '            check(item)']
+        if not transforms:
+            lines.append('    return value')
+        self.functions.append('\n'.join(lines) + '\n')
+        return ('call', name, transforms)
+
+    def source(self, root):
+        return ''.join('\n\n' + function for function in self.functions) + \
+            '\n\n' + ''.join(self.tables) + \
+            '\nvalidate = {}\n'.format(root)
+
+
+def _compile(schema, name=None, directory=None):
+    '''the compiled function of a dictionary schema, raising an exception
+       for the outputs it can not tell are valid'''
+    compiler = _Compiler()
+    check = compiler.dict_check(schema, '')
+    source = '# Validator of the schema {}, generated by {}\n'.format(
+        name or '', __name__) + compiler.source(check[1])
+
+    if directory:
+        if not name:
+            name = 'schema_' + hashlib.blake2b(
+                source.encode(), digest_size=6).hexdigest()
+        filename = os.path.join(directory, name + '.py')
+        os.makedirs(directory, exist_ok=True)
+        with open(filename, 'w') as f:
+            f.write(source)
+    else:
+        filename = '<schema {}>'.format(name or id(schema))
+
+    namespace = compiler.namespace
+    exec(compile(source, filename, 'exec'), namespace)
+    return namespace['validate']
+
+
+def compile_schema(schema, name=None, directory=None):
+    '''Compile a schema into a function validating the outputs as
+       Schema(schema).validate() does
+
+        Args:
+            schema (`dict`): schema of a parser
+            name (`str`): name of the schema, such as the one of its parser
+            directory (`str`): directory where the source of the validator is
+                               written, as <name>.py, so that it shows in the
+                               tracebacks and profiles
+
+        Returns:
+            function validating an output, and returning the output validated
+
+        Raises:
+            SchemaError: the output is not valid
+    '''
+    validator = _compile(schema, name=name, directory=directory)
+
+    def validate(data):
+        if data:
+            try:
+                return validator(data)
+            except Exception:
+                pass
+        # raise the error of Schema
+        return Schema(schema).validate(data)
+    return validate
+
+
+# compiled functions of the schemas, by id of the schema
+_validators = {}
+_lock = threading.Lock()
+
+# directory where the validators compiled for parse() are written
+_directory = None
+
+
+def compiled_validator(schema, name=None):
+    '''the compiled function of a schema, compiled once and raising an
+       exception for the outputs it can not tell are valid'''
+    try:
+        return _validators[id(schema)][1]
+    except KeyError:
+        pass
+    with _lock:
+        if id(schema) not in _validators:
+            # the schema is kept so that its id is not reused
+            _validators[id(schema)] = (schema, _compile(
+                schema, name=name, directory=_directory))
+        return _validators[id(schema)][1]
+
+
+class CompiledSchema(Schema):
+    '''Schema validating the dictionaries with the compiled function of their
+       schema, in place of Schema in MetaParser.parse()
+
+       The outputs are validated with Schema when they are not valid, and
+       when the unsupported keys only log a warning.
+    '''
+
+    def __init__(self, schema, *args, **kwargs):
+        super().__init__(schema, *args, **kwargs)
+        self._validator = compiled_validator(schema) \
+            if isinstance(schema, dict) and schema else None
+
+    def validate(self, data, *args, **kwargs):
+        if self._validator is not None and data and \
+                not kwargs.get('warn_unsupported_keys'):
+            try:
+                return self._validator(data)
+            except Exception:
+                pass
+        return super().validate(data, *args, **kwargs)
+
+
+def use_compiled_schemas(enabled=True, directory=None):
+    '''Validate the outputs of all the parsers with their compiled schema, or
+       with Schema again
+
+        Args:
+            enabled (`bool`): whether the compiled schemas are used
+            directory (`str`): directory where the source of the validators
+                               is written
+    '''
+    global _directory
+    _directory = directory
+    _metaparser.Schema = CompiledSchema if enabled else Schema
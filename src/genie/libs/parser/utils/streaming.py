@@ -0,0 +1,138 @@
+'''Parse huge outputs incrementally, one record at a time'''
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+
+def iter_lines(output):
+    '''Yield the lines of output without their line ending
+
+        Args:
+            output (`str`, `iterable`): the whole output, or an iterable of
+                                        its lines such as a file object
+    '''
+    if isinstance(output, str):
+        output = output.splitlines()
+    for line in output:
+        yield line.rstrip('\r\n')
+
+
+def iter_blocks(output, start, context=()):
+    '''Group the lines of output into blocks of text, each starting on a line
+       matching one of the start patterns, and yield each block as soon as the
+       next one starts.
+
+       Lines matching one of the context patterns, such as an address family
+       header, apply to all the blocks which follow them and are repeated at
+       the top of each of them. The context patterns are given outermost
+       first: a line matching one of them ends the current block and clears
+       the context lines of the following patterns. Lines before the first
+       block which are not context lines are dropped.
+
+       Lines are matched once stripped, as the parsers do.
+
+        Args:
+            output (`str`, `iterable`): the whole output, or an iterable of
+                                        its lines such as a file object
+            start (`list`): compiled patterns starting a block
+            context (`list`): compiled patterns of the context lines,
+                              outermost first
+
+        Returns:
+            generator of `str`
+
+        example:
+
+            >>> output = """
+            ... For address family: IPv4 Unicast
+            ... BGP routing table entry for 10.4.1.1/32, version 4
+            ...   Paths: (1 available, best #1, table default)
+            ... BGP routing table entry for 10.4.1.2/32, version 5
+            ...   Paths: (1 available, best #1, table default)
+            ... """
+            >>> list(iter_blocks(output, [re.compile(r'^BGP +routing')],
+            ...                  [re.compile(r'^For +address +family:')]))
+            ['For address family: IPv4 Unicast\\n'
+             'BGP routing table entry for 10.4.1.1/32, version 4\\n'
+             '  Paths: (1 available, best #1, table default)',
+             'For address family: IPv4 Unicast\\n'
+             'BGP routing table entry for 10.4.1.2/32, version 5\\n'
+             '  Paths: (1 available, best #1, table default)']
+    '''
+    context_lines = [None] * len(context)
+    block = []
+    for line in iter_lines(output):
+        stripped = line.strip()
+
+        for level, pattern in enumerate(context):
+            if pattern.match(stripped):
+                if block:
+                    yield '\n'.join(block)
+                    block = []
+                context_lines[level] = line
+                context_lines[level + 1:] = [None] * (len(context) - level - 1)
+                break
+        else:
+            if any(pattern.match(stripped) for pattern in start):
+                if block:
+                    yield '\n'.join(block)
+                block = [context_line for context_line in context_lines
+                         if context_line is not None]
+                block.append(line)
+            elif block:
+                block.append(line)
+
+    if block:
+        yield '\n'.join(block)
+
+
+class StreamingParser(object):
+    '''Parser mixin adding parse_iter(), for the parsers of outputs made of
+       independent records, such as one per prefix or interface.
+
+       The parser lists the names of its patterns starting a record in
+       stream_start, and of its patterns of the lines applying to all the
+       following records in stream_context, outermost first. Each record is
+       parsed with parse(), so it is validated against the parser schema.
+
+        example:
+
+            >>> class ShowInterfaces(StreamingParser, ShowInterfacesSchema):
+            ...     p1 = LazyPattern(r'^(?P<interface>\\S+) +is +...')
+            ...     stream_start = ('p1',)
+            ...
+            >>> with open('show_interfaces.txt') as f:
+            ...     for record in ShowInterfaces(device=dev).parse_iter(f):
+            ...         store(record)
+    '''
+
+    # names of the patterns starting a record
+    stream_start = ()
+
+    # names of the patterns of the context lines, outermost first
+    stream_context = ()
+
+    def parse_iter(self, output, **kwargs):
+        '''Parse output one record at a time, so the memory used is bounded
+           by the size of a record instead of the whole output
+
+           Each record is the parsed dictionary of one block of output, with
+           the same structure as the one returned by parse(). Merging all the
+           records gives the result of parse(), except for what the parser
+           derives from several records, such as a port-channel listing its
+           member interfaces.
+
+            Args:
+                output (`str`, `iterable`): the whole output, or an iterable
+                                            of its lines such as a file object
+                kwargs: the other arguments of cli()
+
+            Returns:
+                generator of `dict`
+        '''
+        start = [getattr(self, name) for name in self.stream_start]
+        context = [getattr(self, name) for name in self.stream_context]
+        for block in iter_blocks(output, start, context):
+            try:
+                yield self.parse(output=block, **kwargs)
+            except SchemaEmptyParserError:
+                continue
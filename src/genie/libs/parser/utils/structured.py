@@ -0,0 +1,411 @@
+'''Parse the structured outputs of the Junos '| display xml' and
+   '| display json' commands into the dictionaries of the parser schemas
+
+The schemas of the junos parsers mirror the XML of the outputs: the keys are
+the tags of the elements, '@junos:style' the attributes of the elements and
+'#text' their text when they have attributes, the lists being given by the
+ListOfDicts of the schemas. The outputs are converted following the schema,
+so that the dictionary is the one parsed from the text output, without the
+elements the schema does not have.
+'''
+
+import re
+import json
+import string
+import inspect
+from xml.parsers import expat
+
+from genie.metaparser.util.schemaengine import Any, Optional, Use, Or, ListOf
+
+from .schema import ListOfDicts
+from .xml_rows import CHUNK_SIZE, iter_xml_chunks
+
+# formats of the structured outputs, as in '| display xml'
+DISPLAYS = ('xml', 'json')
+
+# root of the outputs
+ROOT = 'rpc-reply'
+
+# start of the JSON outputs, after the prompt such as {master}
+_JSON_START = re.compile(r'\{\s*"')
+
+
+class StructuredOutputError(ValueError):
+    '''The output is not a structured output of the display requested'''
+
+
+# kinds of the values of the schemas
+_LEAF, _DICT, _ANY = range(3)
+
+
+class _Node(object):
+    '''Value of a schema: its kind, the schema of its dictionaries, the type
+       of its text, and whether it is a list'''
+
+    __slots__ = ('kind', 'keys', 'any', 'type', 'listed', 'nullable')
+
+    def __init__(self, kind, schema=None, type_=str, listed=False,
+                 nullable=False):
+        self.kind = kind
+        self.type = type_
+        # a list even of one element, the elements of the others being
+        # listed only when repeated
+        self.listed = listed
+        # None when the element is empty
+        self.nullable = nullable
+        self.keys = {}
+        self.any = None
+        if schema is not None:
+            for key, value in schema.items():
+                if isinstance(key, Any):
+                    self.any = value
+                elif isinstance(key, Optional):
+                    self.keys[key.schema] = value
+                elif isinstance(key, str):
+                    self.keys[key] = value
+
+
+def _node(value, cache):
+    '''the _Node of a value of a schema, made once per value'''
+    try:
+        return cache[id(value)][1]
+    except KeyError:
+        pass
+
+    if isinstance(value, dict):
+        node = _Node(_DICT, value)
+    elif isinstance(value, Use) and isinstance(value.schema, ListOfDicts):
+        # the lists which can be a dictionary are one when of one element
+        node = _Node(_DICT, value.schema.schema,
+                     listed=not value.schema.allow_dict)
+    elif isinstance(value, ListOf) and isinstance(value.schema, dict):
+        node = _Node(_DICT, value.schema, listed=True)
+    elif isinstance(value, list) and len(value) == 1 \
+            and isinstance(value[0], dict):
+        node = _Node(_DICT, value[0], listed=True)
+    elif isinstance(value, list) or value is list:
+        node = _Node(_LEAF, listed=True)
+    elif isinstance(value, Or):
+        types = value.schemas
+        node = _Node(_LEAF, nullable=None in types,
+                     type_=next((t for t in types
+                                 if t in (str, int, float, bool)), str))
+    elif value in (int, float, bool):
+        node = _Node(_LEAF, type_=value)
+    elif value is str:
+        node = _Node(_LEAF)
+    else:
+        # Use() of a function, or anything the schema does not describe
+        node = _Node(_ANY)
+    # keep the value, so that its id is not reused
+    cache[id(value)] = (value, node)
+    return node
+
+
+def _leaf_text(text):
+    if text[:1] == '\n':
+        # the text of some elements is on its own line, indented, the
+        # spaces of the other texts being the ones of the value
+        return text.strip()
+    return text
+
+
+class _Builder(object):
+    '''Build the dictionary of the schema from the elements of an output,
+       given in document order with start() and end()'''
+
+    def __init__(self, schema):
+        self.cache = {}
+        self.result = {}
+        # the open elements: their node, tag, attributes and children
+        self.stack = [[_node(schema, self.cache), None, {}, self.result]]
+        # depth in the elements the schema does not have
+        self.skipped = 0
+
+    def start(self, tag, attrib):
+        if self.skipped:
+            self.skipped += 1
+            return
+        parent = self.stack[-1][0]
+        if parent.kind == _ANY:
+            node = parent
+        elif tag in parent.keys:
+            node = _node(parent.keys[tag], self.cache)
+        elif parent.any is not None:
+            node = _node(parent.any, self.cache)
+        else:
+            # not in the schema, skipped with its children
+            self.skipped = 1
+            return
+        if node.kind == _LEAF:
+            attrib = {}
+        elif node.kind == _DICT:
+            attrib = {key: value for key, value in attrib.items()
+                      if key in node.keys}
+        self.stack.append([node, tag, attrib, None])
+
+    def end(self, text):
+        if self.skipped:
+            self.skipped -= 1
+            return
+        node, tag, attrib, children = self.stack.pop()
+
+        if node.kind == _LEAF:
+            if node.type is bool:
+                # flags, such as <iff-up/>
+                value = True
+            elif not text:
+                value = None if node.nullable else ''
+            else:
+                value = node.type(_leaf_text(text))
+        elif node.kind == _ANY and children is None and not attrib:
+            value = _leaf_text(text) if text else None
+        else:
+            value = children or {}
+            value.update(attrib)
+            # the text around the children is their indentation
+            text = text.strip() if text else None
+            if text and (node.kind == _ANY or '#text' in node.keys):
+                value['#text'] = text
+        self._add(node, tag, value)
+
+    def _add(self, node, tag, value):
+        parent = self.stack[-1]
+        if parent[3] is None:
+            parent[3] = {}
+        siblings = parent[3]
+        if node.listed:
+            siblings.setdefault(tag, []).append(value)
+        elif tag in siblings:
+            # repeated element, listed
+            if not isinstance(siblings[tag], list):
+                siblings[tag] = [siblings[tag]]
+            siblings[tag].append(value)
+        else:
+            siblings[tag] = value
+
+
+def _parse_xml(output, builder, chunk_size):
+    parser = expat.ParserCreate(namespace_separator='}')
+    parser.buffer_text = True
+    # prefixes of the namespaces of the attributes, such as junos
+    prefixes = {}
+    # the text of the open elements
+    texts = []
+    # whether the root of the output is an element of the rpc-reply rather
+    # than the rpc-reply itself, and whether it ended
+    wrapped = False
+    done = False
+
+    def local_name(name):
+        return name[name.find('}') + 1:]
+
+    def start_namespace(prefix, uri):
+        prefixes.setdefault(uri, prefix)
+
+    def start(name, attrib):
+        nonlocal wrapped
+        tag = local_name(name)
+        if not texts and tag != ROOT:
+            wrapped = True
+        if texts or wrapped:
+            attrs = {}
+            for key, value in attrib.items():
+                uri, _, local = key.rpartition('}')
+                prefix = prefixes.get(uri)
+                attrs['@{}:{}'.format(prefix, local) if prefix
+                      else '@' + local] = value
+            builder.start(tag, attrs)
+        texts.append([])
+
+    def end(name):
+        nonlocal done
+        text = ''.join(texts.pop())
+        if texts or wrapped:
+            builder.end(text)
+        if not texts:
+            done = True
+
+    def character_data(data):
+        if texts:
+            texts[-1].append(data)
+
+    parser.StartNamespaceDeclHandler = start_namespace
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = character_data
+
+    started = False
+    for chunk in iter_xml_chunks(output, chunk_size=chunk_size):
+        if not started:
+            # the command and the prompt may come before the XML
+            index = chunk.find('<')
+            if index < 0:
+                continue
+            chunk = chunk[index:]
+            started = True
+        try:
+            parser.Parse(chunk, False)
+        except expat.ExpatError as e:
+            if not done:
+                raise StructuredOutputError(str(e)) from None
+        if done:
+            # the prompt may come after the XML
+            return
+    if not started:
+        raise StructuredOutputError('output is not XML')
+    try:
+        parser.Parse('', True)
+    except expat.ExpatError as e:
+        if not done:
+            raise StructuredOutputError(str(e)) from None
+
+
+def _json_elements(builder, tag, values):
+    '''build the elements of the Junos JSON, each a list of objects whose
+       'attributes' and 'data' are the attributes and the text of the
+       element'''
+    if not isinstance(values, list):
+        values = [values]
+    for value in values:
+        if not isinstance(value, dict):
+            builder.start(tag, {})
+            builder.end(None if value is None else str(value))
+            continue
+        builder.start(tag, {'@' + name: attr for name, attr in
+                            (value.get('attributes') or {}).items()
+                            if name.partition(':')[0] != 'xmlns'})
+        for child, child_values in value.items():
+            if child not in ('attributes', 'data'):
+                _json_elements(builder, child, child_values)
+        data = value.get('data')
+        builder.end(None if data is None else str(data))
+
+
+def _parse_json(output, builder):
+    if not isinstance(output, str):
+        output = ''.join(output)
+    m = _JSON_START.search(output)
+    if not m:
+        raise StructuredOutputError('output is not JSON')
+    try:
+        top, _ = json.JSONDecoder().raw_decode(output, m.start())
+    except ValueError as e:
+        raise StructuredOutputError(str(e)) from None
+    if not isinstance(top, dict):
+        raise StructuredOutputError('output is not a JSON object')
+    for tag, values in top.items():
+        if tag != 'attributes':
+            _json_elements(builder, tag, values)
+
+
+def parse_structured(output, schema, display='xml', chunk_size=CHUNK_SIZE):
+    '''Convert the output of a Junos '| display xml' or '| display json'
+       command into a dictionary of the schema.
+
+       The XML output is parsed incrementally, and each element is converted
+       and dropped as soon as it ends, so only the dictionary is kept in
+       memory. The elements, attributes and namespace declarations the schema
+       does not have are left out, and so are the elements of the rpc-reply
+       the schema does not have, such as the cli banner. The text of the
+       elements on their own line is stripped, the spaces of the others
+       being kept as the text outputs show them, the flags the schema gives
+       as bool, which are empty elements, are True, and the repeated
+       elements are listed.
+
+        Args:
+            output (`str`, `iterable`): the whole output, or an iterable of
+                                        its chunks such as a file object
+            schema (`dict`): schema of the parser
+            display (`str`): format of the output, 'xml' or 'json'
+            chunk_size (`int`): size of the chunks of the XML output parsed
+                                at a time
+
+        Returns:
+            `dict`
+
+        Raises:
+            StructuredOutputError: the output is not of the format
+
+        example:
+
+            >>> parse_structured(device.execute('show route | display xml'),
+            ...                  ShowRoute.schema)
+            {'route-information': {'route-table': [{'table-name': 'inet.0',
+            ...
+    '''
+    builder = _Builder(schema)
+    if display == 'xml':
+        _parse_xml(output, builder, chunk_size)
+    elif display == 'json':
+        _parse_json(output, builder)
+    else:
+        raise ValueError("display must be one of {}".format(DISPLAYS))
+    return builder.result
+
+
+class StructuredParser(object):
+    '''Parser mixin adding xml(), parsing the structured output of the Junos
+       commands, for the junos parsers whose schema mirrors it.
+
+       The command is the one of cli_command with the fields of the
+       arguments, with '| display xml', or '| display json' with
+       display='json'.
+       When the device returns no structured output, such as an error on an
+       older release, or the output given is the text one, it is parsed by
+       cli() instead, and so it is when no command has the fields of the
+       arguments.
+
+        example:
+
+            >>> class ShowRoute(StructuredParser, ShowRouteSchema):
+            ...     cli_command = ['show route', 'show route {ip_address}']
+            ...
+            >>> ShowRoute(device=dev, context='xml').parse()
+            >>> ShowRoute(device=dev, context='xml').parse(display='json')
+    '''
+
+    def structured_command(self, **kwargs):
+        '''the command of cli_command with the fields of the arguments
+           given, and of the defaults of cli() such as protocol='bgp', the
+           one with the most fields, None if there is none'''
+        commands = self.cli_command
+        if isinstance(commands, str):
+            commands = [commands]
+        values = {name: param.default for name, param in
+                  inspect.signature(self.cli).parameters.items()
+                  if param.default is not param.empty}
+        values.update(kwargs)
+        given = {name for name, value in kwargs.items() if value is not None}
+        available = {name for name, value in values.items()
+                     if value is not None}
+
+        found = None
+        for command in commands:
+            fields = {name for _, name, _, _ in string.Formatter().parse(
+                command) if name}
+            if given <= fields <= available and (
+                    found is None or len(fields) > len(found[1])):
+                found = (command, fields)
+        if found is None:
+            return None
+        return found[0].format(**values)
+
+    def xml(self, output=None, display='xml', **kwargs):
+        if display not in DISPLAYS:
+            raise ValueError("display must be one of {}".format(DISPLAYS))
+        if output is None:
+            command = self.structured_command(**kwargs)
+            if command is None:
+                return self.cli(**kwargs)
+            out = self.device.execute(
+                '{} | display {}'.format(command, display))
+        else:
+            out = output
+
+        try:
+            return parse_structured(out, self.schema, display=display)
+        except StructuredOutputError:
+            if output is None:
+                return self.cli(**kwargs)
+            return self.cli(output=output, **kwargs)
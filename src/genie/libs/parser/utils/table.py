@@ -0,0 +1,170 @@
+'''Read the fixed-width tables of the outputs, one column per header field'''
+
+import re
+
+from .dispatch import literal_prefix, required_literal
+
+# rows without any letter or digit, such as the dashes under the header,
+# are skipped
+_ROW = re.compile(r'[a-zA-Z0-9]')
+
+
+class TableReader(object):
+    '''Reader of a fixed-width table, giving the same entries as
+       genie.parsergen.oper_fill_tabular for the same arguments.
+
+       The columns are located by the header fields in the header line, and
+       each row is sliced at those columns rather than matched.
+       The header pattern is compiled on the first read only and the columns
+       are cached per header line, so a reader is meant to be created once,
+       as a class attribute of the parser, and used for all its outputs.
+
+       A column starts at its header field and ends where the next one
+       starts, or, for right justified headers, starts just after the
+       previous header field and ends with its own. The first column starts
+       at the beginning of the row, and the last one ends with the row. A
+       header line seen again in the table sets the columns again, and the
+       rows after a line matching the terminal pattern are not read until
+       the next header line.
+
+        Args:
+            header_fields (`list`): patterns of the header fields, in order,
+                                    as in the header line
+            label_fields (`list`): keys of the values of the header fields in
+                                   the entries, the header fields by default
+            index (`int`, `list`): position of the header fields whose values
+                                   key the entries, outermost first
+            table_terminal_pattern (`str`): pattern of the line ending the
+                                            table, searched in each line with
+                                            its '\\n' line ending
+            right_justified (`bool`): whether the header fields are aligned
+                                      on the right of their column
+
+        example:
+
+            >>> class ShowSoftware(ShowSoftwareSchema):
+            ...     table = TableReader(
+            ...         header_fields=["VERSION", "ACTIVE", "DEFAULT"],
+            ...         label_fields=["version", "active", "default"])
+            ...
+            ...     def cli(self, output=None):
+            ...         entries = self.table.read(out)
+            >>> entries
+            {'99.99.999-4567': {'version': '99.99.999-4567',
+                                'active': 'true',
+                                'default': 'true'}}
+    '''
+
+    def __init__(self, header_fields, label_fields=None, index=0,
+                 table_terminal_pattern=None, right_justified=False):
+        if label_fields is not None and \
+                len(label_fields) != len(header_fields):
+            raise ValueError('label_fields and header_fields are not of the '
+                             'same length')
+        self.header_fields = list(header_fields)
+        self.label_fields = list(label_fields or header_fields)
+        self.index = [index] if isinstance(index, int) else list(index)
+        self.table_terminal_pattern = table_terminal_pattern
+        self.right_justified = right_justified
+
+        # compiled on first read
+        self._header = None
+        self._header_literal = None
+        self._terminal = None
+
+        # columns per header line
+        self._columns = {}
+
+    def _compile(self):
+        self._header = re.compile(r'\s*' + r'\s*'.join(
+            '(?P<field{}>{})'.format(i, field)
+            for i, field in enumerate(self.header_fields)) + r'\s*$')
+        # the header line contains the longest literal of the header fields
+        literals = []
+        for field in self.header_fields:
+            field = re.compile(field)
+            literals += [literal_prefix(field), required_literal(field)]
+        self._header_literal = max(literals, key=len)
+        if self.table_terminal_pattern:
+            self._terminal = re.compile(self.table_terminal_pattern)
+
+    def _header_columns(self, line):
+        '''the (start, end) of each column of the table of header line, or
+           None if it is not the header line'''
+        if self._header_literal not in line:
+            return None
+        m = self._header.search(line)
+        if not m:
+            return None
+
+        # the columns are counted from the start of the header
+        header = line[m.start():]
+        try:
+            return self._columns[header]
+        except KeyError:
+            pass
+
+        if self.right_justified:
+            # from the end of the previous field to the end of the field
+            bounds = [m.end('field{}'.format(i)) - m.start()
+                      for i in range(len(self.header_fields) - 1)]
+        else:
+            # from the start of the field to the start of the next one
+            bounds = [m.start('field{}'.format(i)) - m.start()
+                      for i in range(1, len(self.header_fields))]
+        columns = self._columns[header] = list(zip([0] + bounds,
+                                                   bounds + [None]))
+        return columns
+
+    def read(self, output):
+        '''Read the rows of the table in output
+
+            Args:
+                output (`str`): output of the command
+
+            Returns:
+                `dict` of the entries, keyed by the values of the index
+                fields, each the `dict` of the values of its row keyed by
+                the label fields
+        '''
+        if self._header is None:
+            self._compile()
+        terminal = self._terminal
+        labels = self.label_fields
+        index = self.index
+
+        entries = {}
+        columns = None
+        # whether only empty lines were seen since the header line
+        header_end = False
+        for line in output.splitlines():
+            # the terminal pattern is searched with the line ending
+            line += '\n'
+            expanded = line.expandtabs()
+            header_columns = self._header_columns(expanded)
+            if header_columns is not None:
+                columns = header_columns
+                header_end = True
+                continue
+            if columns is None:
+                continue
+
+            # the empty lines right after the header line do not end the
+            # table
+            if header_end and line == '\n':
+                continue
+            header_end = False
+            if terminal and terminal.search(line):
+                columns = None
+                continue
+            if not _ROW.search(line):
+                continue
+
+            line = expanded
+
+            values = [line[start:end].strip() for start, end in columns]
+            entry = entries
+            for i in index[:-1]:
+                entry = entry.setdefault(values[i], {})
+            entry[values[index[-1]]] = dict(zip(labels, values))
+        return entries
@@ -2,4 +2,4 @@ import os
 from genie import abstract
 abstract.declare_package(__name__)
 
-package_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '') 
\ No newline at end of file
+package_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '') 
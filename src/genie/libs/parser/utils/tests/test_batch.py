@@ -0,0 +1,140 @@
+import os
+import time
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from pyats.topology import Device
+from pyats.connections.pool import ConnectionPool
+from unicon.bases.connection import Connection
+
+from genie.libs.parser.utils.batch import execute_commands
+from genie.libs.parser.nxos.show_vrf import ShowRunningConfigVrf
+
+OUTPUTS = {
+    'show vrf': '''
+        N7k# show vrf
+        VRF-Name                           VRF-ID State   Reason
+        VRF1                                    3 Up      --
+        VRF2                                    4 Up      --
+        default                                 1 Up      --
+        ''',
+    "show running-config vrf VRF1 | sec '^vrf'": '''
+        vrf context VRF1
+          vni 10100
+          rd auto
+          address-family ipv4 unicast
+            route-target both auto evpn
+        ''',
+    "show running-config vrf VRF2 | sec '^vrf'": '''
+        vrf context VRF2
+          vni 10200
+          rd 65000:2
+        ''',
+    "show running-config vrf default | sec '^vrf'": '',
+}
+
+
+def execute(command):
+    '''execute() of a device, or of a unicon connection given a list'''
+    if isinstance(command, str):
+        return OUTPUTS[command]
+    result = {}
+    for c in command:
+        if c in result:
+            if not isinstance(result[c], list):
+                result[c] = [result[c]]
+            result[c].append(OUTPUTS[c])
+        else:
+            result[c] = OUTPUTS[c]
+    return list(result.values())[0] if len(result) == 1 else result
+
+
+def connection_of(cls, side_effect=execute, **kwargs):
+    '''mocked connection, its services such as execute() are not attributes
+       of its class'''
+    connection = Mock(spec=cls, **kwargs)
+    connection.execute = Mock(side_effect=side_effect)
+    return connection
+
+
+def device_with(connection):
+    device = Device(name='aDevice', os='nxos')
+    device.connectionmgr.connections[device.default_connection_alias] = \
+        connection
+    return device
+
+
+class TestExecuteCommands(unittest.TestCase):
+
+    commands = ["show running-config vrf VRF2 | sec '^vrf'",
+                'show vrf',
+                "show running-config vrf VRF1 | sec '^vrf'",
+                'show vrf']
+
+    def test_sequential(self):
+        device = Mock(**{'execute.side_effect': execute})
+        self.assertEqual(execute_commands(device, self.commands),
+                         [OUTPUTS[c] for c in self.commands])
+        self.assertEqual([c.args[0] for c in device.execute.call_args_list],
+                         self.commands)
+
+    def test_session(self):
+        connection = connection_of(Connection)
+        device = device_with(connection)
+        self.assertEqual(execute_commands(device, self.commands),
+                         [OUTPUTS[c] for c in self.commands])
+        connection.execute.assert_called_once_with(self.commands)
+
+        # a single command executed several times
+        connection.execute.reset_mock()
+        self.assertEqual(execute_commands(device, ['show vrf'] * 3),
+                         [OUTPUTS['show vrf']] * 3)
+        connection.execute.assert_called_once_with(['show vrf'] * 3)
+
+    def test_pool(self):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_execute(command):
+            with lock:
+                running.append(command)
+                peak.append(len(running))
+            # the first commands take the longest
+            time.sleep(0.05 * (len(self.commands) - len(peak)))
+            with lock:
+                running.remove(command)
+            return OUTPUTS[command]
+
+        connection = connection_of(ConnectionPool, slow_execute, size=2)
+        device = device_with(connection)
+        self.assertEqual(execute_commands(device, self.commands),
+                         [OUTPUTS[c] for c in self.commands])
+        self.assertEqual(connection.execute.call_count, len(self.commands))
+        self.assertEqual(max(peak), 2)
+
+    def test_disabled(self):
+        connection = connection_of(Connection)
+        device = device_with(connection)
+        with patch.dict(os.environ,
+                        {'GENIE_LIBS_PARSER_BATCH_EXECUTE': 'false'}):
+            self.assertEqual(execute_commands(device, self.commands),
+                             [OUTPUTS[c] for c in self.commands])
+        self.assertEqual(connection.execute.call_count, len(self.commands))
+
+    def test_parser(self):
+        expected = ShowRunningConfigVrf(
+            device=Mock(**{'execute.side_effect': execute})).parse()
+        self.assertEqual(sorted(expected['vrf']), ['VRF1', 'VRF2'])
+
+        connection = connection_of(Connection)
+        self.assertEqual(
+            ShowRunningConfigVrf(device=device_with(connection)).parse(),
+            expected)
+        # show vrf, then the running configuration of all the vrfs at once
+        self.assertEqual(connection.execute.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+import array
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.schemaengine import Any, Optional, Use
+
+from genie.libs.parser.utils.columnar import to_columns
+from genie.libs.parser.utils.schema import ListOfDicts
+
+from genie.libs.parser.iosxe.show_arp import ShowArp
+from genie.libs.parser.nxos.show_interface import ShowInterfaceStatus
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def rows(columns):
+    '''the rows of columns, as dictionaries without their None values'''
+    names = list(columns)
+    return [{name: value for name, value in zip(names, row)
+             if value is not None}
+            for row in zip(*columns.values())]
+
+
+class TestToColumns(unittest.TestCase):
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'id': int,
+                Optional('interfaces'): {
+                    Any(): {
+                        'counters': {
+                            'in_pkts': int,
+                            Optional('rate'): float,
+                        },
+                        Optional('vlans'): list,
+                    },
+                },
+                Optional('neighbors'): {
+                    Any(): str,
+                },
+                Optional('routes'): Use(ListOfDicts({
+                    'prefix': str,
+                }, 'routes')),
+            },
+        },
+        Optional('total'): int,
+    }
+
+    parsed = {
+        'vrf': {
+            'default': {
+                'id': 1,
+                'interfaces': {
+                    'Eth1': {'counters': {'in_pkts': 10, 'rate': 0.5},
+                             'vlans': [1, 2]},
+                    'Eth2': {'counters': {'in_pkts': 20}},
+                },
+                'neighbors': {'10.0.0.1': 'up'},
+            },
+            'red': {
+                'id': 2,
+                'routes': [{'prefix': '10.1.0.0/16'},
+                           {'prefix': '10.2.0.0/16'}],
+            },
+            'blue': {
+                'id': 3,
+            },
+        },
+        'total': 2,
+    }
+
+    def test_names(self):
+        self.assertEqual(list(to_columns({}, self.schema)), [
+            'vrf.*',
+            'vrf.*.id',
+            'vrf.*.interfaces.*',
+            'vrf.*.interfaces.*.counters.in_pkts',
+            'vrf.*.interfaces.*.counters.rate',
+            'vrf.*.interfaces.*.vlans',
+            'vrf.*.neighbors.*',
+            'vrf.*.neighbors.*.value',
+            'vrf.*.routes.*',
+            'vrf.*.routes.*.prefix',
+            'total',
+        ])
+
+    def test_rows(self):
+        self.assertEqual(rows(to_columns(self.parsed, self.schema)), [
+            {'vrf.*': 'default', 'vrf.*.id': 1, 'total': 2,
+             'vrf.*.interfaces.*': 'Eth1',
+             'vrf.*.interfaces.*.counters.in_pkts': 10,
+             'vrf.*.interfaces.*.counters.rate': 0.5,
+             'vrf.*.interfaces.*.vlans': [1, 2]},
+            {'vrf.*': 'default', 'vrf.*.id': 1, 'total': 2,
+             'vrf.*.interfaces.*': 'Eth2',
+             'vrf.*.interfaces.*.counters.in_pkts': 20},
+            {'vrf.*': 'default', 'vrf.*.id': 1, 'total': 2,
+             'vrf.*.neighbors.*': '10.0.0.1',
+             'vrf.*.neighbors.*.value': 'up'},
+            {'vrf.*': 'red', 'vrf.*.id': 2, 'total': 2,
+             'vrf.*.routes.*': 0, 'vrf.*.routes.*.prefix': '10.1.0.0/16'},
+            {'vrf.*': 'red', 'vrf.*.id': 2, 'total': 2,
+             'vrf.*.routes.*': 1, 'vrf.*.routes.*.prefix': '10.2.0.0/16'},
+            {'vrf.*': 'blue', 'vrf.*.id': 3, 'total': 2},
+        ])
+
+    def test_empty(self):
+        columns = to_columns({}, self.schema)
+        self.assertEqual(set(map(len, columns.values())), {0})
+        self.assertEqual(rows(to_columns({'total': 0}, self.schema)),
+                         [{'total': 0}])
+
+    def test_arrays(self):
+        columns = to_columns(self.parsed, self.schema, arrays='array')
+        self.assertEqual(columns['vrf.*.id'], array.array('q', [1] * 3 +
+                                                                [2] * 2 + [3]))
+        # None and lists are kept
+        self.assertIsInstance(columns['vrf.*.interfaces.*.counters.in_pkts'],
+                              list)
+        self.assertIsInstance(columns['vrf.*.interfaces.*.vlans'], list)
+
+        columns = to_columns({'vrf': {'default': {'id': 1, 'interfaces': {
+                                 'Eth1': {'counters': {'in_pkts': 1,
+                                                       'rate': 1}},
+                                 'Eth2': {'counters': {'in_pkts': 2,
+                                                       'rate': 0.5}}}}}},
+                             self.schema, arrays='array')
+        self.assertEqual(columns['vrf.*.interfaces.*.counters.rate'],
+                         array.array('d', [1.0, 0.5]))
+
+        with self.assertRaises(ValueError):
+            to_columns(self.parsed, self.schema, arrays='list')
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_numpy(self):
+        columns = to_columns(self.parsed, self.schema, arrays='numpy')
+        self.assertEqual(columns['vrf.*.id'].dtype, numpy.int64)
+        self.assertEqual(list(columns['vrf.*.id']), [1, 1, 1, 2, 2, 3])
+
+
+class TestColumnarParser(unittest.TestCase):
+
+    def test_show_arp(self):
+        output = '''
+            Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+            Internet  10.1.18.1              45   0012.7fff.04d7  ARPA   GigabitEthernet0/0
+            Internet  10.1.18.122             -   0050.56ff.ba6b  ARPA   GigabitEthernet0/0
+        '''
+        parser = ShowArp(device=Mock())
+        columns = parser.parse_columns(output=output)
+        self.assertEqual(columns['interfaces.*'], ['GigabitEthernet0/0'] * 2)
+        self.assertEqual(columns['interfaces.*.ipv4.neighbors.*.ip'],
+                         ['10.1.18.1', '10.1.18.122'])
+        self.assertEqual(columns['global_static_table.*'], [None, None])
+        self.assertEqual(columns,
+                         to_columns(parser.parse(output=output), ShowArp))
+
+    def test_show_interface_status(self):
+        output = '''
+            --------------------------------------------------------------------------------
+            Port          Name               Status    Vlan      Duplex  Speed   Type
+            --------------------------------------------------------------------------------
+            mgmt0         --                 connected routed    full    1000    --
+            Eth1/1        uplink             connected 1         full    10G     10Gbase-SR
+        '''
+        columns = ShowInterfaceStatus(device=Mock()).parse_columns(
+            output=output)
+        self.assertEqual(columns['interfaces.*'], ['mgmt0', 'Ethernet1/1'])
+        self.assertEqual(columns['interfaces.*.status'],
+                         ['connected', 'connected'])
+        self.assertEqual(columns['interfaces.*.port_speed'], ['1000', '10G'])
+
+
+if __name__ == '__main__':
+    unittest.main()
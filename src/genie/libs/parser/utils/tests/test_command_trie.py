@@ -0,0 +1,70 @@
+import re
+import unittest
+
+from genie.libs.parser.utils.common import (
+    CommandTrie,
+    _matches_fuzzy,
+    _get_command_trie,
+    invalidate_parser_lookup,
+    parser_data
+)
+
+
+class TestCommandTrie(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = CommandTrie([
+            'show version',
+            'show vrf',
+            'show vrf {vrf}',
+            'show ip route',
+            'show ip route vrf {vrf}',
+            'show bgp {address_family} summary',
+            '/dna/intent/api/v1/interface/{interface}',
+        ])
+
+    def test_prefix_keywords(self):
+        self.assertEqual(self.trie.candidates(['sh', 'ver']),
+                         ['show version'])
+        self.assertEqual(self.trie.candidates(['show', 'v']),
+                         ['show version', 'show vrf'])
+
+    def test_arguments(self):
+        self.assertEqual(self.trie.candidates(['show', 'vrf', 'VRF1']),
+                         ['show vrf {vrf}'])
+        # vrf argument can only be a single token
+        self.assertEqual(self.trie.candidates(['show', 'vrf', 'a', 'b']), [])
+        # other arguments can span two tokens
+        self.assertEqual(
+            self.trie.candidates(['show', 'bgp', 'ipv4', 'unicast',
+                                  'summary']),
+            ['show bgp {address_family} summary'])
+
+    def test_embedded_argument(self):
+        self.assertEqual(
+            self.trie.candidates(['/dna/intent/api/v1/interface/argument']),
+            ['/dna/intent/api/v1/interface/{interface}'])
+
+    def test_fuzzy_regex_token(self):
+        self.assertEqual(self.trie.candidates(['show', 'ip', '.*'], True),
+                         ['show ip route', 'show ip route vrf {vrf}'])
+
+    def test_candidates_same_as_linear_search(self):
+        trie = _get_command_trie()
+        for command in parser_data:
+            search = re.sub('{.*?}', 'argument', command).split()
+            expected = [c for c in parser_data
+                        if _matches_fuzzy(0, 0, search.copy(), c, {}, False)]
+            candidates = trie.candidates(search)
+            for c in expected:
+                self.assertIn(c, candidates, command)
+
+    def test_invalidate(self):
+        trie = _get_command_trie('iosxe')
+        self.assertIs(trie, _get_command_trie('iosxe'))
+        invalidate_parser_lookup()
+        self.assertIsNot(trie, _get_command_trie('iosxe'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+
+from genie.libs.parser.utils.common import Common, INTF_NAME_PREFIXES
+
+
+class TestConvertIntfName(unittest.TestCase):
+
+    abbreviations = {
+        'Eth1/1': 'Ethernet1/1',
+        'Lo0': 'Loopback0',
+        'lo0': 'Loopback0',
+        'Fa0/1': 'FastEthernet0/1',
+        'Fas0/1': 'FastEthernet0/1',
+        'Po10': 'Port-channel10',
+        'PO10': 'Port-channel10',
+        'Null0': 'Null0',
+        'Gi1/0/1': 'GigabitEthernet1/0/1',
+        'Gig1/0/1': 'GigabitEthernet1/0/1',
+        'GE1/0/1': 'GigabitEthernet1/0/1',
+        'Te1/0/1': 'TenGigabitEthernet1/0/1',
+        'Ten1/0/1': 'TenGigabitEthernet1/0/1',
+        'Tw1/0/1': 'TwoGigabitEthernet1/0/1',
+        'Two1/0/1': 'TwoGigabitEthernet1/0/1',
+        'Twe1/0/1': 'TwentyFiveGigE1/0/1',
+        'mgmt0': 'mgmt0',
+        'Vl100': 'Vlan100',
+        'Tu1': 'Tunnel1',
+        'Fe0/1': '0/1',
+        'Hs1/0': 'HSSI1/0',
+        'AT1/0': 'ATM1/0',
+        'Et0/0': 'Ethernet0/0',
+        'BD10': 'BDI10',
+        'Se0/0/0': 'Serial0/0/0',
+        'Fo1/0/1': 'FortyGigabitEthernet1/0/1',
+        'For1/0/1': 'FortyGigabitEthernet1/0/1',
+        'Hu1/0/1': 'HundredGigE1/0/1',
+        'Hun1/0/1': 'HundredGigE1/0/1',
+        'vl1': 'vasileft1',
+        'vr1': 'vasiright1',
+        'BE1': 'Bundle-Ether1',
+    }
+
+    def test_abbreviations(self):
+        self.assertEqual(
+            sorted({''.join(c for c in intf if c.isalpha())
+                    for intf in self.abbreviations}),
+            sorted(INTF_NAME_PREFIXES))
+        for intf, expected in self.abbreviations.items():
+            with self.subTest(intf=intf):
+                self.assertEqual(Common.convert_intf_name(intf), expected)
+
+    def test_unknown(self):
+        for intf, expected in {
+                'GigabitEthernet1/0/1': 'GigabitEthernet1/0/1',
+                'Port-channel1': 'Port-channel1',
+                'ethernet1/1': 'Ethernet1/1',
+                'fastethernet 0/1': 'FastEthernet0/1',
+                'nve1': 'Nve1',
+                'Gi1/0/1.100': 'GigabitEthernet1/0/1.100',
+                # only the first port is kept
+                'Gi1/0/1:2': 'GigabitEthernet1/0/1',
+                '1/0/1 Gi': 'GigabitEthernet1/0/1',
+                }.items():
+            with self.subTest(intf=intf):
+                self.assertEqual(Common.convert_intf_name(intf), expected)
+
+    def test_not_an_interface(self):
+        for intf in ('', 'mgmt', 'Gi', '1/0/1', '--'):
+            with self.subTest(intf=intf):
+                self.assertEqual(Common.convert_intf_name(intf), intf)
+
+    def test_convert_intf_names(self):
+        intfs = list(self.abbreviations) * 2 + ['nve1', '']
+        self.assertEqual(Common.convert_intf_names(intfs),
+                         [Common.convert_intf_name(intf) for intf in intfs])
+        self.assertEqual(Common.convert_intf_names(iter(['Gi1', 'Te1'])),
+                         ['GigabitEthernet1', 'TenGigabitEthernet1'])
+        self.assertEqual(Common.convert_intf_names([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
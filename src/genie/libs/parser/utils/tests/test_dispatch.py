@@ -0,0 +1,249 @@
+import re
+import json
+import pathlib
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils.patterns import LazyPattern
+from genie.libs.parser.utils.dispatch import LineDispatcher, \
+                                            ParserDispatcher, \
+                                            literal_prefix, \
+                                            first_chars, \
+                                            required_literal, \
+                                            patterns_overlap
+
+from genie.libs.parser.iosxe import show_bgp as iosxe_show_bgp, \
+                                    show_ospf as iosxe_show_ospf, \
+                                    show_interface as iosxe_show_interface
+
+PARSER_DIR = pathlib.Path(__file__).resolve().parents[2]
+
+
+class TestPatternAnalysis(unittest.TestCase):
+
+    def test_literal_prefix(self):
+        self.assertEqual(
+            literal_prefix(re.compile(r'^Hardware +is +(?P<type>.+)$')),
+            'Hardware ')
+        self.assertEqual(
+            literal_prefix(re.compile(r'^(Internet +address) +is')),
+            'Internet ')
+        self.assertEqual(
+            literal_prefix(re.compile(r'^(?P<intf>\S+) +is')), '')
+        self.assertEqual(
+            literal_prefix(re.compile(r'^mtu +\d+', re.IGNORECASE)), '')
+        self.assertEqual(
+            literal_prefix(re.compile(r'^ {2}Local')), '  Local')
+
+    def test_first_chars(self):
+        self.assertEqual(first_chars(re.compile(r'^[0-9]+ +packets')),
+                         set('0123456789'))
+        self.assertEqual(first_chars(re.compile(r'^(?P<a>Gi|Te)\S+')),
+                         {'G', 'T'})
+        self.assertEqual(first_chars(re.compile(r'^m', re.IGNORECASE)),
+                         {'m', 'M'})
+        self.assertIsNone(first_chars(re.compile(r'^(?P<a>\d+)?x')))
+        self.assertIsNone(first_chars(re.compile(r'^$')))
+
+    def test_required_literal(self):
+        self.assertEqual(required_literal(re.compile(
+            r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+)')),
+            ' packets ')
+        # the prefix is not repeated
+        self.assertEqual(required_literal(re.compile(r'^Hardware +is')),
+                         ' is')
+        self.assertEqual(required_literal(re.compile(r'^(?P<a>\S+)')), '')
+        self.assertEqual(required_literal(re.compile(r'^(a|b) +c')), ' c')
+        self.assertEqual(
+            required_literal(re.compile(r'^\S+ +port', re.IGNORECASE)), '')
+
+    def test_patterns_overlap(self):
+        cases = [
+            (r'^(?P<pkts>\d+) +packets +input', r'^(?P<rate>\d+) +minute',
+             False),
+            (r'^(?P<intf>\S+) +is +(?P<status>.+)', r'^Hardware +is +(?P<a>.+)',
+             True),
+            # a line matched by one of them starts a line of the other
+            (r'^Hardware', r'^Hardware +address', True),
+            (r'^ab$', r'^ac', False),
+            (r'^(a|b)c', r'^bc', True),
+            (r'^(?:ab)*c', r'^ababd', False),
+            (r'^a{3}', r'^aab', False),
+            (r'^a{2,}', r'^aab', True),
+            (r'^mtu', r'^MTU', False),
+            (r'(?i)^mtu', r'^MTU', True),
+            (r'^[a-z]', r'^é', False),
+            (r'^\w', r'^é', True),
+            (r'^[^a]', r'^é', True),
+            # the lookaheads and backreferences are not analysed
+            (r'^(?=x)a', r'^a', True),
+            (r'^(\d)\1', r'^12', True),
+            (r'^(\d)\1', r'^a', False),
+        ]
+        for a, b, overlap in cases:
+            with self.subTest(a=a, b=b):
+                self.assertEqual(patterns_overlap(re.compile(a),
+                                                  re.compile(b)), overlap)
+                self.assertEqual(patterns_overlap(re.compile(b),
+                                                  re.compile(a)), overlap)
+
+
+class TestLineDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.p1 = re.compile(r'^(?P<intf>\S+) +is +(?P<status>\w+)$')
+        self.p2 = re.compile(r'^Hardware +is +(?P<type>.+)$')
+        self.p3 = re.compile(r'^(?P<pkts>\d+) +packets +input$')
+        self.p4 = re.compile(r'^Hardware +address +(?P<mac>\S+)$')
+        self.dispatcher = LineDispatcher([self.p1, self.p2,
+                                          self.p3, self.p4])
+
+    def tearDown(self):
+        LineDispatcher.enabled = True
+        LineDispatcher.adaptive = False
+
+    def test_first_match_in_order(self):
+        # p1 is tried first and matches too
+        pattern, m = self.dispatcher.match('Hardware is Gigabit')
+        self.assertIs(pattern, self.p1)
+        self.assertEqual(m.groupdict(), {'intf': 'Hardware',
+                                         'status': 'Gigabit'})
+
+        pattern, m = self.dispatcher.match('Hardware is Gigabit Ethernet')
+        self.assertIs(pattern, self.p2)
+        self.assertEqual(m.group('type'), 'Gigabit Ethernet')
+
+        pattern, m = self.dispatcher.match('10 packets input')
+        self.assertIs(pattern, self.p3)
+
+        pattern, m = self.dispatcher.match('Hardware address 0000.1111.2222')
+        self.assertIs(pattern, self.p4)
+
+    def test_no_match(self):
+        self.assertEqual(self.dispatcher.match('Description: uplink'),
+                         (None, None))
+        self.assertEqual(self.dispatcher.match(''), (None, None))
+        self.assertEqual(self.dispatcher.match('é'), (None, None))
+
+    def test_candidates(self):
+        # p2 and p4 share the 'Hardware ' prefix, the required literals
+        # tell them apart
+        self.assertEqual(self.dispatcher.candidates('Hardware address x'),
+                         (self.p1, self.p2, self.p4))
+        self.assertEqual(self.dispatcher.candidates('Hard'), (self.p1,))
+        self.assertEqual(self.dispatcher.candidates('10 packets input'),
+                         (self.p1, self.p3))
+        self.assertEqual(self.dispatcher.candidates(''),
+                         (self.p1, self.p3))
+
+    def test_disabled(self):
+        LineDispatcher.enabled = False
+        self.assertEqual(self.dispatcher.candidates('10 packets input'),
+                         (self.p1, self.p2, self.p3, self.p4))
+        pattern, m = self.dispatcher.match('Hardware is Gigabit Ethernet')
+        self.assertIs(pattern, self.p2)
+
+    def test_same_as_sequential(self):
+        lines = ['Vlan1 is up', 'Hardware is', 'Hardware  is  x',
+                 'Hardware address', 'Hardware address a b', '1 packets input',
+                 '12packets input', ' 1 packets input', 'H', '']
+        for line in lines:
+            expected = next(((p, p.match(line).group()) for p in
+                             self.dispatcher.patterns if p.match(line)),
+                            (None, None))
+            pattern, m = self.dispatcher.match(line)
+            self.assertEqual((pattern, m.group() if m else None), expected,
+                             line)
+
+    def test_adaptive(self):
+        LineDispatcher.adaptive = True
+        self.dispatcher.rank_interval = 2
+        for _ in range(4):
+            self.dispatcher.match('10 packets input')
+            self.dispatcher.match('Hardware is Gigabit Ethernet')
+
+        # p3 is attempted first as no line matches both p1 and p3, p2 stays
+        # after p1 which matches some of its lines
+        ranked = lambda line: tuple(pattern for pattern, _, _ in
+                                    self.dispatcher._node(line).ranked)
+        self.assertEqual(ranked('10 packets input'), (self.p3, self.p1))
+        self.assertEqual(ranked('Hardware is'), (self.p1, self.p2, self.p4))
+        self.assertIs(self.dispatcher.match('Hardware is Gigabit')[0],
+                      self.p1)
+        self.test_same_as_sequential()
+
+
+class TestParserDispatcher(unittest.TestCase):
+
+    def test_per_class(self):
+        class Parser(object):
+            p1 = LazyPattern(r'^Hardware +is +(?P<type>.+)$')
+            p2 = LazyPattern(r'^MTU +(?P<mtu>\d+)')
+            dispatcher = ParserDispatcher('p2', 'p1')
+
+        class Child(Parser):
+            p1 = LazyPattern(r'^Hardware +type +(?P<type>.+)$')
+
+        self.assertIs(Parser().dispatcher, Parser.dispatcher)
+        self.assertEqual(Parser.dispatcher.patterns, (Parser.p2, Parser.p1))
+        self.assertEqual(Child.dispatcher.patterns, (Parser.p2, Child.p1))
+        self.assertIsNot(Child.dispatcher, Parser.dispatcher)
+
+
+class TestDispatchedParsers(unittest.TestCase):
+    '''Parsers give the same result with and without line dispatch, and
+       with adaptive dispatch'''
+
+    maxDiff = None
+
+    parsers = [
+        (iosxe_show_interface, ['ShowInterfaces', 'ShowInterfacesSwitchport',
+                                'ShowIpInterface', 'ShowIpv6Interface']),
+        (iosxe_show_bgp, ['ShowBgpAllDetail', 'ShowBgpAllSummary',
+                          'ShowBgpAllNeighbors']),
+        (iosxe_show_ospf, ['ShowIpOspf', 'ShowIpOspfInterface2',
+                           'ShowIpOspfDatabaseRouter', 'ShowIpOspfTraffic']),
+    ]
+
+    def tearDown(self):
+        LineDispatcher.enabled = True
+        LineDispatcher.adaptive = False
+        LineDispatcher.rank_interval = 64
+
+    def _parse(self, cls, output, arguments):
+        try:
+            return cls(device=Mock()).parse(output=output, **arguments)
+        except SchemaEmptyParserError:
+            return None
+
+    def test_golden_outputs(self):
+        for module, names in self.parsers:
+            folder = PARSER_DIR / module.__name__.split('.')[-2] / 'tests'
+            for name in names:
+                cls = getattr(module, name)
+                for output_file in sorted(
+                        (folder / name / 'cli' / 'equal').glob('*_output.txt')):
+                    arguments_file = output_file.with_name(
+                        output_file.name.replace('_output.txt',
+                                                 '_arguments.json'))
+                    arguments = json.loads(arguments_file.read_text()) \
+                        if arguments_file.exists() else {}
+                    output = output_file.read_text()
+                    with self.subTest(parser=name, output=output_file.name):
+                        LineDispatcher.enabled = True
+                        dispatched = self._parse(cls, output, arguments)
+                        LineDispatcher.enabled = False
+                        sequential = self._parse(cls, output, arguments)
+                        self.assertEqual(dispatched, sequential)
+                        LineDispatcher.enabled = True
+                        LineDispatcher.adaptive = True
+                        LineDispatcher.rank_interval = 1
+                        adaptive = self._parse(cls, output, arguments)
+                        LineDispatcher.adaptive = False
+                        self.assertEqual(adaptive, sequential)
+
+
+if __name__ == '__main__':
+    unittest.main()
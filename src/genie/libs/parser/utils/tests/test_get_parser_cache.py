@@ -0,0 +1,61 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.common import (
+    get_parser,
+    get_parser_cache_info,
+    invalidate_parser_lookup,
+    parser_data
+)
+from genie.libs.parser.utils.entry_points import add_parser
+
+
+class TestGetParserCache(unittest.TestCase):
+
+    def setUp(self):
+        invalidate_parser_lookup()
+        self.device = Mock(os='iosxe',
+                           custom={'abstraction': {'order': ['os']}})
+
+    def test_hits_and_misses(self):
+        cls, kwargs = get_parser('show ip route vrf VRF1', self.device)
+        self.assertEqual(kwargs, {'vrf': 'VRF1'})
+        self.assertEqual(get_parser_cache_info().misses, 1)
+
+        # Whitespace differences resolve to the same entry
+        cached_cls, cached_kwargs = get_parser('show  ip route vrf VRF1 ',
+                                               self.device)
+        self.assertIs(cached_cls, cls)
+        self.assertEqual(cached_kwargs, kwargs)
+        self.assertEqual(get_parser_cache_info().hits, 1)
+
+    def test_returned_kwargs_are_copies(self):
+        _, kwargs = get_parser('show ip route vrf VRF1', self.device)
+        kwargs['vrf'] = 'changed'
+        _, kwargs = get_parser('show ip route vrf VRF1', self.device)
+        self.assertEqual(kwargs, {'vrf': 'VRF1'})
+
+    def test_keyed_by_os(self):
+        get_parser('show version', self.device)
+        nxos = Mock(os='nxos', custom={'abstraction': {'order': ['os']}})
+        get_parser('show version', nxos)
+        self.assertEqual(get_parser_cache_info().misses, 2)
+        self.assertEqual(get_parser_cache_info().currsize, 2)
+
+    def test_add_parser_invalidates(self):
+        get_parser('show version', self.device)
+        self.assertEqual(get_parser_cache_info().currsize, 1)
+
+        cli_command = 'show test_get_parser_cache_invalidate'
+        mock_parser = Mock()
+        mock_parser.MockParser = Mock(cli_command=cli_command)
+        mock_parser.MockParser.__name__ = 'iosxe.MockParser'
+        add_parser(parser=mock_parser.MockParser, os_name='iosxe')
+        self.addCleanup(invalidate_parser_lookup)
+        self.addCleanup(parser_data.pop, cli_command)
+
+        self.assertEqual(get_parser_cache_info().currsize, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
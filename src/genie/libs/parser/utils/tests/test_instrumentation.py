@@ -0,0 +1,159 @@
+import gc
+import os
+import json
+import time
+import tempfile
+import weakref
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils import instrumentation
+from genie.libs.parser.utils.instrumentation import (
+    PHASES, dump_stats, enable_instrumentation, get_records, get_stats,
+    reset_stats)
+from genie.libs.parser.utils.parse_cache import ParseCache, cached_parse
+
+
+class ShowVrfSchema(MetaParser):
+    schema = {'vrf': {str: {'id': int}}}
+
+
+class ShowVrf(ShowVrfSchema):
+    cli_command = 'show vrf'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+        ret_dict = {}
+        for line in output.splitlines():
+            name, vrf_id = line.split()
+            ret_dict.setdefault('vrf', {})[name] = {'id': int(vrf_id)}
+        return ret_dict
+
+
+class ShowBgpSchema(MetaParser):
+    schema = {'vrf': {str: {'neighbors': int}}}
+
+
+class ShowBgp(ShowBgpSchema):
+    cli_command = 'show bgp vrf {vrf}'
+
+    def cli(self, output=None):
+        ret_dict = {}
+        for vrf in cached_parse(ShowVrf, self.device)['vrf']:
+            out = self.device.execute(self.cli_command.format(vrf=vrf))
+            ret_dict.setdefault('vrf', {})[vrf] = {
+                'neighbors': len(out.splitlines())}
+        return ret_dict
+
+
+def execute(command):
+    time.sleep(0.01)
+    if command == 'show vrf':
+        return 'default 1\nmgmt 2'
+    return '10.1.1.1\n10.2.2.2'
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        enable_instrumentation()
+        self.addCleanup(enable_instrumentation, False)
+        self.addCleanup(reset_stats)
+        self.device = Mock(**{'execute.side_effect': execute})
+
+    def test_phases(self):
+        parsed = ShowBgp(device=self.device).parse()
+        self.assertEqual(parsed['vrf']['mgmt'], {'neighbors': 2})
+
+        vrf, bgp = get_records()
+        self.assertEqual(vrf['command'], 'show vrf')
+        self.assertEqual((vrf['output_bytes'], vrf['output_lines'],
+                          vrf['result_size']), (16, 2, 5))
+        self.assertEqual(bgp['command'], 'show bgp vrf default')
+        self.assertEqual(bgp['output_lines'], 4)
+        self.assertGreaterEqual(bgp['execute'], 0.02)
+        # the parse of the vrfs is in the nested time of the bgp one only
+        self.assertGreaterEqual(bgp['nested'], vrf['total'])
+        self.assertLess(bgp['parse'], 0.01)
+        for record in (vrf, bgp):
+            self.assertAlmostEqual(sum(record[phase] for phase in PHASES
+                                       if phase != 'total'),
+                                   record['total'], places=3)
+
+        # the parser is the same after the parse
+        parser = ShowVrf(device=self.device)
+        parser.parse()
+        self.assertIs(parser.device, self.device)
+        self.assertNotIn('cli', vars(parser))
+
+    def test_stats(self):
+        for _ in range(2):
+            ShowBgp(device=self.device).parse()
+        with self.assertRaises(SchemaEmptyParserError):
+            ShowVrf(device=self.device).parse(output='')
+
+        stats = get_stats('ShowVrf')
+        self.assertEqual([(entry['command'], entry['count'], entry['errors'])
+                          for entry in stats],
+                         [('show vrf', 2, 0), (None, 1, 1)])
+        self.assertEqual(get_stats(command='show vrf'), stats[:1])
+        self.assertEqual(set(stats[0]['timings']), set(PHASES))
+        timing = stats[0]['timings']['execute']
+        self.assertAlmostEqual(timing['mean'], timing['total'] / 2)
+        self.assertEqual(get_stats(
+            ShowBgp.__module__ + '.ShowBgp')[0]['count'], 2)
+
+        reset_stats()
+        self.assertEqual((get_stats(), get_records()), ([], []))
+
+    def test_parse_cache(self):
+        # the device is the same one for the caches of the sub-parsers
+        with ParseCache():
+            ShowBgp(device=self.device).parse()
+            ShowBgp(device=self.device).parse()
+        self.assertEqual(get_stats('ShowVrf')[0]['count'], 1)
+
+    def test_parse_cache_clear(self):
+        # the results are cached for the device, not its timed device
+        with ParseCache() as cache:
+            ShowBgp(device=self.device).parse()
+            self.assertEqual(cache.stats['size'], 1)
+            cache.clear(self.device)
+            self.assertEqual(cache.stats['size'], 0)
+
+    def test_device_released(self):
+        ShowVrf(device=self.device).parse()
+        device = weakref.ref(self.device)
+        del self.device
+        gc.collect()
+        self.assertIsNone(device())
+
+    def test_disabled(self):
+        enable_instrumentation(False)
+        self.assertIs(MetaParser.parse, instrumentation._original_parse)
+        ShowBgp(device=self.device).parse()
+        self.assertEqual(get_records(), [])
+
+    def test_dump(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'stats.json')
+            enable_instrumentation(dump=path, interval=3600)
+            ShowVrf(device=self.device).parse()
+            dump_stats(path)
+            with open(path) as f:
+                self.assertEqual(json.load(f)['stats'], get_stats())
+
+            # the statistics are dumped again when stopped
+            ShowVrf(device=self.device).parse()
+            enable_instrumentation(False)
+            with open(path) as f:
+                self.assertEqual(json.load(f)['stats'][0]['count'], 2)
+            self.assertEqual(os.listdir(directory), ['stats.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils.common import ParserData
+from genie.libs.parser.utils.extension import (
+    ExtendParsers,
+    load_scan_cache,
+    save_scan_cache
+)
+
+
+class TestLazyParserData(unittest.TestCase):
+
+    def test_loaded_on_first_access(self):
+        data = ParserData(lazy=True)
+        self.assertFalse(data.loaded)
+        self.assertIn('show version', data)
+        self.assertTrue(data.loaded)
+
+    def test_extensions_loaded_once(self):
+        data = ParserData(lazy=True)
+        with patch('genie.libs.parser.utils.common._parser_cache_dir',
+                   return_value=tempfile.mkdtemp()):
+            self.assertTrue(data.load_extensions())
+            self.assertFalse(data.load_extensions())
+
+    def test_not_lazy(self):
+        data = ParserData(lazy=False)
+        self.assertTrue(data.extensions_loaded)
+        self.assertFalse(data.load_extensions())
+
+
+class TestScanCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def test_signature_mismatch(self):
+        save_scan_cache(self.cache_dir, 'test', 'sig1', {'a': 1})
+        self.assertEqual(load_scan_cache(self.cache_dir, 'test', 'sig1'),
+                         {'a': 1})
+        self.assertIsNone(load_scan_cache(self.cache_dir, 'test', 'sig2'))
+        self.assertIsNone(load_scan_cache(self.cache_dir, 'missing', 'sig1'))
+
+    def test_extend_cached(self):
+        package = 'genie.libs.parser.utils.tests.dummy_parser'
+        ext = ExtendParsers(package)
+        ext.extend_cached(self.cache_dir)
+        self.assertIn('show clock', ext.output)
+
+        cached = ExtendParsers(package)
+        with patch.object(ExtendParsers, 'extend') as extend:
+            cached.extend_cached(self.cache_dir)
+            extend.assert_not_called()
+        self.assertEqual(cached.output, ext.output)
+
+
+if __name__ == '__main__':
+    unittest.main()
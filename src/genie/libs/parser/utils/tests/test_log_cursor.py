@@ -0,0 +1,143 @@
+import unittest
+from unittest import mock
+
+from genie.libs.parser.utils import log_cursor
+from genie.libs.parser.utils.log_cursor import find_cursor, make_cursor
+from genie.libs.parser.iosxe.show_logging import ShowLogging
+from genie.libs.parser.nxos.show_logging import ShowLoggingLogfile
+from genie.libs.parser.junos.show_log import ShowLogFilename
+
+
+def messages(first, last):
+    return ['*Mar  1 00:00:{:02}: %SYS-5-CONFIG_I: Configured from console '
+            'by vty{}'.format(second, second % 3)
+            for second in range(first, last)]
+
+
+class TestLogCursor(unittest.TestCase):
+
+    def test_cursor(self):
+        lines = messages(0, 10)
+        cursor = make_cursor(lines)
+        self.assertEqual(len(cursor.split(',')), 3)
+        self.assertEqual(find_cursor(lines, cursor), 10)
+        self.assertEqual(find_cursor(lines + messages(10, 12), cursor), 10)
+        self.assertEqual(find_cursor(lines[5:] + messages(10, 12), cursor), 5)
+        # the lines of the cursor are no longer in the log
+        self.assertEqual(find_cursor(messages(20, 30), cursor), 0)
+        self.assertEqual(find_cursor(lines, ''), 0)
+        self.assertEqual(make_cursor([]), '')
+
+        # the empty lines are not lines of the log
+        spaced = [line for message in lines for line in ('', message)]
+        self.assertEqual(make_cursor(spaced), cursor)
+        self.assertEqual(find_cursor(spaced + [''], cursor), 20)
+
+    def test_repeated(self):
+        # the same message logged again is a new line
+        lines = messages(0, 3) + ['%LINK-3-UPDOWN: Interface Gi1, changed '
+                                  'state to up'] * 2
+        cursor = make_cursor(lines)
+        self.assertEqual(find_cursor(lines + lines[-1:], cursor), 5)
+
+    def test_repeated_tail(self):
+        # the lines of the cursor are the same message logged again and
+        # again, the cursor counting their occurrences at the end of the log
+        up = '%LINK-3-UPDOWN: Interface Gi1, changed state to up'
+        lines = messages(0, 3) + [up] * 4
+        cursor = make_cursor(lines)
+        self.assertTrue(cursor.endswith(';2'))
+        self.assertEqual(find_cursor(lines, cursor), 7)
+        self.assertEqual(find_cursor(lines + [up] * 2, cursor), 7)
+        self.assertEqual(find_cursor(lines[2:] + [up], cursor), 5)
+        self.assertEqual(find_cursor(lines + messages(3, 4), cursor), 7)
+
+        # the same messages logged again
+        lines = messages(0, 6)
+        cursor = make_cursor(lines)
+        self.assertNotIn(';', cursor)
+        self.assertEqual(find_cursor(lines + lines[3:], cursor), 6)
+
+    def test_new_lines_only(self):
+        # only the lines after the cursor are hashed, and the ones before it
+        # which could repeat it
+        lines = messages(0, 50)
+        cursor = make_cursor(lines[:45])
+        with mock.patch.object(log_cursor, 'line_hash',
+                               wraps=log_cursor.line_hash) as line_hash:
+            self.assertEqual(find_cursor(lines, cursor), 45)
+        self.assertEqual(line_hash.call_count, 8 + log_cursor.CURSOR_DEPTH)
+
+
+class TestLogParsers(unittest.TestCase):
+
+    iosxe_header = '''
+Syslog logging: enabled (0 messages dropped, 0 messages rate-limited, 0 flushes, 0 overruns, xml disabled, filtering disabled)
+
+No Active Message Discriminator.
+
+    Console logging: disabled
+    Monitor logging: level debugging, 13 messages logged, xml disabled,
+                     filtering disabled
+    Buffer logging:  level debugging, {} messages logged, xml disabled,
+                    filtering disabled
+    Exception Logging: size (4096 bytes)
+    Count and timestamp logging messages: disabled
+    File logging: disabled
+    Persistent logging: disabled
+
+No active filter modules.
+
+    Trap logging: level informational, 1570 message lines logged
+
+Log Buffer (32000 bytes):
+
+'''
+
+    def poll(self, parser, outputs, **kwargs):
+        # parse the outputs one after the other with the cursor of the last
+        # one, giving the lines of each
+        device = mock.Mock()
+        cursor = ''
+        polled = []
+        for output in outputs:
+            device.execute.return_value = output
+            parsed = parser(device=device).parse(cursor=cursor, **kwargs)
+            cursor = parsed['cursor']
+            polled.append(parsed)
+        return polled
+
+    def test_iosxe(self):
+        outputs = [self.iosxe_header.format(count) +
+                   '\n'.join(messages(first, count))
+                   for first, count in ((0, 0), (0, 5), (2, 9), (2, 9))]
+        polled = self.poll(ShowLogging, outputs)
+        self.assertEqual([parsed['logs'] for parsed in polled],
+                         [[], messages(0, 5), messages(5, 9), []])
+        self.assertEqual(polled[1]['logging']['buffer']['messages_logged'],
+                         5)
+
+        # without a cursor, all the lines are parsed
+        device = mock.Mock(**{'execute.return_value': outputs[2]})
+        parsed = ShowLogging(device=device).parse()
+        self.assertEqual(parsed['logs'], messages(2, 9))
+        self.assertNotIn('cursor', parsed)
+
+    def test_nxos(self):
+        outputs = ['show logging logfile\n' + '\n'.join(messages(0, count))
+                   for count in (4, 6)]
+        polled = self.poll(ShowLoggingLogfile, outputs)
+        self.assertEqual([parsed['logs'] for parsed in polled],
+                         [messages(0, 4), messages(4, 6)])
+
+    def test_junos(self):
+        outputs = ['show log messages\n' + '\n'.join(messages(0, count)) +
+                   '\n\n{master}' for count in (4, 6, 6)]
+        polled = self.poll(ShowLogFilename, outputs, filename='messages')
+        self.assertEqual([parsed['file-content'] for parsed in polled],
+                         [['show log messages'] + messages(0, 4) + [''],
+                          messages(4, 6) + [''], ['']])
+
+
+if __name__ == '__main__':
+    unittest.main()
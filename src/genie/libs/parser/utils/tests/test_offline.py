@@ -0,0 +1,120 @@
+import io
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils.offline import (
+    OfflineDevice, command_from_file, file_from_command, find_captures,
+    main, parse_captures)
+
+
+class TestOffline(unittest.TestCase):
+
+    clock = '*05:26:38.035 EST Wed JAN 4 2019\n'
+
+    captures = {
+        'R1/iosxe/show_clock.txt': clock,
+        'R1/iosxe/show_version.txt': '',
+        'R1/iosxe/show_unknown_command.txt': clock,
+        'R1/iosxe/notes.log': clock,
+        'S1/iosxe/cat9k/show clock.txt': clock,
+        'captures.txt': clock,
+    }
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        for name, output in self.captures.items():
+            path = os.path.join(self.root, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(output)
+
+    def test_file_names(self):
+        for command, name in (
+                ('show version', 'show_version.txt'),
+                ('show interfaces Gi1/0/1', 'show_interfaces_Gi1%2F0%2F1.txt'),
+                ('show bgp vrf a_b', 'show_bgp_vrf_a%5Fb.txt')):
+            with self.subTest(command=command):
+                self.assertEqual(file_from_command(command), name)
+                self.assertEqual(command_from_file(name), command)
+        self.assertEqual(command_from_file('show bgp vrf a_b.txt'),
+                         'show bgp vrf a_b')
+
+    def test_find_captures(self):
+        self.assertEqual(
+            [capture[1:] for capture in find_captures(self.root)], [
+                ('R1', 'iosxe', None, 'show clock'),
+                ('R1', 'iosxe', None, 'show unknown command'),
+                ('R1', 'iosxe', None, 'show version'),
+                ('S1', 'iosxe', 'cat9k', 'show clock'),
+            ])
+        self.assertEqual(
+            [capture[3] for capture in find_captures(self.root,
+                                                     platform='isr')],
+            ['isr', 'isr', 'isr', 'cat9k'])
+
+    def test_parse_captures(self):
+        results = list(parse_captures(self.root, jobs=1))
+        self.assertEqual([result['command'] for result in results], [
+            'show clock', 'show unknown command', 'show version',
+            'show clock'])
+
+        clock, unknown, version, platform_clock = results
+        self.assertEqual(clock['parser'],
+                         'genie.libs.parser.iosxe.show_system.ShowClock')
+        self.assertEqual(clock['parsed']['timezone'], 'EST')
+        self.assertGreater(clock['time'], 0)
+        self.assertEqual(platform_clock['parsed'], clock['parsed'])
+
+        self.assertIsNone(unknown['parser'])
+        self.assertIsNone(unknown['time'])
+        self.assertIn('Could not find parser', unknown['error'])
+
+        self.assertTrue(version['error'].startswith(
+            SchemaEmptyParserError.__name__))
+        self.assertNotIn('parsed', version)
+        self.assertIsNotNone(version['time'])
+
+    def test_jobs(self):
+        self.assertEqual(
+            [{k: v for k, v in result.items() if k != 'time'}
+             for result in parse_captures(self.root, jobs=2)],
+            [{k: v for k, v in result.items() if k != 'time'}
+             for result in parse_captures(self.root, jobs=1)])
+
+    def test_device_execute(self):
+        dev = OfflineDevice('R1', 'iosxe',
+                            directory=os.path.join(self.root, 'R1', 'iosxe'))
+        self.assertEqual(dev.execute('show  clock'), self.clock)
+        self.assertEqual(dev.execute(['show clock']),
+                         {'show clock': self.clock})
+        with self.assertRaises(FileNotFoundError):
+            dev.execute('show ip route')
+
+        dev = OfflineDevice('S1', 'iosxe', 'cat9k', directory=os.path.join(
+            self.root, 'S1', 'iosxe', 'cat9k'))
+        self.assertEqual(dev.execute('show clock'), self.clock)
+        self.assertEqual(dev.custom['abstraction']['order'],
+                         ['os', 'platform'])
+
+    def test_main(self):
+        output = os.path.join(self.root, 'results.jsonl')
+        with patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            self.assertEqual(main([self.root, '-o', output, '-j', '1']), 1)
+        self.assertIn('Parsed 4 captures', stderr.getvalue())
+        self.assertIn('2 errors', stderr.getvalue())
+        with open(output) as f:
+            results = [json.loads(line) for line in f]
+        self.assertEqual([result['device'] for result in results],
+                         ['R1', 'R1', 'R1', 'S1'])
+        self.assertEqual(results[0]['parsed']['year'], '2019')
+
+
+if __name__ == '__main__':
+    unittest.main()
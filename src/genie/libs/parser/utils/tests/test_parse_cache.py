@@ -0,0 +1,137 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils import parse_cache
+from genie.libs.parser.utils.parse_cache import ParseCache, cached_parse
+from genie.libs.parser.nxos.show_vrf import ShowVrf, ShowRunningConfigVrf
+
+OUTPUTS = {
+    'show vrf': '''
+        N7k# show vrf
+        VRF-Name                           VRF-ID State   Reason
+        VRF1                                    3 Up      --
+        default                                 1 Up      --
+        ''',
+    'show vrf VRF1': '''
+        VRF-Name                           VRF-ID State   Reason
+        VRF1                                    3 Up      --
+        ''',
+    'show vrf VRF2': '',
+    "show running-config vrf VRF1 | sec '^vrf'": '''
+        vrf context VRF1
+          vni 10100
+          rd auto
+        ''',
+    "show running-config vrf default | sec '^vrf'": '',
+}
+
+
+def device():
+    return Mock(**{'execute.side_effect': lambda command: OUTPUTS[command]})
+
+
+def commands(device):
+    return [call.args[0] for call in device.execute.call_args_list]
+
+
+class TestParseCache(unittest.TestCase):
+
+    def test_no_cache(self):
+        dev = device()
+        self.assertEqual(cached_parse(ShowVrf, dev),
+                         cached_parse(ShowVrf, dev))
+        self.assertEqual(commands(dev), ['show vrf', 'show vrf'])
+
+    def test_cache(self):
+        dev, other = device(), device()
+        with ParseCache() as cache:
+            result = cached_parse(ShowVrf, dev)
+            self.assertEqual(cached_parse(ShowVrf, dev), result)
+            cached_parse(ShowVrf, dev, vrf='VRF1')
+            cached_parse(ShowVrf, other)
+        # per device, parser class and arguments
+        self.assertEqual(commands(dev), ['show vrf', 'show vrf VRF1'])
+        self.assertEqual(commands(other), ['show vrf'])
+        self.assertEqual(cache.stats, {'hits': 1, 'misses': 3, 'size': 3})
+
+        # no longer in effect
+        cached_parse(ShowVrf, dev)
+        self.assertEqual(commands(dev).count('show vrf'), 2)
+
+    def test_copy(self):
+        dev = device()
+        with ParseCache():
+            cached_parse(ShowVrf, dev)['vrfs'].clear()
+            self.assertIn('VRF1', cached_parse(ShowVrf, dev)['vrfs'])
+
+    def test_empty(self):
+        dev = device()
+        with ParseCache() as cache:
+            for _ in range(2):
+                with self.assertRaises(SchemaEmptyParserError):
+                    cached_parse(ShowVrf, dev, vrf='VRF2')
+        self.assertEqual(commands(dev), ['show vrf VRF2'])
+        self.assertEqual(cache.hits, 1)
+
+    def test_ttl(self):
+        dev = device()
+        with patch('genie.libs.parser.utils.parse_cache.time.monotonic',
+                   side_effect=[0, 5, 20, 20]):
+            with ParseCache(ttl=10):
+                cached_parse(ShowVrf, dev)
+                cached_parse(ShowVrf, dev)
+                cached_parse(ShowVrf, dev)
+        self.assertEqual(commands(dev), ['show vrf', 'show vrf'])
+
+    def test_opt_out(self):
+        dev = device()
+        with patch.object(ShowVrf, 'parse_cache', False, create=True):
+            with ParseCache() as cache:
+                cached_parse(ShowVrf, dev)
+                cached_parse(ShowVrf, dev)
+        self.assertEqual(commands(dev), ['show vrf', 'show vrf'])
+        self.assertEqual(cache.stats, {'hits': 0, 'misses': 0, 'size': 0})
+
+    def test_clear(self):
+        dev, other = device(), device()
+        with ParseCache() as cache:
+            cached_parse(ShowVrf, dev)
+            cached_parse(ShowVrf, other)
+            cache.clear(dev)
+            self.assertEqual(cache.stats['size'], 1)
+            cached_parse(ShowVrf, dev)
+        self.assertEqual(commands(dev), ['show vrf', 'show vrf'])
+
+    def test_nested_parse(self):
+        # ShowRunningConfigVrf finds the vrfs with ShowVrf
+        dev = device()
+        with ParseCache() as cache:
+            vrfs = cache.parse(ShowVrf, dev)
+            config = cache.parse(ShowRunningConfigVrf, dev)
+        self.assertEqual(sorted(vrfs['vrfs']), ['VRF1', 'default'])
+        self.assertEqual(list(config['vrf']), ['VRF1'])
+        self.assertEqual(commands(dev).count('show vrf'), 1)
+        self.assertEqual(cache.stats, {'hits': 1, 'misses': 2, 'size': 2})
+
+    def test_without_contextvars(self):
+        # python 3.6, the caches in effect are per thread
+        with patch.object(parse_cache, 'ContextVar', None):
+            active = parse_cache._context_var('test', ())
+        self.assertIsInstance(active, parse_cache._ThreadLocalVar)
+        with patch.object(parse_cache, '_active', active):
+            dev = device()
+            with ParseCache() as outer:
+                with ParseCache() as inner:
+                    self.assertEqual(active.get(), (outer, inner))
+                    cached_parse(ShowVrf, dev)
+                    cached_parse(ShowVrf, dev)
+                self.assertEqual(active.get(), (outer,))
+            self.assertEqual(active.get(), ())
+        self.assertEqual(commands(dev), ['show vrf'])
+        self.assertEqual(inner.stats['hits'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
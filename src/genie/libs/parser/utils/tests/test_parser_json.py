@@ -0,0 +1,75 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.common import (
+    get_parser_doc_data,
+    parser_data
+)
+
+
+class TestParserJson(unittest.TestCase):
+
+    def _walk(self, doc, index, command):
+        for key, value in doc.items():
+            if isinstance(value, dict):
+                self.assertIn(key, index, command)
+                self._walk(value, index[key], command)
+            elif key == 'doc':
+                self.assertIn('class', index, command)
+                self.assertIn('module_name', index, command)
+
+    def test_doc_data_matches_index(self):
+        doc_data = get_parser_doc_data()
+        for command, entry in doc_data.items():
+            if command == 'tokens':
+                continue
+            self.assertIn(command, parser_data)
+            self._walk(entry, parser_data[command], command)
+
+    def test_doc_data_loaded_once(self):
+        self.assertIs(get_parser_doc_data(), get_parser_doc_data())
+
+
+class TestStaleIndex(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        patcher = mock.patch.object(
+            common, '_parser_json_path',
+            lambda name: os.path.join(self.directory, name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write(self, name, data, mtime):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w') as f:
+            json.dump(data, f)
+        os.utime(path, (mtime, mtime))
+
+    def test_index(self):
+        self.write(common.PARSER_JSON, {'show version': {}}, 100)
+        self.write(common.PARSER_INDEX_JSON, {'show clock': {}}, 200)
+        self.assertEqual(common._load_parser_json(extend=False),
+                         {'show clock': {}})
+
+    def test_parsers_json_newer(self):
+        # parsers.json was generated again without being split
+        self.write(common.PARSER_JSON, {'show version': {}}, 200)
+        self.write(common.PARSER_INDEX_JSON, {'show clock': {}}, 100)
+        self.assertEqual(common._load_parser_json(extend=False),
+                         {'show version': {}})
+
+    def test_no_index(self):
+        self.write(common.PARSER_JSON, {'show version': {}}, 100)
+        self.assertEqual(common._load_parser_json(extend=False),
+                         {'show version': {}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import re
+import pathlib
+import unittest
+import importlib.machinery
+from unittest.mock import Mock
+
+from genie.metaparser import MetaParser
+
+from genie.libs.parser.utils.patterns import _PATTERN_TYPE
+from genie.libs.parser.utils.pattern_profiler import PatternProfiler
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.iosxe.show_platform import ShowVersion
+
+PARSER_DIR = pathlib.Path(__file__).resolve().parents[2]
+
+
+def golden(cls, name='golden_output_1'):
+    '''the output and expected output of a golden test of an iosxe parser'''
+    folder = PARSER_DIR / 'iosxe' / 'tests' / cls.__name__ / 'cli' / 'equal'
+    expected = importlib.machinery.SourceFileLoader(
+        'expected', str(folder / (name + '_expected.py'))).load_module()
+    return (folder / (name + '_output.txt')).read_text(), \
+        expected.expected_output
+
+
+class TestPatternProfiler(unittest.TestCase):
+
+    def parse(self, cls):
+        output, expected = golden(cls)
+        device = Mock(**{'execute.return_value': output})
+        self.assertEqual(cls(device=device).parse(), expected)
+
+    def test_profile(self):
+        compile_, parse = re._compile, MetaParser.parse
+        with PatternProfiler() as profiler:
+            # the results are the same
+            self.parse(ShowInterfaces)
+            self.parse(ShowVersion)
+
+        # the class attributes of ShowInterfaces, routed by its dispatcher
+        stats = {stats['name']: stats
+                 for stats in profiler.stats('ShowInterfaces')}
+        self.assertEqual(stats['p1']['parser'],
+                         'genie.libs.parser.iosxe.show_interface.'
+                         'ShowInterfaces')
+        self.assertGreater(stats['p1']['hits'], 0)
+        self.assertGreaterEqual(stats['p1']['attempts'], stats['p1']['hits'])
+        self.assertEqual(stats['p1']['pattern'], ShowInterfaces.p1.pattern)
+
+        # the patterns compiled in cli()
+        stats = {stats['name']: stats
+                 for stats in profiler.stats('ShowVersion')}
+        self.assertGreater(stats['p1']['hits'], 0)
+
+        for stats in profiler.never_attempted():
+            self.assertEqual((stats['attempts'], stats['hits']), (0, 0))
+        for stats in profiler.never_matched('ShowVersion'):
+            self.assertGreater(stats['attempts'], 0)
+            self.assertEqual(stats['hits'], 0)
+        self.assertIn('ShowInterfaces: ', profiler.report())
+
+        # everything is restored
+        self.assertIs(re._compile, compile_)
+        self.assertIs(MetaParser.parse, parse)
+        self.assertIsInstance(ShowInterfaces.p1, _PATTERN_TYPE)
+        self.assertIs(ShowInterfaces.dispatcher.patterns[0],
+                      ShowInterfaces.p1)
+        self.parse(ShowInterfaces)
+
+    def test_nested(self):
+        with PatternProfiler():
+            with self.assertRaises(RuntimeError):
+                with PatternProfiler():
+                    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import re
+import unittest
+
+from genie.libs.parser.utils.patterns import (
+    LazyPattern, _PATTERN_TYPE, class_patterns)
+
+
+class Base(object):
+    # Vlan100 is up
+    p1 = LazyPattern(r'^(?P<intf>\S+) +is +(?P<status>\w+)$')
+
+
+class Child(Base):
+    # MTU 1500 bytes
+    p2 = LazyPattern(r'^mtu +(?P<mtu>\d+) +bytes$', re.IGNORECASE)
+
+
+class TestLazyPattern(unittest.TestCase):
+
+    def test_compiled_once_on_defining_class(self):
+        class Parser(object):
+            p1 = LazyPattern(r'^(?P<name>\w+)$')
+
+        self.assertIsInstance(vars(Parser)['p1'], LazyPattern)
+        compiled = Parser().p1
+        self.assertIsInstance(compiled, _PATTERN_TYPE)
+        self.assertIs(vars(Parser)['p1'], compiled)
+        self.assertIs(Parser().p1, compiled)
+
+    def test_subclass_shares_base_pattern(self):
+        self.assertIs(Child().p1, Base.p1)
+        self.assertNotIn('p1', vars(Child))
+        self.assertEqual(Child().p1.match('Vlan100 is up').groupdict(),
+                         {'intf': 'Vlan100', 'status': 'up'})
+
+    def test_flags(self):
+        self.assertTrue(Child.p2.match('MTU 1500 bytes'))
+
+    def test_class_patterns(self):
+        patterns = class_patterns(Child)
+        self.assertEqual(list(patterns), ['p1', 'p2'])
+        self.assertIs(patterns['p1'], Base.p1)
+        self.assertIs(patterns['p2'], Child.p2)
+
+
+if __name__ == '__main__':
+    unittest.main()
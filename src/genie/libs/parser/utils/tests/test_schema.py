@@ -0,0 +1,109 @@
+import unittest
+import threading
+
+from genie.metaparser.util.schemaengine import Schema, Optional, Use
+from genie.metaparser.util.exceptions import SchemaError
+
+from genie.libs.parser.utils.schema import ListOfDicts
+
+
+class ExampleSchema(object):
+
+    validate_nh_list = ListOfDicts({
+        "to": str,
+        Optional("via"): str,
+        Optional("label"): {
+            "value": str,
+        },
+    }, 'nh', allow_dict=True)
+
+    validate_rt_list = ListOfDicts({
+        "rt-destination": str,
+        Optional("nh"): Use(validate_nh_list),
+    }, 'rt')
+
+    schema = {
+        "route-table": {
+            Optional("rt"): Use(validate_rt_list),
+        }
+    }
+
+
+class TestListOfDicts(unittest.TestCase):
+
+    def valid(self, rt):
+        # a new Schema for each validation, as parse() does
+        return Schema(ExampleSchema.schema).validate(
+            {'route-table': {'rt': rt}})
+
+    def test_valid(self):
+        rt = [{'rt-destination': '10.0.0.0/8',
+               'nh': [{'to': '10.1.1.1', 'via': 'ge-0/0/0.0'},
+                      {'to': '10.1.1.2'}]},
+              {'rt-destination': '10.0.0.0/16'}]
+        self.assertEqual(self.valid(rt), {'route-table': {'rt': rt}})
+
+    def test_allow_dict(self):
+        self.assertEqual(ExampleSchema.validate_nh_list({'to': '10.1.1.1'}),
+                         [{'to': '10.1.1.1'}])
+        self.valid([{'rt-destination': '10.0.0.0/8',
+                     'nh': {'to': '10.1.1.1'}}])
+
+        with self.assertRaises(SchemaError):
+            self.valid({'rt-destination': '10.0.0.0/8'})
+
+    def test_invalid(self):
+        for rt in ('10.0.0.0/8',
+                   [{'rt-destination': 8}],
+                   [{'rt-destination': '10.0.0.0/8', 'unknown': ''}],
+                   [{'rt-destination': '10.0.0.0/8', 'nh': [{}]}]):
+            with self.subTest(rt=rt):
+                with self.assertRaises(Exception):
+                    self.valid(rt)
+
+    def test_error_message(self):
+        with self.assertRaisesRegex(SchemaError, 'rt is not a list'):
+            self.valid('10.0.0.0/8')
+        # Use() names the validator of the list holding the invalid item
+        with self.assertRaisesRegex(SchemaError, r'validate_nh_list\('):
+            self.valid([{'rt-destination': '10.0.0.0/8', 'nh': [{}]}])
+
+    def test_valid_after_invalid(self):
+        # a failed validation in a nested dictionary leaves its state in the
+        # schema which validated it
+        valid = [{'rt-destination': '10.0.0.0/8',
+                  'nh': [{'to': '10.1.1.1', 'label': {'value': '3'}}]}]
+        invalid = [{'rt-destination': '10.0.0.0/8',
+                    'nh': [{'to': '10.1.1.1', 'label': {}}]}]
+        for rt in (valid, invalid, valid, invalid, valid):
+            with self.subTest(rt=rt):
+                if rt is invalid:
+                    with self.assertRaisesRegex(Exception, 'label'):
+                        self.valid(rt)
+                else:
+                    self.valid(rt)
+
+    def test_threads(self):
+        rt = [{'rt-destination': '10.0.0.{}/32'.format(i),
+               'nh': [{'to': '10.1.1.1', 'label': {'value': '3'}}]}
+              for i in range(200)]
+        errors = []
+
+        def validate():
+            try:
+                for _ in range(10):
+                    Schema(ExampleSchema.schema).validate(
+                        {'route-table': {'rt': rt}})
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=validate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+import os
+import glob
+import inspect
+import tempfile
+import unittest
+import importlib
+import importlib.machinery
+from unittest.mock import Mock
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import (
+    Any, And, Optional, Or, Schema, Use)
+
+from genie.libs import parser
+from genie.libs.parser.utils.schema import ListOfDicts
+from genie.libs.parser.utils.schema_compiler import (
+    compile_schema, use_compiled_schemas)
+
+
+def validate(validator, data):
+    # the output validated, or the type and message of the error
+    try:
+        return validator(data)
+    except Exception as e:
+        return type(e), str(e)
+
+
+class TestCompileSchema(unittest.TestCase):
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'router_id': str,
+                Optional('as'): Or(int, str),
+                Optional('status'): Or('up', 'down', None),
+                Optional('flags'): list,
+                Optional('uptime'): float,
+                Optional('enabled'): bool,
+                Optional('neighbor'): {
+                    Any(): {
+                        'state': str,
+                        Optional('count'): int,
+                    },
+                    Optional('total'): int,
+                },
+                Optional('extra'): Any(),
+                Optional('name'): And(str, lambda name: name.islower()),
+            },
+        },
+        Optional('paths'): Use(ListOfDicts({'nh': str}, 'paths')),
+        Optional('routes'): Use(ListOfDicts({'prefix': str}, 'routes',
+                                            allow_dict=True)),
+        Optional('mtu'): Use(int),
+        # the keys which are types are validated by Schema
+        Optional('tags'): {Optional(str): str},
+    }
+
+    outputs = [
+        {'vrf': {'default': {'router_id': '10.1.1.1'}}},
+        {'vrf': {'default': {'router_id': '10.1.1.1', 'as': 65000,
+                             'status': None, 'flags': ['a'], 'uptime': 1.5,
+                             'enabled': True, 'extra': [{'any': 1}],
+                             'name': 'abc'}}},
+        {'vrf': {'default': {'router_id': '10.1.1.1', 'neighbor': {
+            '10.2.2.2': {'state': 'idle', 'count': 2}, 'total': 1}}}},
+        {'vrf': {'default': {'router_id': '10.1.1.1', 'neighbor': {}}}},
+        {'vrf': {}},
+        {'vrf': {'default': {}}},
+        {'vrf': {'default': {'router_id': 1}}},
+        {'vrf': {'default': {'router_id': '10.1.1.1', 'as': 1.0}}},
+        {'vrf': {'default': {'router_id': '10.1.1.1', 'status': 'idle'}}},
+        {'vrf': {'default': {'router_id': '10.1.1.1', 'uptime': 1}}},
+        {'vrf': {'default': {'router_id': '10.1.1.1', 'enabled': 1}}},
+        {'vrf': {'default': {'router_id': '10.1.1.1', 'name': 'ABC'}}},
+        {'vrf': {'default': {'router_id': '10.1.1.1', 'unknown': 1}}},
+        # the explicit keys are not validated as the others
+        {'vrf': {'default': {'router_id': '10.1.1.1', 'neighbor': {
+            'total': 'one'}}}},
+        {'vrf': {'default': {'router_id': '10.1.1.1', 'neighbor': {
+            '10.2.2.2': {}}}}},
+        {'vrf': []},
+        {'vrf': {}, 'paths': [{'nh': '10.1.1.1'}, {'nh': '10.2.2.2'}]},
+        {'vrf': {}, 'paths': []},
+        {'vrf': {}, 'paths': [{}]},
+        {'vrf': {}, 'paths': {'nh': '10.1.1.1'}},
+        {'vrf': {}, 'paths': [{'nh': 1}]},
+        {'vrf': {}, 'routes': {'prefix': '10.0.0.0/8'}},
+        {'vrf': {}, 'routes': [{'prefix': '10.0.0.0/8'}]},
+        {'vrf': {}, 'mtu': '1500'},
+        {'vrf': {}, 'mtu': 'jumbo'},
+        {'mtu': '1500'},
+        {'vrf': {}, 'tags': {'site': 'R1'}},
+        {'vrf': {}, 'tags': {}},
+        {'vrf': {}, 'tags': {1: 'R1'}},
+        {},
+        [],
+    ]
+
+    def test_outputs(self):
+        compiled = compile_schema(self.schema)
+        for output in self.outputs:
+            with self.subTest(output=output):
+                self.assertEqual(validate(compiled, output),
+                                 validate(Schema(self.schema).validate,
+                                          output))
+
+    def test_transforms(self):
+        compiled = compile_schema(self.schema)
+        output = {'vrf': {}, 'mtu': '1500',
+                  'routes': {'prefix': '10.0.0.0/8'}, 'tags': {'site': 'R1'}}
+        self.assertEqual(compiled(output), {
+            'vrf': {}, 'mtu': 1500, 'routes': [{'prefix': '10.0.0.0/8'}],
+            'tags': {'site': 'R1'}})
+        # the output validated is not changed
+        self.assertEqual(output['mtu'], '1500')
+
+    def test_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            compiled = compile_schema(self.schema, name='ShowBgp',
+                                      directory=directory)
+            self.assertEqual(os.listdir(directory), ['ShowBgp.py'])
+            with open(os.path.join(directory, 'ShowBgp.py')) as f:
+                self.assertIn("'router_id': (str,),", f.read())
+            self.assertEqual(compiled(self.outputs[0]), self.outputs[0])
+
+
+class TestUseCompiledSchemas(unittest.TestCase):
+
+    class ShowBgpSchema(MetaParser):
+        schema = TestCompileSchema.schema
+
+    class ShowBgp(ShowBgpSchema):
+        cli_command = 'show bgp'
+
+        def cli(self, output=None):
+            return output
+
+    def setUp(self):
+        use_compiled_schemas()
+        self.addCleanup(use_compiled_schemas, False)
+
+    def parse(self, output, **kwargs):
+        return validate(lambda output: self.ShowBgp(device=Mock()).parse(
+            output=output, **kwargs), output)
+
+    def test_parse(self):
+        parsed = [self.parse(output)
+                  for output in TestCompileSchema.outputs[:-1]]
+        use_compiled_schemas(False)
+        self.assertEqual(parsed,
+                         [self.parse(output)
+                          for output in TestCompileSchema.outputs[:-1]])
+
+    def test_warn_unsupported_keys(self):
+        # the unsupported keys are dropped with a warning
+        output = {'vrf': {'default': {'router_id': '10.1.1.1', 'unknown': 1}}}
+        with self.assertLogs(level='WARNING'):
+            self.assertEqual(self.parse(output, warn_unsupported_keys=True),
+                             {'vrf': {'default': {'router_id': '10.1.1.1'}}})
+
+
+class TestGoldenSchemas(unittest.TestCase):
+    '''the compiled schemas of the parsers validate the expected outputs of
+       their golden outputs as Schema does'''
+
+    def parser_classes(self, os_name):
+        classes = {}
+        root = os.path.dirname(parser.__file__)
+        for path in glob.glob(os.path.join(root, os_name, '**', '*.py'),
+                              recursive=True):
+            module = os.path.relpath(path, root)[:-3].replace(os.sep, '.')
+            if '.tests.' in module or module.endswith('__init__'):
+                continue
+            module = importlib.import_module('genie.libs.parser.' + module)
+            for name, cls in inspect.getmembers(module, inspect.isclass):
+                if issubclass(cls, MetaParser) and \
+                        cls.__module__ == module.__name__:
+                    classes[name] = cls
+        return classes
+
+    def test_golden(self):
+        root = os.path.dirname(parser.__file__)
+        count = 0
+        for os_name in sorted(os.listdir(root)):
+            goldens = sorted(glob.glob(os.path.join(
+                root, os_name, '**', 'tests', '*', 'cli', 'equal',
+                '*_expected.py'), recursive=True))
+            if not goldens:
+                continue
+            classes = self.parser_classes(os_name)
+            validators = {}
+            for golden in goldens:
+                cls = classes.get(golden.split(os.sep)[-4])
+                schema = getattr(cls, 'schema', None)
+                if not isinstance(schema, dict) or not schema:
+                    continue
+                if id(schema) not in validators:
+                    validators[id(schema)] = compile_schema(schema)
+                expected = importlib.machinery.SourceFileLoader(
+                    'expected', golden).load_module().expected_output
+                with self.subTest(golden=golden):
+                    self.assertEqual(
+                        validate(validators[id(schema)], expected),
+                        validate(Schema(schema).validate, expected))
+                count += 1
+        self.assertGreater(count, 1500)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+import io
+import re
+import json
+import pathlib
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils.streaming import iter_blocks
+
+from genie.libs.parser.iosxe import show_bgp as iosxe_show_bgp, \
+                                    show_interface as iosxe_show_interface
+from genie.libs.parser.junos import show_route as junos_show_route
+
+PARSER_DIR = pathlib.Path(__file__).resolve().parents[2]
+
+
+def merge(result, record):
+    '''merge a record into the nested dictionaries of result'''
+    for key, value in record.items():
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
+            merge(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+def merge_route_tables(result, record):
+    '''append the routes of a junos record to the tables of result'''
+    tables = result.setdefault('route-information', {}).\
+                    setdefault('route-table', [])
+    for table in record['route-information']['route-table']:
+        if tables and tables[-1]['table-name'] == table['table-name']:
+            tables[-1].setdefault('rt', []).extend(table.get('rt', []))
+        else:
+            tables.append(table)
+    return result
+
+
+class TestIterBlocks(unittest.TestCase):
+
+    output = '''
+        R1#show bgp all detail
+        For address family: IPv4 Unicast
+        BGP routing table entry for 10.4.1.1/32, version 4
+          Paths: (1 available, best #1, table default)
+        BGP routing table entry for 10.4.1.2/32, version 5
+          Paths: (1 available, best #1, table default)
+
+        For address family: VPNv4 Unicast
+        Route Distinguisher: 100:100 (default for vrf VRF1)
+        BGP routing table entry for 100:100:10.4.1.1/32, version 6
+        Route Distinguisher: 200:200 (default for vrf VRF2)
+        BGP routing table entry for 200:200:10.4.1.1/32, version 7
+        For address family: L2VPN E-VPN
+        BGP routing table entry for [5][65535:1][0][24][10.36.3.0]/17, version 3
+    '''
+
+    start = [re.compile(r'^BGP +routing +table +entry')]
+    context = [re.compile(r'^For +address +family:'),
+               re.compile(r'^Route +Distinguisher:')]
+
+    def _blocks(self, output):
+        return [[line.strip() for line in block.split('\n')]
+                for block in iter_blocks(output, self.start, self.context)]
+
+    def test_blocks(self):
+        self.assertEqual(self._blocks(self.output), [
+            ['For address family: IPv4 Unicast',
+             'BGP routing table entry for 10.4.1.1/32, version 4',
+             'Paths: (1 available, best #1, table default)'],
+            ['For address family: IPv4 Unicast',
+             'BGP routing table entry for 10.4.1.2/32, version 5',
+             'Paths: (1 available, best #1, table default)',
+             ''],
+            ['For address family: VPNv4 Unicast',
+             'Route Distinguisher: 100:100 (default for vrf VRF1)',
+             'BGP routing table entry for 100:100:10.4.1.1/32, version 6'],
+            ['For address family: VPNv4 Unicast',
+             'Route Distinguisher: 200:200 (default for vrf VRF2)',
+             'BGP routing table entry for 200:200:10.4.1.1/32, version 7'],
+            # the route distinguisher does not apply to the next family
+            ['For address family: L2VPN E-VPN',
+             'BGP routing table entry for [5][65535:1][0][24][10.36.3.0]/17, '
+             'version 3',
+             '']])
+
+    def test_lines(self):
+        # a file object, or any iterable of lines with their line ending
+        self.assertEqual(self._blocks(io.StringIO(self.output)),
+                         self._blocks(self.output))
+        self.assertEqual(
+            self._blocks(line + '\r\n' for line in self.output.splitlines()),
+            self._blocks(self.output))
+
+    def test_no_block(self):
+        self.assertEqual(self._blocks(''), [])
+        self.assertEqual(
+            self._blocks('For address family: IPv4 Unicast\n\n'), [])
+
+    def test_lazy(self):
+        def lines():
+            yield 'BGP routing table entry for 10.4.1.1/32, version 4'
+            yield 'BGP routing table entry for 10.4.1.2/32, version 5'
+            raise AssertionError('read past the second block')
+
+        blocks = iter_blocks(lines(), self.start)
+        self.assertEqual(next(blocks),
+                         'BGP routing table entry for 10.4.1.1/32, version 4')
+
+
+class TestParseIter(unittest.TestCase):
+    '''Merging the records of parse_iter() gives the result of parse()'''
+
+    maxDiff = None
+
+    parsers = [
+        (iosxe_show_bgp, ['ShowBgpAllDetail', 'ShowIpBgpAllDetail',
+                          'ShowBgpDetail'], merge),
+        (iosxe_show_interface, ['ShowInterfaces'], merge),
+        (junos_show_route, ['ShowRouteProtocolExtensive'],
+         merge_route_tables),
+    ]
+
+    skip = {
+        # parse() files the E-VPN prefixes under the VPNv4 address family
+        # of the previous route distinguisher
+        ('ShowBgpAllDetail', 'golden_output2_output.txt'),
+        # an unnumbered interface takes the address of another interface
+        ('ShowInterfaces', 'golden_output_output.txt'),
+    }
+
+    def _parse(self, cls, output, arguments):
+        try:
+            return cls(device=Mock()).parse(output=output, **arguments)
+        except SchemaEmptyParserError:
+            return {}
+
+    def test_golden_outputs(self):
+        for module, names, merge_record in self.parsers:
+            folder = PARSER_DIR / module.__name__.split('.')[-2] / 'tests'
+            for name in names:
+                cls = getattr(module, name)
+                for output_file in sorted(
+                        (folder / name / 'cli' / 'equal').glob('*_output.txt')):
+                    if (name, output_file.name) in self.skip:
+                        continue
+                    arguments_file = output_file.with_name(
+                        output_file.name.replace('_output.txt',
+                                                 '_arguments.json'))
+                    arguments = json.loads(arguments_file.read_text()) \
+                        if arguments_file.exists() else {}
+                    with self.subTest(parser=name, output=output_file.name):
+                        with output_file.open() as f:
+                            records = cls(device=Mock()).parse_iter(
+                                f, **arguments)
+                            result = {}
+                            for record in records:
+                                merge_record(result, record)
+                        self.assertEqual(
+                            result, self._parse(cls, output_file.read_text(),
+                                                arguments))
+
+    def test_records(self):
+        output = (PARSER_DIR / 'iosxe' / 'tests' / 'ShowInterfaces' / 'cli' /
+                  'equal' / 'golden_output2_output.txt').read_text()
+        records = iosxe_show_interface.ShowInterfaces(
+            device=Mock()).parse_iter(output)
+        # a record per interface, a port-channel record also holds the
+        # membership of its interfaces
+        interfaces = [next(iter(record)) for record in records]
+        self.assertEqual(len(interfaces), 148)
+
+        parsed = iosxe_show_interface.ShowInterfaces(
+            device=Mock()).parse(output=output)
+        self.assertEqual(sorted(interfaces), sorted(parsed))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,345 @@
+import os
+import glob
+import json
+import inspect
+import unittest
+import importlib
+from unittest.mock import Mock
+from xml.sax.saxutils import escape, quoteattr
+
+from genie.libs.parser import junos
+from genie.libs.parser.junos.show_route import ShowRoute
+from genie.libs.parser.utils.structured import (
+    StructuredOutputError, StructuredParser, parse_structured)
+
+JUNOS_NS = 'http://xml.juniper.net/junos/18.2R1/junos'
+
+# the modules of the junos parsers of the structured outputs
+MODULES = ['show_route', 'show_interface', 'show_ospf', 'show_chassis']
+
+
+def to_xml(tag, value, indent=''):
+    '''the XML of a value of an expected output, indented as the device
+       does'''
+    if isinstance(value, list):
+        return ''.join(to_xml(tag, item, indent) for item in value)
+    if value is True or value is None:
+        return '{}<{}/>\n'.format(indent, tag)
+    if not isinstance(value, dict):
+        return '{}<{}>{}</{}>\n'.format(indent, tag, escape(str(value)), tag)
+    attrs = ''.join(' {}={}'.format(key[1:], quoteattr(item))
+                    for key, item in value.items() if key.startswith('@'))
+    children = ''.join(to_xml(key, item, indent + '    ')
+                       for key, item in value.items()
+                       if not key.startswith(('@', '#')))
+    text = escape(value.get('#text', ''))
+    if children:
+        return '{}<{}{}>{}\n{}{}</{}>\n'.format(
+            indent, tag, attrs, text, children, indent, tag)
+    return '{}<{}{}>{}</{}>\n'.format(indent, tag, attrs, text, tag)
+
+
+def render_xml(expected):
+    xml = to_xml('rpc-reply', dict(expected, **{'@xmlns:junos': JUNOS_NS}))
+    return xml.replace(
+        '</rpc-reply>', '    <cli>\n        <banner></banner>\n    </cli>\n'
+        '</rpc-reply>\n\n{master}')
+
+
+def to_json(value):
+    '''the Junos JSON of a value of an expected output, each element a list
+       of objects'''
+    if isinstance(value, list):
+        return [to_json(item)[0] for item in value]
+    if value is True or value is None:
+        return [None]
+    if not isinstance(value, dict):
+        return [{'data': str(value)}]
+    obj = {}
+    attrs = {key[1:]: item for key, item in value.items()
+             if key.startswith('@')}
+    if attrs:
+        obj['attributes'] = attrs
+    if '#text' in value:
+        obj['data'] = value['#text']
+    for key, item in value.items():
+        if not key.startswith(('@', '#')):
+            obj[key] = to_json(item)
+    return [obj]
+
+
+def render_json(expected):
+    return '{master}\n' + json.dumps(to_json(expected)[0], indent=4)
+
+
+def without_empty_lists(value):
+    # the text parsers may leave an empty list, such as the address families
+    # of an interface with none, which has no element in the structured
+    # output
+    if isinstance(value, dict):
+        return {key: without_empty_lists(item) for key, item in value.items()
+                if item != []}
+    if isinstance(value, list):
+        return [without_empty_lists(item) for item in value]
+    return value
+
+
+class TestParseStructured(unittest.TestCase):
+
+    text = '''
+        show route protocol static 2001:db8:eb18:ca45::1
+
+        inet6.0: 23 destinations, 24 routes (23 active, 0 holddown, 0 hidden)
+        + = Active Route, - = Last Active, * = Both
+
+        2001:db8:eb18:ca45::1/128
+                        *[Static/5] 3w5d 18:30:36
+                            >  to 2001:db8:eb18:6337::1 via ge-0/0/1.0
+    '''
+
+    xml = '''
+        show route protocol static 2001:db8:eb18:ca45::1 | display xml
+        <rpc-reply xmlns:junos="http://xml.juniper.net/junos/18.2R1/junos">
+            <route-information xmlns="http://xml.juniper.net/junos/18.2R1/junos-routing">
+                <!-- keepalive -->
+                <route-table>
+                    <table-name>inet6.0</table-name>
+                    <destination-count>23</destination-count>
+                    <total-route-count>24</total-route-count>
+                    <active-route-count>23</active-route-count>
+                    <holddown-route-count>0</holddown-route-count>
+                    <hidden-route-count>0</hidden-route-count>
+                    <rt junos:style="brief">
+                        <rt-destination>2001:db8:eb18:ca45::1/128</rt-destination>
+                        <rt-announced-count>1</rt-announced-count>
+                        <rt-entry>
+                            <active-tag>*</active-tag>
+                            <current-active/>
+                            <last-active/>
+                            <protocol-name>Static</protocol-name>
+                            <preference>5</preference>
+                            <age junos:seconds="2226636">3w5d 18:30:36</age>
+                            <nh>
+                                <selected-next-hop/>
+                                <to>2001:db8:eb18:6337::1</to>
+                                <via>ge-0/0/1.0</via>
+                            </nh>
+                        </rt-entry>
+                    </rt>
+                </route-table>
+            </route-information>
+            <cli>
+                <banner></banner>
+            </cli>
+        </rpc-reply>
+
+        {master}
+        admin@router>
+    '''
+
+    json = '''
+        {master}
+        {
+            "route-information" : [
+            {
+                "attributes" : {"xmlns" : "http://xml.juniper.net/junos/18.2R1/junos-routing"},
+                "route-table" : [
+                {
+                    "table-name" : [{"data" : "inet6.0"}],
+                    "destination-count" : [{"data" : "23"}],
+                    "total-route-count" : [{"data" : "24"}],
+                    "active-route-count" : [{"data" : "23"}],
+                    "holddown-route-count" : [{"data" : "0"}],
+                    "hidden-route-count" : [{"data" : "0"}],
+                    "rt" : [
+                    {
+                        "attributes" : {"junos:style" : "brief"},
+                        "rt-destination" : [{"data" : "2001:db8:eb18:ca45::1/128"}],
+                        "rt-announced-count" : [{"data" : "1"}],
+                        "rt-entry" : [
+                        {
+                            "active-tag" : [{"data" : "*"}],
+                            "current-active" : [null],
+                            "last-active" : [null],
+                            "protocol-name" : [{"data" : "Static"}],
+                            "preference" : [{"data" : "5"}],
+                            "age" : [
+                            {
+                                "data" : "3w5d 18:30:36",
+                                "attributes" : {"junos:seconds" : "2226636"}
+                            }
+                            ],
+                            "nh" : [
+                            {
+                                "selected-next-hop" : [null],
+                                "to" : [{"data" : "2001:db8:eb18:6337::1"}],
+                                "via" : [{"data" : "ge-0/0/1.0"}]
+                            }
+                            ]
+                        }
+                        ]
+                    }
+                    ]
+                }
+                ]
+            }
+            ]
+        }
+    '''
+
+    # the text output gives the same, without the attributes and the
+    # elements it does not show
+    expected = {
+        'route-information': {
+            'route-table': [{
+                'active-route-count': '23',
+                'destination-count': '23',
+                'hidden-route-count': '0',
+                'holddown-route-count': '0',
+                'rt': [{
+                    '@junos:style': 'brief',
+                    'rt-destination': '2001:db8:eb18:ca45::1/128',
+                    'rt-entry': {
+                        'active-tag': '*',
+                        'age': {'#text': '3w5d 18:30:36',
+                                '@junos:seconds': '2226636'},
+                        'current-active': '',
+                        'last-active': '',
+                        'nh': [{'selected-next-hop': '',
+                                'to': '2001:db8:eb18:6337::1',
+                                'via': 'ge-0/0/1.0'}],
+                        'preference': '5',
+                        'protocol-name': 'Static',
+                    },
+                }],
+                'table-name': 'inet6.0',
+                'total-route-count': '24',
+            }],
+        },
+    }
+
+    def test_xml(self):
+        self.assertEqual(parse_structured(self.xml, ShowRoute.schema),
+                         self.expected)
+        for chunk_size in (1, 7, 64):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    parse_structured(self.xml, ShowRoute.schema,
+                                     chunk_size=chunk_size),
+                    self.expected)
+        self.assertEqual(
+            parse_structured(self.xml.splitlines(True), ShowRoute.schema),
+            self.expected)
+
+    def test_json(self):
+        self.assertEqual(
+            parse_structured(self.json, ShowRoute.schema, display='json'),
+            self.expected)
+
+    def test_lists(self):
+        # the rows of a list of one are listed, and the repeated elements
+        xml = self.xml.replace('<nh>', '<nh><to>1</to></nh><nh>', 1)
+        nh = parse_structured(xml, ShowRoute.schema)['route-information'][
+            'route-table'][0]['rt'][0]['rt-entry']['nh']
+        self.assertEqual([hop['to'] for hop in nh],
+                         ['1', '2001:db8:eb18:6337::1'])
+
+    def test_indented_text(self):
+        # the text of the leaves on their own line is stripped, the spaces
+        # of the other ones are part of their value, such as an as-path
+        xml = self.xml.replace(
+            '<protocol-name>Static</protocol-name>',
+            '<protocol-name>\n                Static\n            '
+            '</protocol-name>').replace(
+            '<to>2001:db8:eb18:6337::1</to>',
+            '<to> 2001:db8:eb18:6337::1</to>')
+        entry = parse_structured(xml, ShowRoute.schema)['route-information'][
+            'route-table'][0]['rt'][0]['rt-entry']
+        self.assertEqual(entry['protocol-name'], 'Static')
+        self.assertEqual(entry['nh'][0]['to'], ' 2001:db8:eb18:6337::1')
+
+    def test_not_structured(self):
+        for output in (self.text, '', 'error: syntax error, expecting '
+                       '<command>: display', self.xml[:300]):
+            with self.subTest(output=output):
+                with self.assertRaises(StructuredOutputError):
+                    parse_structured(output, ShowRoute.schema)
+                with self.assertRaises(StructuredOutputError):
+                    parse_structured(output, ShowRoute.schema,
+                                     display='json')
+        with self.assertRaises(ValueError):
+            parse_structured(self.xml, ShowRoute.schema, display='yang')
+
+    def test_parser(self):
+        command = 'show route protocol static 2001:db8:eb18:ca45::1'
+        outputs = {command: self.text,
+                   command + ' | display xml': self.xml,
+                   command + ' | display json': self.json}
+        device = Mock(**{'execute.side_effect': outputs.get})
+        kwargs = {'protocol': 'static', 'ip_address': '2001:db8:eb18:ca45::1'}
+        text = ShowRoute(device=device).parse(**kwargs)
+
+        parser = ShowRoute(device=device, context='xml')
+        self.assertEqual(parser.parse(**kwargs), self.expected)
+        device.execute.assert_called_with(command + ' | display xml')
+        self.assertEqual(parser.parse(display='json', **kwargs),
+                         self.expected)
+        device.execute.assert_called_with(command + ' | display json')
+
+        # the text output is parsed by cli()
+        self.assertEqual(parser.parse(output=self.text), text)
+
+        # the device has no structured output
+        outputs[command + ' | display xml'] = \
+            "error: syntax error, expecting <command>: display"
+        self.assertEqual(parser.parse(**kwargs), text)
+        device.execute.assert_called_with(command)
+
+    def test_command(self):
+        parser = ShowRoute(device=None)
+        self.assertEqual(parser.structured_command(), 'show route')
+        self.assertEqual(parser.structured_command(protocol='ospf',
+                                                   table='inet.0'),
+                         'show route protocol ospf table inet.0')
+        self.assertIsNone(parser.structured_command(table='inet.0'))
+
+
+class TestStructuredGolden(unittest.TestCase):
+    '''the structured outputs of the golden outputs of the junos parsers
+       give the same dictionaries as their text outputs'''
+
+    def test_golden(self):
+        tests = os.path.join(os.path.dirname(junos.__file__), 'tests')
+        count = 0
+        for module in MODULES:
+            module = importlib.import_module(
+                'genie.libs.parser.junos.' + module)
+            for name, cls in inspect.getmembers(module, inspect.isclass):
+                if cls.__module__ != module.__name__ or \
+                        not issubclass(cls, StructuredParser):
+                    continue
+                for output in sorted(glob.glob(os.path.join(
+                        tests, name, 'cli', 'equal', '*_output.txt'))):
+                    golden = output[:-len('_output.txt')]
+                    kwargs = {}
+                    if os.path.exists(golden + '_arguments.json'):
+                        with open(golden + '_arguments.json') as f:
+                            kwargs = json.load(f)
+                    with open(output) as f:
+                        text = cls(device=Mock()).parse(output=f.read(),
+                                                        **kwargs)
+                    count += 1
+
+                    parser = cls(device=Mock(), context='xml')
+                    for display, render in (('xml', render_xml),
+                                            ('json', render_json)):
+                        with self.subTest(golden=golden, display=display):
+                            self.assertEqual(
+                                parser.parse(output=render(text),
+                                             display=display, **kwargs),
+                                without_empty_lists(text))
+        self.assertGreater(count, 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import unittest
+
+from genie.parsergen import oper_fill_tabular
+
+from genie.libs.parser.utils.table import TableReader
+
+
+class TestTableReader(unittest.TestCase):
+
+    output = '''
+        RP/0/0/CPU0:one#show isis topology level 1
+        Sat Sep 19 14:46:33.902 EDT
+
+        IS-IS ring paths to IPv4 Unicast (Level-1) routers
+        System Id       Metric  Next-Hop        Interface       SNPA
+        --------------- ------- --------------- --------------- ---------
+        one             --
+        two             10      two             Gi0/0/0/0       *PtoP*
+        two             10      two             Gi0/0/0/1       02db.ebba.ecc4
+        three           20      two             Gi0/0/0/0       *PtoP*
+
+        Total: 3
+    '''
+
+    header_fields = ['System Id', 'Metric', 'Next-Hop', 'Interface', 'SNPA']
+
+    def assertSameEntries(self, output, **kwargs):
+        self.assertEqual(
+            TableReader(**kwargs).read(output),
+            oper_fill_tabular(device_output=output, **kwargs).entries)
+
+    def test_read(self):
+        entries = TableReader(header_fields=self.header_fields,
+                              index=[0, 3]).read(self.output)
+        self.assertEqual(entries['two']['Gi0/0/0/1'], {
+            'System Id': 'two', 'Metric': '10', 'Next-Hop': 'two',
+            'Interface': 'Gi0/0/0/1', 'SNPA': '02db.ebba.ecc4'})
+        self.assertEqual(entries['one'][''], {
+            'System Id': 'one', 'Metric': '--', 'Next-Hop': '',
+            'Interface': '', 'SNPA': ''})
+        # not a table row, but read as one without a terminal pattern
+        self.assertIn('Total: 3', entries)
+
+    def test_label_fields(self):
+        reader = TableReader(header_fields=self.header_fields,
+                             label_fields=['id', 'metric', 'next_hop',
+                                           'interface', 'snpa'],
+                             index=1,
+                             table_terminal_pattern=r'^\s*$')
+        self.assertEqual(reader.read(self.output), {
+            '--': {'id': 'one', 'metric': '--', 'next_hop': '',
+                   'interface': '', 'snpa': ''},
+            '10': {'id': 'two', 'metric': '10', 'next_hop': 'two',
+                   'interface': 'Gi0/0/0/1', 'snpa': '02db.ebba.ecc4'},
+            '20': {'id': 'three', 'metric': '20', 'next_hop': 'two',
+                   'interface': 'Gi0/0/0/0', 'snpa': '*PtoP*'},
+        })
+
+        with self.assertRaises(ValueError):
+            TableReader(header_fields=self.header_fields,
+                        label_fields=['id'])
+
+    def test_right_justified(self):
+        # the header fields are padded on the right
+        output = '\n'.join([
+            'Switch Ports Model              SW Version        SW Image              Mode   ',
+            '------ ----- -----              ----------        ----------            ----   ',
+            '*    1 32    WS-C3850-24P       16.4.2            CAT3K_CAA-UNIVERSALK9 BUNDLE ',
+            '     2 32    WS-C3850-24P       16.4.2            CAT3K_CAA-UNIVERSALK9 BUNDLE ',
+            '',
+            'Current            Type            Next reboot',
+        ])
+        reader = TableReader(right_justified=True,
+                             header_fields=['Switch', 'Ports',
+                                            'Model             ',
+                                            'SW Version       ',
+                                            'SW Image              ',
+                                            'Mode   '],
+                             table_terminal_pattern=r'(^\n|^\s*$)')
+        entries = reader.read(output)
+        self.assertEqual(list(entries), ['*    1', '2'])
+        self.assertEqual(entries['2']['Model             '], 'WS-C3850-24P')
+        self.assertEqual(entries['2']['Mode   '], 'BUNDLE')
+        # the columns of the header line are reused
+        self.assertEqual(reader.read(output), entries)
+        self.assertEqual(len(reader._columns), 1)
+
+    def test_terminal_pattern(self):
+        output = '''
+            Process    Location   Proto
+
+            a          n1         y
+            b          n2         y
+
+            c          n3         y
+            Process    Location   Proto
+            d          n4         y
+        '''
+        entries = TableReader(header_fields=['Process', 'Location', 'Proto'],
+                              table_terminal_pattern=r'^\n').read(output)
+        # the empty lines after the header do not end the table, and the
+        # next header line starts it again
+        self.assertEqual(list(entries), ['a', 'b', 'd'])
+
+    def test_empty(self):
+        reader = TableReader(header_fields=self.header_fields)
+        self.assertEqual(reader.read(''), {})
+        self.assertEqual(reader.read('one  10  two'), {})
+
+    def test_same_as_oper_fill_tabular(self):
+        for kwargs in ({},
+                       {'index': [0, 3]},
+                       {'right_justified': True},
+                       {'table_terminal_pattern': r'(^\n|^\s*$)'},
+                       {'table_terminal_pattern': r'^\s+two'}):
+            with self.subTest(**kwargs):
+                self.assertSameEntries(self.output,
+                                       header_fields=self.header_fields,
+                                       **kwargs)
+                self.assertSameEntries(self.output.replace('\n', '\r\n'),
+                                       header_fields=self.header_fields,
+                                       **kwargs)
+                self.assertSameEntries(self.output.replace('      ', '\t'),
+                                       header_fields=self.header_fields,
+                                       **kwargs)
+
+
+if __name__ == '__main__':
+    unittest.main()
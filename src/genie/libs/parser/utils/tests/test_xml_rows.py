@@ -0,0 +1,132 @@
+import io
+import unittest
+import warnings
+
+from genie.libs.parser.utils.xml_rows import (
+    XML_DELIMITER, iter_xml_chunks, iter_xml_rows)
+
+
+class TestXmlRows(unittest.TestCase):
+
+    output = '''<?xml version="1.0" encoding="ISO-8859-1"?>
+        <nf:rpc-reply xmlns="http://www.cisco.com/nxos:1.0:bgp" xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0">
+         <nf:data>
+          <show>
+           <bgp>
+            <sessions>
+             <__readonly__>
+              <totalpeers>3</totalpeers>
+              <TABLE_vrf>
+               <ROW_vrf>
+                <vrf-name-out>default</vrf-name-out>
+                <TABLE_neighbor>
+                 <ROW_neighbor>
+                  <neighbor-id>10.1.1.1</neighbor-id>
+                 </ROW_neighbor>
+                 <ROW_neighbor>
+                  <neighbor-id>10.2.2.2</neighbor-id>
+                 </ROW_neighbor>
+                </TABLE_neighbor>
+                <router-id>10.0.0.1</router-id>
+               </ROW_vrf>
+               <ROW_vrf>
+                <vrf-name-out>red</vrf-name-out>
+               </ROW_vrf>
+              </TABLE_vrf>
+             </__readonly__>
+            </sessions>
+           </bgp>
+          </show>
+         </nf:data>
+        </nf:rpc-reply>
+        ]]>]]>'''
+
+    fields = ['totalpeers', 'vrf-name-out', 'neighbor-id', 'router-id']
+
+    def rows(self, output=None, **kwargs):
+        # the fields found in each row when it is yielded
+        return [(row.tag, {field: row.find(field).text
+                           for field in self.fields
+                           if row.find(field) is not None})
+                for row in iter_xml_rows(output or self.output, **kwargs)]
+
+    def test_chunks(self):
+        output = 'a]]>]]>b]]>]]>c' + XML_DELIMITER
+        for chunk_size in range(1, len(output) + 1):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    ''.join(iter_xml_chunks(output, chunk_size=chunk_size)),
+                    'abc')
+        self.assertEqual(''.join(iter_xml_chunks(['a]]>', ']]>b]', ']'])),
+                         'ab]]')
+
+    def test_rows(self):
+        # a row is yielded with its fields when its first table starts,
+        # before the fields after the table
+        self.assertEqual(self.rows(), [
+            ('ROW_vrf', {'vrf-name-out': 'default'}),
+            ('ROW_neighbor', {'neighbor-id': '10.1.1.1'}),
+            ('ROW_neighbor', {'neighbor-id': '10.2.2.2'}),
+            ('ROW_vrf', {'vrf-name-out': 'red'}),
+        ])
+        self.assertEqual(
+            self.rows(rows=['__readonly__', 'ROW_vrf']),
+            [('__readonly__', {'totalpeers': '3'}),
+             ('ROW_vrf', {'vrf-name-out': 'default'}),
+             ('ROW_vrf', {'vrf-name-out': 'red'})])
+
+    def test_whole(self):
+        # the rows yielded whole have all their fields and nested tables
+        self.assertEqual(self.rows(whole=['ROW_vrf']), [
+            ('ROW_vrf', {'vrf-name-out': 'default',
+                         'router-id': '10.0.0.1'}),
+            ('ROW_vrf', {'vrf-name-out': 'red'}),
+        ])
+        row = next(iter_xml_rows(self.output, whole=['ROW_vrf']))
+        self.assertEqual(
+            [nei.find('neighbor-id').text for nei in
+             row.find('TABLE_neighbor').findall('ROW_neighbor')],
+            ['10.1.1.1', '10.2.2.2'])
+
+    def test_chunk_size(self):
+        rows = self.rows()
+        for output in (self.output.replace('\n', '\r\n'),
+                       io.StringIO(self.output)):
+            self.assertEqual(self.rows(output), rows)
+        for chunk_size in (1, 7, 64):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.rows(chunk_size=chunk_size), rows)
+
+    def test_clear(self):
+        # the rows and tables read are cleared and removed from the tree
+        rows = iter_xml_rows(self.output, rows=['__readonly__', 'ROW_vrf'])
+        readonly = next(rows)
+        vrf = next(rows)
+        self.assertIn(vrf, list(readonly.find('TABLE_vrf')))
+        next(rows)
+        self.assertEqual(len(vrf), 0)
+        self.assertNotIn(vrf, list(readonly.find('TABLE_vrf')))
+        list(rows)
+        self.assertEqual(len(readonly), 0)
+
+    def test_command(self):
+        self.assertEqual(
+            len(self.rows(command='show bgp sessions')), 4)
+        with self.assertRaises(AssertionError):
+            self.rows(command='show bgp sessions vrf all')
+
+        # __readonly__ missing from the output
+        output = self.output.replace('__readonly__', 'TABLE_peers')
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            self.rows(output, command='show bgp sessions')
+        self.assertTrue(w)
+
+    def test_no_namespace(self):
+        output = self.output.replace(
+            'xmlns="http://www.cisco.com/nxos:1.0:bgp" ', '')
+        self.assertEqual(self.rows(output, command='show bgp bad'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
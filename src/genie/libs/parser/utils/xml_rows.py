@@ -0,0 +1,216 @@
+'''Read the XML outputs of the NX-OS '| xml' commands incrementally, one
+   table row at a time'''
+
+import warnings
+import xml.etree.ElementTree as ET
+
+# end of the NETCONF messages, returned by the device with the output
+XML_DELIMITER = ']]>]]>'
+
+# size of the chunks of the output fed to the XML parser
+CHUNK_SIZE = 1 << 16
+
+
+def _local_name(tag):
+    return tag[tag.find('}') + 1:]
+
+
+def iter_xml_chunks(output, chunk_size=CHUNK_SIZE):
+    '''Yield the chunks of output without the NETCONF delimiters, even those
+       split across the chunks
+
+        Args:
+            output (`str`, `iterable`): the whole output, or an iterable of
+                                        its chunks such as a file object
+    '''
+    if isinstance(output, str):
+        chunks = (output[i:i + chunk_size]
+                  for i in range(0, len(output), chunk_size))
+    else:
+        chunks = output
+
+    pending = ''
+    for chunk in chunks:
+        chunk = (pending + chunk).replace(XML_DELIMITER, '')
+        # keep the end of the chunk which may start a delimiter
+        for size in range(len(XML_DELIMITER) - 1, 0, -1):
+            if chunk.endswith(XML_DELIMITER[:size]):
+                pending = chunk[-size:]
+                chunk = chunk[:-size]
+                break
+        else:
+            pending = ''
+        if chunk:
+            yield chunk
+    if pending:
+        yield pending
+
+
+class _Command(object):
+    '''Command composed from the tags of the output down to __readonly__,
+       as Common.compose_compare_command does on the whole tree'''
+
+    def __init__(self):
+        self.words = []
+        # depth of the last element of the command, from the data element
+        # under the rpc-reply
+        self.depth = 1
+        self.done = False
+
+    def start(self, name, depth):
+        if depth != self.depth + 1 or '__XML__value' in name:
+            return
+        self.depth = depth
+        if '__readonly__' in name:
+            self.done = True
+            return
+        if '__XML__PARAM__' not in name and 'TABLE' not in name:
+            self.words.append(name)
+        if 'TABLE' in name:
+            warnings.warn('Tag "__readonly__" should exsist in output when '
+                          'there are actual values in output')
+            self.done = True
+
+    def end(self, elem, name, depth):
+        if depth == self.depth + 1 and '__XML__value' in name:
+            self.words.append(elem.text or '')
+        elif depth <= self.depth:
+            # the command has no other element
+            self.done = True
+
+    def check(self, expect_command):
+        cli = ' '.join(self.words).strip()
+        assert cli == expect_command, \
+            'Cli created from XML tags does not match the actual cli:\n'\
+            'XML Tags cli: {c}\nCli command: {e}'.format(c=cli,
+                                                         e=expect_command)
+
+
+def iter_xml_rows(output, rows=None, whole=None, command=None,
+                  chunk_size=CHUNK_SIZE):
+    '''Parse the XML output of a NX-OS '| xml' command incrementally, and
+       yield its table rows, the ROW_<table> elements, in document order.
+
+       Each row is yielded as soon as its own fields are read, that is when
+       its first nested table starts, or at its end when it has none, so the
+       fields of a row come before the rows of its nested tables, as in the
+       nested loops over the whole tree. The nested tables of a row are not
+       read yet when it is yielded: their rows are yielded in turn. Rows and
+       tables are cleared once read, so that only the fields of the rows
+       being read are kept in memory, however large the tables are.
+
+       The rows with fields after their nested tables are given in whole
+       instead: they are yielded at their end, with their nested tables,
+       whose rows are not yielded in turn.
+
+       The tags of the elements are given without their namespace, such as
+       row.find('neighborid'), once they are read. The elements of a row
+       after its fields may already be in the tree when it is yielded, but
+       keep their namespace until read, so that row.find() only finds the
+       fields read.
+
+       Like the parsers on the whole tree, no row is yielded when the 'show'
+       element of the command has no namespace.
+
+        Args:
+            output (`str`, `iterable`): the whole output, or an iterable of
+                                        its chunks such as a file object,
+                                        with or without the NETCONF
+                                        delimiters
+            rows (`list`): tags of the rows to yield, all the ROW_<table>
+                           elements by default, '__readonly__' yielding the
+                           element holding the fields of the output itself
+            whole (`list`): tags of the rows to yield at their end with their
+                            nested tables
+            command (`str`): command the output must be of, checked against
+                             the tags of the output when given
+            chunk_size (`int`): size of the chunks of the output parsed at a
+                                time
+
+        Returns:
+            generator of `Element`
+
+        Raises:
+            AssertionError: the tags of the output do not match the command
+
+        example:
+
+            >>> for row in iter_xml_rows(out, rows=['ROW_vrf', 'ROW_neighbor'],
+            ...                          command='show bgp vrf all all summary'):
+            ...     if row.tag == 'ROW_vrf':
+            ...         vrf = row.find('vrf-name-out').text
+            ...     elif row.tag == 'ROW_neighbor':
+            ...         neighbor = row.find('neighborid').text
+    '''
+    rows = set(rows) if rows is not None else None
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    cmd = _Command()
+    whole = set(whole or ())
+    # open elements, whether each of them is a row not yielded yet, and
+    # whether it is a row yielded whole
+    stack = []
+    unread = []
+    wholes = []
+    # number of open rows yielded whole
+    inside = 0
+    namespace = None
+
+    def read_events():
+        nonlocal namespace, inside
+        for event, elem in parser.read_events():
+            if event == 'start':
+                name = _local_name(elem.tag)
+                if namespace is None and name == 'show':
+                    namespace = elem.tag[:elem.tag.find('}') + 1] \
+                        if elem.tag.startswith('{') else ''
+                elem.tag = name
+                if not cmd.done:
+                    cmd.start(name, len(stack))
+                    if cmd.done and command is not None and namespace:
+                        cmd.check(command)
+
+                # the fields of the enclosing row are all read
+                if name.startswith('TABLE_') and unread and unread[-1] \
+                        and not inside:
+                    unread[-1] = False
+                    if namespace:
+                        yield stack[-1]
+
+                is_whole = not inside and name in whole
+                stack.append(elem)
+                wholes.append(is_whole)
+                if inside:
+                    unread.append(False)
+                else:
+                    unread.append(is_whole or (
+                        name in rows if rows is not None
+                        else name.startswith('ROW_')))
+                inside += is_whole
+                continue
+
+            name = elem.tag
+            stack.pop()
+            inside -= wholes.pop()
+            if not cmd.done:
+                cmd.end(elem, name, len(stack))
+                if cmd.done and command is not None and namespace:
+                    cmd.check(command)
+
+            if unread.pop() and namespace:
+                yield elem
+            if inside:
+                # kept with the row yielded whole
+                continue
+            if name.startswith(('ROW_', 'TABLE_')) or name == '__readonly__':
+                elem.clear()
+                if stack:
+                    stack[-1].remove(elem)
+
+    for chunk in iter_xml_chunks(output, chunk_size=chunk_size):
+        parser.feed(chunk)
+        yield from read_events()
+    parser.close()
+    yield from read_events()
+
+    if not cmd.done and command is not None and namespace:
+        cmd.check(command)
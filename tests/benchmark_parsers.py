@@ -0,0 +1,275 @@
+"""Benchmark the parsers on the golden outputs of the folder based tests.
+
+The parsers and their cli/equal/*_output.txt golden outputs are discovered the
+same way as ci_folder_parsing.py. Each golden output is parsed with
+parse(output=...), as is and scaled up by repeating it, and reported with:
+
+    * ops/s: parse calls per second
+    * p50/p99: median and 99th percentile latency of a call
+    * peak: peak memory allocated by a call, measured on a separate call as
+      tracemalloc slows parsing down
+
+With --synthetic, the outputs are scaled up with synthetic_outputs.py, which
+replicates their records with unique keys, rather than repeated as is.
+
+With --cli, cli(output=...) is timed instead of parse(), leaving out the
+validation of the result against the schema. With --validate, only the
+validation of the result of cli() against the schema is timed.
+
+With --linear, the parsing time of each output at its smallest and largest
+scale gives the exponent k of time ~ lines ** k, to flag the parsers whose
+parsing time grows faster than their output, such as:
+
+    python benchmark_parsers.py -o iosxe -c ShowIpRoute --synthetic --cli
+                                -s 1000 10000 100000 -n 1 --linear
+
+The results can be saved to a JSON file, and compared with a previously saved
+baseline to flag the parsers which got slower or use more memory.
+
+usage: python benchmark_parsers.py [-o iosxe] [-c ShowInterfaces] [-t c9300]
+                                   [-s 1 10] [--synthetic] [--cli | --validate]
+                                   [-n 20]
+                                   [--save results.json]
+                                   [--baseline baseline.json] [--linear]
+                                   [--tolerance 0.2]
+"""
+
+# Python
+import os
+import sys
+import glob
+import json
+import math
+import time
+import argparse
+import tracemalloc
+from unittest.mock import Mock
+
+from genie.metaparser.util.schemaengine import Schema
+
+from folder_parsing_utils import (
+    get_folder_root,
+    get_operating_systems,
+    get_parser_classes,
+    read_from_file,
+    read_json_file,
+    read_python_file,
+)
+from synthetic_outputs import replicate_output
+
+
+def golden_outputs(operating_system, class_name, token=None):
+    """Return the (test name, output, arguments, expected file) of the golden
+    tests"""
+    folder_root = get_folder_root(operating_system, class_name, token)
+    outputs = []
+    for output_file in sorted(glob.glob(f"{folder_root}/*_output.txt")):
+        user_test = os.path.basename(output_file[: -len("_output.txt")])
+        arguments = {}
+        if os.path.exists(f"{folder_root}/{user_test}_arguments.json"):
+            arguments = read_json_file(f"{folder_root}/{user_test}_arguments.json")
+        outputs.append((user_test, read_from_file(output_file), arguments,
+                        f"{folder_root}/{user_test}_expected.py"))
+    return outputs
+
+
+def scale_output(output, scale, expected_file=None):
+    """Repeat the output scale times, as a larger device would print it, or
+    replicate its records with unique keys given its expected output"""
+    if scale == 1:
+        return output
+    if expected_file:
+        return replicate_output(output, read_python_file(expected_file), scale)
+    return "\n".join([output.rstrip("\n")] * scale) + "\n"
+
+
+def percentile(samples, percent):
+    """Nearest rank percentile of sorted samples"""
+    rank = max(1, -(-len(samples) * percent // 100))
+    return samples[int(rank) - 1]
+
+
+def benchmark(local_class, output, arguments, number, mode="parse"):
+    """Time number parse calls of output, or of its cli() or schema validation
+    only, and measure the peak memory of one"""
+
+    if mode == "validate":
+        parser = local_class(device=Mock())
+        parsed = parser.cli(output=output, **arguments)
+        schema = Schema(parser.schema)
+
+    def parse():
+        if mode == "validate":
+            return schema.validate(parsed)
+        parser = local_class(device=Mock())
+        if mode == "cli":
+            return parser.cli(output=output, **arguments)
+        return parser.parse(output=output, **arguments)
+
+    # warm up, also raises when the parser fails on this output
+    parse()
+
+    samples = []
+    for _ in range(number):
+        start = time.perf_counter()
+        parse()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+
+    tracemalloc.start()
+    try:
+        parse()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "lines": output.count("\n"),
+        "ops": number / sum(samples),
+        "p50_us": percentile(samples, 50) * 1e6,
+        "p99_us": percentile(samples, 99) * 1e6,
+        "peak_kb": peak / 1024,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Return the (key, metric, baseline, current) which regressed by more
+    than tolerance"""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if not base or "error" in result or "error" in base:
+            continue
+        for metric in ("p50_us", "p99_us", "peak_kb"):
+            if result[metric] > base[metric] * (1 + tolerance):
+                regressions.append((key, metric, base[metric], result[metric]))
+    return regressions
+
+
+def nonlinear(results, tolerance):
+    """Return the (key, smallest scale, largest scale, exponent) of the
+    outputs whose parsing time grows faster than lines ** (1 + tolerance)
+    between their smallest and largest scale"""
+    scales = {}
+    for key, result in results.items():
+        if "error" in result or not result["lines"]:
+            continue
+        output, size = key.rsplit("/", 1)
+        scale = int(size[1:].split("-")[0])
+        scales.setdefault(output, []).append(
+            (scale, result["lines"], result["p50_us"]))
+    growths = []
+    for output, sizes in scales.items():
+        sizes.sort()
+        (small, small_lines, small_time), (large, large_lines, large_time) = \
+            sizes[0], sizes[-1]
+        if large_lines <= small_lines:
+            continue
+        exponent = math.log(large_time / small_time) / \
+            math.log(large_lines / small_lines)
+        if exponent > 1 + tolerance:
+            growths.append((output, small, large, exponent))
+    return growths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--operating_system", type=str, default=None,
+                        help="The OS you wish to filter on")
+    parser.add_argument("-c", "--class_name", type=str, default=None,
+                        help="The Class you wish to filter on")
+    parser.add_argument("-t", "--token", type=str, default=None,
+                        help="The Token associated with the class, such as 'asr1k'")
+    parser.add_argument("-s", "--scale", type=int, nargs="+", default=[1],
+                        help="Times each golden output is repeated, such as '1 10 100'")
+    parser.add_argument("--synthetic", action="store_true",
+                        help="Replicate the records of the outputs with unique keys")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--cli", action="store_const", dest="mode", const="cli",
+                      default="parse",
+                      help="Time cli() instead of parse(), without the schema validation")
+    mode.add_argument("--validate", action="store_const", dest="mode",
+                      const="validate",
+                      help="Time the schema validation of the result of cli() only")
+    parser.add_argument("-n", "--number", type=int, default=20,
+                        help="Parse calls timed per output")
+    parser.add_argument("--save", type=str, default=None,
+                        help="Write the results to this JSON file")
+    parser.add_argument("--baseline", type=str, default=None,
+                        help="Compare the results with this JSON file")
+    parser.add_argument("--linear", action="store_true",
+                        help="Check the parsing time grows linearly with the scale")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative increase over the baseline, "
+                             "or of the --linear exponent over 1")
+    args = parser.parse_args()
+
+    results = {}
+    header = "{:<70} {:>7} {:>10} {:>10} {:>10} {:>10}".format(
+        "parser", "lines", "ops/s", "p50 us", "p99 us", "peak kB")
+    print(header)
+    print("-" * len(header))
+    for operating_system in get_operating_systems(args.operating_system):
+        for token, name, local_class in get_parser_classes(
+                operating_system, args.token, args.class_name):
+            for user_test, output, arguments, expected_file in golden_outputs(
+                    operating_system, name, token):
+                for scale in args.scale:
+                    size = f"x{scale}"
+                    if args.synthetic and scale > 1:
+                        size += "-synthetic"
+                    if args.mode != "parse":
+                        size += "-" + args.mode
+                    key = "/".join(filter(None, [operating_system, token, name,
+                                                 user_test, size]))
+                    try:
+                        scaled = scale_output(
+                            output, scale, args.synthetic and expected_file)
+                        result = benchmark(local_class, scaled, arguments,
+                                           args.number, args.mode)
+                    except Exception as e:
+                        results[key] = {"error": repr(e)}
+                        print("{:<70} {}".format(key, type(e).__name__))
+                        continue
+                    results[key] = result
+                    print("{:<70} {:>7} {:>10.1f} {:>10.1f} {:>10.1f} {:>10.1f}"
+                          .format(key, result["lines"], result["ops"],
+                                  result["p50_us"], result["p99_us"],
+                                  result["peak_kb"]))
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=4, sort_keys=True)
+
+    failed = False
+    if args.linear:
+        growths = nonlinear(results, args.tolerance)
+        print()
+        if not growths:
+            print("The parsing time grows linearly with the output")
+        else:
+            failed = True
+            print("Parsing time growing faster than the output:")
+            for output, small, large, exponent in growths:
+                print("  {:<70} x{} -> x{}: lines ** {:.2f}".format(
+                    output, small, large, exponent))
+
+    if args.baseline:
+        regressions = compare(results, read_json_file(args.baseline),
+                              args.tolerance)
+        print()
+        if not regressions:
+            print(f"No regression over {args.baseline}")
+        else:
+            failed = True
+            print(f"Regressions over {args.baseline}:")
+            for key, metric, base, current in regressions:
+                print("  {:<70} {:<8} {:>10.1f} -> {:>10.1f} ({:+.0%})".format(
+                    key, metric, base, current, current / base - 1))
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
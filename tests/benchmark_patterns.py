@@ -0,0 +1,159 @@
+"""Benchmark the per-call cost of compiling parser regular expressions.
+
+Parsers declaring their patterns as LazyPattern class attributes compile them
+once per class. This script compares, for each parser, the time previously
+spent in cli() on pattern setup with the time of the class attribute lookups,
+and puts it in perspective with the time to parse the golden outputs of the
+folder based tests.
+
+    * cold: re.compile of every pattern with an empty re module cache, which is
+      what each call costs once the cache is thrashed by other parsers
+    * warm: re.compile of every pattern served from the re module cache
+    * class: access to the compiled class attributes
+
+usage: python benchmark_patterns.py [-o iosxe] [-c ShowInterfaces] [-n 200]
+"""
+
+# Python
+import os
+import re
+import glob
+import json
+import timeit
+import argparse
+import importlib
+from unittest.mock import Mock
+
+# Genie
+from genie.libs.parser.utils.patterns import class_patterns
+
+PARSER_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', 'src', 'genie', 'libs', 'parser')
+
+# Parsers converted to class level patterns
+PARSERS = {
+    'iosxe': {
+        'show_interface': ['ShowInterfaces'],
+        'show_routing': ['ShowIpRoute', 'ShowIpv6RouteUpdated'],
+        'show_bgp': ['ShowBgpAllNeighbors', 'ShowIpBgpAllSummary'],
+        'show_fdb': ['ShowMacAddressTable'],
+        'show_arp': ['ShowArp'],
+    },
+    'nxos': {
+        'show_interface': ['ShowInterface'],
+        'show_routing': ['ShowIpRoute'],
+        'show_bgp': ['ShowBgpVrfAllAllSummary'],
+        'show_fdb': ['ShowMacAddressTable'],
+        'show_arp': ['ShowIpArp'],
+    },
+    'iosxr': {
+        'show_interface': ['ShowInterfacesDetail'],
+        'show_routing': ['ShowRouteIpv4'],
+        'show_bgp': ['ShowBgpInstanceSummary'],
+        'show_l2vpn': ['ShowL2vpnMacLearning'],
+        'show_arp': ['ShowArpDetail'],
+    },
+    'junos': {
+        'show_interface': ['ShowInterfaces'],
+        'show_route': ['ShowRouteTable'],
+        'show_bgp': ['ShowBgpSummary'],
+        'show_arp': ['ShowArp'],
+    },
+}
+
+
+def golden_outputs(operating_system, cls):
+    """Return the (output, arguments) of the folder based golden tests"""
+    folder = os.path.join(PARSER_FOLDER, operating_system, 'tests',
+                          cls.__name__, 'cli', 'equal')
+    outputs = []
+    for output_file in sorted(glob.glob(f"{folder}/*_output.txt")):
+        with open(output_file) as f:
+            output = f.read()
+        arguments = {}
+        arguments_file = output_file[:-len('_output.txt')] + '_arguments.json'
+        if os.path.exists(arguments_file):
+            with open(arguments_file) as f:
+                arguments = json.load(f)
+        outputs.append((output, arguments))
+    return outputs
+
+
+def per_call(stmt, number):
+    """Best time of a single call in microseconds"""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def benchmark(operating_system, cls, number):
+    patterns = class_patterns(cls)
+    sources = [(p.pattern, p.flags) for p in patterns.values()]
+    names = list(patterns)
+
+    def cold():
+        re.purge()
+        for pattern, flags in sources:
+            re.compile(pattern, flags)
+
+    def warm():
+        for pattern, flags in sources:
+            re.compile(pattern, flags)
+
+    def lookup():
+        for name in names:
+            getattr(cls, name)
+
+    # re.purge is part of the cold loop, remove its own cost
+    result = {
+        'patterns': len(names),
+        'cold': per_call(cold, number) - per_call(re.purge, number),
+        'warm': per_call(warm, number),
+        'class': per_call(lookup, number),
+        'parse': None,
+    }
+
+    outputs = golden_outputs(operating_system, cls)
+    if outputs:
+        def parse():
+            for output, arguments in outputs:
+                device = Mock(**{'execute.return_value': output})
+                cls(device=device).parse(**arguments)
+        try:
+            result['parse'] = per_call(parse, max(1, number // 10)) / len(outputs)
+        except Exception:
+            pass
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-o', '--os', dest='_os', help='only this os')
+    parser.add_argument('-c', '--class', dest='_class', help='only this class')
+    parser.add_argument('-n', '--number', type=int, default=200,
+                        help='calls per measurement')
+    args = parser.parse_args()
+
+    header = '{:<6} {:<28} {:>4} {:>10} {:>10} {:>10} {:>10}'.format(
+        'os', 'parser', 're', 'cold us', 'warm us', 'class us', 'parse us')
+    print(header)
+    print('-' * len(header))
+    for operating_system, modules in PARSERS.items():
+        if args._os and args._os != operating_system:
+            continue
+        for module_name, classes in modules.items():
+            module = importlib.import_module(
+                f'genie.libs.parser.{operating_system}.{module_name}')
+            for name in classes:
+                if args._class and args._class != name:
+                    continue
+                res = benchmark(operating_system, getattr(module, name),
+                                args.number)
+                parse = '{:>10.1f}'.format(res['parse']) \
+                    if res['parse'] is not None else '{:>10}'.format('-')
+                print('{:<6} {:<28} {:>4} {:>10.1f} {:>10.1f} {:>10.2f} {}'
+                      .format(operating_system, name, res['patterns'],
+                              res['cold'], res['warm'], res['class'], parse))
+
+
+if __name__ == '__main__':
+    main()
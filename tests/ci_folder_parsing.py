@@ -2,15 +2,13 @@
 
 # Python
 import os
-import re
 import sys
 import glob
 import json
 import logging
-import inspect
 import argparse
-import importlib
 from unittest.mock import Mock
+from concurrent.futures import ProcessPoolExecutor
 
 # pyATS
 from pyats import aetest
@@ -25,59 +23,20 @@ from genie.utils.diff import Diff
 from genie.libs import parser as _parser
 from genie.metaparser.util.exceptions import SchemaEmptyParserError
 
-
-log = logging.getLogger(__name__)
-
-def read_from_file(file_path):
-    """Helper function to read from a file."""
-    with open(file_path, "r") as f:
-        return f.read()
-
-
-def read_json_file(file_path):
-    """Helper function to read in json."""
-    with open(file_path) as f:
-        data = json.load(f)
-    return data
-
-
-def read_python_file(file_path):
-    """Helper function to read in a Python file, and look for expected_output."""
-    _module = importlib.machinery.SourceFileLoader("expected", file_path).load_module()
-    return getattr(_module, "expected_output")
-
-
-def get_operating_systems(_os):
-    """Helper Script to get operating systems."""
-    # Update and fix as more OS's converted to folder based tests
-    if _os:
-        return [_os]
-    return ["asa", "ios", "iosxe", "junos"]
-    # operating_system = []
-    # for folder in os.listdir("./"):
-    #    if os.path.islink("./" + folder):
-    #        operating_system.append(folder)
-    # return operating_system
-
-
-# The get_tokens function dynamically finds tokens by leveraging globs. This
-# works based on the deterministic folder structure. Within a given OS root folder one can
-# determine that a sub folder is in fact a token, if there is a "tests" directory. Upon removing
-# the .py via [-2], there is now a list of files to import from.
-def get_tokens(folder):
-    tokens = []
-    for path in glob.glob(f"{folder}/*/tests"):
-        tokens.append(path.split("/")[-2])
-    return tokens
+from folder_parsing_utils import (
+    EMPTY_SKIP,
+    get_folder_root,
+    get_operating_systems,
+    get_output_files,
+    get_parser_classes,
+    read_from_file,
+    read_json_file,
+    read_python_file,
+    run_parser_tests,
+)
 
 
-def get_files(folder, token=None):
-    files = []
-    for parse_file in glob.glob(f"{folder}/*.py"):
-        if parse_file.endswith("__init__.py"):
-            continue
-        files.append({"parse_file": parse_file, "token": token})
-    return files
+log = logging.getLogger(__name__)
 
 
 class FileBasedTest(aetest.Testcase):
@@ -113,7 +72,7 @@ class FileBasedTest(aetest.Testcase):
 
     # setup portion used to define command line options
     @aetest.setup
-    def setup(self, _os, _class, _token, _number, _display_only_failed):
+    def setup(self, _os, _class, _token, _number, _display_only_failed, _jobs=None):
 
         # removes screenhandler from root if _display_only_failed 
         # flag is passed
@@ -123,102 +82,148 @@ class FileBasedTest(aetest.Testcase):
         aetest.loop.mark(self.test, operating_system=get_operating_systems(_os))
 
     @aetest.test
-    def test(self,operating_system, steps, _os, _class, _token, _number, _display_only_failed):
+    def test(self,operating_system, steps, _os, _class, _token, _number, _display_only_failed, _jobs=None):
 
         """Loop through OS's and run appropriate tests."""
-        base_folder = f"../src/genie/libs/parser/{operating_system}"
-        # Please refer to get_tokens comments for the how, the what is a genie token, such as
-        # "asr1k" or "c3850" to provide namespaced parsing.
-        tokens = get_tokens(base_folder)
-        parse_files = []
-        parse_files.extend(get_files(base_folder))
-        for token in tokens:
-            parse_files.extend(get_files(f"{base_folder}/{token}", token))
-        start = False
-        # Get all of the root level files
-        for details in parse_files:
-            parse_file = details["parse_file"]
-            token = details["token"]
-            # Load all of the classes in each of those files, and search for classes
-            # that have a `cli` method
-            _module = None
-            module_name = os.path.basename(parse_file[: -len(".py")])
+        if _jobs and _jobs > 1:
+            return self.test_parallel(
+                steps, operating_system, _class, _token, _number, _display_only_failed, _jobs
+            )
+
+        for token, name, local_class in get_parser_classes(operating_system, _token, _class):
             if token:
-                module_name = f"{operating_system}_{token}_{module_name}"
+                msg = f"{operating_system} -> Token -> {token} -> {name}"
             else:
-                module_name = f"{operating_system}_{module_name}"
-            _module = importlib.machinery.SourceFileLoader(
-                module_name, parse_file
-            ).load_module()
-
-            for name, local_class in inspect.getmembers(_module):
-                # The following methods determin when a test is not warranted, further detail will be provided for each method.
-
-                # If there is a token and the "class" was found to be a known whitelist (mainly since there was not existing tests),
-                # skip. Whitelisted items should be cleaned up over time, and this removed to enforce testing always happens.
-                if token and CLASS_SKIP.get(operating_system, {}).get(token, {}).get(
-                    name
-                ):
-                    continue
-                # Same as previous, but in cases without tokens (which is the majority.)
-                elif not token and CLASS_SKIP.get(operating_system, {}).get(name):
-                    continue
+                msg = f"{operating_system} -> {name}"
+            with steps.start(msg, continue_=True) as class_step:
+                with class_step.start(
+                    f"Test Golden -> {operating_system} -> {name}",
+                    continue_=True,
+                ) as golden_steps:
+                    self.test_golden(
+                        golden_steps, local_class, operating_system, _display_only_failed, token, _number
+                    )
 
-                # This is used in conjunction with the arguments that are run at command line, to skip over all tests you are
-                # not concerned with. Basically, it allows a user to not have to wait for 100s of tests to run, to run their
-                # one test.
-                if _token and _token != token:
-                    continue
-                # Same as previous, however, for class
-                if _class and _class != name:
+                with class_step.start(
+                    f"Test Empty -> {operating_system} -> {name}",
+                    continue_=True,
+                ) as empty_steps:
+                    self.test_empty(
+                        empty_steps, local_class, operating_system, token
+                    )
+
+
+    def test_parallel(self, steps, operating_system, _class, _token, _number, _display_only_failed, _jobs):
+        """Shard the parser classes across _jobs worker processes, and report
+        their results as the same steps as the serial run."""
+        units = []
+        for token, name, local_class in get_parser_classes(operating_system, _token, _class):
+            module = sys.modules.get(local_class.__module__)
+            units.append((
+                operating_system,
+                token,
+                local_class.__module__,
+                getattr(module, "__file__", None),
+                name,
+                _number,
+            ))
+
+        timings = []
+        with ProcessPoolExecutor(max_workers=_jobs) as executor:
+            # Chunks of consecutive classes share their module in a worker
+            chunksize = max(1, len(units) // (_jobs * 8))
+            results = executor.map(run_parser_tests, units, chunksize=chunksize)
+            for unit, result in zip(units, results):
+                _, token, _, _, name, _ = unit
+                timings.append((result["time"], name))
+                if token:
+                    msg = f"{operating_system} -> Token -> {token} -> {name}"
+                else:
+                    msg = f"{operating_system} -> {name}"
+                with steps.start(msg, continue_=True) as class_step:
+                    with class_step.start(
+                        f"Test Golden -> {operating_system} -> {name}",
+                        continue_=True,
+                    ) as golden_steps:
+                        self.report_golden(
+                            golden_steps, result["golden"], operating_system, name, token, _display_only_failed
+                        )
+
+                    with class_step.start(
+                        f"Test Empty -> {operating_system} -> {name}",
+                        continue_=True,
+                    ) as empty_steps:
+                        self.report_empty(
+                            empty_steps, result["empty"], result["empty_skip"], operating_system, name, token, _display_only_failed
+                        )
+
+        log.info(banner(f"Slowest {operating_system} parsers"))
+        for duration, name in sorted(timings, reverse=True)[:10]:
+            log.info(f"{duration:8.3f}s {name}")
+
+    @screen_log_handling
+    def report_golden(self, steps, results, operating_system, name, token=None, _display_only_failed=None):
+        """Report the golden test results of a worker process."""
+        if len(results) == 0:
+            steps.failed(f"No files found in appropriate directory for {name}")
+
+        for result in results:
+            if token:
+                msg = f"Gold -> {operating_system} -> Token {token} -> {name} -> {result['name']}"
+            else:
+                msg = f"Gold -> {operating_system} -> {name} -> {result['name']}"
+
+            with steps.start(msg, continue_=True) as step:
+                if result["passed"]:
+                    logging.debug(banner(msg))
+                    logging.debug(f"Parsed in {result['time']:.3f}s")
                     continue
-                # Each "globals()" is checked to see if it has a cli attribute, if so, assumed to be a parser. The _osxe, is
-                # since the ios module often refers to the iosxe parser, leveraging this naming convention.
-                if hasattr(local_class, "cli") and not name.endswith("_iosxe"):
-                    # if name == 'SomeClassName':
-                    #    start = True
-                    # if not start:
-                    #    continue
-                    if token:
-                        msg = f"{operating_system} -> Token -> {token} -> {name}"
-                    else:
-                        msg = f"{operating_system} -> {name}"
-                    with steps.start(msg, continue_=True) as class_step:
-                        with class_step.start(
-                            f"Test Golden -> {operating_system} -> {name}",
-                            continue_=True,
-                        ) as golden_steps:
-                            self.test_golden(
-                                golden_steps, local_class, operating_system, _display_only_failed, token, _number
-                            )
-
-                        with class_step.start(
-                            f"Test Empty -> {operating_system} -> {name}",
-                            continue_=True,
-                        ) as empty_steps:
-                            self.test_empty(
-                                empty_steps, local_class, operating_system, token
-                            )
 
+                if _display_only_failed:
+                    self.add_logger()
+                    log.info(banner(msg))
+                if result["error"]:
+                    log.error(result["error"])
+                    step.errored(f"Parser raised an exception in {result['time']:.3f}s")
+
+                # Display device output, parsed output, and golden_output of failed tests
+                log.info("\nThe following is the device output before it is parsed:\n{}\n".format(result["output"]), extra = {'colour': 'yellow'})
+                log.info("The following is your device's parsed output:\n{}\n".format(result["parsed"]), extra = {'colour': 'yellow'})
+                log.info("The following is your expected output:\n{}\n".format(result["expected"]), extra = {'colour': 'yellow'})
+                log.info("The following is the difference between the two outputs:\n", extra = {'colour': 'yellow'})
+                log.info(result["diff"], extra = {'colour': 'yellow'})
+                step.failed("Device output and expected output do not match")
+
+    @screen_log_handling
+    def report_empty(self, steps, results, empty_skip, operating_system, name, token=None, _display_only_failed=None):
+        """Report the empty test results of a worker process."""
+        if len(results) == 0 and not empty_skip:
+            steps.failed(
+                f"No files found in appropriate directory for {name} empty file"
+            )
+
+        for result in results:
+            if token:
+                msg = f"Empty -> {operating_system} -> {token} -> {name} -> {result['name']}"
+            else:
+                msg = f"Empty -> {operating_system} -> {name} -> {result['name']}"
+            with steps.start(msg, continue_=True) as step:
+                if result["passed"]:
+                    continue
+                if _display_only_failed:
+                    self.add_logger()
+                if result["error"]:
+                    log.error(result["error"])
+                    step.errored(f"Parser raised an exception for {name}")
+                step.failed(f"File parsed, when expected not to for {name}")
 
     @screen_log_handling
     def test_golden(self, steps, local_class, operating_system,_display_only_failed=None, token=None, number=None):
         """Test step that finds any output named with _output.txt, and compares to similar named .py file."""
-        if token:
-            folder_root = f"{operating_system}/{token}/{local_class.__name__}/cli/equal"
-        else:
-            folder_root = f"{operating_system}/{local_class.__name__}/cli/equal"
+        folder_root = get_folder_root(operating_system, local_class.__name__, token)
 
         # Get list of output files to parse and sort
-        convert = lambda text: int(text) if text.isdigit() else text
-        aph_key = lambda key: [convert(c) for c in re.split("([0-9]+)", key)]
-        if number and not operating_system or not local_class:
-            output_glob = sorted(
-                glob.glob(f"{folder_root}/golden_output{number}_output.txt"),
-                key=aph_key,
-            )
-        else:
-            output_glob = sorted(glob.glob(f"{folder_root}/*_output.txt"), key=aph_key)
+        output_glob = get_output_files(folder_root, number)
 
         if len(output_glob) == 0:
             steps.failed(f"No files found in appropriate directory for {local_class}")
@@ -294,11 +299,7 @@ class FileBasedTest(aetest.Testcase):
     @screen_log_handling
     def test_empty(self, steps, local_class, operating_system, token=None):
         """Test step that looks for empty output."""
-        if token:
-            folder_root = f"{operating_system}/{token}/{local_class.__name__}/cli/empty"
-
-        else:
-            folder_root = f"{operating_system}/{local_class.__name__}/cli/empty"
+        folder_root = get_folder_root(operating_system, local_class.__name__, token, "empty")
         output_glob = glob.glob(f"{folder_root}/*_output.txt")
 
         if len(output_glob) == 0 and not EMPTY_SKIP.get(operating_system, {}).get(
@@ -340,143 +341,6 @@ class FileBasedTest(aetest.Testcase):
                 except AttributeError:
                     return True
 
-CLASS_SKIP = {
-    "asa": {
-        "ShowVpnSessiondbSuper": True,
-        },
-    "iosxe": {
-        "c9300": {
-            "ShowInventory": True,
-        },
-        "c9200": {
-            "ShowEnvironmentAllSchema": True,
-            "ShowEnvironmentAll_C9300": True,
-        },
-        "ShowPimNeighbor": True,
-        "ShowIpInterfaceBrief": True,
-        "ShowIpInterfaceBriefPipeVlan": True,
-        "ShowBfdSessions": True,
-        "ShowBfdSessions_viptela": True,
-        "ShowBfdSummary": True,
-        "ShowDot1x": True,
-        "ShowEnvironmentAll": True,
-        "ShowControlConnections_viptela": True,
-        "ShowControlConnections": True,
-        "ShowEigrpNeighborsSuperParser": True,
-        "ShowIpEigrpNeighborsDetailSuperParser": True,
-        "ShowIpOspfInterface": True,
-        "ShowIpOspfNeighborDetail": True,
-        "ShowIpOspfShamLinks": True,
-        "ShowIpOspfVirtualLinks": True,
-        "ShowIpOspfMplsTrafficEngLink": True,
-        "ShowIpOspfDatabaseOpaqueAreaTypeExtLink": True,
-        "ShowIpOspfDatabaseOpaqueAreaTypeExtLinkAdvRouter": True,
-        "ShowIpOspfDatabaseOpaqueAreaTypeExtLinkSelfOriginate": True,
-        "ShowIpOspfDatabaseTypeParser": True,
-        "ShowIpOspfLinksParser": True,  # super class
-        "ShowIpOspfLinksParser2": True, # super class
-        "ShowIpRouteDistributor": True, # super class
-        "ShowIpv6RouteDistributor": True, # super class
-        "ShowControlLocalProperties_viptela": True,
-        "ShowControlLocalProperties": True,
-        "ShowVrfDetailSuperParser": True,
-        "ShowBgp": True,
-        "ShowBgpAllNeighborsRoutesSuperParser": True,
-        "ShowBgpDetailSuperParser": True,
-        "ShowBgpNeighborSuperParser": True,
-        "ShowBgpNeighborsAdvertisedRoutesSuperParser": True,
-        "ShowBgpNeighborsReceivedRoutes": True,
-        "ShowBgpNeighborsReceivedRoutesSuperParser": True,
-        "ShowBgpNeighborsRoutes": True,
-        "ShowBgpSummarySuperParser": True,
-        "ShowBgpSuperParser": True,
-        "ShowIpBgpAllNeighborsAdvertisedRoutes": True,
-        "ShowIpBgpAllNeighborsReceivedRoutes": True,
-        "ShowIpBgpNeighborsReceivedRoutes": True,
-        "ShowIpBgpNeighborsRoutes": True,
-        "ShowIpBgpRouteDistributer": True,
-        "ShowPolicyMapTypeSuperParser": True,
-        "ShowIpLocalPool": True,
-        "ShowInterfaceDetail": True,
-        "ShowInterfaceIpBrief": True,
-        "ShowInterfaceSummary": True,
-        "ShowAuthenticationSessionsInterface": True,
-        "ShowVersion_viptela": True,
-        "ShowOmpPeers_viptela": True,
-        "ShowBfdSummary_viptela": True,
-        "ShowOmpTlocPath_viptela": True,
-        "ShowOmpTlocs_viptela": True,
-        "ShowSoftwaretab_viptela": True, # PR submitted
-        "ShowRebootHistory_viptela": True,
-        "ShowOmpSummary_viptela": True,
-        "ShowSystemStatus_viptela": True,
-        "ShowTcpProxyStatistics": True, # PR submitted
-        "ShowTcpproxyStatus": True, # PR submitted
-        "ShowPlatformTcamUtilization": True, # PR submitted
-        "ShowLicense": True, # PR submitted
-        "Show_Stackwise_Virtual_Dual_Active_Detection": True, # PR submitted
-        "ShowSoftwaretab": True, # PR submitted
-        "ShowOmpPeers_viptela": True,
-        "ShowOmpTlocPath_viptela": True,
-        "ShowOmpTlocs_viptela": True,
-        "genie": True, # need to check
-    },
-    "ios": {
-        "ShowPimNeighbor": True,
-        "ShowInterfacesTrunk": True,
-        "ShowIpInterfaceBrief": True,
-        "ShowIpInterfaceBriefPipeVlan": True,
-        "ShowDot1x": True,
-        "ShowBoot": True,
-        "ShowPagpNeighbor": True,
-        "ShowIpProtocols": True,
-        "ShowIpv6Rpf": True,
-        "ShowIpOspfDatabaseRouter": True,
-        "ShowIpOspfInterface": True,
-        "ShowIpOspfMplsTrafficEngLink": True,
-        "ShowIpOspfNeighborDetail": True,
-        "ShowIpOspfShamLinks": True,
-        "ShowIpOspfVirtualLinks": True,
-        "ShowIpRouteDistributor": True, # super class
-        "ShowIpv6RouteDistributor": True, # super class
-        "ShowIpv6Route": True,
-        "ShowIpBgp": True,
-        "ShowMplsLdpNeighbor": True,
-        "ShowInterfaceDetail": True,
-        "ShowInterfaceIpBrief": True,
-        "ShowInterfaceSummary": True,
-        "ShowInterfaceTransceiverDetail": True,
-        "ShowSdwanSystemStatus": True,
-        "ShowSdwanSoftware": True,
-    },
-    "junos": {
-        "MonitorInterfaceTraffic": True, # issue with Mac
-        "ShowBgpGroupDetailNoMore": True, # need to check
-        "ShowBgpGroupBriefNoMore": True, # need to check
-        "ShowTaskMemory": True, # need to check
-        "ShowConfigurationSystemNtp": True, # need to check
-        "ShowLDPSession": True, # need to check
-        "ShowOspfNeighborInstance": True, # need to check
-        "ShowOspfDatabaseAdvertisingRouterExtensive": True, # need to check
-        "ShowArpNoMore": True, # need to check
-        "ShowRouteProtocolNoMore": True, # need to check
-        "ShowRouteLogicalSystem": True, # need to check
-        "ShowInterfacesTerseInterface": True, # need to check
-        "ShowInterfacesExtensiveNoForwarding": True, # need to check
-        "ShowInterfacesExtensiveInterface": True, # need to check
-        "ShowOspf3NeighborInstance": True, # need to check
-    }
-}
-
-EMPTY_SKIP = {
-    "iosxe": {"ShowVersion": True},
-    "ios": {
-        "ShowVersion": True,
-        "ShowIpv6EigrpNeighbors": True,
-        "ShowIpv6EigrpNeighborsDetail": True,
-    },
-}
-
 if __name__ == "__main__":
 
     # Create the parser
@@ -501,6 +365,10 @@ if __name__ == "__main__":
                         type=int,
                         help="The specific unittest we want to run, such as '25'",
                         default=None)
+    my_parser.add_argument('-j', "--jobs",
+                        type=int,
+                        help="Number of worker processes running the tests, such as '8'",
+                        default=None)
     args = my_parser.parse_args()
 
     _os = args.operating_system
@@ -508,6 +376,7 @@ if __name__ == "__main__":
     _token = args.token
     _display_only_failed = args.display_only_failed
     _number = args.number
+    _jobs = args.jobs
 
     if _number and (not _class or not _number):
         sys.exit("Unittest number provided but missing supporting arguments:"
@@ -524,7 +393,8 @@ if __name__ == "__main__":
         _class=_class,
         _token=_token,
         _display_only_failed=_display_only_failed,
-        _number=_number
+        _number=_number,
+        _jobs=_jobs
     )
 
 else:
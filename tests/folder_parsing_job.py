@@ -29,6 +29,10 @@ def main(runtime):
                        type=int,
                        help="The specific unittest we want to run, such as '25'",
                        default=None)
+    my_parser.add_argument('-j', "--jobs",
+                       type=int,
+                       help="Number of worker processes running the tests, such as '8'",
+                       default=None)
                        
     args, unknown = my_parser.parse_known_args(sys.argv[1:])
     _os = args.operating_system
@@ -40,10 +44,13 @@ def main(runtime):
     _display_only_failed = args.display_failed
 
     _number = args.number
+
+    _jobs = args.jobs
     run(testscript = 'ci_folder_parsing.py',
         runtime = runtime,
         _os=_os,
         _class=_class,
         _token=_token,
         _display_only_failed=_display_only_failed,
-        _number=_number)
\ No newline at end of file
+        _number=_number,
+        _jobs=_jobs)
\ No newline at end of file
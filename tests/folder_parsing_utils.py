@@ -0,0 +1,400 @@
+"""Discovery of the parsers and golden outputs of the folder based tests.
+
+Shared by ci_folder_parsing.py, which checks the parsed outputs, and
+benchmark_parsers.py, which times them. The run_parser_tests work unit of the
+ci_folder_parsing.py process pool mode is defined here as importing
+ci_folder_parsing.py runs its tests.
+"""
+
+# Python
+import os
+import re
+import sys
+import glob
+import json
+import time
+import inspect
+import importlib
+import functools
+import traceback
+from unittest.mock import Mock
+
+TESTS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+PARSER_FOLDER = os.path.join(TESTS_FOLDER, "..", "src", "genie", "libs", "parser")
+
+
+def read_from_file(file_path):
+    """Helper function to read from a file."""
+    with open(file_path, "r") as f:
+        return f.read()
+
+
+def read_json_file(file_path):
+    """Helper function to read in json."""
+    with open(file_path) as f:
+        data = json.load(f)
+    return data
+
+
+def read_python_file(file_path):
+    """Helper function to read in a Python file, and look for expected_output."""
+    _module = importlib.machinery.SourceFileLoader("expected", file_path).load_module()
+    return getattr(_module, "expected_output")
+
+
+def get_operating_systems(_os):
+    """Helper Script to get operating systems."""
+    # Update and fix as more OS's converted to folder based tests
+    if _os:
+        return [_os]
+    return ["asa", "ios", "iosxe", "junos"]
+    # operating_system = []
+    # for folder in os.listdir("./"):
+    #    if os.path.islink("./" + folder):
+    #        operating_system.append(folder)
+    # return operating_system
+
+
+# The get_tokens function dynamically finds tokens by leveraging globs. This
+# works based on the deterministic folder structure. Within a given OS root folder one can
+# determine that a sub folder is in fact a token, if there is a "tests" directory. Upon removing
+# the .py via [-2], there is now a list of files to import from.
+def get_tokens(folder):
+    tokens = []
+    for path in glob.glob(f"{folder}/*/tests"):
+        tokens.append(path.split("/")[-2])
+    return tokens
+
+
+def get_files(folder, token=None):
+    files = []
+    for parse_file in glob.glob(f"{folder}/*.py"):
+        if parse_file.endswith("__init__.py"):
+            continue
+        files.append({"parse_file": parse_file, "token": token})
+    return files
+
+
+def get_folder_root(operating_system, class_name, token=None, kind="equal"):
+    """Folder holding the golden (equal) or empty outputs of a parser class."""
+    if token:
+        return f"{TESTS_FOLDER}/{operating_system}/{token}/{class_name}/cli/{kind}"
+    return f"{TESTS_FOLDER}/{operating_system}/{class_name}/cli/{kind}"
+
+
+def get_parser_classes(operating_system, _token=None, _class=None):
+    """Yield the (token, name, class) of every parser to test for an OS."""
+    base_folder = f"{PARSER_FOLDER}/{operating_system}"
+    # Please refer to get_tokens comments for the how, the what is a genie token, such as
+    # "asr1k" or "c3850" to provide namespaced parsing.
+    tokens = get_tokens(base_folder)
+    parse_files = []
+    parse_files.extend(get_files(base_folder))
+    for token in tokens:
+        parse_files.extend(get_files(f"{base_folder}/{token}", token))
+    # Get all of the root level files
+    for details in parse_files:
+        parse_file = details["parse_file"]
+        token = details["token"]
+        # Load all of the classes in each of those files, and search for classes
+        # that have a `cli` method
+        _module = None
+        module_name = os.path.basename(parse_file[: -len(".py")])
+        if token:
+            module_name = f"{operating_system}_{token}_{module_name}"
+        else:
+            module_name = f"{operating_system}_{module_name}"
+        _module = importlib.machinery.SourceFileLoader(
+            module_name, parse_file
+        ).load_module()
+
+        for name, local_class in inspect.getmembers(_module):
+            # The following methods determin when a test is not warranted, further detail will be provided for each method.
+
+            # If there is a token and the "class" was found to be a known whitelist (mainly since there was not existing tests),
+            # skip. Whitelisted items should be cleaned up over time, and this removed to enforce testing always happens.
+            if token and CLASS_SKIP.get(operating_system, {}).get(token, {}).get(
+                name
+            ):
+                continue
+            # Same as previous, but in cases without tokens (which is the majority.)
+            elif not token and CLASS_SKIP.get(operating_system, {}).get(name):
+                continue
+
+            # This is used in conjunction with the arguments that are run at command line, to skip over all tests you are
+            # not concerned with. Basically, it allows a user to not have to wait for 100s of tests to run, to run their
+            # one test.
+            if _token and _token != token:
+                continue
+            # Same as previous, however, for class
+            if _class and _class != name:
+                continue
+            # Each "globals()" is checked to see if it has a cli attribute, if so, assumed to be a parser. The _osxe, is
+            # since the ios module often refers to the iosxe parser, leveraging this naming convention.
+            if hasattr(local_class, "cli") and not name.endswith("_iosxe"):
+                yield token, name, local_class
+
+
+def get_output_files(folder_root, number=None):
+    """Sorted _output.txt files of a folder, only golden_output<number> if
+    given."""
+    convert = lambda text: int(text) if text.isdigit() else text
+    aph_key = lambda key: [convert(c) for c in re.split("([0-9]+)", key)]
+    if number:
+        return sorted(
+            glob.glob(f"{folder_root}/golden_output{number}_output.txt"),
+            key=aph_key,
+        )
+    return sorted(glob.glob(f"{folder_root}/*_output.txt"), key=aph_key)
+
+
+# The following functions run in the worker processes of the process pool mode of
+# ci_folder_parsing.py. Each worker imports a parser module and reads an
+# _expected.py file once, however many of its work units use them.
+
+@functools.lru_cache(maxsize=None)
+def read_expected_file(file_path):
+    """Cached read_python_file."""
+    return read_python_file(file_path)
+
+
+def load_parser_class(module_name, module_file, class_name):
+    """Return a parser class, loading its module unless already imported."""
+    module = sys.modules.get(module_name)
+    if module is None:
+        if module_file:
+            module = importlib.machinery.SourceFileLoader(
+                module_name, module_file
+            ).load_module()
+        else:
+            module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+def run_golden_tests(local_class, operating_system, token=None, number=None):
+    """Parse the golden outputs of a parser class and compare them to the
+    expected outputs. Return a list of dicts with the test name, the device
+    output, and on failure the parsed and expected outputs and their diff or
+    the traceback."""
+    folder_root = get_folder_root(operating_system, local_class.__name__, token)
+    results = []
+    for user_defined in get_output_files(folder_root, number):
+        user_test = os.path.basename(user_defined[: -len("_output.txt")])
+        start = time.perf_counter()
+        result = {"name": user_test, "passed": False, "error": None}
+        try:
+            golden_output_str = read_from_file(f"{folder_root}/{user_test}_output.txt")
+            result["output"] = golden_output_str
+            golden_parsed_output = read_expected_file(
+                f"{folder_root}/{user_test}_expected.py"
+            )
+            arguments = {}
+            if os.path.exists(f"{folder_root}/{user_test}_arguments.json"):
+                arguments = read_json_file(f"{folder_root}/{user_test}_arguments.json")
+
+            device = Mock(**{"execute.return_value": golden_output_str})
+            obj = local_class(device=device)
+            parsed_output = obj.parse(**arguments)
+
+            if parsed_output != golden_parsed_output:
+                # Genie
+                from genie.utils.diff import Diff
+
+                dd = Diff(parsed_output, golden_parsed_output)
+                dd.findDiff()
+                result["parsed"] = json.dumps(parsed_output, indent=4, sort_keys=True)
+                result["expected"] = json.dumps(golden_parsed_output, indent=4, sort_keys=True)
+                result["diff"] = str(dd)
+            else:
+                result["passed"] = True
+        except Exception:
+            result["error"] = traceback.format_exc()
+        result["time"] = time.perf_counter() - start
+        results.append(result)
+    return results
+
+
+def run_empty_tests(local_class, operating_system, token=None):
+    """Parse the empty outputs of a parser class, which are expected to raise
+    SchemaEmptyParserError. Return a list of dicts with the test name and
+    whether it passed, or the traceback. Like ci_folder_parsing.py, stops at
+    the first empty output which passes."""
+    # Genie
+    from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+    folder_root = get_folder_root(operating_system, local_class.__name__, token, "empty")
+    results = []
+    for user_defined in glob.glob(f"{folder_root}/*_output.txt"):
+        user_test = os.path.basename(user_defined[: -len("_output.txt")])
+        start = time.perf_counter()
+        result = {"name": user_test, "passed": False, "error": None}
+        try:
+            empty_output_str = read_from_file(f"{folder_root}/{user_test}_output.txt")
+            arguments = {}
+            if os.path.exists(f"{folder_root}/{user_test}_arguments.json"):
+                arguments = read_json_file(f"{folder_root}/{user_test}_arguments.json")
+            device = Mock(**{"execute.return_value": empty_output_str})
+            local_class(device=device).parse(**arguments)
+        except (SchemaEmptyParserError, AttributeError):
+            result["passed"] = True
+        except Exception:
+            result["error"] = traceback.format_exc()
+        result["time"] = time.perf_counter() - start
+        results.append(result)
+        if result["passed"]:
+            break
+    return results
+
+
+def run_parser_tests(unit):
+    """Process pool work unit, run the golden and empty tests of the
+    (operating system, token, module name, module file, class name, number)
+    parser."""
+    operating_system, token, module_name, module_file, class_name, number = unit
+    start = time.perf_counter()
+    local_class = load_parser_class(module_name, module_file, class_name)
+    result = {
+        "golden": run_golden_tests(local_class, operating_system, token, number),
+        "empty": run_empty_tests(local_class, operating_system, token),
+        "empty_skip": bool(EMPTY_SKIP.get(operating_system, {}).get(class_name)),
+    }
+    result["time"] = time.perf_counter() - start
+    return result
+
+
+CLASS_SKIP = {
+    "asa": {
+        "ShowVpnSessiondbSuper": True,
+        },
+    "iosxe": {
+        "c9300": {
+            "ShowInventory": True,
+        },
+        "c9200": {
+            "ShowEnvironmentAllSchema": True,
+            "ShowEnvironmentAll_C9300": True,
+        },
+        "ShowPimNeighbor": True,
+        "ShowIpInterfaceBrief": True,
+        "ShowIpInterfaceBriefPipeVlan": True,
+        "ShowBfdSessions": True,
+        "ShowBfdSessions_viptela": True,
+        "ShowBfdSummary": True,
+        "ShowDot1x": True,
+        "ShowEnvironmentAll": True,
+        "ShowControlConnections_viptela": True,
+        "ShowControlConnections": True,
+        "ShowEigrpNeighborsSuperParser": True,
+        "ShowIpEigrpNeighborsDetailSuperParser": True,
+        "ShowIpOspfInterface": True,
+        "ShowIpOspfNeighborDetail": True,
+        "ShowIpOspfShamLinks": True,
+        "ShowIpOspfVirtualLinks": True,
+        "ShowIpOspfMplsTrafficEngLink": True,
+        "ShowIpOspfDatabaseOpaqueAreaTypeExtLink": True,
+        "ShowIpOspfDatabaseOpaqueAreaTypeExtLinkAdvRouter": True,
+        "ShowIpOspfDatabaseOpaqueAreaTypeExtLinkSelfOriginate": True,
+        "ShowIpOspfDatabaseTypeParser": True,
+        "ShowIpOspfLinksParser": True,  # super class
+        "ShowIpOspfLinksParser2": True, # super class
+        "ShowIpRouteDistributor": True, # super class
+        "ShowIpv6RouteDistributor": True, # super class
+        "ShowControlLocalProperties_viptela": True,
+        "ShowControlLocalProperties": True,
+        "ShowVrfDetailSuperParser": True,
+        "ShowBgp": True,
+        "ShowBgpAllNeighborsRoutesSuperParser": True,
+        "ShowBgpDetailSuperParser": True,
+        "ShowBgpNeighborSuperParser": True,
+        "ShowBgpNeighborsAdvertisedRoutesSuperParser": True,
+        "ShowBgpNeighborsReceivedRoutes": True,
+        "ShowBgpNeighborsReceivedRoutesSuperParser": True,
+        "ShowBgpNeighborsRoutes": True,
+        "ShowBgpSummarySuperParser": True,
+        "ShowBgpSuperParser": True,
+        "ShowIpBgpAllNeighborsAdvertisedRoutes": True,
+        "ShowIpBgpAllNeighborsReceivedRoutes": True,
+        "ShowIpBgpNeighborsReceivedRoutes": True,
+        "ShowIpBgpNeighborsRoutes": True,
+        "ShowIpBgpRouteDistributer": True,
+        "ShowPolicyMapTypeSuperParser": True,
+        "ShowIpLocalPool": True,
+        "ShowInterfaceDetail": True,
+        "ShowInterfaceIpBrief": True,
+        "ShowInterfaceSummary": True,
+        "ShowAuthenticationSessionsInterface": True,
+        "ShowVersion_viptela": True,
+        "ShowOmpPeers_viptela": True,
+        "ShowBfdSummary_viptela": True,
+        "ShowOmpTlocPath_viptela": True,
+        "ShowOmpTlocs_viptela": True,
+        "ShowSoftwaretab_viptela": True, # PR submitted
+        "ShowRebootHistory_viptela": True,
+        "ShowOmpSummary_viptela": True,
+        "ShowSystemStatus_viptela": True,
+        "ShowTcpProxyStatistics": True, # PR submitted
+        "ShowTcpproxyStatus": True, # PR submitted
+        "ShowPlatformTcamUtilization": True, # PR submitted
+        "ShowLicense": True, # PR submitted
+        "Show_Stackwise_Virtual_Dual_Active_Detection": True, # PR submitted
+        "ShowSoftwaretab": True, # PR submitted
+        "ShowOmpPeers_viptela": True,
+        "ShowOmpTlocPath_viptela": True,
+        "ShowOmpTlocs_viptela": True,
+        "genie": True, # need to check
+    },
+    "ios": {
+        "ShowPimNeighbor": True,
+        "ShowInterfacesTrunk": True,
+        "ShowIpInterfaceBrief": True,
+        "ShowIpInterfaceBriefPipeVlan": True,
+        "ShowDot1x": True,
+        "ShowBoot": True,
+        "ShowPagpNeighbor": True,
+        "ShowIpProtocols": True,
+        "ShowIpv6Rpf": True,
+        "ShowIpOspfDatabaseRouter": True,
+        "ShowIpOspfInterface": True,
+        "ShowIpOspfMplsTrafficEngLink": True,
+        "ShowIpOspfNeighborDetail": True,
+        "ShowIpOspfShamLinks": True,
+        "ShowIpOspfVirtualLinks": True,
+        "ShowIpRouteDistributor": True, # super class
+        "ShowIpv6RouteDistributor": True, # super class
+        "ShowIpv6Route": True,
+        "ShowIpBgp": True,
+        "ShowMplsLdpNeighbor": True,
+        "ShowInterfaceDetail": True,
+        "ShowInterfaceIpBrief": True,
+        "ShowInterfaceSummary": True,
+        "ShowInterfaceTransceiverDetail": True,
+        "ShowSdwanSystemStatus": True,
+        "ShowSdwanSoftware": True,
+    },
+    "junos": {
+        "MonitorInterfaceTraffic": True, # issue with Mac
+        "ShowBgpGroupDetailNoMore": True, # need to check
+        "ShowBgpGroupBriefNoMore": True, # need to check
+        "ShowTaskMemory": True, # need to check
+        "ShowConfigurationSystemNtp": True, # need to check
+        "ShowLDPSession": True, # need to check
+        "ShowOspfNeighborInstance": True, # need to check
+        "ShowOspfDatabaseAdvertisingRouterExtensive": True, # need to check
+        "ShowArpNoMore": True, # need to check
+        "ShowRouteProtocolNoMore": True, # need to check
+        "ShowRouteLogicalSystem": True, # need to check
+        "ShowInterfacesTerseInterface": True, # need to check
+        "ShowInterfacesExtensiveNoForwarding": True, # need to check
+        "ShowInterfacesExtensiveInterface": True, # need to check
+        "ShowOspf3NeighborInstance": True, # need to check
+    }
+}
+
+EMPTY_SKIP = {
+    "iosxe": {"ShowVersion": True},
+    "ios": {
+        "ShowVersion": True,
+        "ShowIpv6EigrpNeighbors": True,
+        "ShowIpv6EigrpNeighborsDetail": True,
+    },
+}
@@ -0,0 +1,110 @@
+"""Profile the regular expressions of the parsers over a corpus of outputs.
+
+The corpus is the golden outputs of the folder based tests, or a directory of
+captures laid out as for genie.libs.parser.utils.offline. Each output is
+parsed with a PatternProfiler in effect, which reports per parser the
+patterns attempted the most often, and the ones never attempted or never
+matched.
+
+usage: python profile_patterns.py [-o iosxe] [-c ShowInterfaces] [-t 10]
+       python profile_patterns.py --captures captures [--json stats.json]
+"""
+
+# Python
+import os
+import sys
+import json
+import inspect
+import argparse
+import importlib
+from unittest.mock import Mock
+
+# Genie
+from genie.libs.parser.utils.offline import parse_captures
+from genie.libs.parser.utils.pattern_profiler import PatternProfiler
+
+from folder_parsing_utils import (
+    get_folder_root, get_operating_systems, get_output_files, read_from_file,
+    read_json_file)
+
+PARSER_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', 'src', 'genie', 'libs', 'parser')
+
+
+def parser_classes(operating_system, _class=None):
+    """Yield the (token, class) of the parsers of an os, imported with their
+    package name so that their patterns are profiled"""
+    base = os.path.join(PARSER_FOLDER, operating_system)
+    for directory, dirs, files in os.walk(base):
+        dirs[:] = sorted(d for d in dirs if d != 'tests' and
+                         not d.startswith(('.', '_')))
+        token = os.path.relpath(directory, base)
+        token = None if token == '.' else token.replace(os.sep, '/')
+        for name in sorted(files):
+            if not name.endswith('.py') or name == '__init__.py':
+                continue
+            module_name = 'genie.libs.parser.{}.{}{}'.format(
+                operating_system,
+                token.replace('/', '.') + '.' if token else '', name[:-3])
+            try:
+                module = importlib.import_module(module_name)
+            except Exception:
+                continue
+            for class_name, cls in inspect.getmembers(module,
+                                                      inspect.isclass):
+                if cls.__module__ == module_name and hasattr(cls, 'cli') \
+                        and (not _class or _class == class_name):
+                    yield token, cls
+
+
+def profile_goldens(operating_system, _class=None):
+    """Parse the golden outputs of the parsers of an os"""
+    count = 0
+    for token, cls in parser_classes(operating_system, _class):
+        folder = get_folder_root(operating_system, cls.__name__, token)
+        for output_file in get_output_files(folder):
+            arguments = {}
+            arguments_file = output_file[:-len('_output.txt')] + \
+                '_arguments.json'
+            if os.path.exists(arguments_file):
+                arguments = read_json_file(arguments_file)
+            device = Mock(**{'execute.return_value':
+                             read_from_file(output_file)})
+            try:
+                cls(device=device).parse(**arguments)
+            except Exception:
+                pass
+            count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-o', '--os', dest='_os', help='only this os')
+    parser.add_argument('-c', '--class', dest='_class',
+                        help='only this class')
+    parser.add_argument('--captures', help='directory of captures to parse '
+                                           'instead of the golden outputs')
+    parser.add_argument('-t', '--top', type=int, default=10,
+                        help='most attempted patterns shown per parser')
+    parser.add_argument('--json', help='file to write the statistics of '
+                                       'each pattern to')
+    args = parser.parse_args()
+
+    with PatternProfiler() as profiler:
+        if args.captures:
+            count = sum(1 for _ in parse_captures(args.captures, jobs=1))
+        else:
+            count = sum(profile_goldens(operating_system, args._class)
+                        for operating_system in
+                        get_operating_systems(args._os))
+
+    print(profiler.report(parser=args._class, top=args.top))
+    print('{} outputs parsed'.format(count), file=sys.stderr)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(profiler.stats(parser=args._class), f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
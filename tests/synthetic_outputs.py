@@ -0,0 +1,367 @@
+"""Generate large device outputs from the golden outputs of the folder based tests.
+
+The golden outputs only hold a handful of routes, interfaces or mac addresses.
+To see how parsers scale, a golden _output.txt and its _expected.py are
+replicated N times with unique keys:
+
+    * the record keys are the ipv4, ipv6 and mac addresses found in the keys of
+      the expected output, such as the '10.1.1.0/24' route prefix or the
+      '0000.1111.2222' mac address
+    * a record block starts on a line holding a record key, the address keys
+      closest to the root of the expected output, and runs until the next
+      one, the lines of other sections are kept once
+    * each copy of the record blocks, and of the expected output, renumbers the
+      keys to unused addresses, keeping ipv4 and ipv6 prefixes aligned on
+      their mask
+    * the expected outputs of the copies are merged, counters which do not
+      depend on the records, such as the total number of routes, can not be
+      derived and are reported as conflicts
+
+usage: python synthetic_outputs.py -o iosxe -c ShowIpRoute -g golden_output1
+                                   -s 1000 [-t c9300] [--out DIR] [--check]
+"""
+
+# Python
+import os
+import re
+import sys
+import json
+import pprint
+import argparse
+import ipaddress
+from unittest.mock import Mock
+
+from folder_parsing_utils import (
+    get_folder_root,
+    get_parser_classes,
+    read_from_file,
+    read_json_file,
+    read_python_file,
+)
+
+TOKEN = re.compile(
+    # 0000.1111.2222 or 00:11:22:33:44:55
+    r"(?<![\w.:])(?P<mac>[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}"
+    r"|[0-9a-fA-F]{2}(?::[0-9a-fA-F]{2}){5})(?![\w.:])"
+    # 2001:db8::1/128
+    r"|(?<![\w.:])(?P<ipv6>[0-9a-fA-F]{0,4}(?::[0-9a-fA-F]{0,4}){2,7})"
+    r"(?:/(?P<ipv6_len>\d{1,3}))?(?![\w.:])"
+    # 10.1.1.0/24, also after a route distinguisher as in 100:100:10.1.1.0/24
+    r"|(?<![\w.])(?P<ipv4>\d{1,3}(?:\.\d{1,3}){3})"
+    r"(?:/(?P<ipv4_len>\d{1,2}))?(?![\w.])")
+
+BITS = {"mac": 48, "ipv4": 32, "ipv6": 128}
+
+
+def _parse_token(m):
+    """Return the (kind, value, prefix length) of a TOKEN match, the prefix
+    length is None when not given. None if it is not a valid address."""
+    kind = next(kind for kind in BITS if m.group(kind))
+    text = m.group(kind)
+    try:
+        if kind == "mac":
+            value = int(re.sub(r"[.:]", "", text), 16)
+        else:
+            value = int(ipaddress.ip_address(text))
+    except ValueError:
+        return None
+    length = m.group(f"{kind}_len") if kind != "mac" else None
+    return kind, value, int(length) if length else None
+
+
+def _tokens(text):
+    """Return the (match, (kind, value, prefix length)) of the addresses of
+    text"""
+    tokens = []
+    for m in TOKEN.finditer(text):
+        token = _parse_token(m)
+        if token is not None:
+            tokens.append((m, token))
+    return tokens
+
+
+def _format(kind, value, template):
+    """Format value like the template address"""
+    if kind == "ipv4":
+        return str(ipaddress.IPv4Address(value))
+    if kind == "ipv6":
+        return str(ipaddress.IPv6Address(value))
+    digits = "{:012x}".format(value)
+    if any(char.isupper() for char in template):
+        digits = digits.upper()
+    if "." in template:
+        return ".".join(digits[i:i + 4] for i in range(0, 12, 4))
+    return ":".join(digits[i:i + 2] for i in range(0, 12, 2))
+
+
+def _walk_keys(data, depth=0):
+    """Yield the (depth, key) of every dictionary key of the expected output"""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield depth, key
+            yield from _walk_keys(value, depth + 1)
+    elif isinstance(data, list):
+        for value in data:
+            yield from _walk_keys(value, depth + 1)
+
+
+def find_keys(expected):
+    """Return the {(kind, value): step} of the addresses found in the keys of
+    the expected output, and the {(kind, value, prefix length): key} of the
+    record keys, the address keys closest to the root such as the route
+    prefixes. Renumbering an address by multiples of its step keeps it
+    aligned on its mask. The default route can not be renumbered and is not
+    a key."""
+    keys = {}
+    record_keys = {}
+    for depth, key in _walk_keys(expected):
+        if not isinstance(key, str):
+            continue
+        for m, (kind, value, length) in _tokens(key):
+            if length is None:
+                length = BITS[kind]
+            if not length:
+                continue
+            step = 1 << (BITS[kind] - length)
+            keys[(kind, value)] = max(step, keys.get((kind, value), 1))
+            record_keys.setdefault(depth, {})[(kind, value, length)] = key
+    return keys, record_keys[min(record_keys)] if record_keys else {}
+
+
+class Renumber(object):
+    """Map the key addresses of each copy to unused addresses"""
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.used = {kind: set() for kind in BITS}
+        for kind, value in keys:
+            self.used[kind].add(value)
+        self.mapping = {}
+        # last address given to each key, the copies are renumbered in order
+        # so the search for an unused address starts from there
+        self.last = {}
+
+    def address(self, copy, kind, value):
+        try:
+            return self.mapping[(copy, kind, value)]
+        except KeyError:
+            pass
+        step = self.keys[(kind, value)]
+        new = max(value + copy * step,
+                  self.last.get((kind, value), value) + step)
+        # parsers often expect the digits of '2001:db8::1' or '0000.1111.2222'
+        # to stay digits
+        digits = not any(char in "abcdef" for char in _format(kind, value, ""))
+        while new in self.used[kind] or digits and \
+                any(char in "abcdef" for char in _format(kind, new, "")):
+            new += step
+        if new >= 1 << BITS[kind]:
+            raise ValueError(f"Not enough {kind} addresses to replicate "
+                             f"{_format(kind, value, '')} {copy} times")
+        self.used[kind].add(new)
+        self.mapping[(copy, kind, value)] = new
+        self.last[(kind, value)] = new
+        return new
+
+    def text(self, copy, text):
+        """Renumber the key addresses of text"""
+        if not copy:
+            return text
+
+        def replace(m):
+            token = _parse_token(m)
+            if token is None or token[:2] not in self.keys:
+                return m.group(0)
+            kind, value, _ = token
+            new = _format(kind, self.address(copy, kind, value), m.group(kind))
+            return m.group(0).replace(m.group(kind), new, 1)
+
+        return TOKEN.sub(replace, text)
+
+    def expected(self, copy, data):
+        """Renumber the key addresses of the keys and values of data"""
+        if isinstance(data, dict):
+            return {self.expected(copy, key): self.expected(copy, value)
+                    for key, value in data.items()}
+        if isinstance(data, list):
+            return [self.expected(copy, value) for value in data]
+        if isinstance(data, str):
+            return self.text(copy, data)
+        return data
+
+
+def merge(into, data, path=(), conflicts=None):
+    """Merge the expected output of a copy, return the paths of the values
+    which differ between copies"""
+    if conflicts is None:
+        conflicts = []
+    for key, value in data.items():
+        if key not in into:
+            into[key] = value
+        elif isinstance(into[key], dict) and isinstance(value, dict):
+            merge(into[key], value, path + (key,), conflicts)
+        elif isinstance(into[key], list) and isinstance(value, list):
+            if into[key][:len(value)] != value:
+                into[key] = into[key] + value
+        elif into[key] != value:
+            conflicts.append(path + (key,))
+    return conflicts
+
+
+def _indent(line):
+    return len(line) - len(line.lstrip())
+
+
+def record_starts(lines, keys, record_keys):
+    """Return the indexes of the lines starting a record"""
+    texts = {}
+    for (kind, value, length), key in record_keys.items():
+        texts.setdefault((kind, value), set()).add(key)
+    starts = set()
+    masked = set()
+    unmasked = {}
+    for index, line in enumerate(lines):
+        tokens = _tokens(line)
+        for m, (kind, value, length) in tokens:
+            # '10.1.1.0/24' or '[5][65535:1][0][24][10.1.1.0]/17'
+            if length is not None and (kind, value, length) in record_keys or \
+                    any(key in line for key in texts.get((kind, value), ())):
+                starts.add(index)
+                masked.add((kind, value))
+        # '10.1.1.1 is directly connected' under '10.1.0.0/32 is subnetted',
+        # or a mac address. Only the first line an unmasked key leads, as it
+        # can also be found later on as a next hop.
+        if tokens and tokens[0][1][2] is None:
+            unmasked.setdefault(tokens[0][1][:2], index)
+    addresses = {(kind, value) for kind, value, length in record_keys}
+    for address, index in unmasked.items():
+        if address in addresses and address not in masked:
+            starts.add(index)
+    return sorted(starts)
+
+
+def _is_section(line, start_line, keys):
+    """Whether a line ending a record rather belongs to the next section,
+    such as 'For address family: IPv6 Unicast' or a blank line, not indented
+    under the record, or '10.2.0.0/16 is subnetted, 2 subnets'"""
+    tokens = _tokens(line)
+    if any(token[:2] in keys for m, token in tokens):
+        return False
+    return _indent(line) <= _indent(start_line) or \
+        any(token[2] is not None for m, token in tokens)
+
+
+def _replicate_output(output, keys, record_keys, renumber, copies):
+    # A record runs from a line holding a record key to the next one. Its
+    # copies follow it so that they are in the same section of the output,
+    # under the same vrf or address family.
+    lines = output.splitlines(keepends=True)
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+    starts = record_starts(lines, keys, record_keys)
+    if not starts:
+        raise ValueError("No record key found in the output")
+
+    new_output = lines[:starts[0]]
+    for start, end in zip(starts, starts[1:] + [len(lines)]):
+        last = end
+        while last - 1 > start and _is_section(lines[last - 1], lines[start],
+                                               keys):
+            last -= 1
+        record = "".join(lines[start:last])
+        new_output.extend(renumber.text(copy, record) for copy in range(copies))
+        new_output.extend(lines[last:end])
+    return "".join(new_output)
+
+
+def _find_keys(expected):
+    keys, record_keys = find_keys(expected)
+    if not keys:
+        raise ValueError("No address found in the keys of the expected output")
+    return keys, record_keys
+
+
+def replicate_output(output, expected, copies):
+    """Return the output replicated copies times, without deriving its
+    expected output, for the outputs too large to hold both"""
+    keys, record_keys = _find_keys(expected)
+    return _replicate_output(output, keys, record_keys, Renumber(keys), copies)
+
+
+def replicate(output, expected, copies):
+    """Return the output and expected output replicated copies times, and
+    the paths of the expected output which could not be derived"""
+    keys, record_keys = _find_keys(expected)
+    renumber = Renumber(keys)
+    new_output = _replicate_output(output, keys, record_keys, renumber, copies)
+
+    new_expected = {}
+    conflicts = []
+    for copy in range(copies):
+        merge(new_expected, renumber.expected(copy, expected),
+              conflicts=conflicts)
+    return new_output, new_expected, sorted(set(conflicts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--operating_system", type=str, required=True,
+                        help="The OS of the parser")
+    parser.add_argument("-c", "--class_name", type=str, required=True,
+                        help="The parser Class")
+    parser.add_argument("-t", "--token", type=str, default=None,
+                        help="The Token associated with the class, such as 'asr1k'")
+    parser.add_argument("-g", "--golden", type=str, default="golden_output1",
+                        help="The golden test to replicate")
+    parser.add_argument("-s", "--scale", type=int, default=10,
+                        help="Times the records are replicated")
+    parser.add_argument("--out", type=str, default=None,
+                        help="Folder to write the <golden>_x<scale> files to")
+    parser.add_argument("--check", action="store_true",
+                        help="Parse the generated output and compare it")
+    args = parser.parse_args()
+
+    folder_root = get_folder_root(args.operating_system, args.class_name,
+                                  args.token)
+    output = read_from_file(f"{folder_root}/{args.golden}_output.txt")
+    expected = read_python_file(f"{folder_root}/{args.golden}_expected.py")
+    arguments = {}
+    if os.path.exists(f"{folder_root}/{args.golden}_arguments.json"):
+        arguments = read_json_file(f"{folder_root}/{args.golden}_arguments.json")
+
+    new_output, new_expected, conflicts = replicate(output, expected, args.scale)
+    print(f"{args.golden}: {output.count(chr(10))} -> "
+          f"{new_output.count(chr(10))} lines")
+    for path in conflicts:
+        print("  not derived: {}".format(" -> ".join(map(str, path))))
+
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+        name = f"{args.out}/{args.golden}_x{args.scale}"
+        with open(f"{name}_output.txt", "w") as f:
+            f.write(new_output)
+        with open(f"{name}_expected.py", "w") as f:
+            f.write("expected_output = " + pprint.pformat(new_expected, indent=4) + "\n")
+        if arguments:
+            with open(f"{name}_arguments.json", "w") as f:
+                json.dump(arguments, f, indent=4)
+
+    if args.check:
+        local_class = next(local_class for token, name, local_class in
+                           get_parser_classes(args.operating_system, args.token,
+                                              args.class_name))
+        parsed = local_class(device=Mock()).parse(output=new_output, **arguments)
+        # the values which could not be derived are not compared
+        for path in conflicts:
+            for data in (parsed, new_expected):
+                for key in path[:-1]:
+                    data = data.get(key, {})
+                data.pop(path[-1], None)
+        same = parsed == new_expected
+        print("check: {}".format("ok" if same else "parsed output differs"))
+        if not same:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()